@@ -9,6 +9,7 @@ import time
 from dotenv import load_dotenv
 
 from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.list_stream import as_list_with_details
 
 load_dotenv()
 
@@ -16,26 +17,28 @@ load_dotenv()
 async def get_calling_users():
     """
     Get details of all calling enabled users by:
-    1) getting all calling users
-    2) collecting all users that have a calling license
-    3) getting details for all users
+    1) getting all calling licenses
+    2) streaming all users that have a calling license
+    3) getting details for these users while users are still being listed
     """
     async with AsWebexSimpleApi(concurrent_requests=40) as api:
         print('Collecting calling licenses')
         calling_license_ids = set(lic.license_id for lic in await api.licenses.list()
                                   if lic.webex_calling)
 
-        # get users with a calling license
-        calling_users = [user async for user in api.people.list_gen()
-                         if any(lic_id in calling_license_ids for lic_id in user.licenses)]
-        print(f'{len(calling_users)} users:')
-        print('\n'.join(user.display_name for user in calling_users))
+        # users with a calling license; the list of users is not collected but streamed into the details calls
+        calling_users = (user async for user in api.people.list_gen()
+                         if any(lic_id in calling_license_ids for lic_id in user.licenses))
 
-        # get details for all users
+        # get details for all users; at most 40 concurrent details() calls
         start = time.perf_counter()
-        details = await asyncio.gather(*[api.people.details(person_id=user.person_id, calling_data=True)
-                                         for user in calling_users])
+        details = [user async for user in as_list_with_details(
+            calling_users,
+            lambda user: api.people.details(person_id=user.person_id, calling_data=True),
+            concurrency=40)]
         expired = time.perf_counter() - start
+        print(f'{len(details)} users:')
+        print('\n'.join(user.display_name for user in details))
         print(f'Got details for {len(details)} users in {expired * 1000:.3f} ms')
 
 
@@ -57,10 +57,30 @@ def main():
                'wxc_sdk.all_types',
                'wxc_sdk.as_mpe',
                'wxc_sdk.har_writer',
-               'wxc_sdk.har_writer.har']
+               'wxc_sdk.har_writer.har',
+               'wxc_sdk.time_windows',
+               'wxc_sdk.inventory',
+               'wxc_sdk.number_index',
+               'wxc_sdk.list_stream',
+               'wxc_sdk.minimal_diff',
+               'wxc_sdk.reconciler',
+               'wxc_sdk.sync_facade',
+               'wxc_sdk.fan_out',
+               'wxc_sdk.webhook_receiver',
+               'wxc_sdk.event_tailer',
+               'wxc_sdk.bulk_writer',
+               'wxc_sdk.number_provisioning',
+               'wxc_sdk.transcript_export',
+               'wxc_sdk.meeting_quality',
+               'wxc_sdk.xapi_sweeper',
+               'wxc_sdk.device_config_engine',
+               'wxc_sdk.line_key_rollout',
+               'wxc_sdk.space_archive',
+               'wxc_sdk.membership_graph',
+               'wxc_sdk.schedule_eval']
     err = False
     for module_name in module_names:
-        if module_name in to_skip:
+        if module_name in to_skip or module_name.startswith('wxc_sdk.as_api.'):
             continue
         module = import_module(module_name)
         module_all = module.__dict__.get('__all__')
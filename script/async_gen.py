@@ -1,7 +1,25 @@
 #!/usr/bin/env python
+"""
+Generate the async API from the sync API sources
+
+For each sync module with classes used by :class:`wxc_sdk.WebexSimpleApi` one async module is created in the
+``wxc_sdk.as_api`` package. Classes and methods are located in the sync sources using the ``ast`` module and then
+transformed to async. ``wxc_sdk/as_api/__init__.py`` only has a map of all async classes and imports the module
+defining a class when the class is first accessed.
+
+Generated modules are cached by content hash: after a change to a sync module only the affected async module is
+transformed again.
+"""
+import argparse
+import ast
+import builtins
+import hashlib
+import json
 import logging
 import os
 import re
+import symtable
+from collections import defaultdict
 from collections.abc import Generator, Iterable
 from dataclasses import dataclass, field, fields, is_dataclass
 from importlib import import_module
@@ -9,20 +27,24 @@ from itertools import chain
 from pathlib import Path
 from typing import ClassVar, Dict, Optional, Any, Union
 
-from wxc_sdk import WebexSimpleApi
-
 log = logging.getLogger(__name__)
 
-# file name for auto generated async api source
-AS_API_SOURCE = 'as_api.py'
+# package for the auto generated async api sources
+AS_API_PACKAGE = 'as_api'
+
+# directory of the async api package
+AS_API_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'wxc_sdk', AS_API_PACKAGE))
 
-# preamble for autogenerated async API
+# content hash cache: hashes of all inputs and generated modules
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.async_gen_cache.json')
+
+# preamble for each autogenerated async module
 PREAMBLE = """# auto-generated. DO NOT EDIT
 import json
 import logging
 import mimetypes
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta
 import pytz
@@ -30,61 +52,60 @@ from dateutil import tz
 from dateutil.parser import isoparse
 from enum import Enum
 from io import BufferedReader
-from typing import Union, Optional, Literal, List
-
-from pydantic import TypeAdapter
+from typing import Any, Union, Optional, Literal, List
 
-from wxc_sdk.all_types import *
 from wxc_sdk.as_mpe import MultipartEncoder
 from wxc_sdk.as_rest import AsRestSession
-from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
 from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+"""
 
-log = logging.getLogger(__name__)
+# source of the async api package: lazy access to all async classes
+PACKAGE_SOURCE = """# auto-generated. DO NOT EDIT
+\"\"\"
+Async variant of the API: :class:`AsWebexSimpleApi`
+
+The classes are defined in one module per sync module. Modules are only imported when a class is first accessed, so
+that importing a single API class does not require all async classes.
+\"\"\"
+from importlib import import_module
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+{type_checking_imports}
 
-# there seems to be a problem with getting too many users with calling data at the same time
-# this is the maximum number the SDK enforces
-MAX_USERS_WITH_CALLING_DATA = 10
-CALLING_DATA_TIMEOUT_PROTECTION = False
+{all_names}
 
+#: module defining each class
+_MODULES = {{
+{modules}
+}}
 
+
+def __getattr__(name: str):
+    try:
+        module_name = _MODULES[name]
+    except KeyError:
+        if name.startswith('__'):
+            raise AttributeError(f'module {{__name__!r}} has no attribute {{name!r}}')
+        # data types can also be imported from here
+        try:
+            value = getattr(import_module('wxc_sdk.all_types'), name)
+        except AttributeError:
+            raise AttributeError(f'module {{__name__!r}} has no attribute {{name!r}}') from None
+    else:
+        value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 """
 
-# identify sync calls to be translated to "await .." calls
-RE_SYNC_CALLS = re.compile(r"""
-    (?:(?:self\.(?:(?:_)?session\.)?)|  # self., self._session., self.session.
-                                        # ... or
-       (?:super\(\)\.))                 # super().
-                                        # followed by these methods and an opening bracket:
-    (?:rest_)?(?:get|put|post|delete|patch|close|list)\(""",
-                           flags=re.VERBOSE)
-
-# start of a class until the 1st method
-RE_CLASS_START = re.compile(r"""
-    (?:^@\w+(?:\(.+\))?$\n)?            # optional decorator before the class definition with optinal parameters
-    ^class\s(?P<class_name>\w+).*:$     # the 1st line of the class including the class name
-    (?s:.*?)                            # non greedy match on arbitrary characters
-                                        # modfier ?s: -> matches on \n, ? at the end -> non greedy
-    \n+                                 # a sequence of empty lines, end of class_start
-    (?=^[ ]+(?:def)|@)                  # a line starting with spaces and "def" -> 1st method
-    """, flags=re.VERBOSE + re.MULTILINE)
-
-# source of method
-RE_METHOD = re.compile(r"""
-    (?:^[ ]+@\w+(?:\(.+\))?$\n)?    # optional decorator
-    (?P<indent>^[ ]+)def            # start of line with "def"
-    \s+(?P<method_name>\S+)         # white space(s) followed by non white spaces (method name)
-    \(.+$                           # .. until opening bracket until end of line.
-                                    # This is end of the 1st line of the method
-    (?s:.+?)                        # non greedy match on arbitrary characters
-    (?=\s*                          # non capturing, (potentially empty) sequence of white spaces (empty lines)
-        (?:                         # followed by one of ...
-            \Z|                     # ... end of string
-            ^(?P=indent)def|         # ... line with def with same indent as initial def
-            # (?P=indent)@|           # ... or line starting with @ with same indent as initial def
-            ^[ ]*@))                # .. or just a line starting with a @ indicating the start of a decoration
-    """, flags=re.VERBOSE + re.MULTILINE)
+# names of sync methods of the REST session (or API child) to be translated to "await .." calls
+RE_SYNC_METHOD = re.compile(r'(?:rest_)?(?:get|put|post|delete|patch|close|list)')
 
 # method def
 RE_METHOD_DEF = re.compile(r"""
@@ -105,6 +126,32 @@ RE_ASYNC_SOURCE = re.compile("'''async(.*?)$(?P<async_source>.+?)'''", flags=re.
 
 IGNORE_BASES = {'Enum', 'str'}
 
+# packages with hand written code (sync and async) which are not part of the async API
+IGNORE_PACKAGES = [
+    'bulk_writer',
+    'device_config_engine',
+    'event_tailer',
+    'fan_out',
+    'har_writer',
+    'inventory',
+    'line_key_rollout',
+    'list_stream',
+    'meeting_quality',
+    'membership_graph',
+    'minimal_diff',
+    'number_index',
+    'number_provisioning',
+    'reconciler',
+    'schedule_eval',
+    'space_archive',
+    'sync_facade',
+    'time_windows',
+    'transcript_export',
+    'webhook_receiver',
+    'xapi_sweeper',
+]
+
+
 @dataclass
 class Module:
     #: project relative module name
@@ -154,7 +201,8 @@ class Module:
         """
         for module in cls.registry.values():
             module: Module
-            module.imports = list(module.imported())
+            # ignore imports from hand-written packages which are not part of the async API
+            module.imports = [imp for imp in module.imported() if imp.module_name in cls.registry]
             imported_from = set(imp.module_name for imp in module.imports)
             for imported_from_module_name in imported_from:
                 cls.module(module_name=imported_from_module_name).imported_by_module_names.add(module.module_name)
@@ -301,10 +349,11 @@ def source_paths() -> list[Path]:
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'wxc_sdk'))
     py_files = list(Path(project_root).rglob('*.py'))
     py_files.sort()
-    # don't look at the file we are about to create
+    # don't look at the package we are about to create
+    py_files = [path for path in py_files
+                if not Path(AS_API_PATH) in path.parents]
     py_files = [path for path in py_files
-                if os.path.basename(path) != AS_API_SOURCE]
-    py_files = [path for path in py_files if 'har_writer' not in str(path)]
+                if not any(package in path.parts for package in IGNORE_PACKAGES)]
     return py_files
 
 
@@ -316,6 +365,10 @@ class ClassDef:
     source: Optional[str] = None
     base_classes: set[str] = field(default_factory=set)
     is_base_of: set[str] = field(default_factory=set)
+    #: AST of the class definition
+    node: Optional[ast.ClassDef] = None
+    #: line number of the 1st line of the class source (including decorators)
+    first_line: int = 0
 
     #: registry of classes. Key is the unqualified class name
     registry: ClassVar[dict[str, 'ClassDef']] = {}
@@ -370,30 +423,126 @@ class ClassDef:
 
     @classmethod
     def from_path(cls, path: Union[str, Path]) -> Generator['ClassDef', None, None]:
-        class_re = re.compile(r'(?:^@(?P<decorator>\w+).*$\n)?^class\s+(?P<class_name>\w+)(?:\((?P<bases>.+)\))?:\s*$('
-                              r'?:\n^(?:\W.*)?$)+',
-                              flags=re.MULTILINE)
         with open(path, mode='r') as f:
             source = f.read()
+        lines = source.splitlines(keepends=True)
         module_name = Module.module_name_from_path(path=path)
-        for m in class_re.finditer(source):
-            cd = ClassDef.register_class(module_name=module_name, source=m.group(0), **m.groupdict())
-            log.debug(f'register_class: {module_name}.{m.group("class_name")}')
+        for node in ast.parse(source, filename=str(path)).body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            first_line = first_lineno(node)
+            decorator = node.decorator_list and ast.unparse(node.decorator_list[0]).split('(')[0] or None
+            bases = ', '.join(base.id for base in node.bases if isinstance(base, ast.Name))
+            class_source = ''.join(lines[first_line - 1:node.end_lineno])
+            cd = ClassDef.register_class(class_name=node.name, module_name=module_name, decorator=decorator,
+                                         bases=bases, source=class_source)
+            if cd.node is None and cd.source == class_source:
+                cd.node = node
+                cd.first_line = first_line
+            log.debug(f'register_class: {module_name}.{node.name}')
             yield cd
 
 
+def first_lineno(node: Union[ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef]) -> int:
+    """
+    line number of the 1st line of a class or function definition including decorators
+    """
+    return min(chain((node.lineno,), (decorator.lineno for decorator in node.decorator_list)))
+
+
+def content_hash(*sources: str) -> str:
+    """
+    sha256 hash over one or more strings
+    """
+    h = hashlib.sha256()
+    for source in sources:
+        h.update(source.encode())
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+@dataclass
+class GenCache:
+    """
+    Content hash based cache for the generator:
+
+    * hashes of all input files (sync sources and this script) and of the generated files. If nothing changed then
+      generation can be skipped entirely
+    * generated source per async module keyed by the hash of the sync module source, the async class names with the
+      modules defining them and this script. Only modules with changed sources are transformed again
+    """
+    #: input file -> content hash
+    inputs: dict[str, str] = field(default_factory=dict)
+    #: generated file -> content hash
+    outputs: dict[str, str] = field(default_factory=dict)
+    #: content hash -> generated module source
+    modules: dict[str, str] = field(default_factory=dict)
+    #: keys of modules used in this run
+    used: set[str] = field(default_factory=set)
+    hits: int = 0
+    misses: int = 0
+
+    @classmethod
+    def load(cls, enabled: bool = True) -> 'GenCache':
+        if enabled:
+            try:
+                with open(CACHE_PATH, mode='r') as f:
+                    data = json.load(f)
+                return GenCache(inputs=data['inputs'], outputs=data['outputs'], modules=data['modules'])
+            except (OSError, ValueError, KeyError):
+                pass
+        return GenCache()
+
+    def save(self):
+        # only keep entries used in this run so that the cache does not grow forever
+        data = {'inputs': self.inputs, 'outputs': self.outputs,
+                'modules': {k: v for k, v in self.modules.items() if k in self.used}}
+        with open(CACHE_PATH, mode='w') as f:
+            json.dump(data, f)
+
+    def transformed(self, key: str) -> Optional[str]:
+        self.used.add(key)
+        if (source := self.modules.get(key)) is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return source
+
+    @staticmethod
+    def file_hashes(paths: Iterable[Union[str, Path]]) -> dict[str, str]:
+        def one_hash(path: Union[str, Path]) -> str:
+            with open(path, mode='r') as f:
+                return content_hash(f.read())
+
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        return {os.path.relpath(path, root): one_hash(path) for path in paths}
+
+    def changed_inputs(self, inputs: dict[str, str]) -> list[str]:
+        """
+        inputs which changed since the last run
+        """
+        return sorted(name for name in set(self.inputs) | set(inputs)
+                      if self.inputs.get(name) != inputs.get(name))
+
+
+#: cache used by gen()
+CACHE = GenCache()
+
+#: source of this script; part of all cache keys
+SCRIPT_SOURCE = ''
+
 VISITED_FOR_CLASS_SOURCES = set()
 
 
-def class_sources(*, target: type) -> Generator[str, None, None]:
+def class_defs(*, target: type) -> Generator[ClassDef, None, None]:
     """
-    Dump source for one class. Descend into all dependencies before dumping the source for this class
-    :param target: class to dump source of
+    Class definitions needed for one class. Descend into all dependencies before yielding the definition of this class
+    :param target: class to get definitions for
     """
     # pretend we already visited RestSession
     VISITED_FOR_CLASS_SOURCES.add('RestSession')
 
-    def act_on(*, target_class_name: str, level: int = 0) -> Generator[str, None, None]:
+    def act_on(*, target_class_name: str, level: int = 0) -> Generator[ClassDef, None, None]:
         def logger(message: str):
             log.debug(f'{" " * (level * 2)}act_on ({target_class_name}): {message}')
 
@@ -453,7 +602,7 @@ def class_sources(*, target: type) -> Generator[str, None, None]:
 
         logger('dependencies addressed')
 
-        yield class_def.source
+        yield class_def
 
     return act_on(target_class_name=target.__name__)
 
@@ -466,8 +615,12 @@ class ClassTransform:
 
     registry: ClassVar[dict[str, 'ClassTransform']] = dict()
 
+    #: single regex matching all registered class names; rebuilt after new transforms are registered
+    combined: ClassVar[Optional[re.Pattern]] = None
+
     def __post_init__(self):
         self.registry[self.class_name] = self
+        ClassTransform.combined = None
 
     def apply(self, *, source: str) -> tuple[str, int]:
         """
@@ -499,158 +652,371 @@ class ClassTransform:
         :param source:
         :return:
         """
-        total_subs = 0
-        for transform in cls.registry.values():
-            transform: ClassTransform
-            source, subs = transform.apply(source=source)
-            total_subs += subs
-        return source, total_subs
+        # a single pass with one regex for all class names instead of one pass per class name
+        if cls.combined is None:
+            names = sorted(cls.registry, key=len, reverse=True)
+            cls.combined = re.compile(f'\\b({"|".join(map(re.escape, names))})\\b')
+        return cls.combined.subn(repl='As\\g<1>', string=source)
 
 
-def transform_classes_to_async(sources: Iterable[str]) -> Generator[str, None, None]:
-    def transform_method(*, class_name: str, method_match: re.Match) -> str:
-        """
-        Transform source of one method
+def is_sync_call(node: ast.AST) -> bool:
+    """
+    Check if a node is a call that "smells" like async: self.get(..), self.session.rest_get(..), super().put(..), ...
+    """
+    if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
+        return False
+    if not RE_SYNC_METHOD.fullmatch(node.func.attr):
+        return False
+    obj = node.func.value
+    if isinstance(obj, ast.Call):
+        # super().<method>(
+        return isinstance(obj.func, ast.Name) and obj.func.id == 'super' and not obj.args
+    # self.<method>(, self.session.<method>(, self._session.<method>(
+    if isinstance(obj, ast.Attribute) and obj.attr in ('session', '_session'):
+        obj = obj.value
+    return isinstance(obj, ast.Name) and obj.id == 'self'
+
+
+def transform_method(*, class_name: str, node: Union[ast.FunctionDef, ast.AsyncFunctionDef], lines: list[str],
+                     first_line: int) -> str:
+    """
+    Transform source of one method
 
-        :param class_name:
-        :param method_match:
-        :return:
-        """
-        method_name = method_match.group('method_name')
-        source = method_match.group(0)
-        # replace all known class names
-        source, subs = ClassTransform.appy_all(source=source)
-        log.debug(f'transform_method ({class_name}.{method_name}): class name transformations: {subs}')
-
-        # see if there is a '''async block which has the async code
-        if async_code_match := RE_ASYNC_SOURCE.search(source):
-            log.debug(f'transform_method ({class_name}.{method_name}): using async code from async block comment')
-            async_code = async_code_match.group('async_source').strip('\n')
-            return async_code
-
-        # see if there is a call that "smells" like async
-        source, subs = RE_SYNC_CALLS.subn(repl='await \g<0>', string=source)
-        if subs:
-            log.debug(f'transform_method ({class_name}.{method_name}): async call added, change method to "async '
-                      f'def {method_name}"')
-            # found a sync call --> also need to change the method signature to "async"
-            source = re.sub(r'(^[ ]+)def', '\g<1>async def', source)
-
-        source, subs = re.subn(r'(?:async )?def __(enter|exit)__', 'async def __a\g<1>__', source)
-        if subs:
-            log.debug(f'transform_method ({class_name}.{method_name}): converted enter/exit to __aenter__/__aexit__')
-
-        if RE_GENERATOR.search(source):
-            log.debug(f'transform_method ({class_name}.{method_name}): generator detected')
-
-            # this is a method which returns a generator
-            # -> generate two_methods:
-            #   * def <method>_gen(...) -> AsyncGenerator[...
-            #   * async def <method>(...) -> list[
-            #       * switch return self.session.follow_pagination(url=ep, model=Person, params=params)
-            #       * to: return [o async for o in self.session.follow_pagination(url=ep, model=Person, params=params)]
-
-            # switch Generator[ to AsyncGenerator for async generator
-            gen_source, subs = RE_GENERATOR.subn('-> AsyncGenerator[\g<gen_type>\g<post>', source)
-            if not subs:
-                raise ValueError(f'Changing "Generator" to "AsyncGenerator" failed for {class_name}.{method_name}')
-
-            # rename generator method name to _gen; only 1st occurrence
-            gen_source, subs = RE_METHOD_DEF.subn(f'def {method_name}_gen(', gen_source, count=1)
-            if not subs:
-                raise ValueError(f'Changing method name to *_gen failed for {class_name}.{method_name}')
-            log.debug(f'transform_method ({class_name}.{method_name}): created {class_name}.{method_name}_gen')
-
-            # now change signature to 'async def'
-            source, subs = RE_METHOD_DEF.subn(f'async def {method_name}(', source, count=1)
-            if not subs:
-                raise ValueError(f'creating "async def {method_name}" failed for'
-                                 f' {class_name}.{method_name}')
-            # update return signature
-            source, subs = RE_GENERATOR.subn('-> List[\g<gen_type>]:', source)
-            if not subs:
-                raise ValueError(f'updating return signature to "-> list[..]"failed for'
-                                 f' {class_name}.{method_name}')
-            source, subs = RE_FOLLOW_PAGINATION.subn('return [o async for o in \g<follow>]', source)
-            if not subs:
-                raise ValueError(f'updating return return failed for'
-                                 f' {class_name}.{method_name}')
-            log.debug(f'transform_method ({class_name}.{method_name}): created {class_name}.{method_name} -> list[...')
-            source = '\n\n'.join((gen_source, source))
-        return source
+    :param class_name:
+    :param node: AST of the method
+    :param lines: source lines of the method up to the next method
+    :param first_line: line number of the 1st line in the sync module
+    :return:
+    """
+    method_name = node.name
+    source = ''.join(lines)
+
+    # see if there is a '''async block which has the async code
+    if async_code_match := RE_ASYNC_SOURCE.search(source):
+        log.debug(f'transform_method ({class_name}.{method_name}): using async code from async block comment')
+        async_code, _ = ClassTransform.appy_all(source=async_code_match.group('async_source').strip('\n'))
+        return async_code
+
+    # add "await" to all calls that "smell" like async; back to front so that the offsets of the other calls are
+    # still valid. Column offsets are UTF-8 byte offsets
+    lines = list(lines)
+    calls = sorted(((call.lineno - first_line, call.col_offset) for call in ast.walk(node) if is_sync_call(call)),
+                   reverse=True)
+    for line_index, col_offset in calls:
+        line = lines[line_index].encode()
+        lines[line_index] = (line[:col_offset] + b'await ' + line[col_offset:]).decode()
+    if calls:
+        log.debug(f'transform_method ({class_name}.{method_name}): {len(calls)} async call(s) added, change method '
+                  f'to "async def {method_name}"')
+        # found a sync call --> also need to change the method signature to "async"
+        def_index = node.lineno - first_line
+        lines[def_index] = re.sub(r'^([ ]+)def\b', r'\g<1>async def', lines[def_index])
+    source = ''.join(lines).rstrip()
+
+    # replace all known class names
+    source, subs = ClassTransform.appy_all(source=source)
+    log.debug(f'transform_method ({class_name}.{method_name}): class name transformations: {subs}')
+
+    source, subs = re.subn(r'(?:async )?def __(enter|exit)__', 'async def __a\g<1>__', source)
+    if subs:
+        log.debug(f'transform_method ({class_name}.{method_name}): converted enter/exit to __aenter__/__aexit__')
+
+    returns = node.returns
+    if isinstance(returns, ast.Subscript) and isinstance(returns.value, ast.Name) and returns.value.id == 'Generator':
+        log.debug(f'transform_method ({class_name}.{method_name}): generator detected')
+
+        # this is a method which returns a generator
+        # -> generate two_methods:
+        #   * def <method>_gen(...) -> AsyncGenerator[...
+        #   * async def <method>(...) -> list[
+        #       * switch return self.session.follow_pagination(url=ep, model=Person, params=params)
+        #       * to: return [o async for o in self.session.follow_pagination(url=ep, model=Person, params=params)]
+
+        # switch Generator[ to AsyncGenerator for async generator
+        gen_source, subs = RE_GENERATOR.subn('-> AsyncGenerator[\g<gen_type>\g<post>', source)
+        if not subs:
+            raise ValueError(f'Changing "Generator" to "AsyncGenerator" failed for {class_name}.{method_name}')
+
+        # rename generator method name to _gen; only 1st occurrence
+        gen_source, subs = RE_METHOD_DEF.subn(f'def {method_name}_gen(', gen_source, count=1)
+        if not subs:
+            raise ValueError(f'Changing method name to *_gen failed for {class_name}.{method_name}')
+        log.debug(f'transform_method ({class_name}.{method_name}): created {class_name}.{method_name}_gen')
+
+        # now change signature to 'async def'
+        source, subs = RE_METHOD_DEF.subn(f'async def {method_name}(', source, count=1)
+        if not subs:
+            raise ValueError(f'creating "async def {method_name}" failed for'
+                             f' {class_name}.{method_name}')
+        # update return signature
+        source, subs = RE_GENERATOR.subn('-> List[\g<gen_type>]:', source)
+        if not subs:
+            raise ValueError(f'updating return signature to "-> list[..]"failed for'
+                             f' {class_name}.{method_name}')
+        source, subs = RE_FOLLOW_PAGINATION.subn('return [o async for o in \g<follow>]', source)
+        if not subs:
+            raise ValueError(f'updating return return failed for'
+                             f' {class_name}.{method_name}')
+        log.debug(f'transform_method ({class_name}.{method_name}): created {class_name}.{method_name} -> list[...')
+        source = '\n\n'.join((gen_source, source))
+    return source
+
+
+def transform_class(class_def: ClassDef) -> str:
+    """
+    transform source of one class to async
 
-    # noinspection PyShadowingNames
-    def transform_class(*, source: str) -> str:
-        """
-        transform source of one method to async
+    * each class has a part before the 1st method and some methods
+    * not all methods have a call to an async method
+    * properties remain unchanged
+    :param class_def:
+    :return:
+    """
+    class_name = class_def.class_name
+    log.debug(f'transform_class({class_name}): start')
+    lines = class_def.source.splitlines(keepends=True)
+    methods = [node for node in class_def.node.body if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+
+    # each method extends to the start of the next method
+    starts = [first_lineno(method) - class_def.first_line for method in methods]
+    ends = starts[1:] + [len(lines)]
+
+    # apply transforms to start of class def; that's the complete class if there are no methods (enums)
+    class_start = ''.join(lines[:starts[0]] if methods else lines)
+    class_start, subs = ClassTransform.appy_all(source=class_start)
+    log.debug(f'transform_class({class_name}): replacements in class start: {subs}')
+    class_start, subs = re.subn(r'(:class:`(?:[^`<]*<)?)[\w.]+\.As', '\\g<1>As', class_start)
+    log.debug(f'transform_class({class_name}): replacements for ":class:" declarations: {subs}')
+    log.debug(f'transform_class({class_name}): methods: {", ".join(method.name for method in methods)}')
+
+    # new source: transformed class start followed by transformed methods
+    transformed_methods = '\n\n'.join(transform_method(class_name=class_name, node=method, lines=lines[start:end],
+                                                       first_line=class_def.first_line + start)
+                                      for method, start, end in zip(methods, starts, ends))
+    return f'{class_start}{transformed_methods}'
+
+
+def module_file_name(module_name: str) -> str:
+    """
+    name of the async module for a sync module: wxc_sdk.telephony.callqueue -> telephony_callqueue
+    """
+    if module_name == 'wxc_sdk':
+        return 'webex_simple_api'
+    return module_name.removeprefix('wxc_sdk.').replace('.', '_')
 
-        * each class has a part before the 1st method and some methods
-        * not all methods have a call to an async method
-        * properties remain unchanged
-        :param source:
-        :return:
-        """
-        m = RE_CLASS_START.match(source)
-        if not m:
-            raise ValueError('No class name?')
-        class_name = m.group('class_name')
-        log.debug(f'transform_class({class_name}): start')
-        # create and register new transform
-        ClassTransform.from_class_name(class_name)
-
-        # apply transforms to start of class def
-        class_start = m.group(0)
-        class_start, subs = ClassTransform.appy_all(source=class_start)
-        log.debug(f'transform_class({class_name}): replacements in class start: {subs}')
-        class_start, subs = re.subn(r':class:`.+\.As', ':class:`As', class_start)
-        log.debug(f'transform_class({class_name}): replacements for ":class:" declarations: {subs}')
-
-        # get all methods
-        method_matches = list(RE_METHOD.finditer(source))
-        log.debug(f'transform_class({class_name}): methods: '
-                  f'{", ".join(m.group("method_name") for m in method_matches)}')
-
-        # new source: transformed class start followed by transformed methods
-        transformed_methods = "\n\n".join(map(lambda m: transform_method(class_name=class_name,
-                                                                         method_match=m),
-                                              method_matches))
-        source = f'{class_start}{transformed_methods}'
-        return source
 
-    # we suppressed the source for RestSession, but the class name still needs to be translated
-    ClassTransform.from_class_name('RestSession')
-    for class_source in sources:
-        yield transform_class(source=class_source)
+def global_names(source: str) -> set[str]:
+    """
+    Names referenced in a module which are neither defined in the module nor builtins
+    """
+    table = symtable.symtable(source, '<generated>', 'exec')
+    defined = set(symbol.get_name() for symbol in table.get_symbols()
+                  if symbol.is_assigned() or symbol.is_imported())
+    referenced = set()
+
+    def visit(scope: symtable.SymbolTable):
+        for symbol in scope.get_symbols():
+            if symbol.is_referenced() and (scope is table or symbol.is_global()):
+                referenced.add(symbol.get_name())
+        for child in scope.get_children():
+            visit(child)
+
+    visit(table)
+    return referenced - defined - set(dir(builtins))
+
+
+def module_constants(source: str) -> dict[str, str]:
+    """
+    Module level constants (simple assignments of literals) including the comment lines before the assignment
+
+    :return: dict name -> source
+    """
+    lines = source.splitlines(keepends=True)
+    constants = {}
+    for node in ast.parse(source).body:
+        if not (isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)
+                and isinstance(node.value, ast.Constant)):
+            continue
+        start = node.lineno - 1
+        while start and lines[start - 1].startswith('#'):
+            start -= 1
+        constants[node.targets[0].id] = ''.join(lines[start:node.end_lineno])
+    return constants
+
+
+def import_statement(module_name: str, names: Iterable[str], indent: str = '') -> str:
+    """
+    "from .. import .." statement for some names; wrapped at 120 characters
+    """
+    lines = []
+    line = f'{indent}from {module_name} import '
+    for name in sorted(names):
+        entry = f'{name}, '
+        if len(line) + len(entry) >= 118:
+            lines.append(f'{line.rstrip()} \\')
+            # continuation lines are indented by 4 spaces
+            line = f'{indent}    '
+        line = f'{line}{entry}'
+    lines.append(line.rstrip(' ,'))
+    return '\n'.join(lines)
+
+
+def all_statement(names: Iterable[str]) -> str:
+    """
+    nicely formatted __all__ section
+    """
+    lines = []
+    line = '__all__ = ['
+    max_line = 120
+    for name in sorted(names):
+        entry = f"'{name}', "
+        if len(line) + len(entry) >= max_line:
+            lines.append(line.rstrip())
+            line = ' ' * 11
+
+        line = f'{line}{entry}'
+    lines.append(f'{line.rstrip(" ,")}]')
+    return '\n'.join(lines)
+
+
+def module_source(*, module_name: str, classes: list[ClassDef], class_modules: dict[str, str]) -> str:
+    """
+    Source of the async module for one sync module
+
+    :param module_name: name of the sync module
+    :param classes: classes of the sync module to transform; dependencies 1st
+    :param class_modules: name of the async module for each async class name
+    """
+    body = '\n\n\n'.join(map(transform_class, classes))
+    sync_module = Module.registry[module_name]
+    constants = module_constants(sync_module.source())
+
+    # imports for all referenced names: async classes from other async modules, constants are copied so that they
+    # can be changed in the async module, anything else is imported from the sync module
+    as_imports: dict[str, set[str]] = defaultdict(set)
+    sync_imports = set()
+    copied = set()
+    for name in sorted(global_names(f'{PREAMBLE}\n{body}')):
+        if as_module := class_modules.get(name):
+            as_imports[as_module].add(name)
+        elif name in constants:
+            copied.add(name)
+        elif hasattr(sync_module.imported_module, name):
+            sync_imports.add(name)
+        else:
+            raise NameError(f'{module_name}: unresolved name "{name}"')
+    imports = [import_statement(f'wxc_sdk.{AS_API_PACKAGE}.{as_module}', names)
+               for as_module, names in sorted(as_imports.items())]
+    if sync_imports:
+        imports.insert(0, import_statement(module_name, sync_imports))
+
+    imports = ''.join(f'{imp}\n' for imp in imports)
+    parts = [f'{PREAMBLE}{imports}\nlog = logging.getLogger(__name__)']
+    if copied:
+        # constants in the same order as in the sync module
+        parts.append('\n'.join(source.rstrip() for name, source in constants.items() if name in copied))
+    parts.append(all_statement(f'As{class_def.class_name}' for class_def in classes))
+    parts.append(body)
+    return '\n\n\n'.join(part.rstrip('\n') for part in parts) + '\n'
+
+
+def package_source(class_modules: dict[str, str]) -> str:
+    """
+    Source of the async API package: lazy access to all async classes
+    """
+    modules = {name: f'wxc_sdk.{AS_API_PACKAGE}.{as_module}' for name, as_module in class_modules.items()}
+    modules['AsRestSession'] = 'wxc_sdk.as_rest'
+    names_by_module: dict[str, list[str]] = defaultdict(list)
+    for name, module in modules.items():
+        names_by_module[module].append(name)
+    type_checking_imports = '\n'.join(import_statement(module, names, indent=' ' * 4)
+                                      for module, names in sorted(names_by_module.items()))
+    return PACKAGE_SOURCE.format(type_checking_imports=type_checking_imports,
+                                 all_names=all_statement(modules),
+                                 modules='\n'.join(f"    '{name}': '{modules[name]}',"
+                                                   for name in sorted(modules)))
+
+
+def write_if_changed(path: str, source: str):
+    """
+    only write changed sources; keeps timestamps of unchanged modules
+    """
+    try:
+        with open(path, mode='r') as f:
+            if f.read() == source:
+                return
+    except FileNotFoundError:
+        pass
+    log.info(f'writing {os.path.relpath(path, os.path.dirname(AS_API_PATH))}')
+    with open(path, mode='w') as f:
+        f.write(source)
 
 
 def gen():
-    # start with WebexSimpleApi
-    as_api_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'wxc_sdk', AS_API_SOURCE))
-    with open(as_api_path, mode='w') as combined:
-        combined.write(PREAMBLE)
-        converted_classes_source = '\n\n\n'.join(transform_classes_to_async(class_sources(target=WebexSimpleApi)))
-        visited_classes = sorted(VISITED_FOR_CLASS_SOURCES)
-
-        # created nicely formatted __all__ section
-        line = '__all__ = ['
-        max_line = 120
-        for name in visited_classes:
-            entry = f"'As{name}', "
-            if len(line) + len(entry) >= max_line:
-                print(line.rstrip(), file=combined)
-                line = ' ' * 11
-
-            line = f'{line}{entry}'
-        print(f'{line.rstrip(" ,")}]', file=combined)
-        print('\n', file=combined)
-        combined.write(converted_classes_source)
-    return
+    from wxc_sdk import WebexSimpleApi
+
+    # start with WebexSimpleApi: all classes we need, dependencies 1st
+    classes = list(class_defs(target=WebexSimpleApi))
+
+    # class names are replaced in all modules
+    ClassTransform.from_class_name('RestSession')
+    for class_def in classes:
+        ClassTransform.from_class_name(class_def.class_name)
+
+    # one async module for each sync module
+    classes_by_module: dict[str, list[ClassDef]] = defaultdict(list)
+    for class_def in classes:
+        classes_by_module[class_def.module_name].append(class_def)
+    as_modules = {module_name: module_file_name(module_name) for module_name in classes_by_module}
+    if len(set(as_modules.values())) != len(as_modules):
+        raise ValueError('async module names are not unique')
+    class_modules = {f'As{class_def.class_name}': as_modules[class_def.module_name] for class_def in classes}
+
+    os.makedirs(AS_API_PATH, exist_ok=True)
+    # the generated source of a module only depends on the sync module, the module of each async class and this script
+    class_modules_key = json.dumps(class_modules, sort_keys=True)
+    for module_name, module_classes in classes_by_module.items():
+        cache_key = content_hash(SCRIPT_SOURCE, class_modules_key, Module.registry[module_name].source())
+        if (source := CACHE.transformed(cache_key)) is None:
+            log.debug(f'gen: transforming {module_name}')
+            source = module_source(module_name=module_name, classes=module_classes, class_modules=class_modules)
+            CACHE.modules[cache_key] = source
+        write_if_changed(os.path.join(AS_API_PATH, f'{as_modules[module_name]}.py'), source)
+    write_if_changed(os.path.join(AS_API_PATH, '__init__.py'), package_source(class_modules))
+
+    # remove modules for sync modules which don't exist anymore
+    expected = set(as_modules.values()) | {'__init__'}
+    for path in Path(AS_API_PATH).glob('*.py'):
+        if path.stem not in expected:
+            log.info(f'removing {path.name}')
+            path.unlink()
+
+
+def output_hashes() -> dict[str, str]:
+    """
+    content hashes of all modules in the async api package
+    """
+    return GenCache.file_hashes(sorted(Path(AS_API_PATH).glob('*.py')))
 
 
 if __name__ == '__main__':
-    logging.basicConfig(level=logging.DEBUG)
+    parser = argparse.ArgumentParser(description='Generate the async API from the sync API sources')
+    parser.add_argument('--force', action='store_true', help='ignore the content hash cache')
+    parser.add_argument('--verbose', action='store_true', help='debug output')
+    args = parser.parse_args()
+    logging.basicConfig(level=args.verbose and logging.DEBUG or logging.INFO)
     paths = source_paths()
 
+    with open(__file__, mode='r') as f:
+        SCRIPT_SOURCE = f.read()
+    CACHE = GenCache.load(enabled=not args.force)
+    inputs = GenCache.file_hashes(paths + [Path(__file__)])
+    if inputs == CACHE.inputs and output_hashes() == CACHE.outputs:
+        log.info(f'{AS_API_PACKAGE} is up to date')
+        exit(0)
+    changed = CACHE.changed_inputs(inputs)
+    log.info(f'changed: {", ".join(changed[:10]) or AS_API_PACKAGE}{len(changed) > 10 and ", ..." or ""}')
+
     # register all classes in all source paths
     list(chain.from_iterable(ClassDef.from_path(p) for p in paths))
 
@@ -658,18 +1024,11 @@ if __name__ == '__main__':
     modules = list(map(Module, paths))
     Module.init_imports()
 
-    # names of modules that use rest (depend on rest)
-    uses_rest = set(m.module_name for m in Module.registry['wxc_sdk.rest'].dependants_gen())
-
-    # modules depending on rest
-    mo = list(m for m in Module.module_order()
-              if m.module_name in uses_rest)
-
-    for module in Module.registry.values():
-        imported = import_module(module.module_name)
-        foo = 1
-    modules = list(Module.registry)
     for import_qualident in sorted(Import.registry):
         import_item: Import = Import.registry[import_qualident]
-        print(f'{import_qualident}: {", ".join(sorted(import_item.imported_in_module_names))}')
+        log.debug(f'{import_qualident}: {", ".join(sorted(import_item.imported_in_module_names))}')
     gen()
+    CACHE.inputs = inputs
+    CACHE.outputs = output_hashes()
+    CACHE.save()
+    log.info(f'{AS_API_PACKAGE} generated: {CACHE.misses} modules transformed, {CACHE.hits} from cache')
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Benchmark: per call overhead of parsing list responses with an inline TypeAdapter vs. a cached TypeAdapter
+
+    usage: type_adapter_bench.py [-h] [--items ITEMS] [--calls CALLS]
+
+The SDK used to create a new TypeAdapter for every request (``TypeAdapter(list[X]).validate_python(...)``).
+:func:`wxc_sdk.base.type_adapter` caches one TypeAdapter per type. This script compares both approaches for a few
+typical response types and payload sizes.
+"""
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from wxc_sdk.authorizations import Authorization
+from wxc_sdk.base import type_adapter
+from wxc_sdk.common import AuthCode, IdAndName
+from wxc_sdk.telephony.dect_devices import DECTNetworkDetail
+
+# type and a sample (JSON) item to use in the response
+SAMPLES: list[tuple[Any, dict]] = [
+    (list[IdAndName], {'id': 'id', 'name': 'name'}),
+    (list[AuthCode], {'code': '1234', 'description': 'code'}),
+    (list[Authorization], {'id': 'id', 'applicationId': 'app', 'applicationName': 'App', 'orgId': 'org',
+                           'personId': 'person', 'clientId': 'client', 'type': 'access',
+                           'created': '2024-01-01T12:00:00.000Z'}),
+    (list[DECTNetworkDetail], {'id': 'id', 'name': 'network', 'displayName': 'network', 'chassisMac': '00:11',
+                               'model': 'DMS Cisco DBS110', 'defaultAccessCodeEnabled': False,
+                               'numberOfBaseStations': 1, 'numberOfLines': 2,
+                               'location': {'id': 'location', 'name': 'location'}}),
+]
+
+
+def timed(f: Callable[[], Any], calls: int) -> float:
+    """
+    average time per call in µs
+    """
+    start = time.perf_counter()
+    for _ in range(calls):
+        f()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='TypeAdapter parse overhead: inline vs. cached')
+    parser.add_argument('--items', type=int, nargs='+', default=[1, 10, 100], help='items per response')
+    parser.add_argument('--calls', type=int, default=500, help='number of calls per measurement')
+    args = parser.parse_args()
+
+    print(f'{"type":<28} {"items":>6} {"inline µs":>12} {"cached µs":>12} {"speedup":>8}')
+    for t, sample in SAMPLES:
+        name = f'list[{t.__args__[0].__name__}]'
+        for items in args.items:
+            data = [dict(sample) for _ in range(items)]
+            # warm up the cache
+            type_adapter(t).validate_python(data)
+            inline = timed(lambda: TypeAdapter(t).validate_python(data), args.calls)
+            cached = timed(lambda: type_adapter(t).validate_python(data), args.calls)
+            print(f'{name:<28} {items:>6} {inline:>12.1f} {cached:>12.1f} {inline / cached:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
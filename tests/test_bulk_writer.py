@@ -0,0 +1,94 @@
+"""
+Tests for the auto-chunking bulk writers
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest import TestCase
+
+from wxc_sdk.bulk_writer import AsContactsBulkWriter, AsScimBulkWriter, delete_operations
+from wxc_sdk.org_contacts import BulkFailed, BulkResponse as ContactsBulkResponse, Contact
+from wxc_sdk.scim.bulk import BulkErrorResponse, BulkResponse, BulkResponseOperation, ResponseError
+
+
+class FakeScimBulk:
+    """
+    fake SCIM bulk endpoint: fails operations for some ids once (429) or always (409)
+    """
+
+    def __init__(self, flaky: set[str] = None, conflict: set[str] = None):
+        self.flaky = set(flaky or ())
+        self.conflict = set(conflict or ())
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def bulk_request(self, org_id: str, fail_on_errors: int, operations):
+        self.requests.append(len(operations))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        result = []
+        for operation in operations:
+            user_id = operation.path.split('/')[-1]
+            if user_id in self.flaky:
+                self.flaky.discard(user_id)
+                status = 429
+            elif user_id in self.conflict:
+                status = 409
+            else:
+                status = 204
+            response = status >= 400 and BulkErrorResponse(status=status,
+                                                           error=ResponseError(details=f'error {status}')) or None
+            result.append(BulkResponseOperation(bulk_id=operation.bulk_id, status=status, response=response,
+                                                method='DELETE'))
+        # responses are not necessarily in request order
+        result.reverse()
+        return BulkResponse(operations=result)
+
+
+class TestBulkWriter(TestCase):
+    def test_001_scim_chunks_and_retries(self):
+        bulk = FakeScimBulk(flaky={'u3', 'u150'}, conflict={'u7'})
+        api = SimpleNamespace(scim=SimpleNamespace(bulk=bulk))
+
+        def user_ids():
+            for i in range(250):
+                yield f'u{i}'
+
+        writer = AsScimBulkWriter(api, org_id='org', concurrency=2, retry_delay=0)
+        report = asyncio.run(writer.write(delete_operations(user_ids())))
+        self.assertEqual(250, len(report.results))
+        self.assertEqual(['u7'], [r.item.path.split('/')[-1] for r in report.failed])
+        self.assertEqual('error 409', report.failed[0].error)
+        self.assertEqual(2, report.retries)
+        self.assertTrue(all(n <= 100 for n in bulk.requests))
+        # only the two failed operations are sent again
+        self.assertEqual(252, sum(bulk.requests))
+        self.assertLessEqual(bulk.max_in_flight, 2)
+
+    def test_002_contacts(self):
+        requests = []
+
+        async def bulk_create_or_update(org_id: str, contacts: list[Contact]):
+            requests.append(len(contacts))
+            if len(requests) == 1:
+                raise ConnectionError('connection reset')
+            failed = [BulkFailed(id=c.contact_id, error_message='invalid', error_code=400, status_code=400)
+                      for c in contacts if c.contact_id == 'c5']
+            return ContactsBulkResponse(contacts=[], failed_contacts=failed, org_id=org_id)
+
+        api = SimpleNamespace(org_contacts=SimpleNamespace(bulk_create_or_update=bulk_create_or_update))
+        writer = AsContactsBulkWriter(api, org_id='org', chunk_size=10, concurrency=1, retry_delay=0)
+
+        async def contacts():
+            for i in range(25):
+                yield Contact(contact_id=f'c{i}', display_name=f'contact {i}')
+
+        report = asyncio.run(writer.create_or_update(contacts()))
+        self.assertEqual(25, len(report.results))
+        self.assertEqual(['c5'], [r.item.contact_id for r in report.failed])
+        # the 1st chunk failed as a whole and was re-queued
+        self.assertEqual(10, report.retries)
+        self.assertEqual(35, sum(requests))
+        self.assertEqual(2, next(r for r in report.results if r.item.contact_id == 'c0').attempts)
@@ -0,0 +1,62 @@
+"""
+Tests for coalescing of identical concurrent GET requests
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.rest import RestSession
+from wxc_sdk.tokens import Tokens
+
+
+class TestCoalesce(TestCase):
+    def test_001_sync(self):
+        session = RestSession(tokens=Tokens(access_token='token'), concurrent_requests=10, coalesce_gets=True)
+        calls = []
+
+        def request(method, url, **kwargs):
+            calls.append((method, url))
+            time.sleep(0.2)
+            return None, {'items': [{'id': url}]}
+
+        session._request_w_response = request
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: session.rest_get(f'https://x/{i % 2}', params={'max': 1}), range(8)))
+        self.assertEqual(2, len(calls))
+        self.assertEqual(results[0], results[2])
+        # each caller gets its own copy
+        self.assertIsNot(results[0], results[2])
+        # POSTs are never coalesced
+        session.rest_post('https://x/0', json={})
+        self.assertEqual(3, len(calls))
+
+    def test_002_async(self):
+        async def run():
+            session = AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=10, coalesce_gets=True)
+            calls = []
+
+            async def request(method, url, **kwargs):
+                calls.append((method, url))
+                await asyncio.sleep(0.1)
+                if url.endswith('err'):
+                    raise ValueError('failed')
+                return None, {'items': [{'id': url}]}
+
+            try:
+                session._request_w_response = request
+                results = await asyncio.gather(*[session.rest_get('https://x/0') for _ in range(5)])
+                self.assertEqual(1, len(calls))
+                self.assertEqual(5, len({id(r) for r in results}))
+                # exceptions are propagated to all callers
+                errors = await asyncio.gather(*[session.rest_get('https://x/err') for _ in range(3)],
+                                              return_exceptions=True)
+                self.assertTrue(all(isinstance(e, ValueError) for e in errors))
+                self.assertEqual(2, len(calls))
+                # nothing left in flight
+                self.assertEqual({}, session._in_flight)
+            finally:
+                await session.close()
+
+        asyncio.run(run())
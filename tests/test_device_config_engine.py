@@ -0,0 +1,132 @@
+"""
+Tests for the bulk device configuration engine
+"""
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+from unittest import TestCase
+
+from wxc_sdk.common import DeviceCustomization, DeviceCustomizations
+from wxc_sdk.device_config_engine import AsBulkDeviceConfigurator, ConfigMethod, ConfigScope, DeviceTarget
+from wxc_sdk.telephony.jobs import JobErrorItem, StartJobResponse
+
+
+def job(job_id: str, status: str) -> StartJobResponse:
+    return StartJobResponse.model_validate({'id': job_id, 'trackingId': 't', 'sourceUserId': 'u',
+                                            'sourceCustomerId': 'c', 'targetCustomerId': 'c', 'instanceId': 1,
+                                            'jobExecutionStatus': [], 'latestExecutionStatus': status})
+
+
+class FakeApi:
+    def __init__(self, customized_devices: set[str] = (), customized_locations: set[str] = (),
+                 failing_location: str = None, job_errors: dict[str, list[str]] = None):
+        self.customized_devices = set(customized_devices)
+        self.customized_locations = set(customized_locations)
+        self.failing_location = failing_location
+        self.job_errors = job_errors or {}
+        self.calls = Counter()
+        self.jobs = []
+        self.running_jobs = 0
+        self.max_running_jobs = 0
+        devices = SimpleNamespace(device_settings=self.device_settings,
+                                  update_device_settings=self.update_device_settings,
+                                  apply_changes=self.apply_changes)
+        device_settings_jobs = SimpleNamespace(change=self.change, status=self.status, errors_gen=self.errors_gen)
+        self.telephony = SimpleNamespace(devices=devices,
+                                         location=SimpleNamespace(device_settings=self.location_settings),
+                                         device_settings=self.org_settings,
+                                         jobs=SimpleNamespace(device_settings=device_settings_jobs))
+
+    @staticmethod
+    def settings(custom_enabled: bool) -> DeviceCustomization:
+        return DeviceCustomization(customizations=DeviceCustomizations(), custom_enabled=custom_enabled)
+
+    async def device_settings(self, device_id: str, device_model: str, org_id: str = None):
+        self.calls['device_settings'] += 1
+        await asyncio.sleep(0)
+        return self.settings(device_id in self.customized_devices)
+
+    async def update_device_settings(self, device_id: str, device_model: str, customization, org_id: str = None):
+        self.calls['update_device_settings'] += 1
+        await asyncio.sleep(0)
+        if device_id == 'bad':
+            raise ValueError('update failed')
+
+    async def apply_changes(self, device_id: str, org_id: str = None):
+        self.calls['apply_changes'] += 1
+
+    async def location_settings(self, location_id: str, org_id: str = None):
+        return self.settings(location_id in self.customized_locations)
+
+    async def org_settings(self, org_id: str = None):
+        return self.settings(False)
+
+    async def change(self, location_id, customization, org_id=None):
+        self.jobs.append((location_id, customization.custom_enabled))
+        self.running_jobs += 1
+        self.max_running_jobs = max(self.max_running_jobs, self.running_jobs)
+        return job(f'job{len(self.jobs)}:{location_id}', 'STARTED')
+
+    async def status(self, job_id: str, org_id: str = None):
+        await asyncio.sleep(0.01)
+        self.running_jobs -= 1
+        location_id = job_id.split(':')[1]
+        return job(job_id, 'FAILED' if location_id == self.failing_location else 'COMPLETED')
+
+    async def errors_gen(self, job_id: str, org_id: str = None):
+        for device_id in self.job_errors.get(job_id.split(':')[1], []):
+            yield JobErrorItem.model_validate({'item': device_id, 'itemNumber': 0, 'trackingId': 't',
+                                               'error': {'key': '400',
+                                                         'message': [{'description': 'device offline'}]}})
+
+
+def targets(locations: dict[str, int]) -> list[DeviceTarget]:
+    return [DeviceTarget(device_id=f'{location}-{i}', model='DMS Cisco 8845', location_id=location)
+            for location, count in locations.items() for i in range(count)]
+
+
+class TestDeviceConfigEngine(TestCase):
+    def configurator(self, api, scope: ConfigScope, **kwargs) -> AsBulkDeviceConfigurator:
+        return AsBulkDeviceConfigurator(api, change=lambda c: None, scope=scope, job_threshold=5,
+                                        job_poll_interval=0, **kwargs)
+
+    def test_001_per_device(self):
+        api = FakeApi()
+        progress = []
+        configurator = self.configurator(api, ConfigScope.devices, progress=lambda p: progress.append(p.done))
+        report = asyncio.run(configurator.run(targets({'l1': 10}) + [DeviceTarget('bad', 'DMS Cisco 8845', 'l1')]))
+        self.assertEqual(10, report.succeeded)
+        self.assertEqual(['bad'], [o.target.device_id for o in report.outcomes if not o.ok])
+        self.assertEqual(11, api.calls['update_device_settings'])
+        self.assertEqual(10, api.calls['apply_changes'])
+        self.assertEqual(list(range(1, 12)), progress)
+        self.assertEqual([], api.jobs)
+
+    def test_002_location_jobs(self):
+        api = FakeApi(customized_devices={'l1-0'}, failing_location='l3', job_errors={'l2': ['l2-1']})
+        configurator = self.configurator(api, ConfigScope.locations)
+        report = asyncio.run(configurator.run(targets({'l1': 10, 'l2': 6, 'l3': 5, 'l4': 2})))
+        plan = report.plan
+        self.assertEqual({'l1', 'l2', 'l3'}, set(plan.location_jobs))
+        self.assertEqual({'l1-0', 'l4-0', 'l4-1'}, {t.device_id for t in plan.devices})
+        # location jobs enable location level customization; jobs run one at a time
+        self.assertEqual([('l1', True), ('l2', True), ('l3', True)], api.jobs)
+        self.assertEqual(1, api.max_running_jobs)
+        methods = {o.target.device_id: o.method for o in report.outcomes}
+        self.assertEqual(23, len(methods))
+        self.assertEqual(ConfigMethod.location_job, methods['l1-5'])
+        # failed job: devices updated individually
+        self.assertEqual(ConfigMethod.device, methods['l3-0'])
+        self.assertEqual(['l2-1'], [o.target.device_id for o in report.outcomes if not o.ok])
+        # device settings are read once per device, also for devices updated after a failed job
+        self.assertEqual(23, api.calls['device_settings'])
+
+    def test_003_org_job(self):
+        api = FakeApi(customized_locations={'l2'})
+        configurator = self.configurator(api, ConfigScope.org)
+        report = asyncio.run(configurator.run(targets({'l1': 10, 'l2': 6, 'l3': 3})))
+        self.assertEqual(13, len(report.plan.org_job))
+        self.assertEqual(['l2'], list(report.plan.location_jobs))
+        self.assertEqual([(None, False), ('l2', True)], api.jobs)
+        self.assertEqual(19, report.succeeded)
+        self.assertEqual(0, api.calls['update_device_settings'])
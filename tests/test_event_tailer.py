@@ -0,0 +1,99 @@
+"""
+Tests for the compliance/audit event tailer
+"""
+import asyncio
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest import TestCase
+
+from wxc_sdk.event_tailer import AsEventTailer, FileCursorStore, SeenIds
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class Source:
+    """
+    fake list endpoint returning events in the requested window, newest first like the API
+    """
+
+    def __init__(self):
+        self.events = []
+        self.windows = []
+
+    def add(self, event_id: str, minutes: float):
+        self.events.append(SimpleNamespace(id=event_id, created=T0 + timedelta(minutes=minutes)))
+
+    async def fetch(self, from_: datetime, to_: datetime):
+        self.windows.append((from_, to_))
+        for event in sorted(self.events, key=lambda e: e.created, reverse=True):
+            if from_ <= event.created < to_:
+                yield event
+
+
+class TestEventTailer(TestCase):
+    def test_001_seen_ids(self):
+        seen = SeenIds(maxsize=3)
+        self.assertTrue(all(seen.add(i) for i in 'abcd'))
+        self.assertNotIn('a', seen)
+        self.assertFalse(seen.add('d'))
+        self.assertEqual(3, len(seen))
+
+    def test_002_overlap_and_dedupe(self):
+        source = Source()
+        clock = SimpleNamespace(now=T0 + timedelta(minutes=10))
+        tailer = AsEventTailer(source.fetch, start=T0, overlap=timedelta(minutes=5), now=lambda: clock.now)
+
+        async def run():
+            source.add('e1', 1)
+            source.add('e2', 8)
+            first = [e.id for e in await tailer.poll()]
+            # e3 shows up late: created before the watermark but within the overlap
+            source.add('e3', 6)
+            source.add('e4', 12)
+            clock.now = T0 + timedelta(minutes=15)
+            second = [e.id for e in await tailer.poll()]
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertEqual(['e1', 'e2'], first)
+        self.assertEqual(['e3', 'e4'], second)
+        self.assertEqual(T0 + timedelta(minutes=12), tailer.watermark)
+        self.assertEqual(T0 + timedelta(minutes=3), source.windows[-1][0])
+
+    def test_003_cursor_persisted(self):
+        source = Source()
+        source.add('e1', 1)
+        source.add('e2', 2)
+        with tempfile.TemporaryDirectory() as tmp:
+            store = FileCursorStore(os.path.join(tmp, 'cursor.json'))
+            tailer = AsEventTailer(source.fetch, start=T0, store=store, min_interval=0.001,
+                                   now=lambda: T0 + timedelta(minutes=10))
+
+            async def run(t: AsEventTailer):
+                events = []
+                async for event in t.events():
+                    events.append(event.id)
+                    if len(events) == 2:
+                        t.stop()
+                return events
+
+            self.assertEqual(['e1', 'e2'], asyncio.run(run(tailer)))
+            cursor = store.load()
+            self.assertEqual(T0 + timedelta(minutes=2), cursor.watermark)
+            self.assertEqual(['e1', 'e2'], cursor.seen_ids)
+
+            # a new tailer continues from the persisted cursor and does not repeat events
+            source.add('e3', 3)
+            tailer = AsEventTailer(source.fetch, store=store, now=lambda: T0 + timedelta(minutes=10))
+            self.assertEqual(['e3'], [e.id for e in asyncio.run(tailer.poll())])
+
+    def test_004_adaptive_interval(self):
+        tailer = AsEventTailer(Source().fetch, min_interval=1, max_interval=10)
+        tailer.interval = 8
+        tailer._adapt(new_events=5)
+        self.assertEqual(4, tailer.interval)
+        for _ in range(10):
+            tailer._adapt(new_events=0)
+        self.assertEqual(10, tailer.interval)
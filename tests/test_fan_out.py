@@ -0,0 +1,123 @@
+"""
+Tests for thread pool and task based fan-out helpers
+"""
+import asyncio
+import threading
+import time
+from unittest import TestCase
+
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.fan_out import FanOutProgress, as_items_as_completed, as_map_items, items_as_completed, map_items
+
+
+class Counter:
+    """
+    callable which records the maximum number of concurrent calls
+    """
+
+    def __init__(self, fail: set[int] = None, delay: float = 0.002):
+        self.fail = fail or set()
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    def _enter(self):
+        with self.lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _exit(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def __call__(self, i: int) -> int:
+        self._enter()
+        try:
+            time.sleep(self.delay * (i % 3))
+            if i in self.fail:
+                raise ValueError(i)
+            return i * 10
+        finally:
+            self._exit()
+
+    async def as_call(self, i: int) -> int:
+        self._enter()
+        try:
+            await asyncio.sleep(self.delay * (i % 3))
+            if i in self.fail:
+                raise ValueError(i)
+            return i * 10
+        finally:
+            self._exit()
+
+
+class TestFanOut(TestCase):
+    def test_001_map_order_and_concurrency(self):
+        counter = Counter()
+        progress: list[int] = []
+        result = map_items(counter, range(50), max_workers=4, progress=lambda p: progress.append(p.done))
+        self.assertEqual([i * 10 for i in range(50)], result)
+        self.assertLessEqual(counter.max_in_flight, 4)
+        self.assertEqual(list(range(1, 51)), progress)
+
+    def test_002_exceptions_as_results(self):
+        result = map_items(Counter(fail={3, 7}), range(10), max_workers=3)
+        self.assertIsInstance(result[3], ValueError)
+        self.assertIsInstance(result[7], ValueError)
+        self.assertEqual(0, result[0])
+        with self.assertRaises(ValueError) as ctx:
+            map_items(Counter(fail={3, 7}), range(10), max_workers=3, return_exceptions=False)
+        self.assertEqual(3, ctx.exception.args[0])
+
+    def test_003_cancel_on_error(self):
+        counter = Counter(fail={2})
+        with self.assertRaises(ValueError):
+            map_items(counter, range(1000), max_workers=2, cancel_on_error=True)
+        # window of 2 * workers: most items never got started
+        self.assertLess(counter.calls, 20)
+
+    def test_004_as_completed_lazy(self):
+        consumed = []
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        gen = items_as_completed(Counter(), items(), max_workers=2)
+        first = next(gen)
+        self.assertTrue(first.ok)
+        self.assertLessEqual(len(consumed), 6)
+        gen.close()
+        progress = FanOutProgress(total=10)
+        self.assertIsNone(progress.eta)
+
+    def test_005_api_map(self):
+        api = WebexSimpleApi(tokens='token', concurrent_requests=3)
+        try:
+            counter = Counter()
+            self.assertEqual([i * 10 for i in range(20)], api.map(counter, range(20)))
+            self.assertLessEqual(counter.max_in_flight, 3)
+            results = sorted(api.as_completed(counter, range(5)), key=lambda r: r.index)
+            self.assertEqual([0, 10, 20, 30, 40], [r.result for r in results])
+        finally:
+            api.close()
+
+    def test_006_async(self):
+        async def run():
+            counter = Counter(fail={5})
+            result = await as_map_items(counter.as_call, range(30), concurrency=4)
+            self.assertIsInstance(result[5], ValueError)
+            self.assertEqual(60, result[6])
+            self.assertLessEqual(counter.max_in_flight, 4)
+            counter = Counter(fail={2})
+            results = [r async for r in as_items_as_completed(counter.as_call, range(1000), concurrency=3,
+                                                              cancel_on_error=True)]
+            self.assertFalse(results[-1].ok)
+            self.assertLess(counter.calls, 20)
+            self.assertEqual(0, counter.in_flight)
+
+        asyncio.run(run())
@@ -0,0 +1,127 @@
+"""
+Tests for the local inventory mirror
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import call, patch
+
+from wxc_sdk.admin_audit import AuditEvent, AuditEventData
+from wxc_sdk.inventory import InventoryMirror, InventoryEntityType
+from wxc_sdk.locations import Location
+from wxc_sdk.people import Person, PhoneNumber
+from wxc_sdk.telephony.callqueue import CallQueue
+
+
+def gen(items):
+    async def list_gen(**kwargs):
+        for item in items:
+            if kwargs.get('location_id') and getattr(item, 'location_id', None) != kwargs['location_id']:
+                continue
+            yield item
+
+    return list_gen
+
+
+def empty_gen(**kwargs):
+    return gen([])(**kwargs)
+
+
+LOCATIONS = [Location(location_id='L1', name='San Jose'), Location(location_id='L2', name='Berlin')]
+PEOPLE = [Person(person_id='P1', emails=['Alice@example.com'], display_name='Alice', location_id='L1',
+                 extension='4711', phone_numbers=[PhoneNumber(number_type='work', value='+1 408 555 1234')]),
+          Person(person_id='P2', emails=['bob@example.com'], display_name='Bob', location_id='L2', extension='4711')]
+QUEUES = [CallQueue(id='Q1', name='Support', location_id='L1', extension='5000', phone_number='+14085550000')]
+
+
+def fake_api():
+    return SimpleNamespace(
+        locations=SimpleNamespace(list_gen=gen(LOCATIONS)),
+        people=SimpleNamespace(list_gen=gen(PEOPLE)),
+        workspaces=SimpleNamespace(list_gen=empty_gen),
+        telephony=SimpleNamespace(virtual_lines=SimpleNamespace(list_gen=empty_gen),
+                                  phone_numbers_gen=empty_gen,
+                                  callqueue=SimpleNamespace(list_gen=gen(QUEUES)),
+                                  huntgroup=SimpleNamespace(list_gen=empty_gen),
+                                  auto_attendant=SimpleNamespace(list_gen=empty_gen)))
+
+
+class TestInventory(TestCase):
+    def setUp(self) -> None:
+        self.mirror = InventoryMirror()
+        asyncio.run(self.mirror.refresh(fake_api()))
+
+    def tearDown(self) -> None:
+        self.mirror.close()
+
+    def test_001_lookups(self):
+        mirror = self.mirror
+        self.assertIsNotNone(mirror.last_refresh())
+        self.assertEqual('P1', mirror.by_email('alice@EXAMPLE.com').person_id)
+        self.assertEqual(['P1'], [p.person_id for p in mirror.by_number('+14085551234')])
+        self.assertEqual({'P1', 'P2'}, {p.person_id for p in mirror.by_extension('4711')})
+        self.assertEqual(['P2'], [p.person_id for p in mirror.by_extension('4711', location_id='L2')])
+        self.assertEqual('Support', mirror.by_id(InventoryEntityType.call_queues, 'Q1').name)
+        self.assertEqual(['L2'], [loc.location_id for loc in mirror.by_name('berlin')])
+        self.assertEqual(2, len(mirror.all(InventoryEntityType.people)))
+
+    def test_002_location_scoped_refresh(self):
+        mirror = self.mirror
+        PEOPLE.append(Person(person_id='P3', emails=['carol@example.com'], location_id='L2'))
+        try:
+            asyncio.run(mirror.refresh(fake_api(), entity_types=[InventoryEntityType.people], location_ids=['L2']))
+        finally:
+            PEOPLE.pop()
+        self.assertEqual(3, len(mirror.all(InventoryEntityType.people)))
+        self.assertEqual(2, len(mirror.all(InventoryEntityType.people, location_id='L2')))
+
+    def test_003_audit_event_mapping(self):
+        event = AuditEvent(data=AuditEventData(event_category='CALL_QUEUE', location_name='San Jose'))
+        self.assertEqual([(InventoryEntityType.call_queues, 'L1')], self.mirror.stale_from_audit_event(event))
+        event = AuditEvent(data=AuditEventData(event_category='LOGINS'))
+        self.assertEqual([], self.mirror.stale_from_audit_event(event))
+        # only the structured fields are matched; free text is ignored
+        event = AuditEvent(data=AuditEventData(event_category='DEVICES', target_type='DEVICE',
+                                               event_description='user replaced number'))
+        self.assertEqual([], self.mirror.stale_from_audit_event(event))
+        event = AuditEvent(data=AuditEventData(event_category='WORKSPACES', target_type='TargetType.Hunt Group'))
+        self.assertEqual([(InventoryEntityType.workspaces, None), (InventoryEntityType.hunt_groups, None)],
+                         self.mirror.stale_from_audit_event(event))
+
+    def test_004_stale(self):
+        mirror = self.mirror
+        mirror.invalidate(InventoryEntityType.call_queues, 'L1')
+        QUEUES.append(CallQueue(id='Q2', name='Sales', location_id='L1', extension='5001'))
+        try:
+            asyncio.run(mirror.refresh_stale(fake_api()))
+        finally:
+            QUEUES.pop()
+        self.assertEqual(['Q2'], [q.id for q in mirror.by_extension('5001')])
+
+    def test_005_audit_overlap(self):
+        mirror = self.mirror
+        start = datetime.now(tz=timezone.utc)
+        events = [AuditEvent(id='E1', created=start - timedelta(minutes=1),
+                             data=AuditEventData(event_category='CALL_QUEUE'))]
+        windows = []
+
+        async def list_events_gen(org_id, from_, to_):
+            windows.append(from_)
+            for event in events:
+                yield event
+
+        api = fake_api()
+        api.admin_audit = SimpleNamespace(list_events_gen=list_events_gen)
+        asyncio.run(mirror.refresh_from_audit(api, org_id='O', since=start - timedelta(hours=1)))
+        # E1 is seen again in the overlapping window and ignored; late event E2 is picked up
+        events.append(AuditEvent(id='E2', created=start - timedelta(minutes=2),
+                                 data=AuditEventData(event_category='LOCATIONS')))
+        with patch.object(mirror, 'invalidate', wraps=mirror.invalidate) as invalidate:
+            asyncio.run(mirror.refresh_from_audit(api, org_id='O'))
+        self.assertEqual([call(InventoryEntityType.locations, None)], invalidate.call_args_list)
+        # 2nd window starts at the newest event seen minus the overlap
+        self.assertAlmostEqual(start - timedelta(minutes=6), windows[1], delta=timedelta(milliseconds=1))
+        # ... and doesn't move back if there are no new events
+        asyncio.run(mirror.refresh_from_audit(api, org_id='O'))
+        self.assertEqual(windows[1], windows[2])
@@ -0,0 +1,105 @@
+"""
+Tests for line key template rollouts
+"""
+import asyncio
+from collections import Counter
+from types import SimpleNamespace
+from unittest import TestCase
+
+from wxc_sdk.line_key_rollout import AsLineKeyRollout, DevicePopulation, PreviewCache
+from wxc_sdk.telephony.jobs import ApplyLineKeyTemplateJobDetails, JobErrorItem
+
+
+class Conflict(Exception):
+    status = 409
+
+
+class FakeApi:
+    def __init__(self, device_counts: dict[str, int], max_jobs: int = 2, job_errors: dict[str, int] = None):
+        self.device_counts = device_counts
+        self.max_jobs = max_jobs
+        self.job_errors = job_errors or {}
+        self.calls = Counter()
+        self.running = 0
+        self.max_running = 0
+        self.jobs = []
+        self.telephony = SimpleNamespace(
+            devices=SimpleNamespace(preview_apply_line_key_template=self.preview),
+            jobs=SimpleNamespace(apply_line_key_templates=SimpleNamespace(apply=self.apply, status=self.status,
+                                                                         errors_gen=self.errors_gen)))
+
+    async def preview(self, action, template_id=None, location_ids=None, org_id=None, **kwargs) -> int:
+        self.calls['preview'] += 1
+        await asyncio.sleep(0)
+        return sum(self.device_counts.get(location_id, 0) for location_id in location_ids or self.device_counts)
+
+    async def apply(self, action, template_id=None, location_ids=None, org_id=None, **kwargs):
+        self.calls['apply'] += 1
+        if self.running >= self.max_jobs:
+            raise Conflict('too many jobs')
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.jobs.append((template_id, location_ids))
+        return ApplyLineKeyTemplateJobDetails(id=f'{len(self.jobs)}:{location_ids[0]}',
+                                              latest_execution_status='STARTED')
+
+    async def status(self, job_id: str, org_id: str = None):
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        location_id = job_id.split(':')[1]
+        return ApplyLineKeyTemplateJobDetails(id=job_id, latest_execution_status='COMPLETED',
+                                              updated_count=self.device_counts[location_id])
+
+    async def errors_gen(self, job_id: str, org_id: str = None):
+        for i in range(self.job_errors.get(job_id.split(':')[1], 0)):
+            yield JobErrorItem.model_validate({'item': f'device{i}', 'itemNumber': i, 'trackingId': 't',
+                                               'error': {'key': '400',
+                                                         'message': [{'description': 'unsupported model'}]}})
+
+
+class TestLineKeyRollout(TestCase):
+
+    def test_tasks(self):
+        rollout = AsLineKeyRollout(FakeApi({}))
+        tasks = rollout.tasks({'t1': DevicePopulation(location_ids=['l1', 'l2', 'l1']),
+                               None: DevicePopulation()})
+        self.assertEqual([('t1', ['l1']), ('t1', ['l2']), (None, None)],
+                         [(task.template_id, task.location_ids) for task in tasks])
+        self.assertEqual('APPLY_DEFAULT_TEMPLATES', tasks[-1].action.value)
+        rollout.per_location = False
+        tasks = rollout.tasks({'t1': DevicePopulation(location_ids=['l1', 'l2'])})
+        self.assertEqual([['l1', 'l2']], [task.location_ids for task in tasks])
+
+    def test_run(self):
+        counts = {f'l{i}': i % 3 for i in range(12)}
+        api = FakeApi(counts, max_jobs=2, job_errors={'l4': 2, 'l7': 1})
+        rollout = AsLineKeyRollout(api, max_parallel_jobs=3, job_poll_interval=0.001)
+        report = asyncio.run(rollout.run({'t1': DevicePopulation(location_ids=list(counts))}))
+        # locations without devices are skipped
+        self.assertEqual(4, len(report.skipped))
+        self.assertEqual(8, len(report.tasks))
+        self.assertEqual(sum(counts.values()), report.devices)
+        self.assertFalse(report.failed)
+        # 409 responses are retried; never more jobs running than allowed
+        self.assertEqual(2, api.max_running)
+        self.assertGreater(api.calls['apply'], 8)
+        self.assertEqual(3, len(report.errors))
+        self.assertEqual({'l4', 'l7'}, {task.location_ids[0] for task, _ in report.errors})
+
+    def test_preview_cache(self):
+        api = FakeApi({'l1': 1, 'l2': 0})
+        cache = PreviewCache()
+        population = {'t1': DevicePopulation(location_ids=['l1', 'l2'])}
+        rollout = AsLineKeyRollout(api, preview_cache=cache)
+        tasks = rollout.tasks(population)
+        asyncio.run(rollout.preview(tasks))
+        self.assertEqual([1, 0], [task.preview for task in tasks])
+        # a second plan uses cached previews; different filters are previewed again
+        asyncio.run(rollout.preview(rollout.tasks(population)))
+        self.assertEqual(2, api.calls['preview'])
+        asyncio.run(rollout.preview(rollout.tasks({'t1': DevicePopulation(location_ids=['l1'],
+                                                                          exclude_device_tags=['lobby'])})))
+        self.assertEqual(3, api.calls['preview'])
+        cache.ttl = 0
+        asyncio.run(rollout.preview(rollout.tasks(population)))
+        self.assertEqual(5, api.calls['preview'])
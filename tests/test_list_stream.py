@@ -0,0 +1,122 @@
+"""
+Tests for bounded memory streaming of async list results
+"""
+import asyncio
+from unittest import TestCase
+
+from wxc_sdk.list_stream import AsListStream
+
+
+class Source:
+    """
+    fake paginated source which records how many items have been produced
+    """
+
+    def __init__(self, count: int, page_size: int = 10, fail_at: int = None):
+        self.count = count
+        self.page_size = page_size
+        self.fail_at = fail_at
+        self.produced = 0
+        self.pages = 0
+        self.closed = False
+
+    async def gen(self):
+        try:
+            for i in range(self.count):
+                if i % self.page_size == 0:
+                    self.pages += 1
+                    await asyncio.sleep(0)
+                if i == self.fail_at:
+                    raise ValueError('failed')
+                self.produced += 1
+                yield i
+        finally:
+            self.closed = True
+
+
+class TestListStream(TestCase):
+    def test_001_batches(self):
+        async def run():
+            source = Source(95)
+            async with AsListStream(source.gen(), prefetch=20) as stream:
+                return [batch async for batch in stream.batches(30)]
+
+        batches = asyncio.run(run())
+        self.assertEqual([30, 30, 30, 5], [len(b) for b in batches])
+        self.assertEqual(list(range(95)), [i for b in batches for i in b])
+
+    def test_002_backpressure(self):
+        async def run():
+            source = Source(1000)
+            async with AsListStream(source.gen(), prefetch=25) as stream:
+                first = await stream.__anext__()
+                # give the prefetcher plenty of opportunity to run ahead
+                for _ in range(100):
+                    await asyncio.sleep(0)
+                # queue size + one item in flight + item already consumed
+                self.assertLessEqual(source.produced, 25 + 2)
+                self.assertEqual(0, first)
+            self.assertTrue(source.closed)
+
+        asyncio.run(run())
+
+    def test_003_collect_limit(self):
+        for prefetch in (0, 50):
+            with self.subTest(prefetch=prefetch):
+                source = Source(1000)
+                items = asyncio.run(AsListStream(source.gen(), prefetch=prefetch).collect(limit=15))
+                self.assertEqual(list(range(15)), items)
+                self.assertTrue(source.closed)
+                self.assertLessEqual(source.pages, 7)
+
+    def test_004_error(self):
+        source = Source(100, fail_at=42)
+        with self.assertRaises(ValueError):
+            asyncio.run(AsListStream(source.gen(), prefetch=10).collect())
+
+
+class TestListWithDetails(TestCase):
+    @staticmethod
+    def run_details(ordered: bool, count: int = 50, concurrency: int = 5, fail: int = None,
+                    return_exceptions: bool = False):
+        state = {'in_flight': 0, 'max_in_flight': 0}
+
+        async def details(i: int):
+            state['in_flight'] += 1
+            state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+            try:
+                # later items complete faster
+                await asyncio.sleep(0.001 * ((count - i) % 7))
+                if i == fail:
+                    raise ValueError(i)
+                return i * 10
+            finally:
+                state['in_flight'] -= 1
+
+        async def run():
+            source = Source(count)
+            stream = AsListStream(source.gen())
+            result = [r async for r in stream.list_with_details(details, concurrency=concurrency, ordered=ordered,
+                                                               return_exceptions=return_exceptions)]
+            return result, source
+
+        result, source = asyncio.run(run())
+        return result, source, state
+
+    def test_001_ordered(self):
+        result, source, state = self.run_details(ordered=True)
+        self.assertEqual([i * 10 for i in range(50)], result)
+        self.assertLessEqual(state['max_in_flight'], 5)
+
+    def test_002_unordered(self):
+        result, source, state = self.run_details(ordered=False)
+        self.assertEqual([i * 10 for i in range(50)], sorted(result))
+        self.assertNotEqual([i * 10 for i in range(50)], result)
+        self.assertLessEqual(state['max_in_flight'], 5)
+
+    def test_003_errors(self):
+        with self.assertRaises(ValueError):
+            self.run_details(ordered=True, fail=17)
+        result, _, state = self.run_details(ordered=False, fail=17, return_exceptions=True)
+        self.assertEqual(1, sum(isinstance(r, ValueError) for r in result))
+        self.assertEqual(0, state['in_flight'])
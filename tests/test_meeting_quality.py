@@ -0,0 +1,87 @@
+"""
+Tests for the columnar meeting quality pipeline
+"""
+import asyncio
+import math
+from types import SimpleNamespace
+from unittest import TestCase
+
+from wxc_sdk.meeting_quality import AsQualityCollector, QualityColumns
+from wxc_sdk.meetings import Meeting
+from wxc_sdk.meetings.qualities import MediaSessionQuality
+
+
+def session(meeting_id: str, participant: int, network: str = 'wifi', jitter=(1, 2, 3, 4)) -> dict:
+    return {'meetingInstanceId': meeting_id, 'participantId': f'p{participant}',
+            'webexUserEmail': f'user{participant}@example.com', 'networkType': network,
+            'joinTime': '2024-01-01T10:00:00.000Z',
+            'audioIn': [{'samplingInterval': 60, 'startTime': '2024-01-01T10:00:00.000Z', 'codec': 'opus',
+                         'transportType': 'UDP', 'jitter': list(jitter), 'latency': [10, 20, 30, 40],
+                         'packetLoss': [0, 0, 1]}],
+            'videoIn': [{'samplingInterval': 60, 'jitter': [100, 200], 'latency': [50, 60]}]}
+
+
+class FakeSession:
+    def __init__(self, data: dict[str, list[dict]], failing: str = None):
+        self.data = data
+        self.failing = failing
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def follow_pagination(self, url: str, params: dict = None, **kwargs):
+        meeting_id = params['meetingId']
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            for record in self.data[meeting_id]:
+                await asyncio.sleep(0.001)
+                if meeting_id == self.failing:
+                    raise ValueError('rate limited')
+                yield record
+        finally:
+            self.in_flight -= 1
+
+
+class TestMeetingQuality(TestCase):
+    def test_001_columns(self):
+        columns = QualityColumns()
+        columns.add_session(session('m1', 1))
+        columns.add_quality(MediaSessionQuality.model_validate(session('m1', 2, network='ethernet')))
+        self.assertEqual(2, len(columns))
+        self.assertEqual(4, columns.stream_count)
+        self.assertEqual(12, columns.sample_count)
+        self.assertEqual([1, 2, 3, 4], list(columns.series(0, 'jitter')))
+        # shorter series are padded with NaN
+        self.assertTrue(math.isnan(columns.series(0, 'packet_loss')[3]))
+        self.assertEqual([100, 200], list(columns.series(3, 'jitter')))
+        self.assertEqual(['audio_in', 'video_in'] * 2, columns.stream_media)
+
+        by_network = {s.key: s for s in columns.summary(by='network', media='audio_in')}
+        self.assertEqual({'ethernet', 'wifi'}, set(by_network))
+        stats = by_network['wifi'].metrics['jitter']
+        self.assertEqual((4, 2.5, 4, 4), (stats.count, stats.mean, stats.p95, stats.max))
+        self.assertEqual(3, by_network['wifi'].metrics['packet_loss'].count)
+        meeting = columns.summary(by='meeting')[0]
+        self.assertEqual(('m1', 2, 4), (meeting.key, meeting.sessions, meeting.streams))
+        self.assertEqual(12, meeting.metrics['jitter'].count)
+
+    def test_002_collect(self):
+        data = {f'm{i}': [session(f'm{i}', p, jitter=(i, i)) for p in range(3)] for i in range(10)}
+        api = SimpleNamespace(session=FakeSession(data, failing='m7'))
+        meetings = [Meeting(id='m0', site_url='site0')] + [f'm{i}' for i in range(1, 10)]
+        columns = asyncio.run(AsQualityCollector(api, concurrency=4).collect(meetings))
+        self.assertLessEqual(api.session.max_in_flight, 4)
+        self.assertEqual(['m7'], list(columns.errors))
+        # sessions of the failed meeting are not added
+        self.assertEqual(27, len(columns))
+        self.assertEqual(set(data) - {'m7'}, set(columns.sessions['meeting_id']))
+        by_meeting = {s.key: s for s in columns.summary(by='meeting', media='audio_in', metrics=['jitter'])}
+        for i in set(range(10)) - {7}:
+            self.assertEqual(i, by_meeting[f'm{i}'].metrics['jitter'].mean)
+        # offsets stay consistent after merging
+        for stream in range(columns.stream_count):
+            meeting_id = columns.sessions['meeting_id'][columns.stream_session[stream]]
+            if columns.stream_media[stream] == 'audio_in':
+                self.assertEqual([int(meeting_id[1:])] * 2, list(columns.series(stream, 'jitter'))[:2])
+        by_site = {s.key: s.sessions for s in columns.summary(by='site')}
+        self.assertEqual({'site0': 3, None: 24}, by_site)
@@ -0,0 +1,137 @@
+"""
+Tests for the membership graph
+"""
+import asyncio
+import base64
+from types import SimpleNamespace
+from unittest import TestCase
+
+from wxc_sdk.membership_graph import AsMembershipGraphBuilder, ContainerKind, MembershipGraph, normalize_id
+from wxc_sdk.webhook import WebhookEvent
+
+
+def webex_id(kind: str, uuid: str) -> str:
+    return base64.b64encode(f'ciscospark://us/{kind}/{uuid}'.encode()).decode().rstrip('=')
+
+
+def person(i: int) -> str:
+    return webex_id('PEOPLE', f'0000000{i}-aaaa-bbbb-cccc-dddddddddddd')
+
+
+def scim_user(i: int) -> str:
+    return f'0000000{i}-aaaa-bbbb-cccc-dddddddddddd'
+
+
+async def agen(items):
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+class FakeApi:
+    def __init__(self):
+        rooms = {'room1': [1, 2, 3], 'room2': [1], 'room3': []}
+        teams = {'team1': [2, 3]}
+        groups = {'group1': [1, 3]}
+        self.rooms = SimpleNamespace(list_gen=lambda: agen(SimpleNamespace(id=r) for r in rooms))
+        self.teams = SimpleNamespace(list_gen=lambda: agen(SimpleNamespace(id=t) for t in teams))
+        self.memberships = SimpleNamespace(
+            list_gen=lambda room_id: agen(SimpleNamespace(person_id=person(i), person_email=f'user{i}@example.com')
+                                          for i in rooms[room_id]))
+        self.team_memberships = SimpleNamespace(
+            list_gen=lambda team_id: agen(SimpleNamespace(person_id=person(i), person_email=f'user{i}@example.com')
+                                          for i in teams[team_id]))
+        self.scim = SimpleNamespace(groups=SimpleNamespace(
+            search_all_gen=lambda org_id: agen(SimpleNamespace(id=g) for g in list(groups) + ['broken']),
+            members_all_gen=self.scim_members))
+        self.groups = groups
+
+    def scim_members(self, org_id: str, group_id: str):
+        if group_id == 'broken':
+            raise ValueError('no access')
+        return agen(SimpleNamespace(value=scim_user(i)) for i in self.groups[group_id])
+
+
+class TestMembershipGraph(TestCase):
+    def test_normalize_id(self):
+        self.assertEqual(scim_user(1), normalize_id(person(1)))
+        self.assertEqual(scim_user(1), normalize_id(scim_user(1)))
+        self.assertEqual('user@example.com', normalize_id('User@Example.com'))
+        self.assertEqual(f'ROOM/{scim_user(1)}', normalize_id(webex_id('ROOM', scim_user(1)), keep_type=True))
+
+    def test_team_and_general_space(self):
+        # a team and its General space have the same UUID
+        team_id, room_id = webex_id('TEAM', scim_user(1)), webex_id('ROOM', scim_user(1))
+        graph = MembershipGraph()
+        graph.add_membership(ContainerKind.team, team_id, person(1))
+        graph.add_membership(ContainerKind.room, room_id, person(2))
+        self.assertEqual(2, len(graph.containers))
+        self.assertEqual(ContainerKind.team, graph.kind(team_id))
+        self.assertEqual(ContainerKind.room, graph.kind(room_id))
+        self.assertEqual([person(1)], graph.members_of(team_id))
+        self.assertEqual([person(2)], graph.members_of(room_id))
+
+    def test_build(self):
+        builder = AsMembershipGraphBuilder(FakeApi(), concurrency=2, scim_org_id='org')
+        graph = asyncio.run(builder.build())
+        self.assertEqual(['broken'], list(builder.failed))
+        self.assertEqual(8, len(graph))
+        self.assertEqual(3, len(graph.persons))
+        # SCIM user ids, Webex ids and emails map to the same person; order depends on crawl completion
+        self.assertCountEqual(['room1', 'room2', 'group1'], graph.containers_of(person(1)))
+        self.assertCountEqual(['room1', 'room2', 'group1'], graph.containers_of(scim_user(1)))
+        self.assertCountEqual(['room1', 'team1', 'group1'], graph.containers_of('user3@example.com'))
+        self.assertEqual(['group1'], graph.containers_of('user1@example.com', kind=ContainerKind.group))
+        self.assertCountEqual([person(2), person(3)], graph.members_of('team1'))
+        self.assertEqual(ContainerKind.team, graph.kind('team1'))
+
+    def test_incremental_updates(self):
+        graph = MembershipGraph()
+        graph.add_membership(ContainerKind.room, 'room1', person(1))
+        graph.add_membership(ContainerKind.room, 'room1', person(2))
+        graph.compact()
+        self.assertEqual(2, len(graph))
+
+        def event(event_type: str, resource: str, data: dict) -> WebhookEvent:
+            return WebhookEvent.model_validate({'id': 'w', 'name': 'w', 'targetUrl': 'https://example.com',
+                                                'resource': resource, 'event': event_type, 'status': 'active',
+                                                'created': '2024-01-01T00:00:00.000Z', 'data': data})
+
+        self.assertTrue(graph.apply_event(event('deleted', 'memberships',
+                                                {'id': 'm', 'roomId': 'room1', 'personId': person(1)})))
+        self.assertTrue(graph.apply_event(event('created', 'memberships',
+                                                {'id': 'm', 'roomId': 'room2', 'personId': person(2),
+                                                 'personEmail': 'user2@example.com'})))
+        self.assertFalse(graph.apply_event(event('created', 'messages',
+                                                 {'id': 'm', 'roomId': 'room2', 'personId': person(2)})))
+        self.assertFalse(graph.is_member('room1', person(1)))
+        self.assertEqual(['room1', 'room2'], graph.containers_of('user2@example.com'))
+        self.assertEqual([], graph.containers_of(person(1)))
+        self.assertEqual(2, len(graph))
+
+        # re-adding a removed membership and compacting keeps the same state
+        graph.add_membership(ContainerKind.room, 'room1', person(1))
+        before = {p: graph.containers_of(p) for p in (person(1), person(2))}
+        graph.compact()
+        self.assertEqual(before, {p: graph.containers_of(p) for p in (person(1), person(2))})
+        self.assertEqual(3, len(graph))
+
+        self.assertTrue(graph.apply_event(event('deleted', 'rooms', {'id': 'room1'})))
+        self.assertEqual([], graph.members_of('room1'))
+        self.assertEqual(['room2'], graph.containers_of(person(2)))
+
+    def test_compaction(self):
+        graph = MembershipGraph(compact_threshold=10, compact_ratio=0.5)
+        compactions = []
+        compact = graph.compact
+        graph.compact = lambda: compactions.append(len(graph)) or compact()
+        with graph.bulk():
+            for i in range(100):
+                graph.add_membership(ContainerKind.room, f'room{i % 7}', f'user{i}')
+        # bulk updates are compacted once
+        self.assertEqual([100], compactions)
+        for i in range(100, 200):
+            graph.add_membership(ContainerKind.room, 'room0', f'user{i}')
+        # automatic compaction once the overlay exceeds half of the compacted memberships
+        self.assertEqual([100, 151], compactions)
+        self.assertEqual(200, len(graph))
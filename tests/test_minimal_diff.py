@@ -0,0 +1,60 @@
+"""
+Tests for minimal-diff updates
+"""
+import asyncio
+from unittest import TestCase
+
+from wxc_sdk.minimal_diff import MinimalDiff, model_diff
+from wxc_sdk.people import Person
+from wxc_sdk.telephony.location import TelephonyLocation
+
+
+def location(**kwargs) -> TelephonyLocation:
+    data = dict(location_id='L1', name='San Jose', routing_prefix='8001', outside_dial_digit='9',
+                enforce_outside_dial_digit=False)
+    data.update(kwargs)
+    return TelephonyLocation(**data)
+
+
+class TestMinimalDiff(TestCase):
+    def test_001_diff(self):
+        changes = model_diff(location(), location(outside_dial_digit='0'))
+        self.assertEqual({'outside_dial_digit': ('9', '0')}, changes)
+        self.assertEqual({}, model_diff(location(), location()))
+
+    def test_002_sparse_payload_and_skip(self):
+        diff = MinimalDiff()
+        sent = []
+        reads = []
+
+        def read():
+            reads.append(1)
+            return location()
+
+        desired = location(routing_prefix='8002', enforce_outside_dial_digit=True)
+        r = diff.update(key='L1', desired=desired, current=read, update=lambda s: sent.append(s.update()))
+        self.assertFalse(r.skipped)
+        # only changed fields are serialized by the update helper
+        self.assertEqual([{'routingPrefix': '8002', 'enforceOutsideDialDigit': True}], sent)
+        # 2nd time: no read (cached state), no update
+        r = diff.update(key='L1', desired=desired, current=read, update=lambda s: sent.append(s.update()))
+        self.assertTrue(r.skipped)
+        self.assertEqual(1, len(reads))
+        self.assertEqual(1, len(sent))
+        self.assertEqual((1, 1), (diff.sent, diff.skipped))
+
+    def test_003_full_payload_async(self):
+        diff = MinimalDiff()
+        current = Person(person_id='P1', display_name='Alice', emails=['alice@example.com'])
+        desired = current.model_copy(deep=True)
+        desired.display_name = 'Alice Smith'
+
+        async def read():
+            return current
+
+        async def update(person: Person):
+            return person
+
+        r = asyncio.run(diff.as_update(key='P1', desired=desired, current=read, update=update, sparse=False))
+        self.assertEqual({'display_name': ('Alice', 'Alice Smith')}, r.changes)
+        self.assertIs(desired, r.result)
@@ -0,0 +1,77 @@
+"""
+Tests for the number and extension ownership index
+"""
+from unittest import TestCase
+
+from wxc_sdk.common import IdAndName, NumberOwner, OwnerType, UserNumber
+from wxc_sdk.number_index import NumberIndex
+from wxc_sdk.telephony import NumberListPhoneNumber
+from wxc_sdk.telephony.callqueue import CallQueue
+from wxc_sdk.telephony.virtual_line import VirtualLine, VirtualLineLocation
+
+
+def number(phone_number: str = None, extension: str = None, owner_id: str = None, location_id: str = 'L1',
+           esn: str = None) -> NumberListPhoneNumber:
+    owner = owner_id and NumberOwner(owner_id=owner_id, owner_type=OwnerType.people, first_name='First',
+                                     last_name=owner_id)
+    return NumberListPhoneNumber(phone_number=phone_number, extension=extension, esn=esn,
+                                 location=IdAndName(id=location_id, name=location_id), owner=owner,
+                                 main_number=False, toll_free_number=False)
+
+
+class TestNumberIndex(TestCase):
+    def setUp(self) -> None:
+        index = NumberIndex()
+        index.add_features([CallQueue(id='Q1', name='Support', location_id='L1', extension='5000',
+                                      phone_number='+14085550000', esn='8015000'),
+                            VirtualLine(id='V1', display_name='VL', location=VirtualLineLocation(id='L2', name='L2'),
+                                        number=UserNumber(external='+494055500', extension='200'))])
+        index.add_phone_numbers([number('+14085551234', '4711', owner_id='P1', esn='8014711'),
+                                 number('+14085551235'),
+                                 number(extension='4711', owner_id='P2', location_id='L2')])
+        self.index = index
+
+    def test_001_lookups(self):
+        index = self.index
+        self.assertEqual('P1', index.by_number('+1 408 555 1234').owner_id)
+        self.assertEqual('First P1', index.by_number('+14085551234').name)
+        self.assertEqual('P1', index.by_extension('L1', '4711').owner_id)
+        self.assertEqual('P2', index.by_extension('L2', '4711').owner_id)
+        self.assertEqual('P1', index.by_esn('8014711').owner_id)
+        self.assertEqual(OwnerType.call_queue.value, index.by_esn('8015000').owner_type)
+        self.assertEqual('V1', index.by_extension('L2', '200').owner_id)
+        self.assertIsNone(index.by_extension('L3', '4711'))
+        self.assertIsNone(index.by_number('+15555555555'))
+
+    def test_002_unassigned(self):
+        owner = self.index.by_number('+14085551235')
+        self.assertIsNotNone(owner)
+        self.assertIsNone(owner.owner_id)
+        self.assertEqual('L1', owner.location_id)
+
+    def test_003_incremental(self):
+        index = self.index
+        # number moves from unassigned to an owner
+        index.add(owner_id='P3', owner_type=OwnerType.people.value, name='P3', location_id='L1',
+                  number='+14085551235')
+        self.assertEqual('P3', index.by_number('+14085551235').owner_id)
+        index.remove_owner('P1')
+        self.assertIsNone(index.by_number('+14085551234'))
+        self.assertIsNone(index.by_extension('L1', '4711'))
+        # the freed slot is reused
+        index.add(owner_id='P4', owner_type=OwnerType.people.value, name='P4', location_id='L1', extension='4712')
+        self.assertEqual('P4', index.by_extension('L1', '4712').owner_id)
+        self.assertEqual(['+14085551235'], index.numbers_of('P3'))
+        index.remove_number('+14085551235')
+        self.assertEqual([], index.numbers_of('P3'))
+
+    def test_004_location_change(self):
+        index = self.index
+        # the call queue moves to another location: its extension has to move as well
+        index.add(owner_id='Q1', owner_type=OwnerType.call_queue.value, name='Support', location_id='L3',
+                  number='+14085550000')
+        self.assertIsNone(index.by_extension('L1', '5000'))
+        self.assertEqual('Q1', index.by_extension('L3', '5000').owner_id)
+        self.assertEqual('L3', index.by_number('+14085550000').location_id)
+        index.remove_owner('Q1')
+        self.assertIsNone(index.by_extension('L3', '5000'))
@@ -0,0 +1,104 @@
+"""
+Tests for the batched number provisioning pipeline
+"""
+import asyncio
+from collections import defaultdict
+from types import SimpleNamespace
+from unittest import TestCase
+
+from wxc_sdk.common import ValidatePhoneNumbersResponse
+from wxc_sdk.number_provisioning import AsNumberProvisioner, ProvisioningStage
+from wxc_sdk.telephony.location.numbers import NumberAddResponse
+
+
+class FakeApi:
+    """
+    fake telephony API recording requests and concurrency per location
+    """
+
+    def __init__(self, unavailable: set[str] = (), add_errors: set[str] = (), fail_location: str = None):
+        self.unavailable = set(unavailable)
+        self.add_errors = set(add_errors)
+        self.fail_location = fail_location
+        self.validate_sizes = []
+        self.add_sizes = []
+        self.activated = []
+        self.in_flight = defaultdict(int)
+        self.max_in_flight = defaultdict(int)
+        self.first_add_before_last_validate = None
+        number = SimpleNamespace(add=self.add, activate=self.activate)
+        self.telephony = SimpleNamespace(validate_phone_numbers=self.validate,
+                                         location=SimpleNamespace(number=number))
+
+    async def validate(self, phone_numbers: list[str], org_id: str = None):
+        self.validate_sizes.append(len(phone_numbers))
+        await asyncio.sleep(0.001)
+        status = [{'phoneNumber': n, 'tollFreeNumber': False,
+                   'state': 'Duplicate' if n in self.unavailable else 'Available'}
+                  for n in phone_numbers]
+        return ValidatePhoneNumbersResponse.model_validate({'status': 'OK', 'phoneNumbers': status})
+
+    async def add(self, location_id: str, phone_numbers: list[str], **kwargs):
+        if self.first_add_before_last_validate is None:
+            self.first_add_before_last_validate = len(self.validate_sizes)
+        self.add_sizes.append(len(phone_numbers))
+        self.in_flight[location_id] += 1
+        self.max_in_flight[location_id] = max(self.max_in_flight[location_id], self.in_flight[location_id])
+        try:
+            await asyncio.sleep(0.002)
+            if location_id == self.fail_location:
+                raise ValueError('location not found')
+        finally:
+            self.in_flight[location_id] -= 1
+        return NumberAddResponse.model_validate(
+            {'errors': [{'number': n, 'errorMessage': 'already in use'}
+                        for n in phone_numbers if n in self.add_errors]})
+
+    async def activate(self, location_id: str, phone_numbers: list[str], org_id: str = None):
+        self.activated.extend(phone_numbers)
+
+
+def numbers(locations: int = 4, per_location: int = 25):
+    for i in range(per_location):
+        for loc in range(locations):
+            yield f'loc{loc}', f'+1919555{loc:02d}{i:02d}'
+
+
+class TestNumberProvisioning(TestCase):
+    def test_001_pipeline(self):
+        api = FakeApi(unavailable={'+19195550003'}, add_errors={'+19195550105'})
+        sink = []
+        provisioner = AsNumberProvisioner(api, validate_batch=10, add_batch=5, location_concurrency=2,
+                                          activate=True, error_sink=sink.append)
+        report = asyncio.run(provisioner.run(numbers()))
+        self.assertEqual(99, report.validated)
+        self.assertEqual(98, report.added)
+        self.assertEqual(98, report.activated)
+        self.assertEqual(98, len(api.activated))
+        self.assertEqual([ProvisioningStage.validate, ProvisioningStage.add], [e.stage for e in sink])
+        self.assertTrue(all(n <= 10 for n in api.validate_sizes))
+        self.assertTrue(all(n <= 5 for n in api.add_sizes))
+        self.assertTrue(all(n <= 2 for n in api.max_in_flight.values()))
+        # stages overlap: adding started before all validations were sent
+        self.assertLess(api.first_add_before_last_validate, len(api.validate_sizes))
+
+    def test_002_failures_do_not_abort(self):
+        api = FakeApi(fail_location='loc1')
+
+        async def source():
+            for item in numbers(locations=2, per_location=10):
+                yield item
+            # duplicate
+            yield 'loc0', '+19195550000'
+
+        report = asyncio.run(AsNumberProvisioner(api, add_batch=4).run(source()))
+        self.assertEqual(10, report.added)
+        stages = [e.stage for e in report.errors]
+        self.assertEqual(1, stages.count(ProvisioningStage.input))
+        self.assertEqual(10, sum(len(e.phone_numbers) for e in report.errors if e.stage == ProvisioningStage.add))
+
+    def test_003_validate_only(self):
+        api = FakeApi()
+        report = asyncio.run(AsNumberProvisioner(api, validate_only=True).run(numbers(2, 5)))
+        self.assertEqual(10, report.validated)
+        self.assertEqual([], api.add_sizes)
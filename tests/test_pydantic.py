@@ -10,6 +10,8 @@ from pydantic import BaseModel, ValidationError, model_validator, parse_obj_as,
     field_validator, \
     Field, Extra
 
+from wxc_sdk.base import type_adapter
+from wxc_sdk.common import IdAndName
 from wxc_sdk.person_settings.permissions_out import OutgoingPermissions
 
 
@@ -241,5 +243,8 @@ class TestOptional(TestCase):
         print(t.model_dump_json(exclude_none=True, include={'a': True}))
         print(t.model_dump_json(exclude_unset=True))
 
-
-
+    def test_011_cached_type_adapter(self):
+        # one TypeAdapter per type
+        self.assertIs(type_adapter(list[IdAndName]), type_adapter(list[IdAndName]))
+        r = type_adapter(list[IdAndName]).validate_python([{'id': 'i', 'name': 'n'}])
+        self.assertEqual([IdAndName(id='i', name='n')], r)
@@ -0,0 +1,204 @@
+"""
+Tests for the desired-state reconciler
+"""
+import asyncio
+from io import StringIO
+from types import SimpleNamespace
+from unittest import TestCase
+
+from wxc_sdk.locations import Location
+from wxc_sdk.people import Person
+from wxc_sdk.person_settings.dnd import DND
+from wxc_sdk.person_settings.forwarding import PersonForwardingSetting
+from wxc_sdk.reconciler import ActionType, AsReconciler, DesiredState, ReconcileKind
+from wxc_sdk.common.schedules import Event, Schedule, ScheduleType
+from wxc_sdk.telephony.callqueue import CallQueue, CallQueueCallPolicies
+
+DESIRED = """
+locations:
+  San Jose:
+    schedules:
+      - name: business
+        type: businessHours
+    call_queues:
+      - name: Support
+        extension: '5001'
+        callPolicies: {policy: SIMULTANEOUS}
+      - name: Sales
+        extension: '5002'
+    auto_attendants:
+      - name: Main
+        extension: '5100'
+        businessSchedule: business
+  Berlin: {}
+users:
+  Alice@example.com:
+    dnd: {enabled: true}
+"""
+
+
+def fake_api(calls: list):
+    def recorder(name, result=None):
+        async def f(*args, **kwargs):
+            calls.append((name, args, kwargs))
+            await asyncio.sleep(0)
+            return result
+
+        return f
+
+    async def empty(**kwargs):
+        return []
+
+    async def queues(**kwargs):
+        return [CallQueue(id='Q1', name='Support', location_id='L1', extension='5000'),
+                CallQueue(id='Q2', name='Sales', location_id='L1', extension='5002')]
+
+    async def queue_details(location_id, queue_id, org_id=None):
+        return CallQueue(id=queue_id, name='Support' if queue_id == 'Q1' else 'Sales',
+                         extension='5000' if queue_id == 'Q1' else '5002',
+                         call_policies=CallQueueCallPolicies(policy='SIMULTANEOUS'))
+
+    async def locations(**kwargs):
+        return [Location(location_id='L1', name='San Jose')]
+
+    async def people(email, calling_data=False, **kwargs):
+        # the location is only returned with calling data
+        return [Person(person_id='P1', emails=[email], location_id=calling_data and 'L1' or None)]
+
+    async def dnd_read(entity_id, org_id=None):
+        return DND(enabled=False, ring_splash_enabled=False)
+
+    return SimpleNamespace(
+        locations=SimpleNamespace(list=locations),
+        people=SimpleNamespace(list=people),
+        person_settings=SimpleNamespace(dnd=SimpleNamespace(read=dnd_read, configure=recorder('dnd.configure'))),
+        telephony=SimpleNamespace(
+            schedules=SimpleNamespace(list=empty, create=recorder('schedules.create', 'S1')),
+            callqueue=SimpleNamespace(list=queues, details=queue_details, update=recorder('callqueue.update')),
+            huntgroup=SimpleNamespace(list=empty),
+            auto_attendant=SimpleNamespace(list=empty, create=recorder('auto_attendant.create', 'A1'))))
+
+
+class TestReconciler(TestCase):
+    def test_001_plan_and_execute(self):
+        desired = DesiredState.from_yaml(StringIO(DESIRED))
+        calls = []
+        reconciler = AsReconciler(fake_api(calls))
+
+        async def run():
+            plan = await reconciler.plan(desired)
+            self.assertEqual([], calls, 'planning must not change anything')
+            await plan.execute()
+            return plan
+
+        plan = asyncio.run(run())
+        by_name = {a.name: a for a in plan.actions}
+        # Sales is unchanged
+        self.assertEqual(1, plan.unchanged)
+        self.assertEqual({'business', 'Support', 'Main', 'dnd', 'Berlin'}, set(by_name))
+        self.assertEqual(ActionType.error, by_name['Berlin'].action)
+        self.assertEqual(ActionType.create, by_name['business'].action)
+        self.assertEqual(ActionType.update, by_name['Support'].action)
+        # only the changed attribute is compared and sent
+        self.assertEqual({'extension': ('5000', '5001')}, by_name['Support'].changes)
+        update = next(kwargs['update'] for name, _, kwargs in calls if name == 'callqueue.update')
+        self.assertEqual({'extension': '5001'}, update.model_dump(exclude_unset=True))
+        # features depend on schedules, users on features
+        self.assertIn(by_name['business'], by_name['Main'].depends_on)
+        self.assertIn(by_name['Main'], by_name['dnd'].depends_on)
+        names = [name for name, _, _ in calls]
+        self.assertLess(names.index('schedules.create'), names.index('auto_attendant.create'))
+        self.assertEqual('dnd.configure', names[-1])
+        self.assertEqual([by_name['Berlin']], plan.errors)
+        self.assertEqual(ReconcileKind.user_setting, by_name['dnd'].kind)
+        self.assertIn('update call_queue "San Jose/Support": extension', plan.summary())
+
+    def test_002_failed_dependency(self):
+        desired = DesiredState.from_yaml(StringIO(DESIRED))
+        calls = []
+        api = fake_api(calls)
+
+        async def fail(**kwargs):
+            raise ValueError('create failed')
+
+        api.telephony.schedules.create = fail
+        plan = asyncio.run(AsReconciler(api).apply(desired))
+        by_name = {a.name: a for a in plan.actions}
+        self.assertIsInstance(by_name['business'].error, ValueError)
+        self.assertIsInstance(by_name['Main'].error, RuntimeError)
+        self.assertNotIn('auto_attendant.create', [name for name, _, _ in calls])
+
+    def test_003_nested_partial_setting(self):
+        desired = DesiredState.from_yaml(StringIO("""
+users:
+  alice@example.com:
+    forwarding:
+      callForwarding:
+        busy: {enabled: true, destination: '5000'}
+        noAnswer: {numberOfRings: 3}
+"""))
+        calls = []
+        api = fake_api(calls)
+
+        async def forwarding_read(entity_id, org_id=None):
+            return PersonForwardingSetting.default()
+
+        api.person_settings.forwarding = SimpleNamespace(read=forwarding_read,
+                                                         configure=api.person_settings.dnd.configure)
+        plan = asyncio.run(AsReconciler(api).apply(desired))
+        action, = plan.actions
+        # only attributes set in the desired state are compared and reported, on each level
+        self.assertEqual({'call_forwarding': ({'busy': {'enabled': False, 'destination': ''},
+                                               'no_answer': {'number_of_rings': 3}},
+                                              {'busy': {'enabled': True, 'destination': '5000'},
+                                               'no_answer': {'number_of_rings': 3}})},
+                         action.changes)
+        _, (_, payload), _ = calls[0]
+        self.assertEqual({'callForwarding': {'busy': {'enabled': True, 'destination': '5000'},
+                                             'noAnswer': {'numberOfRings': 3}}},
+                         payload.update())
+
+    def test_004_schedule_events_merged(self):
+        desired = DesiredState.from_yaml(StringIO("""
+locations:
+  San Jose:
+    schedules:
+      - name: business
+        type: businessHours
+        events:
+          - {name: weekdays, startDate: '2024-01-01', endDate: '2024-01-01', startTime: '08:00', endTime: '18:00'}
+          - {name: saturday, startDate: '2024-01-06', endDate: '2024-01-06', startTime: '10:00', endTime: '14:00'}
+"""))
+        calls = []
+        api = fake_api(calls)
+
+        def event(name: str, event_id: str = None, start: str = '09:00') -> Event:
+            return Event(event_id=event_id, name=name, start_date='2024-01-01', end_date='2024-01-01',
+                         start_time=start, end_time='18:00')
+
+        current = Schedule(schedule_id='S1', name='business', schedule_type=ScheduleType.business_hours,
+                           events=[event('weekdays', 'E1'), event('lunch', 'E2', start='12:00')])
+
+        async def schedules(**kwargs):
+            return [current]
+
+        async def details(**kwargs):
+            return current.model_copy(deep=True)
+
+        async def update(**kwargs):
+            calls.append(('schedules.update', (), kwargs))
+
+        api.telephony.schedules = SimpleNamespace(list=schedules, details=details, update=update)
+        plan = asyncio.run(AsReconciler(api).apply(desired))
+        action, = plan.actions
+        self.assertEqual(ActionType.update, action.action)
+        _, _, kwargs = calls[0]
+        # desired events are updated or added, other events are kept
+        self.assertEqual([('weekdays', 'E1', '08:00'), ('lunch', 'E2', '12:00'), ('saturday', None, '10:00')],
+                         [(e.name, e.event_id, e.start_time.strftime('%H:%M')) for e in kwargs['schedule'].events])
+
+        # after the update the schedule is up to date; the additional event is no difference
+        current = kwargs['schedule']
+        plan = asyncio.run(AsReconciler(api).plan(desired))
+        self.assertEqual([], plan.actions)
+        self.assertEqual(1, plan.unchanged)
@@ -0,0 +1,105 @@
+"""
+Tests for local schedule evaluation
+"""
+import datetime
+from unittest import TestCase
+
+from wxc_sdk.schedule_eval import CompiledSchedule, ScheduleEvaluator, ScheduleState
+from wxc_sdk.common.schedules import Event, Recurrence, RecurDaily, RecurYearlyByDate, RecurYearlyByDay, Schedule, \
+    ScheduleType
+
+TZ = 'America/New_York'
+
+
+def business() -> Schedule:
+    schedule = Schedule.business(name='business')
+    return schedule
+
+
+def holidays() -> Schedule:
+    return Schedule(name='holidays', schedule_type=ScheduleType.holidays,
+                    events=[Event(name='new year', start_date=datetime.date(2024, 1, 1),
+                                  end_date=datetime.date(2024, 1, 1), all_day_enabled=True,
+                                  recurrence=Recurrence(recur_for_ever=True,
+                                                        recur_yearly_by_date=RecurYearlyByDate(
+                                                            day_of_month=1, month='JANUARY'))),
+                            Event(name='thanksgiving', start_date=datetime.date(2024, 11, 28),
+                                  end_date=datetime.date(2024, 11, 28), all_day_enabled=True,
+                                  recurrence=Recurrence(recur_for_ever=True,
+                                                        recur_yearly_by_day=RecurYearlyByDay(
+                                                            day='THURSDAY', week='FOURTH', month='NOVEMBER'))),
+                            Event(name='company day', start_date=datetime.date(2025, 6, 2),
+                                  end_date=datetime.date(2025, 6, 3), all_day_enabled=True)])
+
+
+def next_weekday(weekday: int, hour: int, minute: int = 0, weeks: int = 1) -> datetime.datetime:
+    today = datetime.date.today()
+    d = today + datetime.timedelta(days=(weekday - today.weekday()) % 7 + 7 * weeks)
+    return datetime.datetime.combine(d, datetime.time(hour, minute))
+
+
+class TestCompiledSchedule(TestCase):
+    def test_001_business_hours(self):
+        cs = CompiledSchedule(business(), TZ)
+        # naive datetimes are local time in the schedule's time zone
+        self.assertTrue(cs.is_active(next_weekday(0, 10)))
+        self.assertFalse(cs.is_active(next_weekday(0, 12, 30)))
+        self.assertTrue(cs.is_active(next_weekday(4, 16, 59)))
+        self.assertFalse(cs.is_active(next_weekday(4, 17)))
+        self.assertFalse(cs.is_active(next_weekday(5, 10)))
+        # weekly recurrence: also true a year later
+        self.assertTrue(cs.is_active(next_weekday(2, 9, weeks=52)))
+
+    def test_002_yearly(self):
+        cs = CompiledSchedule(holidays(), TZ)
+        self.assertTrue(cs.is_active(datetime.datetime(2030, 1, 1, 12)))
+        # 4th Thursday in November 2027 is the 25th
+        self.assertTrue(cs.is_active(datetime.datetime(2027, 11, 25, 23, 59)))
+        self.assertFalse(cs.is_active(datetime.datetime(2027, 11, 26, 0, 0)))
+        # two day non-recurring event
+        self.assertTrue(cs.is_active(datetime.datetime(2025, 6, 3, 20)))
+        self.assertFalse(cs.is_active(datetime.datetime(2026, 6, 3, 20)))
+
+    def test_003_batched_matches_point_queries(self):
+        cs = CompiledSchedule(business(), TZ)
+        start = datetime.datetime.now(tz=datetime.timezone.utc)
+        timestamps = [start + datetime.timedelta(minutes=37 * i) for i in range(2000)]
+        # unsorted input
+        timestamps.reverse()
+        self.assertEqual([cs.is_active(t) for t in timestamps], cs.is_active_many(timestamps))
+
+    def test_004_range_query(self):
+        cs = CompiledSchedule(business(), TZ)
+        monday = next_weekday(0, 0)
+        intervals = cs.intervals(monday, monday + datetime.timedelta(days=7))
+        # two intervals per day, Mon-Fri
+        self.assertEqual(10, len(intervals))
+        self.assertEqual(datetime.time(9), intervals[0][0].time())
+        self.assertEqual(datetime.time(12), intervals[0][1].time())
+
+    def test_005_daily_with_count(self):
+        schedule = Schedule(name='user', schedule_type=ScheduleType.business_hours,
+                            events=[Event(name='e', start_date=datetime.date(2024, 12, 30),
+                                          end_date=datetime.date(2024, 12, 30),
+                                          start_time=datetime.time(8), end_time=datetime.time(9),
+                                          recurrence=Recurrence(recur_daily=RecurDaily(recur_interval=2),
+                                                                recur_end_of_occurrence=3))])
+        cs = CompiledSchedule(schedule)
+        self.assertTrue(cs.is_active(datetime.datetime(2024, 12, 30, 8, 30)))
+        self.assertTrue(cs.is_active(datetime.datetime(2025, 1, 1, 8, 30)))
+        self.assertTrue(cs.is_active(datetime.datetime(2025, 1, 3, 8, 30)))
+        self.assertFalse(cs.is_active(datetime.datetime(2025, 1, 2, 8, 30)))
+        self.assertFalse(cs.is_active(datetime.datetime(2025, 1, 5, 8, 30)))
+
+
+class TestEvaluator(TestCase):
+    def test_001_states(self):
+        evaluator = ScheduleEvaluator()
+        evaluator.add_location('L1', TZ, business_hours=business(), holidays=holidays())
+        evaluator.add_location('L2', 'Europe/Berlin')
+        t = datetime.datetime(2030, 1, 1, 12, tzinfo=datetime.timezone.utc)
+        self.assertEqual({'L1': ScheduleState.holiday, 'L2': ScheduleState.business_hours}, evaluator.states_at(t))
+        monday = next_weekday(0, 10)
+        self.assertEqual(ScheduleState.business_hours, evaluator.state('L1', monday))
+        timeline = evaluator.timeline('L1', [monday, monday.replace(hour=20), t])
+        self.assertEqual([ScheduleState.business_hours, ScheduleState.after_hours, ScheduleState.holiday], timeline)
@@ -0,0 +1,144 @@
+"""
+Tests for the space archiver
+"""
+import asyncio
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.rooms import Room
+from wxc_sdk.space_archive import ArchiveIndex, AsSpaceArchiver
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeMessageServer:
+    """
+    Serves messages of rooms and file contents. Each room has a message with a file shared by all rooms and a
+    message with a file of its own
+    """
+
+    def __init__(self, rooms: int = 5, failing: set[str] = None):
+        self.messages: dict[str, list[dict]] = {f'r{i}': [] for i in range(rooms)}
+        self.failing = set(failing or ())
+        self.downloads = []
+        self.list_requests = []
+        for room_id in self.messages:
+            self.post(room_id, 'shared')
+            self.post(room_id, room_id)
+
+    def post(self, room_id: str, file: str = None):
+        messages = self.messages[room_id]
+        message = {'id': f'{room_id}-m{len(messages)}', 'roomId': room_id, 'text': 'hello',
+                   'created': (START + timedelta(minutes=len(messages))).isoformat()}
+        if file:
+            message['files'] = [f'/contents/{file}']
+        messages.append(message)
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/messages', self.list)
+        app.router.add_get('/contents/{id}', self.content)
+        return app
+
+    async def list(self, request: web.Request) -> web.Response:
+        room_id = request.query['roomId']
+        self.list_requests.append(room_id)
+        origin = str(request.url.origin())
+        items = []
+        for message in reversed(self.messages[room_id]):
+            message = dict(message)
+            if 'files' in message:
+                message['files'] = [f'{origin}{url}' for url in message['files']]
+            items.append(message)
+        return web.json_response({'items': items})
+
+    async def content(self, request: web.Request) -> web.Response:
+        content_id = request.match_info['id']
+        self.downloads.append(content_id)
+        if content_id in self.failing:
+            return web.json_response({'message': 'not found'}, status=404)
+        await asyncio.sleep(0.01)
+        # r3 has the same content as the shared file
+        body = b'shared' if content_id in ('shared', 'r3') else content_id.encode()
+        return web.Response(body=body, content_type='text/plain',
+                            headers={'Content-Disposition': f'attachment; filename="{content_id}.txt"'})
+
+
+def run(server: FakeMessageServer, test):
+    async def main():
+        async with TestServer(server.app()) as test_server:
+            async with AsWebexSimpleApi(tokens='token') as api:
+                api.session.BASE = str(test_server.make_url('')).rstrip('/')
+                return await test(api)
+
+    return asyncio.run(main())
+
+
+class TestSpaceArchive(TestCase):
+    def test_archive_and_incremental_run(self):
+        server = FakeMessageServer(rooms=5, failing={'r1'})
+        with tempfile.TemporaryDirectory() as directory:
+            async def test(api: AsWebexSimpleApi):
+                archiver = AsSpaceArchiver(api, directory=directory, concurrency=3, download_concurrency=2)
+                report = await archiver.archive(list(server.messages))
+                self.assertEqual(5, report.rooms)
+                self.assertEqual(10, report.messages)
+                # the shared file is only downloaded once
+                self.assertEqual(1, server.downloads.count('shared'))
+                self.assertEqual(['r1'], [url.rsplit('/', 1)[-1] for url in report.failed_files])
+                # r3 has the same content as the shared file
+                self.assertEqual(1, report.duplicates)
+                self.assertEqual(4, len(os.listdir(os.path.join(directory, 'files'))))
+                with open(os.path.join(directory, 'messages', 'r0.jsonl')) as f:
+                    self.assertEqual(['r0-m1', 'r0-m0'], [json.loads(line)['id'] for line in f])
+                index = ArchiveIndex(directory)
+                self.assertEqual(5, len(index.cursors))
+                self.assertEqual(1, len(index.failed))
+                # file name and content type are taken from the response headers
+                with open(os.path.join(directory, 'files.jsonl')) as f:
+                    files = {entry['url'].rsplit('/', 1)[-1]: entry for entry in map(json.loads, f)}
+                self.assertEqual('shared.txt', files['shared']['name'])
+                self.assertTrue(files['shared']['contentType'].startswith('text/plain'))
+
+                # incremental run: only new messages are archived and the failed download is retried
+                server.failing.clear()
+                server.downloads.clear()
+                server.post('r0', 'new')
+                server.post('r2')
+                report = await archiver.archive(list(server.messages))
+                self.assertEqual(2, report.messages)
+                self.assertEqual(['new', 'r1'], sorted(server.downloads))
+                self.assertFalse(report.failed_files)
+                with open(os.path.join(directory, 'messages', 'r0.jsonl')) as f:
+                    self.assertEqual(['r0-m1', 'r0-m0', 'r0-m2'], [json.loads(line)['id'] for line in f])
+                self.assertFalse(ArchiveIndex(directory).failed)
+                self.assertFalse(any(name.endswith('.part')
+                                     for _, _, names in os.walk(directory) for name in names))
+
+            run(server, test)
+
+    def test_skip_unchanged_rooms(self):
+        server = FakeMessageServer(rooms=3)
+        with tempfile.TemporaryDirectory() as directory:
+            async def test(api: AsWebexSimpleApi):
+                archiver = AsSpaceArchiver(api, directory=directory, download_files=False)
+                await archiver.archive(list(server.messages))
+                server.list_requests.clear()
+                server.post('r1')
+                rooms = [Room(id=room_id, last_activity=messages[-1]['created'])
+                         for room_id, messages in server.messages.items()]
+                report = await archiver.archive(rooms)
+                # only the room with activity since the last run is listed
+                self.assertEqual(['r1'], server.list_requests)
+                self.assertEqual(2, report.unchanged)
+                self.assertEqual(1, report.messages)
+                self.assertFalse(server.downloads)
+
+            run(server, test)
@@ -0,0 +1,90 @@
+"""
+Tests for the sync facade over the async API
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from unittest import TestCase
+
+from wxc_sdk.people import Person
+from wxc_sdk.sync_facade import SyncFacade, SyncProxy
+
+
+class TestSyncFacade(TestCase):
+    def setUp(self) -> None:
+        self.facade = SyncFacade(tokens='token', concurrent_requests=50)
+
+    def tearDown(self) -> None:
+        self.facade.close()
+
+    def test_001_map_concurrent(self):
+        threads = set()
+
+        async def work(i: int) -> int:
+            threads.add(threading.get_ident())
+            await asyncio.sleep(0.1)
+            if i == 13:
+                raise ValueError(i)
+            return i * 2
+
+        start = time.perf_counter()
+        results = self.facade.map_concurrent(work, range(200), return_exceptions=True)
+        # all 200 calls run concurrently on a single thread
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(1, len(threads))
+        self.assertIsInstance(results[13], ValueError)
+        self.assertEqual(20, results[10])
+        with self.assertRaises(ValueError):
+            self.facade.map_concurrent(work, [13])
+
+    def test_004_cancel_pending(self):
+        finished = []
+
+        async def work(i: int) -> int:
+            await asyncio.sleep(i and 0.5)
+            if not i:
+                raise ValueError(i)
+            finished.append(i)
+            return i
+
+        async def slow():
+            await asyncio.sleep(0.5)
+            finished.append('slow')
+
+        # the 1st exception cancels all other calls
+        with self.assertRaises(ValueError):
+            self.facade.map_concurrent(work, range(10))
+        # a timeout cancels the coroutine
+        with self.assertRaises(FutureTimeoutError):
+            self.facade.run(slow(), timeout=0.1)
+        time.sleep(0.7)
+        self.assertEqual([], finished)
+
+    def test_002_submit(self):
+        async def add(a, b):
+            return a + b
+
+        futures = [self.facade.submit(add, i, 1) for i in range(10)]
+        self.assertEqual(list(range(1, 11)), [f.result() for f in futures])
+        self.assertEqual(3, self.facade.submit(add(1, 2)).result())
+
+    def test_003_proxy(self):
+        async def list_gen(**kwargs):
+            for i in range(5):
+                yield Person(person_id=f'P{i}')
+
+        async def details(person_id: str):
+            return Person(person_id=person_id, display_name=person_id)
+
+        people = self.facade.as_api.people
+        people.list_gen = list_gen
+        people.details = details
+        api = self.facade.api
+        self.assertEqual(['P0', 'P1', 'P2', 'P3', 'P4'], [p.person_id for p in api.people.list_gen()])
+        self.assertEqual('P7', api.people.details(person_id='P7').display_name)
+        # the real async methods are wrapped as well
+        self.assertTrue(callable(api.telephony.callqueue.details))
+        # ... also in API objects which are no AsApiChild
+        self.assertIsInstance(api.telephony.callqueue.policy, SyncProxy)
+        self.assertEqual('token', api.access_token)
@@ -0,0 +1,111 @@
+"""
+Tests for windowed parallel fetch
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from dateutil.parser import isoparse
+
+from wxc_sdk.time_windows import AsWindowedFetcher, WindowPlanner, split_time_range
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class Item:
+    def __init__(self, id: int, created: datetime):
+        self.id = id
+        self.created = created
+
+
+def items_every(minutes: int, count: int) -> list[Item]:
+    return [Item(id=i, created=START + timedelta(minutes=minutes * i)) for i in range(count)]
+
+
+def list_gen_for(items: list[Item], descending: bool, calls: list = None):
+    """
+    Simulated list endpoint: returns all items in [from_, to_] (inclusive)
+    """
+
+    async def list_gen(from_: str, to_: str):
+        if calls is not None:
+            calls.append((from_, to_))
+        from_ = isoparse(from_)
+        to_ = isoparse(to_)
+        selected = [i for i in items if from_ <= i.created <= to_]
+        selected.sort(key=lambda i: i.created, reverse=descending)
+        for item in selected:
+            await asyncio.sleep(0)
+            yield item
+
+    return list_gen
+
+
+class TestSplit(TestCase):
+    def test_001_split(self):
+        windows = split_time_range(START, START + timedelta(days=90), 9)
+        self.assertEqual(9, len(windows))
+        self.assertEqual(START, windows[0].start)
+        self.assertEqual(START + timedelta(days=90), windows[-1].end)
+        for w1, w2 in zip(windows, windows[1:]):
+            self.assertEqual(w1.end, w2.start)
+
+    def test_002_planner_adapts(self):
+        planner = WindowPlanner(from_=START, to_=START + timedelta(days=10), windows=10, target_items=100)
+        first = planner.next_window()
+        self.assertEqual(timedelta(days=1), first.duration)
+        # 1000 items in one day -> next window should be ~1/10 day
+        planner.observe(first, 1000)
+        second = planner.next_window()
+        self.assertEqual(first.end, second.start)
+        self.assertEqual(timedelta(days=1) / 10, second.duration)
+
+    def test_003_planner_covers_range_descending(self):
+        to_ = START + timedelta(hours=5)
+        planner = WindowPlanner(from_=START, to_=to_, windows=3, descending=True)
+        windows = []
+        while (w := planner.next_window()) is not None:
+            windows.append(w)
+        self.assertEqual(to_, windows[0].end)
+        self.assertEqual(START, windows[-1].start)
+        for w1, w2 in zip(windows, windows[1:]):
+            self.assertEqual(w1.start, w2.end)
+
+
+class TestFetch(TestCase):
+    def fetch(self, items: list[Item], descending: bool, **kwargs) -> list[Item]:
+        async def run():
+            fetcher = AsWindowedFetcher(list_gen=list_gen_for(items, descending=descending),
+                                        time_key=lambda i: i.created, descending=descending, **kwargs)
+            return [i async for i in fetcher.fetch(from_=START, to_=START + timedelta(minutes=1000))]
+
+        return asyncio.run(run())
+
+    def test_001_ascending(self):
+        # items exactly on window boundaries must only be returned once
+        items = items_every(minutes=10, count=101)
+        result = self.fetch(items, descending=False, windows=10, prefetch=5)
+        self.assertEqual([i.id for i in items], [i.id for i in result])
+
+    def test_002_descending(self):
+        items = items_every(minutes=7, count=140)
+        result = self.fetch(items, descending=True, windows=7, concurrency=3)
+        self.assertEqual([i.id for i in reversed(items)], [i.id for i in result])
+
+    def test_003_adaptive(self):
+        items = items_every(minutes=1, count=1001)
+        result = self.fetch(items, descending=False, windows=4, concurrency=2, target_items=50)
+        self.assertEqual([i.id for i in items], [i.id for i in result])
+
+    def test_004_error_propagates(self):
+        async def failing(from_: str, to_: str):
+            raise RuntimeError('boom')
+            # noinspection PyUnreachableCode
+            yield
+
+        async def run():
+            fetcher = AsWindowedFetcher(list_gen=failing, time_key=lambda i: i.created)
+            return [i async for i in fetcher.fetch(from_=START, to_=START + timedelta(days=1))]
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(run())
@@ -0,0 +1,96 @@
+"""
+Tests for token stores shared by multiple processes
+"""
+import datetime
+import multiprocessing
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+from wxc_sdk.integration import FileTokenStore, Integration, SharedTokens, SqliteTokenStore, TokenStore
+from wxc_sdk.tokens import Tokens
+
+
+class CountingIntegration(Integration):
+    """
+    Integration which creates new tokens locally and records each refresh in a file
+    """
+
+    def __init__(self, counter_path: str):
+        super().__init__(client_id='id', client_secret='secret', scopes='spark:all', redirect_url='http://localhost',
+                         initiate_flow_callback=lambda url: None)
+        self.counter_path = counter_path
+
+    def refresh(self, tokens: Tokens):
+        time.sleep(0.2)
+        with open(self.counter_path, mode='a') as f:
+            f.write(f'{os.getpid()}\n')
+        tokens.update(new_tokens(f'access-{os.getpid()}', 3600))
+
+    def get_tokens_from_oauth_flow(self):
+        raise AssertionError('unexpected OAuth flow')
+
+
+def new_tokens(access_token: str, lifetime: int) -> Tokens:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return Tokens(access_token=access_token, refresh_token='refresh', token_type='Bearer',
+                  expires_at=now + datetime.timedelta(seconds=lifetime),
+                  refresh_token_expires_at=now + datetime.timedelta(days=30))
+
+
+def get_tokens(store_class: type[TokenStore], path: str, counter_path: str, queue: multiprocessing.Queue):
+    tokens = CountingIntegration(counter_path).get_tokens_from_store(store=store_class(path))
+    queue.put(tokens.access_token)
+
+
+class TestTokenStore(TestCase):
+    def concurrent_refresh(self, store: TokenStore, directory: str):
+        """
+        processes sharing a store with tokens about to expire
+        """
+        store.write(new_tokens('expiring', 10))
+        counter_path = os.path.join(directory, 'refreshes')
+        queue = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=get_tokens,
+                                             args=(store.__class__, store.path, counter_path, queue))
+                     for _ in range(8)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        access_tokens = {queue.get() for _ in processes}
+        with open(counter_path) as f:
+            refreshes = f.read().split()
+        # only one process refreshed; all processes got the new tokens
+        self.assertEqual(1, len(refreshes))
+        self.assertEqual({f'access-{refreshes[0]}'}, access_tokens)
+        self.assertEqual(f'access-{refreshes[0]}', store.read().access_token)
+
+    def test_file_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = FileTokenStore(os.path.join(directory, 'tokens.yml'))
+            self.assertIsNone(store.read())
+            self.assertIsNone(store.version())
+            self.concurrent_refresh(store, directory)
+
+    def test_sqlite_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = SqliteTokenStore(os.path.join(directory, 'tokens.db'))
+            self.assertIsNone(store.read())
+            self.concurrent_refresh(store, directory)
+
+    def test_shared_tokens(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = FileTokenStore(os.path.join(directory, 'tokens.yml'))
+            store.write(new_tokens('first', 3600))
+            shared = SharedTokens(integration=CountingIntegration(os.path.join(directory, 'refreshes')),
+                                  store=store)
+            tokens = shared.tokens
+            self.assertEqual('first', tokens.access_token)
+            self.assertFalse(shared.check())
+            # another process writes new tokens: the same instance is updated
+            store.write(new_tokens('second', 3600))
+            self.assertTrue(shared.check())
+            self.assertIs(tokens, shared.tokens)
+            self.assertEqual('second', tokens.access_token)
@@ -0,0 +1,125 @@
+"""
+Tests for streaming transcript downloads and the bulk transcript exporter
+"""
+import asyncio
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.as_rest import AsRestError
+from wxc_sdk.transcript_export import AsTranscriptExporter, TranscriptManifest
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeTranscriptServer:
+    """
+    Serves transcript lists and downloads; one transcript per day
+    """
+
+    def __init__(self, days: int = 10, failing: set[str] = None):
+        self.days = days
+        self.failing = set(failing or ())
+        self.downloads = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get('/admin/meetingTranscripts', self.list)
+        app.router.add_get('/meetingTranscripts/{id}/download', self.download)
+        return app
+
+    async def list(self, request: web.Request) -> web.Response:
+        from_ = datetime.fromisoformat(request.query['from'])
+        to_ = datetime.fromisoformat(request.query['to'])
+        items = []
+        for day in range(self.days):
+            start = START + timedelta(days=day)
+            # inclusive at both ends: windows overlap on the boundary
+            if from_ <= start <= to_:
+                items.append({'id': f't{day}', 'meetingId': f'm{day}', 'startTime': start.isoformat(),
+                              'status': 'available'})
+        return web.json_response({'items': items})
+
+    async def download(self, request: web.Request) -> web.StreamResponse:
+        transcript_id = request.match_info['id']
+        self.downloads.append(transcript_id)
+        if transcript_id in self.failing:
+            return web.json_response({'message': 'not found'}, status=404)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            response = web.StreamResponse(headers={'Content-Type': 'text/vtt'})
+            await response.prepare(request)
+            await response.write(b'WEBVTT\n\n')
+            await asyncio.sleep(0.01)
+            for i in range(100):
+                await response.write(f'{i}\n00:00:{i:02d}.000 --> 00:00:{i:02d}.900\n{transcript_id}\n\n'.encode())
+            await response.write_eof()
+            return response
+        finally:
+            self.in_flight -= 1
+
+
+def run(server: FakeTranscriptServer, test):
+    async def main():
+        async with TestServer(server.app()) as test_server:
+            async with AsWebexSimpleApi(tokens='token') as api:
+                api.session.BASE = str(test_server.make_url('')).rstrip('/')
+                return await test(api)
+
+    return asyncio.run(main())
+
+
+class TestTranscriptExport(TestCase):
+    def test_001_download_stream(self):
+        server = FakeTranscriptServer()
+
+        async def test(api: AsWebexSimpleApi):
+            chunks = [chunk async for chunk in api.meetings.transcripts.download_stream(transcript_id='t1',
+                                                                                        chunk_size=256)]
+            text = await api.meetings.transcripts.download(transcript_id='t1')
+            with self.assertRaises(AsRestError) as ctx:
+                await api.meetings.transcripts.download(transcript_id='t2')
+            self.assertEqual(404, ctx.exception.status)
+            return chunks, text
+
+        server.failing.add('t2')
+        chunks, text = run(server, test)
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) <= 256 for chunk in chunks))
+        self.assertEqual(text, b''.join(chunks).decode())
+        self.assertTrue(text.startswith('WEBVTT'))
+
+    def test_002_export_and_resume(self):
+        server = FakeTranscriptServer(days=10, failing={'t3'})
+        with tempfile.TemporaryDirectory() as directory:
+            async def export(api: AsWebexSimpleApi):
+                exporter = AsTranscriptExporter(api, site_url='site', directory=directory, concurrency=3,
+                                                window=timedelta(days=3))
+                return await exporter.export(from_=START, to_=START + timedelta(days=10))
+
+            report = run(server, export)
+            self.assertEqual(9, report.downloaded)
+            self.assertEqual(1, report.failed)
+            # each transcript downloaded once although windows overlap
+            self.assertEqual(10, len(server.downloads))
+            self.assertLessEqual(server.max_in_flight, 3)
+            self.assertTrue(os.path.isfile(os.path.join(directory, 't0.vtt')))
+            self.assertFalse(any(name.endswith('.part') for name in os.listdir(directory)))
+            manifest = TranscriptManifest(os.path.join(directory, 'manifest.jsonl'))
+            self.assertEqual(9, len(manifest.done))
+
+            # resume: only the failed transcript is downloaded again
+            server.failing.clear()
+            server.downloads.clear()
+            report = run(server, export)
+            self.assertEqual(['t3'], server.downloads)
+            self.assertEqual(1, report.downloaded)
+            self.assertEqual(9, report.skipped)
@@ -0,0 +1,110 @@
+"""
+Tests for the aiohttp webhook receiver
+"""
+import asyncio
+import hashlib
+import hmac
+import json
+from types import SimpleNamespace
+from unittest import TestCase
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from wxc_sdk.messages import MessagesData
+from wxc_sdk.webhook import WebhookEvent
+from wxc_sdk.webhook_receiver import DetailsBatcher, SIGNATURE_HEADER, WebhookReceiver, verify_signature
+
+SECRET = 'secret'
+
+
+def event_body(message_id: str = 'message', resource: str = 'messages') -> bytes:
+    return json.dumps({'id': 'webhook', 'name': 'bot', 'targetUrl': 'https://bot.example.com/webhook',
+                       'resource': resource, 'event': 'created', 'status': 'active',
+                       'created': '2024-01-01T00:00:00.000Z', 'actorId': 'actor',
+                       'data': {'id': message_id, 'roomId': 'room', 'roomType': 'group',
+                                'personEmail': 'user@example.com'}}).encode()
+
+
+def sign(body: bytes) -> dict:
+    return {SIGNATURE_HEADER: hmac.new(SECRET.encode(), body, hashlib.sha1).hexdigest()}
+
+
+class TestWebhookReceiver(TestCase):
+    def test_001_signature(self):
+        body = event_body()
+        self.assertTrue(verify_signature(body, SECRET, sign(body)[SIGNATURE_HEADER]))
+        self.assertFalse(verify_signature(body + b' ', SECRET, sign(body)[SIGNATURE_HEADER]))
+        self.assertFalse(verify_signature(body, SECRET, None))
+
+    def test_002_dispatch(self):
+        fetched = []
+
+        async def details(message_id: str):
+            fetched.append(message_id)
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(id=message_id, text=f'text {message_id}')
+
+        api = SimpleNamespace(messages=SimpleNamespace(details=details),
+                              session=SimpleNamespace(concurrent_requests=5))
+        receiver = WebhookReceiver(secret=SECRET, api=api, ack_after_processing=True)
+        texts = []
+
+        @receiver.handler(resource='messages', event='created')
+        async def on_message(event: WebhookEvent):
+            self.assertIsInstance(event.data, MessagesData)
+            texts.append((await receiver.message_details(event.data.id)).text)
+
+        async def run():
+            async with TestClient(TestServer(receiver.app())) as client:
+                bodies = [event_body(f'm{i % 5}') for i in range(20)]
+                responses = await asyncio.gather(*[client.post('/webhook', data=body, headers=sign(body))
+                                                   for body in bodies])
+                self.assertEqual({200}, {r.status for r in responses})
+                r = await client.post('/webhook', data=bodies[0], headers={SIGNATURE_HEADER: 'invalid'})
+                self.assertEqual(401, r.status)
+                r = await client.post('/webhook', data=b'{}', headers=sign(b'{}'))
+                self.assertEqual(400, r.status)
+
+        asyncio.run(run())
+        self.assertEqual(20, len(texts))
+        # concurrent requests for the same message are coalesced
+        self.assertEqual(5, len(set(fetched)))
+        self.assertLess(len(fetched), 20)
+        self.assertEqual(2, receiver.rejected)
+
+    def test_003_backpressure(self):
+        receiver = WebhookReceiver(queue_size=2, workers=1, enqueue_timeout=0.05)
+
+        async def run():
+            blocked = asyncio.Event()
+
+            @receiver.handler()
+            async def slow(_):
+                await blocked.wait()
+
+            async with TestClient(TestServer(receiver.app())) as client:
+                statuses = [(await client.post('/webhook', data=event_body())).status for _ in range(5)]
+                blocked.set()
+            return statuses
+
+        statuses = asyncio.run(run())
+        # one event in the worker, two in the queue, then the queue is full
+        self.assertEqual([202, 202, 202, 503, 503], statuses)
+        self.assertEqual(3, receiver.processed)
+
+    def test_004_batcher(self):
+        async def run():
+            calls = []
+
+            async def fetch(key):
+                calls.append(key)
+                return key * 2
+
+            batcher = DetailsBatcher(fetch, window=0.01, max_batch=3)
+            results = await asyncio.gather(*[batcher.get(i % 4) for i in range(8)])
+            await batcher.aclose()
+            return results, calls
+
+        results, calls = asyncio.run(run())
+        self.assertEqual([(i % 4) * 2 for i in range(8)], results)
+        self.assertEqual(4, len(calls))
@@ -0,0 +1,83 @@
+"""
+Tests for the xAPI fleet status sweeper
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest import TestCase
+
+from wxc_sdk.devices import Device
+from wxc_sdk.xapi import QueryStatusResponse
+from wxc_sdk.xapi_sweeper import AsXApiSweeper, flatten_status
+
+
+def device(i: int, status: str = 'connected', xapi: bool = True) -> Device:
+    return Device.model_validate({'id': f'd{i}', 'displayName': f'device {i}', 'orgId': 'org',
+                                  'capabilities': ['xapi'] if xapi else [], 'permissions': ['xapi'],
+                                  'connectionStatus': status, 'product': 'Room Kit', 'type': 'roomdesk',
+                                  'tags': [], 'sipUrls': []})
+
+
+class FakeXApi:
+    def __init__(self, slow: str = None):
+        self.volume = 50
+        self.slow = slow
+        self.queries = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def query_status(self, device_id: str, name: list[str]) -> QueryStatusResponse:
+        self.queries.append((device_id, tuple(name)))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(1 if device_id == self.slow else 0.001)
+        finally:
+            self.in_flight -= 1
+        result = dict()
+        for n in name:
+            if n == 'Audio.Volume':
+                result['Audio'] = {'Volume': self.volume if device_id == 'd0' else 50}
+            elif n == 'Peripherals.ConnectedDevice':
+                result['Peripherals'] = {'ConnectedDevice': [{'id': 1001, 'Name': 'Navigator', 'Status': 'Connected'}]}
+            else:
+                result[n] = 1
+        return QueryStatusResponse(device_id=device_id, result=result)
+
+
+class TestXApiSweeper(TestCase):
+    def test_001_flatten(self):
+        flat = flatten_status({'SystemUnit': {'Uptime': 10},
+                               'Peripherals': {'ConnectedDevice': [{'id': 1001, 'Name': 'Navigator'}]},
+                               'Network': [{'IPv4': {'Address': '10.0.0.1'}}]})
+        self.assertEqual({'SystemUnit.Uptime': 10, 'Peripherals.ConnectedDevice[1001].Name': 'Navigator',
+                          'Network[0].IPv4.Address': '10.0.0.1'}, flat)
+
+    def test_002_sweep(self):
+        xapi = FakeXApi(slow='d5')
+        api = SimpleNamespace(xapi=xapi)
+        devices = [device(i) for i in range(20)] + [device(20, status='disconnected'),
+                                                    device(21, status='offline_expired'),
+                                                    device(22, xapi=False)]
+        paths = ['Audio.Volume', 'Peripherals.ConnectedDevice'] + [f'P{i}' for i in range(10)]
+        sweeper = AsXApiSweeper(api, paths=paths, concurrency=4, timeout=0.2)
+
+        async def test():
+            first = await sweeper.sweep(devices)
+            xapi.volume = 70
+            second = await sweeper.sweep(devices)
+            return first, second
+
+        first, second = asyncio.run(test())
+        self.assertEqual(23, first.devices)
+        self.assertEqual(19, first.queried)
+        self.assertEqual({'disconnected': 1, 'offline_expired': 1, 'no_xapi': 1}, first.skipped)
+        self.assertEqual(['d5'], list(first.failed))
+        # 12 paths -> 2 queries per device with at most 10 expressions
+        self.assertTrue(all(len(name) <= 10 for _, name in xapi.queries))
+        self.assertLessEqual(xapi.max_in_flight, 8)
+        # initial values are reported as changes
+        self.assertEqual(19 * 13, len(first.changes))
+        self.assertEqual([('d0', 'Audio.Volume', 50, 70)],
+                         [(c.device_id, c.path, c.old, c.new) for c in second.changes])
+        self.assertEqual(19, len(sweeper.table))
+        self.assertGreater(second.duration, 0)
@@ -3,7 +3,8 @@ Simple SDK for Webex APIs with focus on Webex Calling specific endpoints
 """
 import logging
 import os
-from typing import Union
+from collections.abc import Callable, Generator, Iterable
+from typing import Any, Union
 
 from .admin_audit import AdminAuditEventsApi
 from .attachment_actions import AttachmentActionsApi
@@ -13,6 +14,7 @@ from .converged_recordings import ConvergedRecordingsApi
 from .device_configurations import DeviceConfigurationsApi
 from .devices import DevicesApi
 from .events import EventsApi
+from .fan_out import ItemResult, ProgressCallback, items_as_completed, map_items
 from .groups import GroupsApi
 from .guests import GuestManagementApi
 from .licenses import LicensesApi
@@ -199,6 +201,89 @@ class WebexSimpleApi:
         """
         return self.session.access_token
 
+    def map(self, fn: Callable[[Any], Any], items: Iterable, *, return_exceptions: bool = True,
+            cancel_on_error: bool = False, progress: ProgressCallback = None, max_workers: int = None) -> list:
+        """
+        Call a function for each item in a thread pool and return the results in the order of the items.
+
+        The pool is sized to the concurrency limit (and connection pool) of the session so that threads don't queue on
+        connections; all calls share the session's request semaphore and 429 handling.
+
+        :param fn: function to call for each item, typically a lambda calling an API method
+        :param items: items
+        :param return_exceptions: return exceptions as results. Else the first exception (in item order) is raised
+            after all calls completed
+        :param cancel_on_error: raise the first exception immediately and cancel all calls not started yet
+        :param progress: callback for progress reporting; called with a :class:`wxc_sdk.fan_out.FanOutProgress`
+            after each completed item
+        :param max_workers: number of worker threads. Default: concurrency limit of the session
+        :return: list of results (or exceptions)
+        """
+        '''async
+    async def map(self, fn: Callable[[Any], Awaitable], items: Iterable, *, return_exceptions: bool = True,
+                  cancel_on_error: bool = False, progress: ProgressCallback = None, max_workers: int = None) -> list:
+        """
+        Await a coroutine for each item concurrently and return the results in the order of the items.
+
+        Concurrency is limited to the concurrency limit of the session.
+
+        :param fn: function returning an awaitable for an item, typically a lambda calling an API method
+        :param items: items
+        :param return_exceptions: return exceptions as results. Else the first exception (in item order) is raised
+            after all calls completed
+        :param cancel_on_error: raise the first exception immediately and cancel all other calls
+        :param progress: callback for progress reporting; called with a :class:`wxc_sdk.fan_out.FanOutProgress`
+            after each completed item
+        :param max_workers: maximum number of concurrent calls. Default: concurrency limit of the session
+        :return: list of results (or exceptions)
+        """
+        return await as_map_items(fn, items, concurrency=max_workers or self.session.concurrent_requests,
+                                  return_exceptions=return_exceptions, cancel_on_error=cancel_on_error,
+                                  progress=progress)
+        '''
+        return map_items(fn, items, max_workers=max_workers or self.session.concurrent_requests,
+                         return_exceptions=return_exceptions, cancel_on_error=cancel_on_error, progress=progress)
+
+    def as_completed(self, fn: Callable[[Any], Any], items: Iterable, *, cancel_on_error: bool = False,
+                     progress: ProgressCallback = None, max_workers: int = None) -> Generator[ItemResult, None, None]:
+        """
+        Call a function for each item in a thread pool and yield the results as they complete.
+
+        Exceptions are not raised but reported in the results. See :meth:`map`
+
+        :param fn: function to call for each item
+        :param items: items; consumed lazily
+        :param cancel_on_error: stop after the first failed call: the failed result is yielded, calls not started yet
+            are cancelled and the generator ends
+        :param progress: callback for progress reporting
+        :param max_workers: number of worker threads. Default: concurrency limit of the session
+        :return: generator of :class:`wxc_sdk.fan_out.ItemResult` instances in completion order
+        """
+        '''async
+    async def as_completed(self, fn: Callable[[Any], Awaitable], items: Iterable, *, cancel_on_error: bool = False,
+                           progress: ProgressCallback = None,
+                           max_workers: int = None) -> AsyncGenerator[ItemResult, None]:
+        """
+        Await a coroutine for each item concurrently and yield the results as they complete.
+
+        Exceptions are not raised but reported in the results. See :meth:`map`
+
+        :param fn: function returning an awaitable for an item
+        :param items: items; consumed lazily
+        :param cancel_on_error: stop after the first failed call: the failed result is yielded, all other calls are
+            cancelled and the generator ends
+        :param progress: callback for progress reporting
+        :param max_workers: maximum number of concurrent calls. Default: concurrency limit of the session
+        :return: async generator of :class:`wxc_sdk.fan_out.ItemResult` instances in completion order
+        """
+        async for result in as_items_as_completed(fn, items,
+                                                  concurrency=max_workers or self.session.concurrent_requests,
+                                                  cancel_on_error=cancel_on_error, progress=progress):
+            yield result
+        '''
+        return items_as_completed(fn, items, max_workers=max_workers or self.session.concurrent_requests,
+                                  cancel_on_error=cancel_on_error, progress=progress)
+
     def close(self):
         self.session.close()
 
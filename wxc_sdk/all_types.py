@@ -2,7 +2,7 @@ from wxc_sdk.admin_audit import AuditEvent, AuditEventData
 from wxc_sdk.attachment_actions import AttachmentAction, AttachmentActionData
 from wxc_sdk.authorizations import Authorization, AuthorizationType
 from wxc_sdk.base import ApiModel, ApiModelWithErrors, CodeAndReason, RETRY_429_MAX_WAIT, SafeEnum, StrOrDict, \
-    dt_iso_str, enum_str, plus1, to_camel, webex_id_to_uuid
+    dt_iso_str, enum_str, plus1, to_camel, type_adapter, webex_id_to_uuid
 from wxc_sdk.cdr import CDR, CDRCallType, CDRClientType, CDRDirection, CDROriginalReason, CDRRedirectReason, \
     CDRRelatedReason, CDRUserType
 from wxc_sdk.common import AcdCustomization, AlternateNumber, AnnAudioFile, AnnouncementLevel, \
@@ -390,4 +390,4 @@ __all__ = ['AcdCustomization', 'Action', 'ActivationCodeResponse', 'ActivationSt
            'WorkspaceHealthIssue', 'WorkspaceHealthLevel', 'WorkspaceIndoorNavigation', 'WorkspaceLocation',
            'WorkspaceLocationFloor', 'WorkspaceNumbers', 'WorkspacePersonalizationTaskResponse',
            'WorkspaceSupportedDevices', 'WorkspaceWebexCalling', '_Helper', 'dt_iso_str', 'enum_str', 'plus1',
-           'to_camel', 'webex_id_to_uuid']
+           'to_camel', 'type_adapter', 'webex_id_to_uuid']
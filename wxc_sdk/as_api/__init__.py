@@ -0,0 +1,365 @@
+# auto-generated. DO NOT EDIT
+"""
+Async variant of the API: :class:`AsWebexSimpleApi`
+
+The classes are defined in one module per sync module. Modules are only imported when a class is first accessed, so
+that importing a single API class does not require all async classes.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wxc_sdk.as_api.admin_audit import AsAdminAuditEventsApi
+    from wxc_sdk.as_api.api_child import AsApiChild
+    from wxc_sdk.as_api.attachment_actions import AsAttachmentActionsApi
+    from wxc_sdk.as_api.authorizations import AsAuthorizationsApi
+    from wxc_sdk.as_api.cdr import AsDetailedCDRApi
+    from wxc_sdk.as_api.common_schedules import AsScheduleApi
+    from wxc_sdk.as_api.converged_recordings import AsConvergedRecordingsApi
+    from wxc_sdk.as_api.device_configurations import AsDeviceConfigurationsApi
+    from wxc_sdk.as_api.devices import AsDevicesApi
+    from wxc_sdk.as_api.events import AsEventsApi
+    from wxc_sdk.as_api.groups import AsGroupsApi
+    from wxc_sdk.as_api.guests import AsGuestManagementApi
+    from wxc_sdk.as_api.licenses import AsLicensesApi
+    from wxc_sdk.as_api.locations import AsLocationsApi
+    from wxc_sdk.as_api.meetings import AsMeetingsApi
+    from wxc_sdk.as_api.meetings_chats import AsMeetingChatsApi
+    from wxc_sdk.as_api.meetings_closed_captions import AsMeetingClosedCaptionsApi
+    from wxc_sdk.as_api.meetings_invitees import AsMeetingInviteesApi
+    from wxc_sdk.as_api.meetings_participants import AsMeetingParticipantsApi
+    from wxc_sdk.as_api.meetings_preferences import AsMeetingPreferencesApi
+    from wxc_sdk.as_api.meetings_qanda import AsMeetingQandAApi
+    from wxc_sdk.as_api.meetings_qualities import AsMeetingQualitiesApi
+    from wxc_sdk.as_api.meetings_recordings import AsRecordingsApi
+    from wxc_sdk.as_api.meetings_transcripts import AsMeetingTranscriptsApi
+    from wxc_sdk.as_api.memberships import AsMembershipApi
+    from wxc_sdk.as_api.messages import AsMessagesApi
+    from wxc_sdk.as_api.org_contacts import AsOrganizationContactsApi
+    from wxc_sdk.as_api.organizations import AsOrganizationApi
+    from wxc_sdk.as_api.people import AsPeopleApi
+    from wxc_sdk.as_api.person_settings import AsPersonSettingsApi
+    from wxc_sdk.as_api.person_settings_agent_caller_id import AsAgentCallerIdApi
+    from wxc_sdk.as_api.person_settings_anon_calls import AsAnonCallsApi
+    from wxc_sdk.as_api.person_settings_app_shared_line import AsAppSharedLineApi
+    from wxc_sdk.as_api.person_settings_appservices import AsAppServicesApi
+    from wxc_sdk.as_api.person_settings_available_numbers import AsAvailableNumbersApi
+    from wxc_sdk.as_api.person_settings_barge import AsBargeApi
+    from wxc_sdk.as_api.person_settings_call_intercept import AsCallInterceptApi
+    from wxc_sdk.as_api.person_settings_call_policy import AsCallPolicyApi
+    from wxc_sdk.as_api.person_settings_call_recording import AsCallRecordingApi
+    from wxc_sdk.as_api.person_settings_call_waiting import AsCallWaitingApi
+    from wxc_sdk.as_api.person_settings_callbridge import AsCallBridgeApi
+    from wxc_sdk.as_api.person_settings_caller_id import AsCallerIdApi
+    from wxc_sdk.as_api.person_settings_calling_behavior import AsCallingBehaviorApi
+    from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+    from wxc_sdk.as_api.person_settings_dnd import AsDndApi
+    from wxc_sdk.as_api.person_settings_ecbn import AsECBNApi
+    from wxc_sdk.as_api.person_settings_exec_assistant import AsExecAssistantApi
+    from wxc_sdk.as_api.person_settings_forwarding import AsPersonForwardingApi
+    from wxc_sdk.as_api.person_settings_hoteling import AsHotelingApi
+    from wxc_sdk.as_api.person_settings_mode_management import AsModeManagementApi
+    from wxc_sdk.as_api.person_settings_moh import AsMusicOnHoldApi
+    from wxc_sdk.as_api.person_settings_monitoring import AsMonitoringApi
+    from wxc_sdk.as_api.person_settings_msteams import AsMSTeamsSettingApi, AsOrgMSTeamsSettingApi
+    from wxc_sdk.as_api.person_settings_numbers import AsNumbersApi
+    from wxc_sdk.as_api.person_settings_permissions_in import AsIncomingPermissionsApi
+    from wxc_sdk.as_api.person_settings_permissions_out import AsAccessCodesApi, AsDigitPatternsApi, \
+        AsOutgoingPermissionsApi, AsTransferNumbersApi
+    from wxc_sdk.as_api.person_settings_personal_assistant import AsPersonalAssistantApi
+    from wxc_sdk.as_api.person_settings_preferred_answer import AsPreferredAnswerApi
+    from wxc_sdk.as_api.person_settings_priority_alert import AsPriorityAlertApi
+    from wxc_sdk.as_api.person_settings_privacy import AsPrivacyApi
+    from wxc_sdk.as_api.person_settings_push_to_talk import AsPushToTalkApi
+    from wxc_sdk.as_api.person_settings_receptionist import AsReceptionistApi
+    from wxc_sdk.as_api.person_settings_selective_accept import AsSelectiveAcceptApi
+    from wxc_sdk.as_api.person_settings_selective_forward import AsSelectiveForwardApi
+    from wxc_sdk.as_api.person_settings_selective_reject import AsSelectiveRejectApi
+    from wxc_sdk.as_api.person_settings_sequential_ring import AsSequentialRingApi
+    from wxc_sdk.as_api.person_settings_sim_ring import AsSimRingApi
+    from wxc_sdk.as_api.person_settings_voicemail import AsVoicemailApi
+    from wxc_sdk.as_api.reports import AsReportsApi
+    from wxc_sdk.as_api.roles import AsRolesApi
+    from wxc_sdk.as_api.room_tabs import AsRoomTabsApi
+    from wxc_sdk.as_api.rooms import AsRoomsApi
+    from wxc_sdk.as_api.scim import AsScimV2Api
+    from wxc_sdk.as_api.scim_bulk import AsSCIM2BulkApi
+    from wxc_sdk.as_api.scim_child import AsScimApiChild
+    from wxc_sdk.as_api.scim_groups import AsSCIM2GroupsApi
+    from wxc_sdk.as_api.scim_users import AsSCIM2UsersApi
+    from wxc_sdk.as_api.status import AsStatusAPI
+    from wxc_sdk.as_api.team_memberships import AsTeamMembershipsApi
+    from wxc_sdk.as_api.teams import AsTeamsApi
+    from wxc_sdk.as_api.telephony import AsTelephonyApi
+    from wxc_sdk.as_api.telephony_access_codes import AsLocationAccessCodesApi
+    from wxc_sdk.as_api.telephony_announcements_repo import AsAnnouncementsRepositoryApi
+    from wxc_sdk.as_api.telephony_autoattendant import AsAutoAttendantApi
+    from wxc_sdk.as_api.telephony_call_recording import AsCallRecordingSettingsApi
+    from wxc_sdk.as_api.telephony_call_routing import AsCallRoutingApi
+    from wxc_sdk.as_api.telephony_call_routing_translation_pattern import AsTranslationPatternsApi
+    from wxc_sdk.as_api.telephony_callpark import AsCallParkApi
+    from wxc_sdk.as_api.telephony_callpark_extension import AsCallparkExtensionApi
+    from wxc_sdk.as_api.telephony_callpickup import AsCallPickupApi
+    from wxc_sdk.as_api.telephony_callqueue import AsCallQueueApi
+    from wxc_sdk.as_api.telephony_callqueue_agents import AsCallQueueAgentsApi
+    from wxc_sdk.as_api.telephony_callqueue_announcement import AsAnnouncementApi
+    from wxc_sdk.as_api.telephony_callqueue_policies import AsCQPolicyApi
+    from wxc_sdk.as_api.telephony_calls import AsCallsApi
+    from wxc_sdk.as_api.telephony_conference import AsConferenceControlsApi
+    from wxc_sdk.as_api.telephony_cx_essentials import AsCustomerExperienceEssentialsApi
+    from wxc_sdk.as_api.telephony_dect_devices import AsDECTDevicesApi
+    from wxc_sdk.as_api.telephony_devices import AsTelephonyDevicesApi
+    from wxc_sdk.as_api.telephony_emergency_services import AsOrgEmergencyServicesApi
+    from wxc_sdk.as_api.telephony_forwarding import AsFeatureSelector, AsForwardingApi
+    from wxc_sdk.as_api.telephony_guest_calling import AsGuestCallingApi
+    from wxc_sdk.as_api.telephony_huntgroup import AsHuntGroupApi
+    from wxc_sdk.as_api.telephony_jobs import AsApplyLineKeyTemplatesJobsApi, AsDeviceSettingsJobsApi, AsJobsApi, \
+        AsManageNumbersJobsApi, AsMoveUsersJobsApi, AsRebuildPhonesJobsApi, AsUpdateRoutingPrefixJobsApi
+    from wxc_sdk.as_api.telephony_location import AsTelephonyLocationApi
+    from wxc_sdk.as_api.telephony_location_emergency_services import AsLocationEmergencyServicesApi
+    from wxc_sdk.as_api.telephony_location_intercept import AsLocationInterceptApi
+    from wxc_sdk.as_api.telephony_location_internal_dialing import AsInternalDialingApi
+    from wxc_sdk.as_api.telephony_location_moh import AsLocationMoHApi
+    from wxc_sdk.as_api.telephony_location_numbers import AsLocationNumbersApi
+    from wxc_sdk.as_api.telephony_location_receptionist_contacts import AsReceptionistContactsDirectoryApi
+    from wxc_sdk.as_api.telephony_location_vm import AsLocationVoicemailSettingsApi
+    from wxc_sdk.as_api.telephony_operating_modes import AsOperatingModesApi
+    from wxc_sdk.as_api.telephony_org_access_codes import AsOrganisationAccessCodesApi
+    from wxc_sdk.as_api.telephony_organisation_vm import AsOrganisationVoicemailSettingsAPI
+    from wxc_sdk.as_api.telephony_paging import AsPagingApi
+    from wxc_sdk.as_api.telephony_playlists import AsPlayListApi
+    from wxc_sdk.as_api.telephony_pnc import AsPrivateNetworkConnectApi
+    from wxc_sdk.as_api.telephony_prem_pstn import AsPremisePstnApi
+    from wxc_sdk.as_api.telephony_prem_pstn_dial_plan import AsDialPlanApi
+    from wxc_sdk.as_api.telephony_prem_pstn_route_group import AsRouteGroupApi
+    from wxc_sdk.as_api.telephony_prem_pstn_route_list import AsRouteListApi
+    from wxc_sdk.as_api.telephony_prem_pstn_trunk import AsTrunkApi
+    from wxc_sdk.as_api.telephony_pstn import AsPSTNApi
+    from wxc_sdk.as_api.telephony_supervisor import AsSupervisorApi
+    from wxc_sdk.as_api.telephony_virtual_line import AsVirtualLinesApi
+    from wxc_sdk.as_api.telephony_vm_rules import AsVoicemailRulesApi
+    from wxc_sdk.as_api.telephony_voice_messaging import AsVoiceMessagingApi
+    from wxc_sdk.as_api.telephony_voicemail_groups import AsVoicemailGroupsApi
+    from wxc_sdk.as_api.telephony_voiceportal import AsVoicePortalApi
+    from wxc_sdk.as_api.webex_simple_api import AsWebexSimpleApi
+    from wxc_sdk.as_api.webhook import AsWebhookApi
+    from wxc_sdk.as_api.workspace_locations import AsWorkspaceLocationApi, AsWorkspaceLocationFloorApi
+    from wxc_sdk.as_api.workspace_personalization import AsWorkspacePersonalizationApi
+    from wxc_sdk.as_api.workspace_settings import AsWorkspaceSettingsApi
+    from wxc_sdk.as_api.workspace_settings_devices import AsWorkspaceDevicesApi
+    from wxc_sdk.as_api.workspace_settings_numbers import AsWorkspaceNumbersApi
+    from wxc_sdk.as_api.workspaces import AsWorkspacesApi
+    from wxc_sdk.as_api.xapi import AsXApi
+    from wxc_sdk.as_rest import AsRestSession
+
+__all__ = ['AsAccessCodesApi', 'AsAdminAuditEventsApi', 'AsAgentCallerIdApi', 'AsAnnouncementApi',
+           'AsAnnouncementsRepositoryApi', 'AsAnonCallsApi', 'AsApiChild', 'AsAppServicesApi', 'AsAppSharedLineApi',
+           'AsApplyLineKeyTemplatesJobsApi', 'AsAttachmentActionsApi', 'AsAuthorizationsApi', 'AsAutoAttendantApi',
+           'AsAvailableNumbersApi', 'AsBargeApi', 'AsCQPolicyApi', 'AsCallBridgeApi', 'AsCallInterceptApi',
+           'AsCallParkApi', 'AsCallPickupApi', 'AsCallPolicyApi', 'AsCallQueueAgentsApi', 'AsCallQueueApi',
+           'AsCallRecordingApi', 'AsCallRecordingSettingsApi', 'AsCallRoutingApi', 'AsCallWaitingApi',
+           'AsCallerIdApi', 'AsCallingBehaviorApi', 'AsCallparkExtensionApi', 'AsCallsApi', 'AsConferenceControlsApi',
+           'AsConvergedRecordingsApi', 'AsCustomerExperienceEssentialsApi', 'AsDECTDevicesApi', 'AsDetailedCDRApi',
+           'AsDeviceConfigurationsApi', 'AsDeviceSettingsJobsApi', 'AsDevicesApi', 'AsDialPlanApi',
+           'AsDigitPatternsApi', 'AsDndApi', 'AsECBNApi', 'AsEventsApi', 'AsExecAssistantApi', 'AsFeatureSelector',
+           'AsForwardingApi', 'AsGroupsApi', 'AsGuestCallingApi', 'AsGuestManagementApi', 'AsHotelingApi',
+           'AsHuntGroupApi', 'AsIncomingPermissionsApi', 'AsInternalDialingApi', 'AsJobsApi', 'AsLicensesApi',
+           'AsLocationAccessCodesApi', 'AsLocationEmergencyServicesApi', 'AsLocationInterceptApi', 'AsLocationMoHApi',
+           'AsLocationNumbersApi', 'AsLocationVoicemailSettingsApi', 'AsLocationsApi', 'AsMSTeamsSettingApi',
+           'AsManageNumbersJobsApi', 'AsMeetingChatsApi', 'AsMeetingClosedCaptionsApi', 'AsMeetingInviteesApi',
+           'AsMeetingParticipantsApi', 'AsMeetingPreferencesApi', 'AsMeetingQandAApi', 'AsMeetingQualitiesApi',
+           'AsMeetingTranscriptsApi', 'AsMeetingsApi', 'AsMembershipApi', 'AsMessagesApi', 'AsModeManagementApi',
+           'AsMonitoringApi', 'AsMoveUsersJobsApi', 'AsMusicOnHoldApi', 'AsNumbersApi', 'AsOperatingModesApi',
+           'AsOrgEmergencyServicesApi', 'AsOrgMSTeamsSettingApi', 'AsOrganisationAccessCodesApi',
+           'AsOrganisationVoicemailSettingsAPI', 'AsOrganizationApi', 'AsOrganizationContactsApi',
+           'AsOutgoingPermissionsApi', 'AsPSTNApi', 'AsPagingApi', 'AsPeopleApi', 'AsPersonForwardingApi',
+           'AsPersonSettingsApi', 'AsPersonSettingsApiChild', 'AsPersonalAssistantApi', 'AsPlayListApi',
+           'AsPreferredAnswerApi', 'AsPremisePstnApi', 'AsPriorityAlertApi', 'AsPrivacyApi',
+           'AsPrivateNetworkConnectApi', 'AsPushToTalkApi', 'AsRebuildPhonesJobsApi', 'AsReceptionistApi',
+           'AsReceptionistContactsDirectoryApi', 'AsRecordingsApi', 'AsReportsApi', 'AsRestSession', 'AsRolesApi',
+           'AsRoomTabsApi', 'AsRoomsApi', 'AsRouteGroupApi', 'AsRouteListApi', 'AsSCIM2BulkApi', 'AsSCIM2GroupsApi',
+           'AsSCIM2UsersApi', 'AsScheduleApi', 'AsScimApiChild', 'AsScimV2Api', 'AsSelectiveAcceptApi',
+           'AsSelectiveForwardApi', 'AsSelectiveRejectApi', 'AsSequentialRingApi', 'AsSimRingApi', 'AsStatusAPI',
+           'AsSupervisorApi', 'AsTeamMembershipsApi', 'AsTeamsApi', 'AsTelephonyApi', 'AsTelephonyDevicesApi',
+           'AsTelephonyLocationApi', 'AsTransferNumbersApi', 'AsTranslationPatternsApi', 'AsTrunkApi',
+           'AsUpdateRoutingPrefixJobsApi', 'AsVirtualLinesApi', 'AsVoiceMessagingApi', 'AsVoicePortalApi',
+           'AsVoicemailApi', 'AsVoicemailGroupsApi', 'AsVoicemailRulesApi', 'AsWebexSimpleApi', 'AsWebhookApi',
+           'AsWorkspaceDevicesApi', 'AsWorkspaceLocationApi', 'AsWorkspaceLocationFloorApi', 'AsWorkspaceNumbersApi',
+           'AsWorkspacePersonalizationApi', 'AsWorkspaceSettingsApi', 'AsWorkspacesApi', 'AsXApi']
+
+#: module defining each class
+_MODULES = {
+    'AsAccessCodesApi': 'wxc_sdk.as_api.person_settings_permissions_out',
+    'AsAdminAuditEventsApi': 'wxc_sdk.as_api.admin_audit',
+    'AsAgentCallerIdApi': 'wxc_sdk.as_api.person_settings_agent_caller_id',
+    'AsAnnouncementApi': 'wxc_sdk.as_api.telephony_callqueue_announcement',
+    'AsAnnouncementsRepositoryApi': 'wxc_sdk.as_api.telephony_announcements_repo',
+    'AsAnonCallsApi': 'wxc_sdk.as_api.person_settings_anon_calls',
+    'AsApiChild': 'wxc_sdk.as_api.api_child',
+    'AsAppServicesApi': 'wxc_sdk.as_api.person_settings_appservices',
+    'AsAppSharedLineApi': 'wxc_sdk.as_api.person_settings_app_shared_line',
+    'AsApplyLineKeyTemplatesJobsApi': 'wxc_sdk.as_api.telephony_jobs',
+    'AsAttachmentActionsApi': 'wxc_sdk.as_api.attachment_actions',
+    'AsAuthorizationsApi': 'wxc_sdk.as_api.authorizations',
+    'AsAutoAttendantApi': 'wxc_sdk.as_api.telephony_autoattendant',
+    'AsAvailableNumbersApi': 'wxc_sdk.as_api.person_settings_available_numbers',
+    'AsBargeApi': 'wxc_sdk.as_api.person_settings_barge',
+    'AsCQPolicyApi': 'wxc_sdk.as_api.telephony_callqueue_policies',
+    'AsCallBridgeApi': 'wxc_sdk.as_api.person_settings_callbridge',
+    'AsCallInterceptApi': 'wxc_sdk.as_api.person_settings_call_intercept',
+    'AsCallParkApi': 'wxc_sdk.as_api.telephony_callpark',
+    'AsCallPickupApi': 'wxc_sdk.as_api.telephony_callpickup',
+    'AsCallPolicyApi': 'wxc_sdk.as_api.person_settings_call_policy',
+    'AsCallQueueAgentsApi': 'wxc_sdk.as_api.telephony_callqueue_agents',
+    'AsCallQueueApi': 'wxc_sdk.as_api.telephony_callqueue',
+    'AsCallRecordingApi': 'wxc_sdk.as_api.person_settings_call_recording',
+    'AsCallRecordingSettingsApi': 'wxc_sdk.as_api.telephony_call_recording',
+    'AsCallRoutingApi': 'wxc_sdk.as_api.telephony_call_routing',
+    'AsCallWaitingApi': 'wxc_sdk.as_api.person_settings_call_waiting',
+    'AsCallerIdApi': 'wxc_sdk.as_api.person_settings_caller_id',
+    'AsCallingBehaviorApi': 'wxc_sdk.as_api.person_settings_calling_behavior',
+    'AsCallparkExtensionApi': 'wxc_sdk.as_api.telephony_callpark_extension',
+    'AsCallsApi': 'wxc_sdk.as_api.telephony_calls',
+    'AsConferenceControlsApi': 'wxc_sdk.as_api.telephony_conference',
+    'AsConvergedRecordingsApi': 'wxc_sdk.as_api.converged_recordings',
+    'AsCustomerExperienceEssentialsApi': 'wxc_sdk.as_api.telephony_cx_essentials',
+    'AsDECTDevicesApi': 'wxc_sdk.as_api.telephony_dect_devices',
+    'AsDetailedCDRApi': 'wxc_sdk.as_api.cdr',
+    'AsDeviceConfigurationsApi': 'wxc_sdk.as_api.device_configurations',
+    'AsDeviceSettingsJobsApi': 'wxc_sdk.as_api.telephony_jobs',
+    'AsDevicesApi': 'wxc_sdk.as_api.devices',
+    'AsDialPlanApi': 'wxc_sdk.as_api.telephony_prem_pstn_dial_plan',
+    'AsDigitPatternsApi': 'wxc_sdk.as_api.person_settings_permissions_out',
+    'AsDndApi': 'wxc_sdk.as_api.person_settings_dnd',
+    'AsECBNApi': 'wxc_sdk.as_api.person_settings_ecbn',
+    'AsEventsApi': 'wxc_sdk.as_api.events',
+    'AsExecAssistantApi': 'wxc_sdk.as_api.person_settings_exec_assistant',
+    'AsFeatureSelector': 'wxc_sdk.as_api.telephony_forwarding',
+    'AsForwardingApi': 'wxc_sdk.as_api.telephony_forwarding',
+    'AsGroupsApi': 'wxc_sdk.as_api.groups',
+    'AsGuestCallingApi': 'wxc_sdk.as_api.telephony_guest_calling',
+    'AsGuestManagementApi': 'wxc_sdk.as_api.guests',
+    'AsHotelingApi': 'wxc_sdk.as_api.person_settings_hoteling',
+    'AsHuntGroupApi': 'wxc_sdk.as_api.telephony_huntgroup',
+    'AsIncomingPermissionsApi': 'wxc_sdk.as_api.person_settings_permissions_in',
+    'AsInternalDialingApi': 'wxc_sdk.as_api.telephony_location_internal_dialing',
+    'AsJobsApi': 'wxc_sdk.as_api.telephony_jobs',
+    'AsLicensesApi': 'wxc_sdk.as_api.licenses',
+    'AsLocationAccessCodesApi': 'wxc_sdk.as_api.telephony_access_codes',
+    'AsLocationEmergencyServicesApi': 'wxc_sdk.as_api.telephony_location_emergency_services',
+    'AsLocationInterceptApi': 'wxc_sdk.as_api.telephony_location_intercept',
+    'AsLocationMoHApi': 'wxc_sdk.as_api.telephony_location_moh',
+    'AsLocationNumbersApi': 'wxc_sdk.as_api.telephony_location_numbers',
+    'AsLocationVoicemailSettingsApi': 'wxc_sdk.as_api.telephony_location_vm',
+    'AsLocationsApi': 'wxc_sdk.as_api.locations',
+    'AsMSTeamsSettingApi': 'wxc_sdk.as_api.person_settings_msteams',
+    'AsManageNumbersJobsApi': 'wxc_sdk.as_api.telephony_jobs',
+    'AsMeetingChatsApi': 'wxc_sdk.as_api.meetings_chats',
+    'AsMeetingClosedCaptionsApi': 'wxc_sdk.as_api.meetings_closed_captions',
+    'AsMeetingInviteesApi': 'wxc_sdk.as_api.meetings_invitees',
+    'AsMeetingParticipantsApi': 'wxc_sdk.as_api.meetings_participants',
+    'AsMeetingPreferencesApi': 'wxc_sdk.as_api.meetings_preferences',
+    'AsMeetingQandAApi': 'wxc_sdk.as_api.meetings_qanda',
+    'AsMeetingQualitiesApi': 'wxc_sdk.as_api.meetings_qualities',
+    'AsMeetingTranscriptsApi': 'wxc_sdk.as_api.meetings_transcripts',
+    'AsMeetingsApi': 'wxc_sdk.as_api.meetings',
+    'AsMembershipApi': 'wxc_sdk.as_api.memberships',
+    'AsMessagesApi': 'wxc_sdk.as_api.messages',
+    'AsModeManagementApi': 'wxc_sdk.as_api.person_settings_mode_management',
+    'AsMonitoringApi': 'wxc_sdk.as_api.person_settings_monitoring',
+    'AsMoveUsersJobsApi': 'wxc_sdk.as_api.telephony_jobs',
+    'AsMusicOnHoldApi': 'wxc_sdk.as_api.person_settings_moh',
+    'AsNumbersApi': 'wxc_sdk.as_api.person_settings_numbers',
+    'AsOperatingModesApi': 'wxc_sdk.as_api.telephony_operating_modes',
+    'AsOrgEmergencyServicesApi': 'wxc_sdk.as_api.telephony_emergency_services',
+    'AsOrgMSTeamsSettingApi': 'wxc_sdk.as_api.person_settings_msteams',
+    'AsOrganisationAccessCodesApi': 'wxc_sdk.as_api.telephony_org_access_codes',
+    'AsOrganisationVoicemailSettingsAPI': 'wxc_sdk.as_api.telephony_organisation_vm',
+    'AsOrganizationApi': 'wxc_sdk.as_api.organizations',
+    'AsOrganizationContactsApi': 'wxc_sdk.as_api.org_contacts',
+    'AsOutgoingPermissionsApi': 'wxc_sdk.as_api.person_settings_permissions_out',
+    'AsPSTNApi': 'wxc_sdk.as_api.telephony_pstn',
+    'AsPagingApi': 'wxc_sdk.as_api.telephony_paging',
+    'AsPeopleApi': 'wxc_sdk.as_api.people',
+    'AsPersonForwardingApi': 'wxc_sdk.as_api.person_settings_forwarding',
+    'AsPersonSettingsApi': 'wxc_sdk.as_api.person_settings',
+    'AsPersonSettingsApiChild': 'wxc_sdk.as_api.person_settings_common',
+    'AsPersonalAssistantApi': 'wxc_sdk.as_api.person_settings_personal_assistant',
+    'AsPlayListApi': 'wxc_sdk.as_api.telephony_playlists',
+    'AsPreferredAnswerApi': 'wxc_sdk.as_api.person_settings_preferred_answer',
+    'AsPremisePstnApi': 'wxc_sdk.as_api.telephony_prem_pstn',
+    'AsPriorityAlertApi': 'wxc_sdk.as_api.person_settings_priority_alert',
+    'AsPrivacyApi': 'wxc_sdk.as_api.person_settings_privacy',
+    'AsPrivateNetworkConnectApi': 'wxc_sdk.as_api.telephony_pnc',
+    'AsPushToTalkApi': 'wxc_sdk.as_api.person_settings_push_to_talk',
+    'AsRebuildPhonesJobsApi': 'wxc_sdk.as_api.telephony_jobs',
+    'AsReceptionistApi': 'wxc_sdk.as_api.person_settings_receptionist',
+    'AsReceptionistContactsDirectoryApi': 'wxc_sdk.as_api.telephony_location_receptionist_contacts',
+    'AsRecordingsApi': 'wxc_sdk.as_api.meetings_recordings',
+    'AsReportsApi': 'wxc_sdk.as_api.reports',
+    'AsRestSession': 'wxc_sdk.as_rest',
+    'AsRolesApi': 'wxc_sdk.as_api.roles',
+    'AsRoomTabsApi': 'wxc_sdk.as_api.room_tabs',
+    'AsRoomsApi': 'wxc_sdk.as_api.rooms',
+    'AsRouteGroupApi': 'wxc_sdk.as_api.telephony_prem_pstn_route_group',
+    'AsRouteListApi': 'wxc_sdk.as_api.telephony_prem_pstn_route_list',
+    'AsSCIM2BulkApi': 'wxc_sdk.as_api.scim_bulk',
+    'AsSCIM2GroupsApi': 'wxc_sdk.as_api.scim_groups',
+    'AsSCIM2UsersApi': 'wxc_sdk.as_api.scim_users',
+    'AsScheduleApi': 'wxc_sdk.as_api.common_schedules',
+    'AsScimApiChild': 'wxc_sdk.as_api.scim_child',
+    'AsScimV2Api': 'wxc_sdk.as_api.scim',
+    'AsSelectiveAcceptApi': 'wxc_sdk.as_api.person_settings_selective_accept',
+    'AsSelectiveForwardApi': 'wxc_sdk.as_api.person_settings_selective_forward',
+    'AsSelectiveRejectApi': 'wxc_sdk.as_api.person_settings_selective_reject',
+    'AsSequentialRingApi': 'wxc_sdk.as_api.person_settings_sequential_ring',
+    'AsSimRingApi': 'wxc_sdk.as_api.person_settings_sim_ring',
+    'AsStatusAPI': 'wxc_sdk.as_api.status',
+    'AsSupervisorApi': 'wxc_sdk.as_api.telephony_supervisor',
+    'AsTeamMembershipsApi': 'wxc_sdk.as_api.team_memberships',
+    'AsTeamsApi': 'wxc_sdk.as_api.teams',
+    'AsTelephonyApi': 'wxc_sdk.as_api.telephony',
+    'AsTelephonyDevicesApi': 'wxc_sdk.as_api.telephony_devices',
+    'AsTelephonyLocationApi': 'wxc_sdk.as_api.telephony_location',
+    'AsTransferNumbersApi': 'wxc_sdk.as_api.person_settings_permissions_out',
+    'AsTranslationPatternsApi': 'wxc_sdk.as_api.telephony_call_routing_translation_pattern',
+    'AsTrunkApi': 'wxc_sdk.as_api.telephony_prem_pstn_trunk',
+    'AsUpdateRoutingPrefixJobsApi': 'wxc_sdk.as_api.telephony_jobs',
+    'AsVirtualLinesApi': 'wxc_sdk.as_api.telephony_virtual_line',
+    'AsVoiceMessagingApi': 'wxc_sdk.as_api.telephony_voice_messaging',
+    'AsVoicePortalApi': 'wxc_sdk.as_api.telephony_voiceportal',
+    'AsVoicemailApi': 'wxc_sdk.as_api.person_settings_voicemail',
+    'AsVoicemailGroupsApi': 'wxc_sdk.as_api.telephony_voicemail_groups',
+    'AsVoicemailRulesApi': 'wxc_sdk.as_api.telephony_vm_rules',
+    'AsWebexSimpleApi': 'wxc_sdk.as_api.webex_simple_api',
+    'AsWebhookApi': 'wxc_sdk.as_api.webhook',
+    'AsWorkspaceDevicesApi': 'wxc_sdk.as_api.workspace_settings_devices',
+    'AsWorkspaceLocationApi': 'wxc_sdk.as_api.workspace_locations',
+    'AsWorkspaceLocationFloorApi': 'wxc_sdk.as_api.workspace_locations',
+    'AsWorkspaceNumbersApi': 'wxc_sdk.as_api.workspace_settings_numbers',
+    'AsWorkspacePersonalizationApi': 'wxc_sdk.as_api.workspace_personalization',
+    'AsWorkspaceSettingsApi': 'wxc_sdk.as_api.workspace_settings',
+    'AsWorkspacesApi': 'wxc_sdk.as_api.workspaces',
+    'AsXApi': 'wxc_sdk.as_api.xapi',
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _MODULES[name]
+    except KeyError:
+        if name.startswith('__'):
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+        # data types can also be imported from here
+        try:
+            value = getattr(import_module('wxc_sdk.all_types'), name)
+        except AttributeError:
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    else:
+        value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
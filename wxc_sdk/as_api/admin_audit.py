@@ -0,0 +1,137 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.admin_audit import AuditEvent
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsAdminAuditEventsApi']
+
+
+class AsAdminAuditEventsApi(AsApiChild, base='adminAudit'):
+    """
+    Admin Audit Events
+
+    Admin Audit Events are available to full administrators for `certain events
+    <https://help.webex.com/en-us/article/nqzomav/Control-Hub-audit-events-reference>`_ performed in Webex Control Hub.
+
+    Administrators with accounts created before 2019 who have never logged into `Webex Control Hub
+    <https://admin.webex.com>`_ will need to log into
+    Webex Control Hub at least once to enable access to this API.
+
+    An administrator account with the `audit:events_read` scope is required to use this API.
+    """
+
+    def list_events_gen(self, org_id: str, from_: Union[str, datetime], to_: Union[str, datetime],
+                    actor_id: str = None, event_categories: list[str] = None,
+                    **params) -> AsyncGenerator[AuditEvent, None, None]:
+        """
+        List Admin Audit Events
+
+        List admin audit events in your organization. Several query parameters are available to filter the response.
+
+        Long result sets will be split into `pages
+        <https://developer.webex.com/docs/basics#pagination>`_.
+
+        **NOTE**: A maximum of one year of audit events can be returned per request.
+
+        :param org_id: List events in this organization, by ID.
+        :type org_id: str
+        :param from_: List events which occurred after a specific date and time.
+        :type from_: Union[str, datetime]
+        :param to_: List events which occurred before a specific date and time.
+        :type to_: Union[str, datetime]
+        :param actor_id: List events performed by this person, by ID.
+        :type actor_id: str
+        :param event_categories: List events, by event categories.
+        :type event_categories: list[str]
+        :return: Generator yielding :class:`AuditEvent` instances
+        """
+        params['orgId'] = org_id
+        if isinstance(from_, str):
+            from_ = isoparse(from_)
+        from_ = dt_iso_str(from_)
+        params['from'] = from_
+        if isinstance(to_, str):
+            to_ = isoparse(to_)
+        to_ = dt_iso_str(to_)
+        params['to'] = to_
+        if actor_id is not None:
+            params['actorId'] = actor_id
+        if event_categories is not None:
+            params['eventCategories'] = ','.join(event_categories)
+        url = self.ep('events')
+        return self.session.follow_pagination(url=url, model=AuditEvent, item_key='items', params=params)
+
+    async def list_events(self, org_id: str, from_: Union[str, datetime], to_: Union[str, datetime],
+                    actor_id: str = None, event_categories: list[str] = None,
+                    **params) -> List[AuditEvent]:
+        """
+        List Admin Audit Events
+
+        List admin audit events in your organization. Several query parameters are available to filter the response.
+
+        Long result sets will be split into `pages
+        <https://developer.webex.com/docs/basics#pagination>`_.
+
+        **NOTE**: A maximum of one year of audit events can be returned per request.
+
+        :param org_id: List events in this organization, by ID.
+        :type org_id: str
+        :param from_: List events which occurred after a specific date and time.
+        :type from_: Union[str, datetime]
+        :param to_: List events which occurred before a specific date and time.
+        :type to_: Union[str, datetime]
+        :param actor_id: List events performed by this person, by ID.
+        :type actor_id: str
+        :param event_categories: List events, by event categories.
+        :type event_categories: list[str]
+        :return: Generator yielding :class:`AuditEvent` instances
+        """
+        params['orgId'] = org_id
+        if isinstance(from_, str):
+            from_ = isoparse(from_)
+        from_ = dt_iso_str(from_)
+        params['from'] = from_
+        if isinstance(to_, str):
+            to_ = isoparse(to_)
+        to_ = dt_iso_str(to_)
+        params['to'] = to_
+        if actor_id is not None:
+            params['actorId'] = actor_id
+        if event_categories is not None:
+            params['eventCategories'] = ','.join(event_categories)
+        url = self.ep('events')
+        return [o async for o in self.session.follow_pagination(url=url, model=AuditEvent, item_key='items', params=params)]
+
+    async def list_event_categories(self) -> list[str]:
+        """
+        List Admin Audit Event Categories
+
+        Get the list of all admin event categories.
+
+        :rtype: list[str]
+        """
+        url = self.ep('eventCategories')
+        data = await super().get(url)
+        r = data['eventCategories']
+        return r
@@ -0,0 +1,114 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsApiChild']
+
+
+@dataclass(init=False, repr=False)
+class AsApiChild:
+    """
+    Base class for child APIs of :class:`AsWebexSimpleApi`
+    """
+    session: AsRestSession
+
+    def __init__(self, *, session: AsRestSession, base: str = None):
+        #: REST session
+        self.session = session
+        if base:
+            self.base = base
+
+    # noinspection PyMethodOverriding
+
+    def __init_subclass__(cls, base: str):
+        """
+        Subclass registration hook. Each APIChild has a specific endpoint prefix which we gather at subclass
+        registration time-
+
+        :param base: APIChild specific URL path
+        """
+        super().__init_subclass__()
+        # save endpoint prefix
+        cls.base = base
+
+    def ep(self, path: str = None):
+        """
+        endpoint URL for given path
+
+        :param path: path after APIChild subclass specific endpoint URI prefix
+        :type path: str
+        :return: endpoint URL
+        :rtype: str
+        """
+        path = path or ''
+        if self.base and path:
+            path = f'/{path}'
+        return self.session.ep(f'{self.base}{path}')
+
+    async def get(self, *args, **kwargs) -> StrOrDict:
+        """
+        GET request
+
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        return await self.session.rest_get(*args, **kwargs)
+
+    async def post(self, *args, **kwargs) -> StrOrDict:
+        """
+        POST request
+
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        return await self.session.rest_post(*args, **kwargs)
+
+    async def put(self, *args, **kwargs) -> StrOrDict:
+        """
+        PUT request
+
+        :param args:
+        :param kwargs:
+        :return:
+        """
+        return await self.session.rest_put(*args, **kwargs)
+
+    async def delete(self, *args, **kwargs) -> StrOrDict:
+        """
+        DELETE request
+
+        :param args:
+        :param kwargs:
+        """
+        return await self.session.rest_delete(*args, **kwargs)
+
+    async def patch(self, *args, **kwargs) -> StrOrDict:
+        """
+        PATCH request
+
+        :param args:
+        :param kwargs:
+        """
+        return await self.session.rest_patch(*args, **kwargs)
@@ -0,0 +1,46 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.attachment_actions import AttachmentAction
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsAttachmentActionsApi']
+
+
+class AsAttachmentActionsApi(AsApiChild, base='attachment/actions'):
+    """
+    Users create attachment actions by interacting with message attachments such as clicking on a submit button in a
+    card.
+    """
+
+    async def details(self, action_id: str) -> AttachmentAction:
+        """
+        Shows details for a attachment action, by ID.
+        Specify the attachment action ID in the id URI parameter.
+
+        :param action_id: A unique identifier for the attachment action.
+        :type action_id: str
+        """
+        url = self.ep(f'{action_id}')
+        data = await super().get(url=url)
+        return AttachmentAction.model_validate(data)
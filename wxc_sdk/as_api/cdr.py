@@ -0,0 +1,132 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.cdr import CDR
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsDetailedCDRApi']
+
+
+@dataclass(init=False, repr=False)
+class AsDetailedCDRApi(AsApiChild, base='devices'):
+    """
+    To retrieve Detailed Call History information, you must use a token with the spark-admin:calling_cdr_read scope.
+    The authenticating user must be a read-only-admin or full-admin of the organization and have the administrator
+    role "Webex Calling Detailed Call History API access" enabled.
+
+    Detailed Call History information is available 5 minutes after a call has ended and may be retrieved for up to 48
+    hours. For example, if a call ends at 9:46 am, the record for that call can be collected using the API from 9:51
+    am, and is available until 9:46 am two days later.
+
+    This API is rate-limited to one call every 5 minutes for a given organization ID.
+    """
+
+    def get_cdr_history_gen(self, start_time: Union[str, datetime] = None, end_time: Union[datetime, str] = None,
+                        locations: list[str] = None, **params) -> AsyncGenerator[CDR, None, None]:
+        """
+        Provides Webex Calling Detailed Call History data for your organization.
+
+        Results can be filtered with the startTime, endTime and locations request parameters. The startTime and endTime
+        parameters specify the start and end of the time period for the Detailed Call History reports you wish to
+        collect.
+        The API will return all reports that were created between startTime and endTime.
+
+        :param start_time: Time of the first report you wish to collect. (report time is the time the call finished).
+            Can be a datetime object or an ISO-8601 datetime string to be
+            parsed by :meth:`dateutil.parser.isoparse`.
+
+            Note: The specified time must be between 5 minutes ago and 48 hours ago.
+        :type start_time: Union[str, datetime]
+        :param end_time: Time of the last report you wish to collect. Note: The specified time should be earlier than
+            startTime and no earlier than 48 hours ago. Can be a datetime object or an ISO-8601 datetime string to be
+            parsed by :meth:`dateutil.parser.isoparse`.
+        :type end_time: Union[str, datetime]
+        :param locations: Names of the location (as shown in Control Hub). Up to 10 comma-separated locations can be
+            provided. Allows you to query reports by location.
+        :type locations: list[str]
+        :param params: additional arguments
+        :return:
+        """
+        url = 'https://analytics.webexapis.com/v1/cdr_feed'
+        if locations:
+            params['locations'] = ','.join(locations)
+        if not start_time:
+            start_time = datetime.now(tz=tz.tzutc()) - timedelta(hours=47, minutes=58)
+        if not end_time:
+            end_time = datetime.now(tz=tz.tzutc()) - timedelta(minutes=5, seconds=30)
+
+        def guess_datetime(dt: Union[datetime, str]) -> str:
+            if isinstance(dt, str):
+                dt = isoparse(dt)
+            r = dt_iso_str(dt)
+            return r
+
+        params['startTime'] = guess_datetime(start_time)
+        params['endTime'] = guess_datetime(end_time)
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=CDR, params=params, item_key='items')
+
+    async def get_cdr_history(self, start_time: Union[str, datetime] = None, end_time: Union[datetime, str] = None,
+                        locations: list[str] = None, **params) -> List[CDR]:
+        """
+        Provides Webex Calling Detailed Call History data for your organization.
+
+        Results can be filtered with the startTime, endTime and locations request parameters. The startTime and endTime
+        parameters specify the start and end of the time period for the Detailed Call History reports you wish to
+        collect.
+        The API will return all reports that were created between startTime and endTime.
+
+        :param start_time: Time of the first report you wish to collect. (report time is the time the call finished).
+            Can be a datetime object or an ISO-8601 datetime string to be
+            parsed by :meth:`dateutil.parser.isoparse`.
+
+            Note: The specified time must be between 5 minutes ago and 48 hours ago.
+        :type start_time: Union[str, datetime]
+        :param end_time: Time of the last report you wish to collect. Note: The specified time should be earlier than
+            startTime and no earlier than 48 hours ago. Can be a datetime object or an ISO-8601 datetime string to be
+            parsed by :meth:`dateutil.parser.isoparse`.
+        :type end_time: Union[str, datetime]
+        :param locations: Names of the location (as shown in Control Hub). Up to 10 comma-separated locations can be
+            provided. Allows you to query reports by location.
+        :type locations: list[str]
+        :param params: additional arguments
+        :return:
+        """
+        url = 'https://analytics.webexapis.com/v1/cdr_feed'
+        if locations:
+            params['locations'] = ','.join(locations)
+        if not start_time:
+            start_time = datetime.now(tz=tz.tzutc()) - timedelta(hours=47, minutes=58)
+        if not end_time:
+            end_time = datetime.now(tz=tz.tzutc()) - timedelta(minutes=5, seconds=30)
+
+        def guess_datetime(dt: Union[datetime, str]) -> str:
+            if isinstance(dt, str):
+                dt = isoparse(dt)
+            r = dt_iso_str(dt)
+            return r
+
+        params['startTime'] = guess_datetime(start_time)
+        params['endTime'] = guess_datetime(end_time)
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=CDR, params=params, item_key='items')]
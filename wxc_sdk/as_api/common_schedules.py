@@ -0,0 +1,398 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.common.schedules import Event, Schedule, ScheduleApiBase, ScheduleType, ScheduleTypeOrStr
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsScheduleApi']
+
+
+class AsScheduleApi(AsApiChild, base='telephony/config/locations'):
+    """
+    Schedules API
+    """
+
+    def __init__(self, *, session: AsRestSession, base: ScheduleApiBase):
+        super().__init__(session=session, base=base.value)
+        if base == ScheduleApiBase.people:
+            self.after_id = '/features/schedules'
+        elif base == ScheduleApiBase.locations:
+            self.after_id = '/schedules'
+        else:
+            raise ValueError('unexpected value for base')
+
+    def _endpoint(self, *, obj_id: str, schedule_type: ScheduleTypeOrStr = None, schedule_id: str = None,
+                  event_id: str = None):
+        """
+        location specific feature endpoint like v1/telephony/config/locations/{obj_id}/schedules/.... or
+        v1/people/{obj_id}/features/schedules/....
+
+        :meta private:
+        :param obj_id: Unique identifier for the location or user
+        :type obj_id: str
+        :param schedule_type: type of schedule
+        :type schedule_type: ScheduleType
+        :param schedule_id: schedule id
+        :type schedule_id: str
+        :return: full endpoint
+        :rtype: str
+        """
+        ep = self.ep(path=f'{obj_id}{self.after_id}')
+        if schedule_type is not None:
+            schedule_type = ScheduleType.type_or_str(schedule_type)
+            ep = f'{ep}/{schedule_type.value}/{schedule_id}'
+            if event_id is not None:
+                event_id = event_id and f'/{event_id}' or ''
+                ep = f'{ep}/events{event_id}'
+        return ep
+
+    def list_gen(self, obj_id: str, org_id: str = None, schedule_type: ScheduleType = None,
+             name: str = None, **params) -> AsyncGenerator[Schedule, None, None]:
+        """
+        List of Schedules for a Person or location
+
+        List schedules for a person or location in an organization.
+
+        Schedules are used to support calling features and can be defined at the location or person level.
+        businessHours schedules allow you to apply specific call settings at different times of the day or week
+        by defining one or more events. holidays schedules define exceptions to normal business hours by defining one
+        or more events.
+
+        This API requires a full, user, or read-only administrator auth token with a scope of spark-admin:people_read.
+
+        :param obj_id: Return the list of schedules for this location or user
+        :type obj_id: str
+        :param org_id: List schedules for this organization.
+        :type org_id: str
+        :param schedule_type: Type of the schedule.
+            businessHours - Business hours schedule type.
+            holidays - Holidays schedule type.
+        :param name: Only return schedules with the matching name.
+        :return: yields schedules
+        """
+        url = self._endpoint(obj_id=obj_id)
+        if schedule_type is not None:
+            params['type'] = schedule_type.value
+        if name is not None:
+            params['name'] = name
+        if org_id is not None:
+            params['orgId'] = org_id
+
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=Schedule, params=params or None)
+
+    async def list(self, obj_id: str, org_id: str = None, schedule_type: ScheduleType = None,
+             name: str = None, **params) -> List[Schedule]:
+        """
+        List of Schedules for a Person or location
+
+        List schedules for a person or location in an organization.
+
+        Schedules are used to support calling features and can be defined at the location or person level.
+        businessHours schedules allow you to apply specific call settings at different times of the day or week
+        by defining one or more events. holidays schedules define exceptions to normal business hours by defining one
+        or more events.
+
+        This API requires a full, user, or read-only administrator auth token with a scope of spark-admin:people_read.
+
+        :param obj_id: Return the list of schedules for this location or user
+        :type obj_id: str
+        :param org_id: List schedules for this organization.
+        :type org_id: str
+        :param schedule_type: Type of the schedule.
+            businessHours - Business hours schedule type.
+            holidays - Holidays schedule type.
+        :param name: Only return schedules with the matching name.
+        :return: yields schedules
+        """
+        url = self._endpoint(obj_id=obj_id)
+        if schedule_type is not None:
+            params['type'] = schedule_type.value
+        if name is not None:
+            params['name'] = name
+        if org_id is not None:
+            params['orgId'] = org_id
+
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=Schedule, params=params or None)]
+
+    async def details(self, obj_id: str, schedule_type: ScheduleTypeOrStr, schedule_id: str,
+                org_id: str = None) -> Schedule:
+        """
+        Get Details for a Schedule
+
+        Retrieve Schedule details.
+
+        A time schedule establishes a set of times during the day or holidays in the year in which a feature, for
+        example auto attendants, can perform a specific action.
+
+        Retrieving schedule details requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param obj_id: Retrieve schedule details in this location or user
+        :type obj_id: str
+        :param schedule_type: Type of the schedule.
+            businessHours - Business hours schedule type.
+            holidays - Holidays schedule type.
+        :type schedule_type: ScheduleTypeOrStr
+        :param schedule_id: Retrieve the schedule with the matching ID.
+        :type schedule_id: str
+        :param org_id: Retrieve schedule details from this organization.
+        :type org_id: str
+        :return:
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(obj_id=obj_id, schedule_type=schedule_type, schedule_id=schedule_id)
+        data = await self.get(url, params=params)
+        result = Schedule.model_validate(data)
+        return result
+
+    async def create(self, obj_id: str, schedule: Schedule, org_id: str = None) -> str:
+        """
+        Create a Schedule
+
+        Create new Schedule for the given location.
+
+        A time schedule establishes a set of times during the day or holidays in the year in which a feature, for
+        example auto attendants, can perform a specific action.
+
+        Creating a schedule requires a full administrator auth token with a scope of spark-admin:telephony_config_write.
+
+        :param obj_id: Create the schedule for this location or user
+        :type obj_id: str
+        :param schedule: Schedule to be created
+        :type schedule: Schedule
+        :param org_id: Create the schedule for this organization.
+        :type org_id: str
+        :return: ID of the newly created schedule.
+        :rtype: str
+        """
+        schedule_data = schedule.create_update()
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(obj_id=obj_id)
+        data = await self.post(url, data=schedule_data, params=params)
+        result = data['id']
+        return result
+
+    async def update(self, obj_id: str, schedule: Schedule, schedule_type: ScheduleTypeOrStr = None,
+               schedule_id: str = None, org_id: str = None) -> str:
+        """
+        Update a Schedule
+
+        Update the designated Schedule.
+
+        A time schedule establishes a set of times during the day or holidays in the year in which a feature, for
+        example auto attendants, can perform a specific action.
+
+        Updating a schedule requires a full administrator auth token with a scope of spark-admin:telephony_config_write.
+
+        NOTE: The Schedule ID will change upon modification of the Schedule name
+
+        :param obj_id: Location or user for  which this schedule exists
+        :type obj_id: str
+        :param schedule: data for the update
+        :type schedule: Schedule
+        :param schedule_type: Type of the schedule. Default: schedule_type from schedule
+            businessHours - Business hours schedule type.
+            holidays - Holidays schedule type.
+        :type schedule_type: ScheduleTypeOrStr
+        :param schedule_id: Update schedule with the matching ID. Default: schedule_id from schedule
+        :type schedule_id: str
+        :param org_id: Update schedule from this organization.
+        :type org_id: str
+        :return: schedule id
+        """
+        schedule_type = schedule_type or schedule.schedule_type
+        schedule_id = schedule_id or schedule.schedule_id
+        schedule_data = schedule.create_update(update=True)
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(obj_id=obj_id, schedule_type=schedule_type, schedule_id=schedule_id)
+        data = await self.put(url, data=schedule_data, params=params)
+        return data['id']
+
+    async def delete_schedule(self, obj_id: str, schedule_type: ScheduleTypeOrStr, schedule_id: str,
+                        org_id: str = None):
+        """
+        Delete a Schedule
+
+        Delete the designated Schedule.
+
+        A time schedule establishes a set of times during the day or holidays in the year in which a feature, for
+        example auto attendants, can perform a specific action.
+
+        Deleting a schedule requires a full administrator auth token with a scope of spark-admin:telephony_config_write.
+
+        :param obj_id: Location or user from which to delete a schedule.
+        :type obj_id: str
+        :param schedule_type: Type of the schedule.
+            businessHours - Business hours schedule type.
+            holidays - Holidays schedule type.
+        :type schedule_type: ScheduleTypeOrStr
+        :param schedule_id: Delete the schedule with the matching ID.
+        :type schedule_id: str
+        :param org_id: Retrieve schedule details from this organization.
+        :type org_id: str
+        :return:
+        """
+        url = self._endpoint(obj_id=obj_id, schedule_type=schedule_type, schedule_id=schedule_id)
+        params = org_id and {'orgId': org_id} or None
+        await self.delete(url, params=params)
+
+    async def event_details(self, obj_id: str, schedule_type: ScheduleTypeOrStr, schedule_id: str,
+                      event_id: str, org_id: str = None) -> Event:
+        """
+        Get Details for a Schedule Event
+
+        Retrieve Schedule Event details.
+
+        A time schedule establishes a set of times during the day or holidays in the year in which a feature, for
+        example auto attendants, can perform a specific action.
+
+        Retrieving schedule event details requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param obj_id: Retrieve schedule event details for this location or user
+        :type obj_id: str
+        :param schedule_type: Type of the schedule.
+            businessHours - Business hours schedule type.
+            holidays - Holidays schedule type.
+        :type schedule_type: ScheduleTypeOrStr
+        :param schedule_id: Retrieve schedule event details for schedule with the matching ID.
+        :type schedule_id: str
+        :param event_id: Retrieve the schedule event with the matching schedule event ID.
+        :type event_id: str
+        :param org_id: Retrieve schedule event details from this organization.
+        :type org_id: str
+        :return:
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(obj_id=obj_id, schedule_type=schedule_type, schedule_id=schedule_id,
+                             event_id=event_id)
+        data = await self.get(url, params=params)
+        result = Event.model_validate(data)
+        return result
+
+    async def event_create(self, obj_id: str, schedule_type: ScheduleTypeOrStr, schedule_id: str,
+                     event: Event, org_id: str = None) -> str:
+        """
+        Create a Schedule Event
+
+        Create new Event for the given location or user Schedule.
+
+        A time schedule establishes a set of times during the day or holidays in the year in which a feature, for
+        example auto attendants, can perform a specific action.
+
+        Creating a schedule event requires a full administrator auth token with a scope of
+        spark-admin:telephony_config_write.
+
+        :param obj_id: Create the schedule for this location.
+        :type obj_id: str
+        :param schedule_type: Type of the schedule.
+            businessHours - Business hours schedule type.
+            holidays - Holidays schedule type.
+        :type schedule_type: ScheduleTypeOrStr
+        :param schedule_id: Create event for a given schedule ID.
+        :type schedule_id: str
+        :param event: event data
+        :type event: Event
+        :param org_id: Retrieve schedule event details from this organization.
+        :type org_id: str
+        :return: event id
+        :rtype: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(obj_id=obj_id, schedule_type=schedule_type, schedule_id=schedule_id,
+                             event_id='')
+        data = event.model_dump_json(exclude={'event_id'})
+        data = await self.post(url, data=data, params=params)
+        return data['id']
+
+    async def event_update(self, obj_id: str, schedule_type: ScheduleTypeOrStr, schedule_id: str,
+                     event: Event, event_id: str = None, org_id: str = None) -> str:
+        """
+        Update a Schedule Event
+
+        Update the designated Schedule Event.
+
+        A time schedule establishes a set of times during the day or holidays in the year in which a feature, for
+        example auto attendants, can perform a specific action.
+
+        Updating a schedule event requires a full administrator auth token with a scope of
+        spark-admin:telephony_config_write.
+
+        NOTE: The Schedule Event ID will change upon modification of the Schedule event name.
+
+        :param obj_id: Location or user for which this schedule event exists.
+        :type obj_id: str
+        :param schedule_type: Type of the schedule.
+            businessHours - Business hours schedule type.
+            holidays - Holidays schedule type.
+        :type schedule_type: ScheduleTypeOrStr
+        :param schedule_id: Update schedule event with the matching schedule ID.
+        :type schedule_id: str
+        :param event: update settings
+        :type event: Event
+        :param event_id: Update the schedule event with the matching schedule event ID. Default: event id from event
+        :type event_id: str
+        :param org_id: Update schedule from this organization.
+        :type org_id: str
+        :return: event id; changed if name changed
+        """
+        event_id = event_id or event.event_id
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(obj_id=obj_id, schedule_type=schedule_type, schedule_id=schedule_id,
+                             event_id=event_id)
+        event_data = event.model_dump_json(exclude={'event_id'})
+        data = await self.put(url, data=event_data, params=params)
+        return data['id']
+
+    async def event_delete(self, obj_id: str, schedule_type: ScheduleTypeOrStr, schedule_id: str,
+                     event_id: str, org_id: str = None):
+        """
+        Delete a Schedule Event
+
+        Delete the designated Schedule Event.
+
+        A time schedule establishes a set of times during the day or holidays in the year in which a feature, for
+        example auto attendants, can perform a specific action.
+
+        Deleting a schedule event requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param obj_id: Location or user from which to delete a schedule.
+        :type obj_id: str
+        :param schedule_type: Type of the schedule.
+            businessHours - Business hours schedule type.
+            holidays - Holidays schedule type.
+        :type schedule_type: ScheduleTypeOrStr
+        :param schedule_id: Delete schedule event with the matching schedule ID.
+        :type schedule_id: str
+        :param event_id: Delete the schedule event with the matching schedule event ID. Default: event id from event
+        :type event_id: str
+        :param org_id: Delete schedule from this organization.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(obj_id=obj_id, schedule_type=schedule_type, schedule_id=schedule_id,
+                             event_id=event_id)
+        await self.delete(url, params=params)
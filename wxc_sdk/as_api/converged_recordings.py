@@ -0,0 +1,533 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.converged_recordings import ConvergedRecording, ConvergedRecordingMeta, \
+    ConvergedRecordingWithDirectDownloadLinks, RecordingOwnerType, RecordingServiceType, RecordingStatus, \
+    RecordingStorageRegion
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsConvergedRecordingsApi']
+
+
+class AsConvergedRecordingsApi(AsApiChild, base=''):
+    """
+    Converged Recordings
+
+    Not supported for Webex for Government (FedRAMP)
+
+    Webex Meetings and Webex Calling (with Webex as the Call Recording provider) leverage the same recording
+    infrastructure. That ensures that users can use the same recording API to fetch call recordings and/or meeting
+    recordings. This convergence allows the sharing of functionality (summaries, transcripts, etc.) across the Webex
+    Suite and provides a consistent user experience.
+
+    This API is currently limited to Webex Calling i.e., providing details for call recordings but will later be
+    extended to include Webex Meeting recordings.
+
+    The access token needs the following scopes:
+
+    User: `spark:recordings_read` `spark:recordings_write`
+
+    Admin: `spark-admin:recordings_read` `spark-admin:recordings_write`
+
+    Compliance officer: `spark-compliance:recordings_read` `spark-compliance:recordings_write`
+
+
+    When the recording is paused in a call, the recording does not contain the pause. If the recording is stopped and
+    restarted in a call, several recordings are created. Those recordings will be consolidated and available all at
+    once.
+
+    For information on the call recording feature, refer to `Manage call recording for Webex Calling
+    <https://help.webex.com/en-us/article/ilga4/Manage-call-recording-for-Webex-Calling#wbxch_t_manage-call
+    -recording_selecting-call-recording-provider>`_.
+    """
+
+    def list_gen(self, from_: Union[str, datetime] = None,
+             to_: Union[str, datetime] = None, status: RecordingStatus = None,
+             service_type: RecordingServiceType = None,
+             format_: str = None, owner_id: str = None,
+             owner_email: str = None, owner_type: RecordingOwnerType = None,
+             storage_region: RecordingStorageRegion = None,
+             location_id: str = None, topic: str = None,
+             **params) -> AsyncGenerator[ConvergedRecording, None, None]:
+        """
+        List Recordings
+
+        List recordings. You can specify a date range, and the maximum number of recordings to return.
+
+        The list returned is sorted in descending order by the date and time that the recordings were created.
+
+        Long result sets are split into `pages
+        <https://developer.webex.com/docs/basics#pagination>`_.
+
+        List recordings requires the `spark:recordings_read` scope.
+
+        :param from_: Starting date and time (inclusive) for recordings to return, in any `ISO 8601
+            <https://en.wikipedia.org/wiki/ISO_8601>`_ compliant format.
+            `from` cannot be after `to`. The interval between `from` and `to` must be within 30 days.
+        :type from_: Union[str, datetime]
+        :param to_: Ending date and time (exclusive) for List recordings to return, in any `ISO 8601
+            <https://en.wikipedia.org/wiki/ISO_8601>`_ compliant format.
+            `to` cannot be before `from`. The interval between `from` and `to` must be within 30 days.
+        :type to_: Union[str, datetime]
+        :param status: Recording's status. If not specified or `available`, retrieves recordings that are available.
+            Otherwise, if specified as `deleted`, retrieves recordings that have been moved into the recycle bin.
+        :type status: RecordingStatus
+        :param service_type: Recording's service-type. If this item is specified, the API filters recordings by
+            service-type. Valid values are `calling`, or `all`.
+        :type service_type: RecordingServiceType
+        :param format_: Recording's file format. If specified, the API filters recordings by format. Valid values are
+            `MP3`.
+        :type format_: RecordingObjectFormat
+        :param owner_id: Webex user Id to fetch recordings for a particular user.
+        :type owner_id: str
+        :param owner_email: Webex email address to fetch recordings for a particular user.
+        :type owner_email: str
+        :param owner_type: Recording based on type of user.
+        :type owner_type: RecordingOwnerType
+        :param storage_region: Recording stored in certain Webex locations.
+        :type storage_region: RecordingStorageRegion
+        :param location_id: Fetch recordings for users in a particular Webex Calling location (as configured in Control
+            Hub).
+        :type location_id: str
+        :param topic: Recording's topic. If specified, the API filters recordings by topic in a case-insensitive
+            manner.
+        :type topic: str
+        :return: Generator yielding :class:`ConvergedRecording` instances
+        """
+        if from_ is not None:
+            if isinstance(from_, str):
+                from_ = isoparse(from_)
+            from_ = dt_iso_str(from_)
+            params['from'] = from_
+        if to_ is not None:
+            if isinstance(to_, str):
+                to_ = isoparse(to_)
+            to_ = dt_iso_str(to_)
+            params['to'] = to_
+        if status is not None:
+            params['status'] = enum_str(status)
+        if service_type is not None:
+            params['serviceType'] = enum_str(service_type)
+        if format_ is not None:
+            params['format'] = enum_str(format_)
+        if owner_id is not None:
+            params['ownerId'] = owner_id
+        if owner_email is not None:
+            params['ownerEmail'] = owner_email
+        if owner_type is not None:
+            params['ownerType'] = enum_str(owner_type)
+        if storage_region is not None:
+            params['storageRegion'] = enum_str(storage_region)
+        if location_id is not None:
+            params['locationId'] = location_id
+        if topic is not None:
+            params['topic'] = topic
+        url = self.ep('admin/convergedRecordings')
+        return self.session.follow_pagination(url=url, model=ConvergedRecording, item_key='items', params=params)
+
+    async def list(self, from_: Union[str, datetime] = None,
+             to_: Union[str, datetime] = None, status: RecordingStatus = None,
+             service_type: RecordingServiceType = None,
+             format_: str = None, owner_id: str = None,
+             owner_email: str = None, owner_type: RecordingOwnerType = None,
+             storage_region: RecordingStorageRegion = None,
+             location_id: str = None, topic: str = None,
+             **params) -> List[ConvergedRecording]:
+        """
+        List Recordings
+
+        List recordings. You can specify a date range, and the maximum number of recordings to return.
+
+        The list returned is sorted in descending order by the date and time that the recordings were created.
+
+        Long result sets are split into `pages
+        <https://developer.webex.com/docs/basics#pagination>`_.
+
+        List recordings requires the `spark:recordings_read` scope.
+
+        :param from_: Starting date and time (inclusive) for recordings to return, in any `ISO 8601
+            <https://en.wikipedia.org/wiki/ISO_8601>`_ compliant format.
+            `from` cannot be after `to`. The interval between `from` and `to` must be within 30 days.
+        :type from_: Union[str, datetime]
+        :param to_: Ending date and time (exclusive) for List recordings to return, in any `ISO 8601
+            <https://en.wikipedia.org/wiki/ISO_8601>`_ compliant format.
+            `to` cannot be before `from`. The interval between `from` and `to` must be within 30 days.
+        :type to_: Union[str, datetime]
+        :param status: Recording's status. If not specified or `available`, retrieves recordings that are available.
+            Otherwise, if specified as `deleted`, retrieves recordings that have been moved into the recycle bin.
+        :type status: RecordingStatus
+        :param service_type: Recording's service-type. If this item is specified, the API filters recordings by
+            service-type. Valid values are `calling`, or `all`.
+        :type service_type: RecordingServiceType
+        :param format_: Recording's file format. If specified, the API filters recordings by format. Valid values are
+            `MP3`.
+        :type format_: RecordingObjectFormat
+        :param owner_id: Webex user Id to fetch recordings for a particular user.
+        :type owner_id: str
+        :param owner_email: Webex email address to fetch recordings for a particular user.
+        :type owner_email: str
+        :param owner_type: Recording based on type of user.
+        :type owner_type: RecordingOwnerType
+        :param storage_region: Recording stored in certain Webex locations.
+        :type storage_region: RecordingStorageRegion
+        :param location_id: Fetch recordings for users in a particular Webex Calling location (as configured in Control
+            Hub).
+        :type location_id: str
+        :param topic: Recording's topic. If specified, the API filters recordings by topic in a case-insensitive
+            manner.
+        :type topic: str
+        :return: Generator yielding :class:`ConvergedRecording` instances
+        """
+        if from_ is not None:
+            if isinstance(from_, str):
+                from_ = isoparse(from_)
+            from_ = dt_iso_str(from_)
+            params['from'] = from_
+        if to_ is not None:
+            if isinstance(to_, str):
+                to_ = isoparse(to_)
+            to_ = dt_iso_str(to_)
+            params['to'] = to_
+        if status is not None:
+            params['status'] = enum_str(status)
+        if service_type is not None:
+            params['serviceType'] = enum_str(service_type)
+        if format_ is not None:
+            params['format'] = enum_str(format_)
+        if owner_id is not None:
+            params['ownerId'] = owner_id
+        if owner_email is not None:
+            params['ownerEmail'] = owner_email
+        if owner_type is not None:
+            params['ownerType'] = enum_str(owner_type)
+        if storage_region is not None:
+            params['storageRegion'] = enum_str(storage_region)
+        if location_id is not None:
+            params['locationId'] = location_id
+        if topic is not None:
+            params['topic'] = topic
+        url = self.ep('admin/convergedRecordings')
+        return [o async for o in self.session.follow_pagination(url=url, model=ConvergedRecording, item_key='items', params=params)]
+
+    async def details(self, recording_id: str) -> ConvergedRecordingWithDirectDownloadLinks:
+        """
+        Get Recording Details
+
+        Retrieves details for a recording with a specified recording ID.
+
+        Only recordings of owner with the authenticated user may be retrieved.
+
+        Get Recording Details requires the `spark-compliance:recordings_read` scope for compliance officer,
+        `spark-admin:recordings_read` scope for admin and `spark:recordings_read` scope for user.
+
+        :param recording_id: A unique identifier for the recording.
+        :type recording_id: str
+        :rtype: :class:`ConvergedRecordingWithDirectDownloadLinks`
+        """
+        url = self.ep(f'convergedRecordings/{recording_id}')
+        data = await super().get(url)
+        r = ConvergedRecordingWithDirectDownloadLinks.model_validate(data)
+        return r
+
+    async def delete(self, recording_id: str, reason: str = None, comment: str = None):
+        """
+        Delete a Recording
+
+        Removes a recording with a specified recording ID. The deleted recording cannot be recovered.
+
+        If a Compliance Officer deletes another user's recording, the recording will be inaccessible to regular users
+        (host, attendees and shared), and to Compliance officer also. This action purges the recordings from Webex.
+
+        Delete a Recording requires the `spark-compliance:recordings_write` scope.
+
+        :param recording_id: A unique identifier for the recording.
+        :type recording_id: str
+        :param reason: Reason for deleting a recording. Only required when a Compliance Officer is operating on another
+            user's recording.
+        :type reason: str
+        :param comment: Compliance Officer's explanation for deleting a recording. The comment can be a maximum of 255
+            characters long.
+        :type comment: str
+        :rtype: None
+        """
+        body = dict()
+        if reason is not None:
+            body['reason'] = reason
+        if comment is not None:
+            body['comment'] = comment
+        url = self.ep(f'convergedRecordings/{recording_id}')
+        await super().delete(url, json=body)
+
+    async def metadata(self, recording_id: str, show_all_types: bool = None) -> ConvergedRecordingMeta:
+        """
+        Get Recording metadata
+
+        Retrieves metadata details for a recording with a specified recording ID. The recording must be owned by the
+        authenticated user.
+
+        For information on the metadata fields, refer to `Metadata Guide
+        <https://developer.webex.com/docs/api/guides/consolidated-metadata-documentation-and-samples-guide>`_
+
+        Get Recording metadata requires the `spark-compliance:recordings_read` scope for compliance officer,
+        `spark-admin:recordings_read` for admin and `spark:recordings_read` for user.
+
+        :param recording_id: A unique identifier for the recording.
+        :type recording_id: str
+        :param show_all_types: If `showAllTypes` is `true`, all attributes will be shown. If it's `false` or not
+            specified, the following attributes of the metadata will be hidden.
+
+            * serviceData.callActivity.mediaStreams
+
+            * serviceData.callActivity.participants
+
+            * serviceData.callActivity.redirectInfo
+
+            * serviceData.callActivity.redirectedCall
+        :type show_all_types: bool
+        :rtype: None
+        """
+        params = {}
+        if show_all_types is not None:
+            params['showAllTypes'] = str(show_all_types).lower()
+        url = self.ep(f'convergedRecordings/{recording_id}/metadata')
+        data = await super().get(url, params=params)
+        return ConvergedRecordingMeta.model_validate(data)
+
+    async def reassign(self, reassign_owner_email: str, owner_email: str = None, recording_ids: List[str] = None):
+        """
+        Reassign Recordings
+
+        Reassigns recordings to a new user. As an administrator, you can reassign a list of recordings or all
+        recordings of a particular user to a new user.
+
+        The recordings can belong to an org user, a virtual line, or a workspace, but the destination user should only
+        be a valid org user.
+
+        * If only the 'ownerEmail' is provided, it indicates that all recordings owned by the "ownerEmail" will be
+          reassigned.
+
+        * If only the 'recordingIds' are provided, it indicates that these 'recordingIds' will be reassigned.
+
+        * If both the 'ownerEmail' and 'recordingIds' are provided, only the recordingIds belonging to the provided
+          'ownerEmail' will be reassigned.
+
+        The `spark-admin:recordings_write` scope is required to reassign recordings.
+
+        :param reassign_owner_email: New owner of the recordings.
+        :type reassign_owner_email: str
+        :param owner_email: Recording owner email. Can be a user, a virtual line, or a workspace.
+        :type owner_email: str
+        :param recording_ids: List of recording identifiers to be reassigned.
+        :type recording_ids: list[str]
+        :rtype: None
+        """
+        body = dict()
+        if owner_email is not None:
+            body['ownerEmail'] = owner_email
+        if recording_ids is not None:
+            body['recordingIds'] = recording_ids
+        body['reassignOwnerEmail'] = reassign_owner_email
+        url = self.ep('convergedRecordings/reassign')
+        await super().post(url, json=body)
+
+    async def move_recordings_into_the_recycle_bin(self, trash_all: bool = None, owner_email: str = None,
+                                             recording_ids: List[str] = None):
+        """
+        Move Recordings into the Recycle Bin
+
+        Move recordings into the recycle bin with recording IDs or move all the recordings to the recycle bin.
+
+        Only the following two entities can use this API
+
+        * Administrator: A user or an application with the scope `spark-admin:recordings_write`.
+
+        * User: An authenticated user who does not have the scope `spark-admin:recordings_write` but has
+          `spark:recordings_write`.
+
+        As an `administrator`, you can move a list of recordings or all recordings of a particular user within the org
+        you manage to the recycle bin.
+
+        As a `user`, you can move a list of your own recordings or all your recordings to the recycle bin.
+
+        Recordings in the recycle bin can be recovered by `Restore Recordings from Recycle Bin
+        <https://developer.webex.com/docs/api/v1/converged-recordings/restore-recordings-from-recycle-bin>`_ API. If you'd like to
+        empty recordings from the recycle bin, you can use `Purge Recordings from Recycle Bin
+        <https://developer.webex.com/docs/api/v1/converged-recordings/purge-recordings-from-recycle-bin>`_ API to purge all or some
+        of them.
+
+        * If `trashAll` is `true`:
+
+        * `recordingIds` should be empty.
+
+        * If the caller of this API is an `administrator`, `ownerEmail` should not be empty and all recordings owned by
+          the `ownerEmail` will be moved to the recycle bin.
+
+        * If the caller of this API is a `user`, `ownerEmail` should be empty and all recordings owned by the caller
+          will be moved to the recycle bin.
+
+        * If `trashAll` is `false`:
+
+        * `ownerEmail` should be empty.
+
+        * `recordingIds` should not be empty and its maximum size is `100`.
+
+        :param trash_all: If not specified or `false`, moves the recordings specified by `recordingIds` to the recycle
+            bin. If `true`, moves all recordings owned by the caller in case of `user`, and all recordings owned by
+            `ownerEmail` in case of `administrator` to the recycle bin.
+        :type trash_all: bool
+        :param owner_email: Email address for the recording owner. This parameter is only used if `trashAll` is set to
+            `true` and the user or application calling the API has the required administrator scope
+            `spark-admin:recordings_write`. The administrator may specify the email of a user from an org they manage
+            and the API will move all the recordings of that user into the recycle bin.
+        :type owner_email: str
+        :param recording_ids: Recording IDs for moving recordings to the recycle bin in batch.
+        :type recording_ids: list[str]
+        :rtype: None
+        """
+        body = dict()
+        if trash_all is not None:
+            body['trashAll'] = trash_all
+        if owner_email is not None:
+            body['ownerEmail'] = owner_email
+        if recording_ids is not None:
+            body['recordingIds'] = recording_ids
+        url = self.ep('convergedRecordings/softDelete')
+        await super().post(url, json=body)
+
+    async def restore_recordings_from_recycle_bin(self, restore_all: bool = None, owner_email: str = None,
+                                            recording_ids: List[str] = None):
+        """
+        Restore Recordings from Recycle Bin
+
+        Restore recordings from the recycle bin with recording IDs or restore all the recordings that are in the
+        recycle bin.
+
+        Only the following two entities can use this API
+
+        * Administrator: A user or an application with the scope `spark-admin:recordings_write`.
+
+        * User: An authenticated user who does not have the scope `spark-admin:recordings_write` but has
+          `spark:recordings_write`.
+
+        As an `administrator`, you can restore a list of recordings or all recordings of a particular user within the
+        org you manage from the recycle bin.
+
+        As a `user`, you can restore a list of your own recordings or all your recordings from the recycle bin.
+
+        * If `restoreAll` is `true`:
+
+        * `recordingIds` should be empty.
+
+        * If the caller of this API is an `administrator`, `ownerEmail` should not be empty and all recordings owned by
+          the `ownerEmail` will be restored from the recycle bin.
+
+        * If the caller of this API is a `user`, `ownerEmail` should be empty and all recordings owned by the caller
+          will be restored from the recycle bin.
+
+        * If `restoreAll` is `false`:
+
+        * `ownerEmail` should be empty.
+
+        * `recordingIds` should not be empty and its maximum size is `100`.
+
+        :param restore_all: If not specified or `false`, restores the recordings specified by `recordingIds` from the
+            recycle bin. If `true`, restores all recordings owned by the caller in case of `user`, and all recordings
+            owned by `ownerEmail` in case of `administrator` from the recycle bin.
+        :type restore_all: bool
+        :param owner_email: Email address for the recording owner. This parameter is only used if `restoreAll` is set
+            to `true` and the user or application calling the API has the required administrator scope
+            `spark-admin:recordings_write`. The administrator may specify the email of a user from an org they manage
+            and the API will restore all the recordings of that user from the recycle bin.
+        :type owner_email: str
+        :param recording_ids: Recording IDs for restoring recordings from the recycle bin in batch.
+        :type recording_ids: list[str]
+        :rtype: None
+        """
+        body = dict()
+        if restore_all is not None:
+            body['restoreAll'] = restore_all
+        if owner_email is not None:
+            body['ownerEmail'] = owner_email
+        if recording_ids is not None:
+            body['recordingIds'] = recording_ids
+        url = self.ep('convergedRecordings/restore')
+        await super().post(url, json=body)
+
+    async def purge_recordings_from_recycle_bin(self, purge_all: bool = None, owner_email: str = None,
+                                          recording_ids: List[str] = None):
+        """
+        Purge Recordings from Recycle Bin
+
+        Purge recordings from the recycle bin with recording IDs or purge all the recordings that are in the recycle
+        bin. A recording once purged cannot be restored.
+
+        Only the following two entities can use this API
+
+        * Administrator: A user or an application with the scope `spark-admin:recordings_write`.
+
+        * User: An authenticated user who does not have the scope `spark-admin:recordings_write` but has
+          `spark:recordings_write`.
+
+        As an `administrator`, you can purge a list of recordings or all recordings of a particular user within the org
+        you manage from the recycle bin.
+
+        As a `user`, you can purge a list of your own recordings or all your recordings from the recycle bin.
+
+        * If `purgeAll` is `true`:
+
+        * `recordingIds` should be empty.
+
+        * If the caller of this API is an `administrator`, `ownerEmail` should not be empty and all recordings owned
+          the `ownerEmail` will be purged from the recycle bin.
+
+        * If the caller of this API is a `user`, `ownerEmail` should be empty and all recordings owned by the caller
+          will be purged from the recycle bin.
+
+        * If `purgeAll` is `false`:
+
+        * `ownerEmail` should be empty.
+
+        * `recordingIds` should not be empty and its maximum size is `100`.
+
+        :param purge_all: If not specified or `false`, purges the recordings specified by `recordingIds` from the
+            recycle bin. If `true`, purges all recordings owned by the caller in case of `user`, and all recordings
+            owned by `ownerEmail` in case of `administrator` from the recycle bin.
+        :type purge_all: bool
+        :param owner_email: Email address for the recording owner. This parameter is only used if `purgeAll` is set to
+            `true` and the user or application calling the API has the required administrator scope
+            `spark-admin:recordings_write`. The administrator may specify the email of a user from an org they manage
+            and the API will purge all the recordings of that user from the recycle bin.
+        :type owner_email: str
+        :param recording_ids: Recording IDs for purging recordings from the recycle bin in batch.
+        :type recording_ids: list[str]
+        :rtype: None
+        """
+        body = dict()
+        if purge_all is not None:
+            body['purgeAll'] = purge_all
+        if owner_email is not None:
+            body['ownerEmail'] = owner_email
+        if recording_ids is not None:
+            body['recordingIds'] = recording_ids
+        url = self.ep('convergedRecordings/purge')
+        await super().post(url, json=body)
@@ -0,0 +1,79 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.device_configurations import DeviceConfigurationOperation, DeviceConfigurationResponse
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsDeviceConfigurationsApi']
+
+
+class AsDeviceConfigurationsApi(AsApiChild, base='deviceConfigurations'):
+    """
+    The Device Configurations API allows developers to view and modify configurations on Webex Rooms devices, as well as
+    other devices that use the configuration service.
+
+    Viewing the list of all device configurations in an organization requires an administrator auth token with
+    the spark-admin:devices_read scope. Adding, updating, or deleting configurations for devices in an organization
+    requires an administrator auth token with both the spark-admin:devices_write and the spark-admin:devices_read scope.
+    """
+
+    async def list(self, device_id: str, key: str = None) -> DeviceConfigurationResponse:
+        """
+        Lists all device configurations associated with the given device ID. Administrators can list configurations
+        for all devices within an organization.
+
+        :param device_id: List device configurations by device ID.
+        :type device_id: str
+        :param key: This can optionally be used to filter configurations. Keys are composed of segments. It's
+            possible to use absolute paths, wildcards or ranges.
+
+            Absolute gives only one configuration as a result. Conference.MaxReceiveCallRate for example gives the
+            ConferenceMaxReceiveCallRate configuration.
+
+            Wildcards (*) can specify multiple configurations with shared segments. Audio.Ultrasound.* for example
+            will filter on all Audio Ultrasound configurations.
+
+            Range ([number]) can be used to filter numbered segments. FacilityService.Service[1].Name for instance
+            only shows the first FacilityService Service Name configuration, FacilityService.Service[*].Name shows all,
+            FacilityService.Service[1..3].Name shows the first three and FacilityService.Service[2..n].Name shows all
+            starting at 2.
+        :type key: str
+
+        :return: device configurations
+        """
+        params = key and {'key': key} or dict()
+        params['deviceId'] = device_id
+        data = await self.get(self.ep(), params=params)
+        return DeviceConfigurationResponse.model_validate(data)
+
+    async def update(self, device_id: str, operations: List[DeviceConfigurationOperation]) -> DeviceConfigurationResponse:
+        """
+        Update Device Configurations
+
+        :param device_id: Update device configurations by device ID.
+        :param operations: list if operations to apply
+        """
+        body = [op.for_update() for op in operations]
+        data = await self.patch(self.ep(), json=body, content_type='application/json-patch+json',
+                          params={'deviceId': device_id})
+        return DeviceConfigurationResponse.model_validate(data)
@@ -0,0 +1,127 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.events import ComplianceEvent, EventResource, EventType
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsEventsApi']
+
+
+class AsEventsApi(AsApiChild, base='events'):
+    """
+    Events are generated when actions take place within Webex, such as when someone creates or deletes a message.
+    The Events API can only be used by a Compliance Officer with an API access token that contains the
+    spark-compliance:events_read scope. See the Compliance Guide for more information.
+    """
+
+    def list_gen(self, resource: EventResource = None, type_: EventType = None, actor_id: str = None,
+             from_: Union[str, datetime] = None, to_: Union[str, datetime] = None,
+             **params) -> AsyncGenerator[ComplianceEvent, None, None]:
+        """
+        List events in your organization. Several query parameters are available to filter the response.
+
+        Long result sets will be split into `pages
+        <https://developer.webex.com/docs/basics#pagination>`_.
+
+        :param resource: List events with a specific resource type.
+        :type resource: EventResource
+        :param type_: List events with a specific event type.
+        :type type_: EventType
+        :param actor_id: List events performed by this person, by person ID.
+        :type actor_id: str
+        :param from_: List events which occurred after a specific date and time.
+        :type from_: str
+        :param to_: List events that occurred before a specific date and time. If not specified, events up to the
+            present time will be listed. Cannot be set to a future date relative to the current time.
+        :type to_: str
+        """
+        if resource is not None:
+            params['resource'] = enum_str(resource)
+        if type_ is not None:
+            params['type'] = enum_str(type_)
+        if actor_id is not None:
+            params['actorId'] = actor_id
+        if from_ is not None:
+            if isinstance(from_, str):
+                from_ = isoparse(from_)
+            from_ = dt_iso_str(from_)
+            params['from'] = from_
+        if to_ is not None:
+            if isinstance(to_, str):
+                to_ = isoparse(to_)
+            to_ = dt_iso_str(to_)
+            params['to'] = to_
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=ComplianceEvent, params=params)
+
+    async def list(self, resource: EventResource = None, type_: EventType = None, actor_id: str = None,
+             from_: Union[str, datetime] = None, to_: Union[str, datetime] = None,
+             **params) -> List[ComplianceEvent]:
+        """
+        List events in your organization. Several query parameters are available to filter the response.
+
+        Long result sets will be split into `pages
+        <https://developer.webex.com/docs/basics#pagination>`_.
+
+        :param resource: List events with a specific resource type.
+        :type resource: EventResource
+        :param type_: List events with a specific event type.
+        :type type_: EventType
+        :param actor_id: List events performed by this person, by person ID.
+        :type actor_id: str
+        :param from_: List events which occurred after a specific date and time.
+        :type from_: str
+        :param to_: List events that occurred before a specific date and time. If not specified, events up to the
+            present time will be listed. Cannot be set to a future date relative to the current time.
+        :type to_: str
+        """
+        if resource is not None:
+            params['resource'] = enum_str(resource)
+        if type_ is not None:
+            params['type'] = enum_str(type_)
+        if actor_id is not None:
+            params['actorId'] = actor_id
+        if from_ is not None:
+            if isinstance(from_, str):
+                from_ = isoparse(from_)
+            from_ = dt_iso_str(from_)
+            params['from'] = from_
+        if to_ is not None:
+            if isinstance(to_, str):
+                to_ = isoparse(to_)
+            to_ = dt_iso_str(to_)
+            params['to'] = to_
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=ComplianceEvent, params=params)]
+
+    async def details(self, event_id: str) -> ComplianceEvent:
+        """
+        Shows details for an event, by event ID.
+        Specify the event ID in the eventId parameter in the URI.
+
+        :param event_id: The unique identifier for the event.
+        :type event_id: str
+        """
+        url = self.ep(f'{event_id}')
+        data = await super().get(url=url)
+        return ComplianceEvent.model_validate(data)
@@ -0,0 +1,97 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.guests import Guest
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsGuestManagementApi']
+
+
+class AsGuestManagementApi(AsApiChild, base='guests'):
+    """
+    Guest Management
+
+    Guests in Webex are users with only a temporary identity and are often used for single-transaction collaborations.
+    Examples include click-to-call and click-to-chat applications where the guest interacts with the agent only for
+    the duration of the call or chat session.
+    Guests in Webex are created and managed via a Service App with the scope guest-issuer:write and guest-issuer:read
+    and are represented by a token with a fixed and predefined set of scopes.
+
+    Since the Service App manages its own pool of guests, you need to insert the Service App token into the developer
+    portal's Try-It mode rather than your default personal token.
+
+    The `guests/token` endpoint is used to create and retrieve guest tokens, and the `guests/count` is used to assess
+    the number of current guests.
+
+    Creating guests via the guest-issuer application type is deprecated and will
+    be removed in the future.
+
+    """
+
+    async def create(self, subject: str, display_name: str) -> Guest:
+        """
+        Create a Guest
+
+        Create a new token for a single guest user. The Service App that creates the guest must have the scope
+        `guest-issuer:write`.
+
+        Guests are implicitly created by retrieving the guest access token.
+
+        Repeated calls to this API with the same `subject` will create additional tokens without invalidating previous
+        ones. Tokens are valid until the `expiresIn`.
+
+        Guests can be renamed by supplying the same `subject` and changing the `displayName.`
+
+        To retrieve a new token for an existing guest, please provide the existing guest's `subject`. Tokens are valid
+        until `expiresIn`.
+
+        :param subject: The unique and external identifier of the guest.
+        :type subject: str
+        :param display_name: The display name shown in the Webex application.
+        :type display_name: str
+        :rtype: :class:`Guest`
+        """
+        body = dict()
+        body['subject'] = subject
+        body['displayName'] = display_name
+        url = self.ep('token')
+        data = await super().post(url, json=body)
+        guest = Guest.model_validate(data)
+        now = datetime.now(pytz.UTC)
+        if not guest.expires_at and guest.expires_in:
+            delta = timedelta(seconds=guest.expires_in)
+            guest.expires_at = now + delta
+
+        return guest
+
+    async def guest_count(self) -> int:
+        """
+        Get Guest Count
+
+        To retrieve the number of guests, the scopes `guest-issuer:read` or `guest-issuer:write` are needed.
+
+        :rtype: int
+        """
+        url = self.ep('count')
+        data = await super().get(url)
+        return data
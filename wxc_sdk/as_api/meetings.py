@@ -0,0 +1,1352 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.meetings import AttendeePrivileges, AudioConnectionOptions, BreakoutSession, CreateMeetingBody, \
+    GetMeetingSurveyResponse, InterpreterForSimultaneousInterpretation, InviteeForCreateMeeting, JoinMeetingBody, \
+    JoinMeetingResponse, Meeting, MeetingOptions, PatchMeetingBody, PatchMeetingResponse, Registration, \
+    ScheduledMeeting, ScheduledType, SimultaneousInterpretation, SurveyResult, TrackingCode, TrackingCodeItem, \
+    UnlockedMeetingJoinSecurity
+from wxc_sdk.as_api.api_child import AsApiChild
+from wxc_sdk.as_api.meetings_chats import AsMeetingChatsApi
+from wxc_sdk.as_api.meetings_closed_captions import AsMeetingClosedCaptionsApi
+from wxc_sdk.as_api.meetings_invitees import AsMeetingInviteesApi
+from wxc_sdk.as_api.meetings_participants import AsMeetingParticipantsApi
+from wxc_sdk.as_api.meetings_preferences import AsMeetingPreferencesApi
+from wxc_sdk.as_api.meetings_qanda import AsMeetingQandAApi
+from wxc_sdk.as_api.meetings_qualities import AsMeetingQualitiesApi
+from wxc_sdk.as_api.meetings_recordings import AsRecordingsApi
+from wxc_sdk.as_api.meetings_transcripts import AsMeetingTranscriptsApi
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsMeetingsApi']
+
+
+@dataclass(init=False, repr=False)
+class AsMeetingsApi(AsApiChild, base='meetings'):
+    """
+    Meetings API
+    """
+    #: meeting chats API
+    chats: AsMeetingChatsApi
+    #: closed captions API
+    closed_captions: AsMeetingClosedCaptionsApi
+    #: meeting invitees API
+    invitees: AsMeetingInviteesApi
+    #: meeting participants API
+    participants: AsMeetingParticipantsApi
+    #: preferences API
+    preferences: AsMeetingPreferencesApi
+    #: Q and A API
+    qanda: AsMeetingQandAApi
+    #: qualities API
+    qualities: AsMeetingQualitiesApi
+    # recordings
+    recordings: AsRecordingsApi
+    #: transcripts
+    transcripts: AsMeetingTranscriptsApi
+
+    def __init__(self, session: AsRestSession):
+        super().__init__(session=session)
+        self.chats = AsMeetingChatsApi(session=session)
+        self.closed_captions = AsMeetingClosedCaptionsApi(session=session)
+        self.invitees = AsMeetingInviteesApi(session=session)
+        self.participants = AsMeetingParticipantsApi(session=session)
+        self.preferences = AsMeetingPreferencesApi(session=session)
+        self.qanda = AsMeetingQandAApi(session=session)
+        self.qualities = AsMeetingQualitiesApi(session=session)
+        self.recordings = AsRecordingsApi(session=session)
+        self.transcripts = AsMeetingTranscriptsApi(session=session)
+
+    async def create(self, title: str = None, agenda: str = None, password: str = None, start: str = None, end: str = None,
+               timezone: str = None, recurrence: str = None, enabled_auto_record_meeting: bool = None,
+               allow_any_user_to_be_co_host: bool = None, enabled_join_before_host: bool = None,
+               enable_connect_audio_before_host: bool = None, join_before_host_minutes: int = None,
+               exclude_password: bool = None, public_meeting: bool = None, reminder_time: int = None,
+               unlocked_meeting_join_security: UnlockedMeetingJoinSecurity = None, session_type_id: int = None,
+               enabled_webcast_view: bool = None, panelist_password: str = None, enable_automatic_lock: bool = None,
+               automatic_lock_minutes: int = None, allow_first_user_to_be_co_host: bool = None,
+               allow_authenticated_devices: bool = None, send_email: bool = None, host_email: str = None,
+               site_url: str = None, meeting_options: MeetingOptions = None,
+               attendee_privileges: AttendeePrivileges = None, integration_tags: List[str] = None,
+               enabled_breakout_sessions: bool = None, tracking_codes: TrackingCodeItem = None,
+               audio_connection_options: AudioConnectionOptions = None, adhoc: bool = None, room_id: str = None,
+               template_id: str = None, scheduled_type: ScheduledType = None,
+               invitees: InviteeForCreateMeeting = None, registration: Registration = None,
+               simultaneous_interpretation: SimultaneousInterpretation = None,
+               breakout_sessions: BreakoutSession = None) -> Meeting:
+        """
+        Creates a new meeting. Regular users can schedule up to 100 meetings in 24 hours and admin users up to 3000.
+
+        :param title: Meeting title. The title can be a maximum of 128 characters long.
+        :type title: str
+        :param agenda: Meeting agenda. The agenda can be a maximum of 1300 characters long.
+        :type agenda: str
+        :param password: Meeting password. Must conform to the site's password complexity settings. Read password
+            management for details.
+        :type password: str
+        :param start: Date and time for the start of meeting in any ISO 8601 compliant format. start cannot be before
+            current date and time or after end. Duration between start and end cannot be shorter than 10 minutes or
+            longer than 24 hours. Refer to the Webex Meetings guide for more information about restrictions on updating
+            date and time for a meeting. Please note that when a meeting is being updated, start of the meeting will be
+            accurate to minutes, not seconds or milliseconds. Therefore, if start is within the same minute as the
+            current time, start will be adjusted to the upcoming minute; otherwise, start will be adjusted with seconds
+            and milliseconds stripped off. For instance, if the current time is 2022-03-01T10:32:16.657+08:00, start of
+            2022-03-01T10:32:28.076+08:00 or 2022-03-01T10:32:41+08:00 will be adjusted to 2022-03-01T10:33:00+08:00,
+            and start of 2022-03-01T11:32:28.076+08:00 or 2022-03-01T11:32:41+08:00 will be adjusted to
+            2022-03-01T11:32:00+08:00.
+        :type start: str
+        :param end: Date and time for the end of meeting in any ISO 8601 compliant format. end cannot be before current
+            date and time or before start. Duration between start and end cannot be shorter than 10 minutes or longer
+            than 24 hours. Refer to the Webex Meetings guide for more information about restrictions on updating date
+            and time for a meeting. Please note that when a meeting is being updated, end of the meeting will be
+            accurate to minutes, not seconds or milliseconds. Therefore, end will be adjusted with seconds and
+            milliseconds stripped off. For instance, end of 2022-03-01T11:52:28.076+08:00 or 2022-03-01T11:52:41+08:00
+            will be adjusted to 2022-03-01T11:52:00+08:00.
+        :type end: str
+        :param timezone: Time zone in which the meeting was originally scheduled (conforming with the IANA time zone
+            database).
+        :type timezone: str
+        :param recurrence: Meeting series recurrence rule (conforming with RFC 2445). Applies only to a recurring
+            meeting series, not to a meeting series with only one scheduled meeting. Multiple days or dates for monthly
+            or yearly recurrence rule are not supported, only the first day or date specified is taken. For example,
+            "FREQ=MONTHLY;INTERVAL=1;COUNT=10;BYMONTHDAY=10,11,12" is not supported and it will be partially supported
+            as "FREQ=MONTHLY;INTERVAL=1;COUNT=10;BYMONTHDAY=10".
+        :type recurrence: str
+        :param enabled_auto_record_meeting: Whether or not meeting is recorded automatically.
+        :type enabled_auto_record_meeting: bool
+        :param allow_any_user_to_be_co_host: Whether or not to allow any attendee with a host account on the target
+            site to become a cohost when joining the meeting. The target site is specified by siteUrl parameter when
+            creating the meeting; if not specified, it's user's preferred site.
+        :type allow_any_user_to_be_co_host: bool
+        :param enabled_join_before_host: Whether or not to allow any attendee to join the meeting before the host joins
+            the meeting.
+        :type enabled_join_before_host: bool
+        :param enable_connect_audio_before_host: Whether or not to allow any attendee to connect audio in the meeting
+            before the host joins the meeting. This attribute is only applicable if the enabledJoinBeforeHost attribute
+            is set to true.
+        :type enable_connect_audio_before_host: bool
+        :param join_before_host_minutes: The number of minutes an attendee can join the meeting before the meeting
+            start time and the host joins. This attribute is only applicable if the enabledJoinBeforeHost attribute is
+            set to true. Valid options are 0, 5, 10 and 15. Default is 0 if not specified.
+        :type join_before_host_minutes: int
+        :param exclude_password: Whether or not to exclude the meeting password from the email invitation.
+        :type exclude_password: bool
+        :param public_meeting: Whether or not to allow the meeting to be listed on the public calendar.
+        :type public_meeting: bool
+        :param reminder_time: The number of minutes before the meeting begins, that an email reminder is sent to the
+            host.
+        :type reminder_time: int
+        :param unlocked_meeting_join_security: Specifies how the people who aren't on the invite can join the unlocked
+            meeting.
+        :type unlocked_meeting_join_security: UnlockedMeetingJoinSecurity
+        :param session_type_id: Unique identifier for a meeting session type for the user. This attribute is required
+            while scheduling webinar meeting. All available meeting session types enabled for the user can be retrieved
+            by List Meeting Session Types API.
+        :type session_type_id: int
+        :param enabled_webcast_view: Whether or not webcast view is enabled.
+        :type enabled_webcast_view: bool
+        :param panelist_password: Password for panelists of a webinar meeting. Must conform to the site's password
+            complexity settings. Read password management for details. If not specified, a random password conforming
+            to the site's password rules will be generated automatically.
+        :type panelist_password: str
+        :param enable_automatic_lock: Whether or not to automatically lock the meeting after it starts.
+        :type enable_automatic_lock: bool
+        :param automatic_lock_minutes: The number of minutes after the meeting begins, for automatically locking it.
+        :type automatic_lock_minutes: int
+        :param allow_first_user_to_be_co_host: Whether or not to allow the first attendee of the meeting with a host
+            account on the target site to become a cohost. The target site is specified by siteUrl parameter when
+            creating the meeting; if not specified, it's user's preferred site.
+        :type allow_first_user_to_be_co_host: bool
+        :param allow_authenticated_devices: Whether or not to allow authenticated video devices in the meeting's
+            organization to start or join the meeting without a prompt.
+        :type allow_authenticated_devices: bool
+        :param send_email: Whether or not to send emails to host and invitees. It is an optional field and default
+            value is true.
+        :type send_email: bool
+        :param host_email: Email address for the meeting host. This attribute should only be set if the user or
+            application calling the API has the admin-level scopes. When used, the admin may specify the email of a
+            user in a site they manage to be the meeting host.
+        :type host_email: str
+        :param site_url: URL of the Webex site which the meeting is updated on. If not specified, the meeting is
+            created on user's preferred site. All available Webex sites and preferred site of the user can be retrieved
+            by Get Site List API.
+        :type site_url: str
+        :param meeting_options: Meeting Options.
+        :type meeting_options: MeetingOptions
+        :param attendee_privileges: Attendee Privileges.
+        :type attendee_privileges: AttendeePrivileges
+        :param integration_tags: External keys created by an integration application in its own domain, for example
+            Zendesk ticket IDs, Jira IDs, Salesforce Opportunity IDs, etc. The integration application queries meetings
+            by a key in its own domain. The maximum size of integrationTags is 3 and each item of integrationTags can
+            be a maximum of 64 characters long. Please note that an empty or null integrationTags will delete all
+            existing integration tags for the meeting implicitly. Developer can update integration tags for a
+            meetingSeries but he cannot update it for a scheduledMeeting or a meeting instance.
+        :type integration_tags: List[str]
+        :param enabled_breakout_sessions: Whether or not breakout sessions are enabled. If the value of
+            enabledBreakoutSessions is false, users can not set breakout sessions. If the value of
+            enabledBreakoutSessions is true, users can update breakout sessions using the Update Breakout Sessions API.
+            Updating breakout sessions are not supported by this API.
+        :type enabled_breakout_sessions: bool
+        :param tracking_codes: Tracking codes information. All available tracking codes and their options for the
+            specified site can be retrieved by List Meeting Tracking Codes API. If an optional tracking code is missing
+            from the trackingCodes array and there's a default option for this tracking code, the default option is
+            assigned automatically. If the inputMode of a tracking code is select, its value must be one of the
+            site-level options or the user-level value. Tracking code is not supported for a personal room meeting or
+            an ad-hoc space meeting.
+        :type tracking_codes: TrackingCodeItem
+        :param audio_connection_options: Audio connection options.
+        :type audio_connection_options: AudioConnectionOptions
+        :param adhoc: Whether or not to create an ad-hoc meeting for the room specified by roomId. When true, roomId is
+            required.
+        :type adhoc: bool
+        :param room_id: Unique identifier for the Webex space which the meeting is to be associated with. It can be
+            retrieved by List Rooms. roomId is required when adhoc is true. When roomId is specified, the parameter
+            hostEmail will be ignored.
+        :type room_id: str
+        :param template_id: Unique identifier for meeting template. Please note that start and end are optional when
+            templateId is specified. The list of meeting templates that is available for the authenticated user can be
+            retrieved from List Meeting Templates. This parameter is ignored for an ad-hoc meeting.
+        :type template_id: str
+        :param scheduled_type: When set as an attribute in a POST request body, specifies whether it's a regular
+            meeting, a webinar, or a meeting scheduled in the user's personal room. If not specified, it's a regular
+            meeting by default. The default value for an ad-hoc meeting is meeting and the user's input value will be
+            ignored.
+        :type scheduled_type: ScheduledType
+        :param invitees: Invitees for meeting. The maximum size of invitees is 1000. If roomId is specified and
+            invitees is missing, all the members in the space are invited implicitly. If both roomId and invitees are
+            specified, only those in the invitees list are invited. coHost for each invitee is true by default if
+            roomId is specified when creating a meeting, and anyone in the invitee list that is not qualified to be a
+            cohost will be invited as a non-cohost invitee. The user's input value will be ignored for an ad-hoc
+            meeting and the the members of the room specified by roomId except "me" will be used by default.
+        :type invitees: InviteeForCreateMeeting
+        :param registration: Meeting registration. When this option is enabled, meeting invitees must register personal
+            information to join the meeting. Meeting invitees will receive an email with a registration link for the
+            registration. When the registration form has been submitted and approved, an email with a real meeting link
+            will be received. By clicking that link the meeting invitee can join the meeting. Please note that meeting
+            registration does not apply to a meeting when it's a recurring meeting with a recurrence field or no
+            password, or the Join Before Host option is enabled for the meeting. See Register for a Meeting in Cisco
+            Webex Meetings for details. This parameter is ignored for an ad-hoc meeting.
+        :type registration: Registration
+        :param simultaneous_interpretation: Simultaneous interpretation information for a meeting.
+        :type simultaneous_interpretation: SimultaneousInterpretation
+        :param breakout_sessions: Breakout sessions are smaller groups that are split off from the main meeting or
+            webinar. They allow a subset of participants to collaborate and share ideas over audio and video. Use
+            breakout sessions for workshops, classrooms, or for when you need a moment to talk privately with a few
+            participants outside of the main session. Please note that maximum number of breakout sessions in a meeting
+            or webinar is 100. In webinars, if hosts preassign attendees to breakout sessions, the role of attendee
+            will be changed to panelist. Breakout session is not supported for a meeting with simultaneous
+            interpretation.
+        :type breakout_sessions: BreakoutSession
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/create-a-meeting
+        """
+        body = CreateMeetingBody()
+        if title is not None:
+            body.title = title
+        if agenda is not None:
+            body.agenda = agenda
+        if password is not None:
+            body.password = password
+        if start is not None:
+            body.start = start
+        if end is not None:
+            body.end = end
+        if timezone is not None:
+            body.timezone = timezone
+        if recurrence is not None:
+            body.recurrence = recurrence
+        if enabled_auto_record_meeting is not None:
+            body.enabled_auto_record_meeting = enabled_auto_record_meeting
+        if allow_any_user_to_be_co_host is not None:
+            body.allow_any_user_to_be_co_host = allow_any_user_to_be_co_host
+        if enabled_join_before_host is not None:
+            body.enabled_join_before_host = enabled_join_before_host
+        if enable_connect_audio_before_host is not None:
+            body.enable_connect_audio_before_host = enable_connect_audio_before_host
+        if join_before_host_minutes is not None:
+            body.join_before_host_minutes = join_before_host_minutes
+        if exclude_password is not None:
+            body.exclude_password = exclude_password
+        if public_meeting is not None:
+            body.public_meeting = public_meeting
+        if reminder_time is not None:
+            body.reminder_time = reminder_time
+        if unlocked_meeting_join_security is not None:
+            body.unlocked_meeting_join_security = unlocked_meeting_join_security
+        if session_type_id is not None:
+            body.session_type_id = session_type_id
+        if enabled_webcast_view is not None:
+            body.enabled_webcast_view = enabled_webcast_view
+        if panelist_password is not None:
+            body.panelist_password = panelist_password
+        if enable_automatic_lock is not None:
+            body.enable_automatic_lock = enable_automatic_lock
+        if automatic_lock_minutes is not None:
+            body.automatic_lock_minutes = automatic_lock_minutes
+        if allow_first_user_to_be_co_host is not None:
+            body.allow_first_user_to_be_co_host = allow_first_user_to_be_co_host
+        if allow_authenticated_devices is not None:
+            body.allow_authenticated_devices = allow_authenticated_devices
+        if send_email is not None:
+            body.send_email = send_email
+        if host_email is not None:
+            body.host_email = host_email
+        if site_url is not None:
+            body.site_url = site_url
+        if meeting_options is not None:
+            body.meeting_options = meeting_options
+        if attendee_privileges is not None:
+            body.attendee_privileges = attendee_privileges
+        if integration_tags is not None:
+            body.integration_tags = integration_tags
+        if enabled_breakout_sessions is not None:
+            body.enabled_breakout_sessions = enabled_breakout_sessions
+        if tracking_codes is not None:
+            body.tracking_codes = tracking_codes
+        if audio_connection_options is not None:
+            body.audio_connection_options = audio_connection_options
+        if adhoc is not None:
+            body.adhoc = adhoc
+        if room_id is not None:
+            body.room_id = room_id
+        if template_id is not None:
+            body.template_id = template_id
+        if scheduled_type is not None:
+            body.scheduled_type = scheduled_type
+        if invitees is not None:
+            body.invitees = invitees
+        if registration is not None:
+            body.registration = registration
+        if simultaneous_interpretation is not None:
+            body.simultaneous_interpretation = simultaneous_interpretation
+        if breakout_sessions is not None:
+            body.breakout_sessions = breakout_sessions
+        url = self.ep()
+        data = await super().post(url=url, data=body.model_dump_json())
+        return Meeting.model_validate(data)
+
+    async def get(self, meeting_id: str, current: bool = None, host_email: str = None) -> Meeting:
+        """
+        Retrieves details for a meeting with a specified meeting ID.
+
+        :param meeting_id: Unique identifier for the meeting being requested.
+        :type meeting_id: str
+        :param current: Whether or not to retrieve only the current scheduled meeting of the meeting series, i.e. the
+            meeting ready to join or start or the upcoming meeting of the meeting series. If it's true, return details
+            for the current scheduled meeting of the series, i.e. the scheduled meeting ready to join or start or the
+            upcoming scheduled meeting of the meeting series. If it's false or not specified, return details for the
+            entire meeting series. This parameter only applies to meeting series.
+        :type current: bool
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes. If set, the admin may specify the email of a user in a site
+            they manage and the API will return details for a meeting that is hosted by that user.
+        :type host_email: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/get-a-meeting
+        """
+        params = {}
+        if current is not None:
+            params['current'] = str(current).lower()
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        url = self.ep(f'{meeting_id}')
+        data = await super().get(url=url, params=params)
+        return Meeting.model_validate(data)
+
+    def list_gen(self, meeting_number: str = None, web_link: str = None, room_id: str = None, meeting_type: str = None,
+             state: str = None, scheduled_type: str = None, current: bool = None, from_: str = None, to_: str = None,
+             host_email: str = None, site_url: str = None, integration_tag: str = None,
+             **params) -> AsyncGenerator[Meeting, None, None]:
+        """
+        Retrieves details for meetings with a specified meeting number, web link, meeting type, etc. Please note that
+        there are various products in the Webex Suite such as Meetings and Events. Currently, only meetings of the
+        Meetings product are supported by this API, meetings of others in the suite are not supported. Ad-hoc meetings
+        created by Create a Meeting with adhoc of true and a roomId will not be listed, but the ended and ongoing
+        ad-hoc meeting instances will be listed.
+
+        :param meeting_number: Meeting number for the meeting objects being requested. meetingNumber, webLink and
+            roomId are mutually exclusive. If it's an exceptional meeting from a meeting series, the exceptional
+            meeting instead of the primary meeting series is returned.
+        :type meeting_number: str
+        :param web_link: URL encoded link to information page for the meeting objects being requested. meetingNumber,
+            webLink and roomId are mutually exclusive.
+        :type web_link: str
+        :param room_id: Associated Webex space ID for the meeting objects being requested. meetingNumber, webLink and
+            roomId are mutually exclusive.
+        :type room_id: str
+        :param meeting_type: Meeting type for the meeting objects being requested. This parameter will be ignored if
+            meetingNumber, webLink or roomId is specified. Possible values: meetingSeries, scheduledMeeting, meeting
+        :type meeting_type: str
+        :param state: Meeting state for the meeting objects being requested. If not specified, return meetings of all
+            states. This parameter will be ignored if meetingNumber, webLink or roomId is specified. Details of an
+            ended meeting will only be available 15 minutes after the meeting has ended. inProgress meetings are not
+            fully supported. The API will try to return details of an inProgress meeting 15 minutes after the meeting
+            starts. However, it may take longer depending on the traffic. See the Webex Meetings guide for more
+            information about the states of meetings. Possible values: active, scheduled, ready, lobby, inProgress,
+            ended, missed, expired
+        :type state: str
+        :param scheduled_type: Scheduled type for the meeting objects being requested. Possible values: meeting,
+            webinar, personalRoomMeeting
+        :type scheduled_type: str
+        :param current: Flag identifying to retrieve the current scheduled meeting of the meeting series or the entire
+            meeting series. This parameter only applies to scenarios where meetingNumber is specified and the meeting
+            is not an exceptional meeting from a meeting series. If it's true, return the scheduled meeting of the
+            meeting series which is ready to join or start or the upcoming scheduled meeting of the meeting series; if
+            it's false, return the entire meeting series.
+        :type current: bool
+        :param from_: Start date and time (inclusive) in any ISO 8601 compliant format for the meeting objects being
+            requested. from cannot be after to. This parameter will be ignored if meetingNumber, webLink or roomId is
+            specified.
+        :type from_: str
+        :param to_: End date and time (exclusive) in any ISO 8601 compliant format for the meeting objects being
+            requested. to cannot be before from. This parameter will be ignored if meetingNumber, webLink or roomId is
+            specified.
+        :type to_: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes. If set, the admin may specify the email of a user in a site
+            they manage and the API will return details for meetings that are hosted by that user.
+        :type host_email: str
+        :param site_url: URL of the Webex site which the API lists meetings from. If not specified, the API lists
+            meetings from user's all sites. All available Webex sites of the user can be retrieved by Get Site List
+            API.
+        :type site_url: str
+        :param integration_tag: External key created by an integration application. This parameter is used by the
+            integration application to query meetings by a key in its own domain such as a Zendesk ticket ID, a Jira
+            ID, a Salesforce Opportunity ID, etc.
+        :type integration_tag: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/list-meetings
+        """
+        if meeting_number is not None:
+            params['meetingNumber'] = meeting_number
+        if web_link is not None:
+            params['webLink'] = web_link
+        if room_id is not None:
+            params['roomId'] = room_id
+        if meeting_type is not None:
+            params['meetingType'] = meeting_type
+        if state is not None:
+            params['state'] = state
+        if scheduled_type is not None:
+            params['scheduledType'] = scheduled_type
+        if current is not None:
+            params['current'] = current
+        if from_ is not None:
+            params['from'] = from_
+        if to_ is not None:
+            params['to'] = to_
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        if site_url is not None:
+            params['siteUrl'] = site_url
+        if integration_tag is not None:
+            params['integrationTag'] = integration_tag
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=Meeting, params=params)
+
+    async def list(self, meeting_number: str = None, web_link: str = None, room_id: str = None, meeting_type: str = None,
+             state: str = None, scheduled_type: str = None, current: bool = None, from_: str = None, to_: str = None,
+             host_email: str = None, site_url: str = None, integration_tag: str = None,
+             **params) -> List[Meeting]:
+        """
+        Retrieves details for meetings with a specified meeting number, web link, meeting type, etc. Please note that
+        there are various products in the Webex Suite such as Meetings and Events. Currently, only meetings of the
+        Meetings product are supported by this API, meetings of others in the suite are not supported. Ad-hoc meetings
+        created by Create a Meeting with adhoc of true and a roomId will not be listed, but the ended and ongoing
+        ad-hoc meeting instances will be listed.
+
+        :param meeting_number: Meeting number for the meeting objects being requested. meetingNumber, webLink and
+            roomId are mutually exclusive. If it's an exceptional meeting from a meeting series, the exceptional
+            meeting instead of the primary meeting series is returned.
+        :type meeting_number: str
+        :param web_link: URL encoded link to information page for the meeting objects being requested. meetingNumber,
+            webLink and roomId are mutually exclusive.
+        :type web_link: str
+        :param room_id: Associated Webex space ID for the meeting objects being requested. meetingNumber, webLink and
+            roomId are mutually exclusive.
+        :type room_id: str
+        :param meeting_type: Meeting type for the meeting objects being requested. This parameter will be ignored if
+            meetingNumber, webLink or roomId is specified. Possible values: meetingSeries, scheduledMeeting, meeting
+        :type meeting_type: str
+        :param state: Meeting state for the meeting objects being requested. If not specified, return meetings of all
+            states. This parameter will be ignored if meetingNumber, webLink or roomId is specified. Details of an
+            ended meeting will only be available 15 minutes after the meeting has ended. inProgress meetings are not
+            fully supported. The API will try to return details of an inProgress meeting 15 minutes after the meeting
+            starts. However, it may take longer depending on the traffic. See the Webex Meetings guide for more
+            information about the states of meetings. Possible values: active, scheduled, ready, lobby, inProgress,
+            ended, missed, expired
+        :type state: str
+        :param scheduled_type: Scheduled type for the meeting objects being requested. Possible values: meeting,
+            webinar, personalRoomMeeting
+        :type scheduled_type: str
+        :param current: Flag identifying to retrieve the current scheduled meeting of the meeting series or the entire
+            meeting series. This parameter only applies to scenarios where meetingNumber is specified and the meeting
+            is not an exceptional meeting from a meeting series. If it's true, return the scheduled meeting of the
+            meeting series which is ready to join or start or the upcoming scheduled meeting of the meeting series; if
+            it's false, return the entire meeting series.
+        :type current: bool
+        :param from_: Start date and time (inclusive) in any ISO 8601 compliant format for the meeting objects being
+            requested. from cannot be after to. This parameter will be ignored if meetingNumber, webLink or roomId is
+            specified.
+        :type from_: str
+        :param to_: End date and time (exclusive) in any ISO 8601 compliant format for the meeting objects being
+            requested. to cannot be before from. This parameter will be ignored if meetingNumber, webLink or roomId is
+            specified.
+        :type to_: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes. If set, the admin may specify the email of a user in a site
+            they manage and the API will return details for meetings that are hosted by that user.
+        :type host_email: str
+        :param site_url: URL of the Webex site which the API lists meetings from. If not specified, the API lists
+            meetings from user's all sites. All available Webex sites of the user can be retrieved by Get Site List
+            API.
+        :type site_url: str
+        :param integration_tag: External key created by an integration application. This parameter is used by the
+            integration application to query meetings by a key in its own domain such as a Zendesk ticket ID, a Jira
+            ID, a Salesforce Opportunity ID, etc.
+        :type integration_tag: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/list-meetings
+        """
+        if meeting_number is not None:
+            params['meetingNumber'] = meeting_number
+        if web_link is not None:
+            params['webLink'] = web_link
+        if room_id is not None:
+            params['roomId'] = room_id
+        if meeting_type is not None:
+            params['meetingType'] = meeting_type
+        if state is not None:
+            params['state'] = state
+        if scheduled_type is not None:
+            params['scheduledType'] = scheduled_type
+        if current is not None:
+            params['current'] = current
+        if from_ is not None:
+            params['from'] = from_
+        if to_ is not None:
+            params['to'] = to_
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        if site_url is not None:
+            params['siteUrl'] = site_url
+        if integration_tag is not None:
+            params['integrationTag'] = integration_tag
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=Meeting, params=params)]
+
+    def list_of_series_gen(self, meeting_series_id: str, from_: str = None, to_: str = None, meeting_type: str = None,
+                       state: str = None, is_modified: bool = None, host_email: str = None,
+                       **params) -> AsyncGenerator[ScheduledMeeting, None, None]:
+        """
+        Lists scheduled meeting and meeting instances of a meeting series identified by meetingSeriesId. Scheduled
+        meetings of an ad-hoc meeting created by Create a Meeting with adhoc of true and a roomId will not be listed,
+        but the ended and ongoing meeting instances of it will be listed.
+        Each scheduled meeting or meeting instance of a meeting series has its own start, end, etc. Thus, for example,
+        when a daily meeting has been scheduled from 2019-04-01 to 2019-04-10, there are 10 scheduled meeting instances
+        in this series, one instance for each day, and each one has its own attributes. When a scheduled meeting has
+        been started and ended or is happening, there are even more ended or in-progress meeting instances.
+        Use this operation to list scheduled meeting and meeting instances of a meeting series within a specific date
+        range.
+        Long result sets are split into pages.
+        trackingCodes is not supported for ended meeting instances.
+
+        :param meeting_series_id: Unique identifier for the meeting series. Please note that currently meeting ID of a
+            scheduled personal room meeting is not supported for this API.
+        :type meeting_series_id: str
+        :param from_: Start date and time (inclusive) for the range for which meetings are to be returned in any ISO
+            8601 compliant format. from cannot be after to.
+        :type from_: str
+        :param to_: End date and time (exclusive) for the range for which meetings are to be returned in any ISO 8601
+            compliant format. to cannot be before from.
+        :type to_: str
+        :param meeting_type: Meeting type for the meeting objects being requested. If not specified, return meetings of
+            all types. Possible values: scheduledMeeting, meeting
+        :type meeting_type: str
+        :param state: Meeting state for the meetings being requested. If not specified, return meetings of all states.
+            Details of an ended meeting will only be available 15 minutes after the meeting has ended. inProgress
+            meetings are not fully supported. The API will try to return details of an inProgress meeting 15 minutes
+            after the meeting starts. However, it may take longer depending on the traffic. See the Webex Meetings
+            guide for more information about the states of meetings. Possible values: scheduled, ready, lobby,
+            inProgress, ended, missed
+        :type state: str
+        :param is_modified: Flag identifying whether or not only to retrieve scheduled meeting instances which have
+            been modified. This parameter only applies to scheduled meetings. If it's true, only return modified
+            scheduled meetings; if it's false, only return unmodified scheduled meetings; if not specified, all
+            scheduled meetings will be returned.
+        :type is_modified: bool
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes. If set, the admin may specify the email of a user in a site
+            they manage and the API will return meetings that are hosted by that user.
+        :type host_email: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/list-meetings-of-a-meeting-series
+        """
+        params['meetingSeriesId'] = meeting_series_id
+        if from_ is not None:
+            params['from'] = from_
+        if to_ is not None:
+            params['to'] = to_
+        if meeting_type is not None:
+            params['meetingType'] = meeting_type
+        if state is not None:
+            params['state'] = state
+        if is_modified is not None:
+            params['isModified'] = is_modified
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=ScheduledMeeting, params=params)
+
+    async def list_of_series(self, meeting_series_id: str, from_: str = None, to_: str = None, meeting_type: str = None,
+                       state: str = None, is_modified: bool = None, host_email: str = None,
+                       **params) -> List[ScheduledMeeting]:
+        """
+        Lists scheduled meeting and meeting instances of a meeting series identified by meetingSeriesId. Scheduled
+        meetings of an ad-hoc meeting created by Create a Meeting with adhoc of true and a roomId will not be listed,
+        but the ended and ongoing meeting instances of it will be listed.
+        Each scheduled meeting or meeting instance of a meeting series has its own start, end, etc. Thus, for example,
+        when a daily meeting has been scheduled from 2019-04-01 to 2019-04-10, there are 10 scheduled meeting instances
+        in this series, one instance for each day, and each one has its own attributes. When a scheduled meeting has
+        been started and ended or is happening, there are even more ended or in-progress meeting instances.
+        Use this operation to list scheduled meeting and meeting instances of a meeting series within a specific date
+        range.
+        Long result sets are split into pages.
+        trackingCodes is not supported for ended meeting instances.
+
+        :param meeting_series_id: Unique identifier for the meeting series. Please note that currently meeting ID of a
+            scheduled personal room meeting is not supported for this API.
+        :type meeting_series_id: str
+        :param from_: Start date and time (inclusive) for the range for which meetings are to be returned in any ISO
+            8601 compliant format. from cannot be after to.
+        :type from_: str
+        :param to_: End date and time (exclusive) for the range for which meetings are to be returned in any ISO 8601
+            compliant format. to cannot be before from.
+        :type to_: str
+        :param meeting_type: Meeting type for the meeting objects being requested. If not specified, return meetings of
+            all types. Possible values: scheduledMeeting, meeting
+        :type meeting_type: str
+        :param state: Meeting state for the meetings being requested. If not specified, return meetings of all states.
+            Details of an ended meeting will only be available 15 minutes after the meeting has ended. inProgress
+            meetings are not fully supported. The API will try to return details of an inProgress meeting 15 minutes
+            after the meeting starts. However, it may take longer depending on the traffic. See the Webex Meetings
+            guide for more information about the states of meetings. Possible values: scheduled, ready, lobby,
+            inProgress, ended, missed
+        :type state: str
+        :param is_modified: Flag identifying whether or not only to retrieve scheduled meeting instances which have
+            been modified. This parameter only applies to scheduled meetings. If it's true, only return modified
+            scheduled meetings; if it's false, only return unmodified scheduled meetings; if not specified, all
+            scheduled meetings will be returned.
+        :type is_modified: bool
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes. If set, the admin may specify the email of a user in a site
+            they manage and the API will return meetings that are hosted by that user.
+        :type host_email: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/list-meetings-of-a-meeting-series
+        """
+        params['meetingSeriesId'] = meeting_series_id
+        if from_ is not None:
+            params['from'] = from_
+        if to_ is not None:
+            params['to'] = to_
+        if meeting_type is not None:
+            params['meetingType'] = meeting_type
+        if state is not None:
+            params['state'] = state
+        if is_modified is not None:
+            params['isModified'] = is_modified
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=ScheduledMeeting, params=params)]
+
+    async def patch(self, meeting_id: str, title: str = None, agenda: str = None, password: str = None, start: str = None,
+              end: str = None, timezone: str = None, recurrence: str = None, enabled_auto_record_meeting: bool = None,
+              allow_any_user_to_be_co_host: bool = None, enabled_join_before_host: bool = None,
+              enable_connect_audio_before_host: bool = None, join_before_host_minutes: int = None,
+              exclude_password: bool = None, public_meeting: bool = None, reminder_time: int = None,
+              unlocked_meeting_join_security: UnlockedMeetingJoinSecurity = None, session_type_id: int = None,
+              enabled_webcast_view: bool = None, panelist_password: str = None, enable_automatic_lock: bool = None,
+              automatic_lock_minutes: int = None, allow_first_user_to_be_co_host: bool = None,
+              allow_authenticated_devices: bool = None, send_email: bool = None, host_email: str = None,
+              site_url: str = None, meeting_options: MeetingOptions = None,
+              attendee_privileges: AttendeePrivileges = None, integration_tags: List[str] = None,
+              enabled_breakout_sessions: bool = None, tracking_codes: TrackingCodeItem = None,
+              audio_connection_options: AudioConnectionOptions = None) -> PatchMeetingResponse:
+        """
+        Updates details for a meeting with a specified meeting ID. This operation applies to meeting series and
+        scheduled meetings. It doesn't apply to ended or in-progress meeting instances. Ad-hoc meetings created by
+        Create a Meeting with adhoc of true and a roomId cannot be updated.
+
+        :param meeting_id: Unique identifier for the meeting to be updated. This parameter applies to meeting series
+            and scheduled meetings. It doesn't apply to ended or in-progress meeting instances. Please note that
+            currently meeting ID of a scheduled personal room meeting is not supported for this API.
+        :type meeting_id: str
+        :param title: Meeting title. The title can be a maximum of 128 characters long.
+        :type title: str
+        :param agenda: Meeting agenda. The agenda can be a maximum of 1300 characters long.
+        :type agenda: str
+        :param password: Meeting password. Must conform to the site's password complexity settings. Read password
+            management for details.
+        :type password: str
+        :param start: Date and time for the start of meeting in any ISO 8601 compliant format. start cannot be before
+            current date and time or after end. Duration between start and end cannot be shorter than 10 minutes or
+            longer than 24 hours. Refer to the Webex Meetings guide for more information about restrictions on updating
+            date and time for a meeting. Please note that when a meeting is being updated, start of the meeting will be
+            accurate to minutes, not seconds or milliseconds. Therefore, if start is within the same minute as the
+            current time, start will be adjusted to the upcoming minute; otherwise, start will be adjusted with seconds
+            and milliseconds stripped off. For instance, if the current time is 2022-03-01T10:32:16.657+08:00, start of
+            2022-03-01T10:32:28.076+08:00 or 2022-03-01T10:32:41+08:00 will be adjusted to 2022-03-01T10:33:00+08:00,
+            and start of 2022-03-01T11:32:28.076+08:00 or 2022-03-01T11:32:41+08:00 will be adjusted to
+            2022-03-01T11:32:00+08:00.
+        :type start: str
+        :param end: Date and time for the end of meeting in any ISO 8601 compliant format. end cannot be before current
+            date and time or before start. Duration between start and end cannot be shorter than 10 minutes or longer
+            than 24 hours. Refer to the Webex Meetings guide for more information about restrictions on updating date
+            and time for a meeting. Please note that when a meeting is being updated, end of the meeting will be
+            accurate to minutes, not seconds or milliseconds. Therefore, end will be adjusted with seconds and
+            milliseconds stripped off. For instance, end of 2022-03-01T11:52:28.076+08:00 or 2022-03-01T11:52:41+08:00
+            will be adjusted to 2022-03-01T11:52:00+08:00.
+        :type end: str
+        :param timezone: Time zone in which the meeting was originally scheduled (conforming with the IANA time zone
+            database).
+        :type timezone: str
+        :param recurrence: Meeting series recurrence rule (conforming with RFC 2445). Applies only to a recurring
+            meeting series, not to a meeting series with only one scheduled meeting. Multiple days or dates for monthly
+            or yearly recurrence rule are not supported, only the first day or date specified is taken. For example,
+            "FREQ=MONTHLY;INTERVAL=1;COUNT=10;BYMONTHDAY=10,11,12" is not supported and it will be partially supported
+            as "FREQ=MONTHLY;INTERVAL=1;COUNT=10;BYMONTHDAY=10".
+        :type recurrence: str
+        :param enabled_auto_record_meeting: Whether or not meeting is recorded automatically.
+        :type enabled_auto_record_meeting: bool
+        :param allow_any_user_to_be_co_host: Whether or not to allow any attendee with a host account on the target
+            site to become a cohost when joining the meeting. The target site is specified by siteUrl parameter when
+            creating the meeting; if not specified, it's user's preferred site.
+        :type allow_any_user_to_be_co_host: bool
+        :param enabled_join_before_host: Whether or not to allow any attendee to join the meeting before the host joins
+            the meeting.
+        :type enabled_join_before_host: bool
+        :param enable_connect_audio_before_host: Whether or not to allow any attendee to connect audio in the meeting
+            before the host joins the meeting. This attribute is only applicable if the enabledJoinBeforeHost attribute
+            is set to true.
+        :type enable_connect_audio_before_host: bool
+        :param join_before_host_minutes: The number of minutes an attendee can join the meeting before the meeting
+            start time and the host joins. This attribute is only applicable if the enabledJoinBeforeHost attribute is
+            set to true. Valid options are 0, 5, 10 and 15. Default is 0 if not specified.
+        :type join_before_host_minutes: int
+        :param exclude_password: Whether or not to exclude the meeting password from the email invitation.
+        :type exclude_password: bool
+        :param public_meeting: Whether or not to allow the meeting to be listed on the public calendar.
+        :type public_meeting: bool
+        :param reminder_time: The number of minutes before the meeting begins, that an email reminder is sent to the
+            host.
+        :type reminder_time: int
+        :param unlocked_meeting_join_security: Specifies how the people who aren't on the invite can join the unlocked
+            meeting.
+        :type unlocked_meeting_join_security: UnlockedMeetingJoinSecurity
+        :param session_type_id: Unique identifier for a meeting session type for the user. This attribute is required
+            while scheduling webinar meeting. All available meeting session types enabled for the user can be retrieved
+            by List Meeting Session Types API.
+        :type session_type_id: int
+        :param enabled_webcast_view: Whether or not webcast view is enabled.
+        :type enabled_webcast_view: bool
+        :param panelist_password: Password for panelists of a webinar meeting. Must conform to the site's password
+            complexity settings. Read password management for details. If not specified, a random password conforming
+            to the site's password rules will be generated automatically.
+        :type panelist_password: str
+        :param enable_automatic_lock: Whether or not to automatically lock the meeting after it starts.
+        :type enable_automatic_lock: bool
+        :param automatic_lock_minutes: The number of minutes after the meeting begins, for automatically locking it.
+        :type automatic_lock_minutes: int
+        :param allow_first_user_to_be_co_host: Whether or not to allow the first attendee of the meeting with a host
+            account on the target site to become a cohost. The target site is specified by siteUrl parameter when
+            creating the meeting; if not specified, it's user's preferred site.
+        :type allow_first_user_to_be_co_host: bool
+        :param allow_authenticated_devices: Whether or not to allow authenticated video devices in the meeting's
+            organization to start or join the meeting without a prompt.
+        :type allow_authenticated_devices: bool
+        :param send_email: Whether or not to send emails to host and invitees. It is an optional field and default
+            value is true.
+        :type send_email: bool
+        :param host_email: Email address for the meeting host. This attribute should only be set if the user or
+            application calling the API has the admin-level scopes. When used, the admin may specify the email of a
+            user in a site they manage to be the meeting host.
+        :type host_email: str
+        :param site_url: URL of the Webex site which the meeting is updated on. If not specified, the meeting is
+            created on user's preferred site. All available Webex sites and preferred site of the user can be retrieved
+            by Get Site List API.
+        :type site_url: str
+        :param meeting_options: Meeting Options.
+        :type meeting_options: MeetingOptions
+        :param attendee_privileges: Attendee Privileges.
+        :type attendee_privileges: AttendeePrivileges
+        :param integration_tags: External keys created by an integration application in its own domain, for example
+            Zendesk ticket IDs, Jira IDs, Salesforce Opportunity IDs, etc. The integration application queries meetings
+            by a key in its own domain. The maximum size of integrationTags is 3 and each item of integrationTags can
+            be a maximum of 64 characters long. Please note that an empty or null integrationTags will delete all
+            existing integration tags for the meeting implicitly. Developer can update integration tags for a
+            meetingSeries but he cannot update it for a scheduledMeeting or a meeting instance.
+        :type integration_tags: List[str]
+        :param enabled_breakout_sessions: Whether or not breakout sessions are enabled. If the value of
+            enabledBreakoutSessions is false, users can not set breakout sessions. If the value of
+            enabledBreakoutSessions is true, users can update breakout sessions using the Update Breakout Sessions API.
+            Updating breakout sessions are not supported by this API.
+        :type enabled_breakout_sessions: bool
+        :param tracking_codes: Tracking codes information. All available tracking codes and their options for the
+            specified site can be retrieved by List Meeting Tracking Codes API. If an optional tracking code is missing
+            from the trackingCodes array and there's a default option for this tracking code, the default option is
+            assigned automatically. If the inputMode of a tracking code is select, its value must be one of the
+            site-level options or the user-level value. Tracking code is not supported for a personal room meeting or
+            an ad-hoc space meeting.
+        :type tracking_codes: TrackingCodeItem
+        :param audio_connection_options: Audio connection options.
+        :type audio_connection_options: AudioConnectionOptions
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/patch-a-meeting
+        """
+        body = PatchMeetingBody()
+        if title is not None:
+            body.title = title
+        if agenda is not None:
+            body.agenda = agenda
+        if password is not None:
+            body.password = password
+        if start is not None:
+            body.start = start
+        if end is not None:
+            body.end = end
+        if timezone is not None:
+            body.timezone = timezone
+        if recurrence is not None:
+            body.recurrence = recurrence
+        if enabled_auto_record_meeting is not None:
+            body.enabled_auto_record_meeting = enabled_auto_record_meeting
+        if allow_any_user_to_be_co_host is not None:
+            body.allow_any_user_to_be_co_host = allow_any_user_to_be_co_host
+        if enabled_join_before_host is not None:
+            body.enabled_join_before_host = enabled_join_before_host
+        if enable_connect_audio_before_host is not None:
+            body.enable_connect_audio_before_host = enable_connect_audio_before_host
+        if join_before_host_minutes is not None:
+            body.join_before_host_minutes = join_before_host_minutes
+        if exclude_password is not None:
+            body.exclude_password = exclude_password
+        if public_meeting is not None:
+            body.public_meeting = public_meeting
+        if reminder_time is not None:
+            body.reminder_time = reminder_time
+        if unlocked_meeting_join_security is not None:
+            body.unlocked_meeting_join_security = unlocked_meeting_join_security
+        if session_type_id is not None:
+            body.session_type_id = session_type_id
+        if enabled_webcast_view is not None:
+            body.enabled_webcast_view = enabled_webcast_view
+        if panelist_password is not None:
+            body.panelist_password = panelist_password
+        if enable_automatic_lock is not None:
+            body.enable_automatic_lock = enable_automatic_lock
+        if automatic_lock_minutes is not None:
+            body.automatic_lock_minutes = automatic_lock_minutes
+        if allow_first_user_to_be_co_host is not None:
+            body.allow_first_user_to_be_co_host = allow_first_user_to_be_co_host
+        if allow_authenticated_devices is not None:
+            body.allow_authenticated_devices = allow_authenticated_devices
+        if send_email is not None:
+            body.send_email = send_email
+        if host_email is not None:
+            body.host_email = host_email
+        if site_url is not None:
+            body.site_url = site_url
+        if meeting_options is not None:
+            body.meeting_options = meeting_options
+        if attendee_privileges is not None:
+            body.attendee_privileges = attendee_privileges
+        if integration_tags is not None:
+            body.integration_tags = integration_tags
+        if enabled_breakout_sessions is not None:
+            body.enabled_breakout_sessions = enabled_breakout_sessions
+        if tracking_codes is not None:
+            body.tracking_codes = tracking_codes
+        if audio_connection_options is not None:
+            body.audio_connection_options = audio_connection_options
+        url = self.ep(f'{meeting_id}')
+        data = await super().patch(url=url, data=body.model_dump_json())
+        return PatchMeetingResponse.model_validate(data)
+
+    async def update(self, meeting_id: str, title: str = None, agenda: str = None, password: str = None, start: str = None,
+               end: str = None, timezone: str = None, recurrence: str = None, enabled_auto_record_meeting: bool = None,
+               allow_any_user_to_be_co_host: bool = None, enabled_join_before_host: bool = None,
+               enable_connect_audio_before_host: bool = None, join_before_host_minutes: int = None,
+               exclude_password: bool = None, public_meeting: bool = None, reminder_time: int = None,
+               unlocked_meeting_join_security: UnlockedMeetingJoinSecurity = None, session_type_id: int = None,
+               enabled_webcast_view: bool = None, panelist_password: str = None, enable_automatic_lock: bool = None,
+               automatic_lock_minutes: int = None, allow_first_user_to_be_co_host: bool = None,
+               allow_authenticated_devices: bool = None, send_email: bool = None, host_email: str = None,
+               site_url: str = None, meeting_options: MeetingOptions = None,
+               attendee_privileges: AttendeePrivileges = None, integration_tags: List[str] = None,
+               enabled_breakout_sessions: bool = None, tracking_codes: TrackingCodeItem = None,
+               audio_connection_options: AudioConnectionOptions = None) -> PatchMeetingResponse:
+        """
+        Updates details for a meeting with a specified meeting ID. This operation applies to meeting series and
+        scheduled meetings. It doesn't apply to ended or in-progress meeting instances. Ad-hoc meetings created by
+        Create a Meeting with adhoc of true and a roomId cannot be updated.
+
+        :param meeting_id: Unique identifier for the meeting to be updated. This parameter applies to meeting series
+            and scheduled meetings. It doesn't apply to ended or in-progress meeting instances. Please note that
+            currently meeting ID of a scheduled personal room meeting is not supported for this API.
+        :type meeting_id: str
+        :param title: Meeting title. The title can be a maximum of 128 characters long.
+        :type title: str
+        :param agenda: Meeting agenda. The agenda can be a maximum of 1300 characters long.
+        :type agenda: str
+        :param password: Meeting password. Must conform to the site's password complexity settings. Read password
+            management for details.
+        :type password: str
+        :param start: Date and time for the start of meeting in any ISO 8601 compliant format. start cannot be before
+            current date and time or after end. Duration between start and end cannot be shorter than 10 minutes or
+            longer than 24 hours. Refer to the Webex Meetings guide for more information about restrictions on updating
+            date and time for a meeting. Please note that when a meeting is being updated, start of the meeting will be
+            accurate to minutes, not seconds or milliseconds. Therefore, if start is within the same minute as the
+            current time, start will be adjusted to the upcoming minute; otherwise, start will be adjusted with seconds
+            and milliseconds stripped off. For instance, if the current time is 2022-03-01T10:32:16.657+08:00, start of
+            2022-03-01T10:32:28.076+08:00 or 2022-03-01T10:32:41+08:00 will be adjusted to 2022-03-01T10:33:00+08:00,
+            and start of 2022-03-01T11:32:28.076+08:00 or 2022-03-01T11:32:41+08:00 will be adjusted to
+            2022-03-01T11:32:00+08:00.
+        :type start: str
+        :param end: Date and time for the end of meeting in any ISO 8601 compliant format. end cannot be before current
+            date and time or before start. Duration between start and end cannot be shorter than 10 minutes or longer
+            than 24 hours. Refer to the Webex Meetings guide for more information about restrictions on updating date
+            and time for a meeting. Please note that when a meeting is being updated, end of the meeting will be
+            accurate to minutes, not seconds or milliseconds. Therefore, end will be adjusted with seconds and
+            milliseconds stripped off. For instance, end of 2022-03-01T11:52:28.076+08:00 or 2022-03-01T11:52:41+08:00
+            will be adjusted to 2022-03-01T11:52:00+08:00.
+        :type end: str
+        :param timezone: Time zone in which the meeting was originally scheduled (conforming with the IANA time zone
+            database).
+        :type timezone: str
+        :param recurrence: Meeting series recurrence rule (conforming with RFC 2445). Applies only to a recurring
+            meeting series, not to a meeting series with only one scheduled meeting. Multiple days or dates for monthly
+            or yearly recurrence rule are not supported, only the first day or date specified is taken. For example,
+            "FREQ=MONTHLY;INTERVAL=1;COUNT=10;BYMONTHDAY=10,11,12" is not supported and it will be partially supported
+            as "FREQ=MONTHLY;INTERVAL=1;COUNT=10;BYMONTHDAY=10".
+        :type recurrence: str
+        :param enabled_auto_record_meeting: Whether or not meeting is recorded automatically.
+        :type enabled_auto_record_meeting: bool
+        :param allow_any_user_to_be_co_host: Whether or not to allow any attendee with a host account on the target
+            site to become a cohost when joining the meeting. The target site is specified by siteUrl parameter when
+            creating the meeting; if not specified, it's user's preferred site.
+        :type allow_any_user_to_be_co_host: bool
+        :param enabled_join_before_host: Whether or not to allow any attendee to join the meeting before the host joins
+            the meeting.
+        :type enabled_join_before_host: bool
+        :param enable_connect_audio_before_host: Whether or not to allow any attendee to connect audio in the meeting
+            before the host joins the meeting. This attribute is only applicable if the enabledJoinBeforeHost attribute
+            is set to true.
+        :type enable_connect_audio_before_host: bool
+        :param join_before_host_minutes: The number of minutes an attendee can join the meeting before the meeting
+            start time and the host joins. This attribute is only applicable if the enabledJoinBeforeHost attribute is
+            set to true. Valid options are 0, 5, 10 and 15. Default is 0 if not specified.
+        :type join_before_host_minutes: int
+        :param exclude_password: Whether or not to exclude the meeting password from the email invitation.
+        :type exclude_password: bool
+        :param public_meeting: Whether or not to allow the meeting to be listed on the public calendar.
+        :type public_meeting: bool
+        :param reminder_time: The number of minutes before the meeting begins, that an email reminder is sent to the
+            host.
+        :type reminder_time: int
+        :param unlocked_meeting_join_security: Specifies how the people who aren't on the invite can join the unlocked
+            meeting.
+        :type unlocked_meeting_join_security: UnlockedMeetingJoinSecurity
+        :param session_type_id: Unique identifier for a meeting session type for the user. This attribute is required
+            while scheduling webinar meeting. All available meeting session types enabled for the user can be retrieved
+            by List Meeting Session Types API.
+        :type session_type_id: int
+        :param enabled_webcast_view: Whether or not webcast view is enabled.
+        :type enabled_webcast_view: bool
+        :param panelist_password: Password for panelists of a webinar meeting. Must conform to the site's password
+            complexity settings. Read password management for details. If not specified, a random password conforming
+            to the site's password rules will be generated automatically.
+        :type panelist_password: str
+        :param enable_automatic_lock: Whether or not to automatically lock the meeting after it starts.
+        :type enable_automatic_lock: bool
+        :param automatic_lock_minutes: The number of minutes after the meeting begins, for automatically locking it.
+        :type automatic_lock_minutes: int
+        :param allow_first_user_to_be_co_host: Whether or not to allow the first attendee of the meeting with a host
+            account on the target site to become a cohost. The target site is specified by siteUrl parameter when
+            creating the meeting; if not specified, it's user's preferred site.
+        :type allow_first_user_to_be_co_host: bool
+        :param allow_authenticated_devices: Whether or not to allow authenticated video devices in the meeting's
+            organization to start or join the meeting without a prompt.
+        :type allow_authenticated_devices: bool
+        :param send_email: Whether or not to send emails to host and invitees. It is an optional field and default
+            value is true.
+        :type send_email: bool
+        :param host_email: Email address for the meeting host. This attribute should only be set if the user or
+            application calling the API has the admin-level scopes. When used, the admin may specify the email of a
+            user in a site they manage to be the meeting host.
+        :type host_email: str
+        :param site_url: URL of the Webex site which the meeting is updated on. If not specified, the meeting is
+            created on user's preferred site. All available Webex sites and preferred site of the user can be retrieved
+            by Get Site List API.
+        :type site_url: str
+        :param meeting_options: Meeting Options.
+        :type meeting_options: MeetingOptions
+        :param attendee_privileges: Attendee Privileges.
+        :type attendee_privileges: AttendeePrivileges
+        :param integration_tags: External keys created by an integration application in its own domain, for example
+            Zendesk ticket IDs, Jira IDs, Salesforce Opportunity IDs, etc. The integration application queries meetings
+            by a key in its own domain. The maximum size of integrationTags is 3 and each item of integrationTags can
+            be a maximum of 64 characters long. Please note that an empty or null integrationTags will delete all
+            existing integration tags for the meeting implicitly. Developer can update integration tags for a
+            meetingSeries but he cannot update it for a scheduledMeeting or a meeting instance.
+        :type integration_tags: List[str]
+        :param enabled_breakout_sessions: Whether or not breakout sessions are enabled. If the value of
+            enabledBreakoutSessions is false, users can not set breakout sessions. If the value of
+            enabledBreakoutSessions is true, users can update breakout sessions using the Update Breakout Sessions API.
+            Updating breakout sessions are not supported by this API.
+        :type enabled_breakout_sessions: bool
+        :param tracking_codes: Tracking codes information. All available tracking codes and their options for the
+            specified site can be retrieved by List Meeting Tracking Codes API. If an optional tracking code is missing
+            from the trackingCodes array and there's a default option for this tracking code, the default option is
+            assigned automatically. If the inputMode of a tracking code is select, its value must be one of the
+            site-level options or the user-level value. Tracking code is not supported for a personal room meeting or
+            an ad-hoc space meeting.
+        :type tracking_codes: TrackingCodeItem
+        :param audio_connection_options: Audio connection options.
+        :type audio_connection_options: AudioConnectionOptions
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/update-a-meeting
+        """
+        body = PatchMeetingBody()
+        if title is not None:
+            body.title = title
+        if agenda is not None:
+            body.agenda = agenda
+        if password is not None:
+            body.password = password
+        if start is not None:
+            body.start = start
+        if end is not None:
+            body.end = end
+        if timezone is not None:
+            body.timezone = timezone
+        if recurrence is not None:
+            body.recurrence = recurrence
+        if enabled_auto_record_meeting is not None:
+            body.enabled_auto_record_meeting = enabled_auto_record_meeting
+        if allow_any_user_to_be_co_host is not None:
+            body.allow_any_user_to_be_co_host = allow_any_user_to_be_co_host
+        if enabled_join_before_host is not None:
+            body.enabled_join_before_host = enabled_join_before_host
+        if enable_connect_audio_before_host is not None:
+            body.enable_connect_audio_before_host = enable_connect_audio_before_host
+        if join_before_host_minutes is not None:
+            body.join_before_host_minutes = join_before_host_minutes
+        if exclude_password is not None:
+            body.exclude_password = exclude_password
+        if public_meeting is not None:
+            body.public_meeting = public_meeting
+        if reminder_time is not None:
+            body.reminder_time = reminder_time
+        if unlocked_meeting_join_security is not None:
+            body.unlocked_meeting_join_security = unlocked_meeting_join_security
+        if session_type_id is not None:
+            body.session_type_id = session_type_id
+        if enabled_webcast_view is not None:
+            body.enabled_webcast_view = enabled_webcast_view
+        if panelist_password is not None:
+            body.panelist_password = panelist_password
+        if enable_automatic_lock is not None:
+            body.enable_automatic_lock = enable_automatic_lock
+        if automatic_lock_minutes is not None:
+            body.automatic_lock_minutes = automatic_lock_minutes
+        if allow_first_user_to_be_co_host is not None:
+            body.allow_first_user_to_be_co_host = allow_first_user_to_be_co_host
+        if allow_authenticated_devices is not None:
+            body.allow_authenticated_devices = allow_authenticated_devices
+        if send_email is not None:
+            body.send_email = send_email
+        if host_email is not None:
+            body.host_email = host_email
+        if site_url is not None:
+            body.site_url = site_url
+        if meeting_options is not None:
+            body.meeting_options = meeting_options
+        if attendee_privileges is not None:
+            body.attendee_privileges = attendee_privileges
+        if integration_tags is not None:
+            body.integration_tags = integration_tags
+        if enabled_breakout_sessions is not None:
+            body.enabled_breakout_sessions = enabled_breakout_sessions
+        if tracking_codes is not None:
+            body.tracking_codes = tracking_codes
+        if audio_connection_options is not None:
+            body.audio_connection_options = audio_connection_options
+        url = self.ep(f'{meeting_id}')
+        data = await super().put(url=url, data=body.model_dump_json())
+        return PatchMeetingResponse.model_validate(data)
+
+    async def delete(self, meeting_id: str, host_email: str = None, send_email: bool = None):
+        """
+        Deletes a meeting with a specified meeting ID. The deleted meeting cannot be recovered. This operation applies
+        to meeting series and scheduled meetings. It doesn't apply to ended or in-progress meeting instances. Ad-hoc
+        meetings created by Create a Meeting with adhoc of true and a roomId cannot be deleted.
+
+        :param meeting_id: Unique identifier for the meeting to be deleted. This parameter applies to meeting series
+            and scheduled meetings. It doesn't apply to ended or in-progress meeting instances.
+        :type meeting_id: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes. If set, the admin may specify the email of a user in a site
+            they manage and the API will delete a meeting that is hosted by that user.
+        :type host_email: str
+        :param send_email: Whether or not to send emails to host and invitees. It is an optional field and default
+            value is true.
+        :type send_email: bool
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/delete-a-meeting
+        """
+        params = {}
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        if send_email is not None:
+            params['sendEmail'] = send_email
+        url = self.ep(f'{meeting_id}')
+        await super().delete(url=url, params=params)
+        return
+
+    async def join(self, meeting_id: str = None, meeting_number: str = None, web_link: str = None, join_directly: bool = None,
+             email: str = None, display_name: str = None, password: str = None,
+             expiration_minutes: int = None) -> JoinMeetingResponse:
+        """
+        Retrieves a meeting join link for a meeting with a specified meetingId, meetingNumber, or webLink that allows
+        users to join the meeting directly without logging in and entering a password.
+
+        :param meeting_id: Unique identifier for the meeting. This parameter applies to meeting series and scheduled
+            meetings. It doesn't apply to ended or in-progress meeting instances. Please note that currently meeting ID
+            of a scheduled personal room meeting is also supported for this API.
+        :type meeting_id: str
+        :param meeting_number: Meeting number. Applies to meeting series, scheduled meeting, and meeting instances, but
+            not to meeting instances which have ended.
+        :type meeting_number: str
+        :param web_link: Link to a meeting information page where the meeting client is launched if the meeting is
+            ready to start or join.
+        :type web_link: str
+        :param join_directly: Whether or not to redirect to joinLink. It is an optional field and default value is
+            true.
+        :type join_directly: bool
+        :param email: Email address of meeting participant. If the user is a guest issuer, email is required.
+        :type email: str
+        :param display_name: Display name of meeting participant. The maximum length of displayName is 128 characters.
+            If the user is a guest issuer, displayName is required.
+        :type display_name: str
+        :param password: It's required when the meeting is protected by a password and the current user is not
+            privileged to view it if they are not a host, cohost or invitee of the meeting.
+        :type password: str
+        :param expiration_minutes: Expiration duration of joinLink in minutes. Must be between 1 and 60.
+        :type expiration_minutes: int
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/join-a-meeting
+        """
+        body = JoinMeetingBody()
+        if meeting_id is not None:
+            body.meeting_id = meeting_id
+        if meeting_number is not None:
+            body.meeting_number = meeting_number
+        if web_link is not None:
+            body.web_link = web_link
+        if join_directly is not None:
+            body.join_directly = join_directly
+        if email is not None:
+            body.email = email
+        if display_name is not None:
+            body.display_name = display_name
+        if password is not None:
+            body.password = password
+        if expiration_minutes is not None:
+            body.expiration_minutes = expiration_minutes
+        url = self.ep('join')
+        data = await super().post(url=url, data=body.model_dump_json())
+        return JoinMeetingResponse.model_validate(data)
+
+    async def update_simultaneous_interpretation(self, meeting_id: str, enabled: bool,
+                                           interpreters:
+                                           InterpreterForSimultaneousInterpretation =
+                                           None) -> SimultaneousInterpretation:
+        """
+        Updates simultaneous interpretation options of a meeting with a specified meeting ID. This operation applies to
+        meeting series and scheduled meetings. It doesn't apply to ended or in-progress meeting instances.
+
+        :param meeting_id: Unique identifier for the meeting. Does not support meeting IDs for a scheduled personal
+            room meeting.
+        :type meeting_id: str
+        :param enabled: Whether or not simultaneous interpretation is enabled.
+        :type enabled: bool
+        :param interpreters: Interpreters for meeting.
+        :type interpreters: InterpreterForSimultaneousInterpretation
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/update-meeting-simultaneous-interpretation
+        """
+        body = SimultaneousInterpretation()
+        if enabled is not None:
+            body.enabled = enabled
+        if interpreters is not None:
+            body.interpreters = interpreters
+        url = self.ep(f'{meeting_id}/simultaneousInterpretation')
+        data = await super().put(url=url, data=body.model_dump_json())
+        return SimultaneousInterpretation.model_validate(data)
+
+    async def survey(self, meeting_id: str) -> GetMeetingSurveyResponse:
+        """
+        Retrieves details for a meeting survey identified by meetingId.
+
+        :param meeting_id: Unique identifier for the meeting. Please note that only the meeting ID of a scheduled
+            webinar is supported for this API.
+        :type meeting_id: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/get-a-meeting-survey
+        """
+        url = self.ep(f'{meeting_id}/survey')
+        data = await super().get(url=url)
+        return GetMeetingSurveyResponse.model_validate(data)
+
+    def list_survey_results_gen(self, meeting_id: str, meeting_start_time_from: str = None,
+                            meeting_start_time_to: str = None, **params) -> AsyncGenerator[SurveyResult, None, None]:
+        """
+        Retrieves results for a meeting survey identified by meetingId.
+
+        :param meeting_id: Unique identifier for the meeting. Please note that only the meeting ID of a scheduled
+            webinar is supported for this API.
+        :type meeting_id: str
+        :param meeting_start_time_from: Start date and time (inclusive) in any ISO 8601 compliant format for the
+            meeting objects being requested. meetingStartTimeFrom cannot be after meetingStartTimeTo. This parameter
+            will be ignored if meetingId is the unique identifier for the specific meeting instance. When meetingId is
+            not the unique identifier for the specific meeting instance, the meetingStartTimeFrom, if not specified,
+            equals meetingStartTimeTo minus 1 month; if meetingStartTimeTo is also not specified, the default value for
+            meetingStartTimeFrom is 1 month before the current date and time.
+        :type meeting_start_time_from: str
+        :param meeting_start_time_to: End date and time (exclusive) in any ISO 8601 compliant format for the meeting
+            objects being requested. meetingStartTimeTo cannot be prior to meetingStartTimeFrom. This parameter will be
+            ignored if meetingId is the unique identifier for the specific meeting instance. When meetingId is not the
+            unique identifier for the specific meeting instance, if meetingStartTimeFrom is also not specified, the
+            default value for meetingStartTimeTo is the current date and time;For example,if meetingStartTimeFrom is a
+            month ago, the default value for meetingStartTimeTo is 1 month after meetingStartTimeFrom.Otherwise it is
+            the current date and time.
+        :type meeting_start_time_to: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/list-meeting-survey-results
+        """
+        if meeting_start_time_from is not None:
+            params['meetingStartTimeFrom'] = meeting_start_time_from
+        if meeting_start_time_to is not None:
+            params['meetingStartTimeTo'] = meeting_start_time_to
+        url = self.ep(f'{meeting_id}/surveyResults')
+        return self.session.follow_pagination(url=url, model=SurveyResult, params=params)
+
+    async def list_survey_results(self, meeting_id: str, meeting_start_time_from: str = None,
+                            meeting_start_time_to: str = None, **params) -> List[SurveyResult]:
+        """
+        Retrieves results for a meeting survey identified by meetingId.
+
+        :param meeting_id: Unique identifier for the meeting. Please note that only the meeting ID of a scheduled
+            webinar is supported for this API.
+        :type meeting_id: str
+        :param meeting_start_time_from: Start date and time (inclusive) in any ISO 8601 compliant format for the
+            meeting objects being requested. meetingStartTimeFrom cannot be after meetingStartTimeTo. This parameter
+            will be ignored if meetingId is the unique identifier for the specific meeting instance. When meetingId is
+            not the unique identifier for the specific meeting instance, the meetingStartTimeFrom, if not specified,
+            equals meetingStartTimeTo minus 1 month; if meetingStartTimeTo is also not specified, the default value for
+            meetingStartTimeFrom is 1 month before the current date and time.
+        :type meeting_start_time_from: str
+        :param meeting_start_time_to: End date and time (exclusive) in any ISO 8601 compliant format for the meeting
+            objects being requested. meetingStartTimeTo cannot be prior to meetingStartTimeFrom. This parameter will be
+            ignored if meetingId is the unique identifier for the specific meeting instance. When meetingId is not the
+            unique identifier for the specific meeting instance, if meetingStartTimeFrom is also not specified, the
+            default value for meetingStartTimeTo is the current date and time;For example,if meetingStartTimeFrom is a
+            month ago, the default value for meetingStartTimeTo is 1 month after meetingStartTimeFrom.Otherwise it is
+            the current date and time.
+        :type meeting_start_time_to: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/list-meeting-survey-results
+        """
+        if meeting_start_time_from is not None:
+            params['meetingStartTimeFrom'] = meeting_start_time_from
+        if meeting_start_time_to is not None:
+            params['meetingStartTimeTo'] = meeting_start_time_to
+        url = self.ep(f'{meeting_id}/surveyResults')
+        return [o async for o in self.session.follow_pagination(url=url, model=SurveyResult, params=params)]
+
+    def list_tracking_codes_gen(self, service: str, site_url: str = None,
+                            host_email: str = None) -> AsyncGenerator[TrackingCode, None, None]:
+        """
+        Lists tracking codes on a site by a meeting host. The result indicates which tracking codes and what options
+        can be used to create or update a meeting on the specified site.
+
+        :param service: Service for schedule or sign-up pages.
+        :type service: str
+        :param site_url: URL of the Webex site which the API retrieves the tracking code from. If not specified, the
+            API retrieves the tracking code from the user's preferred site. All available Webex sites and preferred
+            sites of a user can be retrieved by Get Site List API.
+        :type site_url: str
+        :param host_email: Email address for the meeting host. This parameter is only used if a user or application
+            calling the API has the admin-level scopes. The admin may specify the email of a user on a site they manage
+            and the API will return meeting participants of the meetings that are hosted by that user.
+        :type host_email: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/list-meeting-tracking-codes
+        """
+        params = dict()
+        params['service'] = service
+        if site_url is not None:
+            params['siteUrl'] = site_url
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        url = self.ep('trackingCodes')
+        return self.session.follow_pagination(url=url, model=TrackingCode, params=params)
+
+    async def list_tracking_codes(self, service: str, site_url: str = None,
+                            host_email: str = None) -> List[TrackingCode]:
+        """
+        Lists tracking codes on a site by a meeting host. The result indicates which tracking codes and what options
+        can be used to create or update a meeting on the specified site.
+
+        :param service: Service for schedule or sign-up pages.
+        :type service: str
+        :param site_url: URL of the Webex site which the API retrieves the tracking code from. If not specified, the
+            API retrieves the tracking code from the user's preferred site. All available Webex sites and preferred
+            sites of a user can be retrieved by Get Site List API.
+        :type site_url: str
+        :param host_email: Email address for the meeting host. This parameter is only used if a user or application
+            calling the API has the admin-level scopes. The admin may specify the email of a user on a site they manage
+            and the API will return meeting participants of the meetings that are hosted by that user.
+        :type host_email: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meetings/list-meeting-tracking-codes
+        """
+        params = dict()
+        params['service'] = service
+        if site_url is not None:
+            params['siteUrl'] = site_url
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        url = self.ep('trackingCodes')
+        return [o async for o in self.session.follow_pagination(url=url, model=TrackingCode, params=params)]
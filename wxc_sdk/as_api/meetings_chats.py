@@ -0,0 +1,105 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.meetings.chats import ChatObject
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsMeetingChatsApi']
+
+
+class AsMeetingChatsApi(AsApiChild, base='meetings/postMeetingChats'):
+    """
+    Chats are content captured in a meeting when chat messages are sent between the participants within a meeting.
+    This feature allows a Compliance Officer to access the in-meeting chat content.
+
+    The Compliance Officer can use the Meeting Chats API to retrieve the chats of a meeting and to delete all chats
+    associated with a meeting. private chats are text messages between two people. group chats are for larger
+    breakout spaces. Meeting chats are different from room messages in that there is no catch-up propagation. For
+    example, if a user joins a meeting late only, chat messages that are created from then on, will be propagated to
+    this user. To understand which user saw which message if they joined late, you have to query the
+    meetingParticipants REST resource for the joined/left times and compare to the meetingsChat chatTime field.
+
+    The Webex meetings chat functionality and API endpoint described here is "upon-request" and not enabled
+    by default. If you need it enabled for your org, or if you need help, please contact the Webex Developer Support
+    team at devsupport@webex.com.
+    """
+
+    def list_gen(self, meeting_id: str, offset: int = None, **params) -> AsyncGenerator[ChatObject, None, None]:
+        """
+        Lists the meeting chats of a finished meeting instance specified by meetingId. You can set a maximum number
+        of chats to return.
+
+        Use this operation to list the chats of a finished meeting instance when they are ready. Please note that
+        only meeting instances in state ended are supported for meetingId. Meeting series, scheduled meetings and
+        in-progress meeting instances are not supported.
+
+        :param meeting_id: A unique identifier for the meeting instance to which the chats belong. The meeting ID of
+            a scheduled personal room meeting is not supported.
+        :type meeting_id: str
+        :param offset: Offset from the first result that you want to fetch.
+        :type offset: int
+        """
+        params['meetingId'] = meeting_id
+        if offset is not None:
+            params['offset'] = offset
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=ChatObject, params=params)
+
+    async def list(self, meeting_id: str, offset: int = None, **params) -> List[ChatObject]:
+        """
+        Lists the meeting chats of a finished meeting instance specified by meetingId. You can set a maximum number
+        of chats to return.
+
+        Use this operation to list the chats of a finished meeting instance when they are ready. Please note that
+        only meeting instances in state ended are supported for meetingId. Meeting series, scheduled meetings and
+        in-progress meeting instances are not supported.
+
+        :param meeting_id: A unique identifier for the meeting instance to which the chats belong. The meeting ID of
+            a scheduled personal room meeting is not supported.
+        :type meeting_id: str
+        :param offset: Offset from the first result that you want to fetch.
+        :type offset: int
+        """
+        params['meetingId'] = meeting_id
+        if offset is not None:
+            params['offset'] = offset
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=ChatObject, params=params)]
+
+    async def delete(self, meeting_id: str):
+        """
+        Deletes the meeting chats of a finished meeting instance specified by meetingId.
+
+        Use this operation to delete the chats of a finished meeting instance when they are ready. Please note that
+        only meeting instances in state ended are supported for meetingId. Meeting series, scheduled meetings and
+        in-progress meeting instances are not supported.
+
+        :param meeting_id: A unique identifier for the meeting instance to which the chats belong. Meeting IDs of a
+            scheduled personal room meeting are not supported.
+        :type meeting_id: str
+        """
+        params = dict()
+        params['meetingId'] = meeting_id
+        url = self.ep()
+        await super().delete(url=url, params=params)
+        return
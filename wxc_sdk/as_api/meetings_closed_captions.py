@@ -0,0 +1,125 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.meetings.closed_captions import CCSnippet, ClosedCaption
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsMeetingClosedCaptionsApi']
+
+
+class AsMeetingClosedCaptionsApi(AsApiChild, base='meetingClosedCaptions'):
+    """
+    Meeting Closed Captions APIs are enabled upon request, and are not available by default. Please contact the Webex
+    Developer Support team at devsupport@webex.com if you would like to enable this feature for your organization.
+    Meeting closed captions are the automatic transcriptions of what is being said during a meeting in real-time.
+    Closed captions appear after being enabled during a meeting and can be translated to a participant's language.
+    A closed caption snippet is a short text snippet from a meeting closed caption which was spoken by a particular
+    participant in the meeting. A meeting's closed captions consists of many snippets.
+    The Closed Captions API manages meeting closed captions and snippets. You can list meeting closed captions, as well
+    as list and download snippets. Closed captions can be retrieved in either Web Video Text Tracks (VTT) or plain text
+    (TXT) format via the download links provided by the vttDownloadLink and txtDownloadlink response properties,
+    respectively.
+    Refer to the Meetings API Scopes section of Meetings Overview guide for the scopes required for each API.
+    Notes:
+    Currently, closed caption APIs are only supported for the Compliance Officer role.
+    Closed captions will be available 15 minutes after the meeting is finished.
+    """
+
+    def list_gen(self, meeting_id: str, **params) -> AsyncGenerator[ClosedCaption, None, None]:
+        """
+        Lists closed captions of a finished meeting instance specified by meetingId.
+
+        :param meeting_id: Unique identifier for the meeting instance which the closed captions belong to. This
+            parameter only applies to ended meeting instnaces. It does not apply to meeting series, scheduled meetings
+            or scheduled personal room meetings.
+        :type meeting_id: str
+        """
+        params['meetingId'] = meeting_id
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=ClosedCaption, params=params)
+
+    async def list(self, meeting_id: str, **params) -> List[ClosedCaption]:
+        """
+        Lists closed captions of a finished meeting instance specified by meetingId.
+
+        :param meeting_id: Unique identifier for the meeting instance which the closed captions belong to. This
+            parameter only applies to ended meeting instnaces. It does not apply to meeting series, scheduled meetings
+            or scheduled personal room meetings.
+        :type meeting_id: str
+        """
+        params['meetingId'] = meeting_id
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=ClosedCaption, params=params)]
+
+    def list_snippets_gen(self, closed_caption_id: str, meeting_id: str, **params) -> AsyncGenerator[CCSnippet, None, None]:
+        """
+        Lists snippets of a meeting closed caption specified by closedCaptionId.
+
+        :param closed_caption_id: Unique identifier for the meeting closed caption which the snippets belong to.
+        :type closed_caption_id: str
+        :param meeting_id: Unique identifier for the meeting instance which the closed caption snippets belong to. This
+            parameter only applies to ended meeting instances. It does not apply to meeting series, scheduled meetings
+            or scheduled personal room meetings.
+        :type meeting_id: str
+        """
+        params['meetingId'] = meeting_id
+        url = self.ep(f'{closed_caption_id}/snippets')
+        return self.session.follow_pagination(url=url, model=CCSnippet, params=params)
+
+    async def list_snippets(self, closed_caption_id: str, meeting_id: str, **params) -> List[CCSnippet]:
+        """
+        Lists snippets of a meeting closed caption specified by closedCaptionId.
+
+        :param closed_caption_id: Unique identifier for the meeting closed caption which the snippets belong to.
+        :type closed_caption_id: str
+        :param meeting_id: Unique identifier for the meeting instance which the closed caption snippets belong to. This
+            parameter only applies to ended meeting instances. It does not apply to meeting series, scheduled meetings
+            or scheduled personal room meetings.
+        :type meeting_id: str
+        """
+        params['meetingId'] = meeting_id
+        url = self.ep(f'{closed_caption_id}/snippets')
+        return [o async for o in self.session.follow_pagination(url=url, model=CCSnippet, params=params)]
+
+    async def download_snippets(self, closed_caption_id: str, meeting_id: str, format: str = None):
+        """
+        Download meeting closed caption snippets from the meeting closed caption specified by closedCaptionId formatted
+        either as a Video Text Track (.vtt) file or plain text (.txt) file.
+
+        :param closed_caption_id: Unique identifier for the meeting closed caption.
+        :type closed_caption_id: str
+        :param meeting_id: Unique identifier for the meeting instance which the closed caption snippets belong to. This
+            parameter only applies to meeting instances in the ended state. It does not apply to meeting series,
+            scheduled meetings or scheduled personal room meetings.
+        :type meeting_id: str
+        :param format: Format for the downloaded meeting closed caption snippets. Possible values: vtt, txt
+        :type format: str
+        """
+        # TODO: verify return and adapt
+        params = dict()
+        params['meetingId'] = meeting_id
+        if format is not None:
+            params['format'] = format
+        url = self.ep(f'{closed_caption_id}/download')
+        await super().get(url=url, params=params)
+        return
@@ -0,0 +1,213 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.meetings.participants import AdmitParticipantsBody, Participant, QueryMeetingParticipantsWithEmailBody, \
+    UpdateParticipantBody, UpdateParticipantResponse
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsMeetingParticipantsApi']
+
+
+class AsMeetingParticipantsApi(AsApiChild, base='meetingParticipants'):
+    """
+    This API manages meeting participants.
+    Refer to the Meetings API Scopes section of Meetings Overview for scopes required for each API.
+    """
+
+    def list_participants_gen(self, meeting_id: str, host_email: str = None, join_time_from: str = None,
+                          join_time_to: str = None, **params) -> AsyncGenerator[Participant, None, None]:
+        """
+        List all participants in a live or post meeting. The meetingId parameter is required, which is the unique
+        identifier for the meeting.
+        The authenticated user calling this API must either have an Administrator role with the
+        meeting:admin_participants_read scope, or be the meeting host.
+
+        :param meeting_id: The unique identifier for the meeting. Please note that currently meeting ID of a scheduled
+            personal room meeting is not supported for this API.
+        :type meeting_id: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes, the admin may specify the email of a user in a site they manage
+            and the API will return meeting participants of the meetings that are hosted by that user.
+        :type host_email: str
+        :param join_time_from: The time participants join a meeting starts from the specified date and time (inclusive)
+            in any ISO 8601 compliant format. If joinTimeFrom is not specified, it equals joinTimeTo minus 7 days.
+        :type join_time_from: str
+        :param join_time_to: The time participants join a meeting before the specified date and time (exclusive) in any
+            ISO 8601 compliant format. If joinTimeTo is not specified, it equals joinTimeFrom plus 7 days. The interval
+            between joinTimeFrom and joinTimeTo must be within 90 days.
+        :type join_time_to: str
+        """
+        params['meetingId'] = meeting_id
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        if join_time_from is not None:
+            params['joinTimeFrom'] = join_time_from
+        if join_time_to is not None:
+            params['joinTimeTo'] = join_time_to
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=Participant, params=params)
+
+    async def list_participants(self, meeting_id: str, host_email: str = None, join_time_from: str = None,
+                          join_time_to: str = None, **params) -> List[Participant]:
+        """
+        List all participants in a live or post meeting. The meetingId parameter is required, which is the unique
+        identifier for the meeting.
+        The authenticated user calling this API must either have an Administrator role with the
+        meeting:admin_participants_read scope, or be the meeting host.
+
+        :param meeting_id: The unique identifier for the meeting. Please note that currently meeting ID of a scheduled
+            personal room meeting is not supported for this API.
+        :type meeting_id: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes, the admin may specify the email of a user in a site they manage
+            and the API will return meeting participants of the meetings that are hosted by that user.
+        :type host_email: str
+        :param join_time_from: The time participants join a meeting starts from the specified date and time (inclusive)
+            in any ISO 8601 compliant format. If joinTimeFrom is not specified, it equals joinTimeTo minus 7 days.
+        :type join_time_from: str
+        :param join_time_to: The time participants join a meeting before the specified date and time (exclusive) in any
+            ISO 8601 compliant format. If joinTimeTo is not specified, it equals joinTimeFrom plus 7 days. The interval
+            between joinTimeFrom and joinTimeTo must be within 90 days.
+        :type join_time_to: str
+        """
+        params['meetingId'] = meeting_id
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        if join_time_from is not None:
+            params['joinTimeFrom'] = join_time_from
+        if join_time_to is not None:
+            params['joinTimeTo'] = join_time_to
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=Participant, params=params)]
+
+    async def query_participants_with_email(self, meeting_id: str, max: int = None, host_email: str = None,
+                                      join_time_from: str = None, join_time_to: str = None,
+                                      emails: list[str] = None) -> list[Participant]:
+        """
+        Query participants in a live meeting, or after the meeting, using participant's email. The meetingId parameter
+        is the unique identifier for the meeting and is required.
+        The authenticated user calling this API must either have an Administrator role with the
+        meeting:admin_participants_read scope, or be the meeting host.
+
+        :param meeting_id: The unique identifier for the meeting.
+        :type meeting_id: str
+        :param max: Limit the maximum number of participants in the response, up to 1000.
+        :type max: int
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes, the admin may specify the email of a user in a site they manage
+            and the API will return meeting participants of the meetings that are hosted by that user.
+        :type host_email: str
+        :param join_time_from: The time participants join a meeting starts from the specified date and time (inclusive)
+            in any ISO 8601 compliant format. If joinTimeFrom is not specified, it equals joinTimeTo minus 7 days.
+        :type join_time_from: str
+        :param join_time_to: The time participants join a meeting before the specified date and time (exclusive) in any
+            ISO 8601 compliant format. If joinTimeTo is not specified, it equals joinTimeFrom plus 7 days. The interval
+            between joinTimeFrom and joinTimeTo must be within 90 days.
+        :type join_time_to: str
+        :param emails: Participants email list Possible values: a@example.com
+        :type emails: List[str]
+        """
+        params = dict()
+        params['meetingId'] = meeting_id
+        if max is not None:
+            params['max'] = max
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        if join_time_from is not None:
+            params['joinTimeFrom'] = join_time_from
+        if join_time_to is not None:
+            params['joinTimeTo'] = join_time_to
+        body = QueryMeetingParticipantsWithEmailBody()
+        if emails is not None:
+            body.emails = emails
+        url = self.ep('query')
+        data = await super().post(url=url, params=params, data=body.model_dump_json())
+        # TODO: this is wrong -> fix code generation
+        return data["items"]
+
+    async def participant_details(self, participant_id: str, host_email: str = None) -> Participant:
+        """
+        Get a meeting participant details of a live or post meeting. The participantId is required to identify the
+        meeting and the participant.
+        The authenticated user calling this API must either have an Administrator role with the
+        meeting:admin_participants_read scope, or be the meeting host.
+
+        :param participant_id: The unique identifier for the meeting and the participant.
+        :type participant_id: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes, the admin may specify the email of a user in a site they manage
+            and the API will return meeting participants of the meetings that are hosted by that user.
+        :type host_email: str
+        """
+        params = {}
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        url = self.ep(f'{participant_id}')
+        data = await super().get(url=url, params=params)
+        return Participant.model_validate(data)
+
+    async def update_participant(self, participant_id: str, muted: bool = None, admit: bool = None,
+                           expel: bool = None) -> UpdateParticipantResponse:
+        """
+        To mute, un-mute, expel, or admit a participant in a live meeting. The participantId is required to identify
+        the meeting and the participant.
+        Notes:
+
+        :param participant_id: The unique identifier for the meeting and the participant.
+        :type participant_id: str
+        :param muted: The value is true or false, and means to mute or unmute the audio of a participant.
+        :type muted: bool
+        :param admit: The value can be true or false. The value of true is to admit a participant to the meeting if the
+            participant is in the lobby, No-Op if the participant is not in the lobby or when the value is set to
+            false.
+        :type admit: bool
+        :param expel: The attribute is exclusive and its value can be true or false. The value of true means that the
+            participant will be expelled from the meeting, the value of false means No-Op.
+        :type expel: bool
+        """
+        body = UpdateParticipantBody()
+        if muted is not None:
+            body.muted = muted
+        if admit is not None:
+            body.admit = admit
+        if expel is not None:
+            body.expel = expel
+        url = self.ep(f'{participant_id}')
+        data = await super().put(url=url, data=body.model_dump_json())
+        return UpdateParticipantResponse.model_validate(data)
+
+    async def admit_participants(self, participant_ids: List[str] = None):
+        """
+        To admit participants into a live meeting in bulk.
+        This API limits the maximum size of items in the request body to 100.
+        Each participantId of items in the request body should have the same prefix of meetingId.
+
+        :param participant_ids: The ID that identifies the meeting participant.
+        :type participant_ids: List[str]
+        """
+        body = AdmitParticipantsBody()
+        if participant_ids is not None:
+            body.items = participant_ids
+        url = self.ep('admit')
+        await super().post(url=url, data=body.model_dump_json())
+        return
@@ -0,0 +1,98 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.meetings.qanda import AnswerObject, QAObject
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsMeetingQandAApi']
+
+
+class AsMeetingQandAApi(AsApiChild, base='meetings/q_and_a'):
+    """
+    During a Question and Answer (Q&A) session, attendees can pose questions to hosts, co-hosts, and presenters, who
+    can answer and moderate those questions. You use the Meeting Q&A API to retrieve the questions and the answers in a
+    meeting.
+    Currently, these APIs are available to users with one of the meeting host, admin or Compliance Officer roles.
+    The features and APIs described here are available upon-request and is not enabled by default. If would like this
+    feature enabled for your organization please contact the Webex Developer Support team at devsupport@webex.com.
+    """
+
+    def list_gen(self, meeting_id: str, **params) -> AsyncGenerator[QAObject, None, None]:
+        """
+        Lists questions and answers from a meeting, when ready.
+        Notes:
+
+        :param meeting_id: A unique identifier for the meeting instance which the Q&A belongs to.
+        :type meeting_id: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-q-and-a/list-meeting-q-and-a
+        """
+        params['meetingId'] = meeting_id
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=QAObject, params=params)
+
+    async def list(self, meeting_id: str, **params) -> List[QAObject]:
+        """
+        Lists questions and answers from a meeting, when ready.
+        Notes:
+
+        :param meeting_id: A unique identifier for the meeting instance which the Q&A belongs to.
+        :type meeting_id: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-q-and-a/list-meeting-q-and-a
+        """
+        params['meetingId'] = meeting_id
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=QAObject, params=params)]
+
+    def list_answers_gen(self, question_id: str, meeting_id: str,
+                     **params) -> AsyncGenerator[AnswerObject, None, None]:
+        """
+        Lists the answers to a specific question asked in a meeting.
+
+        :param question_id: The ID of a question.
+        :type question_id: str
+        :param meeting_id: A unique identifier for the meeting instance which the Q&A belongs to.
+        :type meeting_id: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-q-and-a/list-answers-of-a-question
+        """
+        params['meetingId'] = meeting_id
+        url = self.ep(f'{question_id}/answers')
+        return self.session.follow_pagination(url=url, model=AnswerObject, params=params)
+
+    async def list_answers(self, question_id: str, meeting_id: str,
+                     **params) -> List[AnswerObject]:
+        """
+        Lists the answers to a specific question asked in a meeting.
+
+        :param question_id: The ID of a question.
+        :type question_id: str
+        :param meeting_id: A unique identifier for the meeting instance which the Q&A belongs to.
+        :type meeting_id: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-q-and-a/list-answers-of-a-question
+        """
+        params['meetingId'] = meeting_id
+        url = self.ep(f'{question_id}/answers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AnswerObject, params=params)]
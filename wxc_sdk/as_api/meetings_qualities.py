@@ -0,0 +1,83 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.meetings.qualities import MediaSessionQuality
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsMeetingQualitiesApi']
+
+
+class AsMeetingQualitiesApi(AsApiChild, base=''):
+    """
+    To retrieve quality information, you must use an administrator token with the analytics:read_all scope. The
+    authenticated user must be a read-only or full administrator of the organization to which the meeting belongs and
+    must not be an external administrator.
+    To use this endpoint, the org needs to be licensed for the Webex Pro Pack.
+    For CI-Native site, no additional settings are required.
+    For CI-linked site, the admin must also be set as the Full/ReadOnly Site Admin of the site.
+    A minimum Webex and Teams client version is required. For details, see Troubleshooting Help Doc.
+    Quality information is available 10 minutes after a meeting has started and may be retrieved for up to 7 days.
+    A rate limit of 1 API call every 5 minutes for the same meeting instance ID applies.
+    """
+
+    def meeting_qualities_gen(self, meeting_id: str, offset: int = None,
+                          **params) -> AsyncGenerator[MediaSessionQuality, None, None]:
+        """
+        Get quality data for a meeting, by meetingId. Only organization administrators can retrieve meeting quality
+        data.
+
+        :param meeting_id: Unique identifier for the specific meeting instance. Note: The meetingId can be obtained via
+            the Meeting List API when meetingType=meeting. The id attribute in the Meeting List Response is what is
+            needed, for example, e5dba9613a9d455aa49f6ffdafb6e7db_I_191395283063545470.
+        :type meeting_id: str
+        :param offset: Offset from the first result that you want to fetch.
+        :type offset: int
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-qualities/get-meeting-qualities
+        """
+        params['meetingId'] = meeting_id
+        if offset is not None:
+            params['offset'] = offset
+        url = 'https://analytics.webexapis.com/v1/meeting/qualities'
+        return self.session.follow_pagination(url=url, model=MediaSessionQuality, params=params)
+
+    async def meeting_qualities(self, meeting_id: str, offset: int = None,
+                          **params) -> List[MediaSessionQuality]:
+        """
+        Get quality data for a meeting, by meetingId. Only organization administrators can retrieve meeting quality
+        data.
+
+        :param meeting_id: Unique identifier for the specific meeting instance. Note: The meetingId can be obtained via
+            the Meeting List API when meetingType=meeting. The id attribute in the Meeting List Response is what is
+            needed, for example, e5dba9613a9d455aa49f6ffdafb6e7db_I_191395283063545470.
+        :type meeting_id: str
+        :param offset: Offset from the first result that you want to fetch.
+        :type offset: int
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-qualities/get-meeting-qualities
+        """
+        params['meetingId'] = meeting_id
+        if offset is not None:
+            params['offset'] = offset
+        url = 'https://analytics.webexapis.com/v1/meeting/qualities'
+        return [o async for o in self.session.follow_pagination(url=url, model=MediaSessionQuality, params=params)]
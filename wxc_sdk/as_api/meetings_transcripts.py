@@ -0,0 +1,370 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.meetings.transcripts import DeleteTranscriptBody, Transcript, TranscriptSnippet, \
+    UpdateTranscriptSnippetBody
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsMeetingTranscriptsApi']
+
+
+class AsMeetingTranscriptsApi(AsApiChild, base=''):
+    """
+    Not supported for Webex for Government (FedRAMP)
+    A meeting transcript is the automatic transcription of a meeting's recordings by our industry-leading
+    speech-to-text engine to capture of what was discussed and decided during the meeting, in text form.
+    A transcript snippet is a short text snippet from a meeting transcript which was spoken by a particular participant
+    in the meeting. A meeting transcript consists of many snippets.
+    This API manages meeting transcripts and snippets. You can use the Transcript API to list meeting transcripts,
+    list, get and update transcript snippets. Transcripts may be retrieved via download link defined by vttDownloadLink
+    or txtDownloadlink in the response body.
+    Refer to the Meetings API Scopes section of Meetings Overview for scopes required for each API.
+    NOTE:
+    """
+
+    def list_gen(self, meeting_id: str = None, host_email: str = None, site_url: str = None, from_: str = None,
+             to_: str = None, **params) -> AsyncGenerator[Transcript, None, None]:
+        """
+        Lists available transcripts of an ended meeting instance.
+        Use this operation to list transcripts of an ended meeting instance when they are ready. Please note that only
+        meeting instances in state ended are supported for meetingId. Meeting series, scheduled meetings and
+        in-progress meeting instances are not supported.
+
+        :param meeting_id: Unique identifier for the meeting instance to which the transcript belongs. Please note that
+            currently the meeting ID of a scheduled personal room meeting is not supported for this API. If meetingId
+            is not specified, the operation returns an array of transcripts for all meetings of the current user.
+        :type meeting_id: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes. If set, the admin may specify the email of a user in a site
+            they manage and the API will return details for a meeting that is hosted by that user. If meetingId is not
+            specified, it can not support hostEmail.
+        :type host_email: str
+        :param site_url: URL of the Webex site from which the API lists transcripts. If not specified, the API lists
+            transcripts from user's preferred site. All available Webex sites and the preferred site of the user can be
+            retrieved by the Get Site List API.
+        :type site_url: str
+        :param from_: Starting date and time (inclusive) for transcripts to return, in any ISO 8601 compliant format.
+            from cannot be after to.
+        :type from_: str
+        :param to_: Ending date and time (exclusive) for List transcripts to return, in any ISO 8601 compliant format.
+            to cannot be before from.
+        :type to_: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-transcripts/list-meeting-transcripts
+        """
+        if meeting_id is not None:
+            params['meetingId'] = meeting_id
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        if site_url is not None:
+            params['siteUrl'] = site_url
+        if from_ is not None:
+            params['from'] = from_
+        if to_ is not None:
+            params['to'] = to_
+        url = self.ep('meetingTranscripts')
+        return self.session.follow_pagination(url=url, model=Transcript, params=params)
+
+    async def list(self, meeting_id: str = None, host_email: str = None, site_url: str = None, from_: str = None,
+             to_: str = None, **params) -> List[Transcript]:
+        """
+        Lists available transcripts of an ended meeting instance.
+        Use this operation to list transcripts of an ended meeting instance when they are ready. Please note that only
+        meeting instances in state ended are supported for meetingId. Meeting series, scheduled meetings and
+        in-progress meeting instances are not supported.
+
+        :param meeting_id: Unique identifier for the meeting instance to which the transcript belongs. Please note that
+            currently the meeting ID of a scheduled personal room meeting is not supported for this API. If meetingId
+            is not specified, the operation returns an array of transcripts for all meetings of the current user.
+        :type meeting_id: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes. If set, the admin may specify the email of a user in a site
+            they manage and the API will return details for a meeting that is hosted by that user. If meetingId is not
+            specified, it can not support hostEmail.
+        :type host_email: str
+        :param site_url: URL of the Webex site from which the API lists transcripts. If not specified, the API lists
+            transcripts from user's preferred site. All available Webex sites and the preferred site of the user can be
+            retrieved by the Get Site List API.
+        :type site_url: str
+        :param from_: Starting date and time (inclusive) for transcripts to return, in any ISO 8601 compliant format.
+            from cannot be after to.
+        :type from_: str
+        :param to_: Ending date and time (exclusive) for List transcripts to return, in any ISO 8601 compliant format.
+            to cannot be before from.
+        :type to_: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-transcripts/list-meeting-transcripts
+        """
+        if meeting_id is not None:
+            params['meetingId'] = meeting_id
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        if site_url is not None:
+            params['siteUrl'] = site_url
+        if from_ is not None:
+            params['from'] = from_
+        if to_ is not None:
+            params['to'] = to_
+        url = self.ep('meetingTranscripts')
+        return [o async for o in self.session.follow_pagination(url=url, model=Transcript, params=params)]
+
+    def list_compliance_officer_gen(self, site_url: str, from_: str = None, to_: str = None,
+                                **params) -> AsyncGenerator[Transcript, None, None]:
+        """
+        Lists available or deleted transcripts of an ended meeting instance for a specific site.
+        The returned list is sorted in descending order by the date and time that the transcript was created.
+
+        :param site_url: URL of the Webex site from which the API lists transcripts.
+        :type site_url: str
+        :param from_: Starting date and time (inclusive) for transcripts to return, in any ISO 8601 compliant format.
+            from cannot be after to.
+        :type from_: str
+        :param to_: Ending date and time (exclusive) for List transcripts to return, in any ISO 8601 compliant format.
+            to cannot be before from.
+        :type to_: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-transcripts/list-meeting-transcripts-for
+        -compliance-officer
+        """
+        params['siteUrl'] = site_url
+        if from_ is not None:
+            params['from'] = from_
+        if to_ is not None:
+            params['to'] = to_
+        url = self.ep('admin/meetingTranscripts')
+        return self.session.follow_pagination(url=url, model=Transcript, params=params)
+
+    async def list_compliance_officer(self, site_url: str, from_: str = None, to_: str = None,
+                                **params) -> List[Transcript]:
+        """
+        Lists available or deleted transcripts of an ended meeting instance for a specific site.
+        The returned list is sorted in descending order by the date and time that the transcript was created.
+
+        :param site_url: URL of the Webex site from which the API lists transcripts.
+        :type site_url: str
+        :param from_: Starting date and time (inclusive) for transcripts to return, in any ISO 8601 compliant format.
+            from cannot be after to.
+        :type from_: str
+        :param to_: Ending date and time (exclusive) for List transcripts to return, in any ISO 8601 compliant format.
+            to cannot be before from.
+        :type to_: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-transcripts/list-meeting-transcripts-for
+        -compliance-officer
+        """
+        params['siteUrl'] = site_url
+        if from_ is not None:
+            params['from'] = from_
+        if to_ is not None:
+            params['to'] = to_
+        url = self.ep('admin/meetingTranscripts')
+        return [o async for o in self.session.follow_pagination(url=url, model=Transcript, params=params)]
+
+    def _download_url_params(self, transcript_id: str, format: str = None,
+                             host_email: str = None) -> tuple[str, dict]:
+        """
+        URL and parameters for a transcript download
+
+        :meta private:
+        """
+        params = {}
+        if format is not None:
+            params['format'] = format
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        url = self.ep(f'meetingTranscripts/{transcript_id}/download')
+        return url, params
+
+    async def download(self, transcript_id: str, format: str = None, host_email: str = None) -> str:
+        """
+        Download a meeting transcript from the meeting transcript specified by transcriptId.
+
+        The whole transcript is read into memory. Use :meth:`download_stream` or :meth:`download_to_file` for large
+        transcripts.
+
+        :param transcript_id: Unique identifier for the meeting transcript.
+        :type transcript_id: str
+        :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
+        :type format: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes. If set, the admin may specify the email of a user in a site
+            they manage and the API will return details for a meeting that is hosted by that user.
+        :type host_email: str
+        :return: transcript content
+        :rtype: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-transcripts/download-a-meeting-transcript
+        """
+        url, params = self._download_url_params(transcript_id=transcript_id, format=format, host_email=host_email)
+        data = await super().get(url=url, params=params)
+        return data if isinstance(data, str) else json.dumps(data)
+
+    async def download_stream(self, transcript_id: str, format: str = None, host_email: str = None,
+                              chunk_size: int = 65536) -> AsyncGenerator[bytes, None]:
+        """
+        Download a meeting transcript in chunks without reading the whole transcript into memory
+
+        :param transcript_id: Unique identifier for the meeting transcript.
+        :type transcript_id: str
+        :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
+        :type format: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes.
+        :type host_email: str
+        :param chunk_size: maximum size of the chunks
+        :type chunk_size: int
+        :return: async generator of chunks of the transcript content
+        """
+        url, params = self._download_url_params(transcript_id=transcript_id, format=format, host_email=host_email)
+        async for chunk in self.session.stream_get(url=url, params=params, chunk_size=chunk_size):
+            yield chunk
+        
+
+    async def download_to_file(self, transcript_id: str, path: str, format: str = None, host_email: str = None,
+                               chunk_size: int = 65536) -> int:
+        """
+        Download a meeting transcript to a file.
+
+        The transcript is streamed to a temporary file next to the target which is renamed to the target path after
+        the download completed: the target file never contains a partial transcript.
+
+        :param transcript_id: Unique identifier for the meeting transcript.
+        :type transcript_id: str
+        :param path: path of the target file
+        :type path: str
+        :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
+        :type format: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes.
+        :type host_email: str
+        :param chunk_size: maximum size of the chunks
+        :type chunk_size: int
+        :return: number of bytes written
+        :rtype: int
+        """
+        tmp_path = f'{path}.part'
+        size = 0
+        try:
+            with open(tmp_path, mode='wb') as f:
+                async for chunk in self.download_stream(transcript_id=transcript_id, format=format,
+                                                        host_email=host_email, chunk_size=chunk_size):
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return size
+        
+
+    def list_snippets_gen(self, transcript_id: str, **params) -> AsyncGenerator[TranscriptSnippet, None, None]:
+        """
+        Lists snippets of a meeting transcript specified by transcriptId.
+        Use this operation to list snippets of a meeting transcript when they are ready.
+
+        :param transcript_id: Unique identifier for the meeting transcript to which the snippets belong.
+        :type transcript_id: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-transcripts/list-snippets-of-a-meeting-transcript
+        """
+        url = self.ep(f'meetingTranscripts/{transcript_id}/snippets')
+        return self.session.follow_pagination(url=url, model=TranscriptSnippet, params=params)
+
+    async def list_snippets(self, transcript_id: str, **params) -> List[TranscriptSnippet]:
+        """
+        Lists snippets of a meeting transcript specified by transcriptId.
+        Use this operation to list snippets of a meeting transcript when they are ready.
+
+        :param transcript_id: Unique identifier for the meeting transcript to which the snippets belong.
+        :type transcript_id: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-transcripts/list-snippets-of-a-meeting-transcript
+        """
+        url = self.ep(f'meetingTranscripts/{transcript_id}/snippets')
+        return [o async for o in self.session.follow_pagination(url=url, model=TranscriptSnippet, params=params)]
+
+    async def snippet_detail(self, transcript_id: str, snippet_id: str) -> TranscriptSnippet:
+        """
+        Retrieves details for a transcript snippet specified by snippetId from the meeting transcript specified by
+        transcriptId.
+
+        :param transcript_id: Unique identifier for the meeting transcript to which the requested snippet belongs.
+        :type transcript_id: str
+        :param snippet_id: Unique identifier for the snippet being requested.
+        :type snippet_id: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-transcripts/get-a-transcript-snippet
+        """
+        url = self.ep(f'meetingTranscripts/{transcript_id}/snippets/{snippet_id}')
+        data = await super().get(url=url)
+        return TranscriptSnippet.model_validate(data)
+
+    async def update_snippet(self, transcript_id: str, snippet_id: str, text: str, reason: str = None) -> TranscriptSnippet:
+        """
+        Updates details for a transcript snippet specified by snippetId from the meeting transcript specified by
+        transcriptId.
+
+        :param transcript_id: Unique identifier for the meeting transcript to which the snippet to be updated belongs.
+        :type transcript_id: str
+        :param snippet_id: Unique identifier for the snippet being updated.
+        :type snippet_id: str
+        :param text: Text for the snippet.
+        :type text: str
+        :param reason: Reason for snippet update; only required for Compliance Officers.
+        :type reason: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-transcripts/update-a-transcript-snippet
+        """
+        body = UpdateTranscriptSnippetBody()
+        if text is not None:
+            body.text = text
+        if reason is not None:
+            body.reason = reason
+        url = self.ep(f'meetingTranscripts/{transcript_id}/snippets/{snippet_id}')
+        data = await super().put(url=url, data=body.model_dump_json())
+        return TranscriptSnippet.model_validate(data)
+
+    async def delete(self, transcript_id: str, reason: str = None, comment: str = None):
+        """
+        Removes a transcript with a specified transcript ID. The deleted transcript cannot be recovered. If a
+        Compliance Officer deletes another user's transcript, the transcript will be inaccessible to regular users
+        (host, attendees), but will be still available to the Compliance Officer.
+
+        :param transcript_id: Unique identifier for the meeting transcript.
+        :type transcript_id: str
+        :param reason: Reason for deleting a transcript. Only required when a Compliance Officer is operating on
+            another user's transcript.
+        :type reason: str
+        :param comment: Explanation for deleting a transcript. The comment can be a maximum of 255 characters long.
+        :type comment: str
+
+        documentation: https://developer.webex.com/docs/api/v1/meeting-transcripts/delete-a-transcript
+        """
+        body = DeleteTranscriptBody()
+        if reason is not None:
+            body.reason = reason
+        if comment is not None:
+            body.comment = comment
+        url = self.ep(f'meetingTranscripts/{transcript_id}')
+        await super().delete(url=url, data=body.model_dump_json())
+        return
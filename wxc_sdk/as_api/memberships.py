@@ -0,0 +1,181 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.memberships import Membership
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsMembershipApi']
+
+
+class AsMembershipApi(AsApiChild, base='memberships'):
+    """
+    Manipulating Team Memberships as a Compliance Officer
+
+    As a Compliance Officer, you can indirectly manage the memberships of a team to which you do not belong.
+    Individuals added to the team's general space are automatically considered team members. Therefore, you can
+    utilize your standard privilege of adding individuals to a space or room by adding them to the team's general
+    space.
+
+    The team ID contains the general room ID with a different prefix. To locate the general room ID of a team, you need
+    to decode and recode the team ID using the new prefix. Below is a command-line example for this process. Note that
+    the final sed replacement is used to remove padding characters.
+
+    Example: echo "Y2lzY29zcGFyazovL3VzL1RFQU0vYjQ5ODhmODAtN2QzMS0xMWVkLTk4Y2MtNWY5MTFhZWU1OTA0" | base64 -d | sed
+    's/TEAM/ROOM/' | base64 | sed 's/\=.//'
+    """
+
+    def list_gen(self, room_id: str = None, person_id: str = None, person_email: str = None,
+             **params) -> AsyncGenerator[Membership, None, None]:
+        """
+        Lists all room memberships. By default, lists memberships for rooms to which the authenticated user belongs.
+        Use query parameters to filter the response.
+        Use roomId to list memberships for a room, by ID.
+        NOTE: For moderated team spaces, the list of memberships will include only the space moderators if the user
+        is a team member but not a direct participant of the space.
+        Use either personId or personEmail to filter the results. The roomId parameter is required when using these
+        parameters.
+        Long result sets will be split into pages.
+
+        :param room_id: List memberships associated with a room, by ID.
+        :type room_id: str
+        :param person_id: List memberships associated with a person, by ID. The roomId parameter is required
+            when using this parameter.
+        :type person_id: str
+        :param person_email: List memberships associated with a person, by email address. The roomId parameter
+            is required when using this parameter.
+        :type person_email: str
+        """
+        if room_id is not None:
+            params['roomId'] = room_id
+        if person_id is not None:
+            params['personId'] = person_id
+        if person_email is not None:
+            params['personEmail'] = person_email
+        url = self.ep()
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=Membership, params=params)
+
+    async def list(self, room_id: str = None, person_id: str = None, person_email: str = None,
+             **params) -> List[Membership]:
+        """
+        Lists all room memberships. By default, lists memberships for rooms to which the authenticated user belongs.
+        Use query parameters to filter the response.
+        Use roomId to list memberships for a room, by ID.
+        NOTE: For moderated team spaces, the list of memberships will include only the space moderators if the user
+        is a team member but not a direct participant of the space.
+        Use either personId or personEmail to filter the results. The roomId parameter is required when using these
+        parameters.
+        Long result sets will be split into pages.
+
+        :param room_id: List memberships associated with a room, by ID.
+        :type room_id: str
+        :param person_id: List memberships associated with a person, by ID. The roomId parameter is required
+            when using this parameter.
+        :type person_id: str
+        :param person_email: List memberships associated with a person, by email address. The roomId parameter
+            is required when using this parameter.
+        :type person_email: str
+        """
+        if room_id is not None:
+            params['roomId'] = room_id
+        if person_id is not None:
+            params['personId'] = person_id
+        if person_email is not None:
+            params['personEmail'] = person_email
+        url = self.ep()
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=Membership, params=params)]
+
+    async def create(self, room_id: str, person_id: str = None, person_email: str = None,
+               is_moderator: bool = None) -> Membership:
+        """
+        Add someone to a room by Person ID or email address, optionally making them a moderator.
+
+        :param room_id: The room ID.
+        :type room_id: str
+        :param person_id: The person ID.
+        :type person_id: str
+        :param person_email: The email address of the person.
+        :type person_email: str
+        :param is_moderator: Whether or not the participant is a room moderator.
+        :type is_moderator: bool
+        """
+        body = {}
+        if room_id is not None:
+            body['roomId'] = room_id
+        if person_id is not None:
+            body['personId'] = person_id
+        if person_email is not None:
+            body['personEmail'] = person_email
+        if is_moderator is not None:
+            body['isModerator'] = is_moderator
+        url = self.ep()
+        data = await super().post(url=url, json=body)
+        return Membership.model_validate(data)
+
+    async def details(self, membership_id: str) -> Membership:
+        """
+        Get details for a membership by ID.
+        Specify the membership ID in the membershipId URI parameter.
+
+        :param membership_id: The unique identifier for the membership.
+        :type membership_id: str
+        """
+        url = self.ep(f'{membership_id}')
+        data = await super().get(url=url)
+        return Membership.model_validate(data)
+
+    async def update(self, update: Membership) -> Membership:
+        """
+        Updates properties for a membership by ID
+
+        :param update: new settings; ID has to be set in update.
+
+            These can be updated:
+                is_moderator: bool: Whether or not the participant is a room moderator.
+
+                is_room_hidden: bool: When set to true, hides direct spaces in the teams client. Any new message will
+                make the room visible again.
+        :type update: Membership
+
+        """
+        if update.id is None:
+            raise ValueError('ID has to be set')
+        data = update.update()
+        url = self.ep(f'{update.id}')
+        data = await super().put(url=url, json=data)
+        return Membership.model_validate(data)
+
+    async def delete(self, membership_id: str):
+        """
+        Deletes a membership by ID.
+        Specify the membership ID in the membershipId URI parameter.
+        The membership for the last moderator of a Team's General space may not be deleted; promote another user to
+        team moderator first.
+
+        :param membership_id: The unique identifier for the membership.
+        :type membership_id: str
+        """
+        url = self.ep(f'{membership_id}')
+        await super().delete(url=url)
+        return
@@ -0,0 +1,74 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.organizations import Organization
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsOrganizationApi']
+
+
+class AsOrganizationApi(AsApiChild, base='organizations'):
+    async def list(self, calling_data: bool = None) -> list[Organization]:
+        """
+        List all organizations visible by your account. The results will not be paginated.
+
+        :param calling_data: Include XSI endpoint values in the response (if applicable) for the organization.
+            Default: false
+        :type calling_data: bool
+        :return: list of Organizations
+        """
+        params = calling_data and {'callingData': 'true'} or None
+        data = await self.get(url=self.ep(), params=params)
+        return type_adapter(list[Organization]).validate_python(data['items'])
+
+    async def details(self, org_id: str, calling_data: bool = None) -> Organization:
+        """
+        Get Organization Details
+
+        Shows details for an organization, by ID.
+
+        :param org_id: The unique identifier for the organization.
+        :type org_id: str
+        :param calling_data: Include XSI endpoint values in the response (if applicable) for the organization.
+            Default: false
+        :type calling_data: bool
+        :return: org details
+        :rtype: :class:`Organization`
+        """
+        url = self.ep(org_id)
+        params = calling_data and {'callingData': 'true'} or None
+        data = await self.get(url=url, params=params)
+        return Organization.model_validate(data)
+
+    async def delete(self, org_id: str):
+        """
+        Delete Organization
+
+        Deletes an organization, by ID. It may take up to 10 minutes for the organization to be deleted after the
+        response is returned.
+
+        :param org_id: The unique identifier for the organization.
+        :type org_id: str
+        """
+        url = self.ep(org_id)
+        await super().delete(url=url)
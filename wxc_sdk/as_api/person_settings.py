@@ -0,0 +1,246 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings import ApiSelector, DeviceList, Hoteling, ScheduleApiBase
+from wxc_sdk.as_api.api_child import AsApiChild
+from wxc_sdk.as_api.common_schedules import AsScheduleApi
+from wxc_sdk.as_api.person_settings_agent_caller_id import AsAgentCallerIdApi
+from wxc_sdk.as_api.person_settings_app_shared_line import AsAppSharedLineApi
+from wxc_sdk.as_api.person_settings_appservices import AsAppServicesApi
+from wxc_sdk.as_api.person_settings_available_numbers import AsAvailableNumbersApi
+from wxc_sdk.as_api.person_settings_barge import AsBargeApi
+from wxc_sdk.as_api.person_settings_call_intercept import AsCallInterceptApi
+from wxc_sdk.as_api.person_settings_call_recording import AsCallRecordingApi
+from wxc_sdk.as_api.person_settings_call_waiting import AsCallWaitingApi
+from wxc_sdk.as_api.person_settings_callbridge import AsCallBridgeApi
+from wxc_sdk.as_api.person_settings_caller_id import AsCallerIdApi
+from wxc_sdk.as_api.person_settings_calling_behavior import AsCallingBehaviorApi
+from wxc_sdk.as_api.person_settings_dnd import AsDndApi
+from wxc_sdk.as_api.person_settings_ecbn import AsECBNApi
+from wxc_sdk.as_api.person_settings_exec_assistant import AsExecAssistantApi
+from wxc_sdk.as_api.person_settings_forwarding import AsPersonForwardingApi
+from wxc_sdk.as_api.person_settings_hoteling import AsHotelingApi
+from wxc_sdk.as_api.person_settings_mode_management import AsModeManagementApi
+from wxc_sdk.as_api.person_settings_moh import AsMusicOnHoldApi
+from wxc_sdk.as_api.person_settings_monitoring import AsMonitoringApi
+from wxc_sdk.as_api.person_settings_msteams import AsMSTeamsSettingApi
+from wxc_sdk.as_api.person_settings_numbers import AsNumbersApi
+from wxc_sdk.as_api.person_settings_permissions_in import AsIncomingPermissionsApi
+from wxc_sdk.as_api.person_settings_permissions_out import AsOutgoingPermissionsApi
+from wxc_sdk.as_api.person_settings_personal_assistant import AsPersonalAssistantApi
+from wxc_sdk.as_api.person_settings_preferred_answer import AsPreferredAnswerApi
+from wxc_sdk.as_api.person_settings_privacy import AsPrivacyApi
+from wxc_sdk.as_api.person_settings_push_to_talk import AsPushToTalkApi
+from wxc_sdk.as_api.person_settings_receptionist import AsReceptionistApi
+from wxc_sdk.as_api.person_settings_selective_accept import AsSelectiveAcceptApi
+from wxc_sdk.as_api.person_settings_selective_forward import AsSelectiveForwardApi
+from wxc_sdk.as_api.person_settings_selective_reject import AsSelectiveRejectApi
+from wxc_sdk.as_api.person_settings_voicemail import AsVoicemailApi
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsPersonSettingsApi']
+
+
+@dataclass(init=False, repr=False)
+class AsPersonSettingsApi(AsApiChild, base='people'):
+    """
+    API for all user level settings
+    """
+
+    #: agent caller id Api
+    agent_caller_id: AsAgentCallerIdApi
+    app_shared_line: AsAppSharedLineApi
+    #: Person's Application Services Settings
+    appservices: AsAppServicesApi
+    #: Available numbers for a person
+    available_numbers: AsAvailableNumbersApi
+    #: Barge In Settings for a Person
+    barge: AsBargeApi
+    #: Call bridge settings for a person
+    call_bridge: AsCallBridgeApi
+    #: Call Intercept Settings for a Person
+    call_intercept: AsCallInterceptApi
+    #: Call Recording Settings for a Person
+    call_recording: AsCallRecordingApi
+    #: Call Waiting Settings for a Person
+    call_waiting: AsCallWaitingApi
+    #: Caller ID Settings for a Person
+    caller_id: AsCallerIdApi
+    #: Person's Calling Behavior
+    calling_behavior: AsCallingBehaviorApi
+    #: Do Not Disturb Settings for a Person
+    dnd: AsDndApi
+    #: ECBN settings
+    ecbn: AsECBNApi
+    #: Executive Assistant Settings for a Person
+    exec_assistant: AsExecAssistantApi
+    #: Forwarding Settings for a Person
+    forwarding: AsPersonForwardingApi
+    #: Hoteling Settings for a Person
+    hoteling: AsHotelingApi
+    #: Person's mode management settings
+    mode_management: AsModeManagementApi
+    #: Person's Monitoring Settings
+    monitoring: AsMonitoringApi
+    # ; MS Teams settings
+    ms_teams: AsMSTeamsSettingApi
+    #: music on hold settings
+    music_on_hold: AsMusicOnHoldApi
+    #: Phone Numbers for a Person
+    numbers: AsNumbersApi
+    #: Incoming Permission Settings for a Person
+    permissions_in: AsIncomingPermissionsApi
+    #: Person's Outgoing Calling Permissions Settings
+    permissions_out: AsOutgoingPermissionsApi
+    #: Personal Assistant Settings
+    personal_assistant: AsPersonalAssistantApi
+    #: Preferred answer endpoint settings
+    preferred_answer: AsPreferredAnswerApi
+    #: Person's Privacy Settings
+    privacy: AsPrivacyApi
+    #: Push-to-Talk Settings for a Person
+    push_to_talk: AsPushToTalkApi
+    #: Receptionist Client Settings for a Person
+    receptionist: AsReceptionistApi
+    #: Schedules for a Person
+    schedules: AsScheduleApi
+    #: selective accept settings
+    selective_accept: AsSelectiveAcceptApi
+    #: selective forward settings
+    selective_forward: AsSelectiveForwardApi
+    #: selective reject settings
+    selective_reject: AsSelectiveRejectApi
+
+    #: Voicemail Settings for a Person
+    voicemail: AsVoicemailApi
+
+    def __init__(self, session: AsRestSession):
+        """
+
+        :meta private:
+        """
+        super().__init__(session=session)
+        self.agent_caller_id = AsAgentCallerIdApi(session=session)
+        self.app_shared_line = AsAppSharedLineApi(session=session)
+        self.appservices = AsAppServicesApi(session=session)
+        self.available_numbers = AsAvailableNumbersApi(session=session)
+        self.barge = AsBargeApi(session=session)
+        self.call_bridge = AsCallBridgeApi(session=session)
+        self.call_intercept = AsCallInterceptApi(session=session)
+        self.call_recording = AsCallRecordingApi(session=session)
+        self.call_waiting = AsCallWaitingApi(session=session)
+        self.calling_behavior = AsCallingBehaviorApi(session=session)
+        self.caller_id = AsCallerIdApi(session=session)
+        self.dnd = AsDndApi(session=session)
+        self.ecbn = AsECBNApi(session=session)
+        self.exec_assistant = AsExecAssistantApi(session=session)
+        self.forwarding = AsPersonForwardingApi(session=session)
+        self.hoteling = AsHotelingApi(session=session)
+        self.mode_management = AsModeManagementApi(session=session)
+        self.monitoring = AsMonitoringApi(session=session)
+        self.ms_teams = AsMSTeamsSettingApi(session=session)
+        self.music_on_hold = AsMusicOnHoldApi(session=session)
+        self.numbers = AsNumbersApi(session=session)
+        self.permissions_in = AsIncomingPermissionsApi(session=session)
+        self.permissions_out = AsOutgoingPermissionsApi(session=session)
+        self.personal_assistant = AsPersonalAssistantApi(session=session)
+        self.preferred_answer = AsPreferredAnswerApi(session=session)
+        self.privacy = AsPrivacyApi(session=session)
+        self.push_to_talk = AsPushToTalkApi(session=session)
+        self.receptionist = AsReceptionistApi(session=session)
+        self.schedules = AsScheduleApi(session=session, base=ScheduleApiBase.people)
+        self.selective_accept = AsSelectiveAcceptApi(session=session, selector=ApiSelector.person)
+        self.selective_forward = AsSelectiveForwardApi(session=session, selector=ApiSelector.person)
+        self.selective_reject = AsSelectiveRejectApi(session=session, selector=ApiSelector.person)
+
+        self.voicemail = AsVoicemailApi(session=session)
+
+    # This endpoint is also available in the voicemail API and is only kept here for backward compatibility.
+
+    async def reset_vm_pin(self, person_id: str, org_id: str = None):
+        """
+        Reset Voicemail PIN
+
+        Reset a voicemail PIN for a person.
+
+        The voicemail feature transfers callers to voicemail based on your settings. You can then retrieve voice
+        messages via Voicemail. A voicemail PIN is used to retrieve your voicemail messages.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope.
+
+        This endpoint is also available in the voicemail API and is only kept here for backward compatibility.
+
+        :param person_id: Unique identifier for the person.
+        :param org_id: Person is in this organization. Only admin users of another organization (such as partners) may
+            use this parameter as the default is the same organization as the token used to access API.
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep(f'{person_id}/features/voicemail/actions/resetPin/invoke')
+        await self.post(url, params=params)
+
+    async def devices(self, person_id: str, org_id: str = None) -> DeviceList:
+        """
+        Get all devices for a person.
+
+        This requires a full or read-only administrator or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param person_id: Person to retrieve devices for
+        :type person_id: str
+        :param org_id: organization that person belongs to
+        :type org_id: str
+        :return: device info for user
+        :rtype: DeviceList
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.session.ep(f'telephony/config/people/{person_id}/devices')
+        data = await self.get(url=url, params=params)
+        return DeviceList.model_validate(data)
+
+    async def modify_hoteling_settings_primary_devices(self, person_id: str, hoteling: Hoteling,
+                                                 org_id: str = None):
+        """
+        Modify Hoteling Settings for a Person's Primary Devices
+
+        Modify hoteling login configuration on a person's Webex Calling Devices which are in effect when the device is
+        the user's primary device and device type is PRIMARY. To view the current hoteling login settings, see the
+        `hoteling` field in `Get Person Devices
+        <https://developer.webex.com/docs/api/v1/device-call-settings/get-person-devices>`_.
+
+        Modifying devices for a person requires a full administrator or location administrator auth token with a scope
+        of `spark-admin:telephony_config_write`.
+
+        :param person_id: ID of the person associated with the device.
+        :type person_id: str
+        :param hoteling: Modify person Device Hoteling Setting.
+        :type hoteling: Hoteling
+        :param org_id: Organization to which the person belongs.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['hoteling'] = hoteling.model_dump(mode='json', by_alias=True, exclude_none=True)
+        url = self.ep(f'telephony/config/people/{person_id}/devices/settings/hoteling')
+        await super().put(url, params=params, json=body)
@@ -0,0 +1,101 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.agent_caller_id import AgentCallerId
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsAgentCallerIdApi']
+
+
+class AsAgentCallerIdApi(AsPersonSettingsApiChild):
+    """
+    API to manage agent caller id settings
+
+    Also used for virtual lines
+    """
+    feature = 'agent'
+
+    async def available_caller_ids(self, entity_id: str, org_id: str = None) -> list[AgentCallerId]:
+        """
+        Retrieve Agent's List of Available Caller IDs
+
+        Get the list of call queues and hunt groups available for caller ID use by this person, virtual line, or
+        workspace as an agent.
+
+        This API requires a full, user, or read-only administrator or location administrator auth token with a scope
+        of `spark-admin:people_read`.
+
+        :param entity_id: Unique identifier for the person, virtual line, or workspace.
+        :type entity_id: str
+        :param org_id: ID of the organization in which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access API.
+        :type org_id: str
+        :rtype: list[AvailableCallerIdObject]
+        """
+        ep = self.f_ep(entity_id, 'availableCallerIds')
+        params = org_id and {'orgId': org_id} or None
+        data = await self.get(ep, params=params)
+        return type_adapter(list[AgentCallerId]).validate_python(data['availableCallerIds'])
+
+    async def read(self, entity_id: str) -> AgentCallerId:
+        """
+        Retrieve Agent's Caller ID Information
+
+        Retrieve the Agent's Caller ID Information.
+
+        Each agent will be able to set their outgoing Caller ID as either the Call Queue's Caller ID, Hunt Group's
+        Caller ID or their own configured Caller ID.
+
+        This API requires a full admin or read-only administrator or location administrator auth token with a scope
+        of `spark-admin:telephony_config_read`.
+
+        :param entity_id: Unique identifier for the person, virtual line, or workspace
+        :type entity_id: str
+        :rtype: AgentCallerId
+        """
+        url = self.f_ep(entity_id, 'callerId')
+        data = await super().get(url)
+        r = AgentCallerId.model_validate(data['selectedCallerId'])
+        return r
+
+    async def configure(self, entity_id: str, selected_caller_id: str = None):
+        """
+        Modify Agent's Caller ID Information.
+
+        Each Agent will be able to set their outgoing Caller ID as either the designated Call Queue's Caller ID or Hunt
+        Group's Caller ID or their own configured Caller ID
+
+        This API requires a full or user administrator or location administrator auth token with
+        the `spark-admin:telephony_config_write` scope.
+
+        :param entity_id: Unique identifier for the person, virtual line, or workspace
+        :type entity_id: str
+        :param selected_caller_id: The unique identifier of the call queue or hunt group to use for the agent's caller
+            ID. Set to null to use the agent's own caller ID.
+        :type selected_caller_id: str
+        :rtype: None
+        """
+        body = {'selectedCallerId': selected_caller_id}
+        url = self.f_ep(entity_id, 'callerId')
+        await super().put(url, json=body)
@@ -0,0 +1,84 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsAnonCallsApi']
+
+
+class AsAnonCallsApi(AsPersonSettingsApiChild):
+    """
+    API for anonymous call reject settings; so far only used for workspaces
+    """
+
+    feature = 'anonymousCallReject'
+
+    async def read(self, entity_id: str, org_id: str = None) -> bool:
+        """
+        Retrieve Anonymous Call Settings for an entity.
+
+        Anonymous Call Rejection, when enabled, blocks all incoming calls from unidentified or blocked caller IDs.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: bool
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id)
+        data = await super().get(url, params=params)
+        r = data['enabled']
+        return r
+
+    async def configure(self, entity_id: str, enabled: bool, org_id: str = None):
+        """
+        Modify Anonymous Call Settings for an entity.
+
+        Anonymous Call Rejection, when enabled, blocks all incoming calls from unidentified or blocked caller IDs.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param enabled: `true` if the Anonymous Call Rejection feature is enabled.
+        :type enabled: bool
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['enabled'] = enabled
+        url = self.f_ep(entity_id)
+        await super().put(url, params=params, json=body)
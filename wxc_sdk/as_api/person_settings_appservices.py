@@ -0,0 +1,85 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.appservices import AppServicesSettings
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsAppServicesApi']
+
+
+class AsAppServicesApi(AsPersonSettingsApiChild):
+    """
+    API for person's app services settings
+    """
+
+    feature = 'applications'
+
+    async def read(self, person_id: str, org_id: str = None) -> AppServicesSettings:
+        """
+        Retrieve a Person's Application Services Settings
+
+        Application services let you determine the ringing behavior for calls made to people in certain scenarios.
+        You can also specify which devices can download the Webex Calling app.
+
+        This API requires a full, user, or read-only administrator auth token with a scope of spark-admin:people_read.
+
+        :param person_id: Unique identifier for the person.
+        :type person_id: str
+        :param org_id: Person is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        :return: privacy settings
+        :rtype: :class:`Privacy`
+        """
+        ep = self.f_ep(person_id=person_id)
+        params = org_id and {'orgId': org_id} or None
+        data = await self.get(ep, params=params)
+        return AppServicesSettings.model_validate(data)
+
+    async def configure(self, person_id: str, settings: AppServicesSettings, org_id: str = None):
+        """
+        Modify a Person's Application Services Settings
+
+        Application services let you determine the ringing behavior for calls made to users in certain scenarios. You
+        can also specify which devices users can download the Webex Calling app on.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope.
+
+        :param person_id: Unique identifier for the person.
+        :type person_id: str
+        :param settings: settings for update
+        :type settings: :class:`AppServicesSettings`
+        :param org_id: Person is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        """
+        ep = self.f_ep(person_id=person_id)
+        params = org_id and {'orgId': org_id} or None
+        data = settings.model_dump_json(include={'ring_devices_for_click_to_dial_calls_enabled': True,
+                                                 'ring_devices_for_group_page_enabled': True,
+                                                 'ring_devices_for_call_park_enabled': True,
+                                                 'desktop_client_enabled': True,
+                                                 'tablet_client_enabled': True,
+                                                 'mobile_client_enabled': True,
+                                                 'browser_client_enabled': True})
+        await self.put(ep, params=params, data=data)
@@ -0,0 +1,78 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.barge import BargeSettings
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsBargeApi']
+
+
+class AsBargeApi(AsPersonSettingsApiChild):
+    """
+    API for barge settings; also used for virtual lines and workspaces
+    """
+
+    feature = 'bargeIn'
+
+    async def read(self, entity_id: str, org_id: str = None) -> BargeSettings:
+        """
+        Retrieve Barge In Settings
+
+        The Barge In feature enables you to use a Feature Access Code (FAC) to answer a call that was directed to
+        another subscriber, or barge-in on the call if it was already answered. Barge In can be used across locations.
+
+        This API requires a full, user, or read-only administrator auth token with a scope of spark-admin:people_read
+        or a user auth token with spark:people_read scope can be used by an entity to read their own settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        :return: barge settings for specific user
+        :rtype: BargeSettings
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        return BargeSettings.model_validate(await self.get(ep, params=params))
+
+    async def configure(self, entity_id: str, barge_settings: BargeSettings, org_id: str = None):
+        """
+        Configure Barge In Settings
+
+        The Barge In feature enables you to use a Feature Access Code (FAC) to answer a call that was directed to
+        another subscriber, or barge-in on the call if it was already answered. Barge In can be used across locations.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope or a user
+        auth token with spark:people_write scope can be used by an entity to update their own settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param barge_settings: new setting to be applied
+        :type barge_settings: BargeSettings
+        :param org_id: entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        await self.put(ep, params=params, data=barge_settings.model_dump_json())
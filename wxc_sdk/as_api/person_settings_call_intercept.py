@@ -0,0 +1,133 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.call_intercept import InterceptSetting
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsCallInterceptApi']
+
+
+class AsCallInterceptApi(AsPersonSettingsApiChild):
+    """
+    API for call intercept settings
+
+    Also used for virtual lines and workspaces
+    """
+
+    feature = 'intercept'
+
+    async def read(self, entity_id: str, org_id: str = None) -> InterceptSetting:
+        """
+        Read Call Intercept Settings
+
+        Retrieves Call Intercept Settings
+
+        The intercept feature gracefully takes an entity’s phone out of service, while providing callers with
+        informative announcements and alternative routing options. Depending on the service configuration, none,
+        some, or all incoming calls to the specified entity are intercepted. Also depending on the service
+        configuration, outgoing calls are intercepted or rerouted to another location.
+
+        This API requires a full, user, or read-only administrator auth token with a scope of spark-admin:people_read.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        :return: user's call intercept settings
+        :rtype: InterceptSetting
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        return InterceptSetting.model_validate(await self.get(ep, params=params))
+
+    async def configure(self, entity_id: str, intercept: InterceptSetting, org_id: str = None):
+        """
+        Configure Call Intercept Settings
+
+        Configures Call Intercept Settings
+
+        The intercept feature gracefully takes an entity’s phone out of service, while providing callers with
+        informative announcements and alternative routing options. Depending on the service configuration, none, some,
+        or all incoming calls to the specified entity are intercepted. Also depending on the service configuration,
+        outgoing calls are intercepted or rerouted to another location.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param intercept: new intercept settings
+        :type intercept: InterceptSetting
+        :param org_id: entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        data = intercept.update()
+        await self.put(ep, params=params, json=data)
+
+    async def greeting(self, entity_id: str, content: Union[BufferedReader, str],
+                 upload_as: str = None, org_id: str = None):
+        """
+        Configure Call Intercept Greeting
+
+        ConfigureCall Intercept Greeting by uploading a Waveform Audio File Format, .wav, encoded audio
+        file.
+
+        Your request will need to be a multipart/form-data request rather than JSON, using the audio/wav Content-Type.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope or a user
+        auth token with spark:people_write scope can be used by an entity to update their settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param content: the file to be uploaded, can be a path to a file or a buffered reader (opened file); if a
+            reader referring to an open file is passed then make sure to open the file as binary b/c otherwise the
+            content length might be calculated wrong
+        :type content: Union[BufferedReader, str]
+        :param upload_as: filename for the content. Only required if content is a reader; has to be a .wav file name.
+        :type upload_as: str
+        :param org_id: entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        """
+        if isinstance(content, str):
+            upload_as = os.path.basename(content)
+            content = open(content, mode='rb')
+            must_close = True
+        else:
+            must_close = False
+            # an existing reader
+            if not upload_as:
+                raise ValueError('upload_as is required')
+        encoder = MultipartEncoder({'file': (upload_as, content, 'audio/wav')})
+        ep = self.f_ep(person_id=entity_id, path='actions/announcementUpload/invoke')
+        params = org_id and {'orgId': org_id} or None
+        try:
+            await self.post(ep, data=encoder, headers={'Content-Type': encoder.content_type},
+                      params=params)
+        finally:
+            if must_close:
+                content.close()
+        return
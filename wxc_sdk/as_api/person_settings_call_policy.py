@@ -0,0 +1,102 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.call_policy import PrivacyOnRedirectedCalls
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsCallPolicyApi']
+
+
+class AsCallPolicyApi(AsPersonSettingsApiChild):
+    """
+    API for call policy settings.
+
+    For now only used for workspaces
+    """
+
+    feature = 'callPolicies'
+
+    async def read(self, entity_id: str,
+             org_id: str = None) -> PrivacyOnRedirectedCalls:
+        """
+        Read Call Policy Settings for an entity
+
+        Retrieve Call Policies settings.
+
+        The call policy feature enables administrator to configure call policy settings such as Connected Line
+        Identification Privacy on Redirected Calls for a professional workspace.
+
+        This API requires a full or read-only administrator or location administrator auth token with a scope of
+        `spark-admin:workspaces_read` scope can be used to read workspace settings.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: ID of the organization in which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access API.
+        :type org_id: str
+        :rtype: PrivacyOnRedirectedCalls
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id)
+        data = await super().get(url, params=params)
+        r = type_adapter(PrivacyOnRedirectedCalls).validate_python(data['connectedLineIdPrivacyOnRedirectedCalls'])
+        return r
+
+    async def configure(self, entity_id: str,
+                  connected_line_id_privacy_on_redirected_calls: PrivacyOnRedirectedCalls,
+                  org_id: str = None):
+        """
+        Configure Call Policy Settings for an entity
+
+        Configure Call Policies settings.
+
+        The call policy feature enables administrator to configure call policy settings such as Connected Line
+        Identification Privacy on Redirected Calls for a professional workspace.
+
+        This API requires a full or user administrator or location administrator auth token with the
+        `spark-admin:workspaces_write` scope can be used to update workspace settings.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param connected_line_id_privacy_on_redirected_calls: Specifies the connection type to be used.
+        :type connected_line_id_privacy_on_redirected_calls: PrivacyOnRedirectedCalls
+        :param org_id: ID of the organization in which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['connectedLineIdPrivacyOnRedirectedCalls'] = enum_str(connected_line_id_privacy_on_redirected_calls)
+        url = self.f_ep(entity_id)
+        await super().put(url, params=params, json=body)
@@ -0,0 +1,82 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.call_recording import CallRecordingSetting
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsCallRecordingApi']
+
+
+class AsCallRecordingApi(AsPersonSettingsApiChild):
+    """
+    API for recording settings
+
+    Also used for virtual lines, workspaces
+    """
+
+    feature = 'callRecording'
+
+    async def read(self, entity_id: str, org_id: str = None) -> CallRecordingSetting:
+        """
+        Read Call Recording Settings
+
+        Retrieve Call Recording Settings
+
+        The Call Recording feature provides a hosted mechanism to record the calls placed and received on the Carrier
+        platform for replay and archival. This feature is helpful for quality assurance, security, training, and more.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        return CallRecordingSetting.model_validate(await self.get(ep, params=params))
+
+    async def configure(self, entity_id: str, recording: CallRecordingSetting, org_id: str = None):
+        """
+        Configure Call Recording Settings for a entity
+
+        Configure Call Recording Settings
+
+        The Call Recording feature provides a hosted mechanism to record the calls placed and received on the Carrier
+        platform for replay and archival. This feature is helpful for quality assurance, security, training, and more.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param recording: the new recording settings
+        :type recording: CallRecordingSetting
+        :param org_id: entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        data = recording.update()
+        await self.put(ep, params=params, json=data)
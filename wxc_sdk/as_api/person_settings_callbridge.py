@@ -0,0 +1,100 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.callbridge import CallBridgeSetting
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsCallBridgeApi']
+
+
+class AsCallBridgeApi(AsPersonSettingsApiChild):
+    """
+    User Call Settings with Call Bridge Feature
+
+    Also used for virtual lines
+
+    Not supported for Webex for Government (FedRAMP)
+
+    Person Call Settings supports modifying Webex Calling settings for a specific person.
+
+    Viewing People requires a full, user, or read-only administrator auth token with a scope
+    of `spark-admin:people_read` or, for select APIs, a user auth token with `spark:people_read` scope can be used by a
+    person to read their own settings.
+
+    Configuring People settings requires a full or user administrator auth token with the `spark-admin:people_write`
+    scope or, for select APIs, a user auth token with `spark:people_write` scope can be used by a person to update
+    their own settings.
+    """
+
+    feature = 'callBridge'
+
+    async def read(self, entity_id: str, org_id: str = None) -> CallBridgeSetting:
+        """
+        Read Call Bridge Settings
+
+        Retrieve Bridge settings.
+
+        This API requires a full, user or read-only administrator or location administrator auth token with a scope
+        of `spark-admin:people_read`.
+
+        :param entity_id: Unique identifier for the person.
+        :type entity_id: str
+        :param org_id: ID of the organization in which the person resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access API.
+        :type org_id: str
+        :rtype: :class:'CallBridgeSetting'
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id)
+        data = await super().get(url, params=params)
+        return CallBridgeSetting.model_validate(data)
+
+    async def configure(self, entity_id: str, setting: CallBridgeSetting,
+                  org_id: str = None):
+        """
+        Configure Call Bridge Settings
+
+        Configure Call Bridge settings.
+
+        This API requires a full or user administrator or location administrator auth token with
+        the `spark-admin:people_write` scope.
+
+        :param entity_id: Unique identifier for the person.
+        :type entity_id: str
+        :param setting: new call bridge settings
+        :type setting: :class:'CallBridgeSetting'
+        :param org_id: ID of the organization in which the person resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = setting.model_dump(mode='json', exclude_none=True, by_alias=True)
+        url = self.f_ep(entity_id)
+        await super().put(url, params=params, json=body)
@@ -0,0 +1,133 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.caller_id import CallerId, CallerIdSelectedType, ExternalCallerIdNamePolicy
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsCallerIdApi']
+
+
+class AsCallerIdApi(AsPersonSettingsApiChild):
+    """
+    API for caller id settings
+
+    Also used for: virtual lines, workspaces
+    """
+
+    feature = 'callerId'
+
+    async def read(self, entity_id: str, org_id: str = None) -> CallerId:
+        """
+        Retrieve Caller ID Settings
+
+        Caller ID settings control how a entity’s information is displayed when making outgoing calls.
+
+        This API requires a full, user, or read-only administrator auth token with a scope of spark-admin:people_read
+        or a user auth token with spark:people_read scope can be used by a entity to read their settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        return CallerId.model_validate(await self.get(ep, params=params))
+
+    async def configure(self, entity_id: str, org_id: str = None,
+                  selected: CallerIdSelectedType = None,
+                  custom_number: str = None,
+                  first_name: str = None,
+                  last_name: str = None,
+                  external_caller_id_name_policy: ExternalCallerIdNamePolicy = None,
+                  custom_external_caller_id_name: str = None):
+        """
+        Configure a Caller ID Settings
+
+        Caller ID settings control how a entity’s information is displayed when making outgoing calls.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope or a user
+        auth token with spark:people_write scope can be used by a entity to update their own settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        :param selected: Which type of outgoing Caller ID will be used.
+        :type selected: CallerIdSelectedType
+        :param custom_number: This value must be an assigned number from the entity\'s location.
+        :type custom_number: str
+        :param first_name: entity's Caller ID first name. Characters of %, +, `, " and Unicode characters are not
+            allowed.
+
+        :type first_name: str
+        :param last_name: entity's Caller ID last name. Characters of %, +, `, " and Unicode characters are not
+            allowed.
+        :type last_name: str
+        :param external_caller_id_name_policy: Designates which type of External Caller ID Name policy is used.
+            Default is DIRECT_LINE.
+        :type external_caller_id_name_policy: ExternalCallerIdNamePolicy
+        :param custom_external_caller_id_name: Custom External Caller Name, which will be shown if External Caller ID
+            Name is OTHER.
+        :type custom_external_caller_id_name: str
+
+        """
+        data = {to_camel(k): v for i, (k, v) in enumerate(locals().items())
+                if i > 2 and v is not None}
+        params = org_id and {'orgId': org_id} or None
+        ep = self.f_ep(person_id=entity_id)
+        await self.put(ep, params=params, json=data)
+
+    async def configure_settings(self, entity_id: str, settings: CallerId, org_id: str = None):
+        """
+        Configure a Caller ID Settings
+
+        Caller ID settings control how a entity’s information is displayed when making outgoing calls.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope or a user
+        auth token with spark:people_write scope can be used by a entity to update their own settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param settings: new settings
+        :type settings: CallerId
+        :param org_id: entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+
+        Example:
+
+            .. code-block:: python
+
+                api = self.api.telephony.virtual_lines.caller_id
+                caller_id_settings = api.read(entity_id=self.target.id)
+                caller_id_settings.block_in_forward_calls_enabled = True
+                api.configure_settings(entity_id=self.target.id, settings=caller_id_settings)
+
+        """
+        params = org_id and {'orgId': org_id} or None
+        data = settings.update()
+        ep = self.f_ep(person_id=entity_id)
+        await self.put(ep, params=params, json=data)
@@ -0,0 +1,98 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.calling_behavior import CallingBehavior
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsCallingBehaviorApi']
+
+
+class AsCallingBehaviorApi(AsPersonSettingsApiChild):
+    """
+    API for person's calling behavior settings
+    """
+
+    feature = 'callingBehavior'
+
+    async def read(self, person_id: str, org_id: str = None) -> CallingBehavior:
+        """
+        Read Person's Calling Behavior
+
+        Retrieves the calling behavior and UC Manager Profile settings for the person which includes overall calling
+        behavior and calling UC Manager Profile ID.
+
+        Webex Calling Behavior controls which Webex telephony application is to be used.
+
+        An organization has an organization-wide default Calling Behavior that may be overridden for individual persons.
+
+        In addition, UC Manager Profiles are applicable if your organization uses Jabber in Team Messaging mode or
+        Calling in Webex Teams (Unified CM).
+
+        The UC Manager Profile also has an organization-wide default and may be overridden for individual persons.
+
+        This API requires a full, user, or read-only administrator auth token with a scope of spark-admin:people_read.
+
+        :param person_id: Unique identifier for the person.
+        :type person_id: str
+        :param org_id: Person is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        :return: calling behavior setting
+        :rtype: CallingBehavior
+        """
+        ep = self.f_ep(person_id=person_id)
+        params = org_id and {'orgId': org_id} or None
+        data = await self.get(ep, params=params)
+        return CallingBehavior.model_validate(data)
+
+    async def configure(self, person_id: str, settings: CallingBehavior,
+                  org_id: str = None):
+        """
+        Configure a Person's Calling Behavior
+
+        Modifies the calling behavior settings for the person which includes overall calling behavior and UC Manager
+        Profile ID.
+
+        Webex Calling Behavior controls which Webex telephony application is to be used.
+
+        An organization has an organization-wide default Calling Behavior that may be overridden for individual persons.
+
+        In addition, UC Manager Profiles are applicable if your organization uses Jabber in Team Messaging mode or
+        Calling in Webex Teams (Unified CM).
+
+        The UC Manager Profile also has an organization-wide default and may be overridden for individual persons.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope.
+
+        :param person_id: Unique identifier for the person.
+        :type person_id: str
+        :param settings: new settings
+        :type settings: CallingBehavior
+        :param org_id: Person is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        """
+        ep = self.f_ep(person_id=person_id)
+        params = org_id and {'orgId': org_id} or None
+        data = settings.model_dump_json(exclude_none=False, exclude={'effective_behavior_type'}, exclude_unset=True)
+        await self.put(ep, params=params, data=data)
@@ -0,0 +1,121 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.common import ApiSelector
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsPersonSettingsApiChild']
+
+
+class AsPersonSettingsApiChild(AsApiChild, base=''):
+    """
+    Base class for all classes implementing person settings APIs
+    """
+
+    feature = None
+
+    def __init__(self, *, session: AsRestSession, selector: ApiSelector = ApiSelector.person):
+        # set parameters to get the correct URL templates
+        #
+        #               selector                    feature_prefix  url template
+        # workspaces    workspaces                      /features/      workspaces/{person_id}/features/{feature}{path}
+        # locations     telephony/config/locations      /               telephony/config/locations/{person_id}{path}
+        # person        people                          /features       people/{person_id}/features/{feature}{path}
+        # virtual line  telephony/config/virtualLines   /               telephony/config/virtualLines/{person_id}/{feature}
+        self.feature_prefix = '/features/'
+        if selector == ApiSelector.workspace:
+            self.selector = 'workspaces'
+        elif selector == ApiSelector.location:
+            self.selector = 'telephony/config/locations'
+            self.feature_prefix = '/'
+        elif selector == ApiSelector.virtual_line:
+            self.selector = 'telephony/config/virtualLines'
+            self.feature_prefix = '/'
+        elif selector == ApiSelector.person:
+            self.selector = 'people'
+        else:
+            raise ValueError(f'Invalid selector: {selector}')
+        super().__init__(session=session, base=self.selector)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(base='')
+        if cls.feature is None:
+            raise TypeError('feature has to be defined')
+
+    def f_ep(self, person_id: str, path: str = None) -> str:
+        """
+        person specific feature endpoint like v1/people/{uid}/features/....
+
+        :meta private:
+        :param person_id: Unique identifier for the person.
+        :type person_id: str
+        :param path: path in the endpoint after the feature base URL
+        :type path: str
+        :return: full endpoint
+        :rtype: str
+        """
+        path = path and f'/{path}' or ''
+        # url templates:
+        #
+        #               selector                        feature_prefix  url template
+        # workspaces    workspaces                      /features/      workspaces/{person_id}/features/{feature}{path}
+        # locations     telephony/config/locations      /               telephony/config/locations/{person_id}{path}
+        # person        people                          /features       people/{person_id}/features/{feature}{path}
+        # virtual line  telephony/config/virtualLines   /               telephony/config/virtualLines/{person_id}/{feature}
+        selector = self.selector
+        feature_prefix = self.feature_prefix
+        # some paths need to be remapped
+        alternates = {
+            ('workspaces', 'anonymousCallReject'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'bargeIn'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'callBridge'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'callPolicies'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'doNotDisturb'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'emergencyCallbackNumber'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'musicOnHold'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'outgoingPermission/digitPatterns'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'privacy'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'priorityAlert'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'pushToTalk'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'selectiveAccept'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'selectiveForward'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'selectiveReject'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'sequentialRing'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'simultaneousRing'): ('telephony/config/workspaces', '/'),
+            ('workspaces', 'voicemail'): ('telephony/config/workspaces', '/'),
+            ('people', 'agent'): ('telephony/config/people', '/'),
+            ('people', 'callBridge'): ('telephony/config/people', '/features/'),
+            ('people', 'emergencyCallbackNumber'): ('telephony/config/people', '/'),
+            ('people', 'outgoingPermission/'): ('telephony/config/people', '/'),
+            ('people', 'outgoingPermission/accessCodes'): ('telephony/config/people', '/'),
+            ('people', 'outgoingPermission/digitPatterns'): ('telephony/config/people', '/'),
+            ('people', 'musicOnHold'): ('telephony/config/people', '/'),
+            ('people', 'selectiveAccept'): ('telephony/config/people', '/'),
+            ('people', 'selectiveForward'): ('telephony/config/people', '/'),
+            ('people', 'selectiveReject'): ('telephony/config/people', '/'),
+        }
+        if selector == 'people' and self.feature == 'voicemail' and path == '/passcode':
+            # this is a new endpoint for users and is the only VM endpoint with a different URL structure
+            return self.session.ep(f'telephony/config/people/{person_id}/voicemail/passcode')
+        selector, feature_prefix = alternates.get((selector, self.feature), (selector, feature_prefix))
+        return self.session.ep(f'{selector}/{person_id}{feature_prefix}{self.feature}{path}')
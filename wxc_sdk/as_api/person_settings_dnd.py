@@ -0,0 +1,76 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.dnd import DND
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsDndApi']
+
+
+class AsDndApi(AsPersonSettingsApiChild):
+    """
+    API for person's DND settings. Also used for workspaces
+    """
+
+    feature = 'doNotDisturb'
+
+    async def read(self, entity_id: str, org_id: str = None) -> DND:
+        """
+        Read Do Not Disturb Settings for an entity
+        Retrieve an entity's Do Not Disturb Settings
+
+        When enabled, this feature will give all incoming calls the busy treatment. Optionally, you can enable a Ring
+        Reminder to play a brief tone on your desktop phone when you receive incoming calls.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: Entity is in this organization. Only admin users of another organization (such as partners) may
+        use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        :return:
+        """
+        ep = self.f_ep(entity_id)
+        params = org_id and {'orgId': org_id} or None
+        return DND.model_validate(await self.get(ep, params=params))
+
+    async def configure(self, entity_id: str, dnd_settings: DND, org_id: str = None):
+        """
+        Configure Do Not Disturb Settings for an entity
+        Configure an entity's Do Not Disturb Settings
+
+        When enabled, this feature will give all incoming calls the busy treatment. Optionally, you can enable a Ring
+        Reminder to play a brief tone on your desktop phone when you receive incoming calls.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope or a user
+        auth token with spark:people_write scope can be used by an entity to update their settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param dnd_settings: new setting to be applied
+        :type dnd_settings: DND
+        :param org_id: Entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        """
+        ep = self.f_ep(entity_id)
+        params = org_id and {'orgId': org_id} or None
+        await self.put(ep, params=params, data=dnd_settings.model_dump_json())
@@ -0,0 +1,142 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.ecbn import ECBNDependencies, PersonECBN, SelectedECBN
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsECBNApi']
+
+
+class AsECBNApi(AsPersonSettingsApiChild):
+    """
+    Emergency Callback Configurations can be enabled at the organization level, Users without individual telephone
+    numbers, such as extension-only users, must be set up with accurate Emergency Callback Numbers (ECBN) to enable
+    them to make emergency calls. These users can either utilize the default ECBN for their location or be assigned
+    another specific telephone number from that location for emergency purposes.
+
+    Viewing these settings requires a full or read-only administrator auth token with a scope of
+    `spark-admin:telephony_config_read`. Modifying these settings requires a full administrator auth token with a
+    scope of `spark-admin:telephony_config_write`.
+    """
+
+    feature = 'emergencyCallbackNumber'
+
+    async def read(self, entity_id: str,
+             org_id: str = None) -> PersonECBN:
+        """
+        Get an entity's Emergency Callback Number
+
+        Retrieve an entity's emergency callback number settings. Also applies to workspaces and virtual lines.
+
+        Emergency Callback Configurations can be enabled at the organization level, Users without individual telephone
+        numbers, such as extension-only users, must be set up with accurate Emergency Callback Numbers (ECBN) and
+        Emergency Service Addresses to enable them to make emergency calls. These users can either utilize the default
+        ECBN for their location or be assigned another specific telephone number from that location for emergency
+        purposes.
+
+        To retrieve an entity's callback number requires a full, user or read-only administrator or location
+        administrator auth token with a scope of `spark-admin:telephony_config_read`.
+
+        :param entity_id: Unique identifier for the entity, virtual line, or workspace
+        :type entity_id: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access API.
+        :type org_id: str
+        :rtype: :class:`PersonECBN`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id)
+        data = await super().get(url, params=params)
+        r = PersonECBN.model_validate(data)
+        return r
+
+    async def configure(self, entity_id: str,
+                  selected: SelectedECBN,
+                  location_member_id: str = None, org_id: str = None):
+        """
+        Update an entity's Emergency Callback Number.
+
+        Update an entity's emergency callback number settings. Also applies to workspaces and virtual lines.
+
+        Emergency Callback Configurations can be enabled at the organization level, Users without individual telephone
+        numbers, such as extension-only users, must be set up with accurate Emergency Callback Numbers (ECBN) to
+        enable them to make emergency calls. These users can either utilize the default ECBN for their location or be
+        assigned another specific telephone number from that location for emergency purposes.
+
+        To update an emergency callback number requires a full, location, user, or read-only administrator auth token
+        with a scope of `spark-admin:telephony_config_write`.
+
+        :param entity_id: Unique identifier for the entity, virtual line, or workspace.
+        :type entity_id: str
+        :param selected: The source from which the emergency calling line ID (CLID) is selected for an actual emergency
+            call.
+        :type selected: SelectedECBN
+        :param location_member_id: Member ID of person/workspace/virtual line within the location.
+        :type location_member_id: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['selected'] = enum_str(selected)
+        if location_member_id is not None:
+            body['locationMemberId'] = location_member_id
+        url = self.f_ep(entity_id)
+        await super().put(url, params=params, json=body)
+
+    async def dependencies(self, entity_id: str,
+                     org_id: str = None) -> ECBNDependencies:
+        """
+        Retrieve an entity's Emergency Callback Number Dependencies
+
+        Retrieve Emergency Callback Number dependencies for an entity. Also applies to workspaces and virtual lines.
+
+        Emergency Callback Configurations can be enabled at the organization level, Users without individual telephone
+        numbers, such as extension-only users, must be set up with accurate Emergency Call Back Numbers (ECBN) to
+        enable them to make emergency calls. These users can either utilize the default ECBN for their location or be
+        assigned another specific telephone number from that location for emergency purposes.
+
+        Retrieving the dependencies requires a full, user or read-only administrator or location administrator auth
+        token with a scope of `spark-admin:telephony_config_read`.
+
+        :param entity_id: Unique identifier for the person, virtual line, or workspace
+        :type entity_id: str
+        :param org_id: Retrieve Emergency Callback Number attributes for this organization.
+        :type org_id: str
+        :rtype: :class:`ECBNDependencies`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id, 'dependencies')
+        data = await super().get(url, params=params)
+        r = ECBNDependencies.model_validate(data)
+        return r
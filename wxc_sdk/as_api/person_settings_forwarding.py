@@ -0,0 +1,116 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.forwarding import PersonForwardingSetting
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsPersonForwardingApi']
+
+
+class AsPersonForwardingApi(AsPersonSettingsApiChild):
+    """
+    API for person's call forwarding settings
+
+    Also used for virtual lines, workspaces
+    """
+
+    feature = 'callForwarding'
+
+    async def read(self, entity_id: str, org_id: str = None) -> PersonForwardingSetting:
+        """
+        Retrieve an entity's Call Forwarding Settings
+
+        Three types of call forwarding are supported:
+
+        * Always – forwards all incoming calls to the destination you choose.
+
+        * When busy – forwards all incoming calls to the destination you chose while the phone is in use or the person
+          is busy.
+
+        * When no answer – forwarding only occurs when you are away or not answering your phone.
+
+        In addition, the Business Continuity feature will send calls to a destination of your choice if your phone is
+        not connected to the network for any reason, such as power outage, failed Internet connection, or wiring problem
+
+        This API requires a full, user, or read-only administrator auth token with a scope of spark-admin:people_read
+        or a user auth token with spark:people_read scope can be used by a person to read their own settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: Entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        :return: user's forwarding settings
+        :rtype: PersonForwardingSetting
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        return PersonForwardingSetting.model_validate(await self.get(ep, params=params))
+
+    async def configure(self, entity_id: str, forwarding: PersonForwardingSetting, org_id: str = None):
+        """
+        Configure an Entity's Call Forwarding Settings
+
+        Three types of call forwarding are supported:
+
+        * Always – forwards all incoming calls to the destination you choose.
+
+        * When busy – forwards all incoming calls to the destination you chose while the phone is in use or the entity
+          is busy.
+
+        * When no answer – forwarding only occurs when you are away or not answering your phone.
+
+        In addition, the Business Continuity feature will send calls to a destination of your choice if your phone is
+        not connected to the network for any reason, such as power outage, failed Internet connection, or wiring problem
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope or a user
+        auth token with spark:people_write scope can be used by a person to update their settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param forwarding: new forwarding settings
+        :type forwarding: PersonForwardingSetting
+        :param org_id: Person is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+
+        Example:
+
+            .. code-block:: python
+
+                api = self.api.telephony.virtual_lines.forwarding
+
+                forwarding = api.read(entity_id=self.target.id)
+                always = CallForwardingAlways(
+                    enabled=True,
+                    destination='9999',
+                    destination_voicemail_enabled=True,
+                    ring_reminder_enabled=True)
+                forwarding.call_forwarding.always = always
+                api.configure(entity_id=self.target.id, forwarding=update)
+
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        data = forwarding.update()
+        await self.put(ep, params=params, json=data)
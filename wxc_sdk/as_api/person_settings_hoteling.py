@@ -0,0 +1,84 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsHotelingApi']
+
+
+class AsHotelingApi(AsPersonSettingsApiChild):
+    """
+    API for person's hoteling settings
+    """
+
+    # TODO: this seems to be wrong. For workspace devices methods exist with complete coverage for all hoteling settings
+
+    feature = 'hoteling'
+
+    async def read(self, person_id: str, org_id: str = None) -> bool:
+        """
+        Read Hoteling Settings for a Person
+
+        Retrieve a person's hoteling settings.
+
+        As an administrator, you can enable hoteling for people so that their phone profile (phone number, features,
+        and calling plan) is temporarily loaded onto a shared (host) phone.
+
+        This API requires a full, user, or read-only administrator auth token with a scope of spark-admin:people_read.
+
+        :param person_id: Unique identifier for the person.
+        :type person_id: str
+        :param org_id: Person is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        :return: hoteling setting
+        :rtype: bool
+        """
+        ep = self.f_ep(person_id=person_id)
+        params = org_id and {'orgId': org_id} or None
+        data = await self.get(ep, params=params)
+        return data['enabled']
+
+    async def configure(self, person_id: str, enabled: bool, org_id: str = None):
+        """
+        Configure Hoteling Settings for a Person
+
+        Configure a person's hoteling settings.
+
+        As an administrator, you can enable hoteling for people so that their phone profile (phone number, features,
+        and calling plan) is temporarily loaded onto a shared (host) phone.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope.
+
+        :param person_id: Unique identifier for the person.
+        :type person_id: str
+        :param enabled: When true, allow this person to connect to a Hoteling host device.
+        :type enabled: bool
+        :param org_id: Person is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        """
+        ep = self.f_ep(person_id=person_id)
+        params = org_id and {'orgId': org_id} or None
+        data = json.dumps({'enabled': enabled})
+        await self.put(ep, params=params, json=data)
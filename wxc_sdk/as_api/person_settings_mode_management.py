@@ -0,0 +1,192 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.mode_management import AvailableFeature, ModeManagementFeature
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsModeManagementApi']
+
+
+class AsModeManagementApi(AsApiChild, base='telephony/config/people'):
+    """
+    Operating Mode Management for Person Call Settings
+
+    Person Call Settings supports modifying Webex Calling settings for a specific person.
+
+    Viewing People requires a full, user, or read-only administrator or location administrator auth token with a scope
+    of `spark-admin:people_read` or, for select APIs, a user auth token with `spark:people_read` scope can be used by
+    a person to read their own settings.
+
+    Configuring People settings requires a full, or user administrator or location administrator auth token with the
+    `spark-admin:people_write` scope or, for select APIs, a user auth token with `spark:people_write` scope can be
+    used by a person to update their own settings.
+
+    Call Settings API access can be restricted via Control Hub by a full administrator. Restricting access causes the
+    APIs to throw a `403 Access Forbidden` error.
+
+    See details about `features available by license type for Webex Calling
+    <https://help.webex.com/en-us/article/n1qbbp7/Features-available-by-license-type-for-Webex-Calling>`_.
+    """
+
+    def available_features_gen(self, person_id: str = None, name: str = None,
+                           phone_number: str = None, extension: str = None, order: str = None,
+                           org_id: str = None,
+                           **params) -> AsyncGenerator[AvailableFeature, None, None]:
+        """
+        Retrieve the List of Available Features.
+
+        Retrieve a list of feature identifiers that can be assigned to a user for `Mode Management`. Feature
+        identifiers reference feature instances like `Auto Attendants`, `Call Queues`, and `Hunt Groups`.
+
+        Features with mode-based call forwarding enabled can be assigned to a user for `Mode Management`.
+
+        Retrieving this list requires a full, read-only, or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param person_id: A unique identifier for the user.
+        :type person_id: str
+        :param name: List features whose `name` contains this string.
+        :type name: str
+        :param phone_number: List features whose phoneNumber contains this matching string.
+        :type phone_number: str
+        :param extension: List features whose `extension` contains this matching string.
+        :type extension: str
+        :param order: Sort the list of features based on `name`, `phoneNumber`, or `extension`, either `asc`, or
+            `desc`.
+        :type order: str
+        :param org_id: Retrieve features list from this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableFeature` instances
+        """
+        if name is not None:
+            params['name'] = name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if extension is not None:
+            params['extension'] = extension
+        if order is not None:
+            params['order'] = order
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{person_id}/modeManagement/availableFeatures')
+        return self.session.follow_pagination(url=url, model=AvailableFeature,
+                                              item_key='features', params=params)
+
+    async def available_features(self, person_id: str = None, name: str = None,
+                           phone_number: str = None, extension: str = None, order: str = None,
+                           org_id: str = None,
+                           **params) -> List[AvailableFeature]:
+        """
+        Retrieve the List of Available Features.
+
+        Retrieve a list of feature identifiers that can be assigned to a user for `Mode Management`. Feature
+        identifiers reference feature instances like `Auto Attendants`, `Call Queues`, and `Hunt Groups`.
+
+        Features with mode-based call forwarding enabled can be assigned to a user for `Mode Management`.
+
+        Retrieving this list requires a full, read-only, or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param person_id: A unique identifier for the user.
+        :type person_id: str
+        :param name: List features whose `name` contains this string.
+        :type name: str
+        :param phone_number: List features whose phoneNumber contains this matching string.
+        :type phone_number: str
+        :param extension: List features whose `extension` contains this matching string.
+        :type extension: str
+        :param order: Sort the list of features based on `name`, `phoneNumber`, or `extension`, either `asc`, or
+            `desc`.
+        :type order: str
+        :param org_id: Retrieve features list from this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableFeature` instances
+        """
+        if name is not None:
+            params['name'] = name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if extension is not None:
+            params['extension'] = extension
+        if order is not None:
+            params['order'] = order
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{person_id}/modeManagement/availableFeatures')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableFeature,
+                                              item_key='features', params=params)]
+
+    async def assigned_features(self, person_id: str = None,
+                          org_id: str = None) -> list[ModeManagementFeature]:
+        """
+        Retrieve the List of Features Assigned to a User for Mode Management.
+
+        Retrieve a list of feature identifiers that are already assigned to a user for `Mode Management`. Feature
+        identifiers reference feature instances like `Auto Attendants`, `Call Queues`, and `Hunt Groups`.
+        A maximum of 50 features can be assigned to a user for `Mode Management`.
+
+        Features with mode-based call forwarding enabled can be assigned to a user for `Mode Management`.
+
+        Retrieving this list requires a full, read-only, or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param person_id: A unique identifier for the user.
+        :type person_id: str
+        :param org_id: Retrieve features list from this organization.
+        :type org_id: str
+        :rtype: list[ModeManagementFeature]
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{person_id}/modeManagement/features')
+        data = await super().get(url, params=params)
+        r = type_adapter(list[ModeManagementFeature]).validate_python(data['features'])
+        return r
+
+    async def assign_features(self, feature_ids: list[str], person_id: str = None, org_id: str = None):
+        """
+        Assign a List of Features to a User for Mode Management.
+
+        Assign a user a list of feature identifiers for `Mode Management`. Feature identifiers reference feature
+        instances like `Auto Attendants`, `Call Queues`, and `Hunt Groups`.
+        A maximum of 50 features can be assigned to a user for `Mode Management`.
+
+        Updating mode management settings for a user requires a full, or location administrator auth token with a scope
+        of `spark-admin:telephony_config_write`.
+
+        :param feature_ids: Array of feature IDs.
+        :type feature_ids: list[str]
+        :param person_id: A unique identifier for the user.
+        :type person_id: str
+        :param org_id: Retrieve features list from this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['featureIds'] = feature_ids
+        url = self.ep(f'{person_id}/modeManagement/features')
+        await super().put(url, params=params, json=body)
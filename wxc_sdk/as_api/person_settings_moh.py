@@ -0,0 +1,86 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.moh import MusicOnHold
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsMusicOnHoldApi']
+
+
+class AsMusicOnHoldApi(AsPersonSettingsApiChild):
+
+    feature = 'musicOnHold'
+
+    async def read(self, entity_id: str, org_id: str = None) -> MusicOnHold:
+        """
+        Retrieve Music On Hold Settings for a Person, virtual line, or workspace.
+
+        Retrieve the music on hold settings.
+
+        Music on hold is played when a caller is put on hold, or the call is parked.
+
+        Retrieving a person's music on hold settings requires a full, user or read-only administrator or location
+        administrator auth token with a scope of `spark-admin:telephony_config_read`.
+
+        :param entity_id: Unique identifier for the person, virtual line, or workspace.
+        :type entity_id: str
+        :param org_id: ID of the organization in which the person resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access API.
+        :type org_id: str
+        :rtype: :class:`GetMusicOnHoldObject`
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.f_ep(entity_id)
+        data = await super().get(url, params=params)
+        r = MusicOnHold.model_validate(data)
+        return r
+
+    async def configure(self, entity_id: str, settings: MusicOnHold,
+                  org_id: str = None):
+        """
+        Configure Music On Hold Settings for a Personvirtual line, or workspace.
+
+        Configure music on hold settings.
+
+        Music on hold is played when a caller is put on hold, or the call is parked.
+
+        To configure music on hold settings for a person, music on hold setting must be enabled for this location.
+
+        Updating a person's music on hold settings requires a full or user administrator or location administrator auth
+        token with a scope of `spark-admin:telephony_config_write`.
+
+        :param entity_id: Unique identifier for the person, virtual line, or workspace.
+        :type entity_id: str
+        :param settings: new MOH settings
+        :type settings: MusicOnHold
+        :param org_id: ID of the organization in which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = org_id and {'orgId': org_id} or None
+        body = settings.update()
+        url = self.f_ep(entity_id)
+        await super().put(url, params=params, json=body)
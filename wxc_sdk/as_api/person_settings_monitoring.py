@@ -0,0 +1,97 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.monitoring import Monitoring
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsMonitoringApi']
+
+
+class AsMonitoringApi(AsPersonSettingsApiChild):
+    """
+    API for person's call monitoring settings, also used for workspaces
+    """
+
+    feature = 'monitoring'
+
+    async def read(self, entity_id: str, org_id: str = None) -> Monitoring:
+        """
+        Retrieve an entity's Monitoring Settings
+
+        Retrieves the monitoring settings of the entity, which shows specified people, places, virtual lines or call
+        park extensions that are being monitored.
+
+        Monitors the line status which indicates if a person, place or virtual line is on a call and if a call has been
+        parked on that extension.
+
+        This API requires a full, user, or read-only administrator or location administrator auth token with a scope of
+        `spark-admin:people_read`.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: ID of the organization in which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access API.
+        :type org_id: str
+        :return: monitoring settings
+        :rtype: :class:`Monitoring`
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        data = await self.get(ep, params=params)
+        return Monitoring.model_validate(data)
+
+    async def configure(self, entity_id: str, settings: Monitoring, org_id: str = None):
+        """
+        Modify an entity's Monitoring Settings
+
+        Modifies the monitoring settings of the entity.
+
+        Monitors the line status of specified people, places, virtual lines or call park extension. The line status
+        indicates if a person, place or virtual line is on a call and if a call has been parked on that extension.
+
+        This API requires a full or user administrator or location administrator auth token with the
+        `spark-admin:people_write` scope.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param settings: settings for update
+        :type settings: :class:`Monitoring`
+        :param org_id: Person is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        data = {}
+        if settings.call_park_notification_enabled is not None:
+            data['enableCallParkNotification'] = settings.call_park_notification_enabled
+        if settings.monitored_elements is not None:
+            id_list = []
+            for me in settings.monitored_elements:
+                if isinstance(me, str):
+                    id_list.append(me)
+                else:
+                    id_list.append(me.member and me.member.member_id or me.cpe and me.cpe.cpe_id)
+            data['monitoredElements'] = id_list
+        await self.put(ep, params=params, json=data)
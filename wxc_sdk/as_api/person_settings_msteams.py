@@ -0,0 +1,158 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.msteams import MSTeamsSettings, OrgMSTeamsSettings
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsMSTeamsSettingApi', 'AsOrgMSTeamsSettingApi']
+
+
+class AsMSTeamsSettingApi(AsApiChild, base='telephony/config/people'):
+    async def read(self, person_id: str,
+             org_id: str = None) -> MSTeamsSettings:
+        """
+        Retrieve a Person's MS Teams Settings
+
+        At a person level, MS Teams settings allow access to retrieving the `HIDE WEBEX APP` and `PRESENCE SYNC`
+        settings.
+
+        To retrieve a person's MS Teams settings requires a full or read-only administrator auth token with a scope
+        of `spark-admin:telephony_config_read`.
+
+        :param person_id: Unique identifier for the person.
+        :type person_id: str
+        :param org_id: ID of the organization in which the person resides. Only admin users of another organization
+            (such as partners) may use this parameter since the default is the same organization as the token used to
+            access the API.
+        :type org_id: str
+        :rtype: :class:`MSTeamsSettings`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{person_id}/settings/msTeams')
+        data = await super().get(url, params=params)
+        r = MSTeamsSettings.model_validate(data)
+        return r
+
+    async def configure(self, person_id: str,
+                  setting_name: str, value: bool,
+                  org_id: str = None):
+        """
+        Configure a Person's MS Teams Setting
+
+        MS Teams settings can be configured at the person level.
+
+        Requires a full administrator auth token with a scope of `spark-admin:telephony_config_write`.
+
+        :param person_id: Unique identifier for the person.
+        :type person_id: str
+        :param setting_name: The enum value to be set to `HIDE_WEBEX_APP`.
+        :type setting_name: str
+        :param value: The boolean value to update the `HIDE_WEBEX_APP` setting, either `true` or `false`. Set to `null`
+            to delete the `HIDE_WEBEX_APP` setting.
+        :type value: bool
+        :param org_id: ID of the organization in which the person resides. Only admin users of another organization
+            (such as partners) may use this parameter since the default is the same organization as the token used to
+            access the API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['settingName'] = setting_name
+        body['value'] = value
+        url = self.ep(f'{person_id}/settings/msTeams')
+        await super().put(url, params=params, json=body)
+
+
+class AsOrgMSTeamsSettingApi(AsApiChild, base='telephony/config/settings/msTeams'):
+    """
+    Client Call Settings
+
+    Client Call Settings supports reading and writing of Webex Calling client settings for a specific organization.
+
+    Viewing these read-only organization settings requires a full or read-only administrator auth token with a scope of
+    `spark-admin:telephony_config_read`.
+
+    Modifying these organization settings requires a full administrator auth token with a scope of
+    `spark-admin:telephony_config_write`.
+
+    A partner administrator can retrieve or change settings in a customer's organization using the optional `orgId`
+    query parameter.
+    """
+
+    async def read(self, org_id: str = None) -> OrgMSTeamsSettings:
+        """
+        Get an Organization's MS Teams Settings
+
+        Get organization MS Teams settings.
+
+        At an organization level, MS Teams settings allow access to viewing the `HIDE WEBEX APP` and `PRESENCE SYNC`
+        settings.
+
+        To retrieve an organization's MS Teams settings requires a full or read-only administrator auth token with a
+        scope of `spark-admin:telephony_config_read`.
+
+        :param org_id: Retrieve MS Teams settings for the organization.
+        :type org_id: str
+        :rtype: :class:`OrgMSTeamsSettings`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep()
+        data = await super().get(url, params=params)
+        r = OrgMSTeamsSettings.model_validate(data)
+        return r
+
+    async def configure(self, setting_name: str, value: bool,
+                  org_id: str = None):
+        """
+        Update an Organization's MS Teams Setting
+
+        Update an MS Teams setting.
+
+        MS Teams setting can be updated at the organization level.
+
+        Requires a full administrator auth token with a scope of `spark-admin:telephony_config_write`.
+
+        :param setting_name: The enum value, either `HIDE_WEBEX_APP` or `PRESENCE_SYNC`, for the respective
+            `settingName` to be updated.
+        :type setting_name: SettingsObjectSettingName
+        :param value: The boolean value, either `true` or `false`, for the respective `settingName` to be updated.
+        :type value: bool
+        :param org_id: Update MS Teams setting value for the organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['settingName'] = setting_name
+        body['value'] = value
+        url = self.ep()
+        await super().put(url, params=params, json=body)
@@ -0,0 +1,85 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.numbers import PersonNumbers, UpdatePersonNumbers
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsNumbersApi']
+
+
+class AsNumbersApi(AsPersonSettingsApiChild):
+    """
+    API for person's numbers
+    """
+
+    feature = 'numbers'
+
+    async def read(self, person_id: str, prefer_e164_format: bool = None, org_id: str = None) -> PersonNumbers:
+        """
+        Get a person's phone numbers including alternate numbers.
+
+        A person can have one or more phone numbers and/or extensions via which they can be called.
+
+        This API requires a full or user administrator auth token with
+        the spark-admin:people_read scope.
+
+        :param person_id: Unique identifier for the person.
+        :type person_id: str
+        :param prefer_e164_format: Return phone numbers in E.164 format.
+        :type prefer_e164_format: bool
+        :param org_id: Person is in this organization. Only admin users of another organization (such as partners) may
+            use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        :return: Alternate numbers of the user
+        :rtype: :class:`PersonNumbers`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        if prefer_e164_format is not None:
+            params['preferE164Format'] = str(prefer_e164_format).lower()
+        ep = self.f_ep(person_id=person_id)
+        return PersonNumbers.model_validate(await self.get(ep, params=params))
+
+    async def update(self, person_id: str, update: UpdatePersonNumbers, org_id: str = None):
+        """
+        Assign or unassign alternate phone numbers to a person.
+
+        Each location has a set of phone numbers that can be assigned to people, workspaces, or features. Phone
+        numbers must follow E.164 format for all countries, except for the United States, which can also follow the
+        National format. Active phone numbers are in service.
+
+        Assigning or Unassigning an alternate phone number to a person requires a full administrator auth token with
+        a scope of spark-admin:telephony_config_write.
+
+        :param person_id: Unique identifier of the person.
+        :type person_id: str
+        :param update: Update to apply
+        :type update: :class:`UpdatePersonNumbers`
+        :param org_id: organization to work on
+        :type org_id: str
+        """
+        url = self.session.ep(f'telephony/config/people/{person_id}/numbers')
+        params = org_id and {'orgId': org_id} or None
+        body = update.model_dump_json()
+        await self.put(url=url, params=params, data=body)
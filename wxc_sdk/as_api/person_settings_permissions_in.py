@@ -0,0 +1,82 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.permissions_in import IncomingPermissions
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsIncomingPermissionsApi']
+
+
+class AsIncomingPermissionsApi(AsPersonSettingsApiChild):
+    """
+    API for incoming permissions settings
+
+    Also used for virtual lines, workspaces
+    """
+
+    feature = 'incomingPermission'
+
+    async def read(self, entity_id: str, org_id: str = None) -> IncomingPermissions:
+        """
+        Read Incoming Permission Settings
+
+        Retrieve Incoming Permission Settings
+
+        You can change the incoming calling permissions for an entity if you want them to be different from your
+        organization's default.
+
+        This API requires a full, user, or read-only administrator auth token with a scope of spark-admin:people_read.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        :return: incoming permission settings for specific user
+        :rtype: :class:`IncomingPermissions`
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        return IncomingPermissions.model_validate(await self.get(ep, params=params))
+
+    async def configure(self, entity_id: str, settings: IncomingPermissions, org_id: str = None):
+        """
+        Configure incoming permissions settings
+
+        The Barge In feature enables you to use a Feature Access Code (FAC) to answer a call that was directed to
+        another subscriber, or barge-in on the call if it was already answered. Barge In can be used across locations.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope or a user
+        auth token with spark:people_write scope can be used by an entity to update their own settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param settings: new setting to be applied
+        :type settings: :class:`IncomingPermissions`
+        :param org_id: entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        await self.put(ep, params=params, data=settings.model_dump_json())
@@ -0,0 +1,465 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.permissions_out import ApiSelector, AuthCode, AuthCodes, AutoTransferNumbers, \
+    DigitPattern, DigitPatterns, OutgoingPermissions
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsAccessCodesApi', 'AsDigitPatternsApi', 'AsOutgoingPermissionsApi', 'AsTransferNumbersApi']
+
+
+class AsAccessCodesApi(AsPersonSettingsApiChild):
+    """
+    API for outgoing permission access codes: locations, persons, workspaces, virtual lines
+    """
+    feature = 'outgoingPermission/accessCodes'
+
+    async def read(self, entity_id: str, org_id: str = None) -> AuthCodes:
+        """
+        Retrieve Access codes.
+
+        Access codes are used to bypass permissions.
+
+        This API requires a full or read-only administrator auth token with a scope of spark-admin:workspaces_read or
+        a user auth token with spark:workspaces_read scope can be used to read entity settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the token
+            used to access API.
+        :type org_id: str
+        :return: authorization codes
+        :rtype: :class:`AuthCodes`
+        """
+        url = self.f_ep(entity_id)
+        params = org_id and {'orgId': org_id} or None
+        data = await self.get(url, params=params)
+        return AuthCodes.model_validate(data)
+
+    async def modify(self, entity_id: str, use_custom_access_codes: bool = None,
+               delete_codes: list[Union[str, AuthCode]] = None, org_id: str = None):
+        """
+        Modify Access Codes
+
+        Access codes are used to bypass permissions.
+
+        This API requires a full or user administrator or location administrator auth token with
+        the `spark-admin:telephony_config_write` scope.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param use_custom_access_codes: When `true`, use custom settings for the access codes category of outgoing call
+            permissions.
+        :type use_custom_access_codes: bool
+        :param delete_codes: Indicates access codes to delete.
+        :type delete_codes: list[str]
+        :param org_id: ID of the organization in which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access the API.
+        :type org_id: str
+        :rtype: None
+        """
+        url = self.f_ep(entity_id)
+        params = org_id and {'orgId': org_id} or None
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        if use_custom_access_codes is not None:
+            body['useCustomAccessCodes'] = use_custom_access_codes
+        if delete_codes is not None:
+            body['deleteCodes'] = [ac.code if isinstance(ac, AuthCode) else ac
+                                   for ac in delete_codes]
+        await super().put(url, params=params, json=body)
+
+    async def create(self, entity_id: str, code: str, description: str, org_id: str = None):
+        """
+        Create new Access codes.
+
+        Access codes are used to bypass permissions.
+
+        This API requires a full or user administrator auth token with the spark-admin:workspaces_write scope or a
+        user auth token with spark:workspaces_write scope can be used to update workspace settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param code: Indicates an access code.
+        :type code: str
+        :param description: Indicates the description of the access code.
+        :type description: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the token
+            used to access API.
+        :type org_id: str
+        """
+        url = self.f_ep(entity_id)
+        params = org_id and {'orgId': org_id} or None
+        body = {'code': code,
+                'description': description}
+        await self.post(url, params=params, json=body)
+
+    async def delete(self, entity_id: str, org_id: str = None):
+        """
+        Delete Access Code
+
+        Deletes all Access codes for the given entity.
+
+        Access codes are used to bypass permissions.
+
+        This API requires a full or user administrator or location administrator auth token with the
+        `spark-admin:workspaces_write` scope or a user auth token with `spark:workspaces_write` scope can be used to
+        update entity settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access the API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id)
+        await super().delete(url, params=params)
+
+
+class AsDigitPatternsApi(AsPersonSettingsApiChild):
+    feature = 'outgoingPermission/digitPatterns'
+
+    async def get_digit_patterns(self, entity_id: str,
+                           org_id: str = None) -> DigitPatterns:
+        """
+        Retrieve Digit Patterns
+
+        Retrieve digit patterns.
+
+        Digit patterns are used to bypass permissions.
+
+        Retrieving digit patterns requires a full or user or read-only administrator or location administrator auth
+        token with a scope of `spark-admin:telephony_config_read`.
+
+        :param entity_id: Unique identifier for location, person, workspace, or virtual line.
+        :type entity_id: str
+        :param org_id: ID of the organization in which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access the API.
+        :type org_id: str
+        :rtype: :class:`UserOutgoingPermissionDigitPatternGetListObject`
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.f_ep(entity_id)
+        data = await super().get(url, params=params)
+        r = DigitPatterns.model_validate(data)
+        return r
+
+    async def details(self, entity_id: str, digit_pattern_id: str,
+                org_id: str = None) -> DigitPattern:
+        """
+        Retrieve Digit Pattern Details
+
+        Retrieve the digit pattern details.
+
+        Digit patterns are used to bypass permissions.
+
+        Retrieving the digit pattern details requires a full or user or read-only administrator or location
+        administrator auth token with a scope of `spark-admin:telephony_config_read`.
+
+        :param entity_id: Unique identifier for location, person, workspace, or virtual line.
+        :type entity_id: str
+        :param digit_pattern_id: Unique identifier for the digit pattern.
+        :type digit_pattern_id: str
+        :param org_id: ID of the organization in which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access the API.
+        :type org_id: str
+        :rtype: :class:`UserDigitPatternObject`
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.f_ep(entity_id, path=digit_pattern_id)
+        data = await super().get(url, params=params)
+        r = DigitPattern.model_validate(data)
+        return r
+
+    async def create(self, entity_id: str, pattern: DigitPattern, org_id: str = None) -> str:
+        """
+        Create Digit Patterns
+
+        Create new digit pattern.
+
+        Digit patterns are used to bypass permissions.
+
+        Creating the digit pattern requires a full or user or location administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param entity_id: Unique identifier for location, person, workspace, or virtual line.
+        :type entity_id: str
+        :param pattern: new digit pattern
+        :type pattern: :class:`DigitPattern`
+        :param org_id: ID of the organization in which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access the API.
+        :type org_id: str
+        :rtype: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        body = pattern.create_or_update()
+        url = self.f_ep(entity_id)
+        data = await super().post(url, params=params, json=body)
+        r = data['id']
+        return r
+
+    async def update_category_control_settings(self, entity_id: str,
+                                         use_custom_digit_patterns: bool = None,
+                                         org_id: str = None):
+        """
+        Modify the Digit Pattern Category Control Settings for the entity
+
+        Modifies whether this user uses the specified digit patterns when placing outbound calls or not.
+
+        Updating the digit pattern category control settings requires a full or user or location administrator auth
+        token with a scope of `spark-admin:telephony_config_write`.
+
+        :param entity_id: Unique identifier for location, person, workspace, or virtual line.
+        :type entity_id: str
+        :param use_custom_digit_patterns: When `true`, use custom settings for the digit patterns category of outgoing
+            call permissions.
+        :type use_custom_digit_patterns: bool
+        :param org_id: ID of the organization in which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access the API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = org_id and {'orgId': org_id} or None
+        body = dict()
+        if use_custom_digit_patterns is not None:
+            body['useCustomDigitPatterns'] = use_custom_digit_patterns
+        url = self.f_ep(entity_id)
+        await super().put(url, params=params, json=body)
+
+    async def update(self, entity_id: str, settings: DigitPattern, org_id: str = None):
+        """
+        Modify Digit Patterns
+
+        Modify Digit Patterns
+
+        Digit patterns are used to bypass permissions.
+
+        Updating the digit pattern requires a full or user or location administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param entity_id: Unique identifier for location, person, workspace, or virtual line.
+        :type entity_id: str
+        :param settings: new digit pattern settings
+        :type settings: :class:`DigitPattern`
+        :param org_id: ID of the organization in which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access the API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = org_id and {'orgId': org_id} or None
+        body = settings.create_or_update()
+        url = self.f_ep(entity_id, path=settings.id)
+        await super().put(url, params=params, json=body)
+
+    async def delete(self, entity_id: str, digit_pattern_id: str, org_id: str = None):
+        """
+        Delete a Digit Pattern
+
+        Delete Digit Pattern.
+
+        Digit patterns are used to bypass permissions.
+
+        Deleting the digit pattern requires a full or user or location administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param entity_id: Unique identifier for location, person, workspace, or virtual line.
+        :type entity_id: str
+        :param digit_pattern_id: Unique identifier for the digit pattern.
+        :type digit_pattern_id: str
+        :param org_id: ID of the organization in which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access the API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.f_ep(entity_id, path=digit_pattern_id)
+        await super().delete(url, params=params)
+
+    async def delete_all(self, entity_id: str, org_id: str = None):
+        """
+        Delete all Digit Patterns.
+
+        Digit patterns are used to bypass permissions.
+
+        Deleting the digit patterns requires a full or user or location administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param entity_id: Unique identifier for location, person, workspace, or virtual line.
+        :type entity_id: str
+        :param org_id: ID of the organization in which the entity resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access the API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.f_ep(entity_id)
+        await super().delete(url, params=params)
+
+
+class AsTransferNumbersApi(AsPersonSettingsApiChild):
+    """
+    API for outgoing permission auto transfer numbers
+    """
+    feature = 'outgoingPermission/autoTransferNumbers'
+
+    async def read(self, entity_id: str, org_id: str = None) -> AutoTransferNumbers:
+        """
+        Retrieve Transfer Numbers Settings .
+
+        When calling a specific call type, this entity will be automatically transferred to another number. The
+        person assigned the Auto Transfer Number can then approve the call and send it through or reject the call
+        type. You can add up to 3 numbers.
+
+        This API requires a full or read-only administrator auth token with a scope of spark-admin:workspaces_read or
+        a user auth token with spark:workspaces_read scope can be used to read entity settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        :return: auto transfer numbers
+        :rtype: :class:`AutoTransferNumbers`
+        """
+        url = self.f_ep(entity_id)
+        params = org_id and {'orgId': org_id} or None
+        data = await self.get(url, params=params)
+        return AutoTransferNumbers.model_validate(data)
+
+    async def configure(self, entity_id: str, settings: AutoTransferNumbers, org_id: str = None):
+        """
+        Modify Transfer Numbers Settings for an entity.
+
+        When calling a specific call type, this entity will be automatically transferred to another number.
+        The person assigned the Auto Transfer Number can then approve the call and send it through or reject the
+        call type. You can add up to 3 numbers.
+
+        This API requires a full or user administrator auth token with the spark-admin:workspaces_write scope or a
+        user auth token with spark:workspaces_write scope can be used to update entity settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param settings: new auto transfer numbers
+        :type settings: :class:`AutoTransferNumbers`
+        :param org_id: entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        """
+        url = self.f_ep(entity_id)
+        params = org_id and {'orgId': org_id} or None
+        body = settings.model_dump_json()
+        await self.put(url, params=params, data=body)
+
+
+@dataclass(init=False, repr=False)
+class AsOutgoingPermissionsApi(AsPersonSettingsApiChild):
+    """
+    API for outgoing permissions settings
+
+    Also used for user, workspace, location, and virtual line outgoing permissions
+    """
+    transfer_numbers: AsTransferNumbersApi
+    access_codes: AsAccessCodesApi
+    digit_patterns: AsDigitPatternsApi
+
+    feature = 'outgoingPermission'
+
+    def __getattribute__(self, item):
+        if item == 'access_codes' and self.selector == ApiSelector.location:
+            raise AttributeError("access_codes API is not available for locations. Use the telephony access_codes API")
+        return super().__getattribute__(item)
+
+    def __init__(self, *, session: AsRestSession,
+                 selector: ApiSelector = 'person'):
+        super().__init__(session=session, selector=selector)
+        self.transfer_numbers = AsTransferNumbersApi(session=session, selector=selector)
+        if selector == ApiSelector.location:
+            # Apparently there is a difference between access code API for locations on one hand and users,
+            # workspaces, and virtual lines one the other.
+            # For locations, we can create multiple access codes at once.
+            self.access_codes = None    # instead use the access_codes API at the telephony level
+        else:
+            self.access_codes = AsAccessCodesApi(session=session, selector=selector)
+        self.digit_patterns = AsDigitPatternsApi(session=session, selector=selector)
+
+    async def read(self, entity_id: str, org_id: str = None) -> OutgoingPermissions:
+        """
+        Retrieve Outgoing Calling Permissions Settings
+
+        You can change the outgoing calling permissions for a person if you want them to be different from your
+        organization's default.
+
+        This API requires a full, user, or read-only administrator auth token with a scope of spark-admin:people_read.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: Entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        :return: outgoing permission settings for specific user
+        :rtype: :class:`OutgoingPermissions`
+        """
+        ep = self.f_ep(entity_id)
+        params = org_id and {'orgId': org_id} or None
+        return OutgoingPermissions.model_validate(await self.get(ep, params=params))
+
+    async def configure(self, entity_id: str, settings: OutgoingPermissions, drop_call_types: set[str] = None,
+                  org_id: str = None):
+        """
+        Configure Outgoing Calling Permissions Settings
+
+        Turn on outgoing call settings for this entity to override the calling settings from the location that are
+        used by default.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope or a user
+        auth token with spark:people_write scope can be used by a person to update their own settings.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param settings: new setting to be applied
+        :type settings: :class:`OutgoingPermissions`
+        :param drop_call_types: set of call type names to be excluded from updates. Default is the set of call_types
+            known to be not supported for updates
+        :type drop_call_types: set[str]
+        :param org_id: Entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        """
+        ep = self.f_ep(entity_id)
+        params = org_id and {'orgId': org_id} or None
+        await self.put(ep, params=params, data=settings.model_dump_json(drop_call_types=drop_call_types))
@@ -0,0 +1,83 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.personal_assistant import PersonalAssistant
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsPersonalAssistantApi']
+
+
+class AsPersonalAssistantApi(AsApiChild, base=''):
+    """
+    API for personal assistant settings
+
+    """
+
+    async def get(self, person_id: str, org_id: str = None) -> PersonalAssistant:
+        """
+        Get Personal Assistant
+
+        Retrieve Personal Assistant details for a specific user.
+
+        Personal Assistant is used to manage a user's incoming calls when they are away.
+
+        Retrieving Personal Assistant details requires a full, user, or read-only administrator auth token with a scope
+        of `spark-admin:telephony_config_read`.
+
+        :param person_id: Unique identifier for the person.
+        :type person_id: str
+        :param org_id: Get Personal Assistant details for the organization.
+        :type org_id: str
+        :rtype: :class:`PersonalAssistant`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'telephony/config/people/{person_id}/features/personalAssistant')
+        data = await super().get(url, params=params)
+        r = PersonalAssistant.model_validate(data)
+        return r
+
+    async def update(self, person_id: str, settings: PersonalAssistant, org_id: str = None):
+        """
+        Update Personal Assistant
+
+        Update Personal Assistant details for a specific user.
+
+        Personal Assistant is used to manage a user's incoming calls when they are away.
+
+        Updating Personal Assistant details requires a full or user administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param person_id: Unique identifier for the person.
+        :type person_id: str
+        :param settings: Personal Assistant settings.
+        :type settings: PersonalAssistant
+        :param org_id: Update Personal Assistant details for the organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {'orgId': org_id} if org_id is not None else None
+        body = settings.model_dump(mode='json', exclude_unset=True, by_alias=True)
+        url = self.ep(f'telephony/config/people/{person_id}/features/personalAssistant')
+        await super().put(url, params=params, json=body)
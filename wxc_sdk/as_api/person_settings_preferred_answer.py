@@ -0,0 +1,86 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.preferred_answer import PreferredAnswerResponse
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsPreferredAnswerApi']
+
+
+class AsPreferredAnswerApi(AsApiChild, base='telephony/config/people'):
+
+    # noinspection PyMethodOverriding
+    def ep(self, person_id: str) -> str:
+        """
+        :meta private:
+        """
+        return super().ep(f'{person_id}/preferredAnswerEndpoint')
+
+    async def read(self, person_id: str, org_id: str = None) -> PreferredAnswerResponse:
+        """
+        Get Preferred Answer Endpoint
+        Get the person's preferred answer endpoint (if any) and the list of endpoints available for selection. These
+        endpoints can be used by the following Call Control API's that allow the person to specify an endpointId to
+        use for the call:
+
+        /v1/telephony/calls/dial
+
+        /v1/telephony/calls/retrieve
+
+        /v1/telephony/calls/pickup
+
+        /v1/telephony/calls/barge-in
+
+        /v1/telephony/calls/answer
+
+        This API requires spark:telephony_config_read or spark-admin:telephony_config_read scope.
+
+        :param person_id: A unique identifier for the person.
+        :param org_id: ID of the organization in which the person resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access
+            API.
+        :return: person's preferred answer endpoint settings
+        :rtype: PreferredAnswerResponse
+        """
+        params = org_id and {'orgId': org_id} or None
+        ep = self.ep(person_id=person_id)
+        return PreferredAnswerResponse.model_validate(await self.get(ep, params=params))
+
+    async def modify(self, person_id: str, preferred_answer_endpoint_id: str, org_id: str = None):
+        """
+        Modify Preferred Answer Endpoint
+        Sets or clears the person’s preferred answer endpoint. To clear the preferred answer endpoint the p
+        preferred_answer_endpoint_id parameter must be set to None.
+        This API requires spark:telephony_config_write or spark-admin:telephony_config_write scope.
+
+        :param person_id: A unique identifier for the person.
+        :param preferred_answer_endpoint_id: Person’s preferred answer endpoint.
+        :param org_id: ID of the organization in which the person resides. Only admin users of another organization
+            (such as partners) may use this parameter as the default is the same organization as the token used to
+            access
+            API.
+        """
+        params = org_id and {'orgId': org_id} or None
+        ep = self.ep(person_id=person_id)
+        await self.put(ep, params=params, json={'preferredAnswerEndpointId': preferred_answer_endpoint_id})
@@ -0,0 +1,221 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.priority_alert import PriorityAlert, PriorityAlertCriteria
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsPriorityAlertApi']
+
+
+class AsPriorityAlertApi(AsPersonSettingsApiChild):
+    """
+    API for priority alert settings
+
+    For now only used for workspaces
+    """
+
+    feature = 'priorityAlert'
+
+    async def read_criteria(self, entity_id: str, id: str,
+                      org_id: str = None) -> PriorityAlertCriteria:
+        """
+        Retrieve Priority Alert Criteria for a Workspace
+
+        Retrieve Priority Alert Criteria Settings for a Workspace.
+
+        The priority alert feature enables administrators to configure priority alert settings for a professional
+        workspace.
+
+        Priority Alert Criteria (Schedules) can also be set up to alert these phones during certain times of the day or
+        days of the week.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param id: Unique identifier for the criteria.
+        :type id: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: :class:`PriorityAlertCriteria`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id, f'criteria/{id}')
+        data = await super().get(url, params=params)
+        r = PriorityAlertCriteria.model_validate(data)
+        return r
+
+    async def configure_criteria(self, entity_id: str, id: str, settings: PriorityAlertCriteria,
+                           org_id: str = None):
+        """
+        Modify Priority Alert Criteria for a Workspace
+
+        Modify Priority Alert Criteria Settings for a Workspace.
+
+        The priority alert feature enables administrators to configure priority alert settings for a professional
+        workspace.
+
+        Priority Alert Criteria (Schedules) can also be set up to alert these phones during certain times of the day or
+        days of the week.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param id: Unique identifier for the criteria.
+        :type id: str
+        :param settings: new settings to be applied.
+        :type settings: PriorityAlertCriteria
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = settings.update()
+
+        url = self.f_ep(entity_id, f'criteria/{id}')
+        await super().put(url, params=params, json=body)
+
+    async def delete_criteria(self, entity_id: str, id: str, org_id: str = None):
+        """
+        Delete Priority Alert Criteria for a Workspace
+
+        Delete Priority Alert criteria Settings for a workspace.
+
+        The priority alert feature enables administrators to configure priority alert settings for a professional
+        workspace.
+
+        Priority Alert Criteria (Schedules) can also be set up to alert these phones during certain times of the day or
+        days of the week.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param id: Unique identifier for the criteria.
+        :type id: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id, f'criteria/{id}')
+        await super().delete(url, params=params)
+
+    async def create_criteria(self, entity_id: str, settings: PriorityAlertCriteria, org_id: str = None) -> str:
+        """
+        Create Priority Alert Criteria for a Workspace
+
+        Create Priority Alert Criteria Settings for a Workspace.
+
+        The priority alert feature enables administrators to configure priority alert settings for a professional
+        workspace.
+
+        Priority Alert Criteria (Schedules) can also be set up to alert these phones during certain times of the day or
+        days of the week.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param settings: new settings to be applied.
+        :type settings: PriorityAlertCriteria
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: str
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = settings.update()
+        url = self.f_ep(entity_id, 'criteria')
+        data = await super().post(url, params=params, json=body)
+        r = data['id']
+        return r
+
+    async def read(self, entity_id: str,
+             org_id: str = None) -> PriorityAlert:
+        """
+        Retrieve Priority Alert Settings for a Workspace.
+
+        The priority alert feature enables administrators to configure priority alert settings for a professional
+        workspace.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: :class:`PriorityAlert`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id)
+        data = await super().get(url, params=params)
+        r = PriorityAlert.model_validate(data)
+        return r
+
+    async def configure(self, entity_id: str, settings: PriorityAlert,
+                  org_id: str = None):
+        """
+        Configure Priority Alert Settings for a Workspace
+
+        Configure a workspace Priority Alert Settings.
+
+        The priority alert feature enables administrator to configure priority alert settings for a professional
+        workspace.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param settings: Settings for new criteria
+        :type settings: PriorityAlert
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = settings.update()
+        url = self.f_ep(entity_id)
+        await super().put(url, params=params, json=body)
@@ -0,0 +1,92 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.privacy import Privacy
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsPrivacyApi']
+
+
+class AsPrivacyApi(AsPersonSettingsApiChild):
+    """
+    API for privacy settings for users, vírtual lines and workspaces
+    """
+
+    feature = 'privacy'
+
+    async def read(self, entity_id: str, org_id: str = None) -> Privacy:
+        """
+        Get Privacy Settings for an entity
+
+        Get privacy settings for the specified entity id.
+
+        The privacy feature enables the entity's line to be monitored by others and determine if they can be reached
+        by Auto Attendant services.
+
+        This API requires a full, user, or read-only administrator auth token with a scope of spark-admin:people_read.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: Entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        :return: privacy settings
+        :rtype: :class:`Privacy`
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        data = await self.get(ep, params=params)
+        return Privacy.model_validate(data)
+
+    async def configure(self, entity_id: str, settings: Privacy, org_id: str = None):
+        """
+        Configure an entity's Privacy Settings
+
+        Configure an entity's privacy settings for the specified entity ID.
+
+        The privacy feature enables the entity's line to be monitored by others and determine if they can be reached by
+        Auto Attendant services.
+
+        This API requires a full or user administrator or location administrator auth token with
+        the spark-admin:people_write scope.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param settings: settings for update
+        :type settings: :class:`Monitoring`
+        :param org_id: Entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        data = settings.model_dump(mode='json', by_alias=True, exclude_none=True)
+        if settings.monitoring_agents is not None:
+            id_list = []
+            for ma in settings.monitoring_agents:
+                if isinstance(ma, str):
+                    id_list.append(ma)
+                else:
+                    id_list.append(ma.agent_id)
+            data['monitoringAgents'] = id_list
+        await self.put(ep, params=params, json=data)
@@ -0,0 +1,90 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.push_to_talk import MonitoredMember, PushToTalkSettings
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsPushToTalkApi']
+
+
+class AsPushToTalkApi(AsPersonSettingsApiChild):
+    """
+    API for person's PTT settings
+
+    Also used for virtual lines and workspaces
+    """
+
+    feature = 'pushToTalk'
+
+    async def read(self, entity_id: str, org_id: str = None) -> PushToTalkSettings:
+        """
+        Read Push-to-Talk Settings for an entity
+
+        Push-to-Talk allows the use of desk phones as either a one-way or two-way intercom that connects people in
+        different parts of your organization.
+
+        This API requires a full, user, or read-only administrator auth token with a scope of spark-admin:people_read.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: Entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        :type org_id: str
+        :return: PTT settings for specific entity
+        :rtype: PushToTalkSettings
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        return PushToTalkSettings.model_validate(await self.get(ep, params=params))
+
+    async def configure(self, entity_id: str, settings: PushToTalkSettings, org_id: str = None):
+        """
+        Configure Push-to-Talk Settings for an entity
+
+        Configure an entity's Push-to-Talk Settings
+
+        Push-to-Talk allows the use of desk phones as either a one-way or two-way intercom that connects people in
+        different parts of your organization.
+
+        This API requires a full or user administrator auth token with the spark-admin:people_write scope.
+
+        :param entity_id: Unique identifier for the person.
+        :type entity_id: str
+        :param settings: new setting to be applied. For members only the ID needs to be set
+        :type settings: PushToTalkSettings
+        :param org_id: Entity is in this organization. Only admin users of another organization (such as partners)
+            may use this parameter as the default is the same organization as the token used to access API.
+        """
+        ep = self.f_ep(person_id=entity_id)
+        params = org_id and {'orgId': org_id} or None
+        if settings.members:
+            # for an update member is just a list of IDs
+            body_settings = settings.model_copy(deep=True)
+            members = [m.member_id if isinstance(m, MonitoredMember) else m
+                       for m in settings.members]
+            body_settings.members = members
+        else:
+            body_settings = settings
+        body = body_settings.model_dump_json(exclude_none=False,
+                                             exclude_unset=True)
+        await self.put(ep, params=params, data=body)
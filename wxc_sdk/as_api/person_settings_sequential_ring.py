@@ -0,0 +1,210 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.sequential_ring import SequentialRing, SequentialRingCriteria
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsSequentialRingApi']
+
+
+class AsSequentialRingApi(AsPersonSettingsApiChild):
+    """
+    API for sequential ring settings
+
+    For now only used for workspaces
+    """
+
+    feature = 'sequentialRing'
+
+    async def read_criteria(self, entity_id: str, id: str,
+                      org_id: str = None) -> SequentialRingCriteria:
+        """
+        Retrieve sequential ring criteria for an entity.
+
+        The sequential ring feature enables you to create a list of up to five phone numbers. When the workspace
+        receives incoming calls, these numbers will ring one after another.
+        The sequential ring criteria specify settings such as schedule and incoming numbers for which to sequentially
+        ring or not.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param id: Unique identifier for the criteria.
+        :type id: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: :class:`SelectiveCriteria`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id, f'criteria/{id}')
+        data = await super().get(url, params=params)
+        r = SequentialRingCriteria.model_validate(data)
+        return r
+
+    async def configure_criteria(self, entity_id: str, id: str, settings: SequentialRingCriteria,
+                           org_id: str = None):
+        """
+        Modify sequential ring criteria for an entity.
+
+        The sequential ring feature enables you to create a list of up to five phone numbers. When the workspace
+        receives incoming calls, these numbers will ring one after another.
+        The sequential ring criteria specify settings such as schedule and incoming numbers for which to sequentially
+        ring or not.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param id: Unique identifier for the criteria.
+        :type id: str
+        :param settings: new settings to be applied.
+        :type settings: SequentialRingCriteria
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = settings.update()
+        url = self.f_ep(entity_id, f'criteria/{id}')
+        await super().put(url, params=params, json=body)
+
+    async def delete_criteria(self, entity_id: str, id: str, org_id: str = None):
+        """
+        Delete sequential ring criteria for an entity.
+
+        The sequential ring feature enables you to create a list of up to five phone numbers. When the workspace
+        receives incoming calls, these numbers will ring one after another.
+        The sequential ring criteria specify settings such as schedule and incoming numbers for which to sequentially
+        ring or not.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param id: Unique identifier for the criteria.
+        :type id: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id, f'criteria/{id}')
+        await super().delete(url, params=params)
+
+    async def create_criteria(self, entity_id: str, settings: SequentialRingCriteria,
+                        org_id: str = None) -> str:
+        """
+        Create sequential ring criteria for an entity.
+
+        The sequential ring feature enables you to create a list of up to five phone numbers. When the workspace
+        receives incoming calls, these numbers will ring one after another.
+        The sequential ring criteria specify settings such as schedule and incoming numbers for which to sequentially
+        ring or not.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param settings: new settings to be applied.
+        :type settings: SelectiveCriteria
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: str
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = settings.update()
+
+        url = self.f_ep(entity_id, 'criteria')
+        data = await super().post(url, params=params, json=body)
+        r = data['id']
+        return r
+
+    async def read(self, entity_id: str,
+             org_id: str = None) -> SequentialRing:
+        """
+        Retrieve sequential ring settings for an entity.
+
+        The sequential ring feature enables you to create a list of up to five phone numbers. When the workspace
+        receives incoming calls, these numbers will ring one after another.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: :class:`SequentialRing`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id)
+        data = await super().get(url, params=params)
+        r = SequentialRing.model_validate(data)
+        return r
+
+    async def configure(self, entity_id: str, settings: SequentialRing,
+                  org_id: str = None):
+        """
+        Modify sequential ring settings for an entity.
+
+        The sequential ring feature enables you to create a list of up to five phone numbers. When the entity
+        receives incoming calls, these numbers will ring one after another.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param settings: Settings for new criteria
+        :type settings: SequentialRing
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = settings.update()
+        url = self.f_ep(entity_id)
+        await super().put(url, params=params, json=body)
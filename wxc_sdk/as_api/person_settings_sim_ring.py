@@ -0,0 +1,239 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.person_settings.sim_ring import SimRing, SimRingCriteria
+from wxc_sdk.as_api.person_settings_common import AsPersonSettingsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsSimRingApi']
+
+
+class AsSimRingApi(AsPersonSettingsApiChild):
+    """
+    API for simultaneous ring settings
+
+    For now only used for workspaces
+    """
+
+    feature = 'simultaneousRing'
+
+    async def read_criteria(self, entity_id: str, id: str,
+                      org_id: str = None) -> SimRingCriteria:
+        """
+        Retrieve Simultaneous Ring Criteria for an entity
+
+        Retrieve Simultaneous Ring Criteria Settings for an entity.
+
+        The Simultaneous Ring feature allows you to configure your office phone and other phones of your choice to ring
+        simultaneously.
+        Simultaneous Ring Criteria (Schedules) can also be set up to ring these phones during certain times of the day
+        or days of the week.
+
+        This API requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:workspaces_read` or a user auth token with a scope of `spark:workspaces_read` to read workspace
+        settings.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param id: Unique identifier for the criteria.
+        :type id: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: :class:`SimRingCriteria`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id, f'criteria/{id}')
+        data = await super().get(url, params=params)
+        r = SimRingCriteria.model_validate(data)
+        return r
+
+    async def configure_criteria(self, entity_id: str, id: str, settings: SimRingCriteria,
+                           org_id: str = None):
+        """
+        Modify Simultaneous Ring Criteria for an entity
+
+        Modify Simultaneous Ring Criteria Settings for an entity.
+
+        The Simultaneous Ring feature allows you to configure your office phone and other phones of your choice to ring
+        simultaneously.
+        Simultaneous Ring Criteria (Schedules) can also be set up to ring these phones during certain times of the day
+        or days of the week.
+
+        This API requires a full, user or location administrator auth token with the `spark-admin:workspaces_write`
+        scope or a user auth token with a scope of `spark:workspaces_write` to update workspace settings.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param id: Unique identifier for the criteria.
+        :type id: str
+        :param settings: new settings to be applied.
+        :type settings: SimRingCriteria
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = settings.update()
+
+        url = self.f_ep(entity_id, f'criteria/{id}')
+        await super().put(url, params=params, json=body)
+
+    async def delete_criteria(self, entity_id: str, id: str, org_id: str = None):
+        """
+        Delete Simultaneous Ring Criteria for an entity
+
+        Delete simultaneous ring criteria Settings for an entity.
+
+        The Simultaneous Ring feature allows you to configure your office phone and other phones of your choice to ring
+        simultaneously.
+        Simultaneous Ring Criteria (Schedules) can also be set up to ring these phones during certain times of the day
+        or days of the week.
+
+        This API requires a full, user or location administrator auth token with the `spark-admin:workspaces_write`
+        scope or a user auth token with a scope of `spark:workspaces_write` to update workspace settings.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param id: Unique identifier for the criteria.
+        :type id: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id, f'criteria/{id}')
+        await super().delete(url, params=params)
+
+    async def create_criteria(self, entity_id: str, settings: SimRingCriteria, org_id: str = None) -> str:
+        """
+        Create Simultaneous Ring Criteria for an entity
+
+        Create Simultaneous Ring Criteria Settings for an entity.
+
+        The Simultaneous Ring feature allows you to configure your office phone and other phones of your choice to ring
+        simultaneously.
+        Simultaneous Ring Criteria (Schedules) can also be set up to ring these phones during certain times of the day
+        or days of the week.
+
+        This API requires a full, user or location administrator auth token with the `spark-admin:workspaces_write`
+        scope or a user auth token with a scope of `spark:workspaces_write` to update workspace settings.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param settings: new settings to be applied.
+        :type settings: SimRingCriteria
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: str
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = settings.update()
+        url = self.f_ep(entity_id, 'criteria')
+        data = await super().post(url, params=params, json=body)
+        r = data['id']
+        return r
+
+    async def read(self, entity_id: str,
+             org_id: str = None) -> SimRing:
+        """
+        Retrieve Simultaneous Ring Settings for an entity.
+
+        The Simultaneous Ring feature allows you to configure your office phone and other phones of your choice to ring
+        simultaneously.
+        Schedules can also be set up to ring these phones during certain times of the day or days of the week.
+
+        This API requires a full, read-only or location administrator auth token with a scope
+        of `spark-admin:workspaces_read` or a user auth token with a scope of `spark:workspaces_read` to read workspace
+        settings.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: :class:`SimRing`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.f_ep(entity_id)
+        data = await super().get(url, params=params)
+        r = SimRing.model_validate(data)
+        return r
+
+    async def configure(self, entity_id: str, settings: SimRing,
+                  org_id: str = None):
+        """
+        Modify Simultaneous Ring Settings for an entity.
+
+        The Simultaneous Ring feature allows you to configure the workspace phones of your choice to ring
+        simultaneously.
+        Schedules can also be set up to ring these phones during certain times of the day or days of the week.
+
+        This API requires a full, user or location administrator auth token with the `spark-admin:workspaces_write`
+        scope or a user auth token with a scope of `spark:workspaces_write` to update workspace settings.
+
+        **NOTE**: This API is only available for professional licensed workspaces.
+
+        :param entity_id: Unique identifier for the entity.
+        :type entity_id: str
+        :param settings: Settings for new criteria
+        :type settings: SimRing
+        :param org_id: ID of the organization within which the entity resides. Only admin users of another
+            organization (such as partners) may use this parameter as the default is the same organization as the
+            token used to access API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = settings.update()
+        url = self.f_ep(entity_id)
+        await super().put(url, params=params, json=body)
@@ -0,0 +1,233 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.reports import Report, ReportTemplate
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsReportsApi']
+
+
+@dataclass(init=False, repr=False)
+class AsReportsApi(AsApiChild, base='devices'):
+    """
+    Reports
+
+    To access these endpoints, you must use an administrator token with the `analytics:read_all` `scope
+    <https://developer.webex.com/docs/integrations#scopes>`_. The
+    authenticated user must be a read-only or full administrator of the organization to which the report belongs.
+
+    To use this endpoint the org needs to be licensed for the Pro Pack.
+
+    Reports available via `Webex Control Hub
+    <https://admin.webex.com>`_ may be generated and downloaded via the Reports API. To access this API,
+    the authenticated user must be a read-only or full administrator of the organization to which the report belongs.
+
+    For more information about Reports, see the `Admin API
+    <https://developer.webex.com/docs/admin#reports-api>`_ guide.
+
+    """
+
+    async def list_templates(self) -> list[ReportTemplate]:
+        """
+        List all the available report templates that can be generated.
+
+        CSV (comma separated value) reports for Webex services are only supported for organizations based in the
+        North American region. Organizations based in other regions will return blank CSV files for any Webex reports.
+
+        :return: list of report templates
+        :rtype: list[ReportTemplate]
+        """
+        # TODO: https://developer.webex.com/docs/api/v1/report-templates/list-report-templates, documentation bug
+        #   "Template Attributes" is actually "items"
+        # TODO: https://developer.webex.com/docs/api/v1/report-templates/list-report-templates, documentation bug
+        #   "validations"/"validations" is actually "validations"
+        # TODO: https://developer.webex.com/docs/api/v1/report-templates/list-report-templates, documentation bug
+        #   "id" is actually "Id"
+        # TODO: https://developer.webex.com/docs/api/v1/report-templates/list-report-templates, documentation bug
+        #   "startDate", "endDate" not documented
+        url = self.session.ep('report/templates')
+        data = await self.get(url=url)
+        result = type_adapter(list[ReportTemplate]).validate_python(data['items'])
+        return result
+
+    def list_gen(self, report_id: str = None, service: str = None, template_id: str = None, from_date: date = None,
+             to_date: date = None) -> AsyncGenerator[Report, None, None]:
+        """
+        Lists all reports. Use query parameters to filter the response. The parameters are optional. However, `from`
+        and `to` parameters should be provided together.
+
+        CSV reports for Teams services are only supported for organizations based in the North American region.
+        Organizations based in a different region will return blank CSV files for any Teams reports.
+
+        Reports are usually provided in zip format. A Content-header `application/zip` or `application/octet-stream`
+        does indicate the zip format. There is usually no .zip file extension.
+
+        :param report_id: List reports by ID.
+        :param service: List reports which use this service.
+        :param template_id: List reports with this report template ID.
+        :param from_date: List reports that were created on or after this date.
+        :param to_date: List reports that were created before this date.
+        :return: yields :class:`Report` instances
+        """
+        # TODO: https://developer.webex.com/docs/api/v1/report-templates/list-report-templates, documentation bug
+        #   "Report Attributes" is actually "items"
+        # TODO: https://developer.webex.com/docs/api/v1/report-templates/list-report-templates, documentation bug
+        #   missing attribute: downloadDomain
+        # TODO: https://developer.webex.com/docs/api/v1/report-templates/list-report-templates, documentation bug
+        #   "id" is actually "Id"
+        # TODO: https://developer.webex.com/docs/api/v1/report-templates/list-report-templates, documentation bug
+        #   "scheduledFrom" is actually "scheduleFrom"
+
+        params = {to_camel(k.split('_')[0] if k.endswith('date') else k): v for k, v in locals().items()
+                  if k not in {'self', 'from_date', 'to_date'} and v is not None}
+        if from_date:
+            params['from'] = from_date.strftime('%Y-%m-%d')
+        if to_date:
+            params['to'] = to_date.strftime('%Y-%m-%d')
+
+        url = self.session.ep('reports')
+        return self.session.follow_pagination(url=url, params=params, model=Report, item_key='items')
+
+    async def list(self, report_id: str = None, service: str = None, template_id: str = None, from_date: date = None,
+             to_date: date = None) -> List[Report]:
+        """
+        Lists all reports. Use query parameters to filter the response. The parameters are optional. However, `from`
+        and `to` parameters should be provided together.
+
+        CSV reports for Teams services are only supported for organizations based in the North American region.
+        Organizations based in a different region will return blank CSV files for any Teams reports.
+
+        Reports are usually provided in zip format. A Content-header `application/zip` or `application/octet-stream`
+        does indicate the zip format. There is usually no .zip file extension.
+
+        :param report_id: List reports by ID.
+        :param service: List reports which use this service.
+        :param template_id: List reports with this report template ID.
+        :param from_date: List reports that were created on or after this date.
+        :param to_date: List reports that were created before this date.
+        :return: yields :class:`Report` instances
+        """
+        # TODO: https://developer.webex.com/docs/api/v1/report-templates/list-report-templates, documentation bug
+        #   "Report Attributes" is actually "items"
+        # TODO: https://developer.webex.com/docs/api/v1/report-templates/list-report-templates, documentation bug
+        #   missing attribute: downloadDomain
+        # TODO: https://developer.webex.com/docs/api/v1/report-templates/list-report-templates, documentation bug
+        #   "id" is actually "Id"
+        # TODO: https://developer.webex.com/docs/api/v1/report-templates/list-report-templates, documentation bug
+        #   "scheduledFrom" is actually "scheduleFrom"
+
+        params = {to_camel(k.split('_')[0] if k.endswith('date') else k): v for k, v in locals().items()
+                  if k not in {'self', 'from_date', 'to_date'} and v is not None}
+        if from_date:
+            params['from'] = from_date.strftime('%Y-%m-%d')
+        if to_date:
+            params['to'] = to_date.strftime('%Y-%m-%d')
+
+        url = self.session.ep('reports')
+        return [o async for o in self.session.follow_pagination(url=url, params=params, model=Report, item_key='items')]
+
+    async def create(self, template_id: int, start_date: date = None, end_date: date = None, site_list: str = None) -> str:
+        """
+        Create a new report. For each templateId, there are a set of validation rules that need to be followed. For
+        example, for templates belonging to Webex, the user needs to provide siteUrl. These validation rules can be
+        retrieved via the Report Templates API.
+
+        CSV reports for Teams services are only supported for organizations based in the North American region.
+        Organizations based in a different region will return blank CSV files for any Teams reports.
+
+        :param template_id: Unique ID representing valid report templates.
+        :type template_id: int
+        :param start_date: Data in the report will be from this date onwards.
+        :type start_date: date
+        :param end_date: Data in the report will be until this date.
+        :type end_date: date
+        :param site_list: Sites belonging to user's organization. This attribute is needed for site-based templates.
+        :type site_list: str
+        :return: The unique identifier for the report.
+        :rtype: str
+        """
+        # TODO: https://developer.webex.com/docs/api/v1/reports/create-a-report, documentation bug
+        #   result actually is something like: {'items': {'Id': 'Y2...lMg'}}
+        body = {'templateId': template_id}
+        if start_date:
+            body['startDate'] = start_date.strftime('%Y-%m-%d')
+        if end_date:
+            body['endDate'] = end_date.strftime('%Y-%m-%d')
+        if site_list:
+            body['siteList'] = site_list
+        url = self.session.ep('reports')
+        data = await self.post(url=url, json=body)
+        result = data['items']['Id']
+        return result
+
+    async def details(self, report_id: str) -> Report:
+        """
+        Shows details for a report, by report ID.
+
+        Specify the report ID in the reportId parameter in the URI.
+
+        CSV reports for Teams services are only supported for organizations based in the North American region.
+        Organizations based in a different region will return blank CSV files for any Teams reports.
+
+        :param report_id: The unique identifier for the report.
+        :type report_id: str
+        :return: report details
+        :rtype: Report
+        """
+        # TODO: https://developer.webex.com/docs/api/v1/reports/create-a-report, documentation bug
+        #   result actually is something like: {'items': [{'title': 'Engagement Report', 'service': 'Webex Calling',
+        #   'startDate': '2021-12-14', 'endDate': '2022-01-13', 'siteList': '', 'created': '2022-01-14 11:16:59',
+        #   'createdBy': 'Y2lz..GM', 'scheduleFrom': 'api', 'status': 'done', 'downloadDomain':
+        #   'https://reportdownload-a.webex.com/',  'downloadURL':
+        #   'https://reportdownload-a.webex.com/api?reportId=Y2lz3ZA',  'Id': 'Y23ZA'}], 'numberOfReports': 1}
+        url = self.session.ep(f'reports/{report_id}')
+        data = await self.get(url=url)
+        result = Report.model_validate(data['items'][0])
+        return result
+
+    async def delete(self, report_id: str):
+        """
+        Remove a report from the system.
+
+        Specify the report ID in the reportId parameter in the URI
+
+        CSV reports for Teams services are only supported for organizations based in the North American region.
+        Organizations based in a different region will return blank CSV files for any Teams reports.
+
+        :param report_id: The unique identifier for the report.
+        :type report_id: str
+        """
+        url = self.session.ep(f'reports/{report_id}')
+        await super().delete(url=url)
+
+    async def download(self, url: str) -> List[dict]:
+        """
+        Download a report from the given URL and yield the rows as dicts
+
+        :param url: download URL
+        :type url: str
+        :return: list of dicts (one per row)
+        :rtype: list[dict]
+        """
+        raise NotImplementedError('async download not implemented; use sync call instead')
+        
@@ -0,0 +1,66 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.roles import IdAndName
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsRolesApi']
+
+
+class AsRolesApi(AsApiChild, base='roles'):
+    """
+    Roles
+
+    A persona for an authenticated user, corresponding to a set of privileges within an organization. This roles
+    resource can be accessed only by an admin and shows only roles relevant to an admin.
+    """
+
+    async def list(self) -> list[IdAndName]:
+        """
+        List Roles
+
+        List all roles.
+
+        :rtype: list[Role]
+        """
+        url = self.ep()
+        data = await super().get(url)
+        r = type_adapter(list[IdAndName]).validate_python(data['items'])
+        return r
+
+    async def details(self, role_id: str) -> IdAndName:
+        """
+        Get Role Details
+
+        Shows details for a role, by ID.
+
+        Specify the role ID in the `roleId` parameter in the URI.
+
+        :param role_id: The unique identifier for the role.
+        :type role_id: str
+        :rtype: :class:`Role`
+        """
+        url = self.ep(f'{role_id}')
+        data = await super().get(url)
+        r = IdAndName.model_validate(data)
+        return r
@@ -0,0 +1,128 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.room_tabs import RoomTab
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsRoomTabsApi']
+
+
+class AsRoomTabsApi(AsApiChild, base='room/tabs'):
+    """
+    A Room Tab represents a URL shortcut that is added as a persistent tab to a Webex room (space) tab row. Use this
+    API to list tabs of any Webex room that you belong to. Room Tabs can also be updated to point to a different
+    content URL, or deleted to remove the tab from the room.
+    Just like in the Webex app, you must be a member of the room in order to list its Room Tabs.
+    """
+
+    def list_tabs_gen(self, room_id: str, **params) -> AsyncGenerator[RoomTab, None, None]:
+        """
+        Lists all Room Tabs of a room specified by the roomId query parameter.
+
+        :param room_id: ID of the room for which to list room tabs.
+        :type room_id: str
+        """
+        if room_id is not None:
+            params['roomId'] = room_id
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=RoomTab, params=params)
+
+    async def list_tabs(self, room_id: str, **params) -> List[RoomTab]:
+        """
+        Lists all Room Tabs of a room specified by the roomId query parameter.
+
+        :param room_id: ID of the room for which to list room tabs.
+        :type room_id: str
+        """
+        if room_id is not None:
+            params['roomId'] = room_id
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=RoomTab, params=params)]
+
+    async def create_tab(self, room_id: str, content_url: str, display_name: str) -> RoomTab:
+        """
+        Add a tab with a specified URL to a room.
+
+        :param room_id: A unique identifier for the room.
+        :type room_id: str
+        :param content_url: URL of the Room Tab. Must use https protocol.
+        :type content_url: str
+        :param display_name: User-friendly name for the room tab.
+        :type display_name: str
+        """
+        body = {}
+        if room_id is not None:
+            body['roomId'] = room_id
+        if content_url is not None:
+            body['contentUrl'] = content_url
+        if display_name is not None:
+            body['displayName'] = display_name
+        url = self.ep()
+        data = await super().post(url=url, json=body)
+        return RoomTab.model_validate(data)
+
+    async def tab_details(self, tab_id: str) -> RoomTab:
+        """
+        Get details for a Room Tab with the specified room tab ID.
+
+        :param tab_id: The unique identifier for the Room Tab.
+        :type tab_id: str
+        """
+        url = self.ep(f'{tab_id}')
+        data = await super().get(url=url)
+        return RoomTab.model_validate(data)
+
+    async def update_tab(self, tab_id: str, room_id: str, content_url: str, display_name: str) -> RoomTab:
+        """
+        Updates the content URL of the specified Room Tab ID.
+
+        :param tab_id: The unique identifier for the Room Tab.
+        :type tab_id: str
+        :param room_id: ID of the room that contains the room tab in question.
+        :type room_id: str
+        :param content_url: Content URL of the Room Tab. URL must use https protocol.
+        :type content_url: str
+        :param display_name: User-friendly name for the room tab.
+        :type display_name: str
+        """
+        body = {}
+        if room_id is not None:
+            body['roomId'] = room_id
+        if content_url is not None:
+            body['contentUrl'] = content_url
+        if display_name is not None:
+            body['displayName'] = display_name
+        url = self.ep(f'{tab_id}')
+        data = await super().put(url=url, json=body)
+        return RoomTab.model_validate(data)
+
+    async def delete_tab(self, tab_id: str):
+        """
+        Deletes a Room Tab with the specified ID.
+
+        :param tab_id: The unique identifier for the Room Tab to delete.
+        :type tab_id: str
+        """
+        url = self.ep(f'{tab_id}')
+        await super().delete(url=url)
+        return
@@ -0,0 +1,126 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.scim.bulk import BulkOperation, BulkResponse
+from wxc_sdk.as_api.scim_child import AsScimApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsSCIM2BulkApi']
+
+
+class AsSCIM2BulkApi(AsScimApiChild, base='identity/scim'):
+    """
+    Bulk Manage SCIM 2 Users and Groups
+
+    The bulk API allows you to create, update, and remove multiple users and groups in Webex.  The number of Bulk
+    operations in a single request is limited to 100.
+
+    Bulk deletion of Users is irreversible. Please test in a test org or sandbox
+    before running the command in your production system.
+
+    """
+
+    async def bulk_request(self, org_id: str, fail_on_errors: int,
+                     operations: list[BulkOperation]) -> BulkResponse:
+        """
+        User bulk API
+
+        **Authorization**
+
+        OAuth token rendered by Identity Broker.
+
+        One of the following OAuth scopes is required:
+
+        - `identity:people_rw`
+
+        **Usage**:
+
+        1. The input JSON must conform to the following schema: 'urn:ietf:params:scim:api:messages:2.0:BulkRequest'.
+
+        2. The request must be accompanied with a body in JSON format according to the standard SCIM schema definition.
+           The maximum number of operations in a request is 100; an error is thrown if the limit is exceeded.
+
+        3. `failOnErrors` parameter
+
+           An integer specifies the number of errors that the service provider will accept before the operation is
+           terminated and an error response is returned.
+           It is OPTIONAL in a request.
+           Maximum number of operations allowed to fail before the server stops processing the request. The value must
+           be between 1 and 100.
+
+        4. `operations` parameter
+
+           Contains a list of bulk operations for POST/PATCH/DELETE operations. (REQUIRED)
+
+           + `operations.method`
+
+             The HTTP method of the current operation. Possible values are POST, PATCH or DELETE.
+           + `operations.path
+
+             The Resource's relative path. If the method is POST the value must specify a Resource type endpoint;
+             e.g., /Users or /Groups whereas all other method values must specify the path to a specific Resource;
+             e.g., /Users/2819c223-7f76-453a-919d-413861904646.
+           + `operations.data`
+
+             The Resource data as it would appear for a single POST or PATCH Resource operation.
+             It is REQUIRED in a request when method is POST and PATCH.
+             Refer to corresponding wiki for SCIM 2.0 POST, PATCH and DELETE API.
+           + `operations.bulkId`
+
+             The transient identifier of a newly created resource, unique within a bulk request and created by the
+             client.
+             The bulkId serves as a surrogate resource id enabling clients to uniquely identify newly created
+             resources in
+             the response and cross-reference new resources in and across operations within a bulk request.
+             It is REQUIRED when "method" is "POST".
+
+        :param org_id: Webex Identity assigned organization identifier for user's organization.
+        :type org_id: str
+        :param fail_on_errors: An integer specifying the maximum number of errors that the service provider will accept
+            before the operation is terminated and an error response is returned.
+        :type fail_on_errors: int
+        :param operations: Contains a list of bulk operations for POST/PATCH/DELETE operations.
+        :type operations: list[BulkOperation]
+        :rtype: :class:`BulkResponse`
+
+        Example:
+
+            .. code-block:: python
+
+                # bulk operations to create a bunch of users from a list of ScimUser instances
+                new_scim_users: list[ScimUser]
+                operations = [BulkOperation(method=BulkMethod.post, path='/Users',
+                                            bulk_id=str(uuid.uuid4()),
+                                            data=scim_user.create_update())
+                              for scim_user in new_scim_users]
+                bulk_response = self.api.scim.bulk.bulk_request(org_id=org_id, fail_on_errors=1,
+                                                                operations=operations)
+        """
+        body = dict()
+        body['schemas'] = ['urn:ietf:params:scim:api:messages:2.0:BulkRequest']
+        body['failOnErrors'] = fail_on_errors
+        body['operations'] = type_adapter(list[BulkOperation]).dump_python(
+            operations, mode='json', by_alias=True, exclude_none=True)
+        url = self.ep(f'{org_id}/v2/Bulk')
+        data = await super().post(url, json=body)
+        r = BulkResponse.model_validate(data)
+        return r
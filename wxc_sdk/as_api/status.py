@@ -0,0 +1,143 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.status import Component, Incident, StatusSummary
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsStatusAPI']
+
+
+class AsStatusAPI(AsApiChild, base='status'):
+    """
+    Webex Status API as described at https://status.webex.com/api
+    """
+
+    # noinspection PyMethodOverriding
+    def ep(self, path: str):
+        """
+
+        :meta private:
+        """
+        return f'https://status.webex.com/{path}.json'
+
+    async def summary(self) -> StatusSummary:
+        """
+        Get a summary of the status page, including a status indicator, component statuses, unresolved incidents,
+        and any upcoming or in-progress scheduled maintenances.
+
+        :return: Status summary
+        :rtype: StatusSummary
+        """
+        url = self.ep('index')
+        data = await self.session.rest_get(url=url)
+        return StatusSummary.model_validate(data)
+
+    async def status(self) -> str:
+        """
+        Get the status rollup for the whole page. This response includes an indicator - one of green (operational),
+        yellow (under_maintenance/degraded_performance/partial_outage), red (major_outage).
+
+        :return: Webex status
+        :rtype: str
+        """
+        url = self.ep('status')
+        data = await self.session.rest_get(url=url)
+        return data['status']['indicator']
+
+    async def components(self) -> list[Component]:
+        """
+        Get the components for the status page. Each component is listed along with its status - one of operational,
+        under_maintenance,degraded_performance, partial_outage, or major_outage.
+
+        :return: list of components
+        :rtype: list[Component]
+        """
+        url = self.ep('components')
+        data = await self.session.rest_get(url=url)
+        return type_adapter(list[Component]).validate_python(data['components'])
+
+    async def unresolved_incidents(self) -> list[Incident]:
+        """
+        Get a list of any unresolved incidents. This response will only return incidents in the Investigating,
+        Identified, or Monitoring state.
+
+        :return: list of incidents
+        :rtype: list[Incident]
+        """
+        url = self.ep('unresolved-incidents')
+        data = await self.session.rest_get(url=url)
+        return type_adapter(list[Incident]).validate_python(data['incidents'])
+
+    async def all_incidents(self) -> list[Incident]:
+        """
+        Get a list of the 50 most recent incidents. This includes all unresolved incidents as described above,
+        as well as those in the Resolved state.
+
+        :return: list of incidents
+        :rtype: list[Incident]
+        """
+        url = self.ep('all-incidents')
+        data = await self.session.rest_get(url=url)
+        return type_adapter(list[Incident]).validate_python(data['incidents'])
+
+    async def upcoming_scheduled_maintenances(self) -> list[Incident]:
+        """
+        Scheduled maintenances are planned outages, upgrades, or general notices that you're working on
+        infrastructure and disruptions may occurr. A close sibling of Incidents, each usually goes through a
+        progression of statuses listed below, with an impact calculated from a blend of component statuses (or an
+        optional override).
+
+        Status: Scheduled, In Progress, or Completed
+
+        Impact: Maintenance
+
+        :return: list of incidents
+        :rtype: list[Incident]
+        """
+        url = self.ep('upcoming-scheduled-maintenances')
+        data = await self.session.rest_get(url=url)
+        return type_adapter(list[Incident]).validate_python(data['scheduled_maintenances'])
+
+    async def active_scheduled_maintenances(self) -> list[Incident]:
+        """
+        Get a list of any active maintenances. This response will only return scheduled maintenances in the In
+        Progress state.
+
+        :return: list of incidents
+        :rtype: list[Incident]
+        """
+        url = self.ep('active-scheduled-maintenances')
+        data = await self.session.rest_get(url=url)
+        return type_adapter(list[Incident]).validate_python(data['scheduled_maintenances'])
+
+    async def all_scheduled_maintenances(self) -> list[Incident]:
+        """
+        Get a list of the 50 most recent scheduled maintenances. This includes scheduled maintenances in Scheduled ,
+        In Progress or Completed state.
+
+        :return: list of incidents
+        :rtype: list[Incident]
+        """
+        url = self.ep('all-scheduled-maintenances')
+        data = await self.session.rest_get(url=url)
+        return type_adapter(list[Incident]).validate_python(data['scheduled_maintenances'])
@@ -0,0 +1,130 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.team_memberships import TeamMembership
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsTeamMembershipsApi']
+
+
+class AsTeamMembershipsApi(AsApiChild, base='team/memberships'):
+    """
+    Team Memberships represent a person's relationship to a team. Use this API to list members of any team that you're
+    in or create memberships to invite someone to a team. Team memberships can also be updated to make someone a
+    moderator or deleted to remove them from the team.
+    Just like in the Webex app, you must be a member of the team in order to list its memberships or invite people.
+    """
+
+    def list_gen(self, team_id: str, **params) -> AsyncGenerator[TeamMembership, None, None]:
+        """
+        Lists all team memberships for a given team, specified by the teamId query parameter.
+        Use query parameters to filter the response.
+
+        :param team_id: List memberships for a team, by ID.
+        :type team_id: str
+        """
+        if team_id is not None:
+            params['teamId'] = team_id
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=TeamMembership, params=params)
+
+    async def list(self, team_id: str, **params) -> List[TeamMembership]:
+        """
+        Lists all team memberships for a given team, specified by the teamId query parameter.
+        Use query parameters to filter the response.
+
+        :param team_id: List memberships for a team, by ID.
+        :type team_id: str
+        """
+        if team_id is not None:
+            params['teamId'] = team_id
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=TeamMembership, params=params)]
+
+    async def create(self, team_id: str, person_id: str = None, person_email: str = None,
+               is_moderator: bool = None) -> TeamMembership:
+        """
+        Add someone to a team by Person ID or email address, optionally making them a moderator.
+
+        :param team_id: The team ID.
+        :type team_id: str
+        :param person_id: The person ID.
+        :type person_id: str
+        :param person_email: The email address of the person.
+        :type person_email: str
+        :param is_moderator: Whether or not the participant is a team moderator.
+        :type is_moderator: bool
+        """
+        body = {}
+        if team_id is not None:
+            body['teamId'] = team_id
+        if person_id is not None:
+            body['personId'] = person_id
+        if person_email is not None:
+            body['personEmail'] = person_email
+        if is_moderator is not None:
+            body['isModerator'] = is_moderator
+        url = self.ep()
+        data = await super().post(url=url, json=body)
+        return TeamMembership.model_validate(data)
+
+    async def details(self, membership_id: str) -> TeamMembership:
+        """
+        Shows details for a team membership, by ID.
+        Specify the team membership ID in the membershipId URI parameter.
+
+        :param membership_id: The unique identifier for the team membership.
+        :type membership_id: str
+        """
+        url = self.ep(f'{membership_id}')
+        data = await super().get(url=url)
+        return TeamMembership.model_validate(data)
+
+    async def membership(self, membership_id: str, is_moderator: bool) -> TeamMembership:
+        """
+        Updates a team membership, by ID.
+        Specify the team membership ID in the membershipId URI parameter.
+
+        :param membership_id: The unique identifier for the team membership.
+        :type membership_id: str
+        :param is_moderator: Whether or not the participant is a team moderator.
+        :type is_moderator: bool
+        """
+        body = {'isModerator': is_moderator}
+        url = self.ep(f'{membership_id}')
+        data = await super().put(url=url, json=body)
+        return TeamMembership.model_validate(data)
+
+    async def delete(self, membership_id: str):
+        """
+        Deletes a team membership, by ID.
+        Specify the team membership ID in the membershipId URI parameter.
+        The team membership for the last moderator of a team may not be deleted; promote another user to team moderator
+        first.
+
+        :param membership_id: The unique identifier for the team membership.
+        :type membership_id: str
+        """
+        url = self.ep(f'{membership_id}')
+        await super().delete(url=url)
+        return
@@ -0,0 +1,106 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.teams import Team
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsTeamsApi']
+
+
+class AsTeamsApi(AsApiChild, base='teams'):
+    """
+    Teams are groups of people with a set of rooms that are visible to all members of that team. This API is used to
+    manage the teams themselves. Teams are created and deleted with this API. You can also update a team to change its
+    name, for example.
+    To manage people in a team see the Team Memberships API.
+    To manage team rooms see the Rooms API.
+    """
+
+    def list_gen(self) -> AsyncGenerator[Team, None, None]:
+        """
+        Lists teams to which the authenticated user belongs.
+        """
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=Team)
+
+    async def list(self) -> List[Team]:
+        """
+        Lists teams to which the authenticated user belongs.
+        """
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=Team)]
+
+    async def create(self, name: str) -> Team:
+        """
+        Creates a team.
+        The authenticated user is automatically added as a member of the team. See the Team Memberships API to learn
+        how to add more people to the team.
+
+        :param name: A user-friendly name for the team.
+        :type name: str
+        """
+        body = {}
+        if name is not None:
+            body['name'] = name
+        url = self.ep()
+        data = await super().post(url=url, json=body)
+        return Team.model_validate(data)
+
+    async def details(self, team_id: str) -> Team:
+        """
+        Shows details for a team, by ID.
+        Specify the team ID in the teamId parameter in the URI.
+
+        :param team_id: The unique identifier for the team.
+        :type team_id: str
+        """
+        url = self.ep(f'{team_id}')
+        data = await super().get(url=url)
+        return Team.model_validate(data)
+
+    async def update(self, team_id: str, name: str) -> Team:
+        """
+        Updates details for a team, by ID.
+        Specify the team ID in the teamId parameter in the URI.
+
+        :param team_id: The unique identifier for the team.
+        :type team_id: str
+        :param name: A user-friendly name for the team.
+        :type name: str
+        """
+        body = {'name': name}
+        url = self.ep(f'{team_id}')
+        data = await super().put(url=url, json=body)
+        return Team.model_validate(data)
+
+    async def delete(self, team_id: str):
+        """
+        Deletes a team, by ID.
+        Specify the team ID in the teamId parameter in the URI.
+
+        :param team_id: The unique identifier for the team.
+        :type team_id: str
+        """
+        url = self.ep(f'{team_id}')
+        await super().delete(url=url)
+        return
@@ -0,0 +1,629 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony import AnnouncementLanguage, ApiSelector, DeviceCustomization, MoHConfig, NumberDetails, \
+    NumberListPhoneNumber, NumberListPhoneNumberType, NumberState, NumberType, OriginatorType, OwnerType, \
+    RouteIdentity, ScheduleApiBase, SupportedDevices, TelephonyType, TestCallRoutingResult, UCMProfile, \
+    ValidateExtensionsResponse, ValidatePhoneNumbersResponse
+from wxc_sdk.as_api.api_child import AsApiChild
+from wxc_sdk.as_api.common_schedules import AsScheduleApi
+from wxc_sdk.as_api.person_settings_msteams import AsOrgMSTeamsSettingApi
+from wxc_sdk.as_api.person_settings_permissions_out import AsOutgoingPermissionsApi
+from wxc_sdk.as_api.telephony_access_codes import AsLocationAccessCodesApi
+from wxc_sdk.as_api.telephony_announcements_repo import AsAnnouncementsRepositoryApi
+from wxc_sdk.as_api.telephony_autoattendant import AsAutoAttendantApi
+from wxc_sdk.as_api.telephony_call_recording import AsCallRecordingSettingsApi
+from wxc_sdk.as_api.telephony_call_routing import AsCallRoutingApi
+from wxc_sdk.as_api.telephony_callpark import AsCallParkApi
+from wxc_sdk.as_api.telephony_callpark_extension import AsCallparkExtensionApi
+from wxc_sdk.as_api.telephony_callpickup import AsCallPickupApi
+from wxc_sdk.as_api.telephony_callqueue import AsCallQueueApi
+from wxc_sdk.as_api.telephony_calls import AsCallsApi
+from wxc_sdk.as_api.telephony_conference import AsConferenceControlsApi
+from wxc_sdk.as_api.telephony_cx_essentials import AsCustomerExperienceEssentialsApi
+from wxc_sdk.as_api.telephony_dect_devices import AsDECTDevicesApi
+from wxc_sdk.as_api.telephony_devices import AsTelephonyDevicesApi
+from wxc_sdk.as_api.telephony_emergency_services import AsOrgEmergencyServicesApi
+from wxc_sdk.as_api.telephony_guest_calling import AsGuestCallingApi
+from wxc_sdk.as_api.telephony_huntgroup import AsHuntGroupApi
+from wxc_sdk.as_api.telephony_jobs import AsJobsApi
+from wxc_sdk.as_api.telephony_location import AsTelephonyLocationApi
+from wxc_sdk.as_api.telephony_location_intercept import AsLocationInterceptApi
+from wxc_sdk.as_api.telephony_operating_modes import AsOperatingModesApi
+from wxc_sdk.as_api.telephony_org_access_codes import AsOrganisationAccessCodesApi
+from wxc_sdk.as_api.telephony_organisation_vm import AsOrganisationVoicemailSettingsAPI
+from wxc_sdk.as_api.telephony_paging import AsPagingApi
+from wxc_sdk.as_api.telephony_playlists import AsPlayListApi
+from wxc_sdk.as_api.telephony_pnc import AsPrivateNetworkConnectApi
+from wxc_sdk.as_api.telephony_prem_pstn import AsPremisePstnApi
+from wxc_sdk.as_api.telephony_pstn import AsPSTNApi
+from wxc_sdk.as_api.telephony_supervisor import AsSupervisorApi
+from wxc_sdk.as_api.telephony_virtual_line import AsVirtualLinesApi
+from wxc_sdk.as_api.telephony_vm_rules import AsVoicemailRulesApi
+from wxc_sdk.as_api.telephony_voice_messaging import AsVoiceMessagingApi
+from wxc_sdk.as_api.telephony_voicemail_groups import AsVoicemailGroupsApi
+from wxc_sdk.as_api.telephony_voiceportal import AsVoicePortalApi
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsTelephonyApi']
+
+
+@dataclass(init=False, repr=False)
+class AsTelephonyApi(AsApiChild, base='telephony/config'):
+    """
+    The telephony settings (features) API.
+    """
+    #: access or authentication codes at location level
+    access_codes: AsLocationAccessCodesApi
+    announcements_repo: AsAnnouncementsRepositoryApi
+    auto_attendant: AsAutoAttendantApi
+    #: location call intercept settings
+    call_intercept: AsLocationInterceptApi
+    call_routing: AsCallRoutingApi
+    calls: AsCallsApi
+    callpark: AsCallParkApi
+    callpark_extension: AsCallparkExtensionApi
+    callqueue: AsCallQueueApi
+    call_recording: AsCallRecordingSettingsApi
+    conference: AsConferenceControlsApi
+    cx_essentials: AsCustomerExperienceEssentialsApi
+    dect_devices: AsDECTDevicesApi
+    #: WxC device operations
+    devices: AsTelephonyDevicesApi
+    #: emergency services
+    emergency_services: AsOrgEmergencyServicesApi
+    guest_calling: AsGuestCallingApi
+    huntgroup: AsHuntGroupApi
+    jobs: AsJobsApi
+    #: location specific settings
+    location: AsTelephonyLocationApi
+    locations: AsTelephonyLocationApi
+    ms_teams: AsOrgMSTeamsSettingApi
+    operating_modes: AsOperatingModesApi
+    #: organisation access codes
+    organisation_access_codes: AsOrganisationAccessCodesApi
+    #: organisation voicemail settings
+    organisation_voicemail: AsOrganisationVoicemailSettingsAPI
+    paging: AsPagingApi
+    #: location level outgoing permissions
+    permissions_out: AsOutgoingPermissionsApi
+    pickup: AsCallPickupApi
+    playlist: AsPlayListApi
+    pnc: AsPrivateNetworkConnectApi
+    prem_pstn: AsPremisePstnApi
+    pstn: AsPSTNApi
+    schedules: AsScheduleApi
+    supervisors: AsSupervisorApi
+    virtual_lines: AsVirtualLinesApi
+    # location voicemail groups
+    voicemail_groups: AsVoicemailGroupsApi
+    voicemail_rules: AsVoicemailRulesApi
+    voice_messaging: AsVoiceMessagingApi
+    voiceportal: AsVoicePortalApi
+
+    def __init__(self, session: AsRestSession):
+        super().__init__(session=session)
+        self.access_codes = AsLocationAccessCodesApi(session=session)
+        self.announcements_repo = AsAnnouncementsRepositoryApi(session=session)
+        self.auto_attendant = AsAutoAttendantApi(session=session)
+        self.call_intercept = AsLocationInterceptApi(session=session)
+        self.call_routing = AsCallRoutingApi(session=session)
+        self.call_recording = AsCallRecordingSettingsApi(session=session)
+        self.calls = AsCallsApi(session=session)
+        self.callpark = AsCallParkApi(session=session)
+        self.callpark_extension = AsCallparkExtensionApi(session=session)
+        self.callqueue = AsCallQueueApi(session=session)
+        self.conference = AsConferenceControlsApi(session=session)
+        self.cx_essentials = AsCustomerExperienceEssentialsApi(session=session)
+        self.dect_devices = AsDECTDevicesApi(session=session)
+        self.devices = AsTelephonyDevicesApi(session=session)
+        self.emergency_services = AsOrgEmergencyServicesApi(session=session)
+        self.guest_calling = AsGuestCallingApi(session=session)
+        self.huntgroup = AsHuntGroupApi(session=session)
+        self.jobs = AsJobsApi(session=session)
+        self.location = AsTelephonyLocationApi(session=session)
+        self.locations = self.location
+        self.ms_teams = AsOrgMSTeamsSettingApi(session=session)
+        self.operating_modes = AsOperatingModesApi(session=session)
+        self.organisation_access_codes = AsOrganisationAccessCodesApi(session=session)
+        self.organisation_voicemail = AsOrganisationVoicemailSettingsAPI(session=session)
+        self.paging = AsPagingApi(session=session)
+        self.permissions_out = AsOutgoingPermissionsApi(session=session, selector=ApiSelector.location)
+        self.pickup = AsCallPickupApi(session=session)
+        self.playlist = AsPlayListApi(session=session)
+        self.pnc = AsPrivateNetworkConnectApi(session=session)
+        self.prem_pstn = AsPremisePstnApi(session=session)
+        self.pstn = AsPSTNApi(session=session)
+        self.schedules = AsScheduleApi(session=session, base=ScheduleApiBase.locations)
+        self.supervisors = AsSupervisorApi(session=session)
+        self.virtual_lines = AsVirtualLinesApi(session=session)
+        self.voicemail_groups = AsVoicemailGroupsApi(session=session)
+        self.voicemail_rules = AsVoicemailRulesApi(session=session)
+        self.voice_messaging = AsVoiceMessagingApi(session=session)
+        self.voiceportal = AsVoicePortalApi(session=session)
+
+    def phone_numbers_gen(self, location_id: str = None, phone_number: str = None, available: bool = None,
+                      order: str = None,
+                      owner_name: str = None, owner_id: str = None, owner_type: OwnerType = None,
+                      extension: str = None, number_type: NumberType = None,
+                      phone_number_type: NumberListPhoneNumberType = None,
+                      state: NumberState = None, details: bool = None, toll_free_numbers: bool = None,
+                      restricted_non_geo_numbers: bool = None,
+                      included_telephony_type: TelephonyType = None,
+                      service_number: bool = None,
+                      org_id: str = None, **params) -> AsyncGenerator[NumberListPhoneNumber, None, None]:
+        """
+        Get Phone Numbers for an Organization with Given Criterias
+
+        List all the phone numbers for the given organization along with the status and owner (if any).
+
+        Numbers can be standard, service, or mobile. Both standard and service numbers are PSTN numbers.
+        Service numbers are considered as high-utilization or high-concurrency phone numbers and can be assigned to
+        features like auto-attendants, call queues, and hunt groups.
+        Phone numbers can be linked to a specific location, be active or inactive, and be assigned or unassigned.
+        The owner of a number is the person, workspace, or feature to which the number is assigned.
+        Only a person can own a mobile number.
+
+        Retrieving this list requires a full or read-only administrator or location administrator auth token with a
+        scope of `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization.
+        :type location_id: str
+        :param phone_number: Search for this phone number.
+        :type phone_number: str
+        :param available: Search among the available phone numbers. This parameter cannot be used along with owner_type
+            parameter when set to true.
+        :type available: bool
+        :param order: Sort the list of phone numbers based on the following:lastName,dn,extension. Default sort will
+            be based on number and extension in an Ascending order
+        :type order: str
+        :param owner_name: Return the list of phone numbers that is owned by given owner name. Maximum length is 255.
+        :type owner_name: str
+        :param owner_id: Returns only the matched number/extension entries assigned to the feature with specified
+            uuid/broadsoftId.
+        :type owner_id: str
+        :param owner_type: Returns the list of phone numbers that are of given owner_type.
+        :type owner_type: OwnerType
+        :param extension: Returns the list of PSTN phone numbers with given extension.
+        :type extension: str
+        :param number_type: Returns the filtered list of PSTN phone numbers that contains given type of numbers.
+            This parameter cannot be used along with available or state.
+        :type number_type: NumberType
+        :param phone_number_type: Returns the filtered list of PSTN phone numbers that are of given phoneNumberType.
+        :type phone_number_type: NumberListPhoneNumberType
+        :param state: Returns the list of PSTN phone numbers with matching state.
+        :type state: NumberState
+        :param details: Returns the overall count of the PSTN phone numbers along with other details for given
+            organization.
+        :type details: bool
+        :param toll_free_numbers: Returns the list of toll free phone numbers.
+        :type toll_free_numbers: bool
+        :param restricted_non_geo_numbers: Returns the list of restricted non geographical numbers.
+        :type restricted_non_geo_numbers: bool
+        :param included_telephony_type: Returns the list of phone numbers that are of given `includedTelephonyType`.
+            By default if this query parameter is not provided, it will list both PSTN and Mobile Numbers. Possible
+            input values are PSTN_NUMBER, MOBILE_NUMBER.
+        :type included_telephony_type: TelephonyType
+        :param service_number: Returns the list of service phone numbers.
+        :type service_number: bool
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: yields :class:`NumberListPhoneNumber` instances
+        """
+        params.update((to_camel(p), v) for i, (p, v) in enumerate(locals().items())
+                      if i and v is not None and p != 'params')
+        # parameter is actually called included_telephony_types
+        if itp := params.pop('includedTelephonyType', None):
+            params['includedTelephonyTypes'] = itp
+        for param, value in params.items():
+            if isinstance(value, bool):
+                value = 'true' if value else 'false'
+                params[param] = value
+            elif isinstance(value, Enum):
+                value = value.value
+                params[param] = value
+        url = self.ep(path='numbers')
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=NumberListPhoneNumber, params=params,
+                                              item_key='phoneNumbers')
+
+    async def phone_numbers(self, location_id: str = None, phone_number: str = None, available: bool = None,
+                      order: str = None,
+                      owner_name: str = None, owner_id: str = None, owner_type: OwnerType = None,
+                      extension: str = None, number_type: NumberType = None,
+                      phone_number_type: NumberListPhoneNumberType = None,
+                      state: NumberState = None, details: bool = None, toll_free_numbers: bool = None,
+                      restricted_non_geo_numbers: bool = None,
+                      included_telephony_type: TelephonyType = None,
+                      service_number: bool = None,
+                      org_id: str = None, **params) -> List[NumberListPhoneNumber]:
+        """
+        Get Phone Numbers for an Organization with Given Criterias
+
+        List all the phone numbers for the given organization along with the status and owner (if any).
+
+        Numbers can be standard, service, or mobile. Both standard and service numbers are PSTN numbers.
+        Service numbers are considered as high-utilization or high-concurrency phone numbers and can be assigned to
+        features like auto-attendants, call queues, and hunt groups.
+        Phone numbers can be linked to a specific location, be active or inactive, and be assigned or unassigned.
+        The owner of a number is the person, workspace, or feature to which the number is assigned.
+        Only a person can own a mobile number.
+
+        Retrieving this list requires a full or read-only administrator or location administrator auth token with a
+        scope of `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization.
+        :type location_id: str
+        :param phone_number: Search for this phone number.
+        :type phone_number: str
+        :param available: Search among the available phone numbers. This parameter cannot be used along with owner_type
+            parameter when set to true.
+        :type available: bool
+        :param order: Sort the list of phone numbers based on the following:lastName,dn,extension. Default sort will
+            be based on number and extension in an Ascending order
+        :type order: str
+        :param owner_name: Return the list of phone numbers that is owned by given owner name. Maximum length is 255.
+        :type owner_name: str
+        :param owner_id: Returns only the matched number/extension entries assigned to the feature with specified
+            uuid/broadsoftId.
+        :type owner_id: str
+        :param owner_type: Returns the list of phone numbers that are of given owner_type.
+        :type owner_type: OwnerType
+        :param extension: Returns the list of PSTN phone numbers with given extension.
+        :type extension: str
+        :param number_type: Returns the filtered list of PSTN phone numbers that contains given type of numbers.
+            This parameter cannot be used along with available or state.
+        :type number_type: NumberType
+        :param phone_number_type: Returns the filtered list of PSTN phone numbers that are of given phoneNumberType.
+        :type phone_number_type: NumberListPhoneNumberType
+        :param state: Returns the list of PSTN phone numbers with matching state.
+        :type state: NumberState
+        :param details: Returns the overall count of the PSTN phone numbers along with other details for given
+            organization.
+        :type details: bool
+        :param toll_free_numbers: Returns the list of toll free phone numbers.
+        :type toll_free_numbers: bool
+        :param restricted_non_geo_numbers: Returns the list of restricted non geographical numbers.
+        :type restricted_non_geo_numbers: bool
+        :param included_telephony_type: Returns the list of phone numbers that are of given `includedTelephonyType`.
+            By default if this query parameter is not provided, it will list both PSTN and Mobile Numbers. Possible
+            input values are PSTN_NUMBER, MOBILE_NUMBER.
+        :type included_telephony_type: TelephonyType
+        :param service_number: Returns the list of service phone numbers.
+        :type service_number: bool
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: yields :class:`NumberListPhoneNumber` instances
+        """
+        params.update((to_camel(p), v) for i, (p, v) in enumerate(locals().items())
+                      if i and v is not None and p != 'params')
+        # parameter is actually called included_telephony_types
+        if itp := params.pop('includedTelephonyType', None):
+            params['includedTelephonyTypes'] = itp
+        for param, value in params.items():
+            if isinstance(value, bool):
+                value = 'true' if value else 'false'
+                params[param] = value
+            elif isinstance(value, Enum):
+                value = value.value
+                params[param] = value
+        url = self.ep(path='numbers')
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=NumberListPhoneNumber, params=params,
+                                              item_key='phoneNumbers')]
+
+    async def phone_number_details(self, org_id: str = None) -> NumberDetails:
+        """
+        get summary (counts) of phone numbers
+
+        :param org_id: details for numbers in this organization.
+        :type org_id: str
+        :return: phone number details
+        :rtype: :class:`NumberDetails`
+        """
+        params = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                  if i and v is not None}
+        params['details'] = 'true'
+        params['max'] = 1
+        url = self.ep(path='numbers')
+        data = await self.get(url, params=params)
+        return NumberDetails.model_validate(data['count'])
+
+    async def validate_extensions(self, extensions: list[str]) -> ValidateExtensionsResponse:
+        """
+        Validate the List of Extensions
+
+        Validates the list of Extensions provided by the customer at the organization level. It checks the extension
+        meets the current extension length limits and does not conflict with the extensions of organization-level
+        entities and settings. To check for extension use across all locations, use the `Get Phone Numbers
+        <https://developer.webex.com/v1/telephony/config/numbers>`_ API. To
+        validate an extension and check for conflicts for a specific location, use the `Validate Extensions
+        <https://developer.webex.com/docs/api/v1/location-call-settings/validate-extensions>`_ API.
+
+        Retrieving this list requires a full or read-only administrator or location administrator auth token with a
+        scope of `spark-admin:telephony_config_read`.
+
+        :param extensions: Array of Strings of ID of Extensions.
+        :type extensions: list[str]
+        :return: validation response
+        :rtype: :class:`wxc_sdk.common.ValidateExtensionsResponse`
+        """
+        url = self.ep(path='actions/validateExtensions/invoke')
+        data = await self.post(url, json={'extensions': extensions})
+        return ValidateExtensionsResponse.model_validate(data)
+
+    async def validate_phone_numbers(self, phone_numbers: list[str], org_id: str = None) -> ValidatePhoneNumbersResponse:
+        """
+        Validate the list of phone numbers in an organization. Each phone number's availability is indicated in the
+        response.
+
+        Each location has a set of phone numbers that can be assigned to people, workspaces, or features. Phone numbers
+        must follow E.164 format for all countries, except for the United States, which can also follow the National
+        format. Active phone numbers are in service.
+
+        Validating a phone number in an organization requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param phone_numbers: List of phone numbers to be validated.
+        :type phone_numbers: list[str]
+        :param org_id: Organization of the Route Group.
+        :type org_id: str
+        :return: validation result
+        :rtype: :class:`wxc_sdk.common.ValidatePhoneNumbersResponse`
+        """
+        url = self.ep('actions/validateNumbers/invoke')
+        body = {'phoneNumbers': phone_numbers}
+        params = org_id and {'orgId': org_id} or None
+        data = await self.post(url=url, params=params, json=body)
+        return ValidatePhoneNumbersResponse.model_validate(data)
+
+    async def ucm_profiles(self, org_id: str = None) -> list[UCMProfile]:
+        """
+        Read the List of UC Manager Profiles
+
+        List all calling UC Manager Profiles for the organization.
+
+        UC Manager Profiles are applicable if your organization uses Jabber in Team Messaging mode or Calling in
+        Webex Teams (Unified CM).
+
+        The UC Manager Profile has an organization-wide default and may be overridden for individual persons, although
+        currently only setting at a user level is supported by Webex APIs.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:people_read as this API is designed to be used in conjunction with calling behavior at the
+        user level.
+
+        :param org_id: List manager profiles in this organization.
+        :type org_id: str
+        :return: list of :class:`UCMProfile`
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep(path='callingProfiles')
+        data = await self.get(url, params=params)
+        return type_adapter(list[UCMProfile]).validate_python(data['callingProfiles'])
+
+    def route_choices_gen(self, route_group_name: str = None, trunk_name: str = None, order: str = None,
+                      org_id: str = None) -> AsyncGenerator[RouteIdentity, None, None]:
+        """
+        List all Routes for the organization.
+
+        Trunk and Route Group qualify as Route. Trunks and Route Groups provide you the ability to configure Webex
+        Calling to manage calls between Webex Calling hosted users and premises PBX(s) users. This solution lets you
+        configure users to use Cloud PSTN (CCP or Cisco PSTN) or Premises-based PSTN.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param route_group_name: Return the list of route identities matching the route group name.
+        :param trunk_name: Return the list of route identities matching the trunk name.
+        :param order: Order the route identities according to the designated fields.
+            Available sort fields: routeName, routeType.
+        :param org_id: List route identities for this organization.
+        :return:
+        """
+        params = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                  if i and v is not None}
+        url = self.ep('routeChoices')
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=RouteIdentity, params=params, item_key='routeIdentities')
+
+    async def route_choices(self, route_group_name: str = None, trunk_name: str = None, order: str = None,
+                      org_id: str = None) -> List[RouteIdentity]:
+        """
+        List all Routes for the organization.
+
+        Trunk and Route Group qualify as Route. Trunks and Route Groups provide you the ability to configure Webex
+        Calling to manage calls between Webex Calling hosted users and premises PBX(s) users. This solution lets you
+        configure users to use Cloud PSTN (CCP or Cisco PSTN) or Premises-based PSTN.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param route_group_name: Return the list of route identities matching the route group name.
+        :param trunk_name: Return the list of route identities matching the trunk name.
+        :param order: Order the route identities according to the designated fields.
+            Available sort fields: routeName, routeType.
+        :param org_id: List route identities for this organization.
+        :return:
+        """
+        params = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                  if i and v is not None}
+        url = self.ep('routeChoices')
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=RouteIdentity, params=params, item_key='routeIdentities')]
+
+    async def test_call_routing(self, originator_id: str, originator_type: OriginatorType, destination: str,
+                          originator_number: str = None, include_applied_services: bool = None,
+                          org_id: str = None) -> TestCallRoutingResult:
+        """
+        Test Call Routing
+
+        Validates that an incoming call can be routed.
+
+        Dial plans route calls to on-premises destinations by use of trunks or route groups.
+        They are configured globally for an enterprise and apply to all users, regardless of location.
+        A dial plan also specifies the routing choice (trunk or route group) for calls that match any of its dial
+        patterns.
+        Specific dial patterns can be defined as part of your dial plan.
+
+        Test call routing requires a full administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param originator_id: This element is used to identify the originating party. It can be a person ID or a trunk
+            ID.
+        :type originator_id: str
+        :param originator_type: This element is used to identify if the `originatorId` is of type `PEOPLE` or `TRUNK`.
+        :type originator_type: OriginatorType
+        :param destination: This element specifies the called party. It can be any dialable string, for example, an ESN
+            number, E.164 number, hosted user DN, extension, extension with location code, URL, or FAC code.
+        :type destination: str
+        :param originator_number: Only used when `originatorType` is `TRUNK`. The `originatorNumber` can be a phone
+            number or URI.
+        :type originator_number: str
+        :param include_applied_services: This element is used to retrieve if any translation pattern, call intercept,
+            permission by type or permission by digit pattern is present for the called party.
+        :type include_applied_services: bool
+        :param org_id: Organization in which we are validating a call routing.
+        :type org_id: str
+        :rtype: :class:`TestCallRoutingResult`
+        """
+        params = org_id and {'orgId': org_id} or None
+        body = dict()
+        body['originatorId'] = originator_id
+        body['originatorType'] = enum_str(originator_type)
+        if originator_number is not None:
+            body['originatorNumber'] = originator_number
+        body['destination'] = destination
+        if include_applied_services is not None:
+            body['includeAppliedServices'] = include_applied_services
+        url = self.ep('actions/testCallRouting/invoke')
+        data = await self.post(url=url, params=params, json=body)
+        return TestCallRoutingResult.model_validate(data)
+
+    async def supported_devices(self, org_id: str = None) -> SupportedDevices:
+        """
+        Gets the list of supported devices for an organization.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param org_id: List supported devices for an organization
+        :return: List of supported devices
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep('supportedDevices')
+        data = await self.get(url=url, params=params)
+        return SupportedDevices.model_validate(data)
+
+    async def device_settings(self, org_id: str = None) -> DeviceCustomization:
+        """
+        Get device override settings for an organization.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param org_id: List supported devices for an organization location.
+        :type org_id: str
+        :return: device customization response
+        :rtype: DeviceCustomization
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep('devices/settings')
+        data = await self.get(url=url, params=params)
+        return DeviceCustomization.model_validate(data)
+
+    async def read_list_of_announcement_languages(self) -> list[AnnouncementLanguage]:
+        """
+        List all languages supported by Webex Calling for announcements and voice prompts.
+        Retrieving announcement languages requires a full or read-only administrator auth token with a scope of
+        spark-admin:telephony_config_read.
+
+        documentation: https://developer.webex.com/docs/api/v1/webex-calling-organization-settings/read-the-list-of
+        -announcement-languages
+        """
+        url = self.ep('announcementLanguages')
+        data = await super().get(url=url)
+        return type_adapter(list[AnnouncementLanguage]).validate_python(data["languages"])
+
+    async def read_moh(self, org_id: str = None) -> MoHConfig:
+        """
+        Get the organization Music on Hold configuration
+
+        Retrieve the organization's Music on Hold settings.
+
+        :param org_id: Retrieve Music on Hold settings for this organization.
+        :type org_id: str
+        :rtype: MoHConfig
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep('moh/settings')
+        data = await super().get(url, params=params)
+        return MoHConfig.model_validate(data)
+
+    async def update_moh(self, settings: MoHConfig, org_id: str = None):
+        """
+        Update the organization Music on Hold configuration
+
+        Update the organization's Music on Hold settings.
+
+        :param settings: Music on Hold settings
+        :type settings: MoHConfig
+        :param org_id: Patch Music on Hold for this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = settings.model_dump(mode='json', by_alias=True, exclude_none=True)
+        url = self.ep('moh/settings')
+        await super().put(url, params=params, json=body)
+
+    async def create_a_call_token(self, called_number: str, guest_name: str = None) -> str:
+        """
+        Create a call token
+
+        Create a call token before initiating the click-to-call interaction.
+        The call token embeds information related to click-to-call interaction into an encrypted JWE token.
+        This token is used along with the `guest token
+        <https://developer.webex.com/docs/api/v1/guests-management/create-a-guest>`_ to initialise the web calling SDK
+
+        Creating a call token requires a service app access token with a scope of `spark:webrtc_calling`.
+
+        :param called_number: Number to be called. This number should be enabled as guest calling destination at
+            `Webex Control Hub
+            <https://admin.webex.com>`_ by the administrator.
+        :type called_number: str
+        :param guest_name: Name of the guest caller.
+        :type guest_name: str
+        :rtype: str
+        """
+        body = dict()
+        body['calledNumber'] = called_number
+        if guest_name is not None:
+            body['guestName'] = guest_name
+        url = self.session.ep('telephony/click2call/callToken')
+        data = await super().post(url, json=body)
+        r = data['callToken']
+        return r
@@ -0,0 +1,251 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.announcements_repo import RepoAnnouncement, RepositoryUsage
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsAnnouncementsRepositoryApi']
+
+
+class AsAnnouncementsRepositoryApi(AsApiChild, base='telephony/config'):
+    """
+    Not supported for Webex for Government (FedRAMP)
+
+    Features: Announcement Repository support reading and writing of Webex Calling Announcement Repository settings for
+    a specific organization.
+
+    Viewing these read-only organization settings requires a full or read-only administrator auth token with a scope of
+    spark-admin:telephony_config_read.
+    Modifying these organization settings requires a full administrator auth token with a scope
+    of spark-admin:telephony_config_write.
+
+    A partner administrator can retrieve or change settings in a customer's organization using the optional orgId query
+    parameter.
+    """
+
+    def list_gen(self, location_id: str = None, order: str = None, file_name: str = None, file_type: str = None,
+             media_file_type: str = None, name: str = None, org_id: str = None,
+             **params) -> AsyncGenerator[RepoAnnouncement, None, None]:
+        """
+        Fetch a list of binary announcement greetings at an organization as well as location level.
+        An admin can upload a file at an organization level. This file will be uploaded to the announcement repository.
+        This API requires a full or read-only administrator auth token with a scope of
+        spark-admin:telephony_config_read.
+
+        :param location_id: Return the list of enterprise or Location announcement files. Without this parameter, the
+            Enterprise level announcements are returned. Possible values: all, locations,
+            Y2lzY29zcGFyazovL3VzL0xPQ0FUSU9OLzMxMTYx
+        :type location_id: str
+        :param order: Sort the list according to fileName or fileSize. The default sort will be in Ascending order.
+        :type order: str
+        :param file_name: Return the list of announcements with the given fileName.
+        :type file_name: str
+        :param file_type: Return the list of announcement files for this fileType.
+        :type file_type: str
+        :param media_file_type: Return the list of announcement files for this mediaFileType.
+        :type media_file_type: str
+        :param name: Return the list of announcement files for this announcement label.
+        :type name: str
+        :param org_id: Create an announcement in this organization.
+        :type org_id: str
+        :return: yields :class:`RepoAnnouncement` objects
+
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if location_id is not None:
+            params['locationId'] = location_id
+        if order is not None:
+            params['order'] = order
+        if file_name is not None:
+            params['fileName'] = file_name
+        if file_type is not None:
+            params['fileType'] = file_type
+        if media_file_type is not None:
+            params['mediaFileType'] = media_file_type
+        if name is not None:
+            params['name'] = name
+        url = self.ep('announcements')
+        return self.session.follow_pagination(url=url, model=RepoAnnouncement, item_key='announcements',
+                                              params=params)
+
+    async def list(self, location_id: str = None, order: str = None, file_name: str = None, file_type: str = None,
+             media_file_type: str = None, name: str = None, org_id: str = None,
+             **params) -> List[RepoAnnouncement]:
+        """
+        Fetch a list of binary announcement greetings at an organization as well as location level.
+        An admin can upload a file at an organization level. This file will be uploaded to the announcement repository.
+        This API requires a full or read-only administrator auth token with a scope of
+        spark-admin:telephony_config_read.
+
+        :param location_id: Return the list of enterprise or Location announcement files. Without this parameter, the
+            Enterprise level announcements are returned. Possible values: all, locations,
+            Y2lzY29zcGFyazovL3VzL0xPQ0FUSU9OLzMxMTYx
+        :type location_id: str
+        :param order: Sort the list according to fileName or fileSize. The default sort will be in Ascending order.
+        :type order: str
+        :param file_name: Return the list of announcements with the given fileName.
+        :type file_name: str
+        :param file_type: Return the list of announcement files for this fileType.
+        :type file_type: str
+        :param media_file_type: Return the list of announcement files for this mediaFileType.
+        :type media_file_type: str
+        :param name: Return the list of announcement files for this announcement label.
+        :type name: str
+        :param org_id: Create an announcement in this organization.
+        :type org_id: str
+        :return: yields :class:`RepoAnnouncement` objects
+
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if location_id is not None:
+            params['locationId'] = location_id
+        if order is not None:
+            params['order'] = order
+        if file_name is not None:
+            params['fileName'] = file_name
+        if file_type is not None:
+            params['fileType'] = file_type
+        if media_file_type is not None:
+            params['mediaFileType'] = media_file_type
+        if name is not None:
+            params['name'] = name
+        url = self.ep('announcements')
+        return [o async for o in self.session.follow_pagination(url=url, model=RepoAnnouncement, item_key='announcements',
+                                              params=params)]
+
+    async def _upload_or_modify(self, *, url, name, file, upload_as, params, is_upload) -> dict:
+        if isinstance(file, str):
+            upload_as = upload_as or os.path.basename(file)
+            file = open(file, mode='rb')
+            must_close = True
+        else:
+            must_close = False
+            # an existing reader
+            if not upload_as:
+                raise ValueError('upload_as is required')
+        encoder = MultipartEncoder({'name': name, 'file': (upload_as, file, 'audio/wav')})
+        if is_upload:
+            meth = super().post
+        else:
+            meth = super().put
+        try:
+            data = await meth(url, data=encoder, headers={'Content-Type': encoder.content_type},
+                        params=params)
+        finally:
+            if must_close:
+                file.close()
+        return data
+        
+
+    async def upload_announcement(self, name: str, file: Union[BufferedReader, str], upload_as: str = None,
+                            location_id: str = None,
+                            org_id: str = None) -> str:
+        params = org_id and {'orgId': org_id} or None
+        if location_id is None:
+            url = self.ep('announcements')
+        else:
+            url = self.ep(f'locations/{location_id}/announcements')
+        data = await self._upload_or_modify(url=url, name=name, file=file, upload_as=upload_as, params=params,
+                                      is_upload=True)
+        return data["id"]
+
+        
+
+    async def usage(self, location_id: str = None, org_id: str = None) -> RepositoryUsage:
+        """
+        Retrieves repository usage for announcements for an organization.
+        This API requires a full or read-only administrator auth token with a scope of
+        spark-admin:telephony_config_read.
+
+        :param location_id: Unique identifier of a location
+        :type location_id: str
+        :param org_id: Create an announcement in this organization.
+        :type org_id: str
+
+        """
+        params = org_id and {'orgId': org_id} or None
+        if location_id is None:
+            url = self.ep('announcements/usage')
+        else:
+            url = self.ep(f'locations/{location_id}/announcements/usage')
+        data = await super().get(url=url, params=params)
+        return RepositoryUsage.model_validate(data)
+
+    async def details(self, announcement_id: str, location_id: str = None, org_id: str = None) -> RepoAnnouncement:
+        """
+        Fetch details of a binary announcement greeting by its ID at an organization level.
+        An admin can upload a file at an organization level. This file will be uploaded to the announcement repository.
+        This API requires a full or read-only administrator auth token with a scope of
+        spark-admin:telephony_config_read.
+
+        :param location_id: Unique identifier of a location
+        :type location_id: str
+        :param announcement_id: Unique identifier of an announcement.
+        :type announcement_id: str
+        :param org_id: Get details of an announcement in this organization.
+        :type org_id: str
+
+        """
+        params = org_id and {'orgId': org_id} or None
+        if location_id is None:
+            url = self.ep(f'announcements/{announcement_id}')
+        else:
+            url = self.ep(f'locations/{location_id}/announcements/{announcement_id}')
+        data = await super().get(url=url, params=params)
+        return RepoAnnouncement.model_validate(data)
+
+    async def delete(self, announcement_id: str, location_id: str = None, org_id: str = None):
+        """
+        Delete an announcement greeting.
+        This API requires a full administrator auth token with a scope of spark-admin:telephony_config_write.
+
+        :param announcement_id: Unique identifier of an announcement.
+        :type announcement_id: str
+        :param location_id: Unique identifier of a location where announcement is being deleted.
+        :type location_id: str
+        :param org_id: Delete an announcement in this organization.
+        :type org_id: str
+
+        """
+        params = org_id and {'orgId': org_id} or None
+
+        if location_id is None:
+            url = self.ep(f'announcements/{announcement_id}')
+        else:
+            url = self.ep(f'locations/{location_id}/announcements/{announcement_id}')
+        await super().delete(url=url, params=params)
+
+    async def modify(self, announcement_id: str, name: str, file: Union[BufferedReader, str],
+               upload_as: str = None, location_id: str = None, org_id: str = None):
+        params = org_id and {'orgId': org_id} or None
+        if location_id is None:
+            url = self.ep(f'announcements/{announcement_id}')
+        else:
+            url = self.ep(f'locations/{location_id}/announcements/{announcement_id}')
+        data = await self._upload_or_modify(url=url, name=name, file=file, upload_as=upload_as, params=params,
+                                      is_upload=False)
+        return data["id"]
+
+        
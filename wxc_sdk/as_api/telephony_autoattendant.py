@@ -0,0 +1,451 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.autoattendant import AutoAttendant, AvailableNumber
+from wxc_sdk.as_api.api_child import AsApiChild
+from wxc_sdk.as_api.telephony_forwarding import AsFeatureSelector, AsForwardingApi
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsAutoAttendantApi']
+
+
+@dataclass(init=False, repr=False)
+class AsAutoAttendantApi(AsApiChild, base='telephony/config/autoAttendants'):
+    """
+    Auto attendant API
+    """
+    forwarding: AsForwardingApi
+
+    def __init__(self, session: AsRestSession):
+        super().__init__(session=session)
+        self.forwarding = AsForwardingApi(session=session, feature_selector=AsFeatureSelector.auto_attendants)
+
+    def _endpoint(self, *, location_id: str = None, auto_attendant_id: str = None, path: str = None) -> str:
+        """
+        auto attendant specific feature endpoint like /v1/telephony/config/locations/{locationId}/autoAttendants/{
+        auto_attendant_id}
+
+        :meta private:
+        :param location_id: Unique identifier for the location.
+        :type location_id: str
+        :param auto_attendant_id: auto attendant id
+        :type auto_attendant_id: str
+        :return: full endpoint
+        :rtype: str
+        """
+        if location_id is None:
+            return self.session.ep('telephony/config/autoAttendants')
+        else:
+            ep = self.session.ep(f'telephony/config/locations/{location_id}/autoAttendants')
+            if auto_attendant_id:
+                ep = f'{ep}/{auto_attendant_id}'
+            if path:
+                ep = f'{ep}/{path}'
+            return ep
+
+    def list_gen(self, org_id: str = None, location_id: str = None, name: str = None,
+             phone_number: str = None, **params) -> AsyncGenerator[AutoAttendant, None, None]:
+        """
+        Read the List of Auto Attendants
+        List all Auto Attendants for the organization.
+
+        Auto attendants play customized prompts and provide callers with menu options for routing their calls through
+        your system.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param org_id: List auto attendants for this organization.
+        :type org_id: str
+        :param location_id: Return the list of auto attendants for this location.
+        :type location_id: str
+        :param name: Only return auto attendants with the matching name.
+        :type name: str
+        :param phone_number: Only return auto attendants with the matching phone number.
+        :type phone_number: str
+        :return: yields :class:`AutoAttendant` objects
+        """
+        params.update((to_camel(k), v)
+                      for i, (k, v) in enumerate(locals().items())
+                      if i and v is not None and k != 'params')
+        url = self._endpoint()
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=AutoAttendant, params=params, item_key='autoAttendants')
+
+    async def list(self, org_id: str = None, location_id: str = None, name: str = None,
+             phone_number: str = None, **params) -> List[AutoAttendant]:
+        """
+        Read the List of Auto Attendants
+        List all Auto Attendants for the organization.
+
+        Auto attendants play customized prompts and provide callers with menu options for routing their calls through
+        your system.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param org_id: List auto attendants for this organization.
+        :type org_id: str
+        :param location_id: Return the list of auto attendants for this location.
+        :type location_id: str
+        :param name: Only return auto attendants with the matching name.
+        :type name: str
+        :param phone_number: Only return auto attendants with the matching phone number.
+        :type phone_number: str
+        :return: yields :class:`AutoAttendant` objects
+        """
+        params.update((to_camel(k), v)
+                      for i, (k, v) in enumerate(locals().items())
+                      if i and v is not None and k != 'params')
+        url = self._endpoint()
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=AutoAttendant, params=params, item_key='autoAttendants')]
+
+    async def by_name(self, name: str, location_id: str = None, org_id: str = None) -> Optional[AutoAttendant]:
+        """
+        Get auto attendant info by name
+
+        :param location_id:
+        :param name:
+        :param org_id:
+        :return:
+        """
+        return next((hg for hg in await self.list(name=name, location_id=location_id, org_id=org_id)
+                     if hg.name == name), None)
+
+    async def details(self, location_id: str, auto_attendant_id: str, org_id: str = None) -> AutoAttendant:
+        """
+        Get Details for an Auto Attendant
+        Retrieve an Auto Attendant details.
+
+        Auto attendants play customized prompts and provide callers with menu options for routing their calls through
+        your system.
+
+        Retrieving an auto attendant details requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param location_id: Retrieve an auto attendant details in this location.
+        :type location_id: str
+        :param auto_attendant_id: Retrieve the auto attendant with the matching ID.
+        :type auto_attendant_id: str
+        :param org_id: Retrieve auto attendant details from this organization.
+        :type org_id: str
+        :return: auto attendant details
+        :rtype: :class:`AutoAttendant`
+        """
+        url = self._endpoint(location_id=location_id, auto_attendant_id=auto_attendant_id)
+        params = org_id and {'orgId': org_id} or None
+        return AutoAttendant.model_validate(await self.get(url, params=params))
+
+    async def create(self, location_id: str, settings: AutoAttendant, org_id: str = None) -> str:
+        """
+        Create an Auto Attendant
+        Create new Auto Attendant for the given location.
+
+        Auto attendants play customized prompts and provide callers with menu options for routing their calls through
+        your system.
+
+        Creating an auto attendant requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Create the auto attendant for this location.
+        :type location_id: str
+        :param settings: auto attendant settings for new auto attendant
+        :type settings: :class:`AutoAttendant`
+        :param org_id: Create the auto attendant for this organization.
+        :type org_id: str
+        :return: ID of the newly created auto attendant.
+        :rtype: str
+        """
+        data = settings.create_or_update()
+        url = self._endpoint(location_id=location_id)
+        params = org_id and {'orgId': org_id} or None
+        data = await self.post(url, data=data, params=params)
+        return data['id']
+
+    async def update(self, location_id: str, auto_attendant_id: str, settings: AutoAttendant, org_id: str = None):
+        """
+        Update an Auto Attendant
+        Update the designated Auto Attendant.
+
+        Auto attendants play customized prompts and provide callers with menu options for routing their calls through
+        your system.
+
+        Updating an auto attendant requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Location in which this auto attendant exists.
+        :type location_id: str
+        :param auto_attendant_id: Update an auto attendant with the matching ID.
+        :type auto_attendant_id: str
+        :param settings: auto attendant settings for the update
+        :type settings: :class:`AutoAttendant`
+        :param org_id: Create the auto attendant for this organization.
+        :type org_id: str
+        """
+        data = settings.create_or_update()
+        url = self._endpoint(location_id=location_id, auto_attendant_id=auto_attendant_id)
+        params = org_id and {'orgId': org_id} or None
+        await self.put(url, data=data, params=params)
+
+    async def delete_auto_attendant(self, location_id: str, auto_attendant_id: str, org_id: str = None):
+        """
+        elete the designated Auto Attendant.
+
+        Auto attendants play customized prompts and provide callers with menu options for routing their calls through
+        your system.
+
+        Deleting an auto attendant requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Location from which to delete an auto attendant.
+        :type location_id: str
+        :param auto_attendant_id: Delete the auto attendant with the matching ID.
+        :type auto_attendant_id: str
+        :param org_id: Delete the auto attendant from this organization.
+        :type org_id: str
+        """
+        url = self._endpoint(location_id=location_id, auto_attendant_id=auto_attendant_id)
+        params = org_id and {'orgId': org_id} or None
+        await self.delete(url, params=params)
+
+    def primary_available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                        org_id: str = None,
+                                        **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Auto Attendant Primary Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the auto attendant's primary phone
+        number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def primary_available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                        org_id: str = None,
+                                        **params) -> List[AvailableNumber]:
+        """
+        Get Auto Attendant Primary Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the auto attendant's primary phone
+        number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
+
+    def alternate_available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                          org_id: str = None,
+                                          **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Auto Attendant Alternate Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the auto attendant's alternate number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='alternate/availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def alternate_available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                          org_id: str = None,
+                                          **params) -> List[AvailableNumber]:
+        """
+        Get Auto Attendant Alternate Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the auto attendant's alternate number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='alternate/availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
+
+    def call_forward_available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                             owner_name: str = None, extension: str = None,
+                                             org_id: str = None,
+                                             **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Auto Attendant Call Forward Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the auto attendant's call forward
+        number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        assigned to an owning entity.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param owner_name: Return the list of phone numbers that are owned by the given `ownerName`. Maximum length is
+            255.
+        :type owner_name: str
+        :param extension: Returns the list of PSTN phone numbers with the given `extension`.
+        :type extension: str
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        if extension is not None:
+            params['extension'] = extension
+        url = self._endpoint(location_id=location_id, path='callForwarding/availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def call_forward_available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                             owner_name: str = None, extension: str = None,
+                                             org_id: str = None,
+                                             **params) -> List[AvailableNumber]:
+        """
+        Get Auto Attendant Call Forward Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the auto attendant's call forward
+        number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        assigned to an owning entity.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param owner_name: Return the list of phone numbers that are owned by the given `ownerName`. Maximum length is
+            255.
+        :type owner_name: str
+        :param extension: Returns the list of PSTN phone numbers with the given `extension`.
+        :type extension: str
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        if extension is not None:
+            params['extension'] = extension
+        url = self._endpoint(location_id=location_id, path='callForwarding/availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
@@ -0,0 +1,40 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.as_api.api_child import AsApiChild
+from wxc_sdk.as_api.telephony_call_routing_translation_pattern import AsTranslationPatternsApi
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsCallRoutingApi']
+
+
+@dataclass(init=False, repr=False)
+class AsCallRoutingApi(AsApiChild, base='telephony/config'):
+    """
+    Call Routing Api
+    """
+    #: translation patterns
+    tp: AsTranslationPatternsApi
+
+    def __init__(self, session: AsRestSession):
+        super().__init__(session=session)
+        self.tp = AsTranslationPatternsApi(session=session)
@@ -0,0 +1,390 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.callpark import AvailableRecallHuntGroup, CallPark, LocationCallParkSettings, \
+    PersonPlaceAgent
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsCallParkApi']
+
+
+class AsCallParkApi(AsApiChild, base='telephony/config/callParks'):
+    """
+    Call Park API
+    """
+
+    def _endpoint(self, *, location_id: str, callpark_id: str = None, path: str = None) -> str:
+        """
+        call park specific feature endpoint like /v1/telephony/config/locations/{locationId}/callParks/{callpark_id}
+
+        :meta private:
+        :param location_id: Unique identifier for the location.
+        :type location_id: str
+        :param callpark_id: call park id
+        :type callpark_id: str
+        :param path: addtl. path
+        :type path: str
+        :return: full endpoint
+        :rtype: str
+        """
+        call_park_id = callpark_id and f'/{callpark_id}' or ''
+        path = path and f'/{path}' or ''
+        ep = self.session.ep(f'telephony/config/locations/{location_id}/callParks{call_park_id}{path}')
+        return ep
+
+    def list_gen(self, location_id: str, order: Literal['ASC', 'DSC'] = None, name: str = None,
+             org_id: str = None, **params) -> AsyncGenerator[CallPark, None, None]:
+        """
+        Read the List of Call Parks
+
+        List all Call Parks for the organization.
+
+        Call Park allows call recipients to place a call on hold so that it can be retrieved from another device.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        NOTE: The Call Park ID will change upon modification of the Call Park name.
+
+        :param location_id: Return the list of call parks for this location.
+        :type location_id: str
+        :param order: Sort the list of call parks by name, either ASC or DSC. Default is ASC.
+        :type order: str
+        :param name: Return the list of call parks that contains the given name. The maximum length is 80.
+        :type name: str
+        :param org_id: List call parks for this organization.
+        :type org_id: str
+        :return: yields :class:`CallPark` objects
+        """
+        params.update((to_camel(k), v)
+                      for i, (k, v) in enumerate(locals().items())
+                      if i > 1 and v is not None and k != 'params')
+        url = self._endpoint(location_id=location_id)
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=CallPark, params=params, item_key='callParks')
+
+    async def list(self, location_id: str, order: Literal['ASC', 'DSC'] = None, name: str = None,
+             org_id: str = None, **params) -> List[CallPark]:
+        """
+        Read the List of Call Parks
+
+        List all Call Parks for the organization.
+
+        Call Park allows call recipients to place a call on hold so that it can be retrieved from another device.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        NOTE: The Call Park ID will change upon modification of the Call Park name.
+
+        :param location_id: Return the list of call parks for this location.
+        :type location_id: str
+        :param order: Sort the list of call parks by name, either ASC or DSC. Default is ASC.
+        :type order: str
+        :param name: Return the list of call parks that contains the given name. The maximum length is 80.
+        :type name: str
+        :param org_id: List call parks for this organization.
+        :type org_id: str
+        :return: yields :class:`CallPark` objects
+        """
+        params.update((to_camel(k), v)
+                      for i, (k, v) in enumerate(locals().items())
+                      if i > 1 and v is not None and k != 'params')
+        url = self._endpoint(location_id=location_id)
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=CallPark, params=params, item_key='callParks')]
+
+    async def create(self, location_id: str, settings: CallPark, org_id: str = None) -> str:
+        """
+        Create a Call Park
+
+        Create new Call Parks for the given location.
+
+        Call Park allows call recipients to place a call on hold so that it can be retrieved from another device.
+
+        Creating a call park requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        NOTE: The Call Park ID will change upon modification of the Call Park name.
+
+        :param location_id: Create the call park for this location.
+        :type location_id: str
+        :param settings: settings for new call park
+        :type settings: :class:`CallPark`
+        :param org_id: Create the call park for this organization.
+        :return: ID of the newly created call park.
+        :rtype: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(location_id=location_id)
+        body = settings.create_or_update()
+        data = await self.post(url, data=body, params=params)
+        return data['id']
+
+    async def delete_callpark(self, location_id: str, callpark_id: str, org_id: str = None):
+        """
+        Delete a Call Park
+
+        Delete the designated Call Park.
+
+        Call Park allows call recipients to place a call on hold so that it can be retrieved from another device.
+
+        Deleting a call park requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        NOTE: The Call Park ID will change upon modification of the Call Park name.
+
+        :param location_id: Location from which to delete a call park.
+        :type location_id: str
+        :param callpark_id: Delete the call park with the matching ID.
+        :type callpark_id: str
+        :param org_id: Delete the call park from this organization.
+        :type org_id: str
+        """
+        url = self._endpoint(location_id=location_id, callpark_id=callpark_id)
+        params = org_id and {'orgId': org_id} or None
+        await self.delete(url, params=params)
+
+    async def details(self, location_id: str, callpark_id: str, org_id: str = None) -> CallPark:
+        """
+        Get Details for a Call Park
+
+        Retrieve Call Park details.
+
+        Call Park allows call recipients to place a call on hold so that it can be retrieved from another device.
+
+        Retrieving call park details requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        NOTE: The Call Park ID will change upon modification of the Call Park name.
+
+        :param location_id: Retrieve settings for a call park in this location.
+        :type location_id: str
+        :param callpark_id: Retrieve settings for a call park with the matching ID.
+        :type callpark_id: str
+        :param org_id: Retrieve call park settings from this organization.
+        :type org_id: str
+        :return: call park info
+        :rtype: :class:`CallPark`
+        """
+        url = self._endpoint(location_id=location_id, callpark_id=callpark_id)
+        params = org_id and {'orgId': org_id} or None
+        return CallPark.model_validate(await self.get(url, params=params))
+
+    async def update(self, location_id: str, callpark_id: str, settings: CallPark, org_id: str = None) -> str:
+        """
+        Update a Call Park
+
+        Update the designated Call Park.
+
+        Call Park allows call recipients to place a call on hold so that it can be retrieved from another device.
+
+        Updating a call park requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        NOTE: The Call Park ID will change upon modification of the Call Park name.
+
+        :param location_id: RLocation in which this call park exists.
+        :type location_id: str
+        :param callpark_id: Update settings for a call park with the matching ID.
+        :type callpark_id: str
+        :param settings: updates
+        :type settings: :class:`CallPark`
+        :param org_id: Update call park settings from this organization.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(location_id=location_id, callpark_id=callpark_id)
+        body = settings.create_or_update()
+        data = await self.put(url, data=body, params=params)
+        return data['id']
+
+    def available_agents_gen(self, location_id: str, call_park_name: str = None, name: str = None, phone_number: str = None,
+                         order: str = None, org_id: str = None) -> AsyncGenerator[PersonPlaceAgent, None, None]:
+        """
+        Get available agents from Call Parks
+        Retrieve available agents from call parks for a given location.
+
+        Call Park allows call recipients to place a call on hold so that it can be retrieved from another device.
+
+        Retrieving available agents from call parks requires a full or read-only administrator auth token with
+        a scope of spark-admin:telephony_config_read.
+
+        :param location_id: Return the available agents for this location.
+        :type location_id: str
+        :param call_park_name: Only return available agents from call parks with the matching name.
+        :type call_park_name: str
+        :param name: Only return available agents with the matching name.
+        :type name: str
+        :param phone_number: Only return available agents with the matching primary number.
+        :type phone_number: str
+        :param order: Order the available agents according to the designated fields. Up to three vertical bar (|)
+            separated sort order fields may be specified. Available sort fields: fname, lname, number and extension.
+            The maximum supported sort order value is 3.
+        :type order: str
+        :param org_id: Return the available agents for this organization.
+        :type org_id: str
+        :return: yields :class:`PersonPlaceCallPark` objects
+        """
+        params = {to_camel(k): v for i, (k, v) in enumerate(locals().items())
+                  if i > 1 and v is not None}
+        url = self._endpoint(location_id=location_id, path='availableUsers')
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=PersonPlaceAgent, params=params, item_key='agents')
+
+    async def available_agents(self, location_id: str, call_park_name: str = None, name: str = None, phone_number: str = None,
+                         order: str = None, org_id: str = None) -> List[PersonPlaceAgent]:
+        """
+        Get available agents from Call Parks
+        Retrieve available agents from call parks for a given location.
+
+        Call Park allows call recipients to place a call on hold so that it can be retrieved from another device.
+
+        Retrieving available agents from call parks requires a full or read-only administrator auth token with
+        a scope of spark-admin:telephony_config_read.
+
+        :param location_id: Return the available agents for this location.
+        :type location_id: str
+        :param call_park_name: Only return available agents from call parks with the matching name.
+        :type call_park_name: str
+        :param name: Only return available agents with the matching name.
+        :type name: str
+        :param phone_number: Only return available agents with the matching primary number.
+        :type phone_number: str
+        :param order: Order the available agents according to the designated fields. Up to three vertical bar (|)
+            separated sort order fields may be specified. Available sort fields: fname, lname, number and extension.
+            The maximum supported sort order value is 3.
+        :type order: str
+        :param org_id: Return the available agents for this organization.
+        :type org_id: str
+        :return: yields :class:`PersonPlaceCallPark` objects
+        """
+        params = {to_camel(k): v for i, (k, v) in enumerate(locals().items())
+                  if i > 1 and v is not None}
+        url = self._endpoint(location_id=location_id, path='availableUsers')
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=PersonPlaceAgent, params=params, item_key='agents')]
+
+    def available_recalls_gen(self, location_id: str, name: str = None, order: str = None,
+                          org_id: str = None) -> AsyncGenerator[AvailableRecallHuntGroup, None, None]:
+        """
+        Get available recall hunt groups from Call Parks
+
+        Retrieve available recall hunt groups from call parks for a given location.
+
+        Call Park allows call recipients to place a call on hold so that it can be retrieved from another device.
+
+        Retrieving available recall hunt groups from call parks requires a full or read-only administrator auth
+        token with a scope of spark-admin:telephony_config_read.
+
+        :param location_id: Return the available recall hunt groups for this location.
+        :type location_id: str
+        :param name: Only return available recall hunt groups with the matching name.
+        :type name: str
+        :param order: Order the available recall hunt groups according to the designated fields. Available sort
+            fields: lname.
+        :param order: str
+        :param org_id: Return the available recall hunt groups for this organization.
+        :type org_id: str
+        :return: yields :class:`AvailableRecallHuntGroup` objects
+        """
+        params = {to_camel(k): v for i, (k, v) in enumerate(locals().items())
+                  if i > 1 and v is not None}
+        url = self._endpoint(location_id=location_id, path='availableRecallHuntGroups')
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=AvailableRecallHuntGroup,
+                                              params=params, item_key='huntGroups')
+
+    async def available_recalls(self, location_id: str, name: str = None, order: str = None,
+                          org_id: str = None) -> List[AvailableRecallHuntGroup]:
+        """
+        Get available recall hunt groups from Call Parks
+
+        Retrieve available recall hunt groups from call parks for a given location.
+
+        Call Park allows call recipients to place a call on hold so that it can be retrieved from another device.
+
+        Retrieving available recall hunt groups from call parks requires a full or read-only administrator auth
+        token with a scope of spark-admin:telephony_config_read.
+
+        :param location_id: Return the available recall hunt groups for this location.
+        :type location_id: str
+        :param name: Only return available recall hunt groups with the matching name.
+        :type name: str
+        :param order: Order the available recall hunt groups according to the designated fields. Available sort
+            fields: lname.
+        :param order: str
+        :param org_id: Return the available recall hunt groups for this organization.
+        :type org_id: str
+        :return: yields :class:`AvailableRecallHuntGroup` objects
+        """
+        params = {to_camel(k): v for i, (k, v) in enumerate(locals().items())
+                  if i > 1 and v is not None}
+        url = self._endpoint(location_id=location_id, path='availableRecallHuntGroups')
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableRecallHuntGroup,
+                                              params=params, item_key='huntGroups')]
+
+    async def call_park_settings(self, location_id: str, org_id: str = None) -> LocationCallParkSettings:
+        """
+        Get Call Park Settings
+
+        Retrieve Call Park Settings from call parks for a given location.
+
+        Call Park allows call recipients to place a call on hold so that it can be retrieved from another device.
+
+        Retrieving settings from call parks requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param location_id: Return the call park settings for this location.
+        :type location_id: str
+        :param org_id: Return the call park settings for this organization.
+        :type org_id: str
+        :return:
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(location_id=location_id, path='settings')
+        return LocationCallParkSettings.model_validate(await self.get(url, params=params))
+
+    async def update_call_park_settings(self, location_id: str, settings: LocationCallParkSettings, org_id: str = None):
+        """
+        Update Call Park settings
+
+        Update Call Park settings for the designated location.
+
+        Call Park allows call recipients to place a call on hold so that it can be retrieved from another device.
+
+        Updating call park settings requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Location for which call park settings will be updated.
+        :type location_id: str
+        :param settings: update settings
+        :type settings: :class:`LocationCallParkSettings`
+        :param org_id: Update call park settings from this organization.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(location_id=location_id, path='settings')
+        body = settings.update()
+        await self.put(url, params=params, data=body)
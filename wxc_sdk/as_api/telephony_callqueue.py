@@ -0,0 +1,795 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.callqueue import AvailableAgent, AvailableNumber, CallQueue, CallQueueSettings
+from wxc_sdk.as_api.api_child import AsApiChild
+from wxc_sdk.as_api.telephony_callqueue_agents import AsCallQueueAgentsApi
+from wxc_sdk.as_api.telephony_callqueue_announcement import AsAnnouncementApi
+from wxc_sdk.as_api.telephony_callqueue_policies import AsCQPolicyApi
+from wxc_sdk.as_api.telephony_forwarding import AsFeatureSelector, AsForwardingApi
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsCallQueueApi']
+
+
+@dataclass(init=False, repr=False)
+class AsCallQueueApi(AsApiChild, base=''):
+    """
+    Features:  Call Queue
+
+    Features: Call Queue supports reading and writing of Webex Calling Call Queue settings for a specific organization.
+
+    Supervisors are users who manage agents and who perform functions including monitoring, coaching, and more.
+
+    Viewing these read-only organization settings requires a full or read-only administrator auth token with a scope
+    of `spark-admin:telephony_config_read`.
+
+    Modifying these organization settings requires a full administrator auth token with a scope
+    of `spark-admin:telephony_config_write`.
+
+    A partner administrator can retrieve or change settings in a customer's organization using the optional `orgId`
+    query parameter.
+    """
+    agents: AsCallQueueAgentsApi
+    forwarding: AsForwardingApi
+    announcement: AsAnnouncementApi
+    policy: AsCQPolicyApi
+
+    def __init__(self, session: AsRestSession):
+        super().__init__(session=session)
+        self.agents = AsCallQueueAgentsApi(session=session)
+        self.forwarding = AsForwardingApi(session=session, feature_selector=AsFeatureSelector.queues)
+        self.announcement = AsAnnouncementApi(session=session)
+        self.policy = AsCQPolicyApi(session=session)
+
+    def _endpoint(self, *, location_id: str = None, queue_id: str = None, path: str = None):
+        """
+        Helper to get URL for API endpoints
+
+        :meta private:
+        :param location_id:
+        :param queue_id:
+        :return:
+        """
+        if location_id is None:
+            return self.ep('telephony/config/queues')
+        else:
+            ep = self.ep(f'telephony/config/locations/{location_id}/queues')
+            if queue_id:
+                ep = f'{ep}/{queue_id}'
+            if path:
+                ep = f'{ep}/{path}'
+            return ep
+
+    @staticmethod
+    def update_or_create(*, queue: CallQueue) -> str:
+        """
+        Get JSON for update or create
+
+        :meta private:
+        :param queue:
+        :return:
+        """
+        return queue.model_dump_json(
+            exclude={'id': True,
+                     'location_name': True,
+                     'location_id': True,
+                     'toll_free_number': True,
+                     'language': True,
+                     'agents':
+                         {'__all__':
+                              {'first_name': True,
+                               'last_name': True,
+                               'user_type': True,
+                               'extension': True,
+                               'phone_number': True}},
+                     'alternate_number_settings':
+                         {'alternate_numbers':
+                              {'__all__':
+                                   {'toll_free_number': True}}},
+                     'queue_settings':
+                         {'overflow':
+                              {'is_transfer_number_set': True}}})
+
+    def list_gen(self, location_id: str = None, name: str = None, phone_number: str = None,
+             department_id: str = None, department_name: str = None,
+             has_cx_essentials: bool = None, org_id: str = None,
+             **params) -> AsyncGenerator[CallQueue, None, None]:
+        """
+        Read the List of Call Queues
+
+        List all Call Queues for the organization.
+
+        Call queues temporarily hold calls in the cloud, when all agents
+        assigned to receive calls from the queue are unavailable. Queued calls are routed to
+        an available agent, when not on an active call. Each call queue is assigned a lead number, which is a telephone
+        number that external callers can dial to reach the users assigned to the call queue.
+        Call queues are also assigned an internal extension, which can be dialed
+        internally to reach the users assigned to the call queue.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param location_id: Returns the list of call queues in this location.
+        :type location_id: str
+        :param name: Returns only the call queues matching the given name.
+        :type name: str
+        :param phone_number: Returns only the call queues matching the given primary phone number or extension.
+        :type phone_number: str
+        :param department_id: Returns only call queues matching the given department ID.
+        :type department_id: str
+        :param department_name: Returns only call queues matching the given department name.
+        :type department_name: str
+        :param has_cx_essentials: Returns only the list of call queues with Customer Experience Essentials license when
+            `true`, otherwise returns the list of Customer Experience Basic call queues.
+        :type has_cx_essentials: bool
+        :param org_id: Returns the list of call queues in this organization.
+        :type org_id: str
+        :return: yields :class:`CallQueue` objects
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if location_id is not None:
+            params['locationId'] = location_id
+        if name is not None:
+            params['name'] = name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if department_id is not None:
+            params['departmentId'] = department_id
+        if department_name is not None:
+            params['departmentName'] = department_name
+        if has_cx_essentials is not None:
+            params['hasCxEssentials'] = str(has_cx_essentials).lower()
+        url = self._endpoint()
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=CallQueue, params=params)
+
+    async def list(self, location_id: str = None, name: str = None, phone_number: str = None,
+             department_id: str = None, department_name: str = None,
+             has_cx_essentials: bool = None, org_id: str = None,
+             **params) -> List[CallQueue]:
+        """
+        Read the List of Call Queues
+
+        List all Call Queues for the organization.
+
+        Call queues temporarily hold calls in the cloud, when all agents
+        assigned to receive calls from the queue are unavailable. Queued calls are routed to
+        an available agent, when not on an active call. Each call queue is assigned a lead number, which is a telephone
+        number that external callers can dial to reach the users assigned to the call queue.
+        Call queues are also assigned an internal extension, which can be dialed
+        internally to reach the users assigned to the call queue.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param location_id: Returns the list of call queues in this location.
+        :type location_id: str
+        :param name: Returns only the call queues matching the given name.
+        :type name: str
+        :param phone_number: Returns only the call queues matching the given primary phone number or extension.
+        :type phone_number: str
+        :param department_id: Returns only call queues matching the given department ID.
+        :type department_id: str
+        :param department_name: Returns only call queues matching the given department name.
+        :type department_name: str
+        :param has_cx_essentials: Returns only the list of call queues with Customer Experience Essentials license when
+            `true`, otherwise returns the list of Customer Experience Basic call queues.
+        :type has_cx_essentials: bool
+        :param org_id: Returns the list of call queues in this organization.
+        :type org_id: str
+        :return: yields :class:`CallQueue` objects
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if location_id is not None:
+            params['locationId'] = location_id
+        if name is not None:
+            params['name'] = name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if department_id is not None:
+            params['departmentId'] = department_id
+        if department_name is not None:
+            params['departmentName'] = department_name
+        if has_cx_essentials is not None:
+            params['hasCxEssentials'] = str(has_cx_essentials).lower()
+        url = self._endpoint()
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=CallQueue, params=params)]
+
+    async def by_name(self, name: str, location_id: str = None, has_cx_essentials: bool = None,
+                org_id: str = None) -> Optional[CallQueue]:
+        """
+        Get queue info by name
+
+        :param location_id:
+        :param has_cx_essentials:
+        :param name:
+        :param org_id:
+        :return:
+        """
+        return next((cq for cq in await self.list(location_id=location_id, has_cx_essentials=has_cx_essentials,
+                                            org_id=org_id, name=name)
+                     if cq.name == name), None)
+
+    async def create(self, location_id: str, settings: CallQueue, has_cx_essentials: bool = None,
+               org_id: str = None) -> str:
+        """
+        Create a Call Queue
+
+        Create new Call Queues for the given location.
+
+        Call queues temporarily hold calls in the cloud, when all agents assigned to receive calls from the queue are
+        unavailable.
+        Queued calls are routed to an available agent, when not on an active call. Each call queue is assigned a lead
+        number, which is a telephone
+        number that external callers can dial to reach the users assigned to the call queue. Call queues are also
+        assigned an internal extension,
+        which can be dialed internally to reach the users assigned to the call queue.
+
+        Creating a call queue requires a full administrator or location administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param location_id: Create the call queue for this location.
+        :type location_id: str
+        :param settings: parameters for queue creation.
+        :type settings: :class:`CallQueue`
+        :param has_cx_essentials: Creates a Customer Experience Essentials call queue, when `true`. This requires
+            Customer Experience Essentials licensed agents. If this parameter is not set, the `has_cx_essentials`
+            attribute of the `settings` object is considered.
+        :type has_cx_essentials: bool
+        :param org_id: Create the call queue for this organization.
+        :type org_id: str
+        :return: queue id
+        :rtype: str
+
+        Example:
+
+            .. code-block:: python
+
+                settings = CallQueue(name=new_name,
+                                     extension=extension,
+                                     call_policies=CallQueueCallPolicies.default(),
+                                     queue_settings=QueueSettings.default(queue_size=10),
+                                     agents=[Agent(agent_id=user.person_id) for user in members])
+
+                # create new queue
+                queue_id = api.telephony.callqueue.create(location_id=target_location.location_id,
+                                                          settings=settings)
+
+        """
+        params = org_id and {'orgId': org_id} or {}
+        if has_cx_essentials is not None:
+            params['hasCxEssentials'] = str(has_cx_essentials).lower()
+        elif settings.has_cx_essentials:
+            params['hasCxEssentials'] = 'true'
+        cq_data = settings.create_or_update()
+        url = self._endpoint(location_id=location_id)
+        data = await self.post(url, json=cq_data, params=params)
+        return data['id']
+
+    async def delete_queue(self, location_id: str, queue_id: str, org_id: str = None):
+        """
+        Delete a Call Queue
+        Delete the designated Call Queue.
+
+        Call queues temporarily hold calls in the cloud when all agents, which can be users or agents, assigned to
+        receive calls from the queue are unavailable. Queued calls are routed to an available agent when not on an
+        active call. Each call queue is assigned a Lead Number, which is a telephone number outside callers can dial
+        to reach users assigned to the call queue. Call queues are also assigned an internal extension, which can be
+        dialed internally to reach users assigned to the call queue.
+
+        Deleting a call queue requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Location from which to delete a call queue.
+        :type location_id: str
+        :param queue_id: Delete the call queue with the matching ID.
+        :type queue_id: str
+        :param org_id: Delete the call queue from this organization.
+        :type org_id: str
+        """
+        url = self._endpoint(location_id=location_id, queue_id=queue_id)
+        params = org_id and {'orgId': org_id} or None
+        await self.delete(url=url, params=params)
+
+    async def details(self, location_id: str, queue_id: str, has_cx_essentials: bool = None,
+                org_id: str = None) -> CallQueue:
+        """
+        Get Details for a Call Queue
+
+        Retrieve Call Queue details.
+
+        Call queues temporarily hold calls in the cloud, when all agents assigned to receive calls from the queue are
+        unavailable.
+        Queued calls are routed to an available agent, when not on an active call. Each call queue is assigned a lead
+        number, which is a telephone
+        number that external callers can dial to reach the users assigned to the call queue. Call queues are also
+        assigned an internal extension,
+        which can be dialed internally to reach the users assigned to the call queue.
+
+        Retrieving call queue details requires a full or read-only administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Retrieves the details of a call queue in this location.
+        :type location_id: str
+        :param queue_id: Retrieves the details of call queue with this identifier.
+        :type queue_id: str
+        :param has_cx_essentials: Must be set to `true`, to view the details of a call queue with Customer Experience
+            Essentials license. This can otherwise be omited or set to `false`.
+        :type has_cx_essentials: bool
+        :param org_id: Retrieves the details of a call queue in this organization.
+        :type org_id: str
+        :return: call queue details
+        :rtype: :class:`CallQueue`
+        """
+        url = self._endpoint(location_id=location_id, queue_id=queue_id)
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        if has_cx_essentials is not None:
+            params['hasCxEssentials'] = str(has_cx_essentials).lower()
+        data = await self.get(url, params=params)
+        result = CallQueue.model_validate(data)
+        result.location_id = location_id
+        # noinspection PyTypeChecker
+        return result
+
+    async def update(self, location_id: str, queue_id: str, update: CallQueue, org_id: str = None):
+        """
+        Update a Call Queue
+
+        Update the designated Call Queue.
+
+        Call queues temporarily hold calls in the cloud when all agents, which can be users or agents, assigned to
+        receive calls from the queue are unavailable. Queued calls are routed to an available agent when not on an
+        active call. Each call queue is assigned a Lead Number, which is a telephone number outside callers can dial
+        to reach users assigned to the call queue. Call queues are also assigned an internal extension, which can be
+        dialed internally to reach users assigned to the call queue.
+
+        Updating a call queue requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Location in which this call queue exists.
+        :type location_id: str
+        :param queue_id: Update setting for the call queue with the matching ID.
+        :type queue_id: str
+        :param update: updates
+        :type update: :class:`CallQueue`
+        :param org_id: Update call queue settings from this organization.
+
+        Examples:
+
+        .. code-block::
+
+            api = AsWebexSimpleApi()
+
+            # shortcut
+            cq = api.telephony.callqueue
+
+            # disable a call queue
+            update = CallQueue(enabled=False)
+            cq.update(location_id=...,
+                      queue_id=...,
+                      update=update)
+
+            # set the call routing policy to SIMULTANEOUS
+            update = CallQueue(call_policies=CallPolicies(policy=Policy.simultaneous))
+            cq.update(location_id=...,
+                      queue_id=...,
+                      update=update)
+            # don't bounce calls after the set number of rings.
+            update = CallQueue(
+                call_policies=CallPolicies(
+                    call_bounce=CallBounce(
+                        enabled=False)))
+            cq.update(location_id=...,
+                      queue_id=...,
+                      update=update)
+
+        Alternatively you can also read call queue details, update them in place and then call update().
+
+        .. code-block::
+
+            details = cq.details(location_id=...,
+                                 queue_id=...)
+            details.call_policies.call_bounce.agent_unavailable_enabled=False
+            details.call_policies.call_bounce.on_hold_enabled=False
+            cq.update(location_id=...,
+                      queue_id=...,
+                      update=details)
+
+        """
+        params = org_id and {'orgId': org_id} or None
+        if location_id is None or queue_id is None:
+            raise ValueError('location_id and queue_id cannot be None')
+        cq_data = update.create_or_update()
+        url = self._endpoint(location_id=location_id, queue_id=queue_id)
+        await self.put(url=url, json=cq_data, params=params)
+
+    async def get_call_queue_settings(self, org_id: str = None) -> CallQueueSettings:
+        """
+        Get Call Queue Settings
+
+        Retrieve Call Queue Settings for a specific organization.
+
+        Call Queue Settings are used to enable the Simultaneous Ringing algorithm that maintains queue positions for
+        customers.
+
+        Retrieving Call Queue Settings requires a full, user, or read-only administrator auth token with a scope
+        of `spark-admin:telephony_config_read`.
+
+        :param org_id: Call Queue Settings for this organization.
+        :type org_id: str
+        :rtype: :class:`CallQueueSettings`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep('telephony/config/queues/settings')
+        data = await self.get(url, params=params)
+        r = CallQueueSettings.model_validate(data)
+        return r
+
+    async def update_call_queue_settings(self, settings: CallQueueSettings, org_id: str = None):
+        """
+        Update Call Queue Settings
+
+        Update Call Queue Settings for a specific organization.
+
+        Call Queue Settings are used to enable the Simultaneous Ringing algorithm that maintains queue positions for
+        customers.
+
+        Updating Call Queue Settings requires a full or user administrator auth token with a scope
+        `spark-admin:telephony_config_write`.
+
+        :param settings: Call Queue Settings for this organization.
+        :param org_id: update Call Queue Settings for this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = settings.model_dump(mode='json', by_alias=True, exclude_none=True)
+        url = self.ep('telephony/config/queues/settings')
+        await self.put(url, params=params, json=body)
+
+    def primary_available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                        org_id: str = None,
+                                        **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Call Queue Primary Available Phone Numbers
+
+        List the service and standard PSTN numbers that are available to be assigned as the call queue's primary phone
+        number.
+
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`CallQueuePrimaryAvailableNumberObject` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def primary_available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                        org_id: str = None,
+                                        **params) -> List[AvailableNumber]:
+        """
+        Get Call Queue Primary Available Phone Numbers
+
+        List the service and standard PSTN numbers that are available to be assigned as the call queue's primary phone
+        number.
+
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`CallQueuePrimaryAvailableNumberObject` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
+
+    def alternate_available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                          org_id: str = None,
+                                          **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Call Queue Alternate Available Phone Numbers
+
+        List the service and standard PSTN numbers that are available to be assigned as the call queue's alternate
+        phone number.
+
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='alternate/availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def alternate_available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                          org_id: str = None,
+                                          **params) -> List[AvailableNumber]:
+        """
+        Get Call Queue Alternate Available Phone Numbers
+
+        List the service and standard PSTN numbers that are available to be assigned as the call queue's alternate
+        phone number.
+
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='alternate/availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
+
+    def call_forward_available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                             owner_name: str = None, extension: str = None,
+                                             org_id: str = None,
+                                             **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Call Queue Call Forward Available Phone Numbers
+
+        List the service and standard PSTN numbers that are available to be assigned as the call queue's call forward
+        number.
+
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        assigned to an owning entity.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param owner_name: Return the list of phone numbers that are owned by the given `ownerName`. Maximum length is
+            255.
+        :type owner_name: str
+        :param extension: Returns the list of PSTN phone numbers with the given `extension`.
+        :type extension: str
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        if extension is not None:
+            params['extension'] = extension
+        url = self._endpoint(location_id=location_id, path='callForwarding/availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def call_forward_available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                             owner_name: str = None, extension: str = None,
+                                             org_id: str = None,
+                                             **params) -> List[AvailableNumber]:
+        """
+        Get Call Queue Call Forward Available Phone Numbers
+
+        List the service and standard PSTN numbers that are available to be assigned as the call queue's call forward
+        number.
+
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        assigned to an owning entity.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param owner_name: Return the list of phone numbers that are owned by the given `ownerName`. Maximum length is
+            255.
+        :type owner_name: str
+        :param extension: Returns the list of PSTN phone numbers with the given `extension`.
+        :type extension: str
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        if extension is not None:
+            params['extension'] = extension
+        url = self._endpoint(location_id=location_id, path='callForwarding/availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
+
+    def available_agents_gen(self, location_id: str, name: str = None, phone_number: str = None,
+                                        order: str = None, org_id: str = None,
+                                        **params) -> AsyncGenerator[AvailableAgent, None, None]:
+        """
+        Get Call Queue Available Agents
+
+        List all available users, workspaces, or virtual lines that can be assigned as call queue agents.
+
+        Available agents are users (excluding users with Webex Calling Standard license), workspaces, or virtual lines
+        that can be assigned to a call queue.
+        Calls from the call queue are routed to assigned agents based on configuration.
+        An agent can be assigned to one or more call queues and can be managed by supervisors.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: The location ID of the call queue. Temporary mandatory query parameter, used for
+            performance reasons only and not a filter.
+        :type location_id: str
+        :param name: Search based on name (user first and last name combination).
+        :type name: str
+        :param phone_number: Search based on number or extension.
+        :type phone_number: str
+        :param order: Order the available agents according to the designated fields. Up to three comma-separated sort
+            order fields may be specified. Available sort fields are: `userId`, `fname`, `firstname`, `lname`,
+            `lastname`, `dn`, and `extension`. Sort order can be added together with each field using a hyphen, `-`.
+            Available sort orders are: `asc`, and `desc`.
+        :type order: str
+        :param org_id: List available agents for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableAgentObject` instances
+        """
+        params['locationId'] = location_id
+        if org_id is not None:
+            params['orgId'] = org_id
+        if name is not None:
+            params['name'] = name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if order is not None:
+            params['order'] = order
+        url = self.ep('telephony/config/queues/agents/availableAgents')
+        return self.session.follow_pagination(url=url, model=AvailableAgent, item_key='agents', params=params)
+
+    async def available_agents(self, location_id: str, name: str = None, phone_number: str = None,
+                                        order: str = None, org_id: str = None,
+                                        **params) -> List[AvailableAgent]:
+        """
+        Get Call Queue Available Agents
+
+        List all available users, workspaces, or virtual lines that can be assigned as call queue agents.
+
+        Available agents are users (excluding users with Webex Calling Standard license), workspaces, or virtual lines
+        that can be assigned to a call queue.
+        Calls from the call queue are routed to assigned agents based on configuration.
+        An agent can be assigned to one or more call queues and can be managed by supervisors.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: The location ID of the call queue. Temporary mandatory query parameter, used for
+            performance reasons only and not a filter.
+        :type location_id: str
+        :param name: Search based on name (user first and last name combination).
+        :type name: str
+        :param phone_number: Search based on number or extension.
+        :type phone_number: str
+        :param order: Order the available agents according to the designated fields. Up to three comma-separated sort
+            order fields may be specified. Available sort fields are: `userId`, `fname`, `firstname`, `lname`,
+            `lastname`, `dn`, and `extension`. Sort order can be added together with each field using a hyphen, `-`.
+            Available sort orders are: `asc`, and `desc`.
+        :type order: str
+        :param org_id: List available agents for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableAgentObject` instances
+        """
+        params['locationId'] = location_id
+        if org_id is not None:
+            params['orgId'] = org_id
+        if name is not None:
+            params['name'] = name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if order is not None:
+            params['order'] = order
+        url = self.ep('telephony/config/queues/agents/availableAgents')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableAgent, item_key='agents', params=params)]
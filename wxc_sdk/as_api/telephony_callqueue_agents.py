@@ -0,0 +1,218 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.callqueue.agents import AgentCallQueueSetting, CallQueueAgent, CallQueueAgentDetail
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsCallQueueAgentsApi']
+
+
+class AsCallQueueAgentsApi(AsApiChild, base='telephony/config/queues/agents'):
+    """
+    Call Queue Agents API
+    """
+
+    def list_gen(self, location_id: str = None, queue_id: str = None, name: str = None,
+             phone_number: str = None, join_enabled: bool = None,
+             has_cx_essentials: bool = None, order: str = None, org_id: str = None,
+             **params) -> AsyncGenerator[CallQueueAgent, None, None]:
+        """
+        Read the List of Call Queue Agents
+
+        List all Call Queues Agents for the organization.
+
+        Agents can be users, workplace or virtual lines assigned to a call queue. Calls from the call queue are routed
+        to agents based on configuration.
+        An agent can be assigned to one or more call queues and can be managed by supervisors.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        **Note**: The decoded value of the agent's `id`, and the `type` returned in the response, are always returned
+        as `PEOPLE`, even when the agent is a workspace or virtual line. This will be addressed in a future release.
+
+        :param location_id: Return only the call queue agents in this location.
+        :type location_id: str
+        :param queue_id: Only return call queue agents with the matching queue ID.
+        :type queue_id: str
+        :param name: Returns only the list of call queue agents that match the given name.
+        :type name: str
+        :param phone_number: Returns only the list of call queue agents that match the given phone number or extension.
+        :type phone_number: str
+        :param join_enabled: Returns only the list of call queue agents that match the given `joinEnabled` value.
+        :type join_enabled: bool
+        :param has_cx_essentials: Returns only the list of call queues with Customer Experience Essentials license when
+            `true`, otherwise returns the list of Customer Experience Basic call queues.
+        :type has_cx_essentials: bool
+        :param order: Sort results alphabetically by call queue agent's name, in ascending or descending order.
+        :type order: str
+        :param org_id: List call queues agents in this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`ListCallQueueAgentObject` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if location_id is not None:
+            params['locationId'] = location_id
+        if queue_id is not None:
+            params['queueId'] = queue_id
+        if name is not None:
+            params['name'] = name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if join_enabled is not None:
+            params['joinEnabled'] = str(join_enabled).lower()
+        if has_cx_essentials is not None:
+            params['hasCxEssentials'] = str(has_cx_essentials).lower()
+        if order is not None:
+            params['order'] = order
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=CallQueueAgent, item_key='agents', params=params)
+
+    async def list(self, location_id: str = None, queue_id: str = None, name: str = None,
+             phone_number: str = None, join_enabled: bool = None,
+             has_cx_essentials: bool = None, order: str = None, org_id: str = None,
+             **params) -> List[CallQueueAgent]:
+        """
+        Read the List of Call Queue Agents
+
+        List all Call Queues Agents for the organization.
+
+        Agents can be users, workplace or virtual lines assigned to a call queue. Calls from the call queue are routed
+        to agents based on configuration.
+        An agent can be assigned to one or more call queues and can be managed by supervisors.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        **Note**: The decoded value of the agent's `id`, and the `type` returned in the response, are always returned
+        as `PEOPLE`, even when the agent is a workspace or virtual line. This will be addressed in a future release.
+
+        :param location_id: Return only the call queue agents in this location.
+        :type location_id: str
+        :param queue_id: Only return call queue agents with the matching queue ID.
+        :type queue_id: str
+        :param name: Returns only the list of call queue agents that match the given name.
+        :type name: str
+        :param phone_number: Returns only the list of call queue agents that match the given phone number or extension.
+        :type phone_number: str
+        :param join_enabled: Returns only the list of call queue agents that match the given `joinEnabled` value.
+        :type join_enabled: bool
+        :param has_cx_essentials: Returns only the list of call queues with Customer Experience Essentials license when
+            `true`, otherwise returns the list of Customer Experience Basic call queues.
+        :type has_cx_essentials: bool
+        :param order: Sort results alphabetically by call queue agent's name, in ascending or descending order.
+        :type order: str
+        :param org_id: List call queues agents in this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`ListCallQueueAgentObject` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if location_id is not None:
+            params['locationId'] = location_id
+        if queue_id is not None:
+            params['queueId'] = queue_id
+        if name is not None:
+            params['name'] = name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if join_enabled is not None:
+            params['joinEnabled'] = str(join_enabled).lower()
+        if has_cx_essentials is not None:
+            params['hasCxEssentials'] = str(has_cx_essentials).lower()
+        if order is not None:
+            params['order'] = order
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=CallQueueAgent, item_key='agents', params=params)]
+
+    async def details(self, id: str, has_cx_essentials: bool = None,
+                org_id: str = None) -> CallQueueAgentDetail:
+        """
+        Get Details for a Call Queue Agent
+
+        Retrieve details of a particular Call queue agent based on the agent ID.
+
+        Agents can be users, workplace or virtual lines assigned to a call queue. Calls from the call queue are routed
+        to agents based on configuration.
+        An agent can be assigned to one or more call queues and can be managed by supervisors.
+
+        Retrieving a call queue agent's details require a full or read-only administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        **Note**: The agent's `type` returned in the response and in the decoded value of the agent's `id`, is always
+        of type `PEOPLE`, even if the agent is a workspace or virtual line. This` will be corrected in a future
+        release.
+
+        :param id: Retrieve call queue agents with this identifier.
+        :type id: str
+        :param has_cx_essentials: Must be set to `true` to view the details of an agent with Customer Experience
+            Essentials license. This can otherwise be ommited or set to `false`.
+        :type has_cx_essentials: bool
+        :param org_id: Retrieve call queue agents from this organization.
+        :type org_id: str
+        :rtype: :class:`CallQueueAgent`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        if has_cx_essentials is not None:
+            params['hasCxEssentials'] = str(has_cx_essentials).lower()
+        url = self.ep(f'{id}')
+        data = await super().get(url, params=params)
+        r = CallQueueAgent.model_validate(data)
+        return r
+
+    async def update_call_queue_settings(self, id: str, settings: List[AgentCallQueueSetting],
+                                   has_cx_essentials: bool = None, org_id: str = None):
+        """
+        Update an Agent's Settings of One or More Call Queues
+
+        Modify an agent's call queue settings for an organization.
+
+        Calls from the call queue are routed to agents based on configuration.
+        An agent can be assigned to one or more call queues and can be managed by supervisors.
+
+        This operation requires a full administrator auth token with a scope of `spark-admin:telephony_config_write`.
+
+        :param id: Identifier of the agent to be updated.
+        :type id: str
+        :type settings: list[ModifyAgentsForCallQueueObjectSettings]
+        :param has_cx_essentials: Must be set to `true` to modify an agent that has Customer Experience Essentials
+            license. This can otherwise be ommited or set to `false`.
+        :type has_cx_essentials: bool
+        :param org_id: Update the settings of an agent in this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        if has_cx_essentials is not None:
+            params['hasCxEssentials'] = str(has_cx_essentials).lower()
+        body = dict()
+        body['settings'] = type_adapter(list[AgentCallQueueSetting]).dump_python(settings, mode='json',
+                                                                                 by_alias=True,
+                                                                                 exclude_none=True)
+        url = self.ep(f'{id}/settings')
+        await super().put(url, params=params, json=body)
@@ -0,0 +1,89 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.callqueue.announcement import Announcement
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsAnnouncementApi']
+
+
+class AsAnnouncementApi:
+    """
+    API for call queue Announcements
+    """
+
+    def __init__(self, *, session: AsRestSession):
+        self._session = session
+
+    def _endpoint(self, location_id: str, queue_id: str, path: str = None):
+        """
+
+        :meta private:
+        :param location_id:
+        :param queue_id:
+        :param path:
+        :return:
+        """
+        path = path and f'/{path}' or ''
+        ep = self._session.ep(path=f'telephony/config/locations/{location_id}/queues/{queue_id}/announcements{path}')
+        return ep
+
+    def list_gen(self, location_id: str, queue_id: str, org_id: str = None) -> AsyncGenerator[Announcement]:
+        """
+
+        :param location_id:
+        :param queue_id:
+        :param org_id:
+        :return:
+        """
+        url = self._endpoint(location_id=location_id, queue_id=queue_id)
+        params = org_id and {'orgId': org_id} or dict()
+        # noinspection PyTypeChecker
+        return self._session.follow_pagination(url=url, model=Announcement, params=params)
+
+    async def list(self, location_id: str, queue_id: str, org_id: str = None) -> List[Announcement]:
+        """
+
+        :param location_id:
+        :param queue_id:
+        :param org_id:
+        :return:
+        """
+        url = self._endpoint(location_id=location_id, queue_id=queue_id)
+        params = org_id and {'orgId': org_id} or dict()
+        # noinspection PyTypeChecker
+        return [o async for o in self._session.follow_pagination(url=url, model=Announcement, params=params)]
+
+    async def delete_announcement(self, location_id: str, queue_id: str, file_name: str, org_id: str = None):
+        """
+
+        :param location_id:
+        :type location_id: str
+        :param queue_id:
+        :type queue_id: str
+        :param file_name:
+        :type file_name: str
+        :param org_id:
+        """
+        url = self._endpoint(location_id=location_id, queue_id=queue_id, path=file_name)
+        params = org_id and {'orgId': org_id} or None
+        await self._session.delete(url=url, params=params)
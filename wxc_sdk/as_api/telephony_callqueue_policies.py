@@ -0,0 +1,222 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.callqueue.policies import ForcedForward, HolidayService, NightService, StrandedCalls
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsCQPolicyApi']
+
+
+@dataclass(init=False, repr=False)
+class AsCQPolicyApi:
+    _session: AsRestSession
+
+    def _ep(self, location_id: str, queue_id: str, path: str):
+        return self._session.ep(f'telephony/config/locations/{location_id}/queues/{queue_id}/{path}')
+
+    def __init__(self, session: AsRestSession):
+        self._session = session
+
+    async def holiday_service_details(self, location_id: str, queue_id: str, org_id: str = None) -> HolidayService:
+        """
+        Retrieve Call Queue Holiday Service details.
+
+        Configure the call queue to route calls differently during the holidays.
+
+        Retrieving call queue holiday service details requires a full or read-only administrator auth token with a
+        scope of spark-admin:telephony_config_read.
+
+        :param location_id: Retrieve settings for a call queue in this location.
+        :type location_id: str
+        :param queue_id: Retrieve settings for the call queue with this identifier.
+        :type queue_id: str
+        :param org_id: Retrieve call queue settings from this organization.
+        :type org_id: str
+        :return: Call Queue Holiday Service details
+        :rtype: HolidayService
+        """
+        url = self._ep(location_id, queue_id, 'holidayService')
+        params = org_id and {'orgId': org_id} or None
+        data = await self._session.rest_get(url=url, params=params)
+        return HolidayService.model_validate(data)
+
+    async def holiday_service_update(self, location_id: str, queue_id: str, update: HolidayService, org_id: str = None):
+        """
+        Update the designated Call Queue Holiday Service.
+
+        Configure the call queue to route calls differently during the holidays.
+
+        Updating a call queue holiday service requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Location in which this call queue exists.
+        :type location_id: str
+        :param queue_id: Update setting for the call queue with the matching ID.
+        :type queue_id: str
+        :param update: holiday service settings.
+        :type update: HolidayService
+        :param org_id: Update call queue settings from this organisation.
+        :type org_id: str
+        """
+        url = self._ep(location_id, queue_id, 'holidayService')
+        params = org_id and {'orgId': org_id} or None
+        body = update.model_dump_json(exclude={'holiday_schedules'})
+        await self._session.rest_put(url=url, params=params, data=body)
+
+    async def night_service_detail(self, location_id: str, queue_id: str, org_id: str = None) -> NightService:
+        """
+        Retrieve Call Queue Night service details.
+
+        Configure the call queue to route calls differently during the hours when the queue is not in service. This
+        is determined by a schedule that defines the business hours of the queue.
+
+        Retrieving call queue details requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param location_id: Retrieve settings for a call queue in this location.
+        :type location_id: str
+        :param queue_id: Retrieve settings for the call queue night service with this identifier.
+        :type queue_id: str
+        :param org_id: Retrieve call queue night service settings from this organisation
+        :type org_id: str
+        :return: Call Queue Night service details
+        :rtype: NightService
+        """
+        url = self._ep(location_id, queue_id, 'nightService')
+        params = org_id and {'orgId': org_id} or None
+        data = await self._session.rest_get(url=url, params=params)
+        return NightService.model_validate(data)
+
+    async def night_service_update(self, location_id: str, queue_id: str, update: NightService, org_id: str = None):
+        """
+        Update Call Queue Night Service details.
+
+        Configure the call queue to route calls differently during the hours when the queue is not in service. This
+        is determined by a schedule that defines the business hours of the queue.
+
+        Retrieving call queue night service details requires a full or read-only administrator auth token with a
+        scope of spark-admin:telephony_config_read.
+
+        :param location_id: update settings for a call queue in this location.
+        :type location_id: str
+        :param queue_id: update settings for the call queue night service with this identifier.
+        :type queue_id: str
+        :param update: new night service settings
+        :type update: NightService
+        :param org_id: update call queue night service settings from this organisation.
+        :type org_id: str
+        """
+        url = self._ep(location_id, queue_id, 'nightService')
+        params = org_id and {'orgId': org_id} or None
+        body = update.model_dump_json(exclude={'business_hours_schedules'})
+        await self._session.rest_put(url=url, params=params, data=body)
+
+    async def stranded_calls_details(self, location_id: str, queue_id: str, org_id: str = None) -> StrandedCalls:
+        """
+        Allow admin to view default/configured Stranded Calls settings.
+
+        Stranded-All agents logoff Policy: If the last agent staffing a queue “unjoins” the queue or signs out,
+        then all calls in the queue become stranded. Stranded-Unavailable Policy: This policy allows for the
+        configuration of the processing of calls that are in a staffed queue when all agents are unavailable.
+
+        Retrieving call queue Stranded Calls details requires a full or read-only administrator auth token with a
+        scope of spark-admin:telephony_config_read.
+
+        :param location_id: Retrieve settings for a call queue in this location.
+        :type location_id: str
+        :param queue_id: Retrieve settings for the call queue with this identifier.
+        :type queue_id: str
+        :param org_id: Retrieve call queue settings from this organization.
+        :type org_id: str
+        :return: Stranded Calls settings
+        :rtype: StrandedCalls
+        """
+        url = self._ep(location_id, queue_id, 'strandedCalls')
+        params = org_id and {'orgId': org_id} or None
+        data = await self._session.rest_get(url=url, params=params)
+        return StrandedCalls.model_validate(data)
+
+    async def stranded_calls_update(self, location_id: str, queue_id: str, update: StrandedCalls, org_id: str = None):
+        """
+        Update the designated Call Stranded Calls Service.
+
+        Allow admin to modify configured Stranded Calls settings.
+
+        Updating a call queue stranded calls requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Location in which this call queue exists.
+        :type location_id: str
+        :param queue_id: Update setting for the call queue with the matching ID.
+        :type queue_id: str
+        :param update: Call Stranded Calls settings
+        :type update: StrandedCalls
+        :param org_id: Update call queue settings from this organisation.
+        :type org_id: str
+        """
+        url = self._ep(location_id, queue_id, 'strandedCalls')
+        params = org_id and {'orgId': org_id} or None
+        await self._session.rest_put(url=url, params=params, data=update.model_dump_json())
+
+    async def forced_forward_details(self, location_id: str, queue_id: str, org_id: str = None) -> ForcedForward:
+        """
+        Retrieve Call Queue policy Forced Forward details.
+
+        This policy allows calls to be temporarily diverted to a configured destination.
+
+        Retrieving call queue Forced Forward details requires a full or read-only administrator auth token with a
+        scope of spark-admin:telephony_config_read.
+
+        :param location_id: Location in which this call queue exists.
+        :param queue_id: Retrieve setting for the call queue with the matching ID.
+        :param org_id: Retrieve call queue settings from this organisation.
+        :return: Call Queue policy Forced Forward details.
+        :rtype: ForcedForward
+        """
+        url = self._ep(location_id, queue_id, 'forcedForward')
+        params = org_id and {'orgId': org_id} or None
+        data = await self._session.rest_get(url=url, params=params)
+        return ForcedForward.model_validate(data)
+
+    async def forced_forward_update(self, location_id: str, queue_id: str, update: ForcedForward, org_id: str = None):
+        """
+        Update the designated Forced Forward Service.
+
+        If the option is enabled, then incoming calls to the queue are forwarded to the configured destination. Calls
+        that are already in the queue remain queued. The policy can be configured to play an announcement prior to
+        proceeding with the forward.
+
+        Updating a call queue Forced Forward service requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Location in which this call queue exists.
+        :type location_id: str
+        :param queue_id: Update setting for the call queue with the matching ID.
+        :type queue_id: str
+        :param update: new call queue Forced Forward settings
+        :type update: ForcedForward
+        :param org_id: Update call queue settings from this organisation.
+        :type org_id: str
+        """
+        url = self._ep(location_id, queue_id, 'forcedForward')
+        params = org_id and {'orgId': org_id} or None
+        await self._session.rest_put(url=url, params=params, data=update.model_dump_json())
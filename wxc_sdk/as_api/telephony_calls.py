@@ -0,0 +1,429 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.calls import CallHistoryRecord, CallInfo, DialResponse, HistoryType, ParkedAgainst, \
+    RejectAction, TelephonyCall
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsCallsApi']
+
+
+class AsCallsApi(AsApiChild, base='telephony/calls'):
+    """
+    Call Controls
+
+    Call Control APIs in support of Webex Calling. All `GET` commands require the `spark:calls_read` scope while all
+    other commands require the `spark:calls_write` scope.
+
+    **Notes:**
+
+    - These APIs support 3rd Party Call Control only.
+    - The Call Control APIs are only for use by Webex Calling Multi Tenant users and not applicable for users hosted on
+      UCM, including Dedicated Instance users.
+    """
+
+    async def dial(self, destination: str) -> DialResponse:
+        """
+        Initiate an outbound call to a specified destination. This is also commonly referred to as Click to Call or
+        Click to Dial. Alerts on all the devices belonging to the user. When the user answers on one of these alerting
+        devices, an outbound call is placed from that device to the destination.
+
+        :param destination: The destination to be dialed. The destination can be digits or a URI. Some examples for
+            destination include: 1234, 2223334444, +12223334444, *73, tel:+12223334444, user@company.domain,
+            sip:user@company.domain
+        :type destination: str
+        :return: Call id and call session id
+        """
+        ep = self.ep('dial')
+        data = await self.post(ep, json={'destination': destination})
+        return DialResponse.model_validate(data)
+
+    async def answer(self, call_id: str, endpoint_id: str = None):
+        """
+        Answer an incoming call. When no endpointId is specified, the call is answered on the user's primary device.
+        When an endpointId is specified, the call is answered on the device or application identified by the
+        endpointId. The answer  API is rejected if the device is not alerting for the call or the device does not
+        support answer via API.
+
+        :param call_id: The call identifier of the call to be answered.
+        :type call_id: str
+        :param endpoint_id: The ID of the device or application to answer the call on. The endpointId must be one of
+            the endpointIds returned by :meth:`wxc_sdk.person_settings.preferred_answer.AsPreferredAnswerApi.read`
+        :type endpoint_id: str
+        """
+        body = {to_camel(k): v for k, v in locals().items()
+                if v is not None and k != 'self'}
+        ep = self.ep('answer')
+        await self.post(ep, json=body)
+
+    async def reject(self, call_id: str, action: RejectAction = None):
+        """
+        Reject an unanswered incoming call.
+
+        :param call_id: The call identifier of the call to be rejected.
+        :type call_id: str
+        :param action: The rejection action to apply to the call. The busy action is applied if no specific action is
+            provided.
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('reject')
+        await self.post(ep, json=data)
+
+    async def hangup(self, call_id: str):
+        """
+        Hangup a call. If used on an unanswered incoming call, the call is rejected and sent to busy.
+
+        :param call_id: The call identifier of the call to hangup.
+        :type call_id: str
+        """
+        ep = self.ep('hangup')
+        await self.post(ep, json={'callId': call_id})
+
+    async def hold(self, call_id: str):
+        """
+        Hold a connected call.
+
+        :param call_id: The call identifier of the call to hold.
+        :type call_id: str
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('hold')
+        await self.post(ep, json=data)
+
+    async def resume(self, call_id: str):
+        """
+        Resume a held call.
+
+        :param call_id: The call identifier of the call to resume.
+        :type call_id: str
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('resume')
+        await self.post(ep, json=data)
+
+    async def divert(self, call_id: str, destination: str = None, to_voicemail: bool = None):
+        """
+        Divert a call to a destination or a user's voicemail. This is also commonly referred to as Blind Transfer
+
+        :param call_id: The call identifier of the call to divert.
+        :type call_id: str
+        :param destination: The destination to divert the call to. If toVoicemail is false, destination is required.
+            The destination can be digits or a URI. Some examples for destination include: 1234, 2223334444,
+            +12223334444, *73, tel:+12223334444, user@company.domain, sip:user@company.domain
+        :type destination: str
+        :param to_voicemail: If set to true, the call is diverted to voicemail. If no destination is specified, the
+            call is diverted to the user's own voicemail. If a destination is specified, the call is diverted to the
+            specified user's voicemail.
+        :type to_voicemail: bool
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('divert')
+        await self.post(ep, json=data)
+
+    async def transfer(self, call_id1: str = None, call_id2: str = None, destination: str = None):
+        """
+        Transfer two calls together. Unanswered incoming calls cannot be transferred but can be diverted using the
+        divert API. If the user has only two calls and wants to transfer them together, the callId1 and callId2
+        parameters are optional and when not provided the calls are automatically selected and transferred. If the
+        user has more than two calls and wants to transfer two of them together, the callId1 and callId2 parameters
+        are mandatory to specify which calls are being transferred. These are also commonly referred to as Attended
+        Transfer, Consultative Transfer, or Supervised Transfer and will return a 204 response. If the user wants to
+        transfer one call to a new destination but only when the destination responds, the callId1 and destination
+        parameters are mandatory to specify the call being transferred and the destination. This is referred to as a
+        Mute Transfer and is similar to the divert API with the difference of waiting for the destination to respond
+        prior to transferring the call. If the destination does not respond, the call is not transferred. This will
+        return a 201 response.
+
+        :param call_id1: The call identifier of the first call to transfer. This parameter is mandatory if either
+            call_id2 or destination is provided.
+        :type call_id1: str
+        :param call_id2: The call identifier of the first call to transfer. This parameter is mandatory if either
+            callId2 or destination is provided.
+        :type call_id1: str
+        :param destination: The destination to be transferred to. The destination can be digits or a URI. Some
+            examples for destination include: 1234, 2223334444,
+            +12223334444, *73, tel:+12223334444, user@company.domain, sip:user@company.domain.
+            This parameter is mandatory if call_id1 is provided and call_id2 is not provided.
+        :type destination: str
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('transfer')
+        await self.post(ep, json=data)
+
+    async def park(self, call_id: str, destination: str = None, is_group_park: bool = None) -> ParkedAgainst:
+        """
+        Park a connected call. The number field in the response can be used as the destination for the retrieve
+        command to retrieve the parked call.
+
+        :param call_id: The call identifier of the call to park.
+        :type call_id: str
+        :param destination: Identifies where the call is to be parked. If not provided, the call is parked against the
+            parking user.
+            The destination can be digits or a URI. Some examples for destination include: 1234, 2223334444,
+            +12223334444, *73, tel:+12223334444, user@company.domain, sip:user@company.domain
+        :type destination: str
+        :param is_group_park: If set to true, the call is parked against an automatically selected member of the
+            user's call park group and the destination parameter is ignored.
+        :type is_group_park: bool
+        :return: The details of where the call has been parked.
+        :rtype: :class:`ParkedAgainst`
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('park')
+        data = await self.post(ep, json=data)
+        return ParkedAgainst.model_validate(data)
+
+    async def retrieve(self, destination: str) -> CallInfo:
+        """
+        :param destination: Identifies where the call is parked. The number field from the park command response can
+            be used as the destination for the retrieve command. If not provided, the call parked against the
+            retrieving user is retrieved. The destination can be digits or a URI. Some examples for destination
+            include: 1234, 2223334444, +12223334444, *73, tel:+12223334444, user@company.domain,
+            sip:user@company.domain
+        :return: call id and call session id of retreived call
+        :rtype: :class:`CallInfo`
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('retrieve')
+        data = await self.post(ep, json=data)
+        return CallInfo.model_validate(data)
+
+    async def start_recording(self, call_id: str):
+        """
+        Start recording a call. Use of this API is only valid when the user's call recording mode is set to "On Demand".
+
+        :param call_id: The call identifier of the call to start recording.
+        :type call_id: str
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('startRecording')
+        await self.post(ep, json=data)
+
+    async def stop_recording(self, call_id: str):
+        """
+        Stop recording a call. Use of this API is only valid when a call is being recorded and the user's call
+        recording mode is set to "On Demand".
+
+        :param call_id: The call identifier of the call to stop recording.
+        :type call_id: str
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('stopRecording')
+        await self.post(ep, json=data)
+
+    async def pause_recording(self, call_id: str):
+        """
+        Pause recording on a call. Use of this API is only valid when a call is being recorded and the user's call
+        recording mode is set to "On Demand" or "Always with Pause/Resume".
+
+        :param call_id: The call identifier of the call to pause recording.
+        :type call_id: str
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('pauseRecording')
+        await self.post(ep, json=data)
+
+    async def resume_recording(self, call_id: str):
+        """
+        Resume recording a call. Use of this API is only valid when a call's recording is paused and the user's call
+        recording mode is set to "On Demand" or "Always with Pause/Resume".
+
+        :param call_id: The call identifier of the call to resume recording.
+        :type call_id: str
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('resumeRecording')
+        await self.post(ep, json=data)
+
+    async def transmit_dtmf(self, call_id: str, dtmf: str):
+        """
+        Transmit DTMF digits to a call.
+
+        :param call_id: The call identifier of the call to hold.
+        :type call_id: str
+        :param dtmf: The DTMF digits to transmit. Each digit must be part of the following set: [0, 1, 2, 3, 4, 5, 6,
+            7, 8, 9, *, #, A, B, C, D]. A comma "," may be included to indicate a pause between digits. For the value
+            “1,234”, the DTMF 1 digit is initially sent. After a pause, the DTMF 2, 3, and 4 digits are sent
+            successively.
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('transmitDtmf')
+        await self.post(ep, json=data)
+
+    async def push(self, call_id: str):
+        """
+        Pushes a call from the assistant to the executive the call is associated with. Use of this API is only valid
+        when the assistant’s call is associated with an executive.
+
+        :param call_id: The call identifier of the call to push.
+        :type call_id: str
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('push')
+        await self.post(ep, json=data)
+
+    async def pickup(self, target: str) -> CallInfo:
+        """
+        Picks up an incoming call to another user. A new call is initiated to perform the pickup in a similar manner
+        to the dial command. When target is not present, the API pickups up a call from the user’s call pickup group.
+        When target is present, the API pickups an incoming call from the specified target user.
+
+        :param target: Identifies the user to pickup an incoming call from. If not provided, an incoming call to the
+            user’s call pickup group is picked up. The target can be digits or a URI. Some examples for target
+            include: 1234, 2223334444, +12223334444, tel:+12223334444, user@company.domain, sip:user@company.domain
+        :type target: str
+        :return: call info of picked up call
+        :rtype: :class:`CallInfo`
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('pickup')
+        data = await self.post(ep, json=data)
+        return CallInfo.model_validate(data)
+
+    async def barge_in(self, target: str):
+        """
+        Barge-in on another user’s answered call. A new call is initiated to perform the barge-in in a similar manner
+        to the dial command.
+
+        :param target: Identifies the user to barge-in on. The target can be digits or a URI. Some examples for target
+            include: 1234, 2223334444, +12223334444, tel:+12223334444, user@company.domain, sip:user@company.domain
+        :type target: str
+        :return: call info of picked up call
+        :rtype: :class:`CallInfo`
+        """
+        data = {to_camel(p): v for i, (p, v) in enumerate(locals().items())
+                if i and v is not None}
+        ep = self.ep('bargeIn')
+        data = await self.post(ep, json=data)
+        return CallInfo.model_validate(data)
+
+    def list_calls_gen(self) -> AsyncGenerator[TelephonyCall, None, None]:
+        """
+        Get the list of details for all active calls associated with the user.
+
+        :return: yield :class:`TelephonyCall`
+        """
+        ep = self.ep()
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=ep, model=TelephonyCall)
+
+    async def list_calls(self) -> List[TelephonyCall]:
+        """
+        Get the list of details for all active calls associated with the user.
+
+        :return: yield :class:`TelephonyCall`
+        """
+        ep = self.ep()
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=ep, model=TelephonyCall)]
+
+    async def call_details(self, call_id: str) -> TelephonyCall:
+        """
+        Get the details of the specified active call for the user.
+
+        :param call_id: The call identifier of the call.
+        :type call_id: str
+        :return: call details
+        :rtype: :class:`TelephonyCall`
+        """
+        ep = self.ep(call_id)
+        data = await self.get(ep)
+        return TelephonyCall.model_validate(data)
+
+    def call_history_gen(self, history_type: Union[str, HistoryType] = None) -> AsyncGenerator[CallHistoryRecord, None, None]:
+        """
+        List Call History
+
+        Get the list of call history records for the user. A maximum of 20 call history records per type (placed,
+        missed, received) are returned.
+
+        :param history_type: The type of call history records to retrieve. If not specified, then all call history
+            records are retrieved. Possible values: placed, missed, received
+        :type history_type: HistoryType or str
+        :return: yields :class:`CallHistoryRecord` objects
+        """
+        params = history_type and {'type': enum_str(history_type)} or None
+        url = self.ep('history')
+        return self.session.follow_pagination(url=url, model=CallHistoryRecord, params=params)
+
+    async def call_history(self, history_type: Union[str, HistoryType] = None) -> List[CallHistoryRecord]:
+        """
+        List Call History
+
+        Get the list of call history records for the user. A maximum of 20 call history records per type (placed,
+        missed, received) are returned.
+
+        :param history_type: The type of call history records to retrieve. If not specified, then all call history
+            records are retrieved. Possible values: placed, missed, received
+        :type history_type: HistoryType or str
+        :return: yields :class:`CallHistoryRecord` objects
+        """
+        params = history_type and {'type': enum_str(history_type)} or None
+        url = self.ep('history')
+        return [o async for o in self.session.follow_pagination(url=url, model=CallHistoryRecord, params=params)]
+
+    async def mute(self, call_id: str):
+        """
+        Mute
+
+        Mute a call. This API can only be used for a call that reports itself as mute capable via the muteCapable field
+        in the call details.
+
+        :param call_id: The call identifier of the call to mute.
+        :type call_id: str
+        :rtype: None
+        """
+        body = dict()
+        body['callId'] = call_id
+        url = self.ep('mute')
+        await super().post(url, json=body)
+
+    async def unmute(self, call_id: str):
+        """
+        Unmute
+
+        Unmute a call. This API can only be used for a call that reports itself as mute capable via the muteCapable
+        field in the call details.
+
+        :param call_id: The call identifier of the call to unmute.
+        :type call_id: str
+        :rtype: None
+        """
+        body = dict()
+        body['callId'] = call_id
+        url = self.ep('unmute')
+        await super().post(url, json=body)
@@ -0,0 +1,189 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.conference import ConferenceDetails
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsConferenceControlsApi']
+
+
+class AsConferenceControlsApi(AsApiChild, base='telephony/conference'):
+    """
+    Conference Controls
+
+    Conference Control APIs in support of Webex Calling.
+
+    All `GET` commands require the `spark:calls_read` scope while all other commands require the `spark:calls_write`
+    scope.
+    """
+
+    async def start_conference(self, call_ids: list[str]):
+        """
+        Start Conference
+
+        Join the user's calls into a conference.  A minimum of two call IDs are required. Each call ID identifies an
+        existing call between the user
+        and a participant to be added to the conference.
+
+        :param call_ids: List of call identifiers of the participants to join into the conference. A minimum of two
+            call IDs are required.
+        :type call_ids: list[str]
+        :rtype: None
+        """
+        body = dict()
+        body['callIds'] = call_ids
+        url = self.ep()
+        await super().post(url, json=body)
+
+    async def release_conference(self):
+        """
+        Release Conference
+
+        Release the conference (the host and all participants). Note that for a 3WC (three-way call) the `Transfer API
+        <https://developer.webex.com/docs/api/v1/call-controls/transfer>`_
+        can be used to perform an attended transfer so that the participants remain connected.
+
+        :rtype: None
+        """
+        url = self.ep()
+        await super().delete(url)
+
+    async def get_conference_details(self) -> ConferenceDetails:
+        """
+        Get Conference Details
+
+        Get the details of the conference.  An empty JSON object body is returned if there is no conference.
+
+        :rtype: :class:`ConferenceDetails`
+        """
+        url = self.ep()
+        data = await super().get(url)
+        r = ConferenceDetails.model_validate(data)
+        return r
+
+    async def add_participant(self, call_id: str):
+        """
+        Add Participant
+
+        Adds a participant to an existing conference.  The request body contains the participant's call ID.
+
+        :param call_id: The call identifier of the participant to add.
+        :type call_id: str
+        :rtype: None
+        """
+        body = dict()
+        body['callId'] = call_id
+        url = self.ep('addParticipant')
+        await super().post(url, json=body)
+
+    async def mute(self, call_id: str = None):
+        """
+        Mute
+
+        Mutes the host or a participant. Mutes the host when no request body is provided (i.e. media stream from the
+        host will not be transmitted to the conference).  Mutes a participant when the request body contains the
+        participant's call ID (i.e. media stream from the participant will not be transmitted to the conference).
+
+        :param call_id: The call identifier of the participant to mute. The conference host is muted when this
+            attribute is not provided.
+        :type call_id: str
+        :rtype: None
+        """
+        body = dict()
+        if call_id is not None:
+            body['callId'] = call_id
+        url = self.ep('mute')
+        await super().post(url, json=body)
+
+    async def unmute(self, call_id: str = None):
+        """
+        Unmute
+
+        Unmutes the host or a participant. Unmutes the host when no request body is provided (i.e. media stream from
+        the host will be transmitted to the conference).  Unmutes a participant when the request body contains the
+        participant's call ID (i.e. media stream from the participant will be transmitted to the conference).
+
+        :param call_id: The call identifier of the participant to unmute. The conference host is unmuted when this
+            attribute is not provided.
+        :type call_id: str
+        :rtype: None
+        """
+        body = dict()
+        if call_id is not None:
+            body['callId'] = call_id
+        url = self.ep('unmute')
+        await super().post(url, json=body)
+
+    async def deafen_participant(self, call_id: str):
+        """
+        Deafen Participant
+
+        Deafens a participant (i.e. media stream will not be transmitted to the participant).
+        The request body contains the call ID of the participant to deafen
+
+        :param call_id: The call identifier of the participant to deafen.
+        :type call_id: str
+        :rtype: None
+        """
+        body = dict()
+        body['callId'] = call_id
+        url = self.ep('deafen')
+        await super().post(url, json=body)
+
+    async def undeafen_participant(self, call_id: str):
+        """
+        Undeafen Participant
+
+        Undeafens a participant (i.e. resume transmitting the conference media stream to the participant).
+        The request body contains the call ID of the participant to undeafen.
+
+        :param call_id: The call identifier of the participant to undeafen.
+        :type call_id: str
+        :rtype: None
+        """
+        body = dict()
+        body['callId'] = call_id
+        url = self.ep('undeafen')
+        await super().post(url, json=body)
+
+    async def hold(self):
+        """
+        Hold
+
+        Hold the conference host.  There is no request body.
+
+        :rtype: None
+        """
+        url = self.ep('hold')
+        await super().post(url)
+
+    async def resume(self):
+        """
+        Resume
+
+        Resumes the held conference host.  There is no request body.
+
+        :rtype: None
+        """
+        url = self.ep('resume')
+        await super().post(url)
@@ -0,0 +1,153 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.cx_essentials import AvailableAgent, ScreenPopConfiguration
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsCustomerExperienceEssentialsApi']
+
+
+class AsCustomerExperienceEssentialsApi(AsApiChild, base='telephony/config/locations'):
+    """
+    Customer Experience Essentials
+
+    Webex Customer Experience Essentials APIs provide the core capabilities of the Webex Contact Center solution. These
+    APIs allow you to
+    manage Customer Experience Essentials features such as supervisor configuration, agent configuration, and call
+    queue configuration, which are distinct from the Customer Experience Basic suite.
+
+    `Learn more about the customer Experience Essentials suite.
+    <https://help.webex.com/en-us/article/72sb3r/Webex-Customer-Experience-Essentials>`_
+
+    Viewing the read-only customer Experience Essentials APIs requires a full, device or read-only administrator auth
+    token with a scope of `spark-admin:telephony_config_read`.
+
+    Modifying the customer Experience Essentials APIs requires a full or device administrator auth token with a scope
+    of `spark-admin:telephony_config_write`.
+    """
+
+    async def get_screen_pop_configuration(self, location_id: str = None,
+                                     queue_id: str = None, org_id: str = None) -> ScreenPopConfiguration:
+        """
+        Get Screen Pop configuration for a Call Queue in a Location
+
+        Screen pop lets agents view customer-related info in a pop-up window. This API returns the screen pop
+        configuration for a call queue in a location.
+
+        :param location_id: The location ID where the call queue resides.
+        :type location_id: str
+        :param queue_id: The call queue ID for which screen pop configuration is modified.
+        :type queue_id: str
+        :param org_id: The organization ID of the customer or partner's organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{location_id}/queues/{queue_id}/cxEssentials/screenPop')
+        data = await super().get(url, params=params)
+        return ScreenPopConfiguration.model_validate(data)
+
+    async def modify_screen_pop_configuration(self, location_id: str,
+                                        queue_id: str, settings: ScreenPopConfiguration, org_id: str = None):
+        """
+        Modify Screen Pop configuration for a Call Queue in a Location
+
+        Screen pop lets agents view customer-related info in a pop-up window. This API allows you to modify the screen
+        pop configuration for a call queue in a location.
+
+        :param location_id: The location ID where the call queue resides.
+        :type location_id: str
+        :param queue_id: The call queue ID for which screen pop configuration is modified.
+        :type queue_id: str
+        :param settings: The screen pop configuration settings.
+        :type settings: ScreenPopConfiguration
+        :param org_id: The organization ID of the customer or partner's organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = settings.model_dump(mode='json', by_alias=True)
+        url = self.ep(f'{location_id}/queues/{queue_id}/cxEssentials/screenPop')
+        await super().put(url, params=params, json=body)
+
+    def available_agents_gen(self, location_id: str,
+                         has_cx_essentials: bool = None,
+                         org_id: str = None) -> AsyncGenerator[AvailableAgent, None, None]:
+        """
+        Get List of available agents for Customer Experience Essentials
+
+        Retrieve the list of available agents with Customer Experience Essentials license in a location.
+
+        This operation requires a full or read-only administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Retrieve the list of avaiilable agents in this location.
+        :type location_id: str
+        :param has_cx_essentials: Returns only the list of available agents with Customer Experience Essentials license
+            when `true`, otherwise returns the list of available agents with Customer Experience Basic license.
+        :type has_cx_essentials: bool
+        :param org_id: The organization ID of the customer or partner's organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableAgent` instances
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        if has_cx_essentials is not None:
+            params['hasCxEssentials'] = str(has_cx_essentials).lower()
+        url = self.ep(f'{location_id}/cxEssentials/agents/availableAgents')
+        return self.session.follow_pagination(url=url, model=AvailableAgent, item_key='agents',
+                                              params=params)
+
+    async def available_agents(self, location_id: str,
+                         has_cx_essentials: bool = None,
+                         org_id: str = None) -> List[AvailableAgent]:
+        """
+        Get List of available agents for Customer Experience Essentials
+
+        Retrieve the list of available agents with Customer Experience Essentials license in a location.
+
+        This operation requires a full or read-only administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Retrieve the list of avaiilable agents in this location.
+        :type location_id: str
+        :param has_cx_essentials: Returns only the list of available agents with Customer Experience Essentials license
+            when `true`, otherwise returns the list of available agents with Customer Experience Basic license.
+        :type has_cx_essentials: bool
+        :param org_id: The organization ID of the customer or partner's organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableAgent` instances
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        if has_cx_essentials is not None:
+            params['hasCxEssentials'] = str(has_cx_essentials).lower()
+        url = self.ep(f'{location_id}/cxEssentials/agents/availableAgents')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableAgent, item_key='agents',
+                                              params=params)]
@@ -0,0 +1,94 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.emergency_services import OrgEmergencyCallNotification
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsOrgEmergencyServicesApi']
+
+
+class AsOrgEmergencyServicesApi(AsApiChild, base='telephony/config/emergencyCallNotification'):
+    """
+    Organization Call Settings with Emergency Services
+
+    Emergency Call Notifications can be enabled at the organization level, allowing specified email addresses to
+    receive email notifications when an emergency call is made. To comply with U.S. Public Law 115-127, also known as
+    Kari’s Law, any call that's made from within your organization to emergency services must generate an email
+    notification.
+
+    Viewing these organization settings requires a full or read-only administrator auth token with a scope of
+    `spark-admin:telephony_config_read`. Modifying these organization settings requires a full administrator auth
+    token with a scope of `spark-admin:telephony_config_write`.
+    """
+
+    async def read_emergency_call_notification(self, org_id: str = None) -> OrgEmergencyCallNotification:
+        """
+        Get an Organization Emergency Call Notification
+
+        Get organization emergency call notification.
+
+        Emergency Call Notifications can be enabled at the organization level, allowing specified email addresses to
+        receive email notifications when an emergency call is made. To comply with U.S. Public Law 115-127, also known
+        as Kari’s Law, any call that's made from within your organization to emergency services must generate an email
+        notification.
+
+        To retrieve organization call notifications requires a full, user or read-only administrator auth token with a
+        scope of `spark-admin:telephony_config_read`.
+
+        :param org_id: Retrieve Emergency Call Notification attributes for the organization.
+        :type org_id: str
+        :rtype: :class:`OrgEmergencyCallNotification`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep()
+        data = await super().get(url, params=params)
+        r = OrgEmergencyCallNotification.model_validate(data)
+        return r
+
+    async def update_emergency_call_notification(self, setting: OrgEmergencyCallNotification, org_id: str = None):
+        """
+        Update an organization emergency call notification.
+
+        Once settings are enabled at the organization level, the configured email address will receive emergency call
+        notifications for all locations.
+
+        Emergency Call Notifications can be enabled at the organization level, allowing specified email addresses to
+        receive email notifications when an emergency call is made. To comply with U.S. Public Law 115-127, also known
+        as Kari’s Law, any call that's made from within your organization to emergency services must generate an email
+        notification.
+
+        To update organization call notification requires a full or user administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param setting: updated settings
+        :type setting: OrgEmergencyCallNotification
+        :param org_id: Update Emergency Call Notification attributes for the organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = org_id and {'orgId': org_id} or None
+        body = setting.update()
+        url = self.ep()
+        await super().put(url, params=params, json=body)
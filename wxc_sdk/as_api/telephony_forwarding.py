@@ -0,0 +1,240 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.forwarding import CallForwarding, ForwardingRuleDetails
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsFeatureSelector', 'AsForwardingApi']
+
+
+class AsFeatureSelector(str, Enum):
+    queues = 'queues'
+    huntgroups = 'huntGroups'
+    auto_attendants = 'autoAttendants'
+
+
+
+@dataclass(init=False, repr=False)
+class AsForwardingApi(AsApiChild, base=''):
+    """
+    API for forwarding settings on call queues, hunt groups, and auto attendants
+    """
+    _session: AsRestSession
+    _feature: AsFeatureSelector
+
+    def __init__(self, session: AsRestSession, feature_selector: AsFeatureSelector):
+        self._session = session
+        self._feature = feature_selector
+        super().__init__(session=session)
+
+    def _endpoint(self, location_id: str, feature_id: str, path: str = None):
+        """
+
+        :meta private:
+        :param location_id:
+        :param feature_id:
+        :param path:
+        """
+        path = path and f'/{path}' or ''
+        ep = self._session.ep(path=f'telephony/config/locations/{location_id}/{self._feature.value}/'
+                                   f'{feature_id}/callForwarding{path}')
+        return ep
+
+    async def settings(self, location_id: str, feature_id: str, org_id: str = None) -> CallForwarding:
+        """
+        Retrieve Call Forwarding settings for the designated feature including the list of call
+        forwarding rules.
+
+        The call forwarding feature allows you to direct all incoming calls based on specific criteria that you define.
+        Below are the available options for configuring your call forwarding:
+        1. Always forward calls to a designated number.
+        2. Forward calls to a designated number based on certain criteria.
+        3. Forward calls using different modes.
+
+        Retrieving call forwarding settings for an auto attendant requires a full or read-only administrator or
+        location administrator auth token with a scope of `spark-admin:telephony_config_read`.
+
+        :param location_id: Location in which this feature exists.
+        :type location_id: str
+        :param feature_id: Retrieve the call forwarding settings for this entity
+        :type feature_id: str
+        :param org_id: Retrieve call forwarding settings from this organization.
+        :type org_id: str
+        :return: call forwarding settings
+        :rtype: class:`CallForwarding`
+        """
+        params = org_id and {'orgId': org_id} or {}
+        url = self._endpoint(location_id=location_id, feature_id=feature_id)
+        data = await self._session.rest_get(url=url, params=params)
+        result = CallForwarding.model_validate(data['callForwarding'])
+        return result
+
+    async def update(self, location_id: str, feature_id: str,
+               forwarding: CallForwarding, org_id: str = None):
+        """
+        Update Call Forwarding Settings for a feature
+
+        Update Call Forwarding settings for the designated feature.
+
+        Updating call forwarding settings for a feature requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Location in which this feature exists.
+        :type location_id: str
+        :param feature_id: Update call forwarding settings for this feature.
+        :type feature_id: str
+        :param forwarding: Forwarding settings
+        :type forwarding: :class:`CallForwarding`
+        :param org_id: Update feature forwarding settings from this organization.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or {}
+        url = self._endpoint(location_id=location_id, feature_id=feature_id)
+
+        body = {'callForwarding': forwarding.update()}
+        await self._session.rest_put(url=url, json=body, params=params)
+
+    async def create_call_forwarding_rule(self, location_id: str, feature_id: str,
+                                    forwarding_rule: ForwardingRuleDetails, org_id: str = None) -> str:
+        """
+        Create a Selective Call Forwarding Rule feature
+
+        A selective call forwarding rule for feature to be forwarded or not
+        forwarded to the designated number, based on the defined criteria.
+
+        Note that the list of existing call forward rules is available feature's call
+        forwarding settings.
+        :param location_id: Location in which the call queue exists.
+        :type location_id: str
+        :param feature_id: Create the rule for this feature
+        :type feature_id: str
+        :param forwarding_rule: details of rule to be created
+        :type forwarding_rule: :class:`ForwardingRuleDetails`
+        :param org_id: Create the feature forwarding rule for this organization.
+        :type org_id: str
+        :return: forwarding rule id
+        :rtype; str
+        """
+        url = self._endpoint(location_id=location_id, feature_id=feature_id, path='selectiveRules')
+        params = org_id and {'orgId': org_id} or None
+        body = forwarding_rule.model_dump_json()
+        data = await self._session.rest_post(url=url, data=body, params=params)
+        return data['id']
+
+    async def call_forwarding_rule(self, location_id: str, feature_id: str, rule_id: str,
+                             org_id: str = None) -> ForwardingRuleDetails:
+        """
+        Retrieve a Selective Call Forwarding Rule's settings for the designated Call Queue.
+
+        A selective call forwarding rule for feature allows calls to be forwarded or not forwarded
+        to the designated number, based on the defined criteria.
+
+        Note that the list of existing call forward rules is available in the feature's call
+        forwarding settings.
+        :param location_id: Location in which the feature exists.
+        :type location_id: stre
+        :param feature_id: Retrieve setting for a rule for this feature.
+        :type feature_id: str
+        :param rule_id: feature rule you are retrieving settings for.
+        :type rule_id: str
+        :param org_id: Retrieve feature forwarding settings from this organization.
+        :type org_id: str
+        :return: call forwarding rule details
+        :rtype: :class:`ForwardingRuleDetails`
+        """
+        url = self._endpoint(location_id=location_id, feature_id=feature_id, path=f'selectiveRules/{rule_id}')
+        params = org_id and {'orgId': org_id} or None
+        data = await self._session.rest_get(url=url, params=params)
+        result = ForwardingRuleDetails.model_validate(data)
+        return result
+
+    async def update_call_forwarding_rule(self, location_id: str, feature_id: str, rule_id: str,
+                                    forwarding_rule: ForwardingRuleDetails, org_id: str = None) -> str:
+        """
+        Update a Selective Call Forwarding Rule's settings for the designated feature.
+
+        A selective call forwarding rule for feature allows calls to be forwarded or not forwarded
+        to the designated number, based on the defined criteria.
+
+        Note that the list of existing call forward rules is available in the feature's call
+        forwarding settings.
+
+        NOTE: The Call Forwarding Rule ID will change upon modification of the Call Forwarding Rule name.
+
+        :param location_id: Location in which the feature exists.
+        :type location_id: str
+        :param feature_id: Update settings for a rule for this feature.
+        :type feature_id: str
+        :param rule_id: feature you are updating settings for.
+        :type rule_id: str
+        :param forwarding_rule: forwarding rule details for update
+        :type forwarding_rule: :class:`ForwardingRuleDetails`
+        :param org_id: Update feature rule settings for this organization.
+        :type org_id: str
+        :return: new call forwarding rule id
+        :rtype: str
+        """
+        url = self._endpoint(location_id=location_id, feature_id=feature_id, path=f'selectiveRules/{rule_id}')
+        params = org_id and {'orgId': org_id} or None
+        body = forwarding_rule.model_dump_json(exclude={'id'})
+        data = await self._session.rest_put(url=url, params=params, data=body)
+        return data['id']
+
+    async def delete_call_forwarding_rule(self, location_id: str, feature_id: str, rule_id: str, org_id: str = None):
+        """
+        Delete a Selective Call Forwarding Rule for the designated feature.
+
+        A selective call forwarding rule for a feature allows calls to be forwarded or not forwarded
+        to the designated number, based on the defined criteria.
+
+        Note that the list of existing call forward rules is available in the feature's call
+        forwarding
+        settings.
+        """
+        url = self._endpoint(location_id=location_id, feature_id=feature_id, path=f'selectiveRules/{rule_id}')
+        params = org_id and {'orgId': org_id} or None
+        await self._session.rest_delete(url=url, params=params)
+
+    async def switch_mode_for_call_forwarding(self, location_id: str, feature_id: str,
+                                        org_id: str = None):
+        """
+        Switch Mode for Call Forwarding Settings for an entity
+
+        Switches the current operating mode to the mode as per normal operations.
+
+        Switching operating mode a full, or location administrator auth token with a scope
+        of `spark-admin:telephony_config_write`.
+
+        :param location_id: `Location` in which this `call queue` exists.
+        :type location_id: str
+        :param feature_id: Switch operating mode to normal operations for this entity.
+        :type feature_id: str
+        :param org_id: Switch operating mode as per normal operations for this entity from this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self._endpoint(location_id=location_id, feature_id=feature_id, path='actions/switchMode/invoke')
+        await self._session.rest_post(url, params=params)
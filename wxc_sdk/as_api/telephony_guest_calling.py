@@ -0,0 +1,247 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.guest_calling import DestinationMember, GuestCallingSettings
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsGuestCallingApi']
+
+
+class AsGuestCallingApi(AsApiChild, base='telephony/config/guestCalling'):
+    """
+    Guest Calling Settings with Click-to-call
+
+    Calling Service Settings supports reading and writing of Webex Calling service settings for a specific
+    organization.
+
+    Viewing these read-only organization settings requires a full or read-only administrator auth token with a scope of
+    `spark-admin:telephony_config_read`.
+
+    Modifying these organization settings requires a full administrator auth token with a scope of
+    `spark-admin:telephony_config_write`.
+
+    A partner administrator can retrieve or change settings in a customer's organization using the optional `orgId`
+    query parameter.
+    """
+
+    async def read(self, org_id: str = None) -> GuestCallingSettings:
+        """
+        Read the Click-to-call Settings
+
+        Retrieve the organization's click-to-call calling settings.
+
+        Click-to-call settings determine whether click-to-call is enabled and whether privacy mode is enabled.
+
+        Retrieving click-to-call settings requires a full or read-only administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param org_id: ID of the organization. Only admin users of another organization (such as partners) may use this
+            parameter as the default is the same organization as the token used to access the API.
+        :type org_id: str
+        :rtype: :class:`GuestCallingSettings`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep()
+        data = await super().get(url, params=params)
+        r = GuestCallingSettings.model_validate(data)
+        return r
+
+    async def update(self, enabled: bool, privacy_enabled: bool, destination_members: list[str],
+               org_id: str = None):
+        """
+        Update the Click-to-call Settings
+
+        Update the organization's click-to-call settings.
+
+        Click-to-call settings determine whether click-to-call is enabled and whether privacy mode is enabled.
+
+        Updating an organization's click-to-call settings requires a full administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param enabled: Set to `true` to allow click-to-call calling.
+        :type enabled: bool
+        :param privacy_enabled: Set to `true` to enable privacy mode.
+        :type privacy_enabled: bool
+        :param destination_members: List of destination member IDs. Supported destination types are Auto Attendant,
+            Call Queue, Hunt Group, and Virtual Line.
+        :type destination_members: list[str]
+        :param org_id: ID of the organization. Only admin users of another organization (such as partners) may use this
+            parameter as the default is the same organization as the token used to access the API.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['enabled'] = enabled
+        body['privacyEnabled'] = privacy_enabled
+        body['destinationMembers'] = destination_members
+        url = self.ep()
+        await super().put(url, params=params, json=body)
+
+    def members_gen(self, member_name: str = None, phone_number: str = None, extension: str = None,
+                org_id: str = None, **params) -> AsyncGenerator[DestinationMember, None, None]:
+        """
+        Read the Click-to-call Members
+
+        Retrieve the organization's click-to-call members.
+
+        Click-to-call members are the destination members that click-to-call callers can call.
+
+        Retrieving click-to-call members requires a full or read-only administrator or location administrator auth
+        token with a scope of `spark-admin:telephony_config_read`.
+
+        :param member_name: Search (Contains) numbers based on member name.
+        :type member_name: str
+        :param phone_number: Search (Contains) based on number.
+        :type phone_number: str
+        :param extension: Search (Contains) based on extension.
+        :type extension: str
+        :param org_id: ID of the organization. Only admin users of another organization (such as partners) may use this
+            parameter as the default is the same organization as the token used to access the API.
+        :type org_id: str
+        :return: Generator yielding :class:`DestinationMember` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if member_name is not None:
+            params['memberName'] = member_name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if extension is not None:
+            params['extension'] = extension
+        url = self.ep('members')
+        return self.session.follow_pagination(url=url, model=DestinationMember, item_key='destinationMembers',
+                                              params=params)
+
+    async def members(self, member_name: str = None, phone_number: str = None, extension: str = None,
+                org_id: str = None, **params) -> List[DestinationMember]:
+        """
+        Read the Click-to-call Members
+
+        Retrieve the organization's click-to-call members.
+
+        Click-to-call members are the destination members that click-to-call callers can call.
+
+        Retrieving click-to-call members requires a full or read-only administrator or location administrator auth
+        token with a scope of `spark-admin:telephony_config_read`.
+
+        :param member_name: Search (Contains) numbers based on member name.
+        :type member_name: str
+        :param phone_number: Search (Contains) based on number.
+        :type phone_number: str
+        :param extension: Search (Contains) based on extension.
+        :type extension: str
+        :param org_id: ID of the organization. Only admin users of another organization (such as partners) may use this
+            parameter as the default is the same organization as the token used to access the API.
+        :type org_id: str
+        :return: Generator yielding :class:`DestinationMember` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if member_name is not None:
+            params['memberName'] = member_name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if extension is not None:
+            params['extension'] = extension
+        url = self.ep('members')
+        return [o async for o in self.session.follow_pagination(url=url, model=DestinationMember, item_key='destinationMembers',
+                                              params=params)]
+
+    def available_members_gen(self, member_name: str = None, phone_number: str = None,
+                          extension: str = None, org_id: str = None,
+                          **params) -> AsyncGenerator[DestinationMember, None, None]:
+        """
+        Read the Click-to-call Available Members
+
+        Retrieve the organization's click-to-call available members.
+
+        Click-to-call available members are the members that can be added as destination members for click-to-call
+        callers.
+
+        Retrieving click-to-call available members requires a full or read-only administrator or location administrator
+        auth token with a scope of `spark-admin:telephony_config_read`.
+
+        :param member_name: Search (Contains) numbers based on member name.
+        :type member_name: str
+        :param phone_number: Search (Contains) based on number.
+        :type phone_number: str
+        :param extension: Search (Contains) based on extension.
+        :type extension: str
+        :param org_id: ID of the organization. Only admin users of another organization (such as partners) may use this
+            parameter as the default is the same organization as the token used to access the API.
+        :type org_id: str
+        :return: Generator yielding :class:`DestinationMember` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if member_name is not None:
+            params['memberName'] = member_name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if extension is not None:
+            params['extension'] = extension
+        url = self.ep('availableMembers')
+        return self.session.follow_pagination(url=url, model=DestinationMember, item_key='availableDestinationMembers',
+                                              params=params)
+
+    async def available_members(self, member_name: str = None, phone_number: str = None,
+                          extension: str = None, org_id: str = None,
+                          **params) -> List[DestinationMember]:
+        """
+        Read the Click-to-call Available Members
+
+        Retrieve the organization's click-to-call available members.
+
+        Click-to-call available members are the members that can be added as destination members for click-to-call
+        callers.
+
+        Retrieving click-to-call available members requires a full or read-only administrator or location administrator
+        auth token with a scope of `spark-admin:telephony_config_read`.
+
+        :param member_name: Search (Contains) numbers based on member name.
+        :type member_name: str
+        :param phone_number: Search (Contains) based on number.
+        :type phone_number: str
+        :param extension: Search (Contains) based on extension.
+        :type extension: str
+        :param org_id: ID of the organization. Only admin users of another organization (such as partners) may use this
+            parameter as the default is the same organization as the token used to access the API.
+        :type org_id: str
+        :return: Generator yielding :class:`DestinationMember` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if member_name is not None:
+            params['memberName'] = member_name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if extension is not None:
+            params['extension'] = extension
+        url = self.ep('availableMembers')
+        return [o async for o in self.session.follow_pagination(url=url, model=DestinationMember, item_key='availableDestinationMembers',
+                                              params=params)]
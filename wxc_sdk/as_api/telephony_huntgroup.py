@@ -0,0 +1,446 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.huntgroup import AvailableNumber, HGCallPolicies, HuntGroup
+from wxc_sdk.as_api.api_child import AsApiChild
+from wxc_sdk.as_api.telephony_forwarding import AsFeatureSelector, AsForwardingApi
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsHuntGroupApi']
+
+
+@dataclass(init=False, repr=False)
+class AsHuntGroupApi(AsApiChild, base='telephony/config/huntGroups'):
+    """
+    Hunt Group API
+    """
+    forwarding: AsForwardingApi
+
+    def __init__(self, session: AsRestSession):
+        super().__init__(session=session)
+        self.forwarding = AsForwardingApi(session=session, feature_selector=AsFeatureSelector.huntgroups)
+
+    def _endpoint(self, *, location_id: str = None, huntgroup_id: str = None, path: str = None) -> str:
+        """
+        hunt group specific feature endpoint like /v1/telephony/config/locations/{locationId}/huntGroups/{huntGroupId}
+
+        :meta private:
+        :param location_id: Unique identifier for the location.
+        :type location_id: str
+        :param huntgroup_id: schedule id
+        :type huntgroup_id: str
+        :return: full endpoint
+        :rtype: str
+        """
+        if location_id is None:
+            return self.session.ep('telephony/config/huntGroups')
+        else:
+            ep = self.session.ep(f'telephony/config/locations/{location_id}/huntGroups')
+            if huntgroup_id:
+                ep = f'{ep}/{huntgroup_id}'
+            if path:
+                ep = f'{ep}/{path}'
+            return ep
+
+    def list_gen(self, org_id: str = None, location_id: str = None, name: str = None,
+             phone_number: str = None, **params) -> AsyncGenerator[HuntGroup, None, None]:
+        """
+        Read the List of Hunt Groups
+
+        List all calling Hunt Groups for the organization.
+
+        Hunt groups can route incoming calls to a group of people or workspaces. You can even configure a pattern to
+        route to a whole group.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope of
+        spark-admin:telephony_config_read.
+
+        :param org_id: List hunt groups for this organization.
+        :param location_id: Only return hunt groups with matching location ID.
+        :param name: Only return hunt groups with the matching name.
+        :param phone_number: Only return hunt groups with the matching primary phone number or extension.
+        :return: yields :class:`HuntGroup` instances
+        """
+        params.update((to_camel(k), v)
+                      for i, (k, v) in enumerate(locals().items())
+                      if i and v is not None and k != 'params')
+        url = self._endpoint()
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=HuntGroup, params=params)
+
+    async def list(self, org_id: str = None, location_id: str = None, name: str = None,
+             phone_number: str = None, **params) -> List[HuntGroup]:
+        """
+        Read the List of Hunt Groups
+
+        List all calling Hunt Groups for the organization.
+
+        Hunt groups can route incoming calls to a group of people or workspaces. You can even configure a pattern to
+        route to a whole group.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope of
+        spark-admin:telephony_config_read.
+
+        :param org_id: List hunt groups for this organization.
+        :param location_id: Only return hunt groups with matching location ID.
+        :param name: Only return hunt groups with the matching name.
+        :param phone_number: Only return hunt groups with the matching primary phone number or extension.
+        :return: yields :class:`HuntGroup` instances
+        """
+        params.update((to_camel(k), v)
+                      for i, (k, v) in enumerate(locals().items())
+                      if i and v is not None and k != 'params')
+        url = self._endpoint()
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=HuntGroup, params=params)]
+
+    async def by_name(self, name: str, location_id: str = None, org_id: str = None) -> Optional[HuntGroup]:
+        """
+        Get hunt group info by name
+        :param location_id:
+        :param name:
+        :param org_id:
+        :return:
+        """
+        return next((hg for hg in await self.list(name=name, location_id=location_id, org_id=org_id)
+                     if hg.name == name), None)
+
+    async def create(self, location_id: str, settings: HuntGroup, org_id: str = None) -> str:
+        """
+        Create a Hunt Group
+
+        Create new Hunt Groups for the given location.
+
+        Hunt groups can route incoming calls to a group of people or workspaces. You can even configure a pattern to
+        route to a whole group.
+
+        Creating a hunt group requires a full administrator auth token with a scope of
+        spark-admin:telephony_config_write.
+
+        :param location_id: Create the hunt group for the given location.
+        :type location_id: str
+        :param settings: hunt group details
+        :type settings: :class:`HuntGroup`
+        :param org_id: Create the hunt group for this organization.
+        :type org_id: str
+        :return: ID of the newly created hunt group.
+        :rtype: str
+        """
+        params = org_id and {'orgId': org_id} or {}
+        settings.call_policies = settings.call_policies or HGCallPolicies().default()
+        data = settings.create_or_update()
+        url = self._endpoint(location_id=location_id)
+        data = await self.post(url, json=data, params=params)
+        return data['id']
+
+    async def delete_huntgroup(self, location_id: str, huntgroup_id: str, org_id: str = None):
+        """
+        Delete a Hunt Group
+
+        Delete the designated Hunt Group.
+
+        Hunt groups can route incoming calls to a group of people or workspaces. You can even configure a pattern to
+        route to a whole group.
+
+        Deleting a hunt group requires a full administrator auth token with a scope of
+        spark-admin:telephony_config_write.
+
+        :param location_id: Location from which to delete a hunt group.
+        :type location_id: str
+        :param huntgroup_id: Delete the hunt group with the matching ID.
+        :type huntgroup_id: str
+        :param org_id: Delete the hunt group with the matching ID.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(location_id=location_id, huntgroup_id=huntgroup_id)
+        await self.delete(url, params=params)
+
+    async def details(self, location_id: str, huntgroup_id: str, org_id: str = None) -> HuntGroup:
+        """
+        Get Details for a Hunt Group
+
+        Retrieve Hunt Group details.
+
+        Hunt groups can route incoming calls to a group of people or workspaces. You can even configure a pattern to
+        route to a whole group.
+
+        Retrieving hunt group details requires a full or read-only administrator auth token with a scope of
+        spark-admin:telephony_config_read.
+
+        :param location_id: Retrieve settings for a hunt group in this location.
+        :type location_id: str
+        :param huntgroup_id: Retrieve settings for the hunt group with this identifier.
+        :type huntgroup_id: str
+        :param org_id: Retrieve hunt group settings from this organization.
+        :type org_id: str
+        :return: hunt group details
+        """
+        url = self._endpoint(location_id=location_id, huntgroup_id=huntgroup_id)
+        params = org_id and {'orgId': org_id} or {}
+        data = await self.get(url, params=params)
+        result = HuntGroup.model_validate(data)
+        return result
+
+    async def update(self, location_id: str, huntgroup_id: str, update: HuntGroup,
+               org_id: str = None):
+        """
+        Update a Hunt Group
+
+        Update the designated Hunt Group.
+
+        Hunt groups can route incoming calls to a group of people or workspaces. You can even configure a pattern to
+        route to a whole group.
+
+        Updating a hunt group requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Update the hunt group for this location.
+        :type location_id: str
+        :param huntgroup_id: Update setting for the hunt group with the matching ID.
+        :type huntgroup_id: str
+        :param update: hunt group settings
+        :type update: :class:`HuntGroup`
+        :param org_id: Update hunt group settings from this organization.
+        """
+        params = org_id and {'orgId': org_id} or None
+        data = update.create_or_update()
+        url = self._endpoint(location_id=location_id, huntgroup_id=huntgroup_id)
+        await self.put(url, json=data, params=params)
+
+    def primary_available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                        org_id: str = None,
+                                        **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Hunt Group Primary Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the hunt group's primary phone number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def primary_available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                        org_id: str = None,
+                                        **params) -> List[AvailableNumber]:
+        """
+        Get Hunt Group Primary Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the hunt group's primary phone number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
+
+    def alternate_available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                          org_id: str = None,
+                                          **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Hunt Group Alternate Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the hunt group's alternate phone number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='alternate/availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def alternate_available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                          org_id: str = None,
+                                          **params) -> List[AvailableNumber]:
+        """
+        Get Hunt Group Alternate Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the hunt group's alternate phone number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='alternate/availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
+
+    def forward_available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                        owner_name: str = None, extension: str = None,
+                                        org_id: str = None,
+                                        **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Hunt Group Call Forward Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the hunt group's call forward number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        assigned to an owning entity.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param owner_name: Return the list of phone numbers that are owned by the given `ownerName`. Maximum length is
+            255.
+        :type owner_name: str
+        :param extension: Returns the list of PSTN phone numbers with the given `extension`.
+        :type extension: str
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        if extension is not None:
+            params['extension'] = extension
+        url = self._endpoint(location_id=location_id, path='callForwarding/availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def forward_available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                        owner_name: str = None, extension: str = None,
+                                        org_id: str = None,
+                                        **params) -> List[AvailableNumber]:
+        """
+        Get Hunt Group Call Forward Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the hunt group's call forward number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        assigned to an owning entity.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param owner_name: Return the list of phone numbers that are owned by the given `ownerName`. Maximum length is
+            255.
+        :type owner_name: str
+        :param extension: Returns the list of PSTN phone numbers with the given `extension`.
+        :type extension: str
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        if extension is not None:
+            params['extension'] = extension
+        url = self._endpoint(location_id=location_id, path='callForwarding/availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
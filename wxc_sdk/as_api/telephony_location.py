@@ -0,0 +1,930 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.location import AvailableNumber, CallBackSelected, ContactDetails, DeviceCustomization, \
+    IdAndName, Location, LocationECBN, TelephonyLocation, ValidateExtensionsResponse
+from wxc_sdk.as_api.api_child import AsApiChild
+from wxc_sdk.as_api.telephony_location_emergency_services import AsLocationEmergencyServicesApi
+from wxc_sdk.as_api.telephony_location_intercept import AsLocationInterceptApi
+from wxc_sdk.as_api.telephony_location_internal_dialing import AsInternalDialingApi
+from wxc_sdk.as_api.telephony_location_moh import AsLocationMoHApi
+from wxc_sdk.as_api.telephony_location_numbers import AsLocationNumbersApi
+from wxc_sdk.as_api.telephony_location_receptionist_contacts import AsReceptionistContactsDirectoryApi
+from wxc_sdk.as_api.telephony_location_vm import AsLocationVoicemailSettingsApi
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsTelephonyLocationApi']
+
+
+@dataclass(init=False, repr=False)
+class AsTelephonyLocationApi(AsApiChild, base='telephony/config/locations'):
+    #: emergency services
+    emergency_services: AsLocationEmergencyServicesApi
+    #: call intercept settings
+    intercept: AsLocationInterceptApi
+    #: internal dialing settings
+    internal_dialing: AsInternalDialingApi
+    #: moh settings
+    moh: AsLocationMoHApi
+    #: number settings
+    number: AsLocationNumbersApi
+    #: Location VM settings (only enable/disable transcription for now)
+    voicemail: AsLocationVoicemailSettingsApi
+    #: Receptionist contacts directories
+    receptionist_contacts_directory: AsReceptionistContactsDirectoryApi
+
+    def __init__(self, session: AsRestSession):
+        super().__init__(session=session)
+        self.emergency_services = AsLocationEmergencyServicesApi(session=session)
+        self.intercept = AsLocationInterceptApi(session=session)
+        self.internal_dialing = AsInternalDialingApi(session=session)
+        self.moh = AsLocationMoHApi(session=session)
+        self.number = AsLocationNumbersApi(session=session)
+        self.voicemail = AsLocationVoicemailSettingsApi(session=session)
+        self.receptionist_contacts_directory = AsReceptionistContactsDirectoryApi(session=session)
+
+    async def generate_password(self, location_id: str, generate: list[str] = None, org_id: str = None):
+        """
+        Generates an example password using the effective password settings for the location. If you don't specify
+        anything in the generate field or don't provide a request body, then you will receive a SIP password by default.
+
+        It's used while creating a trunk and shouldn't be used anywhere else.
+
+        Generating an example password requires a full or write-only administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Location for which example password has to be generated.
+        :type location_id: str
+        :param generate: password settings array.
+        :type generate: list[str]
+        :param org_id: Organization to which location belongs.
+        :type org_id: str
+        :return: new password
+        :rtype: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        body = generate and {'generate': generate} or {}
+        url = self.ep(f'{location_id}/actions/generatePassword/invoke')
+        data = await self.post(url=url, params=params, json=body)
+        return data['exampleSipPassword']
+
+    async def validate_extensions(self, location_id: str, extensions: list[str],
+                            org_id: str = None) -> ValidateExtensionsResponse:
+        """
+        Validate extensions for a specific location.
+
+        Validating extensions requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Validate extensions for this location.
+        :type location_id: str
+        :param extensions: Array of extensions that will be validated.
+        :type extensions: list[str]
+        :param org_id: Validate extensions for this organization.
+        :type org_id: str
+        :return: Validation result
+        :rtype: :class:`wxc_sdk.common.ValidateExtensionsResponse`
+        """
+        url = self.ep(f'{location_id}/actions/validateExtensions/invoke')
+        body = {'extensions': extensions}
+        params = org_id and {'orgId': org_id} or None
+        data = await self.post(url=url, params=params, json=body)
+        return ValidateExtensionsResponse.model_validate(data)
+
+    async def details(self, location_id: str, org_id: str = None) -> TelephonyLocation:
+        """
+        Shows Webex Calling details for a location, by ID.
+
+        Specify the location ID in the locationId parameter in the URI.
+
+        Searching and viewing location in your organization requires an administrator auth token with
+        the spark-admin:telephony_config_read scope.
+
+        :param location_id: Retrieve Webex Calling location attributes for this location.
+        :type location_id: str
+        :param org_id: Retrieve Webex Calling location attributes for this organization.
+        :type org_id: str
+        :return: Webex Calling details for location
+        :rtype: :class:`TelephonyLocation`
+        """
+        params = org_id and {'orgId': org_id}
+        url = self.ep(location_id)
+        data = await self.get(url=url, params=params)
+        return TelephonyLocation.model_validate(data)
+
+    async def enable_for_calling(self, location: Location, org_id: str = None) -> str:
+        """
+        Enable a Location for Webex Calling
+
+        Enable a location by adding it to Webex Calling. This add Webex Calling support to a
+        location created using the POST /v1/locations API.
+
+        Locations are used to support calling features which can be defined at the location level.
+
+        This API requires a full administrator auth token with a scope of `spark-admin:telephony_config_write`.
+
+        :return: A unique identifier for the location.
+        :rtype: str
+        """
+        params = org_id and {'orgId': org_id}
+        url = self.ep()
+        body = location.model_dump_json()
+        data = await self.post(url=url, data=body, params=params)
+        return data['id']
+
+    def list_gen(self, name: str = None, order: str = None, org_id: str = None) -> AsyncGenerator[TelephonyLocation, None, None]:
+        """
+        List Locations Webex Calling Details
+
+        Lists Webex Calling locations for an organization with Webex Calling details.
+
+        Searching and viewing locations with Webex Calling details in your
+        organization require an administrator auth token with the
+        `spark-admin:telephony_config_read` scope.
+
+        :param name: List locations whose name contains this string.
+        :type name: str
+        :param order: Sort the list of locations based on name, either asc or desc.
+        :type order: str
+        :param org_id: List locations for this organization.
+        :type org_id: str
+        :return: generator of :class:`TelephonyLocation` instances
+        """
+        params = {to_camel(k): v
+                  for k, v in locals().items()
+                  if k != 'self' and v is not None}
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=TelephonyLocation, params=params, item_key='locations')
+
+    async def list(self, name: str = None, order: str = None, org_id: str = None) -> List[TelephonyLocation]:
+        """
+        List Locations Webex Calling Details
+
+        Lists Webex Calling locations for an organization with Webex Calling details.
+
+        Searching and viewing locations with Webex Calling details in your
+        organization require an administrator auth token with the
+        `spark-admin:telephony_config_read` scope.
+
+        :param name: List locations whose name contains this string.
+        :type name: str
+        :param order: Sort the list of locations based on name, either asc or desc.
+        :type order: str
+        :param org_id: List locations for this organization.
+        :type org_id: str
+        :return: generator of :class:`TelephonyLocation` instances
+        """
+        params = {to_camel(k): v
+                  for k, v in locals().items()
+                  if k != 'self' and v is not None}
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=TelephonyLocation, params=params, item_key='locations')]
+
+    async def update(self, location_id: str, settings: TelephonyLocation, org_id: str = None) -> Optional[str]:
+        """
+         Update Location Webex Calling Details
+
+        Update Webex Calling details for a location, by ID.
+
+        Specifies the location ID in the `locationId` parameter in the URI.
+
+        Modifying the `connection` via API is only supported for the local PSTN types of `TRUNK` and `ROUTE_GROUP`.
+
+        Updating a location in your organization requires an administrator auth token with the
+        `spark-admin:telephony_config_write` scope.
+
+        Example :
+
+            .. code-block:: python
+
+                api.telephony.location.update(location_id=location_id,
+                                              settings=TelephonyLocation(
+                                                  calling_line_id=CallingLineId(
+                                                      phone_number=tn),
+                                                  routing_prefix=routing_prefix,
+                                                  outside_dial_digit='9'))
+
+        :param location_id: Updating Webex Calling location attributes for this location.
+        :type location_id: str
+        :param settings: settings to update
+        :type settings: :class:`TelephonyLocation`
+        :param org_id: Updating Webex Calling location attributes for this organization.
+        :type org_id: str
+        :return: batch job id of update job if one is created
+        :rtype: str
+        """
+        data = settings.update()
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep(location_id)
+        data = await self.put(url=url, json=data, params=params)
+        if data:
+            return data.get('batchJobId')
+        return
+
+    async def change_announcement_language(self, location_id: str, language_code: str, agent_enabled: bool = None,
+                                     service_enabled: bool = None, org_id: str = None):
+        """
+        Change Announcement Language
+
+        Change announcement language for the given location.
+
+        Change announcement language for current people/workspaces and/or existing feature configurations. This does
+        not change the default announcement language which is applied to new users/workspaces and new feature
+        configurations.
+
+        Changing announcement language for the given location requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Change announcement language for this location.
+        :type location_id: str
+        :param language_code: Language code.
+        :type language_code: str
+        :param agent_enabled: Set to true to change announcement language for existing people and workspaces.
+        :type agent_enabled: bool
+        :param service_enabled: Set to true to change announcement language for existing feature configurations.
+        :type service_enabled: bool
+        :param org_id: Change announcement language for this organization.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        body = {'announcementLanguageCode': language_code}
+        if agent_enabled is not None:
+            body['agentEnabled'] = agent_enabled
+        if service_enabled is not None:
+            body['serviceEnabled'] = service_enabled
+        url = self.session.ep(f'{location_id}/actions/modifyAnnouncementLanguage/invoke')
+        await self.put(url, json=body, params=params)
+
+    async def read_ecbn(self, location_id: str,
+                  org_id: str = None) -> LocationECBN:
+        """
+        Get a Location Emergency callback number
+
+        Get location emergency callback number.
+
+        * To retrieve location callback number requires a full, user or read-only administrator or location
+        administrator auth token with a scope of `spark-admin:telephony_config_read`.
+
+        :param location_id: Update location attributes for this location.
+        :type location_id: str
+        :param org_id: Update location attributes for this organization.
+        :type org_id: str
+        :rtype: :class:`LocationECBN`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{location_id}/features/emergencyCallbackNumber')
+        data = await super().get(url, params=params)
+        r = LocationECBN.model_validate(data)
+        return r
+
+    async def update_ecbn(self, location_id: str, selected: CallBackSelected,
+                    location_member_id: str = None, org_id: str = None):
+        """
+        Update a Location Emergency callback number
+
+        Update details for a location emergency callback number.
+
+        * Updating a location callback number requires a full administrator or location administrator auth token with a
+        scope of `spark-admin:telephony_config_write`.
+
+        :param location_id: Update location attributes for this location.
+        :type location_id: str
+        :param selected: Selected number type to configure emergency call back.
+        :type selected: CallBackSelected
+        :param location_member_id: Member ID of user/place within the location. Required if `LOCATION_MEMBER_NUMBER` is
+            selected.
+        :type location_member_id: str
+        :param org_id: Update location attributes for this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['selected'] = enum_str(selected)
+        if location_member_id is not None:
+            body['locationMemberId'] = location_member_id
+        url = self.ep(f'{location_id}/features/emergencyCallbackNumber')
+        await super().put(url, params=params, json=body)
+
+    async def device_settings(self, location_id: str, org_id: str = None) -> DeviceCustomization:
+        """
+        Get device override settings for a location.
+
+        This requires a full or read-only administrator auth token with a scope of spark-admin:telephony_config_read.
+
+        :param location_id: Unique identifier for the location
+        :type location_id: str
+        :param org_id: Settings on the device in this organization
+        :type org_id: str
+        :return: device customization response
+        :rtype: DeviceCustomization
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep(f'{location_id}/devices/settings')
+        data = await self.get(url=url, params=params)
+        return DeviceCustomization.model_validate(data)
+
+    def phone_numbers_available_for_external_caller_id_gen(self, location_id: str,
+                                                       phone_number: List[str] = None,
+                                                       owner_name: str = None, person_id: str = None,
+                                                       org_id: str = None,
+                                                       **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get the List of Phone Numbers Available for External Caller ID
+
+        Get the list of phone numbers available for external caller ID usage by a Webex Calling entity (such as a
+        person, virtual line, or workspace) within the specified location.
+        Numbers from the specified location are returned and cross location numbers are returned as well where the
+        number's location has the same country, PSTN provider, and zone (only applicable for India locations) as the
+        specified location.
+        When `personId` is specified, and the person belongs to a cisco PSTN location, has a mobile number assigned as
+        primary DN, and does not have a billing plan, only the assigned mobile number is returned as the available
+        number for caller ID.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full or read-only administrator or location administrator auth token with a
+        scope of `spark-admin:telephony_config_read`.
+
+        :param location_id: Retrieve available external caller ID numbers for this location.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the provided list in the `phoneNumber` array.
+        :type phone_number: list[str]
+        :param owner_name: Return the list of phone numbers that are owned by the given `ownerName`. Maximum length is
+            255.
+        :type owner_name: str
+        :param person_id: Retrieve available external caller ID numbers for this person. If `personId` is not provided
+            it may result in the unsuccessful assignment of the returned number. This parameter has no effect when
+            workspace or virtual line ID is used.
+        :type person_id: str
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        if person_id is not None:
+            params['personId'] = person_id
+        url = self.ep(f'{location_id}/externalCallerId/availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def phone_numbers_available_for_external_caller_id(self, location_id: str,
+                                                       phone_number: List[str] = None,
+                                                       owner_name: str = None, person_id: str = None,
+                                                       org_id: str = None,
+                                                       **params) -> List[AvailableNumber]:
+        """
+        Get the List of Phone Numbers Available for External Caller ID
+
+        Get the list of phone numbers available for external caller ID usage by a Webex Calling entity (such as a
+        person, virtual line, or workspace) within the specified location.
+        Numbers from the specified location are returned and cross location numbers are returned as well where the
+        number's location has the same country, PSTN provider, and zone (only applicable for India locations) as the
+        specified location.
+        When `personId` is specified, and the person belongs to a cisco PSTN location, has a mobile number assigned as
+        primary DN, and does not have a billing plan, only the assigned mobile number is returned as the available
+        number for caller ID.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full or read-only administrator or location administrator auth token with a
+        scope of `spark-admin:telephony_config_read`.
+
+        :param location_id: Retrieve available external caller ID numbers for this location.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the provided list in the `phoneNumber` array.
+        :type phone_number: list[str]
+        :param owner_name: Return the list of phone numbers that are owned by the given `ownerName`. Maximum length is
+            255.
+        :type owner_name: str
+        :param person_id: Retrieve available external caller ID numbers for this person. If `personId` is not provided
+            it may result in the unsuccessful assignment of the returned number. This parameter has no effect when
+            workspace or virtual line ID is used.
+        :type person_id: str
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        if person_id is not None:
+            params['personId'] = person_id
+        url = self.ep(f'{location_id}/externalCallerId/availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
+
+    def phone_numbers_gen(self, location_id: str,
+                      phone_number: List[str] = None,
+                      owner_name: str = None, org_id: str = None,
+                      **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Available Phone Numbers for a Location with Given Criteria
+
+        List the service and standard PSTN numbers that are available to be assigned as the location's main number.
+        These numbers are associated with the location specified in the request URL and can be active/inactive and
+        assigned to an owning entity or unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full or read-only administrator or location administrator auth token with a
+        scope of `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param owner_name: Return the list of phone numbers that are owned by the given `ownerName`. Maximum length is
+            255.
+        :type owner_name: str
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        url = self.ep(f'{location_id}/availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def phone_numbers(self, location_id: str,
+                      phone_number: List[str] = None,
+                      owner_name: str = None, org_id: str = None,
+                      **params) -> List[AvailableNumber]:
+        """
+        Get Available Phone Numbers for a Location with Given Criteria
+
+        List the service and standard PSTN numbers that are available to be assigned as the location's main number.
+        These numbers are associated with the location specified in the request URL and can be active/inactive and
+        assigned to an owning entity or unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full or read-only administrator or location administrator auth token with a
+        scope of `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param owner_name: Return the list of phone numbers that are owned by the given `ownerName`. Maximum length is
+            255.
+        :type owner_name: str
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        url = self.ep(f'{location_id}/availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
+
+    def webex_go_available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                         org_id: str = None,
+                                         **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Webex Go Available Phone Numbers
+
+        List standard numbers that are available to be assigned as the webex go phone number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self.ep(f'{location_id}/webexGo/availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def webex_go_available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                         org_id: str = None,
+                                         **params) -> List[AvailableNumber]:
+        """
+        Get Webex Go Available Phone Numbers
+
+        List standard numbers that are available to be assigned as the webex go phone number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self.ep(f'{location_id}/webexGo/availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
+
+    def ecbn_available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                     owner_name: str = None, org_id: str = None,
+                                     **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Location ECBN Available Phone Numbers
+
+        List standard numbers that are available to be assigned as the location's emergency callback number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        assigned to an owning entity.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param owner_name: Return the list of phone numbers that are owned by the given `ownerName`. Maximum length is
+            255.
+        :type owner_name: str
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        url = self.ep(f'{location_id}/emergencyCallbackNumber/availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def ecbn_available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                     owner_name: str = None, org_id: str = None,
+                                     **params) -> List[AvailableNumber]:
+        """
+        Get Location ECBN Available Phone Numbers
+
+        List standard numbers that are available to be assigned as the location's emergency callback number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        assigned to an owning entity.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param owner_name: Return the list of phone numbers that are owned by the given `ownerName`. Maximum length is
+            255.
+        :type owner_name: str
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        url = self.ep(f'{location_id}/emergencyCallbackNumber/availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
+
+    def call_intercept_available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                               owner_name: str = None, org_id: str = None,
+                                               **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Location Call Intercept Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the location's call intercept number.
+        These numbers are associated with the location specified in the request URL and can be active/inactive and
+        assigned to an owning entity or unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full or read-only administrator or location administrator auth token with a
+        scope of `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param owner_name: Return the list of phone numbers that are owned by the given `ownerName`. Maximum length is
+            255.
+        :type owner_name: str
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`LocationAvailableNumberObject` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        url = self.ep(f'{location_id}/callIntercept/availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def call_intercept_available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                               owner_name: str = None, org_id: str = None,
+                                               **params) -> List[AvailableNumber]:
+        """
+        Get Location Call Intercept Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the location's call intercept number.
+        These numbers are associated with the location specified in the request URL and can be active/inactive and
+        assigned to an owning entity or unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full or read-only administrator or location administrator auth token with a
+        scope of `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param owner_name: Return the list of phone numbers that are owned by the given `ownerName`. Maximum length is
+            255.
+        :type owner_name: str
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`LocationAvailableNumberObject` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        url = self.ep(f'{location_id}/callIntercept/availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
+
+    async def create_receptionist_contact_directory(self, location_id: str, name: str, contacts: List[str],
+                                                org_id: str = None) -> str:
+        """
+        Create a Receptionist Contact Directory
+
+        Create a new Receptionist Contact Directory for a location.
+
+        Receptionist Contact Directories can be used to create named directories of users and/or location features
+        (Auto Attendant, Call Queue, Hunt Group, Single Number Reach, and Paging Group).
+
+        Adding a directory requires a full or write-only administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param location_id: Add a Receptionist Contact Directory to this location.
+        :type location_id: str
+        :param name: Receptionist Contact Directory name. The directory name should be greater than 0 and less than 41
+            characters in length.
+        :type name: str
+        :param contacts: Non-empty array of users or location features assigned to this Receptionist Contact Directory.
+        :type contacts: list[str]
+        :param org_id: Add a Receptionist Contact Directory to this organization.
+        :type org_id: str
+        :rtype: str
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['name'] = name
+        body['contacts'] = contacts
+        url = self.ep(f'locations/{location_id}/receptionistContacts/directories')
+        data = await super().post(url, params=params, json=body)
+        r = data['id']
+        return r
+
+    async def list_receptionist_contact_directories(self, location_id: str,
+                                                      org_id: str = None) -> List[IdAndName]:
+        """
+        Read list of Receptionist Contact Directories
+
+        List all Receptionist Contact Directories for a location.
+
+        Receptionist Contact Directories can be used to create named directories of users.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: List Receptionist Contact Directories for this location.
+        :type location_id: str
+        :param org_id: List Receptionist Contact Directories for this organization.
+        :type org_id: str
+        :rtype: list[IdAndName]
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'locations/{location_id}/receptionistContacts/directories')
+        data = await super().get(url, params=params)
+        r = type_adapter(list[IdAndName]).validate_python(data['directories'])
+        return r
+
+    async def receptionist_contact_directory_details(self, location_id: str, directory_id: str,
+                                               search_criteria_mode_or: bool = None, first_name: str = None,
+                                               last_name: str = None, phone_number: str = None,
+                                               extension: str = None, person_id: str = None,
+                                               org_id: str = None) -> List[ContactDetails]:
+        """
+        Get details for a Receptionist Contact Directory
+
+        Get details for a specific Receptionist Contact Directory from a location.
+
+        Receptionist Contact Directories are uniquely named per location and contain directories of Persons, Auto
+        Attendants, Call Queues, Hunt Groups, Single Number Reaches, and Paging Groups.
+
+        This API is currently supported for Webex calling organizations with fewer than 2000 users or location-based
+        calling features. For organizations with more than 2000 users or location features, the API will throw an
+        error 25395.
+
+        Retrieving details requires a full or read-only administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Get a Receptionist Contact Directory from this location.
+        :type location_id: str
+        :param directory_id: Get details for the Receptionist Contact Directory with this identifier.
+        :type directory_id: str
+        :param search_criteria_mode_or: When `true`, results matching any one of the search criteria are included. The
+            value can only be `true` or not included in the request. Specifying `searchCriteriaModeOr` without any
+            search criteria, or setting it to `false` results in an `ErrorResponse`. If no search criteria is
+            specified, all results are returned.
+        :type search_criteria_mode_or: bool
+        :param first_name: Search for directories that contain people with the indicated first name.
+        :type first_name: str
+        :param last_name: Search for directories that contain people with the indicated last name.
+        :type last_name: str
+        :param phone_number: Search for directories that contain people with the indicated phone number.
+        :type phone_number: str
+        :param extension: Search for directories that contain people with the indicated extension.
+        :type extension: str
+        :param person_id: Search for directories that contain people with the indicated person ID.
+        :type person_id: str
+        :param org_id: Get a Receptionist Contact Directory from this organization.
+        :type org_id: str
+        :rtype: list[ContactDetails]
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        if search_criteria_mode_or is not None:
+            params['searchCriteriaModeOr'] = str(search_criteria_mode_or).lower()
+        if first_name is not None:
+            params['firstName'] = first_name
+        if last_name is not None:
+            params['lastName'] = last_name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if extension is not None:
+            params['extension'] = extension
+        if person_id is not None:
+            params['personId'] = person_id
+        url = self.ep(f'locations/{location_id}/receptionistContacts/directories/{directory_id}')
+        data = await super().get(url, params=params)
+        r = type_adapter(list[ContactDetails]).validate_python(data['contacts'])
+        return r
+
+    async def delete_receptionist_contact_directory(self, location_id: str, directory_id: str, org_id: str = None):
+        """
+        Delete a Receptionist Contact Directory
+
+        Delete a Receptionist Contact Directory from a location.
+
+        Receptionist Contact Directories can be used to create named directories of users.
+
+        Deleting a directory requires a full or write-only administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param location_id: Delete a Receptionist Contact Directory from this location.
+        :type location_id: str
+        :param directory_id: Add a Receptionist Contact Directory ID.
+        :type directory_id: str
+        :param org_id: Delete a Receptionist Contact Directory from this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'locations/{location_id}/receptionistContacts/directories/{directory_id}')
+        await super().delete(url, params=params)
+
+    async def modify_a_receptionist_contact_directory(self, location_id: str, directory_id: str, name: str,
+                                                contacts: List[str], org_id: str = None) -> str:
+        """
+        Modify a Receptionist Contact Directory
+
+        Modify Receptionist Contact Directories attached to a location. This modification will replace the existing
+        list of contacts with the new incoming contacts list from the request body. The API does not support
+        incremental updates.
+
+        Receptionist Contact Directories can be used to create named groups of Persons, Auto Attendants, Call Queues,
+        Hunt Groups, Single Number Reaches, and Paging Groups.
+
+        Modifying a directory requires a full or write-only administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param location_id: Modify list of Receptionist Contact Directories for this location.
+        :type location_id: str
+        :param directory_id: Get details for the Receptionist Contact Directory with this identifier.
+        :type directory_id: str
+        :param name: Receptionist Contact Directory name. The directory name should be greater than 0 and less than 41
+            characters in length.
+        :type name: str
+        :param contacts: Non-empty array of users or location features assigned to this Receptionist Contact Directory.
+        :type contacts: list[str]
+        :param org_id: Modify list of Receptionist Contact Directories for this organization.
+        :type org_id: str
+        :rtype: str
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['name'] = name
+        body['contacts'] = contacts
+        url = self.ep(f'locations/{location_id}/receptionistContacts/directories/{directory_id}')
+        data = await super().put(url, params=params, json=body)
+        r = data['id']
+        return r
@@ -0,0 +1,102 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.location.emergency_services import LocationEmergencyCallNotification
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsLocationEmergencyServicesApi']
+
+
+class AsLocationEmergencyServicesApi(AsApiChild, base='telephony/config/locations'):
+    """
+    Emergency Call Notifications can be enabled at the organization level, allowing specified email addresses to
+    receive email notifications when an emergency call is made. Once activated at the organization level, individual
+    locations can configure this setting to direct notifications to specific email addresses. To comply with U.S.
+    Public Law 115-127, also known as Kari’s Law, any call that's made from within your organization to emergency
+    services must generate an email notification.
+
+    Viewing these organization settings requires a full or read-only administrator auth token with a scope
+    of `spark-admin:telephony_config_read`. Modifying these organization settings requires a full administrator auth
+    token with a scope of `spark-admin:telephony_config_write`.
+    """
+
+    async def read_emergency_call_notification(self, location_id: str,
+                                         org_id: str = None) -> LocationEmergencyCallNotification:
+        """
+        Get a Location Emergency Call Notification
+
+        Get location emergency call notification.
+
+        Emergency Call Notifications can be enabled at the organization level, allowing specified email addresses to
+        receive email notifications when an emergency call is made. Once activated at the organization level,
+        individual locations can configure this setting to direct notifications to specific email addresses. To comply
+        with U.S. Public Law 115-127, also known as Kari’s Law, any call that's made from within your organization to
+        emergency services must generate an email notification.
+
+        To retrieve location call notifications requires a full, user or read-only administrator or location
+        administrator auth token with a scope of `spark-admin:telephony_config_read`.
+
+        :param location_id: Retrieve Emergency Call Notification attributes for this location.
+        :type location_id: str
+        :param org_id: Retrieve Emergency Call Notification attributes for the location in this organization.
+        :type org_id: str
+        :rtype: :class:`LocationEmergencyCallNotification`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{location_id}/emergencyCallNotification')
+        data = await super().get(url, params=params)
+        r = LocationEmergencyCallNotification.model_validate(data)
+        return r
+
+    async def update_emergency_call_notification(self, location_id: str, setting: LocationEmergencyCallNotification,
+                                           org_id: str = None):
+        """
+        Update a location emergency call notification.
+
+        Once settings enabled at the organization level, the configured email address will receive emergency call
+        notifications for all locations; for specific location customization, users can navigate to Management >
+        Locations, select the Calling tab, and update the Emergency Call Notification settings.
+
+        Emergency Call Notifications can be enabled at the organization level, allowing specified email addresses to
+        receive email notifications when an emergency call is made. Once activated at the organization level,
+        individual locations can configure this setting to direct notifications to specific email addresses. To comply
+        with U.S. Public Law 115-127, also known as Kari’s Law, any call that's made from within your organization to
+        emergency services must generate an email notification.
+
+        To update location call notification requires a full, user or location administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param location_id: Update Emergency Call Notification attributes for this location.
+        :type location_id: str
+        :param setting: new settings
+        :type setting: LocationEmergencyCallNotification
+        :param org_id: Update Emergency Call Notification attributes for a location in this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = org_id and {'orgId': org_id} or None
+        body = setting.update()
+        url = self.ep(f'{location_id}/emergencyCallNotification')
+        await super().put(url, params=params, json=body)
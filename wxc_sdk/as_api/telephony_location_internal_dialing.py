@@ -0,0 +1,80 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.location.internal_dialing import InternalDialing
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsInternalDialingApi']
+
+
+class AsInternalDialingApi(AsApiChild, base='telephony/config/locations'):
+    """
+    Internal dialing settings for location
+    """
+
+    def url(self, location_id: str) -> str:
+        return super().ep(f'{location_id}/internalDialing')
+
+    async def read(self, location_id: str, org_id: str = None) -> InternalDialing:
+        """
+        Get current configuration for routing unknown extensions to the Premises as internal calls
+
+        If some users in a location are registered to a PBX, retrieve the setting to route unknown extensions (digits
+        that match the extension length) to the PBX.
+
+        Retrieving the internal dialing configuration requires a full or read-only administrator auth token with a
+        scope of spark-admin:telephony_config_read.
+
+        :param location_id: location for which internal calling configuration is being requested
+        :type location_id: str
+        :param org_id:
+        :type org_id: str
+        :return: settings
+        :rtype: :class:`InternalDialing`
+        """
+        url = self.url(location_id=location_id)
+        params = org_id and {'orgId': org_id} or None
+        data = await self.get(url=url, params=params)
+        return InternalDialing.model_validate(data)
+
+    async def update(self, location_id: str, update: InternalDialing, org_id: str = None):
+        """
+        Modify current configuration for routing unknown extensions to the Premises as internal calls
+
+        If some users in a location are registered to a PBX, enable the setting to route unknown extensions (digits
+        that match the extension length) to the PBX.
+
+        Editing the internal dialing configuration requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: location for which internal calling configuration is being requested
+        :type location_id: str
+        :param update: new settings
+        :type update: :class:`InternalDialing`
+        :param org_id:
+        :type org_id: str
+        """
+        url = self.url(location_id=location_id)
+        params = org_id and {'orgId': org_id} or None
+        data = update.model_dump_json(exclude_none=False)
+        await self.put(url=url, params=params, data=data)
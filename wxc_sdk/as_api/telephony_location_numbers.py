@@ -0,0 +1,155 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.location.numbers import NumberAddResponse, NumberState, NumberUsageType, TelephoneNumberType
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsLocationNumbersApi']
+
+
+class AsLocationNumbersApi(AsApiChild, base='telephony/config/locations'):
+    def _url(self, location_id: str, path: str = None):
+        """
+
+        :meta private:
+        """
+        path = path and f'/{path}' or ''
+        return self.ep(f'{location_id}/numbers{path}')
+
+    async def add(self, location_id: str, phone_numbers: list[str], number_type: TelephoneNumberType = None,
+            number_usage_type: NumberUsageType = None,
+            state: NumberState = NumberState.inactive, subscription_id: str = None,
+            org_id: str = None)->NumberAddResponse:
+        """
+        Add Phone Numbers to a location
+
+        Adds a specified set of phone numbers to a location for an organization.
+
+        Each location has a set of phone numbers that can be assigned to people, workspaces, or features. Phone numbers
+        must follow the E.164 format. Active phone numbers are in service.
+
+        Adding a phone number to a location requires a full administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        This API is only supported for adding DID and Toll-free numbers to non-integrated
+        PSTN connection types such as Local Gateway (LGW) and Non-integrated CPP. It should never be used for
+        locations with integrated PSTN connection types like Cisco Calling Plans or Integrated CCP because backend
+        data issues may occur.
+
+        Mobile numbers can be added to any location that has PSTN connection setup. Only
+        20 mobile numbers can be added per request.
+
+        :param location_id: LocationId to which numbers should be added.
+        :type location_id: str
+        :param phone_numbers: List of phone numbers that need to be added.
+        :type phone_numbers: list[str]
+        :param number_type: Type of the number. Required for `MOBILE` number type.
+        :type number_type: TelephoneNumberType
+        :param number_usage_type: Type of usage expected for the number.
+        :type number_usage_type: NumberUsageType
+        :param state: Reflects the state of the number. By default, the state of a number is set to `ACTIVE` for DID
+            and toll-free numbers only. Mobile numbers will be activated upon assignment to a user.
+        :type state: NumberState
+        :param subscription_id: Reflects the `subscriptionId` to be used for mobile number order.
+        :type subscription_id: str
+        :param org_id: Organization to manage.
+        :type org_id: str
+        """
+        url = self._url(location_id)
+        params = org_id and {'orgId': org_id} or None
+        body = dict()
+        body['phoneNumbers'] = phone_numbers
+        if number_type is not None:
+            body['numberType'] = enum_str(number_type)
+        if number_usage_type is not None:
+            body['numberUsageType'] = enum_str(number_usage_type)
+        if state is not None:
+            body['state'] = enum_str(state)
+        if subscription_id is not None:
+            body['subscriptionId'] = subscription_id
+
+        r = await self.post(url=url, params=params, json=body)
+        if isinstance(r, list):
+            return NumberAddResponse.model_validate(r[0])
+        return NumberAddResponse.model_validate({})
+
+    async def activate(self, location_id: str, phone_numbers: list[str], org_id: str = None):
+        """
+        Activate Phone Numbers in a location
+
+        Activate the specified set of phone numbers in a location for an organization.
+
+        Each location has a set of phone numbers that can be assigned to people, workspaces, or features. Phone numbers
+        must follow the E.164 format. Active phone numbers are in service.
+
+        A mobile number is activated when assigned to a user. This API will not activate mobile numbers.
+
+        Activating a phone number in a location requires a full administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        This API is only supported for non-integrated PSTN connection types of Local
+        Gateway (LGW) and Non-integrated CPP. It should never be used for locations with integrated PSTN connection
+        types like Cisco Calling Plans or Integrated CCP because backend data issues may occur.
+
+        :param location_id: LocationId in which numbers should be activated.
+        :type location_id: str
+        :param phone_numbers: List of phone numbers to be activated.
+        :type phone_numbers: list[str]
+        :param org_id: Organization to manage
+        :type org_id: str
+        """
+        url = self._url(location_id)
+        params = org_id and {'orgId': org_id} or None
+        body = {'phoneNumbers': phone_numbers}
+        await super().post(url, params=params, json=body)
+
+    async def remove(self, location_id: str, phone_numbers: list[str], org_id: str = None):
+        """
+        Remove phone numbers from a location
+
+        Remove the specified set of phone numbers from a location for an organization.
+
+        Phone numbers must follow the E.164 format.
+
+        Removing a mobile number may require more time depending on mobile carrier capabilities.
+
+        Removing a phone number from a location requires a full administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        A location's main number cannot be removed.
+
+        This API is only supported for non-integrated PSTN connection types of Local
+        Gateway (LGW) and Non-integrated CPP. It should never be used for locations with integrated PSTN connection
+        types like Cisco Calling Plans or Integrated CCP because backend data issues may occur.
+
+        :param location_id: LocationId from which numbers should be removed.
+        :type location_id: str
+        :param phone_numbers: List of phone numbers to be removed.
+        :type phone_numbers: list[str]
+        :param org_id: Organization to manage
+        :type org_id: str
+        """
+        url = self._url(location_id)
+        params = org_id and {'orgId': org_id} or None
+        body = {'phoneNumbers': phone_numbers}
+        await self.delete(url=url, params=params, json=body)
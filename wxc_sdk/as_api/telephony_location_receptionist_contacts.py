@@ -0,0 +1,134 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.location.receptionist_contacts import IdAndName
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsReceptionistContactsDirectoryApi']
+
+
+class AsReceptionistContactsDirectoryApi(AsApiChild, base='telephony/config/locations'):
+    """
+    Webex Calling Location Receptionist Contacts supports creation of directories and assigning custom groups of
+    users to directories for a location within an organization.
+
+    Receptionist Contact Directories are named custom groups of users.
+
+    Viewing these read-only directories requires a full or read-only administrator auth token with a scope of
+    spark-admin:telephony_config_read, as the current set of APIs is designed to provide supplemental information for
+    administrators utilizing People Webex Calling APIs.
+
+    Modifying these directories requires a full administrator auth token with a scope
+    of spark-admin:telephony_config_write.
+
+    A partner administrator can retrieve or change settings in a customer's organization using the optional OrgId
+    query parameter.
+
+    """
+
+    # TODO: create test cases
+    # TODO: add details(), delete(), and update()
+
+    def _url(self, location_id: str):
+        return self.ep(f'{location_id}/receptionistContacts/directories')
+
+    async def create(self, location_id: str, name: str, contacts: list[str], org_id: str = None) -> str:
+        """
+        Creates a new Receptionist Contact Directory for a location.
+
+        Receptionist Contact Directories can be used to create named directories of users.
+
+        Adding a directory requires a full or write-only administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Add a Receptionist Contact Directory to this location.
+        :type location_id: str
+        :param name: Receptionist Contact Directory name.
+        :type name: str
+        :param contacts: Array of user or workspace ids assigned to this Receptionist Contact Directory
+        :type contacts: list[str]
+        :param org_id: Add a Receptionist Contact Directory to this organization.
+        :type org_id: str
+        :return: Receptionist Contact Directory ID.
+        """
+        url = self._url(location_id)
+        params = org_id and {'orgId': org_id} or None
+        body = {'name': name,
+                'contacts': [{'personId': contact} for contact in contacts]}
+        data = await self.post(url=url, params=params, json=body)
+        return data['id']
+
+    def list_gen(self, location_id: str, org_id: str = None) -> AsyncGenerator[IdAndName, None, None]:
+        """
+        List all Receptionist Contact Directories for a location.
+
+        Receptionist Contact Directories can be used to create named directories of users.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param location_id: List Receptionist Contact Directories for this location.
+        :type location_id: str
+        :param org_id: List Receptionist Contact Directories for this organization.
+        :type org_id: str
+        :return: Yields IdAndName instances
+        """
+        url = self._url(location_id)
+        params = org_id and {'orgId': org_id} or None
+        return self.session.follow_pagination(url=url, model=IdAndName, params=params, item_key='directories')
+
+    async def list(self, location_id: str, org_id: str = None) -> List[IdAndName]:
+        """
+        List all Receptionist Contact Directories for a location.
+
+        Receptionist Contact Directories can be used to create named directories of users.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param location_id: List Receptionist Contact Directories for this location.
+        :type location_id: str
+        :param org_id: List Receptionist Contact Directories for this organization.
+        :type org_id: str
+        :return: Yields IdAndName instances
+        """
+        url = self._url(location_id)
+        params = org_id and {'orgId': org_id} or None
+        return [o async for o in self.session.follow_pagination(url=url, model=IdAndName, params=params, item_key='directories')]
+
+    async def delete(self, location_id: str, directory_id: str, org_id: str = None):
+        """
+        Delete a Receptionist Contact Directory from a location.
+
+        Receptionist Contact Directories can be used to create named directories of users.
+
+        Deleting a directory requires a full or write-only administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Delete a Receptionist Contact Directory from this location.
+        :param directory_id: ID of directory to delete.
+        :param org_id: Delete a Receptionist Contact Directory from this organization.
+        """
+        url = f'{self._url(location_id)}/{directory_id}'
+        params = org_id and {'orgId': org_id} or None
+        await super().delete(url=url, params=params)
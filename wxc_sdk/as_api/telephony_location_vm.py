@@ -0,0 +1,97 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.location.vm import LocationVoiceMailSettings
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsLocationVoicemailSettingsApi']
+
+
+class AsLocationVoicemailSettingsApi(AsApiChild, base='telephony/config/locations'):
+    """
+    location voicemail settings API, for now only enable/disable Vm transcription
+    """
+
+    def _endpoint(self, *, location_id: str, path: str = None) -> str:
+        """
+        location specific
+        telephony/config/locations/{locationId}/voicemail
+
+        :meta private:
+        :param location_id: Unique identifier for the location.
+        :type location_id: str
+        :param path: additional path
+        :type: path: str
+        :return: full endpoint
+        :rtype: str
+        """
+        path = path and f'/{path}' or ''
+        ep = self.session.ep(f'telephony/config/locations/{location_id}/voicemail{path}')
+        return ep
+
+    async def read(self, location_id: str, org_id: str = None) -> LocationVoiceMailSettings:
+        """
+        Get Location Voicemail
+
+        Retrieve voicemail settings for a specific location.
+
+        Location's voicemail settings allows you to enable voicemail transcription for a specific location.
+
+        Retrieving location's voicemail settings requires a full, user or read-only administrator auth token with
+        a scope of spark-admin:telephony_config_read.
+
+
+        :param location_id: Retrieve access codes details for this location.
+        :type location_id: str
+        :param org_id: Retrieve access codes details for a customer location in this organization
+        :type org_id: str
+        :return: location voicemail settings
+        :rtype: :class:`LocationVoiceMailSettings`
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(location_id=location_id)
+        data = await self.get(url, params=params)
+        return LocationVoiceMailSettings.model_validate(data)
+
+    async def update(self, location_id: str, settings: LocationVoiceMailSettings, org_id: str = None):
+        """
+        Update Location Voicemail
+
+        Update the voicemail settings for a specific location.
+
+        Location voicemail settings allows you to enable voicemail transcription for a specific location.
+
+        Updating a location's voicemail settings requires a full administrator or location administrator auth token
+        with a scope of `spark-admin:telephony_config_write`.
+
+        :param location_id: Update voicemail settings for this location.
+        :type location_id: str
+        :param settings: new settings
+        :type settings: :class:`LocationVoiceMailSettings`
+        :param org_id: Update voicemail settings for this organization.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(location_id=location_id)
+        body = settings.update()
+        await self.put(url, params=params, json=body)
@@ -0,0 +1,361 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.operating_modes import IdAndName, OperatingMode, OperatingModeHoliday
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsOperatingModesApi']
+
+
+class AsOperatingModesApi(AsApiChild, base='telephony/config'):
+    """
+    Schedule Based Routing with Operating Modes
+
+    Features: `Operating modes` help manage calls more efficiently by routing them based on predefined settings.
+    Authorized users can adjust these modes to reduce wait times for clients.
+    `Operating modes` are used by mode-based forwarding for the `Auto Attendant`, `Call Queue`, and `Hunt Group`
+    features.
+
+    Viewing these read-only organization settings requires a full, read-only, or location administrator auth token with
+    a scope of `spark-admin:telephony_config_read`.
+
+    Modifying these organization settings requires a full, or location administrator auth token with a scope of
+    `spark-admin:telephony_config_write`.
+
+    A partner administrator can retrieve, or change settings in a customer's organization using the optional `orgId`
+    query parameter.
+    """
+
+    def list_gen(self, limit_to_location_id: str = None, name: str = None,
+             limit_to_org_level_enabled: bool = None, order: str = None,
+             org_id: str = None,
+             **params) -> AsyncGenerator[OperatingMode, None, None]:
+        """
+        Read the List of Operating Modes.
+
+        Retrieve `Operating Modes` list defined at location, or organization level. Use query parameters to filter the
+        result set by location or level. The list returned is sorted in ascending order by operating mode name. Long
+        result sets are split into `pages
+        <https://developer.webex.com/docs/basics#pagination>`_.
+
+        `Operating modes` help manage calls more efficiently by routing them based on predefined settings.
+
+        Retrieving this list requires a full, read-only, or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param limit_to_location_id: Location query parameter to filter the `operating modes` from that location only.
+        :type limit_to_location_id: str
+        :param name: List `operating modes` whose name contains this string.
+        :type name: str
+        :param limit_to_org_level_enabled: If true, only return `operating modes` defined at the organization level.
+        :type limit_to_org_level_enabled: bool
+        :param order: Sort the list of `operating modes` based on `name`, either asc, or desc.
+        :type order: str
+        :param org_id: Retrieve `operating modes` list from this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`OperatingMode` instances
+        """
+        if name is not None:
+            params['name'] = name
+        if limit_to_location_id is not None:
+            params['limitToLocationId'] = limit_to_location_id
+        if limit_to_org_level_enabled is not None:
+            params['limitToOrgLevelEnabled'] = str(limit_to_org_level_enabled).lower()
+        if order is not None:
+            params['order'] = order
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep('operatingModes')
+        return self.session.follow_pagination(url=url, model=OperatingMode, item_key='operatingModes',
+                                              params=params)
+
+    async def list(self, limit_to_location_id: str = None, name: str = None,
+             limit_to_org_level_enabled: bool = None, order: str = None,
+             org_id: str = None,
+             **params) -> List[OperatingMode]:
+        """
+        Read the List of Operating Modes.
+
+        Retrieve `Operating Modes` list defined at location, or organization level. Use query parameters to filter the
+        result set by location or level. The list returned is sorted in ascending order by operating mode name. Long
+        result sets are split into `pages
+        <https://developer.webex.com/docs/basics#pagination>`_.
+
+        `Operating modes` help manage calls more efficiently by routing them based on predefined settings.
+
+        Retrieving this list requires a full, read-only, or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param limit_to_location_id: Location query parameter to filter the `operating modes` from that location only.
+        :type limit_to_location_id: str
+        :param name: List `operating modes` whose name contains this string.
+        :type name: str
+        :param limit_to_org_level_enabled: If true, only return `operating modes` defined at the organization level.
+        :type limit_to_org_level_enabled: bool
+        :param order: Sort the list of `operating modes` based on `name`, either asc, or desc.
+        :type order: str
+        :param org_id: Retrieve `operating modes` list from this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`OperatingMode` instances
+        """
+        if name is not None:
+            params['name'] = name
+        if limit_to_location_id is not None:
+            params['limitToLocationId'] = limit_to_location_id
+        if limit_to_org_level_enabled is not None:
+            params['limitToOrgLevelEnabled'] = str(limit_to_org_level_enabled).lower()
+        if order is not None:
+            params['order'] = order
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep('operatingModes')
+        return [o async for o in self.session.follow_pagination(url=url, model=OperatingMode, item_key='operatingModes',
+                                              params=params)]
+
+    async def details(self, mode_id: str, org_id: str = None) -> OperatingMode:
+        """
+        Get Details for an Operating Mode.
+
+        Retrieve an `Operating Mode` by `Operating Mode ID`.
+
+        `Operating modes` can be used to define call routing rules for different scenarios like business hours, after
+        hours, holidays, etc.
+
+        Retrieving an `operating mode` requires a full, read-only, or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param mode_id: Get the `operating mode` with the matching ID.
+        :type mode_id: str
+        :param org_id: Get the `operating mode` from this organization.
+        :type org_id: str
+        :rtype: :class:`OperatingMode`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'operatingModes/{mode_id}')
+        data = await super().get(url, params=params)
+        r = OperatingMode.model_validate(data)
+        return r
+
+    async def create(self, settings: OperatingMode, org_id: str = None) -> str:
+        """
+        Create an Operating Mode.
+
+        Create an `Operating Mode` at an organization, or a location level.
+
+        `Operating modes` can be used to define call routing rules for different scenarios like business hours, after
+        hours, holidays, etc.
+
+        Creating an `Operating Mode` requires a full, or location administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param settings: Create the `operating mode` with these settings. At least name, type and level must be set.
+        :type settings: OperatingMode
+        :param org_id: Create the `operating mode` for this organization.
+        :type org_id: str
+        :rtype: str
+        """
+        params = {'orgId': org_id} if org_id else None
+        body = settings.create()
+        url = self.ep('operatingModes')
+        data = await super().post(url, params=params, json=body)
+        r = data['id']
+        return r
+
+    async def update(self, mode_id: str, settings: OperatingMode, org_id: str = None):
+        """
+        Modify an Operating Mode.
+
+        Modify the designated `Operating Mode's` configuration.
+
+        `Operating modes` can be used to define call routing rules for different scenarios like business hours, after
+        hours, holidays, etc.
+
+        Modifying an `Operating Mode` requires a full, or location administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param mode_id: Modify the `operating mode` with the matching ID.
+        :type mode_id: str
+        :param settings: Modify the `operating mode` with these settings.
+        :type settings: OperatingMode
+        :param org_id: Modify the `operating mode` from this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {'orgId': org_id} if org_id else None
+        body = settings.update()
+        mode_id = mode_id or settings.id
+        url = self.ep(f'operatingModes/{mode_id}')
+        await super().put(url, params=params, json=body)
+
+    async def delete(self, mode_id: str, org_id: str = None):
+        """
+        Delete an Operating Mode.
+
+        Delete the designated `Operating Mode`.
+
+        Deleting an `Operating Mode` requires a full, or location administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param mode_id: Delete the `operating mode` with the matching ID.
+        :type mode_id: str
+        :param org_id: Delete the `operating mode` from this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'operatingModes/{mode_id}')
+        await super().delete(url, params=params)
+
+    async def holiday_details(self, mode_id: str, holiday_id: str,
+                        org_id: str = None) -> OperatingModeHoliday:
+        """
+        Get details for an Operating Mode Holiday.
+
+        Retrieve an `Operating Mode Holiday` by ID.
+
+        Holidays define a recurring schedule for the `Operating Modes`.
+
+        Retrieving an `Operating Mode Holiday` requires a full, read-only, or location administrator auth token with a
+        scope of `spark-admin:telephony_config_read`.
+
+        :param mode_id: Get the holiday from this `operating mode` matching ID.
+        :type mode_id: str
+        :param holiday_id: Get the `operating mode Holiday` with the matching ID.
+        :type holiday_id: str
+        :param org_id: Get the `operating mode` from this organization.
+        :type org_id: str
+        :rtype: :class:`OperatingModeHoliday`
+        """
+        params = {'orgId': org_id} if org_id else None
+        url = self.ep(f'operatingModes/{mode_id}/holidays/{holiday_id}')
+        data = await super().get(url, params=params)
+        r = OperatingModeHoliday.model_validate(data)
+        return r
+
+    async def holiday_create(self, mode_id: str, settings: OperatingModeHoliday, org_id: str = None) -> str:
+        """
+        Create an Operating Mode Holiday.
+
+        Create a holiday schedule event for the designated `Operating Mode`.
+
+        Holidays define a recurring schedule for the `Operating Modes`. An `Operating Mode` can have a max of 150
+        holidays.
+
+        Creating an `Operating Mode Holiday` requires a full, or location administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param mode_id: Create the holiday for this `operating mode`.
+        :type mode_id: str
+        :param settings: Create the `operating mode holiday` with these settings.
+        :type settings: OperatingModeHoliday
+        :param org_id: Create the `operating mode holiday` for this organization.
+        :type org_id: str
+        :rtype: str
+        """
+        params = {'orgId': org_id} if org_id else None
+        body = settings.create_update()
+        url = self.ep(f'operatingModes/{mode_id}/holidays')
+        data = await super().post(url, params=params, json=body)
+        r = data['id']
+        return r
+
+    async def holiday_update(self, mode_id: str, holiday_id: str, settings: OperatingModeHoliday, org_id: str = None):
+        """
+        Modify an Operating Mode Holiday.
+
+        Modify the designated `Operating Mode Holiday's` configuration.
+
+        Modifying an `Operating Mode Holiday` requires a full, or location administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param mode_id: Modify the holiday from this `operating mode` matching ID.
+        :type mode_id: str
+        :param holiday_id: Modify the `Holiday` with the matching ID.
+        :type holiday_id: str
+        :param settings: Modify the `operating mode holiday` with these settings.
+        :type settings: OperatingModeHoliday
+        :param org_id: Modify the `operating mode` from this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {'orgId': org_id} if org_id else None
+        holiday_id = holiday_id or settings.id
+        body = settings.create_update()
+        url = self.ep(f'operatingModes/{mode_id}/holidays/{holiday_id}')
+        await super().put(url, params=params, json=body)
+
+    async def holiday_delete(self, mode_id: str, holiday_id: str = None, org_id: str = None):
+        """
+        Delete an Operating Mode Holiday.
+
+        Delete the designated `Operating Mode Holiday`.
+
+        Deleting an `Operating Mode Holiday` requires a full, or location administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param mode_id: Delete the holiday from this `operating mode` matching ID.
+        :type mode_id: str
+        :param holiday_id: Delete the holiday with the matching ID.
+        :type holiday_id: str
+        :param org_id: Delete the `operating mode` from this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'operatingModes/{mode_id}/holidays/{holiday_id}')
+        await super().delete(url, params=params)
+
+    async def available_operating_modes(self, location_id: str,
+                                  org_id: str = None) -> List[IdAndName]:
+        """
+        Retrieve the List of Available Operating Modes in a Location.
+
+        Retrieve list of `Operating Modes` which are available to be assigned to a location level feature (`Auto
+        Attendant`, `Call Queue`, or `Hunt Group`). Since each location and an org can have a max of 100 `Operating
+        Modes` defined. The max number of `operating modes` that can be returned is 200.
+
+        `Operating modes` can be used to define call routing rules for different scenarios like business hours, after
+        hours, holidays, etc. for the `Auto Attendant`, `Call Queue`, and `Hunt Group` features.
+
+        Retrieving this list requires a full, read-only, or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Retrieve `operating modes` list from this location.
+        :type location_id: str
+        :param org_id: Retrieve `operating modes` list from this organization.
+        :type org_id: str
+        :rtype: list[IdAndName]
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'locations/{location_id}/operatingModes/availableOperatingModes')
+        data = await super().get(url, params=params)
+        r = type_adapter(list[IdAndName]).validate_python(data['operatingModes'])
+        return r
@@ -0,0 +1,74 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.organisation_vm import OrganisationVoicemailSettings
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsOrganisationVoicemailSettingsAPI']
+
+
+class AsOrganisationVoicemailSettingsAPI(AsApiChild, base='telephony/config/voicemail/settings'):
+    """
+    API for Organisation voicemail settings
+    """
+
+    async def read(self, org_id: str = None) -> OrganisationVoicemailSettings:
+        """
+        Get Voicemail Settings
+
+        Retrieve the organization's voicemail settings.
+
+        Organizational voicemail settings determines what voicemail features a person can configure and automatic
+        message expiration.
+
+        Retrieving organization's voicemail settings requires a full, user or read-only administrator auth token with
+        a scope of spark-admin:telephony_config_read.
+
+        :param org_id: Retrieve voicemail settings for this organization.
+        :type org_id: str
+        :return: VM settings
+        :rtype: OrganisationVoicemailSettings
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep()
+        return OrganisationVoicemailSettings.model_validate(await self.get(url, params=params))
+
+    async def update(self, settings: OrganisationVoicemailSettings, org_id: str = None):
+        """
+        Update the organization's voicemail settings.
+
+        Organizational voicemail settings determines what voicemail features a person can configure and automatic
+        message expiration.
+
+        Updating organization's voicemail settings requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param settings: new settings
+        :type settings: OrganisationVoicemailSettings
+        :param org_id: Update voicemail settings for this organization.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep()
+        data = settings.model_dump_json()
+        await self.put(url, data=data, params=params)
@@ -0,0 +1,269 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.paging import AvailableNumber, Paging
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsPagingApi']
+
+
+class AsPagingApi(AsApiChild, base='telephony/config'):
+
+    def _endpoint(self, *, location_id: str = None, paging_id: str = None, path: str = None) -> str:
+        """
+        endpoint for paging group operation
+
+        :meta private:
+        :param location_id:
+        :type location_id: str
+        :param paging_id:
+        :type paging_id: str
+        """
+        if location_id is None:
+            return super().ep('paging')
+        paging_id = paging_id and f'/{paging_id}' or ''
+        path = path and f'/{path}' or ''
+        return super().ep(f'locations/{location_id}/paging{paging_id}{path}')
+
+    def list_gen(self, location_id: str = None, name: str = None, phone_number: str = None,
+             org_id: str = None, **params) -> AsyncGenerator[Paging, None, None]:
+        """
+        Read the List of Paging Groups
+        List all Paging Groups for the organization.
+
+        Group Paging allows a person to place a one-way call or group page to up to 75 people and/or workspaces by
+        dialing a number or extension assigned to a specific paging group. The Group Paging service makes a
+        simultaneous call to all the assigned targets.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope of
+        spark-admin:telephony_config_read.
+
+        :param location_id: Return only paging groups with matching location ID. Default is all locations
+        :type location_id: str
+        :param name: Return only paging groups with the matching name.
+        :type name: str
+        :param phone_number: Return only paging groups with matching primary phone number or extension.
+        :type phone_number: str
+        :param org_id: List paging groups for this organization.
+        :type org_id: str
+        :return: generator of class:`Paging` objects
+        """
+        params.update((to_camel(k), v)
+                      for i, (k, v) in enumerate(locals().items())
+                      if i and v is not None and k != 'params')
+        url = self._endpoint()
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=Paging, params=params, item_key='locationPaging')
+        pass
+
+    async def list(self, location_id: str = None, name: str = None, phone_number: str = None,
+             org_id: str = None, **params) -> List[Paging]:
+        """
+        Read the List of Paging Groups
+        List all Paging Groups for the organization.
+
+        Group Paging allows a person to place a one-way call or group page to up to 75 people and/or workspaces by
+        dialing a number or extension assigned to a specific paging group. The Group Paging service makes a
+        simultaneous call to all the assigned targets.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope of
+        spark-admin:telephony_config_read.
+
+        :param location_id: Return only paging groups with matching location ID. Default is all locations
+        :type location_id: str
+        :param name: Return only paging groups with the matching name.
+        :type name: str
+        :param phone_number: Return only paging groups with matching primary phone number or extension.
+        :type phone_number: str
+        :param org_id: List paging groups for this organization.
+        :type org_id: str
+        :return: generator of class:`Paging` objects
+        """
+        params.update((to_camel(k), v)
+                      for i, (k, v) in enumerate(locals().items())
+                      if i and v is not None and k != 'params')
+        url = self._endpoint()
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=Paging, params=params, item_key='locationPaging')]
+        pass
+
+    async def create(self, location_id: str, settings: Paging, org_id: str = None) -> str:
+        """
+        Create a new Paging Group
+        Create a new Paging Group for the given location.
+
+        Group Paging allows a person to place a one-way call or group page to up to 75 people and/or workspaces by
+        dialing a number or extension assigned to a specific paging group. The Group Paging service makes a
+        simultaneous call to all the assigned targets.
+
+        Creating a paging group requires a full administrator auth token with a scope of
+        spark-admin:telephony_config_write.
+
+        :param location_id: Create the paging group for this location.
+        :type location_id: str
+        :param settings: new paging group
+        :type settings: Paging
+        :param org_id: Create the paging group for this organization.
+        :type org_id: str
+        :return: ID of the newly created paging group.
+        :rtype: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        if settings.originators and settings.originator_caller_id_enabled is None:
+            raise TypeError('originator_caller_id_enabled required if originators are provided')
+        url = self._endpoint(location_id=location_id)
+        data = settings.create_or_update()
+        data = await self.post(url, data=data, params=params)
+        return data['id']
+
+    async def delete_paging(self, location_id: str, paging_id: str, org_id: str = None):
+        """
+        Delete a Paging Group
+        Delete the designated Paging Group.
+
+        Group Paging allows a person to place a one-way call or group page to up to 75 people and/or workspaces by
+        dialing a number or extension assigned to a specific paging group. The Group Paging service makes a
+        simultaneous call to all the assigned targets.
+
+        Deleting a paging group requires a full administrator auth token with a scope of
+        spark-admin:telephony_config_write.
+
+        :param location_id: Location from which to delete a paging group.
+        :type location_id: str
+        :param paging_id: Delete the paging group with the matching ID.
+        :param org_id: Delete the paging group from this organization.
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(location_id=location_id, paging_id=paging_id)
+        await self.delete(url, params=params)
+
+    async def details(self, location_id: str, paging_id: str, org_id: str = None) -> Paging:
+        """
+        Get Details for a Paging Group
+        Retrieve Paging Group details.
+
+        Group Paging allows a person to place a one-way call or group page to up to 75 people and/or workspaces by
+        dialing a number or extension assigned to a specific paging group. The Group Paging service makes a
+        simultaneous call to all the assigned targets.
+
+        Retrieving paging group details requires a full or read-only administrator auth token with a scope of
+        spark-admin:telephony_config_read.
+        :param location_id: Retrieve settings for a paging group in this location.
+        :param paging_id: Retrieve settings for the paging group with this identifier.
+        :param org_id: Retrieve paging group settings from this organization.
+        :return: :class:`Paging` object
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(location_id=location_id, paging_id=paging_id)
+        return Paging.model_validate(await self.get(url, params=params))
+
+    async def update(self, location_id: str, update: Paging, paging_id: str, org_id: str = None):
+        """
+        Update the designated Paging Group.
+
+        Group Paging allows a person to place a one-way call or group page to up to 75 people and/or workspaces by
+        dialing a number or extension assigned to a specific paging group. The Group Paging service makes a
+        simultaneous call to all the assigned targets.
+
+        Updating a paging group requires a full administrator auth token with a scope of
+        spark-admin:telephony_config_write.
+
+        :param location_id: Update settings for a paging group in this location.
+        :type location_id: str
+        :param update: update parameters
+        :type update: Paging
+        :param paging_id: Update settings for the paging group with this identifier.
+        :type paging_id: str
+        :param org_id: Update paging group settings from this organization.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(location_id=location_id, paging_id=paging_id)
+        data = update.create_or_update()
+        await self.put(url, data=data, params=params)
+
+    def primary_available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                        org_id: str = None,
+                                        **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Paging Group Primary Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the paging group's primary phone number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def primary_available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                        org_id: str = None,
+                                        **params) -> List[AvailableNumber]:
+        """
+        Get Paging Group Primary Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the paging group's primary phone number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
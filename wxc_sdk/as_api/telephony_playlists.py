@@ -0,0 +1,213 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.playlists import IdAndName, PlayList
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsPlayListApi']
+
+
+class AsPlayListApi(AsApiChild, base='telephony/config/announcements/playlists'):
+    """
+    Features:  Announcement PlayList
+
+    Features: Announcement PlayList support reading and writing of Webex Calling Announcement PlayList settings for a
+    specific organization. The playlist has multiple announcement files which will be played where the announcement
+    playlist is selected.
+
+    Viewing these read-only organization settings requires a full or read-only administrator auth token with a scope
+    of `spark-admin:telephony_config_read`.
+
+    Modifying these organization settings requires a full administrator auth token with a scope
+    of `spark-admin:telephony_config_write`.
+
+    A partner administrator can retrieve or change settings in a customer's organization using the optional `orgId`
+    query parameter.
+    """
+
+    async def list(self, org_id: str = None) -> list[PlayList]:
+        """
+        Fetch list of announcement playlist on organization level
+
+        Fetch a list of announcement playlist at an organization.
+
+        This API requires a full or read-only administrator or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param org_id: Get announcements playlist in this organization.
+        :type org_id: str
+        :rtype: list[:class:`PlayList`]
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep()
+        data = await super().get(url, params=params)
+        r = type_adapter(list[PlayList]).validate_python(data['playlists'])
+        return r
+
+    async def create(self, name: str, announcement_ids: List[str], org_id: str = None) -> str:
+        """
+        Create announcement Playlist at organization level
+
+        Create announcement Playlist at an organization level. A maximum of 25 announcement files can be included in a
+        single playlist.
+
+        This API requires a full administrator auth token with a scope of `spark-admin:telephony_config_write`.
+
+        :param name: Unique name for the announcement playlist.
+        :type name: str
+        :param announcement_ids: Array of `announcementIds` associated with the playlist.
+        :type announcement_ids: list[str]
+        :param org_id: Create an announcement playlist in this organization.
+        :type org_id: str
+        :rtype: str
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['name'] = name
+        body['announcementIds'] = announcement_ids
+        url = self.ep()
+        data = await super().post(url, params=params, json=body)
+        r = data['id']
+        return r
+
+    async def details(self, play_list_id: str, org_id: str = None) -> PlayList:
+        """
+        Fetch details of announcement playlist at the organization level
+
+        Fetch details of announcement playlist by its ID at an organization level.
+
+        This API requires a full or read-only administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param play_list_id: Unique identifier of an announcement playlist.
+        :type play_list_id: str
+        :param org_id: Get an announcement playlist in this organization.
+        :type org_id: str
+        :rtype: :class:`PlayList`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{play_list_id}')
+        data = await super().get(url, params=params)
+        r = PlayList.model_validate(data)
+        return r
+
+    async def modify(self, play_list_id: str, name: str = None, announcement_ids: List[str] = None, org_id: str = None):
+        """
+        Modify announcement playlist at organization level
+
+        Modify an existing announcement playlist at an organization level.
+
+        This API requires a full administrator auth token with a scope of `spark-admin:telephony_config_write`.
+
+        :param play_list_id: Unique identifier of an announcement playlist.
+        :type play_list_id: str
+        :param name: Unique name for the announcement playlist.
+        :type name: str
+        :param announcement_ids: Array of `announcementIds` associated with the playlist.
+        :type announcement_ids: list[str]
+        :param org_id: Modify an announcement playlist in this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        if name is not None:
+            body['name'] = name
+        if announcement_ids is not None:
+            body['announcementIds'] = announcement_ids
+        url = self.ep(f'{play_list_id}')
+        await super().put(url, params=params, json=body)
+
+    async def delete(self, play_list_id: str, org_id: str = None):
+        """
+        Delete an announcement playlist for an organization.
+
+        This API requires a full administrator auth token with a scope of `spark-admin:telephony_config_write`.
+
+        :param play_list_id: Unique identifier of an announcement playlist.
+        :type play_list_id: str
+        :param org_id: Delete an announcement playlist in this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{play_list_id}')
+        await super().delete(url, params=params)
+
+    async def assigned_locations(self, play_list_id: str, org_id: str = None) -> List[IdAndName]:
+        """
+        Fetch list of locations which are assigned to the announcement playlist
+
+        Fetch list of locations which are assigned to the given announcement playlist
+
+        This API requires a full or read-only administrator or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param play_list_id: Unique identifier of playlist.
+        :type play_list_id: str
+        :param org_id: Get location associated to a playlist in this organization.
+        :type org_id: str
+        :rtype: :class:`PlayListAssignedLocations`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{play_list_id}/locations')
+        data = await super().get(url, params=params)
+        r = type_adapter(list[IdAndName]).validate_python(data['locations'])
+        return r
+
+    async def modify_assigned_locations(self, play_list_id: str, location_ids: List[str], org_id: str = None):
+        """
+        Modify list of assigned locations to the announcement playlist
+
+        Modify list of assigned locations or add new locations to the announcement playlist. This will assing the
+        playlist to the location's music on hold.
+
+        This API requires a full administrator auth token with a scope of `spark-admin:telephony_config_write`.
+
+        :param play_list_id: Unique identifier of an announcement playlist.
+        :type play_list_id: str
+        :param location_ids: Array of location IDs with which the playlist is associated.
+        :type location_ids: list[str]
+        :param org_id: Modify an assign location for announcement playlist for organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['locationIds'] = location_ids
+        url = self.ep(f'{play_list_id}/locations')
+        await super().put(url, params=params, json=body)
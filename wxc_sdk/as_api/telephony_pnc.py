@@ -0,0 +1,79 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.pnc import NetworkConnectionType
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsPrivateNetworkConnectApi']
+
+
+class AsPrivateNetworkConnectApi(AsApiChild, base='telephony/config/locations'):
+    """
+    API for location private network connect API settings
+    """
+
+    async def read(self, location_id: str, org_id: str = None) -> NetworkConnectionType:
+        """
+        Get Private Network Connect
+
+        Retrieve the location's network connection type.
+
+        Network Connection Type determines if the location's network connection is public or private.
+
+        Retrieving location's network connection type requires a full, user or read-only administrator auth token with
+        a scope of spark-admin:telephony_config_read.
+
+        :param location_id: Retrieve network connection type for this location.
+        :type location_id: str
+        :param org_id: Retrieve network connection type for this organization.
+        :type org_id: str
+        :return: location PNC settings
+        :rtype: NetworkConnectionType
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.session.ep(f'telephony/config/locations/{location_id}/privateNetworkConnect')
+        data = await self.get(url, params=params)
+        return type_adapter(NetworkConnectionType).validate_python(data['networkConnectionType'])
+
+    async def update(self, location_id: str, connection_type: NetworkConnectionType, org_id: str = None):
+        """
+        Get Private Network Connect
+
+        Retrieve the location's network connection type.
+
+        Network Connection Type determines if the location's network connection is public or private.
+
+        Retrieving location's network connection type requires a full, user or read-only administrator auth token with
+        a scope of spark-admin:telephony_config_read.
+
+        :param location_id: Update network connection type for this location.
+        :type location_id: str
+        :param connection_type: Network Connection Type for the location.
+        :type connection_type: NetworkConnectionType
+        :param org_id: Update network connection type for this organization.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.session.ep(f'telephony/config/locations/{location_id}/privateNetworkConnect')
+        body = {'networkConnectionType': connection_type.value}
+        await self.put(url, json=body, params=params)
@@ -0,0 +1,80 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.prem_pstn import DialPatternValidationResult
+from wxc_sdk.as_api.api_child import AsApiChild
+from wxc_sdk.as_api.telephony_prem_pstn_dial_plan import AsDialPlanApi
+from wxc_sdk.as_api.telephony_prem_pstn_route_group import AsRouteGroupApi
+from wxc_sdk.as_api.telephony_prem_pstn_route_list import AsRouteListApi
+from wxc_sdk.as_api.telephony_prem_pstn_trunk import AsTrunkApi
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsPremisePstnApi']
+
+
+@dataclass(init=False, repr=False)
+class AsPremisePstnApi(AsApiChild, base='telephony/config/premisePstn'):
+    """
+    Premises PSTN API
+    """
+    #: dial plan configuration
+    dial_plan: AsDialPlanApi
+    #: trunk configuration
+    trunk: AsTrunkApi
+    #: route group configuration
+    route_group: AsRouteGroupApi
+    #: route list configuration
+    route_list: AsRouteListApi
+
+    def __init__(self, session: AsRestSession):
+        super().__init__(session=session)
+        self.dial_plan = AsDialPlanApi(session=session)
+        self.trunk = AsTrunkApi(session=session)
+        self.route_group = AsRouteGroupApi(session=session)
+        self.route_list = AsRouteListApi(session=session)
+
+    async def validate_pattern(self, dial_patterns: Union[str, List[str]], org_id: str = None) -> DialPatternValidationResult:
+        """
+        Validate a Dial Pattern.
+
+        Dial plans route calls to on-premises destinations by use of trunks or route groups. They are configured
+        globally for an enterprise and apply to all users, regardless of location. A dial plan also specifies the
+        routing choice (trunk or route group) for calls that match any of its dial patterns. Specific dial patterns
+        can be defined as part of your dial plan.
+
+        Validating a dial pattern requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param dial_patterns: Array of dial patterns.
+        :type dial_patterns: list[str] or str
+        :param org_id: Organization to which dial plan belongs.
+        :return: validation result
+        :rtype: :class:`DialPatternValidationResult`
+        """
+        if isinstance(dial_patterns, str):
+            dial_patterns = [dial_patterns]
+
+        url = self.ep('actions/validateDialPatterns/invoke')
+        params = org_id and {'orgId': org_id} or None
+        body = {'dialPatterns': dial_patterns}
+        data = await self.post(url=url, params=params, json=body)
+        return DialPatternValidationResult.model_validate(data)
@@ -0,0 +1,310 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.prem_pstn.dial_plan import ApiModel, CreateResponse, DialPlan, PatternAndAction, RouteType
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsDialPlanApi']
+
+
+@dataclass(init=False, repr=False)
+class AsDialPlanApi(AsApiChild, base='telephony/config/premisePstn/dialPlans'):
+
+    def list_gen(self, dial_plan_name: str = None, route_group_name: str = None, trunk_name: str = None,
+             order: str = None, org_id: str = None, **params) -> AsyncGenerator[DialPlan, None, None]:
+        """
+        List all Dial Plans for the organization.
+
+        Dial plans route calls to on-premises destinations by use of the trunks or route groups with which the dial
+        plan is associated. Multiple dial patterns can be defined as part of your dial plan. Dial plans are configured
+        globally for an enterprise and apply to all users, regardless of location.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param dial_plan_name: Return the list of dial plans matching the dial plan name.
+        :type dial_plan_name: str
+        :param route_group_name: Return the list of dial plans matching the route group name.
+        :type route_group_name: str
+        :param trunk_name: Return the list of dial plans matching the trunk name.
+        :type trunk_name: str
+        :param order: Order the dial plans according to the designated fields. Available sort fields: name, routeName,
+            routeType. Sort order is ascending by default
+        :type order: str
+        :param org_id: List dial plans for this organization.
+        :type org_id: str
+        :return:
+        """
+        params.update((to_camel(p), v) for i, (p, v) in enumerate(locals().items())
+                      if i and v is not None and p != 'params')
+        url = self.ep()
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=DialPlan, params=params, item_key='dialPlans')
+
+    async def list(self, dial_plan_name: str = None, route_group_name: str = None, trunk_name: str = None,
+             order: str = None, org_id: str = None, **params) -> List[DialPlan]:
+        """
+        List all Dial Plans for the organization.
+
+        Dial plans route calls to on-premises destinations by use of the trunks or route groups with which the dial
+        plan is associated. Multiple dial patterns can be defined as part of your dial plan. Dial plans are configured
+        globally for an enterprise and apply to all users, regardless of location.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param dial_plan_name: Return the list of dial plans matching the dial plan name.
+        :type dial_plan_name: str
+        :param route_group_name: Return the list of dial plans matching the route group name.
+        :type route_group_name: str
+        :param trunk_name: Return the list of dial plans matching the trunk name.
+        :type trunk_name: str
+        :param order: Order the dial plans according to the designated fields. Available sort fields: name, routeName,
+            routeType. Sort order is ascending by default
+        :type order: str
+        :param org_id: List dial plans for this organization.
+        :type org_id: str
+        :return:
+        """
+        params.update((to_camel(p), v) for i, (p, v) in enumerate(locals().items())
+                      if i and v is not None and p != 'params')
+        url = self.ep()
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=DialPlan, params=params, item_key='dialPlans')]
+
+    async def create(self, name: str, route_id: str, route_type: RouteType, dial_patterns: List[str] = None,
+               org_id: str = None) -> CreateResponse:
+        """
+        Create a Dial Plan for the organization.
+
+        Dial plans route calls to on-premises destinations by use of trunks or route groups. They are configured
+        globally for an enterprise and apply to all users, regardless of location. A dial plan also specifies the
+        routing choice (trunk or route group) for calls that match any of its dial patterns. Specific dial patterns
+        can be defined as part of your dial plan.
+
+        Creating a dial plan requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param name: A unique name for the dial plan.
+        :type name: str
+        :param route_id: ID of route type associated with the dial plan.
+        :type route_id: str
+        :param route_type: Route Type associated with the dial plan.
+        :type route_type: :class:`wxc_sdk.common.RouteType`
+        :param dial_patterns: An Array of dial patterns
+        :type dial_patterns: list[str]
+        :param org_id: Organization to which dial plan belongs.
+        :type org_id: str
+        :return: result of dial plan creation
+        :rtype: :class:`CreateResponse`
+        """
+        url = self.ep()
+        params = org_id and {'orgId': org_id} or None
+        body = {
+            'name': name,
+            'routeId': route_id,
+            'routeType': route_type.value if isinstance(route_type, RouteType) else route_type,
+            'dialPatterns': dial_patterns or []
+        }
+        data = await self.post(url=url, params=params, json=body)
+        return CreateResponse.model_validate(data)
+
+    async def details(self, dial_plan_id: str, org_id: str = None) -> DialPlan:
+        """
+        Get a Dial Plan for the organization.
+
+        Dial plans route calls to on-premises destinations by use of trunks or route groups. They are configured
+        globally for an enterprise and apply to all users, regardless of location. A dial plan also specifies the
+        routing choice (trunk or route group) for calls that match any of its dial patterns. Specific dial patterns
+        can be defined as part of your dial plan.
+
+        Retrieving a dial plan requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param dial_plan_id: ID of the dial plan.
+        :type dial_plan_id: str
+        :param org_id: Organization to which dial plan belongs.
+        :type org_id: str
+        :return: dial plan details
+        :rtype: :class:`DialPlan`
+        """
+        url = self.ep(dial_plan_id)
+        params = org_id and {'orgId': org_id} or None
+        data = await self.get(url=url, params=params)
+        dp: DialPlan = DialPlan.model_validate(data)
+        dp.dial_plan_id = dial_plan_id
+        return dp
+
+    async def update(self, update: DialPlan, org_id: str = None):
+        """
+        Modify a Dial Plan for the organization.
+
+        Dial plans route calls to on-premises destinations by use of trunks or route groups. They are configured
+        globally for an enterprise and apply to all users, regardless of location. A dial plan also specifies the
+        routing choice (trunk or route group) for calls that match any of its dial patterns. Specific dial patterns
+        can be defined as part of your dial plan.
+
+        Modifying a dial plan requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param update: DialPlan objects with updated settings. Only name, route_id and route_type are considered. All
+            three need to be set
+        :param org_id: Organization to which dial plan belongs.
+        :type org_id: str
+        """
+        url = self.ep(update.dial_plan_id)
+        params = org_id and {'orgId': org_id} or None
+        body = update.model_dump_json(include={'name', 'route_id', 'route_type'})
+        await self.put(url=url, params=params, data=body)
+
+    async def delete_dial_plan(self, dial_plan_id: str, org_id: str = None):
+        """
+        Delete a Dial Plan for the organization.
+
+        Dial plans route calls to on-premises destinations by use of trunks or route groups. They are configured
+        globally for an enterprise and apply to all users, regardless of location. A dial plan also specifies the
+        routing choice (trunk or route group) for calls that match any of its dial patterns. Specific dial patterns
+        can be defined as part of your dial plan.
+
+        Deleting a dial plan requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param dial_plan_id: ID of the dial plan.
+        :type dial_plan_id: str
+        :param org_id: Organization to which dial plan belongs.
+        :type org_id: str
+        """
+        url = self.ep(dial_plan_id)
+        params = org_id and {'orgId': org_id} or None
+        await self.delete(url=url, params=params)
+
+    def patterns_gen(self, dial_plan_id: str, org_id: str = None,
+                 dial_pattern: str = None, **params) -> AsyncGenerator[str, None, None]:
+        """
+        List all Dial Patterns for the organization.
+
+        Dial plans route calls to on-premises destinations by use of trunks or route groups. They are configured
+        globally for an enterprise and apply to all users, regardless of location. A dial plan also specifies the
+        routing choice (trunk or route group) for calls that match any of its dial patterns. Specific dial patterns
+        can be defined as part of your dial plan.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param dial_plan_id: ID of the dial plan.
+        :type dial_plan_id: str
+        :param org_id: List dial patterns associated with a dial plan.
+        :type org_id: str
+        :param dial_pattern: An enterprise dial pattern is represented by a sequence of digits (1-9), followed by
+            optional wildcard characters. Valid wildcard characters are ! (matches any sequence of digits) and
+            X (matches a single digit, 0-9).
+            The ! wildcard can only occur once at the end and only in an E.164 pattern
+        :return: list of patterns
+        :rtype: list[str]
+        """
+        params.update((to_camel(p), v) for i, (p, v) in enumerate(locals().items())
+                      if i > 1 and v is not None and p != 'params')
+        url = self.ep(f'{dial_plan_id}/dialPatterns')
+
+        return self.session.follow_pagination(url=url, params=params, item_key='dialPatterns')
+
+    async def patterns(self, dial_plan_id: str, org_id: str = None,
+                 dial_pattern: str = None, **params) -> List[str]:
+        """
+        List all Dial Patterns for the organization.
+
+        Dial plans route calls to on-premises destinations by use of trunks or route groups. They are configured
+        globally for an enterprise and apply to all users, regardless of location. A dial plan also specifies the
+        routing choice (trunk or route group) for calls that match any of its dial patterns. Specific dial patterns
+        can be defined as part of your dial plan.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param dial_plan_id: ID of the dial plan.
+        :type dial_plan_id: str
+        :param org_id: List dial patterns associated with a dial plan.
+        :type org_id: str
+        :param dial_pattern: An enterprise dial pattern is represented by a sequence of digits (1-9), followed by
+            optional wildcard characters. Valid wildcard characters are ! (matches any sequence of digits) and
+            X (matches a single digit, 0-9).
+            The ! wildcard can only occur once at the end and only in an E.164 pattern
+        :return: list of patterns
+        :rtype: list[str]
+        """
+        params.update((to_camel(p), v) for i, (p, v) in enumerate(locals().items())
+                      if i > 1 and v is not None and p != 'params')
+        url = self.ep(f'{dial_plan_id}/dialPatterns')
+
+        return [o async for o in self.session.follow_pagination(url=url, params=params, item_key='dialPatterns')]
+
+    async def modify_patterns(self, dial_plan_id: str, dial_patterns: List[PatternAndAction], org_id: str = None):
+        """
+        Modify dial patterns for the Dial Plan.
+
+        Dial plans route calls to on-premises destinations by use of trunks or route groups. They are configured
+        globally for an enterprise and apply to all users, regardless of location. A dial plan also specifies the
+        routing choice (trunk or route group) for calls that match any of its dial patterns. Specific dial patterns
+        can be defined as part of your dial plan.
+
+        Modifying a dial pattern requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param dial_plan_id: ID of the dial plan being modified.
+        :type dial_plan_id: str
+        :param dial_patterns: Array of dial patterns to add or delete. Dial Pattern that is not present in the
+            request is not modified.
+        :type dial_patterns: :class:`PatternAndAction`
+        :param org_id: Organization to which dial plan belongs.
+        :type org_id: str
+        """
+        url = self.ep(f'{dial_plan_id}/dialPatterns')
+        params = org_id and {'orgId': org_id} or None
+
+        class Body(ApiModel):
+            dial_patterns: list[PatternAndAction]
+
+        body = Body(dial_patterns=dial_patterns).model_dump_json()
+        await self.put(url=url, params=params, data=body)
+
+    async def delete_all_patterns(self, dial_plan_id: str, org_id: str = None):
+        """
+        Delete all dial patterns from the Dial Plan.
+
+        Dial plans route calls to on-premises destinations by use of trunks or route groups. They are configured
+        globally for an enterprise and apply to all users, regardless of location. A dial plan also specifies the
+        routing choice (trunk or route group) for calls that match any of its dial patterns. Specific dial patterns
+        can be defined as part of your dial plan.
+
+        Deleting dial pattern requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param dial_plan_id: ID of the dial plan being modified.
+        :type dial_plan_id: str
+        :param org_id: Organization to which dial plan belongs.
+        :type org_id: str
+        """
+        url = self.ep(f'{dial_plan_id}/dialPatterns')
+        params = org_id and {'orgId': org_id} or None
+        body = {'deleteAllDialPatterns': True}
+        await self.put(url=url, params=params, json=body)
@@ -0,0 +1,364 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.prem_pstn.route_group import IdAndName, RouteGroup, RouteGroupUsage, UsageRouteLists
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsRouteGroupApi']
+
+
+@dataclass(init=False, repr=False)
+class AsRouteGroupApi(AsApiChild, base='telephony/config/premisePstn/routeGroups'):
+    """
+    API for everything route groups
+    """
+
+    def list_gen(self, name: str = None, order: str = None,
+             org_id: str = None, **params) -> AsyncGenerator[RouteGroup, None, None]:
+        """
+        List all Route Groups for an organization. A Route Group is a group of trunks that allows further scale and
+        redundancy with the connection to the premises.
+
+        Retrieving this route group list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param name: Return the list of route groups matching the route group name.
+        :type name: st
+        :param order: Order the route groups according to designated fields. Available sort orders: asc, desc.
+        :type order: str
+        :param org_id: List route groups for this organization.
+        :type org_id: str
+        :return: generator of :class:`RouteGroup` instances
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'params'})
+        url = self.ep()
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, params=params, model=RouteGroup)
+
+    async def list(self, name: str = None, order: str = None,
+             org_id: str = None, **params) -> List[RouteGroup]:
+        """
+        List all Route Groups for an organization. A Route Group is a group of trunks that allows further scale and
+        redundancy with the connection to the premises.
+
+        Retrieving this route group list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param name: Return the list of route groups matching the route group name.
+        :type name: st
+        :param order: Order the route groups according to designated fields. Available sort orders: asc, desc.
+        :type order: str
+        :param org_id: List route groups for this organization.
+        :type org_id: str
+        :return: generator of :class:`RouteGroup` instances
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'params'})
+        url = self.ep()
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, params=params, model=RouteGroup)]
+
+    async def create(self, route_group: RouteGroup, org_id: str = None) -> str:
+        """
+        Creates a Route Group for the organization.
+
+        A Route Group is a collection of trunks that allows further scale and redundancy with the connection to the
+        premises. Route groups can include up to 10 trunks from different locations.
+
+        Creating a Route Group requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param route_group: settings for new route group. name and local_gateways need to be set. For each LGW
+            id and priority need to be set.
+            Example:
+
+            .. code-block:: python
+
+                rg = RouteGroup(name=rg_name,
+                        local_gateways=[RGTrunk(trunk_id=trunk.trunk_id,
+                                                priority=1)])
+                rg_id = api.telephony.prem_pstn.route_group.create(route_group=rg)
+        :type route_group: :class:`RouteGroup`
+        :param org_id:
+        :type org_id: str
+        :return: id of new route group
+        :rtype: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        body = route_group.model_dump_json(include={'name': True,
+                                                    'local_gateways': {'__all__': {'trunk_id', 'priority'}}})
+        url = self.ep()
+        data = await self.post(url=url, params=params, data=body)
+        return data['id']
+
+    async def details(self, rg_id: str, org_id: str = None) -> RouteGroup:
+        """
+        Reads a Route Group for the organization based on id.
+
+        A Route Group is a collection of trunks that allows further scale and redundancy with the connection to the
+        premises. Route groups can include up to 10 trunks from different locations.
+
+        Reading a Route Group requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param rg_id: Route Group for which details are being requested.
+        :type rg_id: str
+        :param org_id: Organization of the Route Group.
+        :type org_id: str
+        :return: route group details
+        :rtype: :class:`RouteGroup`
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep(rg_id)
+        data = await self.get(url=url, params=params)
+        return RouteGroup.model_validate(data)
+
+    async def update(self, rg_id: str, update: RouteGroup, org_id: str = None):
+        """
+        Modifies an existing Route Group for an organization based on id.
+
+        A Route Group is a collection of trunks that allows further scale and redundancy with the connection to the
+        premises. Route groups can include up to 10 trunks from different locations.
+
+        Modifying a Route Group requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param rg_id: route group to be modified
+        :type rg_id: str
+        :param update: new settings
+        :type update: :class:`RouteGroup`
+        :param org_id: Organization of the Route Group.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        body = update.model_dump_json(include={'name': True,
+                                               'local_gateways': {'__all__': {'trunk_id', 'priority'}}})
+        url = self.ep(rg_id)
+        await self.put(url=url, params=params, data=body)
+
+    async def delete_route_group(self, rg_id: str, org_id: str = None):
+        """
+        Remove a Route Group from an Organization based on id.
+
+        A Route Group is a collection of trunks that allows further scale and redundancy with the connection to the
+        premises. Route groups can include up to 10 trunks from different locations.
+
+        Removing a Route Group requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param rg_id: Route Group to be deleted
+        :type rg_id: str
+        :param org_id: Organization of the Route Group.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep(rg_id)
+        await self.delete(url=url, params=params)
+
+    async def usage(self, rg_id: str, org_id: str = None) -> RouteGroupUsage:
+        """
+        List the number of "Call to" on-premises Extensions, Dial Plans, PSTN Connections, and Route Lists used by a
+        specific Route Group. Users within Call to Extension locations are registered to a PBX which allows you to
+        route unknown extensions (calling number length of 2-6 digits) to the PBX using an existing Trunk or Route
+        Group. PSTN Connections may be cisco PSTN, cloud-connected PSTN, or premises-based PSTN (local gateway).
+        Dial Plans allow you to route calls to on-premises extensions via your trunk or route group. Route Lists are
+        a list of numbers that can be reached via a route group. It can be used to provide cloud PSTN connectivity to
+        Webex Calling Dedicated Instance.
+
+        Retrieving usage information requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param rg_id: Route group requested for information.
+        :type rg_id: str
+        :param org_id: Organization associated with specific route group
+        :type org_id: str
+        :return: usage information
+        :rtype: :class:`RouteGroupUsage`
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep(f'{rg_id}/usage')
+        data = await self.get(url=url, params=params)
+        return RouteGroupUsage.model_validate(data)
+
+    def usage_call_to_extension_gen(self, rg_id: str, org_id: str = None, **params) -> AsyncGenerator[IdAndName, None, None]:
+        """
+        List "Call to" on-premises Extension Locations for a specific route group. Users within these locations are
+        registered to a PBX which allows you to route unknown extensions (calling number length of 2-6 digits) to
+        the PBX using an existing trunk or route group.
+
+        Retrieving this location list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param rg_id: Route group requested for information.
+        :param org_id: Organization associated with specific route group.
+        :return: generator of instances
+        :rtype: :class:`wxc_sdk.common.IdAndName`
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'rg_id', 'params'})
+        url = self.ep(f'{rg_id}/usageCallToExtension')
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=IdAndName, params=params)
+
+    async def usage_call_to_extension(self, rg_id: str, org_id: str = None, **params) -> List[IdAndName]:
+        """
+        List "Call to" on-premises Extension Locations for a specific route group. Users within these locations are
+        registered to a PBX which allows you to route unknown extensions (calling number length of 2-6 digits) to
+        the PBX using an existing trunk or route group.
+
+        Retrieving this location list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param rg_id: Route group requested for information.
+        :param org_id: Organization associated with specific route group.
+        :return: generator of instances
+        :rtype: :class:`wxc_sdk.common.IdAndName`
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'rg_id', 'params'})
+        url = self.ep(f'{rg_id}/usageCallToExtension')
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=IdAndName, params=params)]
+
+    def usage_dial_plan_gen(self, rg_id: str, org_id: str = None, **params) -> AsyncGenerator[IdAndName, None, None]:
+        """
+        List Dial Plan Locations for a specific route group.
+
+        Dial Plans allow you to route calls to on-premises destinations by use of trunks or route groups. They are
+        configured globally for an enterprise and apply to all users, regardless of location. A Dial Plan also
+        specifies the routing choice (trunk or route group) for calls that match any of its dial patterns.
+        Specific dial patterns can be defined as part of your dial plan.
+
+        Retrieving this location list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param rg_id: Route group requested for information.
+        :param org_id: Organization associated with specific route group.
+        :return: generator of instances
+        :rtype: :class:`wxc_sdk.common.IdAndName`
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'rg_id', 'params'})
+        url = self.ep(f'{rg_id}/usageDialPlan')
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=IdAndName, params=params)
+
+    async def usage_dial_plan(self, rg_id: str, org_id: str = None, **params) -> List[IdAndName]:
+        """
+        List Dial Plan Locations for a specific route group.
+
+        Dial Plans allow you to route calls to on-premises destinations by use of trunks or route groups. They are
+        configured globally for an enterprise and apply to all users, regardless of location. A Dial Plan also
+        specifies the routing choice (trunk or route group) for calls that match any of its dial patterns.
+        Specific dial patterns can be defined as part of your dial plan.
+
+        Retrieving this location list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param rg_id: Route group requested for information.
+        :param org_id: Organization associated with specific route group.
+        :return: generator of instances
+        :rtype: :class:`wxc_sdk.common.IdAndName`
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'rg_id', 'params'})
+        url = self.ep(f'{rg_id}/usageDialPlan')
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=IdAndName, params=params)]
+
+    def usage_location_pstn_gen(self, rg_id: str, org_id: str = None, **params) -> AsyncGenerator[IdAndName, None, None]:
+        """
+        List PSTN Connection Locations for a specific route group. This solution lets you configure users to use Cloud
+        PSTN (CCP or Cisco PSTN) or Premises-based PSTN.
+
+        Retrieving this Location list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param rg_id: Route group requested for information.
+        :param org_id: Organization associated with specific route group.
+        :return: generator of instances
+        :rtype: :class:`wxc_sdk.common.IdAndName`
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'rg_id', 'params'})
+        url = self.ep(f'{rg_id}/usagePstnConnection')
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=IdAndName, params=params)
+
+    async def usage_location_pstn(self, rg_id: str, org_id: str = None, **params) -> List[IdAndName]:
+        """
+        List PSTN Connection Locations for a specific route group. This solution lets you configure users to use Cloud
+        PSTN (CCP or Cisco PSTN) or Premises-based PSTN.
+
+        Retrieving this Location list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param rg_id: Route group requested for information.
+        :param org_id: Organization associated with specific route group.
+        :return: generator of instances
+        :rtype: :class:`wxc_sdk.common.IdAndName`
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'rg_id', 'params'})
+        url = self.ep(f'{rg_id}/usagePstnConnection')
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=IdAndName, params=params)]
+
+    def usage_route_lists_gen(self, rg_id: str, org_id: str = None, **params) -> AsyncGenerator[UsageRouteLists, None, None]:
+        """
+        List Route Lists for a specific route group. Route Lists are a list of numbers that can be reached via a
+        Route Group. It can be used to provide cloud PSTN connectivity to Webex Calling Dedicated Instance.
+
+        Retrieving this list of Route Lists requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param rg_id: Route group requested for information.
+        :param org_id: Organization associated with specific route group.
+        :return: generator of instances
+        :rtype: :class:`wxc_sdk.common.IdAndName`
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'rg_id', 'params'})
+        url = self.ep(f'{rg_id}/usageRouteList')
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=UsageRouteLists, params=params)
+
+    async def usage_route_lists(self, rg_id: str, org_id: str = None, **params) -> List[UsageRouteLists]:
+        """
+        List Route Lists for a specific route group. Route Lists are a list of numbers that can be reached via a
+        Route Group. It can be used to provide cloud PSTN connectivity to Webex Calling Dedicated Instance.
+
+        Retrieving this list of Route Lists requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param rg_id: Route group requested for information.
+        :param org_id: Organization associated with specific route group.
+        :return: generator of instances
+        :rtype: :class:`wxc_sdk.common.IdAndName`
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'rg_id', 'params'})
+        url = self.ep(f'{rg_id}/usageRouteList')
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=UsageRouteLists, params=params)]
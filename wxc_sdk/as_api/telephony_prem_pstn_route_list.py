@@ -0,0 +1,285 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.prem_pstn.route_list import NumberAndAction, RouteList, RouteListDetail, \
+    UpdateNumbersResponse
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsRouteListApi']
+
+
+@dataclass(init=False, repr=False)
+class AsRouteListApi(AsApiChild, base='telephony/config/premisePstn/routeLists'):
+    """
+    API for everything route lists
+    """
+
+    def list_gen(self, name: list[str] = None, location_id: list[str] = None, order: str = None,
+             org_id: str = None, **params) -> AsyncGenerator[RouteList, None, None]:
+        """
+        List all Route Lists for the organization.
+
+        A Route List is a list of numbers that can be reached via a Route Group. It can be used to provide cloud PSTN
+        connectivity to Webex Calling Dedicated Instance.
+
+        Retrieving the Route List requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param name: Return the list of Route List matching the route list name.
+        :type name: str
+        :param location_id: Return the list of Route Lists matching the location id.
+        :type location_id: str
+        :param order: Order the Route List according to the designated fields.Available sort fields: name, locationId.
+            Sort order is ascending by default
+        :type order: str
+        :param org_id: List all Route List for this organization.
+        :type org_id: str
+        :return: generator yielding :class:`RouteList` instances
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'params'})
+        url = self.ep()
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, params=params, model=RouteList)
+
+    async def list(self, name: list[str] = None, location_id: list[str] = None, order: str = None,
+             org_id: str = None, **params) -> List[RouteList]:
+        """
+        List all Route Lists for the organization.
+
+        A Route List is a list of numbers that can be reached via a Route Group. It can be used to provide cloud PSTN
+        connectivity to Webex Calling Dedicated Instance.
+
+        Retrieving the Route List requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param name: Return the list of Route List matching the route list name.
+        :type name: str
+        :param location_id: Return the list of Route Lists matching the location id.
+        :type location_id: str
+        :param order: Order the Route List according to the designated fields.Available sort fields: name, locationId.
+            Sort order is ascending by default
+        :type order: str
+        :param org_id: List all Route List for this organization.
+        :type org_id: str
+        :return: generator yielding :class:`RouteList` instances
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'params'})
+        url = self.ep()
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, params=params, model=RouteList)]
+
+    async def create(self, name: str, location_id: str, rg_id: str, org_id: str = None) -> str:
+        """
+        Create a Route List for the organization.
+
+        A Route List is a list of numbers that can be reached via a Route Group. It can be used to provide cloud PSTN
+        connectivity to Webex Calling Dedicated Instance.
+
+        Creating a Route List requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param name: Name of the Route List
+        :type name: str
+        :param location_id: Location associated with the Route List.
+        :type location_id: str
+        :param rg_id: UUID of the route group associated with Route List.
+        :type rg_id: str
+        :param org_id: Organization to which Route List belongs.
+        :type org_id: str
+        :return: ID of the newly route list created.
+        :rtype: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        body = {'name': name,
+                'locationId': location_id,
+                'routeGroupId': rg_id}
+        url = self.ep()
+        data = await self.post(url=url, params=params, json=body)
+        return data['id']
+
+    async def details(self, rl_id: str, org_id: str = None) -> RouteListDetail:
+        """
+        Get Route List Details.
+
+        A Route List is a list of numbers that can be reached via a Route Group. It can be used to provide cloud PSTN
+        connectivity to Webex Calling Dedicated Instance.
+
+        Retrieving a Route List requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param rl_id: ID of the Route List.
+        :type rl_id: str
+        :param org_id: Organization to which Route List belongs.
+        :type org_id: str
+        :return: route list details
+        :rtype: :class:`RouteListDetail`
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep(rl_id)
+        data = await self.get(url=url, params=params)
+        return RouteListDetail.model_validate(data)
+
+    async def update(self, rl_id: str, name: str, rg_id: str, org_id: str = None):
+        """
+        Modify the details for a Route List.
+
+        A Route List is a list of numbers that can be reached via a Route Group. It can be used to provide cloud PSTN
+        connectivity to Webex Calling Dedicated Instance.
+
+        Retrieving a Route List requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param rl_id: ID of the Route List.
+        :type rl_id: str
+        :param name: Route List new name.
+        :type name: str
+        :param rg_id: New route group id.
+        :type rg_id: str
+        :param org_id: Organization to which Route List belongs.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        body = {'name': name,
+                'routeGroupId': rg_id}
+        url = self.ep(rl_id)
+        await self.put(url=url, params=params, json=body)
+
+    async def delete_route_list(self, rl_id: str, org_id: str = None):
+        """
+        Delete Route List for a Customer
+
+        A Route List is a list of numbers that can be reached via a Route Group. It can be used to provide cloud PSTN
+        connectivity to Webex Calling Dedicated Instance.
+
+        Deleting a Route List requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param rl_id: ID of the Route List.
+        :type rl_id: str
+        :param org_id: Organization to which Route List belongs.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep(rl_id)
+        await self.delete(url=url, params=params)
+
+    def numbers_gen(self, rl_id: str, order: str = None, number: str = None,
+                org_id: str = None, **params) -> AsyncGenerator[str, None, None]:
+        """
+        Get numbers assigned to a Route List
+
+        A Route List is a list of numbers that can be reached via a Route Group. It can be used to provide cloud PSTN
+        connectivity to Webex Calling Dedicated Instance.
+
+        Retrieving a Route List requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param rl_id: ID of the Route List.
+        :type rl_id: str
+        :param order: Order the Route Lists according to number.
+        :type order: str
+        :param number: Number assigned to the route list.
+        :type number: str
+        :param org_id: Organization to which Route List belongs.
+        :type org_id: str
+        :return: generator yielding str
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'params', 'rl_id'})
+        url = self.ep(f'{rl_id}/numbers')
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, params=params)
+
+    async def numbers(self, rl_id: str, order: str = None, number: str = None,
+                org_id: str = None, **params) -> List[str]:
+        """
+        Get numbers assigned to a Route List
+
+        A Route List is a list of numbers that can be reached via a Route Group. It can be used to provide cloud PSTN
+        connectivity to Webex Calling Dedicated Instance.
+
+        Retrieving a Route List requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param rl_id: ID of the Route List.
+        :type rl_id: str
+        :param order: Order the Route Lists according to number.
+        :type order: str
+        :param number: Number assigned to the route list.
+        :type number: str
+        :param org_id: Organization to which Route List belongs.
+        :type org_id: str
+        :return: generator yielding str
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'params', 'rl_id'})
+        url = self.ep(f'{rl_id}/numbers')
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, params=params)]
+
+    async def update_numbers(self, rl_id: str, numbers: List[NumberAndAction] = None,
+                       delete_all_numbers: bool = None,
+                       org_id: str = None) -> List[UpdateNumbersResponse]:
+        """
+        Modify numbers for a specific Route List of a Customer.
+
+        A Route List is a list of numbers that can be reached via a Route Group. It can be used to provide cloud PSTN
+        connectivity to Webex Calling Dedicated Instance.
+
+        Retrieving a Route List requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param rl_id: ID of the Route List.
+        :type rl_id: str
+        :param numbers: Array of the numbers to be deleted/added.
+        :type numbers: list[:class:`NumberAndAction`]
+        :param delete_all_numbers: If present, the numbers array is ignored and all numbers in the route list are
+            deleted.
+        :type delete_all_numbers: bool
+        :param org_id: Organization to which Route List belongs.
+        :type org_id: str
+        :return: list of update number status
+        :rtype: list[:class:`UpdateNumbersResponse`]
+        """
+        url = self.ep(f'{rl_id}/numbers')
+        params = org_id and {'orgId': org_id} or None
+
+        body = dict()
+        if numbers is not None:
+            body['numbers'] = type_adapter(list[NumberAndAction]).dump_python(numbers, mode='json', by_alias=True,
+                                                                              exclude_none=True)
+        if delete_all_numbers is not None:
+            body['deleteAllNumbers'] = delete_all_numbers
+        data = await self.put(url=url, params=params, json=body)
+        if data:
+            return type_adapter(list[UpdateNumbersResponse]).validate_python(data['numberStatus'])
+        else:
+            return []
+
+    async def delete_all_numbers(self, rl_id: str, org_id: str = None):
+        url = self.ep(f'{rl_id}/numbers')
+        params = org_id and {'orgId': org_id} or None
+        body = {'deleteAllNumbers': True}
+        await self.put(url=url, params=params, json=body)
@@ -0,0 +1,485 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.prem_pstn.trunk import IdAndName, Trunk, TrunkDetail, TrunkDeviceType, TrunkType, \
+    TrunkTypeWithDeviceType, TrunkUsage
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsTrunkApi']
+
+
+@dataclass(init=False, repr=False)
+class AsTrunkApi(AsApiChild, base='telephony/config/premisePstn/trunks'):
+    """
+    API for everything trunks
+    """
+
+    def list_gen(self, name: str = None, location_name: str = None, trunk_type: str = None, order: str = None,
+             org_id: str = None, **params) -> AsyncGenerator[Trunk, None, None]:
+        """
+        List all Trunks for the organization.
+
+        A Trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks that allow
+        ebex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param name: Return the list of trunks matching the local gateway names.
+        :type name: str
+        :param location_name: Return the list of trunks matching the location names.
+        :type location_name: str
+        :param trunk_type: Return the list of trunks matching the trunk type.
+        :type trunk_type: str
+        :param order: Order the trunks according to the designated fields. Available sort fields: name, locationName.
+            Sort order is ascending by default
+        :type order: str
+        :param org_id:
+        :type org_id: str
+        :return: generator of Trunk instances
+        :rtype: :class:`Trunk`
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'params'})
+        url = self.ep()
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, params=params, model=Trunk, item_key='trunks')
+
+    async def list(self, name: str = None, location_name: str = None, trunk_type: str = None, order: str = None,
+             org_id: str = None, **params) -> List[Trunk]:
+        """
+        List all Trunks for the organization.
+
+        A Trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks that allow
+        ebex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param name: Return the list of trunks matching the local gateway names.
+        :type name: str
+        :param location_name: Return the list of trunks matching the location names.
+        :type location_name: str
+        :param trunk_type: Return the list of trunks matching the trunk type.
+        :type trunk_type: str
+        :param order: Order the trunks according to the designated fields. Available sort fields: name, locationName.
+            Sort order is ascending by default
+        :type order: str
+        :param org_id:
+        :type org_id: str
+        :return: generator of Trunk instances
+        :rtype: :class:`Trunk`
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'params'})
+        url = self.ep()
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, params=params, model=Trunk, item_key='trunks')]
+
+    async def create(self, name: str, location_id: str, password: str, trunk_type: TrunkType = TrunkType.registering,
+               dual_identity_support_enabled: bool = None, device_type: TrunkDeviceType = None, address: str = None,
+               domain: str = None, port: int = None, max_concurrent_calls: int = None, org_id: str = None) -> str:
+        """
+        Create a Trunk for the organization.
+
+        A Trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks that allow
+        Webex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Creating a trunk requires a full administrator auth token with a scope of spark-admin:telephony_config_write.
+
+        :param name: A unique name for the trunk.
+        :type name: str
+        :param location_id: ID of location associated with the trunk.
+        :type location_id: str
+        :param password: A password to use on the trunk.
+        :type password: str
+        :param trunk_type: Trunk Type associated with the trunk.
+        :type trunk_type: :class:`TrunkType`
+        :param dual_identity_support_enabled: Dual Identity Support setting impacts the handling of the From header
+            and P-Asserted-Identity header when sending an initial SIP INVITE to the trunk for an outbound call.
+        :type dual_identity_support_enabled: bool
+        :param device_type: Device type associated with trunk.
+        :type device_type: :class:`TrunkDeviceType`
+        :param address: FQDN or SRV address. Required to create a static certificate-based trunk.
+        :type address: str
+        :param domain: Domain name. Required to create a static certificate based trunk.
+        :type domain: str
+        :param port: FQDN port. Required to create a static certificate-based trunk.
+        :type port: int
+        :param max_concurrent_calls: Max Concurrent call. Required to create a static certificate based trunk.
+        :type max_concurrent_calls: int
+        :param org_id: Organization to which trunk belongs.
+        :type org_id: str
+        :return: id of new trunk
+        :rtype: str
+        """
+        body = {to_camel(p): v for p, v in locals().items()
+                if p not in {'self', 'org_id'} and v is not None}
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep()
+        data = await self.post(url=url, params=params, json=body)
+        return data['id']
+
+    async def details(self, trunk_id: str, org_id: str = None) -> TrunkDetail:
+        """
+        Get a Trunk for the organization.
+
+        A Trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks that allow
+        Webex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Retrieving a trunk requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param trunk_id: ID of the trunk.
+        :type trunk_id: str
+        :param org_id: Organization to which trunk belongs.
+        :type org_id: str
+        :return: trunk details
+        :rtype: :class:`TrunkDetail`
+        """
+        url = self.ep(trunk_id)
+        params = org_id and {'orgId': org_id} or None
+        data = await self.get(url=url, params=params)
+        return TrunkDetail.model_validate(data)
+
+    async def update(self, trunk_id: str, name: str, location_id: str, password: str, trunk_type: TrunkType,
+               dual_identity_support_enabled: bool = None, max_concurrent_calls: int = None, org_id: str = None):
+        """
+        Modify a Trunk for the organization.
+
+        A Trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks that allow
+        Webex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Modifying a trunk requires a full administrator auth token with a scope of spark-admin:telephony_config_write.
+
+        :param trunk_id:
+        :type name: str
+        :param location_id: ID of location associated with the trunk.
+        :type location_id: str
+        :param password: A password to use on the trunk.
+        :type password: str
+        :param trunk_type: Trunk Type associated with the trunk.
+        :type trunk_type: :class:`TrunkType`
+        :param dual_identity_support_enabled: Dual Identity Support setting impacts the handling of the From header
+            and P-Asserted-Identity header when sending an initial SIP INVITE to the trunk for an outbound call.
+        :type dual_identity_support_enabled: bool
+        :param max_concurrent_calls: Max Concurrent call. Required to create a static certificate based trunk.
+        :type max_concurrent_calls: int
+        :param org_id: Organization to which trunk belongs.
+        :type org_id: str:return:
+        """
+        body = {to_camel(p): v for p, v in locals().items()
+                if p not in {'self', 'org_id'} and v is not None}
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep()
+        await self.put(url=url, params=params, json=body)
+
+    async def delete_trunk(self, trunk_id: str, org_id: str = None):
+        """
+        Delete a Trunk for the organization.
+
+        A Trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks that allow
+        Webex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Deleting a trunk requires a full administrator auth token with a scope of spark-admin:telephony_config_write.
+
+        :param trunk_id: ID of the trunk.
+        :type trunk_id: str
+        :param org_id: Organization to which trunk belongs.
+        :type org_id: str
+        """
+        url = self.ep(trunk_id)
+        params = org_id and {'orgId': org_id} or None
+        await self.delete(url=url, params=params)
+
+    async def trunk_types(self, org_id: str = None) -> List[TrunkTypeWithDeviceType]:
+        """
+        List all TrunkTypes with DeviceTypes for the organization.
+
+        A Trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks that allow
+        Webex Calling to distribute calls over multiple trunks or to provide redundancy. Trunk Types are Registering
+        or Certificate Based and are configured in CallManager.
+
+        Retrieving trunk types requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param org_id:
+        :return: trunk types
+        :rtype: list[:class:`TrunkTypeWithDeviceType`]
+        """
+        params = org_id and {'orgId': org_id} or None
+        ep = self.ep('trunkTypes')
+        data = await self.get(url=ep, params=params)
+        return type_adapter(list[TrunkTypeWithDeviceType]).validate_python(data['trunkTypes'])
+
+    async def usage(self, trunk_id: str, org_id: str = None) -> TrunkUsage:
+        """
+        Get Local Gateway Usage Count
+
+        A trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks that allow
+        Webex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Retrieving this information requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param trunk_id: ID of the trunk.
+        :type trunk_id: str
+        :param org_id: Organization to which trunk belongs.
+        :type org_id: str
+        :return: usage counts
+        :rtype: :class:`TrunkUsage`
+        """
+        url = self.ep(f'{trunk_id}/usage')
+        params = org_id and {'orgId': org_id} or None
+        data = await self.get(url=url, params=params)
+        return TrunkUsage.model_validate(data)
+
+    def usage_dial_plan_gen(self, trunk_id: str, org_id: str = None) -> AsyncGenerator[IdAndName, None, None]:
+        """
+        Get Local Gateway Dial Plan Usage for a Trunk.
+
+        A Trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks that allow
+        Webex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Retrieving this information requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param trunk_id: ID of the trunk.
+        :type trunk_id: str
+        :param org_id: Organization to which trunk belongs.
+        :type org_id: str
+        :return: id and name objects
+        """
+        params = {to_camel(p): v for p, v in locals().items()
+                  if v is not None and p not in {'self', 'trunk_id'}}
+        url = self.ep(f'{trunk_id}/usageDialPlan')
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=IdAndName, params=params)
+
+    async def usage_dial_plan(self, trunk_id: str, org_id: str = None) -> List[IdAndName]:
+        """
+        Get Local Gateway Dial Plan Usage for a Trunk.
+
+        A Trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks that allow
+        Webex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Retrieving this information requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param trunk_id: ID of the trunk.
+        :type trunk_id: str
+        :param org_id: Organization to which trunk belongs.
+        :type org_id: str
+        :return: id and name objects
+        """
+        params = {to_camel(p): v for p, v in locals().items()
+                  if v is not None and p not in {'self', 'trunk_id'}}
+        url = self.ep(f'{trunk_id}/usageDialPlan')
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=IdAndName, params=params)]
+
+    def usage_location_pstn_gen(self, trunk_id: str, org_id: str = None) -> AsyncGenerator[IdAndName, None, None]:
+        """
+        Get Local Gateway Dial Plan Usage for a Trunk.
+
+        A Trunk is a connection between Webex Calling and the premises, which terminates on the premises with
+        a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks
+        that allow
+        Webex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Retrieving this information requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param trunk_id: ID of the trunk.
+        :type trunk_id: str
+        :param org_id: Organization to which trunk belongs.
+        :type org_id: str
+        :return: id and name objects
+        """
+        params = {to_camel(p): v for p, v in locals().items()
+                  if v is not None and p not in {'self', 'trunk_id'}}
+        url = self.ep(f'{trunk_id}/usagePstnConnection')
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=IdAndName, params=params)
+
+    async def usage_location_pstn(self, trunk_id: str, org_id: str = None) -> List[IdAndName]:
+        """
+        Get Local Gateway Dial Plan Usage for a Trunk.
+
+        A Trunk is a connection between Webex Calling and the premises, which terminates on the premises with
+        a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks
+        that allow
+        Webex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Retrieving this information requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param trunk_id: ID of the trunk.
+        :type trunk_id: str
+        :param org_id: Organization to which trunk belongs.
+        :type org_id: str
+        :return: id and name objects
+        """
+        params = {to_camel(p): v for p, v in locals().items()
+                  if v is not None and p not in {'self', 'trunk_id'}}
+        url = self.ep(f'{trunk_id}/usagePstnConnection')
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=IdAndName, params=params)]
+
+    def usage_route_group_gen(self, trunk_id: str, org_id: str = None) -> AsyncGenerator[IdAndName, None, None]:
+        """
+        Get Local Gateway Dial Plan Usage for a Trunk.
+
+        A Trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks that allow
+        Webex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Retrieving this information requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param trunk_id: ID of the trunk.
+        :type trunk_id: str
+        :param org_id: Organization to which trunk belongs.
+        :type org_id: str
+        :return: id and name objects
+        """
+        params = {to_camel(p): v for p, v in locals().items()
+                  if v is not None and p not in {'self', 'trunk_id'}}
+        url = self.ep(f'{trunk_id}/usageRouteGroup')
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=IdAndName, params=params)
+
+    async def usage_route_group(self, trunk_id: str, org_id: str = None) -> List[IdAndName]:
+        """
+        Get Local Gateway Dial Plan Usage for a Trunk.
+
+        A Trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks that allow
+        Webex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Retrieving this information requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param trunk_id: ID of the trunk.
+        :type trunk_id: str
+        :param org_id: Organization to which trunk belongs.
+        :type org_id: str
+        :return: id and name objects
+        """
+        params = {to_camel(p): v for p, v in locals().items()
+                  if v is not None and p not in {'self', 'trunk_id'}}
+        url = self.ep(f'{trunk_id}/usageRouteGroup')
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=IdAndName, params=params)]
+
+    def usage_call_to_extension_gen(self, trunk_id: str, org_id: str = None, order: str = None,
+                                name: List[str] = None, **params) -> AsyncGenerator[IdAndName, None, None]:
+        """
+        Get local gateway call to on-premises extension usage for a trunk.
+
+        A trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group which is a group of trunks that
+        allow Webex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Retrieving this information requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param trunk_id: ID of the trunk.
+        :param org_id: Organization to which the trunk belongs.
+        :param order: Order the trunks according to the designated fields. Available sort fields are name,
+            and locationName. Sort order is ascending by default
+        :param name: Return the list of trunks matching the local gateway names
+        :return: generator of :class:`wxc_sdk.common.IdAndName` instances
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'trunk_id', 'params'})
+        if name:
+            params['name'] = ','.join(name)
+        url = self.ep(f'{trunk_id}/usageCallToExtension')
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=url, model=IdAndName, params=params)
+
+    async def usage_call_to_extension(self, trunk_id: str, org_id: str = None, order: str = None,
+                                name: List[str] = None, **params) -> List[IdAndName]:
+        """
+        Get local gateway call to on-premises extension usage for a trunk.
+
+        A trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group which is a group of trunks that
+        allow Webex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Retrieving this information requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param trunk_id: ID of the trunk.
+        :param org_id: Organization to which the trunk belongs.
+        :param order: Order the trunks according to the designated fields. Available sort fields are name,
+            and locationName. Sort order is ascending by default
+        :param name: Return the list of trunks matching the local gateway names
+        :return: generator of :class:`wxc_sdk.common.IdAndName` instances
+        """
+        params.update((to_camel(p), v) for p, v in locals().items()
+                      if v is not None and p not in {'self', 'trunk_id', 'params'})
+        if name:
+            params['name'] = ','.join(name)
+        url = self.ep(f'{trunk_id}/usageCallToExtension')
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=url, model=IdAndName, params=params)]
+
+    async def validate_fqdn_and_domain(self, address: str, domain: str, port: int = None, org_id: str = None):
+        """
+        Validate Local Gateway FQDN and Domain for the organization trunks.
+
+        A Trunk is a connection between Webex Calling and the premises, which terminates on the premises with a local
+        gateway or other supported device. The trunk can be assigned to a Route Group - a group of trunks that allow
+        Webex Calling to distribute calls over multiple trunks or to provide redundancy.
+
+        Validating Local Gateway FQDN and Domain requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param address: FQDN or SRV address of the trunk.
+        :type address: str
+        :param domain: Domain name of the trunk.
+        :type domain: str
+        :param port: FQDN port of the trunk
+        :type port: int
+        :param org_id: Organization to which trunk types belongs.
+        :type org_id: str
+        """
+        body = {p: v for p, v in locals().items()
+                if p not in {'self', 'org_id'} and v is not None}
+        url = self.ep('actions/fqdnValidation/invoke')
+        params = org_id and {'orgId': org_id} or None
+        await self.post(url=url, params=params, json=body)
@@ -0,0 +1,136 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.pstn import PSTNConnectionOption
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsPSTNApi']
+
+
+class AsPSTNApi(AsApiChild, base='telephony/pstn/locations'):
+    """
+    PSTN
+
+    PSTN Location Connection Settings supports PSTN selection when creating a location or changing a PSTN type for a
+    location. This is only supported for Local Gateway and Non-integrated CCP.
+
+    Viewing these read-only organization settings requires a full or read-only administrator auth token with a scope of
+    `spark-admin:telephony_pstn_read`.
+
+    Modifying these organization settings requires a full administrator auth token with a scope of
+    `spark-admin:telephony_pstn_write`.
+
+    A partner administrator can retrieve or change settings in a customer's organization using the optional `orgId`
+    query parameter.
+    """
+
+    async def list(self, location_id: str,
+             org_id: str = None) -> list[PSTNConnectionOption]:
+        """
+        Retrieve PSTN Connection Options for a Location
+
+        Retrieve the list of PSTN connection options available for a location.
+
+        PSTN location connection settings enables the admin to configure or change the PSTN provider for a location.
+
+        Retrieving this list requires a full or read-only administrator auth token with a scope of
+        `spark-admin:telephony_pstn_read`.
+
+        :param location_id: Return the list of List PSTN location connection options for this location.
+        :type location_id: str
+        :param org_id: List PSTN location connection options for this organization.
+        :type org_id: str
+        :rtype: list[PSTNConnectionOption]
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{location_id}/connectionOptions')
+        data = await super().get(url, params=params)
+        r = type_adapter(list[PSTNConnectionOption]).validate_python(data['items'])
+        return r
+
+    async def configure(self, location_id: str, id: str = None, premise_route_type: str = None,
+                  premise_route_id: str = None, org_id: str = None):
+        """
+        Setup PSTN Connection for a Location
+
+        Set up or update the PSTN connection details for a location.
+
+        PSTN location connection settings enables the admin to configure or change the PSTN provider for a location.
+
+        Setting up PSTN connection on a location requires a full administrator auth token with a scope of
+        `spark-admin:telephony_pstn_write`.
+
+        :param location_id: Setup PSTN location connection options for this location.
+        :type location_id: str
+        :param id: A unique identifier for the connection. This is required for non-integrated CCP.
+        :type id: str
+        :param premise_route_type: Premise route type. The possible types are TRUNK and ROUTE_GROUP. This is required
+            for the local gateway.
+        :type premise_route_type: str
+        :param premise_route_id: Premise route ID. This refers to either a Trunk ID or a Route Group ID and is required
+            for the local gateway.
+        :type premise_route_id: str
+        :param org_id: Setup PSTN location connection for this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        if id is not None:
+            body['id'] = id
+        if premise_route_type is not None:
+            body['premiseRouteType'] = premise_route_type
+        if premise_route_id is not None:
+            body['premiseRouteId'] = premise_route_id
+        url = self.ep(f'{location_id}/connection')
+        await super().put(url, params=params, json=body)
+
+    async def read(self, location_id: str,
+             org_id: str = None) -> PSTNConnectionOption:
+        """
+        Retrieve PSTN Connection for a Location
+
+        Retrieves the current configured PSTN connection details for a location.
+
+        PSTN location connection settings enables the admin to configure or change the PSTN provider for a location.
+
+        Retrieving the PSTN connection details for a location requires a full or read-only administrator auth token
+        with a scope of `spark-admin:telephony_pstn_read`.
+
+        :param location_id: Retrieve PSTN location connection details for this location.
+        :type location_id: str
+        :param org_id: Retrieve PSTN location connection details for this organization.
+        :type org_id: str
+        :rtype: :class:`PSTNConnectionOption`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{location_id}/connection')
+        data = await super().get(url, params=params)
+        r = PSTNConnectionOption.model_validate(data)
+        return r
@@ -0,0 +1,518 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.virtual_line import ApiSelector, AssignedDectNetwork, VirtualLine, VirtualLineDevices, \
+    VirtualLineNumberPhoneNumber
+from wxc_sdk.as_api.api_child import AsApiChild
+from wxc_sdk.as_api.person_settings_agent_caller_id import AsAgentCallerIdApi
+from wxc_sdk.as_api.person_settings_available_numbers import AsAvailableNumbersApi
+from wxc_sdk.as_api.person_settings_barge import AsBargeApi
+from wxc_sdk.as_api.person_settings_call_intercept import AsCallInterceptApi
+from wxc_sdk.as_api.person_settings_call_recording import AsCallRecordingApi
+from wxc_sdk.as_api.person_settings_call_waiting import AsCallWaitingApi
+from wxc_sdk.as_api.person_settings_callbridge import AsCallBridgeApi
+from wxc_sdk.as_api.person_settings_caller_id import AsCallerIdApi
+from wxc_sdk.as_api.person_settings_ecbn import AsECBNApi
+from wxc_sdk.as_api.person_settings_forwarding import AsPersonForwardingApi
+from wxc_sdk.as_api.person_settings_moh import AsMusicOnHoldApi
+from wxc_sdk.as_api.person_settings_permissions_in import AsIncomingPermissionsApi
+from wxc_sdk.as_api.person_settings_permissions_out import AsOutgoingPermissionsApi
+from wxc_sdk.as_api.person_settings_privacy import AsPrivacyApi
+from wxc_sdk.as_api.person_settings_push_to_talk import AsPushToTalkApi
+from wxc_sdk.as_api.person_settings_voicemail import AsVoicemailApi
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsVirtualLinesApi']
+
+
+@dataclass(init=False, repr=False)
+class AsVirtualLinesApi(AsApiChild, base='telephony/config/virtualLines'):
+    #: agent caller id Api
+    agent_caller_id: AsAgentCallerIdApi
+    #: Available numbers for a virtual line
+    available_numbers: AsAvailableNumbersApi
+    #: barge settings
+    barge: AsBargeApi
+    #: Call bridge settings
+    call_bridge: AsCallBridgeApi
+    #: call intercept settings
+    call_intercept: AsCallInterceptApi
+    #: call recording settings
+    call_recording: AsCallRecordingApi
+    #: call waiting settings
+    call_waiting: AsCallWaitingApi
+    #: caller id settings
+    caller_id: AsCallerIdApi
+    #: ECBN settings
+    ecbn: AsECBNApi
+    #: forwarding settings
+    forwarding: AsPersonForwardingApi
+    #: music on hold settings
+    music_on_hold: AsMusicOnHoldApi
+    #: incoming permissions
+    permissions_in: AsIncomingPermissionsApi
+    #: outgoing permissions
+    permissions_out: AsOutgoingPermissionsApi
+    #: Privacy Settings
+    privacy: AsPrivacyApi
+    #: Push to Talk Settings
+    push_to_talk: AsPushToTalkApi
+    #: Voicemail Settings
+    voicemail: AsVoicemailApi
+
+    def __init__(self, session):
+        super().__init__(session=session)
+        self.agent_caller_id = AsAgentCallerIdApi(session=session, selector=ApiSelector.virtual_line)
+        self.available_numbers = AsAvailableNumbersApi(session=session, selector=ApiSelector.virtual_line)
+        self.barge = AsBargeApi(session=session, selector=ApiSelector.virtual_line)
+        self.call_bridge = AsCallBridgeApi(session=session, selector=ApiSelector.virtual_line)
+        self.call_intercept = AsCallInterceptApi(session=session, selector=ApiSelector.virtual_line)
+        self.call_recording = AsCallRecordingApi(session=session, selector=ApiSelector.virtual_line)
+        self.call_waiting = AsCallWaitingApi(session=session, selector=ApiSelector.virtual_line)
+        self.caller_id = AsCallerIdApi(session=session, selector=ApiSelector.virtual_line)
+        self.ecbn = AsECBNApi(session=session, selector=ApiSelector.virtual_line)
+        self.forwarding = AsPersonForwardingApi(session=session, selector=ApiSelector.virtual_line)
+        self.music_on_hold = AsMusicOnHoldApi(session=session, selector=ApiSelector.virtual_line)
+        self.permissions_in = AsIncomingPermissionsApi(session=session, selector=ApiSelector.virtual_line)
+        self.permissions_out = AsOutgoingPermissionsApi(session=session, selector=ApiSelector.virtual_line)
+        self.privacy = AsPrivacyApi(session=session, selector=ApiSelector.virtual_line)
+        self.push_to_talk = AsPushToTalkApi(session=session, selector=ApiSelector.virtual_line)
+        self.voicemail = AsVoicemailApi(session=session, selector=ApiSelector.virtual_line)
+
+    async def create(self, first_name: str, last_name: str, location_id: str, display_name: str = None,
+               phone_number: str = None, extension: str = None, caller_id_last_name: str = None,
+               caller_id_first_name: str = None, caller_id_number: str = None,
+               org_id: str = None) -> str:
+        """
+        Create a Virtual Line
+
+        Create new Virtual Line for the given location.
+
+        Virtual line is a capability in Webex Calling that allows administrators to configure multiple lines to Webex
+        Calling users.
+
+        Creating a virtual line requires a full or user administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param first_name: First name defined for a virtual line. Minimum length is 1. Maximum length is 30.
+        :type first_name: str
+        :param last_name: Last name defined for a virtual line. Minimum length is 1. Maximum length is 30.
+        :type last_name: str
+        :param location_id: ID of location for virtual line.
+        :type location_id: str
+        :param display_name: Display name defined for a virtual line.
+        :type display_name: str
+        :param phone_number: Phone number of a virtual line. Minimum length is 1. Maximum length is 23. Either
+            `phoneNumber` or `extension` is mandatory.
+        :type phone_number: str
+        :param extension: Extension of a virtual line. Minimum length is 2. Maximum length is 10. Either `phoneNumber`
+            or `extension` is mandatory.
+        :type extension: str
+        :param caller_id_last_name: Last name used in the Calling Line ID and for dial-by-name functions. Minimum
+            length is 1. Maximum length is 30.
+        :type caller_id_last_name: str
+        :param caller_id_first_name: First name used in the Calling Line ID and for dial-by-name functions. Minimum
+            length is 1. Maximum length is 30.
+        :type caller_id_first_name: str
+        :param caller_id_number: Phone number to appear as the CLID for all calls. Minimum length is 1. Maximum length
+            is 23.
+        :type caller_id_number: str
+        :param org_id: Create the virtual line for this organization.
+        :type org_id: str
+        :rtype: str
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['firstName'] = first_name
+        body['lastName'] = last_name
+        if display_name is not None:
+            body['displayName'] = display_name
+        if phone_number is not None:
+            body['phoneNumber'] = phone_number
+        if extension is not None:
+            body['extension'] = extension
+        body['locationId'] = location_id
+        if caller_id_last_name is not None:
+            body['callerIdLastName'] = caller_id_last_name
+        if caller_id_first_name is not None:
+            body['callerIdFirstName'] = caller_id_first_name
+        if caller_id_number is not None:
+            body['callerIdNumber'] = caller_id_number
+        url = self.ep()
+        data = await super().post(url, params=params, json=body)
+        r = data['id']
+        return r
+
+    async def delete(self, virtual_line_id: str, org_id: str = None):
+        """
+        Delete a Virtual Line
+
+        Delete the designated Virtual Line.
+
+        Virtual line is a capability in Webex Calling that allows administrators to configure multiple lines to Webex
+        Calling users.
+
+        Deleting a virtual line requires a full or user administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param virtual_line_id: Delete the virtual line with the matching ID.
+        :type virtual_line_id: str
+        :param org_id: Delete the virtual line from this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{virtual_line_id}')
+        await super().delete(url, params=params)
+
+    async def details(self, virtual_line_id: str, org_id: str = None) -> VirtualLine:
+        """
+        Get Details for a Virtual Line
+
+        Retrieve Virtual Line details.
+
+        Virtual line is a capability in Webex Calling that allows administrators to configure multiple lines to Webex
+        Calling users.
+
+        Retrieving virtual line details requires a full or user or read-only administrator or location administrator
+        auth token with a scope of `spark-admin:telephony_config_read`.
+
+        :param virtual_line_id: Retrieve settings for a virtual line with the matching ID.
+        :type virtual_line_id: str
+        :param org_id: Retrieve virtual line settings from this organization.
+        :type org_id: str
+        :rtype: :class:`GetVirtualLineObject`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{virtual_line_id}')
+        data = await super().get(url, params=params)
+        r = VirtualLine.model_validate(data)
+        return r
+
+    async def update(self, virtual_line_id: str, first_name: str = None, last_name: str = None,
+               display_name: str = None, phone_number: str = None, extension: str = None,
+               announcement_language: str = None, caller_id_last_name: str = None,
+               caller_id_first_name: str = None, caller_id_number: str = None, time_zone: str = None,
+               org_id: str = None):
+        """
+        Update a Virtual Line
+
+        Update the designated Virtual Line.
+
+        Virtual line is a capability in Webex Calling that allows administrators to configure multiple lines to Webex
+        Calling users.
+
+        Updating a virtual line requires a full or user or location administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param virtual_line_id: Update settings for a virtual line with the matching ID.
+        :type virtual_line_id: str
+        :param first_name: First name defined for a virtual line. Minimum length is 1. Maximum length is 30.
+        :type first_name: str
+        :param last_name: Last name defined for a virtual line. Minimum length is 1. Maximum length is 30.
+        :type last_name: str
+        :param display_name: Display name defined for a virtual line.
+        :type display_name: str
+        :param phone_number: Phone number of a virtual line. Minimum length is 1. Maximum length is 23. Either
+            `phoneNumber` or `extension` is mandatory.
+        :type phone_number: str
+        :param extension: Extension of a virtual line. Minimum length is 2. Maximum length is 10. Either `phoneNumber`
+            or `extension` is mandatory.
+        :type extension: str
+        :param announcement_language: Virtual Line's announcement language.
+        :type announcement_language: str
+        :param caller_id_last_name: Last name used in the Calling Line ID and for dial-by-name functions. Minimum
+            length is 1. Maximum length is 30.
+        :type caller_id_last_name: str
+        :param caller_id_first_name: First name used in the Calling Line ID and for dial-by-name functions. Minimum
+            length is 1. Maximum length is 30.
+        :type caller_id_first_name: str
+        :param caller_id_number: Phone number to appear as the CLID for all calls. Minimum length is 1. Maximum length
+            is 23.
+        :type caller_id_number: str
+        :param time_zone: Time zone defined for the virtual line.
+        :type time_zone: str
+        :param org_id: Update virtual line settings from this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        if first_name is not None:
+            body['firstName'] = first_name
+        if last_name is not None:
+            body['lastName'] = last_name
+        if display_name is not None:
+            body['displayName'] = display_name
+        if phone_number is not None:
+            body['phoneNumber'] = phone_number
+        if extension is not None:
+            body['extension'] = extension
+        if announcement_language is not None:
+            body['announcementLanguage'] = announcement_language
+        if caller_id_last_name is not None:
+            body['callerIdLastName'] = caller_id_last_name
+        if caller_id_first_name is not None:
+            body['callerIdFirstName'] = caller_id_first_name
+        if caller_id_number is not None:
+            body['callerIdNumber'] = caller_id_number
+        if time_zone is not None:
+            body['timeZone'] = time_zone
+        url = self.ep(f'{virtual_line_id}')
+        await super().put(url, params=params, json=body)
+
+    async def get_phone_number(self, virtual_line_id: str,
+                         org_id: str = None) -> VirtualLineNumberPhoneNumber:
+        """
+        Get Phone Number assigned for a Virtual Line
+
+        Get details on the assigned phone number and extension for the virtual line.
+
+        Retrieving virtual line phone number details requires a full or user or read-only administrator auth token
+        with
+        a scope of `spark-admin:telephony_config_read`.
+
+        :param virtual_line_id: Retrieve settings for a virtual line with the matching ID.
+        :type virtual_line_id: str
+        :param org_id: Retrieve virtual line settings from this organization.
+        :type org_id: str
+        :rtype: GetVirtualLineNumberObjectPhoneNumber
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{virtual_line_id}/number')
+        data = await super().get(url, params=params)
+        r = VirtualLineNumberPhoneNumber.model_validate(data['phoneNumber'])
+        return r
+
+    async def update_directory_search(self, virtual_line_id: str, enabled: bool, org_id: str = None):
+        """
+        Update Directory search for a Virtual Line
+
+        Update the directory search for a designated Virtual Line.
+
+        Virtual line is a capability in Webex Calling that allows administrators to configure multiple lines to Webex
+        Calling users.
+
+        Updating Directory search for a virtual line requires a full or user administrator auth token with a scope of
+        `spark-admin:telephony_config_write`.
+
+        :param virtual_line_id: Update settings for a virtual line with the matching ID.
+        :type virtual_line_id: str
+        :param enabled: Whether or not the directory search for a virtual line is enabled.
+        :type enabled: bool
+        :param org_id: Update virtual line settings from this organization.
+        :type org_id: str
+        :rtype: None
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        body = dict()
+        body['enabled'] = enabled
+        url = self.ep(f'{virtual_line_id}/directorySearch')
+        await super().put(url, params=params, json=body)
+
+    async def assigned_devices(self, virtual_line_id: str, org_id: str = None) -> VirtualLineDevices:
+        """
+        Get List of Devices assigned for a Virtual Line
+
+        Retrieve Device details assigned for a virtual line.
+
+        Virtual line is a capability in Webex Calling that allows administrators to configure multiple lines to Webex
+        Calling users.
+
+        Retrieving the assigned device detials for a virtual line requires a full or user or read-only administrator
+        auth token with a scope of `spark-admin:telephony_config_read`.
+
+        :param virtual_line_id: Retrieve settings for a virtual line with the matching ID.
+        :type virtual_line_id: str
+        :param org_id: Retrieve virtual line settings from this organization.
+        :type org_id: str
+        :rtype: :class:`VirtualLineDevices`
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{virtual_line_id}/devices')
+        data = await super().get(url, params=params)
+        r = VirtualLineDevices.model_validate(data)
+        return r
+
+    async def dect_networks(self, virtual_line_id: str, org_id: str = None) -> list[AssignedDectNetwork]:
+        """
+        Get List of Dect Networks Handsets for a Virtual Line
+
+        Retrieve DECT Network details assigned for a virtual line.
+
+        Virtual line is a capability in Webex Calling that allows administrators to configure multiple lines to Webex
+        Calling users.
+
+        Retrieving the assigned device detials for a virtual line requires a full or user or read-only administrator
+        auth token with a scope of `spark-admin:telephony_config_read`.
+
+        :param virtual_line_id: Retrieve settings for a virtual line with the matching ID.
+        :type virtual_line_id: str
+        :param org_id: Retrieve virtual line settings from this organization.
+        :type org_id: str
+        :rtype: list[AssignedDectNetwork]
+        """
+        params = {}
+        if org_id is not None:
+            params['orgId'] = org_id
+        url = self.ep(f'{virtual_line_id}/dectNetworks')
+        data = await super().get(url, params=params)
+        r = type_adapter(list[AssignedDectNetwork]).validate_python(data['dectNetworks'])
+        return r
+
+    def list_gen(self, org_id: str = None, location_id: list[str] = None,
+             id: list[str] = None, owner_name: list[str] = None, phone_number: list[str] = None,
+             location_name: list[str] = None, order: list[str] = None, has_device_assigned: bool = None,
+             has_extension_assigned: bool = None, has_dn_assigned: bool = None,
+             **params) -> AsyncGenerator[VirtualLine, None, None]:
+        """
+        List all Virtual Lines for the organization.
+        Virtual line is a capability in Webex Calling that allows administrators to configure multiple lines to Webex
+        Calling users.
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param org_id: List virtual lines for this organization.
+        :type org_id: str
+        :param location_id: Return the list of virtual lines matching these location ids. Example for multiple values -
+            ?locationId=locId1&locationId=locId2.
+        :type location_id: List[str]
+        :param id: Return the list of virtual lines matching these virtualLineIds.
+        :type id: List[str]
+        :param owner_name: Return the list of virtual lines matching these owner names.
+        :type owner_name: List[str]
+        :param phone_number: Return the list of virtual lines matching these phone numbers.
+        :type phone_number: List[str]
+        :param location_name: Return the list of virtual lines matching the location names.
+        :type location_name: List[str]
+        :param order: Return the list of virtual lines based on the order. Default sort will be in an Ascending order.
+            Maximum 3 orders allowed at a time.
+        :type order: List[str]
+        :param has_device_assigned: If true, includes only virtual lines with devices assigned. When not explicitly
+            specified, the default includes both virtual lines with devices assigned and not assigned.
+        :type has_device_assigned: bool
+        :param has_extension_assigned: If true, includes only virtual lines with an extension assigned. When not
+            explicitly specified, the default includes both virtual lines with extension assigned and not assigned.
+        :type has_extension_assigned: bool
+        :param has_dn_assigned: If true, includes only virtual lines with an assigned directory number, also known as a
+            Dn. When not explicitly specified, the default includes both virtual lines with a Dn assigned and not
+            assigned.
+        :type has_dn_assigned: bool
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if location_id is not None:
+            params['locationId'] = location_id
+        if id is not None:
+            params['id'] = id
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if location_name is not None:
+            params['locationName'] = location_name
+        if order is not None:
+            params['order'] = order
+        if has_device_assigned is not None:
+            params['hasDeviceAssigned'] = has_device_assigned
+        if has_extension_assigned is not None:
+            params['hasExtensionAssigned'] = has_extension_assigned
+        if has_dn_assigned is not None:
+            params['hasDnAssigned'] = has_dn_assigned
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=VirtualLine, params=params, item_key='virtualLines')
+
+    async def list(self, org_id: str = None, location_id: list[str] = None,
+             id: list[str] = None, owner_name: list[str] = None, phone_number: list[str] = None,
+             location_name: list[str] = None, order: list[str] = None, has_device_assigned: bool = None,
+             has_extension_assigned: bool = None, has_dn_assigned: bool = None,
+             **params) -> List[VirtualLine]:
+        """
+        List all Virtual Lines for the organization.
+        Virtual line is a capability in Webex Calling that allows administrators to configure multiple lines to Webex
+        Calling users.
+        Retrieving this list requires a full or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param org_id: List virtual lines for this organization.
+        :type org_id: str
+        :param location_id: Return the list of virtual lines matching these location ids. Example for multiple values -
+            ?locationId=locId1&locationId=locId2.
+        :type location_id: List[str]
+        :param id: Return the list of virtual lines matching these virtualLineIds.
+        :type id: List[str]
+        :param owner_name: Return the list of virtual lines matching these owner names.
+        :type owner_name: List[str]
+        :param phone_number: Return the list of virtual lines matching these phone numbers.
+        :type phone_number: List[str]
+        :param location_name: Return the list of virtual lines matching the location names.
+        :type location_name: List[str]
+        :param order: Return the list of virtual lines based on the order. Default sort will be in an Ascending order.
+            Maximum 3 orders allowed at a time.
+        :type order: List[str]
+        :param has_device_assigned: If true, includes only virtual lines with devices assigned. When not explicitly
+            specified, the default includes both virtual lines with devices assigned and not assigned.
+        :type has_device_assigned: bool
+        :param has_extension_assigned: If true, includes only virtual lines with an extension assigned. When not
+            explicitly specified, the default includes both virtual lines with extension assigned and not assigned.
+        :type has_extension_assigned: bool
+        :param has_dn_assigned: If true, includes only virtual lines with an assigned directory number, also known as a
+            Dn. When not explicitly specified, the default includes both virtual lines with a Dn assigned and not
+            assigned.
+        :type has_dn_assigned: bool
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if location_id is not None:
+            params['locationId'] = location_id
+        if id is not None:
+            params['id'] = id
+        if owner_name is not None:
+            params['ownerName'] = owner_name
+        if phone_number is not None:
+            params['phoneNumber'] = phone_number
+        if location_name is not None:
+            params['locationName'] = location_name
+        if order is not None:
+            params['order'] = order
+        if has_device_assigned is not None:
+            params['hasDeviceAssigned'] = has_device_assigned
+        if has_extension_assigned is not None:
+            params['hasExtensionAssigned'] = has_extension_assigned
+        if has_dn_assigned is not None:
+            params['hasDnAssigned'] = has_dn_assigned
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=VirtualLine, params=params, item_key='virtualLines')]
@@ -0,0 +1,78 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.vm_rules import VoiceMailRules
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsVoicemailRulesApi']
+
+
+class AsVoicemailRulesApi(AsApiChild, base='telephony/config/voicemail/rules'):
+    """
+    API for voicemail rules settings
+    """
+
+    async def read(self, org_id: str = None) -> VoiceMailRules:
+        """
+        Get Voicemail Rules
+
+        Retrieve the organization's voicemail rules.
+
+        Organizational voicemail rules specify the default passcode requirements.
+
+        Retrieving the organization's voicemail rules requires a full, user or read-only administrator auth token with
+        a scope of spark-admin:telephony_config_read.
+
+        :param org_id: Retrieve voicemail settings for this organization.
+        :type org_id: str
+        :return: VM settings
+        :rtype: OrganisationVoicemailSettings
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep()
+        return VoiceMailRules.model_validate(await self.get(url, params=params))
+
+    async def update(self, settings: VoiceMailRules, org_id: str = None):
+        """
+        Update Voicemail Rules
+
+        Update the organization's default voicemail passcode and/or rules.
+
+        Organizational voicemail rules specify the default passcode requirements.
+
+        If you choose to set default passcode for new people added to your organization, communicate to your people
+        what that passcode is, and that it must be reset before they can access their voicemail. If this feature is
+        not turned on, each new person must initially set their own passcode.
+
+        Updating organization's voicemail passcode and/or rules requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param settings: new settings
+        :type settings: VoiceMailRules
+        :param org_id: Update voicemail rules for this organization.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep()
+        data = settings.model_dump_json(exclude={'default_voicemail_pin_rules': True})
+        await self.put(url, params=params, data=data)
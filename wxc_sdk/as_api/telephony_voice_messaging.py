@@ -0,0 +1,98 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.voice_messaging import MessageSummary, VoiceMessageDetails
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsVoiceMessagingApi']
+
+
+class AsVoiceMessagingApi(AsApiChild, base='telephony/voiceMessages'):
+    """
+    Voice Messaging APIs provide support for handling voicemail and message waiting indicators in Webex Calling.  The
+    APIs are limited to user access (no admin access), and all GET commands require the spark:calls_read scope, while
+    the other commands require the spark:calls_write scope.
+    """
+
+    async def summary(self) -> MessageSummary:
+        """
+        Get a summary of the voicemail messages for the user.
+        """
+        url = self.ep('summary')
+        data = await super().get(url=url)
+        return MessageSummary.model_validate(data)
+
+    def list_gen(self, **params) -> AsyncGenerator[VoiceMessageDetails, None, None]:
+        """
+        Get the list of all voicemail messages for the user.
+        """
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=VoiceMessageDetails, params=params)
+
+    async def list(self, **params) -> List[VoiceMessageDetails]:
+        """
+        Get the list of all voicemail messages for the user.
+        """
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=VoiceMessageDetails, params=params)]
+
+    async def delete(self, message_id: str):
+        """
+        Delete a specific voicemail message for the user.
+
+        :param message_id: The message identifier of the voicemail message to delete
+        :type message_id: str
+        """
+        url = self.ep(f'{message_id}')
+        await super().delete(url=url)
+        return
+
+    async def mark_as_read(self, message_id: str):
+        """
+        Update the voicemail message(s) as read for the user.
+        If the messageId is provided, then only mark that message as read.  Otherwise, all messages for the user are
+        marked as read.
+
+        :param message_id: The voicemail message identifier of the message to mark as read.  If the messageId is not
+            provided, then all voicemail messages for the user are marked as read.
+        :type message_id: str
+        """
+        body = {'messageId': message_id}
+        url = self.ep('markAsRead')
+        await super().post(url=url, json=body)
+        return
+
+    async def mark_as_unread(self, message_id: str):
+        """
+        Update the voicemail message(s) as unread for the user.
+        If the messageId is provided, then only mark that message as unread.  Otherwise, all messages for the user are
+        marked as unread.
+
+        :param message_id: The voicemail message identifier of the message to mark as unread.  If the messageId is not
+            provided, then all voicemail messages for the user are marked as unread.
+        :type message_id: str
+        """
+        body = {'messageId': message_id}
+        url = self.ep('markAsUnread')
+        await super().post(url=url, json=body)
+        return
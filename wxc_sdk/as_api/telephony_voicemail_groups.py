@@ -0,0 +1,328 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.voicemail_groups import AvailableNumber, VoicemailGroup, VoicemailGroupDetail
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsVoicemailGroupsApi']
+
+
+class AsVoicemailGroupsApi(AsApiChild, base='telephony/config/voicemailGroups'):
+    """
+    API for voicemail groups
+    """
+
+    def ep(self, location_id: str = None, path: str = None):
+        """
+        :param location_id:
+        :param path:
+        :return:
+        """
+        path = path and f'/{path}' or ''
+        if location_id is None:
+            return super().ep(path)
+        return self.session.ep(f'telephony/config/locations/{location_id}/voicemailGroups{path}')
+
+    def list_gen(self, location_id: str = None, name: str = None, phone_number: str = None,
+             org_id: str = None, **params) -> AsyncGenerator[VoicemailGroup, None, None]:
+        """
+        List the voicemail group information for the organization.
+
+        You can create a shared voicemail box and inbound fax box to assign to users or call routing features like an
+        auto attendant, call queue, or hunt group.
+
+        Retrieving voicemail Group for the organization requires a full read-only administrator auth token with a
+        scope of spark-admin:telephony_config_read.
+
+        :param location_id: Location to which the voicemail group belongs.
+        :type location_id: str
+        :param name: Search (Contains) based on voicemail group name
+        :type name: str
+        :param phone_number: Search (Contains) based on number or extension
+        :type phone_number: str
+        :param org_id: Organization to which the voicemail group belongs.
+        :type org_id: str
+        :return: yields ::class::`VoicemailGroup` instances
+        """
+        params.update((to_camel(p), v) for p, v in locals().items() if p not in {'self', 'params'} and v is not None)
+        url = self.ep()
+        return self.session.follow_pagination(url=url, model=VoicemailGroup, params=params, item_key='voicemailGroups')
+
+    async def list(self, location_id: str = None, name: str = None, phone_number: str = None,
+             org_id: str = None, **params) -> List[VoicemailGroup]:
+        """
+        List the voicemail group information for the organization.
+
+        You can create a shared voicemail box and inbound fax box to assign to users or call routing features like an
+        auto attendant, call queue, or hunt group.
+
+        Retrieving voicemail Group for the organization requires a full read-only administrator auth token with a
+        scope of spark-admin:telephony_config_read.
+
+        :param location_id: Location to which the voicemail group belongs.
+        :type location_id: str
+        :param name: Search (Contains) based on voicemail group name
+        :type name: str
+        :param phone_number: Search (Contains) based on number or extension
+        :type phone_number: str
+        :param org_id: Organization to which the voicemail group belongs.
+        :type org_id: str
+        :return: yields ::class::`VoicemailGroup` instances
+        """
+        params.update((to_camel(p), v) for p, v in locals().items() if p not in {'self', 'params'} and v is not None)
+        url = self.ep()
+        return [o async for o in self.session.follow_pagination(url=url, model=VoicemailGroup, params=params, item_key='voicemailGroups')]
+
+    async def details(self, location_id: str, voicemail_group_id: str, org_id: str = None) -> VoicemailGroupDetail:
+        """
+        Retrieve voicemail group details for a location.
+
+        Manage your voicemail group settings for a specific location, like when you want your voicemail to be active,
+        message storage settings, and how you would like to be notified of new voicemail messages.
+
+        Retrieving voicemail group details requires a full, user or read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param location_id: Retrieve voicemail group details for this location.
+        :type location_id: str
+        :param voicemail_group_id: Retrieve voicemail group details for this voicemail group ID.
+        :type voicemail_group_id: str
+        :param org_id: Retrieve voicemail group details for a customer location.
+        :type org_id: str
+        :return: Voicemail group settings
+        :type: :class:`VoicemailGroupDetail`
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep(location_id, voicemail_group_id)
+        data = await self.get(url=url, params=params)
+        return VoicemailGroupDetail.model_validate(data)
+
+    async def update(self, location_id: str, voicemail_group_id: str, settings: VoicemailGroupDetail, org_id: str = None):
+        """
+        Modifies the voicemail group location details for a particular location for a customer.
+
+        Manage your voicemail settings, like when you want your voicemail to be active, message storage settings, and
+        how you would like to be notified of new voicemail messages.
+
+        Modifying the voicemail group location details requires a full, user administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Modifies the voicemail group details for this location.
+        :type location_id: str
+        :param voicemail_group_id: Modifies the voicemail group details for this voicemail group ID.
+        :type voicemail_group_id: str
+        :param settings: New settings
+        :type settings: :class:`VoicemailGroupDetail`
+        :param org_id: Modifies the voicemail group details for a customer location.
+        :type org_id: str
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep(location_id, voicemail_group_id)
+        body = settings.json_for_update()
+        await self.put(url=url, data=body, params=params)
+
+    async def create(self, location_id: str, settings: VoicemailGroupDetail, org_id: str = None) -> str:
+        """
+        Create new voicemail group for the given location for a customer.
+
+        Voicemail group can be created for given location for a customer.
+
+        Creating voicemail group for the given location requires a full or user administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Create new voice mail group for this location.
+        :type location_id: str
+        :param settings: settings for new voicemail group
+            Example:
+
+            .. code-block:: python
+
+                settings = VoicemailGroupDetail.create(
+                                        name=vmg_name, extension=extension,
+                                        first_name='first', last_name='last',
+                                        passcode=740384)
+                vmg_id = api.telephony.voicemail_groups.create(location_id=location_id,
+                                                               settings=settings)
+
+        :type settings: :class:`VoicemailGroupDetail`
+        :param org_id: Create new voice mail group for this organization.
+        :type org_id: str
+        :return: UUID of the newly created voice mail group.
+        :rtype: str
+        """
+        body = settings.json_for_create()
+        params = org_id and {'orgId': org_id} or None
+        url = self.ep(location_id)
+        data = await self.post(url=url, data=body, params=params)
+        return data['id']
+
+    async def delete(self, location_id: str, voicemail_group_id: str, org_id: str = None):
+        """
+        Delete the designated voicemail group.
+
+        Deleting a voicemail group requires a full administrator auth token with a scope
+        of spark-admin:telephony_config_write.
+
+        :param location_id: Location from which to delete a voicemail group.
+        :type location_id: str
+        :param voicemail_group_id: Delete the voicemail group with the matching ID.
+        :type voicemail_group_id: str
+        :param org_id: Delete the voicemail group from this organization.
+        :type org_id: str
+        """
+        url = self.ep(location_id, voicemail_group_id)
+        await super().delete(url=url)
+
+    def fax_message_available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                            org_id: str = None,
+                                            **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Voicemail Group Fax Message Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as a voicemail group's FAX message phone
+        number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self.ep(location_id=location_id, path='faxMessage/availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def fax_message_available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                            org_id: str = None,
+                                            **params) -> List[AvailableNumber]:
+        """
+        Get Voicemail Group Fax Message Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as a voicemail group's FAX message phone
+        number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self.ep(location_id=location_id, path='faxMessage/availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
+
+    def available_phone_numbers_gen(self, location_id: str, phone_number: List[str] = None,
+                                org_id: str = None,
+                                **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get Voicemail Group Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as a voicemail group's phone number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self.ep(location_id=location_id, path='availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def available_phone_numbers(self, location_id: str, phone_number: List[str] = None,
+                                org_id: str = None,
+                                **params) -> List[AvailableNumber]:
+        """
+        Get Voicemail Group Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as a voicemail group's phone number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self.ep(location_id=location_id, path='availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
@@ -0,0 +1,185 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.telephony.voiceportal import AvailableNumber, PasscodeRules, VoicePortalSettings
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsVoicePortalApi']
+
+
+class AsVoicePortalApi(AsApiChild, base='telephony/config/locations'):
+    """
+    location voice portal API
+    """
+
+    def _endpoint(self, *, location_id: str, path: str = None) -> str:
+        """
+        location specific
+        telephony/config/locations/{locationId}/voicePortal
+
+        :meta private:
+        :param location_id: Unique identifier for the location.
+        :type location_id: str
+        :param path: additional path
+        :type: path: str
+        :return: full endpoint
+        :rtype: str
+        """
+        path = path and f'/{path}' or ''
+        ep = self.session.ep(f'telephony/config/locations/{location_id}/voicePortal{path}')
+        return ep
+
+    async def read(self, location_id: str, org_id: str = None) -> VoicePortalSettings:
+        """
+
+        :param location_id: Location to which the voice portal belongs.
+        :type location_id: str
+        :param org_id: Organization to which the voice portal belongs.
+        :type org_id: str
+        :return: location voice portal settings
+        :rtype: VoicePortalSettings
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(location_id=location_id)
+        return VoicePortalSettings.model_validate(await self.get(url, params=params))
+
+    async def update(self, location_id: str, settings: VoicePortalSettings, passcode: str = None, org_id: str = None):
+        """
+        Update VoicePortal
+
+        Update Voice portal information for the location.
+
+        Voice portals provide an interactive voice response (IVR) system so administrators can manage auto attendant
+        announcements.
+
+        Updating voice portal information for organization and/or rules requires a full administrator auth token with
+        a scope of spark-admin:telephony_config_write.
+
+        :param location_id: Location to which the voice portal belongs.
+        :type location_id: str
+        :param settings: new settings
+        :type settings: VoicePortalSettings
+        :param passcode: new passcode
+        :type passcode: str
+        :param org_id: Organization to which the voice portal belongs.
+        :type org_id: str
+        """
+        data = json.loads(settings.model_dump_json(exclude={'portal_id': True,
+                                                            'language': True}))
+        if passcode is not None:
+            data['passcode'] = {'newPasscode': passcode,
+                                'confirmPasscode': passcode}
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(location_id=location_id)
+        await self.put(url, params=params, json=data)
+
+    async def passcode_rules(self, location_id: str, org_id: str = None) -> PasscodeRules:
+        """
+        Get VoicePortal Passcode Rule
+
+        Retrieve the voice portal passcode rule for a location.
+
+        Voice portals provide an interactive voice response (IVR) system so administrators can manage auto attendant
+        announcements
+
+        Retrieving the voice portal passcode rule requires a full read-only administrator auth token with a scope
+        of spark-admin:telephony_config_read.
+
+        :param location_id: Retrieve voice portal passcode rules for this location.
+        :type location_id: str
+        :param org_id: Retrieve voice portal passcode rules for this organization.
+        :type org_id: str
+        :return: passcode rules
+        :rtype: PasscodeRules
+        """
+        params = org_id and {'orgId': org_id} or None
+        url = self._endpoint(location_id=location_id, path='passcodeRules')
+        return PasscodeRules.model_validate(await self.get(url, params=params))
+
+    def available_phone_numbers_gen(self, location_id: str, phone_number: list[str] = None,
+                                org_id: str = None,
+                                **params) -> AsyncGenerator[AvailableNumber, None, None]:
+        """
+        Get VoicePortal Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the location voice portal's phone
+        number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='availableNumbers')
+        return self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)
+
+    async def available_phone_numbers(self, location_id: str, phone_number: list[str] = None,
+                                org_id: str = None,
+                                **params) -> List[AvailableNumber]:
+        """
+        Get VoicePortal Available Phone Numbers
+
+        List service and standard numbers that are available to be assigned as the location voice portal's phone
+        number.
+        These numbers are associated with the location specified in the request URL, can be active or inactive, and are
+        unassigned.
+
+        The available numbers APIs help identify candidate numbers and their owning entities to simplify the assignment
+        or association of these numbers to members or features.
+
+        Retrieving this list requires a full, read-only or location administrator auth token with a scope of
+        `spark-admin:telephony_config_read`.
+
+        :param location_id: Return the list of phone numbers for this location within the given organization. The
+            maximum length is 36.
+        :type location_id: str
+        :param phone_number: Filter phone numbers based on the comma-separated list provided in the `phoneNumber`
+            array.
+        :type phone_number: list[str]
+        :param org_id: List numbers for this organization.
+        :type org_id: str
+        :return: Generator yielding :class:`AvailableNumber` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if phone_number is not None:
+            params['phoneNumber'] = ','.join(phone_number)
+        url = self._endpoint(location_id=location_id, path='availableNumbers')
+        return [o async for o in self.session.follow_pagination(url=url, model=AvailableNumber, item_key='phoneNumbers', params=params)]
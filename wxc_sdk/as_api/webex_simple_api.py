@@ -0,0 +1,261 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk import Tokens
+from wxc_sdk.as_api.admin_audit import AsAdminAuditEventsApi
+from wxc_sdk.as_api.attachment_actions import AsAttachmentActionsApi
+from wxc_sdk.as_api.authorizations import AsAuthorizationsApi
+from wxc_sdk.as_api.cdr import AsDetailedCDRApi
+from wxc_sdk.as_api.converged_recordings import AsConvergedRecordingsApi
+from wxc_sdk.as_api.device_configurations import AsDeviceConfigurationsApi
+from wxc_sdk.as_api.devices import AsDevicesApi
+from wxc_sdk.as_api.events import AsEventsApi
+from wxc_sdk.as_api.groups import AsGroupsApi
+from wxc_sdk.as_api.guests import AsGuestManagementApi
+from wxc_sdk.as_api.licenses import AsLicensesApi
+from wxc_sdk.as_api.locations import AsLocationsApi
+from wxc_sdk.as_api.meetings import AsMeetingsApi
+from wxc_sdk.as_api.memberships import AsMembershipApi
+from wxc_sdk.as_api.messages import AsMessagesApi
+from wxc_sdk.as_api.org_contacts import AsOrganizationContactsApi
+from wxc_sdk.as_api.organizations import AsOrganizationApi
+from wxc_sdk.as_api.people import AsPeopleApi
+from wxc_sdk.as_api.person_settings import AsPersonSettingsApi
+from wxc_sdk.as_api.reports import AsReportsApi
+from wxc_sdk.as_api.roles import AsRolesApi
+from wxc_sdk.as_api.room_tabs import AsRoomTabsApi
+from wxc_sdk.as_api.rooms import AsRoomsApi
+from wxc_sdk.as_api.scim import AsScimV2Api
+from wxc_sdk.as_api.status import AsStatusAPI
+from wxc_sdk.as_api.team_memberships import AsTeamMembershipsApi
+from wxc_sdk.as_api.teams import AsTeamsApi
+from wxc_sdk.as_api.telephony import AsTelephonyApi
+from wxc_sdk.as_api.webhook import AsWebhookApi
+from wxc_sdk.as_api.workspace_locations import AsWorkspaceLocationApi
+from wxc_sdk.as_api.workspace_personalization import AsWorkspacePersonalizationApi
+from wxc_sdk.as_api.workspace_settings import AsWorkspaceSettingsApi
+from wxc_sdk.as_api.workspaces import AsWorkspacesApi
+from wxc_sdk.as_api.xapi import AsXApi
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsWebexSimpleApi']
+
+
+@dataclass(init=False, repr=False)
+class AsWebexSimpleApi:
+    """
+    The main API object
+    """
+
+    #: Admin Audit Events API :class:`AsAdminAuditEventsApi`
+    admin_audit: AsAdminAuditEventsApi
+    #: Attachment actions API :class:`AsAttachmentActionsApi`
+    attachment_actions: AsAttachmentActionsApi
+    #: Authorizations API :class:`AsAuthorizationsApi`
+    authorizations: AsAuthorizationsApi
+    #: CDR API :class:`AsDetailedCDRApi`
+    cdr: AsDetailedCDRApi
+    #: converged recordings API :class:`AsConvergedRecordingsApi`
+    converged_recordings: AsConvergedRecordingsApi
+    #: device configurations API :class:`AsDeviceConfigurationsApi`
+    device_configurations: AsDeviceConfigurationsApi
+    #: devices API :class:`AsDevicesApi`
+    devices: AsDevicesApi
+    #: events API; :class:`AsEventsApi`
+    events: AsEventsApi
+    #: groups API :class:`AsGroupsApi`
+    groups: AsGroupsApi
+    #: guests API :class:`AsGuestManagementApi`
+    guests: AsGuestManagementApi
+    #: Licenses API :class:`AsLicensesApi`
+    licenses: AsLicensesApi
+    #: Location API :class:`AsLocationsApi`
+    locations: AsLocationsApi
+    #: meetings API :class:`AsMeetingsApi`
+    meetings: AsMeetingsApi
+    #: membership API :class:`AsMembershipApi`
+    membership: AsMembershipApi
+    #: Messages API :class:`AsMessagesApi`
+    messages: AsMessagesApi
+    #: org contacts API :class:`AsOrganizationContactsApi`
+    org_contacts: AsOrganizationContactsApi
+    #: organization settings API
+    organizations: AsOrganizationApi
+    #: Person settings API :class:`AsPersonSettingsApi`
+    person_settings: AsPersonSettingsApi
+    #: People API :class:`AsPeopleApi`
+    people: AsPeopleApi
+    #: Reports API :class:`AsReportsApi`
+    reports: AsReportsApi
+    #: Roles API :class:`AsRolesApi`
+    roles: AsRolesApi
+    #: Rooms API :class:`AsRoomsApi`
+    rooms: AsRoomsApi
+    #: Room tabs API :class:`AsRoomTabsApi`
+    room_tabs: AsRoomTabsApi
+    #: Webex Status API :class:`AsStatusAPI`
+    status: AsStatusAPI
+    #: ScimV2 API: :class:`AsScimV2Api`
+    scim: AsScimV2Api
+    #: Teams API :class:`AsTeamsApi`
+    teams: AsTeamsApi
+    #: Team memberships API :class:`AsTeamMembershipsApi`
+    team_memberships: AsTeamMembershipsApi
+    #: Telephony (features) API :class:`AsTelephonyApi`
+    telephony: AsTelephonyApi
+    #: Webhooks API :class:`AsWebhookApi`
+    webhook: AsWebhookApi
+    #: Workspaces API :class:`AsWorkspacesApi`
+    workspaces: AsWorkspacesApi
+    #: Workspace locations API; :class:`AsWorkspaceLocationApi`
+    workspace_locations: AsWorkspaceLocationApi
+    #: Workspace personalization API :class:workspace_personalization.AsWorkspacePersonalizationApi`
+    workspace_personalization: AsWorkspacePersonalizationApi
+    #: Workspace setting API :class:`AsWorkspaceSettingsApi`
+    workspace_settings: AsWorkspaceSettingsApi
+    #: XAPI API :class:`AsXApi`
+    xapi: AsXApi
+    #: :class:`AsRestSession` used for all API requests
+    session: AsRestSession
+
+    def __init__(self, *, tokens: Union[str, Tokens] = None, concurrent_requests: int = 10, retry_429: bool = True,
+                 **kwargs):
+        """
+
+        :param tokens: token to be used by the API. Can be a :class:`tokens.Tokens` instance, a string or None. If
+            None then an access token is expected in the WEBEX_ACCESS_TOKEN environment variable.
+        :param concurrent_requests: number of concurrent requests when using multi-threading
+        :type concurrent_requests: int
+        :param retry_429: automatically retry for 429 throttling response
+        :type retry_429: bool
+        :param kwargs: additional arguments to be passed to the constructor of the :attr:`session` object to be used
+            for all requests
+        """
+        if isinstance(tokens, str):
+            tokens = Tokens(access_token=tokens)
+        elif tokens is None:
+            tokens = os.getenv('WEBEX_ACCESS_TOKEN')
+            if tokens is None:
+                raise ValueError('if no access token is passed, then a valid access token has to be present in '
+                                 'WEBEX_ACCESS_TOKEN environment variable')
+            tokens = Tokens(access_token=tokens)
+
+        session = AsRestSession(tokens=tokens, concurrent_requests=concurrent_requests, retry_429=retry_429,
+                              **kwargs)
+        self.admin_audit = AsAdminAuditEventsApi(session=session)
+        self.attachment_actions = AsAttachmentActionsApi(session=session)
+        self.authorizations = AsAuthorizationsApi(session=session)
+        self.cdr = AsDetailedCDRApi(session=session)
+        self.converged_recordings = AsConvergedRecordingsApi(session=session)
+        self.device_configurations = AsDeviceConfigurationsApi(session=session)
+        self.devices = AsDevicesApi(session=session)
+        self.events = AsEventsApi(session=session)
+        self.groups = AsGroupsApi(session=session)
+        self.guests = AsGuestManagementApi(session=session)
+        self.licenses = AsLicensesApi(session=session)
+        self.locations = AsLocationsApi(session=session)
+        self.meetings = AsMeetingsApi(session=session)
+        self.membership = AsMembershipApi(session=session)
+        self.messages = AsMessagesApi(session=session)
+        self.org_contacts = AsOrganizationContactsApi(session=session)
+        self.organizations = AsOrganizationApi(session=session)
+        self.person_settings = AsPersonSettingsApi(session=session)
+        self.people = AsPeopleApi(session=session)
+        self.reports = AsReportsApi(session=session)
+        self.roles = AsRolesApi(session=session)
+        self.rooms = AsRoomsApi(session=session)
+        self.room_tabs = AsRoomTabsApi(session=session)
+        self.scim = AsScimV2Api(session=session)
+        self.status = AsStatusAPI(session=session)
+        self.teams = AsTeamsApi(session=session)
+        self.team_memberships = AsTeamMembershipsApi(session=session)
+        self.telephony = AsTelephonyApi(session=session)
+        self.webhook = AsWebhookApi(session=session)
+        self.workspaces = AsWorkspacesApi(session=session)
+        self.workspace_locations = AsWorkspaceLocationApi(session=session)
+        self.workspace_personalization = AsWorkspacePersonalizationApi(session=session)
+        self.workspace_settings = AsWorkspaceSettingsApi(session=session)
+        self.xapi = AsXApi(session=session)
+        self.session = session
+
+    @property
+    def access_token(self) -> str:
+        """
+        access token used for all requests
+
+        :return: access token
+        :rtype: str
+        """
+        return self.session.access_token
+
+    async def map(self, fn: Callable[[Any], Awaitable], items: Iterable, *, return_exceptions: bool = True,
+                  cancel_on_error: bool = False, progress: ProgressCallback = None, max_workers: int = None) -> list:
+        """
+        Await a coroutine for each item concurrently and return the results in the order of the items.
+
+        Concurrency is limited to the concurrency limit of the session.
+
+        :param fn: function returning an awaitable for an item, typically a lambda calling an API method
+        :param items: items
+        :param return_exceptions: return exceptions as results. Else the first exception (in item order) is raised
+            after all calls completed
+        :param cancel_on_error: raise the first exception immediately and cancel all other calls
+        :param progress: callback for progress reporting; called with a :class:`wxc_sdk.fan_out.FanOutProgress`
+            after each completed item
+        :param max_workers: maximum number of concurrent calls. Default: concurrency limit of the session
+        :return: list of results (or exceptions)
+        """
+        return await as_map_items(fn, items, concurrency=max_workers or self.session.concurrent_requests,
+                                  return_exceptions=return_exceptions, cancel_on_error=cancel_on_error,
+                                  progress=progress)
+        
+
+    async def as_completed(self, fn: Callable[[Any], Awaitable], items: Iterable, *, cancel_on_error: bool = False,
+                           progress: ProgressCallback = None,
+                           max_workers: int = None) -> AsyncGenerator[ItemResult, None]:
+        """
+        Await a coroutine for each item concurrently and yield the results as they complete.
+
+        Exceptions are not raised but reported in the results. See :meth:`map`
+
+        :param fn: function returning an awaitable for an item
+        :param items: items; consumed lazily
+        :param cancel_on_error: stop after the first failed call: the failed result is yielded, all other calls are
+            cancelled and the generator ends
+        :param progress: callback for progress reporting
+        :param max_workers: maximum number of concurrent calls. Default: concurrency limit of the session
+        :return: async generator of :class:`wxc_sdk.fan_out.ItemResult` instances in completion order
+        """
+        async for result in as_items_as_completed(fn, items,
+                                                  concurrency=max_workers or self.session.concurrent_requests,
+                                                  cancel_on_error=cancel_on_error, progress=progress):
+            yield result
+        
+
+    async def close(self):
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
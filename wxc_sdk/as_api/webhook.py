@@ -0,0 +1,141 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.webhook import Webhook, WebhookEventType, WebhookResource
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsWebhookApi']
+
+
+class AsWebhookApi(AsApiChild, base='webhooks'):
+    """
+    API for webhook management
+    """
+
+    def list_gen(self) -> AsyncGenerator[Webhook, None, None]:
+        """
+        List all of your webhooks.
+
+        :return: yields webhooks
+        """
+        ep = self.ep()
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=ep, model=Webhook)
+
+    async def list(self) -> List[Webhook]:
+        """
+        List all of your webhooks.
+
+        :return: yields webhooks
+        """
+        ep = self.ep()
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=ep, model=Webhook)]
+
+    async def create(self, name: str, target_url: str, resource: WebhookResource, event: WebhookEventType, filter: str = None,
+               secret: str = None,
+               owned_by: str = None) -> Webhook:
+        """
+        Creates a webhook.
+
+        To learn more about how to create and use webhooks, see The `Webhooks Guide
+        <https://developer.webex.com/docs/api/guides/webhooks>`_.
+
+        :param name: A user-friendly name for the webhook.
+        :type name: str
+        :param target_url: The URL that receives POST requests for each event.
+        :type target_url: str
+        :param resource: The resource type for the webhook. Creating a webhook requires 'read' scope on the resource
+            the webhook is for.
+        :type resource: WebhookResource
+        :param event: The event type for the webhook.
+        :type event: WebhookEvent
+        :param filter: Filter that defines the webhook scope. See `Filtering Webhooks
+            <https://developer.webex.com/docs/api/guides/webhooks#filtering-webhooks>`_ for more information. Please note
+            that if a filter of `hostEmail`, `hostUserId`, `ownerEmail` or `ownerId` is specified, `ownedBy` must be
+            set to `org`.
+        :type filter: str
+        :param secret: The secret used to generate payload signature.
+        :param secret: str
+        :param owned_by: Specify `org` when creating an org/admin level webhook. Supported for `meetings`,
+            `recordings`, `convergedRecordings`,`meetingParticipants`, `meetingTranscripts`, `videoMeshAlerts`,
+            `controlHubAlerts`, `rooms`, `messaging` and `adminBatchJobs` (for Compliance Officers and messages with
+            file attachments only - see `inline file DLP
+            <https://developer.webex.com/docs/api/guides/webex-real-time-file-dlp-basics>`_) resources.
+        :param owned_by: str
+        :return: the new webhook
+        """
+        body = dict()
+        body['name'] = name
+        body['targetUrl'] = target_url
+        body['resource'] = enum_str(resource)
+        body['event'] = enum_str(event)
+        if filter is not None:
+            body['filter'] = filter
+        if secret is not None:
+            body['secret'] = secret
+        if owned_by is not None:
+            body['ownedBy'] = owned_by
+        ep = self.ep()
+        data = await self.post(ep, json=body)
+        result = Webhook.model_validate(data)
+        return result
+
+    async def details(self, webhook_id: str) -> Webhook:
+        """
+        Get Webhook Details
+        Shows details for a webhook, by ID.
+
+        :param webhook_id: The unique identifier for the webhook.
+        :type webhook_id: str
+        :return: Webhook details
+        """
+        url = self.ep(webhook_id)
+        return Webhook.model_validate(await self.get(url))
+
+    async def update(self, webhook_id: str, update: Webhook) -> Webhook:
+        """
+        Updates a webhook, by ID. You cannot use this call to deactivate a webhook, only to activate a webhook that
+        was auto deactivated. The fields that can be updated are name, targetURL, secret and status. All other fields,
+        if supplied, are ignored.
+
+        :param webhook_id: The unique identifier for the webhook.
+        :type webhook_id: str
+        :param update: The webhook update
+        :type update: Webhook
+        :return: updated :class:`Webhook` object
+        """
+        url = self.ep(webhook_id)
+        webhook_data = update.model_dump_json(include={'name', 'target_url', 'secret', 'owned_by', 'status'})
+        return Webhook.model_validate(await self.put(url, data=webhook_data))
+
+    async def webhook_delete(self, webhook_id: str):
+        """
+        Deletes a webhook, by ID.
+
+        :param webhook_id: The unique identifier for the webhook.
+        :type webhook_id: str
+        :return: None
+        """
+        ep = self.ep(f'{webhook_id}')
+        await self.delete(ep)
@@ -0,0 +1,119 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.workspace_settings import ApiSelector
+from wxc_sdk.as_api.api_child import AsApiChild
+from wxc_sdk.as_api.person_settings_anon_calls import AsAnonCallsApi
+from wxc_sdk.as_api.person_settings_available_numbers import AsAvailableNumbersApi
+from wxc_sdk.as_api.person_settings_barge import AsBargeApi
+from wxc_sdk.as_api.person_settings_call_intercept import AsCallInterceptApi
+from wxc_sdk.as_api.person_settings_call_policy import AsCallPolicyApi
+from wxc_sdk.as_api.person_settings_call_waiting import AsCallWaitingApi
+from wxc_sdk.as_api.person_settings_callbridge import AsCallBridgeApi
+from wxc_sdk.as_api.person_settings_caller_id import AsCallerIdApi
+from wxc_sdk.as_api.person_settings_dnd import AsDndApi
+from wxc_sdk.as_api.person_settings_ecbn import AsECBNApi
+from wxc_sdk.as_api.person_settings_forwarding import AsPersonForwardingApi
+from wxc_sdk.as_api.person_settings_moh import AsMusicOnHoldApi
+from wxc_sdk.as_api.person_settings_monitoring import AsMonitoringApi
+from wxc_sdk.as_api.person_settings_permissions_in import AsIncomingPermissionsApi
+from wxc_sdk.as_api.person_settings_permissions_out import AsOutgoingPermissionsApi
+from wxc_sdk.as_api.person_settings_priority_alert import AsPriorityAlertApi
+from wxc_sdk.as_api.person_settings_privacy import AsPrivacyApi
+from wxc_sdk.as_api.person_settings_push_to_talk import AsPushToTalkApi
+from wxc_sdk.as_api.person_settings_selective_accept import AsSelectiveAcceptApi
+from wxc_sdk.as_api.person_settings_selective_forward import AsSelectiveForwardApi
+from wxc_sdk.as_api.person_settings_selective_reject import AsSelectiveRejectApi
+from wxc_sdk.as_api.person_settings_sequential_ring import AsSequentialRingApi
+from wxc_sdk.as_api.person_settings_sim_ring import AsSimRingApi
+from wxc_sdk.as_api.person_settings_voicemail import AsVoicemailApi
+from wxc_sdk.as_api.workspace_settings_devices import AsWorkspaceDevicesApi
+from wxc_sdk.as_api.workspace_settings_numbers import AsWorkspaceNumbersApi
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsWorkspaceSettingsApi']
+
+
+@dataclass(init=False, repr=False)
+class AsWorkspaceSettingsApi(AsApiChild, base='workspaces'):
+    """
+    API for all workspace settings.
+
+    Most of the workspace settings are equivalent to corresponding user settings. For these settings the attributes of
+    this class are instances of the respective user settings APIs. When calling endpoints of these APIs workspace IDs
+    need to be passed to the ``person_id`` parameter of the called function.
+    """
+    anon_calls: AsAnonCallsApi
+    available_numbers: AsAvailableNumbersApi
+    barge: AsBargeApi
+    call_bridge: AsCallBridgeApi
+    call_intercept: AsCallInterceptApi
+    call_policy: AsCallPolicyApi
+    call_waiting: AsCallWaitingApi
+    caller_id: AsCallerIdApi
+    dnd: AsDndApi
+    devices: AsWorkspaceDevicesApi
+    ecbn: AsECBNApi
+    forwarding: AsPersonForwardingApi
+    monitoring: AsMonitoringApi
+    music_on_hold: AsMusicOnHoldApi
+    numbers: AsWorkspaceNumbersApi
+    permissions_in: AsIncomingPermissionsApi
+    permissions_out: AsOutgoingPermissionsApi
+    priority_alert: AsPriorityAlertApi
+    privacy: AsPrivacyApi
+    push_to_talk: AsPushToTalkApi
+    selective_accept: AsSelectiveAcceptApi
+    selective_forward: AsSelectiveForwardApi
+    selective_reject: AsSelectiveRejectApi
+    sequential_ring: AsSequentialRingApi
+    sim_ring: AsSimRingApi
+    voicemail: AsVoicemailApi
+
+    def __init__(self, session: AsRestSession):
+        super().__init__(session=session)
+        self.anon_calls = AsAnonCallsApi(session=session, selector=ApiSelector.workspace)
+        self.available_numbers = AsAvailableNumbersApi(session=session, selector=ApiSelector.workspace)
+        self.barge = AsBargeApi(session=session, selector=ApiSelector.workspace)
+        self.call_bridge = AsCallBridgeApi(session=session, selector=ApiSelector.workspace)
+        self.call_intercept = AsCallInterceptApi(session=session, selector=ApiSelector.workspace)
+        self.call_policy = AsCallPolicyApi(session=session, selector=ApiSelector.workspace)
+        self.call_waiting = AsCallWaitingApi(session=session, selector=ApiSelector.workspace)
+        self.caller_id = AsCallerIdApi(session=session, selector=ApiSelector.workspace)
+        self.devices = AsWorkspaceDevicesApi(session=session)
+        self.dnd = AsDndApi(session=session, selector=ApiSelector.workspace)
+        self.ecbn = AsECBNApi(session=session, selector=ApiSelector.workspace)
+        self.forwarding = AsPersonForwardingApi(session=session, selector=ApiSelector.workspace)
+        self.monitoring = AsMonitoringApi(session=session, selector=ApiSelector.workspace)
+        self.music_on_hold = AsMusicOnHoldApi(session=session, selector=ApiSelector.workspace)
+        self.numbers = AsWorkspaceNumbersApi(session=session)
+        self.permissions_in = AsIncomingPermissionsApi(session=session, selector=ApiSelector.workspace)
+        self.permissions_out = AsOutgoingPermissionsApi(session=session, selector=ApiSelector.workspace)
+        self.priority_alert = AsPriorityAlertApi(session=session, selector=ApiSelector.workspace)
+        self.privacy = AsPrivacyApi(session=session, selector=ApiSelector.workspace)
+        self.push_to_talk = AsPushToTalkApi(session=session, selector=ApiSelector.workspace)
+        self.selective_accept = AsSelectiveAcceptApi(session=session, selector=ApiSelector.workspace)
+        self.selective_forward = AsSelectiveForwardApi(session=session, selector=ApiSelector.workspace)
+        self.selective_reject = AsSelectiveRejectApi(session=session, selector=ApiSelector.workspace)
+        self.sequential_ring = AsSequentialRingApi(session=session, selector=ApiSelector.workspace)
+        self.sim_ring = AsSimRingApi(session=session, selector=ApiSelector.workspace)
+        self.voicemail = AsVoicemailApi(session=session, selector=ApiSelector.workspace)
@@ -0,0 +1,332 @@
+# auto-generated. DO NOT EDIT
+import json
+import logging
+import mimetypes
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+import pytz
+from dateutil import tz
+from dateutil.parser import isoparse
+from enum import Enum
+from io import BufferedReader
+from typing import Any, Union, Optional, Literal, List
+
+from wxc_sdk.as_mpe import MultipartEncoder
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str, type_adapter
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import ItemResult, ProgressCallback, as_items_as_completed, as_map_items
+from wxc_sdk.workspaces import CalendarType, CallingType, CapabilityMap, DevicePlatform, WorkSpaceType, Workspace, \
+    WorkspaceHealthLevel, WorkspaceSupportedDevices
+from wxc_sdk.as_api.api_child import AsApiChild
+
+log = logging.getLogger(__name__)
+
+
+__all__ = ['AsWorkspacesApi']
+
+
+class AsWorkspacesApi(AsApiChild, base='workspaces'):
+    """
+    Workspaces API
+
+    Workspaces represent where people work, such as conference rooms, meeting spaces, lobbies, and lunch rooms. Devices
+    may be associated with workspaces.
+    Viewing the list of workspaces in an organization requires an administrator auth token with the
+    spark-admin:workspaces_read scope. Adding, updating, or deleting workspaces in an organization requires an
+    administrator auth token with the spark-admin:workspaces_write scope.
+    The Workspaces API can also be used by partner administrators acting as administrators of a different organization
+    than their own. In those cases an orgId value must be supplied, as indicated in the reference documentation for the
+    relevant endpoints.
+    """
+
+    def list_gen(self, location_id: str = None, workspace_location_id: str = None, floor_id: str = None,
+             display_name: str = None, capacity: int = None, workspace_type: WorkSpaceType = None,
+             calling: CallingType = None, supported_devices: WorkspaceSupportedDevices = None,
+             calendar: CalendarType = None, device_hosted_meetings_enabled: bool = None,
+             device_platform: DevicePlatform = None, health_level: WorkspaceHealthLevel = None, org_id: str = None,
+             **params) -> AsyncGenerator[Workspace, None, None]:
+        """
+        List Workspaces
+
+        List workspaces. Use query parameters to filter the response. The orgId parameter can only be used by admin
+        users of another organization (such as partners). The workspaceLocationId, floorId, capacity and type fields
+        will only be present for workspaces that have a value set for them. The special values notSet (for filtering
+        on category) and -1 (for filtering on capacity) can be used to filter for workspaces without a type and/or
+        capacity.
+
+        :param location_id: Location associated with the workspace. Values must originate from the /locations API and
+            not the legacy /workspaceLocations API.
+        :type location_id: str
+        :param workspace_location_id: Location associated with the workspace. Both values from the /locations API and
+            the legacy /workspaceLocations API are supported. This field is deprecated and integrations should prefer
+            `locationId` going forward.
+        :type workspace_location_id: str
+        :param floor_id: Floor associated with the workspace.
+        :type floor_id: str
+        :param display_name: List workspaces by display name.
+        :type display_name: str
+        :param capacity: List workspaces with the given capacity. Must be -1 or higher. A value of -1 lists workspaces
+            with no capacity set.
+        :type capacity: int
+        :param workspace_type: List workspaces by type. Possible values: notSet, focus, huddle, meetingRoom, open,
+            desk, other
+        :type workspace_type: :class:`WorkSpaceType`
+        :param calling: List workspaces by calling type. Possible values: freeCalling, hybridCalling, webexCalling,
+            webexEdgeForDevices, thirdPartySipCalling, none
+        :type calling: :class:`CallingType`
+        :param supported_devices: List workspaces by supported devices. Possible values: collaborationDevices, phones
+        :type supported_devices: str
+        :param calendar: List workspaces by calendar type. Possible values: none, google, microsoft
+        :type calendar: :class:`CalendarType`
+        :param device_hosted_meetings_enabled: List workspaces enabled for device hosted meetings.
+        :type device_hosted_meetings_enabled: bool
+        :param device_platform: List workspaces by device platform.
+        :type device_platform: DevicePlatform
+        :param health_level: List workspaces by health level.
+        :type health_level: WorkspaceHealthLevel
+        :param org_id: List workspaces in this organization. Only admin users of another organization
+            (such as partners) may use this parameter.
+        :type org_id: str
+        :return: generator of :class:`Workspace` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if location_id is not None:
+            params['locationId'] = location_id
+        if workspace_location_id is not None:
+            params['workspaceLocationId'] = workspace_location_id
+        if floor_id is not None:
+            params['floorId'] = floor_id
+        if display_name is not None:
+            params['displayName'] = display_name
+        if capacity is not None:
+            params['capacity'] = capacity
+        if workspace_type is not None:
+            params['type'] = enum_str(workspace_type)
+        if calling is not None:
+            params['calling'] = calling
+        if supported_devices is not None:
+            params['supportedDevices'] = enum_str(supported_devices)
+        if calendar is not None:
+            params['calendar'] = calendar
+        if device_hosted_meetings_enabled is not None:
+            params['deviceHostedMeetingsEnabled'] = str(device_hosted_meetings_enabled).lower()
+        if device_platform is not None:
+            params['devicePlatform'] = enum_str(device_platform)
+        ep = self.ep()
+        # noinspection PyTypeChecker
+        return self.session.follow_pagination(url=ep, model=Workspace, params=params)
+
+    async def list(self, location_id: str = None, workspace_location_id: str = None, floor_id: str = None,
+             display_name: str = None, capacity: int = None, workspace_type: WorkSpaceType = None,
+             calling: CallingType = None, supported_devices: WorkspaceSupportedDevices = None,
+             calendar: CalendarType = None, device_hosted_meetings_enabled: bool = None,
+             device_platform: DevicePlatform = None, health_level: WorkspaceHealthLevel = None, org_id: str = None,
+             **params) -> List[Workspace]:
+        """
+        List Workspaces
+
+        List workspaces. Use query parameters to filter the response. The orgId parameter can only be used by admin
+        users of another organization (such as partners). The workspaceLocationId, floorId, capacity and type fields
+        will only be present for workspaces that have a value set for them. The special values notSet (for filtering
+        on category) and -1 (for filtering on capacity) can be used to filter for workspaces without a type and/or
+        capacity.
+
+        :param location_id: Location associated with the workspace. Values must originate from the /locations API and
+            not the legacy /workspaceLocations API.
+        :type location_id: str
+        :param workspace_location_id: Location associated with the workspace. Both values from the /locations API and
+            the legacy /workspaceLocations API are supported. This field is deprecated and integrations should prefer
+            `locationId` going forward.
+        :type workspace_location_id: str
+        :param floor_id: Floor associated with the workspace.
+        :type floor_id: str
+        :param display_name: List workspaces by display name.
+        :type display_name: str
+        :param capacity: List workspaces with the given capacity. Must be -1 or higher. A value of -1 lists workspaces
+            with no capacity set.
+        :type capacity: int
+        :param workspace_type: List workspaces by type. Possible values: notSet, focus, huddle, meetingRoom, open,
+            desk, other
+        :type workspace_type: :class:`WorkSpaceType`
+        :param calling: List workspaces by calling type. Possible values: freeCalling, hybridCalling, webexCalling,
+            webexEdgeForDevices, thirdPartySipCalling, none
+        :type calling: :class:`CallingType`
+        :param supported_devices: List workspaces by supported devices. Possible values: collaborationDevices, phones
+        :type supported_devices: str
+        :param calendar: List workspaces by calendar type. Possible values: none, google, microsoft
+        :type calendar: :class:`CalendarType`
+        :param device_hosted_meetings_enabled: List workspaces enabled for device hosted meetings.
+        :type device_hosted_meetings_enabled: bool
+        :param device_platform: List workspaces by device platform.
+        :type device_platform: DevicePlatform
+        :param health_level: List workspaces by health level.
+        :type health_level: WorkspaceHealthLevel
+        :param org_id: List workspaces in this organization. Only admin users of another organization
+            (such as partners) may use this parameter.
+        :type org_id: str
+        :return: generator of :class:`Workspace` instances
+        """
+        if org_id is not None:
+            params['orgId'] = org_id
+        if location_id is not None:
+            params['locationId'] = location_id
+        if workspace_location_id is not None:
+            params['workspaceLocationId'] = workspace_location_id
+        if floor_id is not None:
+            params['floorId'] = floor_id
+        if display_name is not None:
+            params['displayName'] = display_name
+        if capacity is not None:
+            params['capacity'] = capacity
+        if workspace_type is not None:
+            params['type'] = enum_str(workspace_type)
+        if calling is not None:
+            params['calling'] = calling
+        if supported_devices is not None:
+            params['supportedDevices'] = enum_str(supported_devices)
+        if calendar is not None:
+            params['calendar'] = calendar
+        if device_hosted_meetings_enabled is not None:
+            params['deviceHostedMeetingsEnabled'] = str(device_hosted_meetings_enabled).lower()
+        if device_platform is not None:
+            params['devicePlatform'] = enum_str(device_platform)
+        ep = self.ep()
+        # noinspection PyTypeChecker
+        return [o async for o in self.session.follow_pagination(url=ep, model=Workspace, params=params)]
+
+    async def create(self, settings: Workspace, org_id: str = None):
+        """
+        Create a Workspace
+
+        The `locationId`, `workspaceLocationId`, `floorId`, `indoorNavigation`, `capacity`, `type`, `notes` and
+        `hotdeskingStatus` parameters are optional, and omitting them will result in the creation of a workspace
+        without these values set, or set to their default. A `locationId` must be provided when the `floorId` is set.
+        Calendar and calling can also be set for a new workspace. Omitting them will default to free calling and no
+        calendaring. The `orgId` parameter can only be used by admin users of another organization (such as partners).
+
+        * Information for Webex Calling fields may be found here: `locations
+        <https://developer.webex.com/docs/api/v1/locations/list-locations>`_, `available numbers
+
+        * The `locationId` and `supportedDevices` fields cannot be changed once configured.
+
+        * When creating a `webexCalling` workspace that is not hot desk only, a `locationId` and either a `phoneNumber`
+          or `extension` or both is required. Furthermore, it is possible to set the `licenses` field with a list of
+          Webex Calling license IDs, if desired. If multiple license IDs are provided, the oldest suitable one will be
+          applied. If no licenses are supplied, the oldest suitable one from the active subscriptions will be
+          automaticaly applied.
+
+        * When creating a hot desk only workspace, `phoneNumber` and `extension` fields are not applicable.
+          Furthermore, `deviceHostedMeetingsEnabled`, and `calendar` services are not applicable. If any of these fields
+           are provided the API will return an error. The `calling` type is `webexCalling`.
+
+        :param settings: settings for new Workspace
+        :type settings: :class:`Workspace`
+        :param org_id: OrgId associated with the workspace. Only admin users of another organization
+            (such as partners) may use this parameter.
+        :type org_id: str
+        :return: new workspace
+        :rtype: :class:`Workspace`
+        """
+        if org_id:
+            settings.org_id = org_id
+        data = settings.update_or_create()
+        url = self.ep()
+        data = await self.post(url, json=data)
+        return Workspace.model_validate(data)
+
+    async def details(self, workspace_id) -> Workspace:
+        """
+        Get Workspace Details
+
+        Shows details for a workspace, by ID. The `locationId`, `workspaceLocationId`, `floorId`, `indoorNavigation`,
+        `capacity`, `type` and `notes` fields will only be present if they have been set for the workspace.
+
+        :param workspace_id: A unique identifier for the workspace.
+        :type workspace_id: str
+        :return: workspace details
+        :rtype: :class:`Workspace`
+        """
+        url = self.ep(workspace_id)
+        return Workspace.model_validate(await self.get(url))
+
+    async def update(self, workspace_id, settings: Workspace) -> Workspace:
+        """
+        Update a Workspace
+
+        Updates details for a workspace by ID.
+
+        Specify the workspace ID in the `workspaceId` parameter in the URI. Include all details for the workspace that
+        are present in a `GET request for the workspace details
+        <https://developer.webex.com/docs/api/v1/workspaces/get-workspace-details>`_. Not including the optional `capacity`, `type` or
+        `notes` fields will result in the fields no longer being defined for the workspace. A `locationId` must be
+        provided when the `floorId` is set. The `locationId`, `workspaceLocationId`, `floorId`, `supportedDevices`,
+        `calendar` and `calling` fields do not change when omitted from the update request.
+
+        * Information for Webex Calling fields may be found here: `locations
+        <https://developer.webex.com/docs/api/v1/locations/list-locations>`_ and `available numbers
+
+        * Updating the `calling` parameter is only supported if the existing `calling` type is `freeCalling`, `none`,
+          `thirdPartySipCalling` or `webexCalling`.
+
+        * Updating the `calling` parameter to `none`, `thirdPartySipCalling` or `webexCalling` is not supported if the
+          workspace contains any devices.
+
+        * The `locationId` and `supportedDevices` fields cannot be changed once configured.
+
+        * When updating `webexCalling` information on a workspace that is not hot desk only, a `locationId` and either
+          a `phoneNumber` or `extension` or both is required. Furthermore, the `licenses` field can be set with a list
+          of Webex Calling license IDs, if desired. If multiple license IDs are provided, the oldest suitable one will
+          be applied. If a previously applied license ID is omitted, it will be replaced with one from the list
+          provided. If the `licenses` field is omitted, the current calling license will be retained.
+
+        * When specifying a hot desk only license on a hot desk only workspace, `deviceHostedMeetingsEnabled`, and
+          `calendar` services are not supported and will be automatically disabled. In addition to this, the
+          `phoneNumber` and `extension` will be removed from the workspace. Attempting to enable any of these services,
+          or provide a `phoneNumber` or `extension` will result in an error. The `calling` type for these requests is
+          `webexCalling`.
+
+        :param workspace_id: A unique identifier for the workspace.
+        :type workspace_id: str
+        :param settings: new workspace settings
+        :type settings: :class:`Workspace`
+        :return: updated workspace
+        :rtype: :class:`Workspace`
+        """
+        url = self.ep(workspace_id)
+        j_data = settings.update_or_create(for_update=True)
+        data = await self.put(url, json=j_data)
+        return Workspace.model_validate(data)
+
+    async def delete_workspace(self, workspace_id):
+        """
+        Delete a Workspace
+
+        Deletes a workspace, by ID. Will also delete all devices associated with the workspace. Any deleted devices
+        will need to be reactivated.
+
+        :param workspace_id: A unique identifier for the workspace.
+        :type workspace_id: str
+        """
+        url = self.ep(workspace_id)
+        await self.delete(url)
+
+    async def capabilities(self, workspace_id: str) -> CapabilityMap:
+        """
+        Shows the capabilities for a workspace by ID.
+        Returns a set of capabilities, including whether or not the capability is supported by any device in the
+        workspace, and if the capability is configured (enabled). For example for a specific capability like
+        occupancyDetection, the API will return if the capability is supported and/or configured such that occupancy
+        detection data will flow from the workspace (device) to the cloud. Specify the workspace ID in the workspaceId
+        parameter in the URI.
+
+        :param workspace_id: A unique identifier for the workspace.
+        :type workspace_id: str
+
+        """
+        url = self.ep(f'{workspace_id}/capabilities')
+        data = await super().get(url=url)
+        return CapabilityMap.model_validate(data["capabilities"])
@@ -2,6 +2,7 @@
 REST session for Webex API requests
 """
 import asyncio
+import copy
 import json as json_mod
 import logging
 import ssl
@@ -9,6 +10,7 @@ import urllib.parse
 import uuid
 from asyncio import Semaphore
 from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from functools import wraps
 from io import TextIOBase, StringIO
@@ -23,6 +25,7 @@ from pydantic import ValidationError
 
 from .base import ApiModel, RETRY_429_MAX_WAIT
 from .base import StrOrDict
+from .rest import coalesce_key
 from .tokens import Tokens
 
 __all__ = ['AsErrorMessage', 'AsSingleError', 'AsErrorDetail', 'AsRestError', 'as_dump_response', 'AsRestSession']
@@ -235,6 +238,17 @@ def _dump_response_callback(response: ClientResponse, request_body: str, request
                      diff_ns=diff_ns)
 
 
+@dataclass(init=False, repr=False)
+class _AsInFlightRequest:
+    """
+    A coalesced GET request in flight
+    """
+    #: task executing the request
+    task: asyncio.Future
+    #: number of callers sharing the request
+    callers: int
+
+
 @dataclass(init=False, repr=False)
 class AsRestSession(ClientSession):
     """
@@ -248,6 +262,8 @@ class AsRestSession(ClientSession):
 
     # Bearer token(s) for this session
     _tokens: Tokens
+    #: maximum number of concurrent requests; also the size of the connection pool
+    concurrent_requests: int
     # semaphore for rate limiting
     _sem: Semaphore
     # retry on 429?
@@ -256,10 +272,15 @@ class AsRestSession(ClientSession):
     _response_callback_registry: dict[str, AsRestResponseCallBack]
     # additional request arguments
     _request_arguments: dict
+    # coalesce identical concurrent GET requests?
+    coalesce_gets: bool
+    # coalesced GET requests in flight
+    _in_flight: dict[str, _AsInFlightRequest]
 
     def __init__(self, *, tokens: Tokens, concurrent_requests: int, retry_429: bool = True,
                  trace_configs: list[TraceConfig] = None, proxy_url: str = None,
-                 ssl: Union[bool, aiohttp.Fingerprint, ssl.SSLContext] = None, **kwargs):
+                 ssl: Union[bool, aiohttp.Fingerprint, ssl.SSLContext] = None, coalesce_gets: bool = False,
+                 **kwargs):
         """
         Initialize the REST session
 
@@ -269,15 +290,20 @@ class AsRestSession(ClientSession):
         :param trace_configs: trace configurations, passed to :class:`aiohttp.ClientSession`
         :param proxy_url: used as proxy argument for all :meth:`aiohttp.ClientSession.request` calls
         :param ssl: used as ssl argument for all :meth:`aiohttp.ClientSession.request` calls
+        :param coalesce_gets: coalesce identical concurrent GET requests (same URL, parameters and token): only one
+            request is sent and all callers get a copy of the parsed result
         :param kwargs: additional arguments. All arguments with a "req_" prefix are passed to each
             :meth:`aiohttp.ClientSession.request` call. All other arguments are passed to the constructor of
             :class:`aiohttp.ClientSession`
         """
         self._tokens = tokens
+        self.concurrent_requests = concurrent_requests
         self._sem = Semaphore(concurrent_requests)
         self.retry_429 = retry_429
         self._response_callback_registry = dict()
         self.register_response_callback(_dump_response_callback)
+        self.coalesce_gets = coalesce_gets
+        self._in_flight = dict()
         # keyword arguments for requests start with 'req_'. Any other keyword arguments are passed to the session.
         request_arguments = dict()
         session_arguments = dict()
@@ -456,6 +482,40 @@ class AsRestSession(ClientSession):
 
         return response, response_data
 
+    async def _single_flight_request(self, method: str, url: str, **kwargs) -> Tuple[ClientResponse, StrOrDict]:
+        """
+        Wrapper for :meth:`_request_w_response` which coalesces identical concurrent GET requests if
+        :attr:`coalesce_gets` is set. Callers sharing a request each get their own copy of the parsed body
+
+        :meta private:
+        """
+        key = self.coalesce_gets and coalesce_key(method, url, self._tokens.access_token, kwargs)
+        if not key:
+            return await self._request_w_response(method, url=url, **kwargs)
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            in_flight = _AsInFlightRequest()
+            in_flight.callers = 1
+            in_flight.task = asyncio.ensure_future(self._request_w_response(method, url=url, **kwargs))
+
+            def done(task: asyncio.Future):
+                self._in_flight.pop(key, None)
+                # avoid "exception never retrieved" warnings if all callers have been cancelled
+                if not task.cancelled():
+                    task.exception()
+
+            in_flight.task.add_done_callback(done)
+            self._in_flight[key] = in_flight
+        else:
+            in_flight.callers += 1
+            log.debug(f'coalesced GET {url}')
+        # shield the shared request: cancelling one caller should not cancel the request for all other callers
+        response, data = await asyncio.shield(in_flight.task)
+        if in_flight.callers > 1 and isinstance(data, (dict, list)):
+            # copy on return: each caller gets its own copy of mutable data
+            data = copy.deepcopy(data)
+        return response, data
+
     async def _rest_request(self, method: str, url: str, **kwargs) -> StrOrDict:
         """
         low level API request only returning the body
@@ -471,7 +531,7 @@ class AsRestSession(ClientSession):
         :return: body. Body can be text or dict (parsed from JSON body)
         :rtype: Unon
         """
-        _, data = await self._request_w_response(method, url=url, **kwargs)
+        _, data = await self._single_flight_request(method, url=url, **kwargs)
         return data
 
     async def rest_get(self, *args, **kwargs) -> StrOrDict:
@@ -522,6 +582,77 @@ class AsRestSession(ClientSession):
         """
         return await self._rest_request('PATCH', *args, **kwargs)
 
+    @retry_request
+    async def _stream_request(self, method: str, url: str, headers: dict = None, **kwargs) -> ClientResponse:
+        """
+        low level API REST request with support for 429 rate limiting. The body of a successful response is not read.
+        Response callbacks are only called for error responses.
+
+        :meta private:
+        :return: open streaming response; needs to be released by the caller
+        """
+        request_headers = {'Authorization': f'Bearer {self._tokens.access_token}',
+                           'TrackingID': f'SIMPLE_{uuid.uuid4()}'}
+        if headers:
+            request_headers.update((k.lower(), v) for k, v in headers.items())
+        additional_arguments = dict(kwargs)
+        additional_arguments.update(self._request_arguments or {})
+        start = perf_counter_ns()
+        response = await self.request(method, url=url, headers=request_headers, **additional_arguments)
+        if response.status < 400:
+            return response
+        try:
+            response_data = await response.text()
+            self._dispatch_to_response_callbacks(response=response, request_data=None, request_json=None,
+                                                 response_data=response_data, diff_ns=perf_counter_ns() - start)
+            try:
+                response.raise_for_status()
+            except ClientResponseError as error:
+                raise AsRestError(request_info=error.request_info,
+                                  history=error.history, status=error.status,
+                                  message=error.message, headers=error.headers,
+                                  detail=response_data)
+        finally:
+            response.release()
+
+    @asynccontextmanager
+    async def stream_response(self, method: str, url: str, **kwargs) -> AsyncGenerator[ClientResponse, None]:
+        """
+        Request with a streaming response; for downloads which also need the response headers like
+        content-disposition or content-type. The body is not read and the response is released when leaving the
+        context.
+
+        Example::
+
+            async with api.session.stream_response('GET', url) as response:
+                content_type = response.headers.get('content-type')
+                async for chunk in response.content.iter_chunked(65536):
+                    ...
+
+        :param method: HTTP method
+        :param url: URL
+        :param kwargs: additional keyword arguments for the request like params or headers
+        :return: async context manager for the open response
+        """
+        response = await self._stream_request(method, url=url, **kwargs)
+        try:
+            yield response
+        finally:
+            response.release()
+
+    async def stream_get(self, url: str, chunk_size: int = 65536, **kwargs) -> AsyncGenerator[bytes, None]:
+        """
+        GET request streaming the response body in chunks; for downloads which should not be read into memory at once
+
+        :param url: URL
+        :param chunk_size: maximum size of the chunks
+        :param kwargs: additional keyword arguments for the request like params or headers
+        :return: async generator of body chunks
+        """
+        async with self.stream_response('GET', url=url, **kwargs) as response:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+
     async def follow_pagination(self, url: str, model: Type[ApiModel] = None,
                                 params: dict = None,
                                 item_key: str = None, **kwargs) -> AsyncGenerator[ApiModel, None, None]:
@@ -549,7 +680,7 @@ class AsRestSession(ClientSession):
 
         while url:
             log.debug(f'{self.__class__.__name__}.pagination: getting {url}')
-            response, data = await self._request_w_response('GET', url=url, params=params, **kwargs)
+            response, data = await self._single_flight_request('GET', url=url, params=params, **kwargs)
             # params only in first request. In subsequent requests we rely on the completeness of the 'next' URL
             params = None
             # try to get the next page (if present)
@@ -1,10 +1,8 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import TypeAdapter
-
 from wxc_sdk.api_child import ApiChild
-from wxc_sdk.base import ApiModel, to_camel, SafeEnum
+from wxc_sdk.base import ApiModel, to_camel, SafeEnum, type_adapter
 
 __all__ = ['Authorization', 'AuthorizationType', 'AuthorizationsApi']
 
@@ -101,7 +99,7 @@ class AuthorizationsApi(ApiChild, base='authorizations'):
                 'Invalid parameter combination: exactly one of person_id or person_email has to be present.')
         url = self.ep()
         data = self.get(url, params=params)
-        return TypeAdapter(list[Authorization]).validate_python(data['items'])
+        return type_adapter(list[Authorization]).validate_python(data['items'])
 
     def delete(self, authorization_id: str = None, client_id: str = None, org_id: str = None):
         """
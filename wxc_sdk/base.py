@@ -3,14 +3,15 @@ import logging
 import os
 import sys
 from datetime import datetime
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Optional, Union, Any
 
 from aenum import Enum, extend_enum
 from dateutil import tz
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ValidationError, TypeAdapter
 
 __all__ = ['StrOrDict', 'webex_id_to_uuid', 'to_camel', 'ApiModel', 'CodeAndReason', 'ApiModelWithErrors', 'plus1',
-           'dt_iso_str', 'SafeEnum', 'enum_str', 'RETRY_429_MAX_WAIT']
+           'dt_iso_str', 'SafeEnum', 'enum_str', 'RETRY_429_MAX_WAIT', 'type_adapter']
 
 StrOrDict = Union[str, dict]
 
@@ -135,3 +136,20 @@ def dt_iso_str(dt: datetime, with_msec: bool=True) -> str:
     if not with_msec:
         r = r[:-5] + 'Z'
     return r
+
+
+@lru_cache(maxsize=None)
+def type_adapter(t: Any) -> TypeAdapter:
+    """
+    Cached :class:`pydantic.TypeAdapter` for a type.
+
+    Creating a TypeAdapter builds a validator and serializer core schema which is expensive compared to the actual
+    validation of a typical response. TypeAdapters are created once per type and then reused for all requests.
+
+    Types need to be hashable and must not contain unresolved forward references (strings): forward references
+    would be resolved in the namespace of this module and not in the namespace of the caller.
+
+    :param t: type, for example ``list[Person]``
+    :return: TypeAdapter for the type
+    """
+    return TypeAdapter(t)
@@ -0,0 +1,340 @@
+"""
+Auto-chunking batch writers for SCIM bulk and organization contacts bulk endpoints
+
+Bulk endpoints limit the number of operations per request:
+:meth:`api.scim.bulk.bulk_request <wxc_sdk.scim.bulk.SCIM2BulkApi.bulk_request>` accepts at most 100 operations,
+:meth:`api.org_contacts.bulk_create_or_update <wxc_sdk.org_contacts.OrganizationContactsApi.bulk_create_or_update>`
+and :meth:`api.org_contacts.bulk_delete <wxc_sdk.org_contacts.OrganizationContactsApi.bulk_delete>` have similar
+limits. The writers in this module:
+
+* accept an unbounded (sync or async) iterable of operations, contacts or contact ids and split it into chunks of
+  up to the API limit; the input is consumed lazily
+* send several chunks concurrently; all requests share the concurrency limit and 429 handling of the session
+* map the results in each bulk response back to the inputs: :class:`BulkItemResult`
+* re-queue only the failed operations with a retryable status (429, 5xx, not processed) into later chunks; if a
+  complete request fails with a retryable error then all operations of the chunk are re-queued
+
+Example:
+
+    .. code-block:: python
+
+        async with AsWebexSimpleApi(tokens=token) as api:
+            writer = AsContactsBulkWriter(api, org_id=org_id)
+            report = await writer.create_or_update(contacts_from_hr_system())
+            print(f'{len(report.succeeded)} contacts written, {len(report.failed)} failed, '
+                  f'{report.requests} requests, {report.retries} retries')
+"""
+import asyncio
+import logging
+import uuid
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Generic, Optional, TypeVar, Union
+
+from aiohttp import ClientResponseError
+
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.org_contacts import Contact
+from wxc_sdk.scim.bulk import BulkMethod, BulkOperation
+
+__all__ = ['RETRYABLE_STATUS', 'SCIM_BULK_LIMIT', 'BulkItemResult', 'BulkWriteReport', 'create_operations',
+           'delete_operations', 'AsScimBulkWriter', 'AsContactsBulkWriter']
+
+log = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+#: status codes of failed operations which are re-queued
+RETRYABLE_STATUS = frozenset((429, 500, 502, 503, 504))
+
+#: maximum number of operations in a SCIM bulk request
+SCIM_BULK_LIMIT = 100
+
+
+@dataclass
+class BulkItemResult(Generic[T]):
+    """
+    Result for one input item of a bulk write
+    """
+    #: the input item
+    item: T
+    #: True if the operation succeeded
+    ok: bool = False
+    #: status of the operation; None if no status is available
+    status: Optional[int] = None
+    #: error message for failed operations
+    error: Optional[str] = None
+    #: operation specific result, for example the :class:`BulkResponseOperation
+    #: <wxc_sdk.scim.bulk.BulkResponseOperation>` of a SCIM bulk operation
+    result: Any = None
+    #: number of requests the item was sent in
+    attempts: int = 0
+
+    @property
+    def retryable(self) -> bool:
+        """
+        True if the operation failed with a status which is worth a retry
+        """
+        return not self.ok and (self.status is None or self.status in RETRYABLE_STATUS)
+
+
+@dataclass
+class BulkWriteReport(Generic[T]):
+    """
+    Results of a bulk write
+    """
+    #: final result per input item; in completion order
+    results: list[BulkItemResult[T]] = field(default_factory=list)
+    #: number of bulk requests sent
+    requests: int = 0
+    #: number of operations re-queued after a failure
+    retries: int = 0
+
+    @property
+    def succeeded(self) -> list[BulkItemResult[T]]:
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> list[BulkItemResult[T]]:
+        return [r for r in self.results if not r.ok]
+
+
+def create_operations(resources: Iterable[Any], path: str = '/Users') -> Iterable[BulkOperation]:
+    """
+    SCIM bulk POST operations for resources like :class:`ScimUser <wxc_sdk.scim.users.ScimUser>` or
+    :class:`ScimGroup <wxc_sdk.scim.groups.ScimGroup>`
+
+    :param resources: resources with a ``create_update()`` method
+    :param path: resource type endpoint: ``/Users`` or ``/Groups``
+    """
+    for resource in resources:
+        yield BulkOperation(method=BulkMethod.post, path=path, data=resource.create_update(),
+                            bulk_id=str(uuid.uuid4()))
+
+
+def delete_operations(resource_ids: Iterable[str], path: str = '/Users') -> Iterable[BulkOperation]:
+    """
+    SCIM bulk DELETE operations
+
+    :param resource_ids: ids of users or groups
+    :param path: resource type endpoint: ``/Users`` or ``/Groups``
+    """
+    for resource_id in resource_ids:
+        yield BulkOperation(method=BulkMethod.delete, path=f'{path}/{resource_id}', bulk_id=str(uuid.uuid4()))
+
+
+async def _aiter(source: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[T]:
+    if isinstance(source, AsyncIterable):
+        async for item in source:
+            yield item
+    else:
+        for item in source:
+            yield item
+
+
+def _error_status(e: Exception) -> Optional[int]:
+    """
+    status of an exception raised by a request; None for errors without a status (connection errors, ...)
+    """
+    if isinstance(e, ClientResponseError):
+        return e.status
+    return None
+
+
+class _AsBulkWriter(Generic[T]):
+    """
+    Common logic of the bulk writers: chunking, concurrent requests and re-queueing of failed operations
+    """
+
+    def __init__(self, *, chunk_size: int, concurrency: int, max_attempts: int, retry_delay: float):
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    async def _run(self, source: Union[Iterable[T], AsyncIterable[T]],
+                   send: Callable[[list[BulkItemResult[T]]], Awaitable[None]]) -> BulkWriteReport[T]:
+        """
+        Write all items
+
+        :param source: input items
+        :param send: sends one chunk and updates the results of the chunk in place
+        """
+        report: BulkWriteReport[T] = BulkWriteReport()
+        items = _aiter(source)
+        retry: deque[BulkItemResult[T]] = deque()
+        exhausted = False
+
+        async def next_chunk() -> list[BulkItemResult[T]]:
+            nonlocal exhausted
+            chunk = []
+            while retry and len(chunk) < self.chunk_size:
+                chunk.append(retry.popleft())
+            while not exhausted and len(chunk) < self.chunk_size:
+                try:
+                    chunk.append(BulkItemResult(item=await items.__anext__()))
+                except StopAsyncIteration:
+                    exhausted = True
+            return chunk
+
+        async def send_chunk(chunk: list[BulkItemResult[T]]) -> list[BulkItemResult[T]]:
+            if self.retry_delay and (attempts := max(r.attempts for r in chunk)):
+                await asyncio.sleep(self.retry_delay * attempts)
+            for r in chunk:
+                r.attempts += 1
+                r.ok, r.status, r.error = False, None, None
+            report.requests += 1
+            try:
+                await send(chunk)
+            except Exception as e:
+                log.warning(f'bulk request with {len(chunk)} operations failed: {e}')
+                for r in chunk:
+                    r.status, r.error = _error_status(e), str(e)
+            return chunk
+
+        in_flight: set[asyncio.Future] = set()
+        try:
+            while True:
+                while len(in_flight) < self.concurrency and (chunk := await next_chunk()):
+                    in_flight.add(asyncio.ensure_future(send_chunk(chunk)))
+                if not in_flight:
+                    break
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for r in task.result():
+                        if r.retryable and r.attempts < self.max_attempts:
+                            report.retries += 1
+                            retry.append(r)
+                        else:
+                            report.results.append(r)
+        finally:
+            for task in in_flight:
+                task.cancel()
+        log.debug(f'bulk write: {len(report.results)} items, {len(report.failed)} failed, {report.requests} '
+                  f'requests, {report.retries} retries')
+        return report
+
+
+class AsScimBulkWriter(_AsBulkWriter[BulkOperation]):
+    """
+    Batch writer for :meth:`api.scim.bulk.bulk_request <wxc_sdk.as_api.AsSCIM2BulkApi.bulk_request>`
+    """
+
+    def __init__(self, api: AsWebexSimpleApi, org_id: str, *, chunk_size: int = SCIM_BULK_LIMIT,
+                 concurrency: int = 4, max_attempts: int = 3, retry_delay: float = 1.0,
+                 fail_on_errors: int = SCIM_BULK_LIMIT):
+        """
+        :param api: async API
+        :param org_id: organization
+        :param chunk_size: maximum number of operations per request
+        :param concurrency: maximum number of concurrent requests
+        :param max_attempts: maximum number of attempts per operation
+        :param retry_delay: delay in seconds before a chunk with re-queued operations is sent; multiplied by the
+            number of previous attempts
+        :param fail_on_errors: passed to the bulk request; operations not processed by the server are re-queued
+        """
+        super().__init__(chunk_size=min(chunk_size, SCIM_BULK_LIMIT), concurrency=concurrency,
+                         max_attempts=max_attempts, retry_delay=retry_delay)
+        self.api = api
+        self.org_id = org_id
+        self.fail_on_errors = fail_on_errors
+
+    async def _send(self, chunk: list[BulkItemResult[BulkOperation]]):
+        # make sure that each operation has a bulk id so that results can be mapped back to the inputs
+        for r in chunk:
+            if not r.item.bulk_id:
+                r.item = r.item.model_copy(update={'bulk_id': str(uuid.uuid4())})
+        response = await self.api.scim.bulk.bulk_request(org_id=self.org_id, fail_on_errors=self.fail_on_errors,
+                                                         operations=[r.item for r in chunk])
+        by_bulk_id = {r.item.bulk_id: r for r in chunk}
+        for operation in response.operations or []:
+            if (r := by_bulk_id.pop(operation.bulk_id, None)) is None:
+                log.warning(f'bulk response for unknown bulk id {operation.bulk_id}')
+                continue
+            r.result = operation
+            r.status = operation.status and int(operation.status)
+            r.ok = r.status is not None and 200 <= r.status < 300
+            if not r.ok:
+                error = operation.response and operation.response.error
+                r.error = error and error.details or f'status {r.status}'
+        for r in by_bulk_id.values():
+            # no response: not processed, for example because the failOnErrors threshold was reached
+            r.error = 'not processed'
+
+    async def write(self, operations: Union[Iterable[BulkOperation], AsyncIterable[BulkOperation]]) \
+            -> BulkWriteReport[BulkOperation]:
+        """
+        Send bulk operations in chunks
+
+        :param operations: operations; see :func:`create_operations` and :func:`delete_operations`
+        :return: report with one result per operation
+        """
+        return await self._run(operations, self._send)
+
+
+class AsContactsBulkWriter(_AsBulkWriter):
+    """
+    Batch writer for :meth:`api.org_contacts.bulk_create_or_update
+    <wxc_sdk.as_api.AsOrganizationContactsApi.bulk_create_or_update>` and :meth:`api.org_contacts.bulk_delete
+    <wxc_sdk.as_api.AsOrganizationContactsApi.bulk_delete>`
+    """
+
+    def __init__(self, api: AsWebexSimpleApi, org_id: str, *, chunk_size: int = 100, concurrency: int = 4,
+                 max_attempts: int = 3, retry_delay: float = 1.0):
+        """
+        :param api: async API
+        :param org_id: organization
+        :param chunk_size: maximum number of contacts per request
+        :param concurrency: maximum number of concurrent requests
+        :param max_attempts: maximum number of attempts per contact
+        :param retry_delay: delay in seconds before a chunk with re-queued contacts is sent; multiplied by the
+            number of previous attempts
+        """
+        super().__init__(chunk_size=chunk_size, concurrency=concurrency, max_attempts=max_attempts,
+                         retry_delay=retry_delay)
+        self.api = api
+        self.org_id = org_id
+
+    async def _send_contacts(self, chunk: list[BulkItemResult[Contact]]):
+        response = await self.api.org_contacts.bulk_create_or_update(org_id=self.org_id,
+                                                                     contacts=[r.item for r in chunk])
+        for r in chunk:
+            r.ok, r.status = True, 200
+        by_contact_id = {r.item.contact_id: r for r in chunk if r.item.contact_id}
+        for failed in response.failed_contacts:
+            # failures reference the contact id of updated contacts or the position of the contact in the request
+            r = by_contact_id.get(failed.id)
+            if r is None and failed.id is not None and failed.id.isdigit() and int(failed.id) < len(chunk):
+                r = chunk[int(failed.id)]
+            if r is None:
+                log.warning(f'bulk contacts: failure for unknown contact {failed.id}: {failed.error_message}')
+                continue
+            r.ok = False
+            r.status = failed.status_code or failed.error_code
+            r.error = failed.error_message
+            r.result = failed
+
+    async def _send_deletes(self, chunk: list[BulkItemResult[str]]):
+        await self.api.org_contacts.bulk_delete(org_id=self.org_id, object_ids=[r.item for r in chunk])
+        for r in chunk:
+            r.ok, r.status = True, 204
+
+    async def create_or_update(self, contacts: Union[Iterable[Contact], AsyncIterable[Contact]]) \
+            -> BulkWriteReport[Contact]:
+        """
+        Create or update contacts in chunks
+
+        :param contacts: contacts; contacts with a contact id are updated
+        :return: report with one result per contact
+        """
+        return await self._run(contacts, self._send_contacts)
+
+    async def delete(self, contact_ids: Union[Iterable[str], AsyncIterable[str]]) -> BulkWriteReport[str]:
+        """
+        Delete contacts in chunks
+
+        :param contact_ids: contact ids
+        :return: report with one result per contact id
+        """
+        return await self._run(contact_ids, self._send_deletes)
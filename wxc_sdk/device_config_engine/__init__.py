@@ -0,0 +1,384 @@
+"""
+Bulk device configuration
+
+Changing a device setting on many phones with
+:meth:`api.telephony.devices.update_device_settings <wxc_sdk.telephony.devices.TelephonyDevicesApi.update_device_settings>`
+takes three requests per device (get settings, update settings, apply changes). Device settings can also be set at
+location or organization level and pushed with a single job:
+:meth:`api.telephony.jobs.device_settings.change <wxc_sdk.telephony.jobs.DeviceSettingsJobsApi.change>`. Such a job
+changes the settings of all devices in scope without device level customizations.
+
+:class:`AsBulkDeviceConfigurator` applies a change to a set of devices and picks the cheapest method:
+
+* devices are grouped by location and model; the plan (:class:`ConfigPlan`) assigns each device to an organization
+  level job, a location level job or a per device update
+* jobs are only used if the targets cover the scope of the job (see :class:`ConfigScope`) and if a job covers at least
+  ``job_threshold`` devices
+* devices with device level customizations are not affected by jobs and are always updated individually; the same
+  applies to locations with location level customizations and an organization level job
+* jobs run one after the other (only one device settings job per organization can run at a time) while per device
+  updates run concurrently. If a job fails, all devices of the job are updated individually
+* progress and a per device outcome are reported: :class:`DeviceOutcome`, :class:`BulkConfigReport`
+
+:meth:`AsBulkDeviceConfigurator.update_configurations` applies
+:class:`DeviceConfigurationOperation <wxc_sdk.device_configurations.DeviceConfigurationOperation>` updates to many
+RoomOS devices concurrently.
+
+Example:
+
+    .. code-block:: python
+
+        def change(customizations: DeviceCustomizations):
+            customizations.mpp.display_name_format = DisplayNameSelection.person_last_then_first_name
+
+        async with AsWebexSimpleApi(tokens=token, concurrent_requests=40) as api:
+            targets = [DeviceTarget(device_id=d.device_id, model=d.model, location_id=d.location_id)
+                       for d in mpp_phones]
+            configurator = AsBulkDeviceConfigurator(api, change=change, scope=ConfigScope.locations)
+            report = await configurator.run(targets)
+            print(f'{report.succeeded} succeeded, {report.failed} failed in {report.duration:.0f}s')
+"""
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Optional
+
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.common import DeviceCustomization, DeviceCustomizations
+from wxc_sdk.device_configurations import DeviceConfigurationOperation
+from wxc_sdk.fan_out import FanOutProgress, ProgressCallback, as_items_as_completed
+from wxc_sdk.telephony.jobs import StartJobResponse
+
+__all__ = ['ConfigScope', 'ConfigMethod', 'DeviceTarget', 'DeviceOutcome', 'ConfigPlan', 'BulkConfigReport',
+           'CustomizationChange', 'AsBulkDeviceConfigurator']
+
+log = logging.getLogger(__name__)
+
+#: change to apply; called with the customizations of a device, location or organization and modifies them in place
+CustomizationChange = Callable[[DeviceCustomizations], None]
+
+
+class ConfigScope(str, Enum):
+    """
+    What the targets of a change cover. Determines which jobs can be used
+    """
+    #: targets are an arbitrary set of devices: only per device updates
+    devices = 'devices'
+    #: targets are all devices (affected by the change) in their locations: location level jobs can be used
+    locations = 'locations'
+    #: targets are all devices (affected by the change) in the organization: an organization level job can be used
+    org = 'org'
+
+
+class ConfigMethod(str, Enum):
+    device = 'device'
+    location_job = 'location_job'
+    org_job = 'org_job'
+
+
+@dataclass
+class DeviceTarget:
+    """
+    A device to configure
+    """
+    device_id: str
+    #: device model; needed for device level settings
+    model: str
+    location_id: str
+    #: device has device level customizations; None if unknown. Unknown customization state is read from the device
+    #: if the device is a candidate for a job
+    customized: Optional[bool] = None
+
+
+@dataclass
+class DeviceOutcome:
+    """
+    Result for one device
+    """
+    target: DeviceTarget
+    method: ConfigMethod
+    ok: bool = True
+    error: Optional[str] = None
+    #: id of the job which configured the device
+    job_id: Optional[str] = None
+
+
+@dataclass
+class ConfigPlan:
+    """
+    Assignment of devices to configuration methods
+    """
+    #: devices configured by an organization level job
+    org_job: list[DeviceTarget] = field(default_factory=list)
+    #: devices configured by location level jobs: location id -> devices
+    location_jobs: dict[str, list[DeviceTarget]] = field(default_factory=dict)
+    #: devices updated individually
+    devices: list[DeviceTarget] = field(default_factory=list)
+    #: number of devices by (location id, model)
+    groups: dict[tuple[str, str], int] = field(default_factory=dict)
+
+    @property
+    def requests(self) -> int:
+        """
+        Estimated number of write requests
+        """
+        return bool(self.org_job) + len(self.location_jobs) + 2 * len(self.devices)
+
+
+@dataclass
+class BulkConfigReport:
+    """
+    Result of a bulk configuration
+    """
+    plan: ConfigPlan
+    outcomes: list[DeviceOutcome] = field(default_factory=list)
+    #: final state of all jobs
+    jobs: list[StartJobResponse] = field(default_factory=list)
+    #: duration in seconds
+    duration: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(o.ok for o in self.outcomes)
+
+    @property
+    def failed(self) -> int:
+        return sum(not o.ok for o in self.outcomes)
+
+
+class AsBulkDeviceConfigurator:
+    """
+    Apply a device settings change to many devices using jobs where possible and concurrent per device updates
+    otherwise
+    """
+
+    def __init__(self, api: AsWebexSimpleApi, *, change: CustomizationChange, scope: ConfigScope = ConfigScope.devices,
+                 job_threshold: int = 50, concurrency: int = 20, apply_changes: bool = True,
+                 job_poll_interval: float = 10.0, job_timeout: float = 3600.0, org_id: str = None,
+                 progress: ProgressCallback = None):
+        """
+        :param api: async API
+        :param change: change to apply to device, location or organization customizations
+        :param scope: what the targets cover; determines which jobs can be used
+        :param job_threshold: minimum number of devices for a job; smaller groups are updated individually
+        :param concurrency: maximum number of concurrent per device updates
+        :param apply_changes: apply changes to devices after per device updates
+        :param job_poll_interval: seconds between job status polls
+        :param job_timeout: maximum time in seconds to wait for a job
+        :param org_id: organization
+        :param progress: callback for progress reporting; called after each device outcome
+        """
+        self.api = api
+        self.change = change
+        self.scope = scope
+        self.job_threshold = job_threshold
+        self.concurrency = concurrency
+        self.apply_changes = apply_changes
+        self.job_poll_interval = job_poll_interval
+        self.job_timeout = job_timeout
+        self.org_id = org_id
+        self.progress = progress
+        self._settings: dict[str, DeviceCustomization] = dict()
+        self._state: Optional[FanOutProgress] = None
+
+    async def _read_customized(self, targets: list[DeviceTarget]):
+        """
+        read device settings of devices with unknown customization state. Settings are kept for per device updates
+        """
+
+        async def read(target: DeviceTarget):
+            return await self.api.telephony.devices.device_settings(device_id=target.device_id,
+                                                                     device_model=target.model, org_id=self.org_id)
+
+        async for result in as_items_as_completed(read, targets, concurrency=self.concurrency):
+            if result.ok:
+                self._settings[result.item.device_id] = result.result
+                result.item.customized = bool(result.result.custom_enabled)
+            else:
+                # can't tell; updating the device individually is always safe
+                result.item.customized = True
+
+    async def plan(self, targets: Iterable[DeviceTarget]) -> ConfigPlan:
+        """
+        Assign devices to configuration methods
+
+        :param targets: devices to configure
+        :return: plan
+        """
+        targets = list(targets)
+        plan = ConfigPlan()
+        for target in targets:
+            key = (target.location_id, target.model)
+            plan.groups[key] = plan.groups.get(key, 0) + 1
+        if self.scope == ConfigScope.devices or len(targets) < self.job_threshold:
+            plan.devices = targets
+            return plan
+
+        await self._read_customized([t for t in targets if t.customized is None])
+        by_location: dict[str, list[DeviceTarget]] = defaultdict(list)
+        for target in targets:
+            if target.customized:
+                plan.devices.append(target)
+            else:
+                by_location[target.location_id].append(target)
+
+        location_candidates = by_location
+        if self.scope == ConfigScope.org:
+            # locations with location level customizations are not affected by an organization level job
+            async def location_settings(location_id: str) -> DeviceCustomization:
+                return await self.api.telephony.location.device_settings(location_id=location_id,
+                                                                         org_id=self.org_id)
+
+            customized_locations = set()
+            async for result in as_items_as_completed(location_settings, list(by_location),
+                                                      concurrency=self.concurrency):
+                # if the location settings can't be read then assume that the location is customized
+                if not result.ok or result.result.custom_enabled:
+                    customized_locations.add(result.item)
+            org_targets = [t for location_id, location_targets in by_location.items()
+                           if location_id not in customized_locations
+                           for t in location_targets]
+            if len(org_targets) >= self.job_threshold:
+                plan.org_job = org_targets
+                location_candidates = {location_id: by_location[location_id]
+                                       for location_id in customized_locations}
+        for location_id, location_targets in location_candidates.items():
+            if len(location_targets) >= self.job_threshold:
+                plan.location_jobs[location_id] = location_targets
+            else:
+                plan.devices.extend(location_targets)
+        log.info(f'plan: {len(plan.org_job)} devices in org job, {len(plan.location_jobs)} location jobs with '
+                 f'{sum(map(len, plan.location_jobs.values()))} devices, {len(plan.devices)} per device updates')
+        return plan
+
+    def _report(self, report: BulkConfigReport, outcome: DeviceOutcome):
+        report.outcomes.append(outcome)
+        if self._state is not None:
+            self._state.completed(failed=not outcome.ok)
+            if self.progress is not None:
+                self.progress(self._state)
+
+    async def _update_device(self, target: DeviceTarget):
+        settings = self._settings.pop(target.device_id, None)
+        if settings is None:
+            settings = await self.api.telephony.devices.device_settings(device_id=target.device_id,
+                                                                         device_model=target.model,
+                                                                         org_id=self.org_id)
+        self.change(settings.customizations)
+        settings.custom_enabled = True
+        await self.api.telephony.devices.update_device_settings(device_id=target.device_id,
+                                                                 device_model=target.model, customization=settings,
+                                                                 org_id=self.org_id)
+        if self.apply_changes:
+            await self.api.telephony.devices.apply_changes(device_id=target.device_id, org_id=self.org_id)
+
+    async def _update_devices(self, targets: list[DeviceTarget], report: BulkConfigReport):
+        async for result in as_items_as_completed(self._update_device, targets, concurrency=self.concurrency):
+            self._report(report, DeviceOutcome(target=result.item, method=ConfigMethod.device, ok=result.ok,
+                                               error=None if result.ok else str(result.exception)))
+
+    async def _wait_for_job(self, job: StartJobResponse) -> StartJobResponse:
+        deadline = time.monotonic() + self.job_timeout
+        while job.latest_execution_status not in ('COMPLETED', 'FAILED'):
+            if time.monotonic() > deadline:
+                raise TimeoutError(f'job {job.id} not completed after {self.job_timeout}s')
+            await asyncio.sleep(self.job_poll_interval)
+            job = await self.api.telephony.jobs.device_settings.status(job_id=job.id, org_id=self.org_id)
+        return job
+
+    async def _run_job(self, location_id: Optional[str], targets: list[DeviceTarget],
+                       report: BulkConfigReport) -> list[DeviceTarget]:
+        """
+        run one job and report outcomes
+
+        :return: devices to be updated individually because the job failed
+        """
+        method = ConfigMethod.location_job if location_id else ConfigMethod.org_job
+        try:
+            if location_id:
+                settings = await self.api.telephony.location.device_settings(location_id=location_id,
+                                                                             org_id=self.org_id)
+                settings.custom_enabled = True
+            else:
+                settings = await self.api.telephony.device_settings(org_id=self.org_id)
+            self.change(settings.customizations)
+            job = await self.api.telephony.jobs.device_settings.change(location_id=location_id,
+                                                                       customization=settings, org_id=self.org_id)
+            job = await self._wait_for_job(job)
+        except Exception as e:
+            log.warning(f'{method.value} for {location_id or "organization"} failed: {e}; updating devices '
+                        f'individually')
+            return targets
+        report.jobs.append(job)
+        if job.latest_execution_status != 'COMPLETED':
+            log.warning(f'job {job.id} for {location_id or "organization"} {job.latest_execution_status}; updating '
+                        f'devices individually')
+            return targets
+        errors = dict()
+        async for error in self.api.telephony.jobs.device_settings.errors_gen(job_id=job.id, org_id=self.org_id):
+            message = '; '.join(m.description for m in error.error.message) or error.error.key
+            errors[error.item] = message
+        for target in targets:
+            error = errors.get(target.device_id)
+            self._report(report, DeviceOutcome(target=target, method=method, ok=error is None, error=error,
+                                               job_id=job.id))
+        return []
+
+    async def _run_jobs(self, plan: ConfigPlan, report: BulkConfigReport) -> list[DeviceTarget]:
+        fallback = []
+        if plan.org_job:
+            fallback.extend(await self._run_job(None, plan.org_job, report))
+        for location_id, targets in plan.location_jobs.items():
+            fallback.extend(await self._run_job(location_id, targets, report))
+        return fallback
+
+    async def run(self, targets: Iterable[DeviceTarget], plan: ConfigPlan = None) -> BulkConfigReport:
+        """
+        Apply the change to all targets
+
+        :param targets: devices to configure
+        :param plan: plan to execute. Default: create a plan using :meth:`plan`
+        :return: report with one outcome per device
+        """
+        start = time.perf_counter()
+        targets = list(targets)
+        if plan is None:
+            plan = await self.plan(targets)
+        report = BulkConfigReport(plan=plan)
+        self._state = FanOutProgress(total=len(targets))
+        # jobs run one after the other in the background while devices are updated individually
+        jobs = asyncio.ensure_future(self._run_jobs(plan, report))
+        await self._update_devices(plan.devices, report)
+        fallback = await jobs
+        if fallback:
+            await self._update_devices(fallback, report)
+        self._state = None
+        self._settings.clear()
+        report.duration = time.perf_counter() - start
+        log.info(f'bulk configuration: {report.succeeded} succeeded, {report.failed} failed, '
+                 f'{report.duration:.1f}s')
+        return report
+
+    async def update_configurations(self, device_ids: Iterable[str],
+                                    operations: list[DeviceConfigurationOperation]) -> dict[str, Optional[str]]:
+        """
+        Apply device configuration operations to many devices concurrently. Device configurations (RoomOS devices)
+        only exist at device level
+
+        :param device_ids: devices to update
+        :param operations: operations to apply to each device
+        :return: outcome per device: device id -> None on success, else error message
+        """
+
+        async def update(device_id: str):
+            return await self.api.device_configurations.update(device_id=device_id, operations=operations)
+
+        outcomes = dict()
+        async for result in as_items_as_completed(update, device_ids, concurrency=self.concurrency,
+                                                  progress=self.progress):
+            outcomes[result.item] = None if result.ok else str(result.exception)
+        return outcomes
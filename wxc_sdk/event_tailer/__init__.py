@@ -0,0 +1,274 @@
+"""
+Tail compliance events and admin audit events
+
+Compliance events (:meth:`api.events.list <wxc_sdk.events.EventsApi.list>`) and admin audit events
+(:meth:`api.admin_audit.list_events <wxc_sdk.admin_audit.AdminAuditEventsApi.list_events>`) can only be pulled.
+:class:`AsEventTailer` turns these endpoints into a continuous async stream of new events:
+
+* polls with overlapping time windows so that events which show up late are not missed
+* de-duplicates events by id with a bounded set of recently seen ids: :class:`SeenIds`
+* persists a cursor (watermark and recently seen ids) after each poll so that a restarted tailer continues where it
+  left off: :class:`TailCursor`, :class:`FileCursorStore`
+* adapts the polling interval to the event rate: the interval is halved after each poll with new events and grows
+  after polls without new events
+
+Example:
+
+    .. code-block:: python
+
+        async with AsWebexSimpleApi(tokens=token) as api:
+            tailer = AsEventTailer.admin_audit(api, org_id=org_id,
+                                               store=FileCursorStore('audit_cursor.json'))
+            async for event in tailer.events():
+                siem.send(event.model_dump_json())
+"""
+import asyncio
+import json
+import logging
+import os
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Callable, Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Protocol
+
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.base import ApiModel
+
+__all__ = ['SeenIds', 'TailCursor', 'CursorStore', 'FileCursorStore', 'EventFetch', 'AsEventTailer']
+
+log = logging.getLogger(__name__)
+
+#: async function returning an async generator of events in the time window [from, to)
+EventFetch = Callable[[datetime, datetime], AsyncGenerator[Any, None]]
+
+
+def _utc_now() -> datetime:
+    return datetime.now(tz=timezone.utc)
+
+
+class SeenIds:
+    """
+    Bounded set of recently seen event ids; the oldest ids are evicted first
+    """
+
+    def __init__(self, maxsize: int = 10000, ids: Iterable[str] = None):
+        self.maxsize = maxsize
+        self._ids: OrderedDict[str, None] = OrderedDict()
+        for event_id in ids or ():
+            self.add(event_id)
+
+    def add(self, event_id: str) -> bool:
+        """
+        Add an id
+
+        :return: True if the id was new
+        """
+        if event_id in self._ids:
+            self._ids.move_to_end(event_id)
+            return False
+        self._ids[event_id] = None
+        if len(self._ids) > self.maxsize:
+            self._ids.popitem(last=False)
+        return True
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self):
+        return iter(self._ids)
+
+
+class TailCursor(ApiModel):
+    """
+    Persistent state of a tailer
+    """
+    #: creation time of the newest event seen so far
+    watermark: datetime
+    #: ids of recently seen events, oldest first
+    seen_ids: list[str] = []
+
+
+class CursorStore(Protocol):
+    """
+    Persistence for a :class:`TailCursor`
+    """
+
+    def load(self) -> Optional[TailCursor]:
+        ...
+
+    def save(self, cursor: TailCursor):
+        ...
+
+
+class FileCursorStore:
+    """
+    Store a cursor in a JSON file. The file is replaced atomically
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[TailCursor]:
+        """
+        Load the cursor; None if the file does not exist
+        """
+        try:
+            with open(self.path, mode='r') as f:
+                return TailCursor.model_validate(json.load(f))
+        except FileNotFoundError:
+            return None
+
+    def save(self, cursor: TailCursor):
+        """
+        Save the cursor
+        """
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, mode='w') as f:
+            f.write(cursor.model_dump_json())
+        os.replace(tmp_path, self.path)
+
+
+class AsEventTailer:
+    """
+    Tail events from a pull-only list endpoint as an async stream
+    """
+
+    def __init__(self, fetch: EventFetch, *, store: CursorStore = None, start: datetime = None,
+                 overlap: timedelta = timedelta(minutes=5), min_interval: float = 5.0, max_interval: float = 300.0,
+                 seen_size: int = 10000, now: Callable[[], datetime] = None):
+        """
+        :param fetch: function returning an async generator of events in a time window, called with from and to
+            datetime. Events need to have ``id`` and ``created`` attributes
+        :param store: cursor persistence. If the store has a cursor then tailing continues from that cursor
+        :param start: start time if there is no persisted cursor. Default: now
+        :param overlap: overlap of consecutive polling windows. Events created up to this time before the newest event
+            seen so far are still picked up
+        :param min_interval: minimum polling interval in seconds
+        :param max_interval: maximum polling interval in seconds
+        :param seen_size: maximum number of event ids kept for de-duplication
+        :param now: clock; returns the current time as timezone aware datetime
+        """
+        self._fetch = fetch
+        self.store = store
+        self.overlap = overlap
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._now = now or _utc_now
+        #: current polling interval in seconds
+        self.interval = min_interval
+        cursor = store and store.load()
+        if cursor is None:
+            cursor = TailCursor(watermark=start or self._now())
+        self.watermark: datetime = cursor.watermark
+        self.seen = SeenIds(maxsize=seen_size, ids=cursor.seen_ids)
+        self._stop: Optional[asyncio.Event] = None
+
+    @classmethod
+    def compliance_events(cls, api: AsWebexSimpleApi, *, resource: str = None, type_: str = None,
+                          actor_id: str = None, **kwargs) -> 'AsEventTailer':
+        """
+        Tailer for compliance events: :meth:`api.events.list_gen <wxc_sdk.as_api.AsEventsApi.list_gen>`
+
+        :param api: async API
+        :param resource: only events for this resource type
+        :param type_: only events of this type
+        :param actor_id: only events performed by this person
+        :param kwargs: passed to the :class:`AsEventTailer` constructor
+        """
+
+        def fetch(from_: datetime, to_: datetime):
+            return api.events.list_gen(resource=resource, type_=type_, actor_id=actor_id, from_=from_, to_=to_)
+
+        return cls(fetch, **kwargs)
+
+    @classmethod
+    def admin_audit(cls, api: AsWebexSimpleApi, *, org_id: str, actor_id: str = None,
+                    event_categories: list[str] = None, **kwargs) -> 'AsEventTailer':
+        """
+        Tailer for admin audit events:
+        :meth:`api.admin_audit.list_events_gen <wxc_sdk.as_api.AsAdminAuditEventsApi.list_events_gen>`
+
+        :param api: async API
+        :param org_id: organization
+        :param actor_id: only events performed by this person
+        :param event_categories: only events in these categories
+        :param kwargs: passed to the :class:`AsEventTailer` constructor
+        """
+
+        def fetch(from_: datetime, to_: datetime):
+            return api.admin_audit.list_events_gen(org_id=org_id, from_=from_, to_=to_, actor_id=actor_id,
+                                                   event_categories=event_categories)
+
+        return cls(fetch, **kwargs)
+
+    @property
+    def cursor(self) -> TailCursor:
+        """
+        Current cursor
+        """
+        return TailCursor(watermark=self.watermark, seen_ids=list(self.seen))
+
+    async def poll(self) -> list:
+        """
+        Poll once: get all events in the window from watermark - overlap to now which have not been seen before
+
+        :return: new events, oldest first
+        """
+        to_ = self._now()
+        from_ = self.watermark - self.overlap
+        events = [event async for event in self._fetch(from_, to_)]
+        new = [event for event in events if event.id not in self.seen]
+        new.sort(key=lambda e: e.created or to_)
+        for event in new:
+            self.seen.add(event.id)
+            if event.created and event.created > self.watermark:
+                self.watermark = event.created
+        log.debug(f'poll {from_.isoformat()} - {to_.isoformat()}: {len(events)} events, {len(new)} new')
+        return new
+
+    def _adapt(self, new_events: int):
+        if new_events:
+            self.interval = max(self.min_interval, self.interval / 2)
+        else:
+            self.interval = min(self.max_interval, self.interval * 1.5)
+
+    def save(self):
+        """
+        Persist the current cursor
+        """
+        if self.store is not None:
+            self.store.save(self.cursor)
+
+    async def events(self) -> AsyncGenerator[Any, None]:
+        """
+        Async stream of new events; runs until :meth:`stop` is called.
+
+        The cursor is persisted after all events of a poll have been consumed: after a restart events are delivered
+        at least once.
+        """
+        self._stop = asyncio.Event()
+        while not self._stop.is_set():
+            try:
+                new = await self.poll()
+            except Exception as e:
+                log.warning(f'poll failed: {e}')
+                self.interval = min(self.max_interval, self.interval * 2)
+            else:
+                for event in new:
+                    yield event
+                self.save()
+                self._adapt(len(new))
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self):
+        """
+        Stop the stream returned by :meth:`events` after the current poll
+        """
+        if self._stop is not None:
+            self._stop.set()
@@ -0,0 +1,295 @@
+"""
+Fan-out helpers: call a function for many items concurrently
+
+:meth:`WebexSimpleApi.map <wxc_sdk.WebexSimpleApi.map>` and
+:meth:`WebexSimpleApi.as_completed <wxc_sdk.WebexSimpleApi.as_completed>` (and their async counterparts in
+:class:`AsWebexSimpleApi <wxc_sdk.as_api.AsWebexSimpleApi>`) are based on the helpers in this module:
+
+* :func:`items_as_completed`/:func:`map_items`: thread pool based for the sync API
+* :func:`as_items_as_completed`/:func:`as_map_items`: task based for the async API
+
+Compared to a plain :class:`concurrent.futures.ThreadPoolExecutor`:
+
+* the number of workers defaults to the concurrency limit of the session. The connection pool of the session has the
+  same size, so worker threads never queue on connections, and all calls share the session's request semaphore and
+  429 handling
+* items are submitted in a bounded window; a large (or lazy) iterable is not materialized up front
+* per item exceptions are returned as results: :class:`ItemResult`
+* optionally the first exception cancels all remaining work
+* progress and throughput are reported through a callback: :class:`FanOutProgress`
+
+Example:
+
+    .. code-block:: python
+
+        with WebexSimpleApi(concurrent_requests=20) as api:
+            users = api.people.list()
+            details = api.map(lambda user: api.people.details(person_id=user.person_id, calling_data=True),
+                              users,
+                              progress=lambda p: print(f'{p.done}/{p.total} {p.rate:.1f}/s'))
+"""
+import asyncio
+import logging
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Iterable, Sized
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import Generic, Optional, TypeVar, Union
+
+__all__ = ['FanOutProgress', 'ProgressCallback', 'ItemResult', 'items_as_completed', 'map_items',
+           'as_items_as_completed', 'as_map_items']
+
+log = logging.getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+@dataclass
+class FanOutProgress:
+    """
+    Progress of a fan-out
+    """
+    #: number of completed items
+    done: int = 0
+    #: number of failed items
+    errors: int = 0
+    #: total number of items; None if the number of items is not known up front
+    total: Optional[int] = None
+    #: seconds since the start of the fan-out
+    elapsed: float = 0.0
+    #: start time; :func:`time.perf_counter` value
+    start: float = field(default_factory=time.perf_counter, repr=False)
+
+    @property
+    def rate(self) -> float:
+        """
+        throughput: completed items per second
+        """
+        return self.elapsed and self.done / self.elapsed or 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """
+        estimated number of seconds until all items are completed; None if unknown
+        """
+        if self.total is None or not self.rate:
+            return None
+        return (self.total - self.done) / self.rate
+
+    def completed(self, failed: bool = False):
+        """
+        Record a completed item. Can be used to report progress of work which is not a single fan-out
+
+        :param failed: True if the item failed
+        """
+        self.done += 1
+        self.errors += failed
+        self.elapsed = time.perf_counter() - self.start
+
+
+#: progress callback; called with the current progress after each completed item
+ProgressCallback = Callable[[FanOutProgress], None]
+
+
+@dataclass
+class ItemResult(Generic[T, R]):
+    """
+    Result of the call for one item
+    """
+    #: position of the item in the iterable
+    index: int
+    #: the item
+    item: T
+    #: return value of the call; None if the call failed
+    result: Optional[R] = None
+    #: exception raised by the call
+    exception: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if the call did not raise an exception
+        """
+        return self.exception is None
+
+    def value(self) -> Union[R, BaseException]:
+        """
+        Result or exception
+        """
+        return self.result if self.exception is None else self.exception
+
+
+def _progress(items: Iterable) -> FanOutProgress:
+    return FanOutProgress(total=len(items) if isinstance(items, Sized) else None)
+
+
+def _report(progress: FanOutProgress, result: ItemResult, callback: Optional[ProgressCallback]):
+    progress.completed(failed=not result.ok)
+    if not result.ok:
+        log.debug(f'fan-out: item {result.index} failed: {result.exception}')
+    if callback is not None:
+        callback(progress)
+
+
+def items_as_completed(fn: Callable[[T], R], items: Iterable[T], *, max_workers: int, cancel_on_error: bool = False,
+                       progress: ProgressCallback = None) -> Generator[ItemResult[T, R], None, None]:
+    """
+    Call a function for each item in a thread pool and yield the results as they complete
+
+    :param fn: function to call for each item
+    :param items: items; consumed lazily in a window of twice the number of workers
+    :param max_workers: number of worker threads
+    :param cancel_on_error: stop after the first failed call: the failed result is yielded, calls not started yet are
+        cancelled and the generator ends
+    :param progress: callback for progress reporting
+    :return: generator of results in completion order
+    """
+    state = _progress(items)
+    source = enumerate(items)
+    pending: dict[Future, tuple[int, T]] = dict()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fan_out') as pool:
+
+        def submit_next() -> bool:
+            for index, item in source:
+                pending[pool.submit(fn, item)] = (index, item)
+                return True
+            return False
+
+        try:
+            for _ in range(2 * max_workers):
+                if not submit_next():
+                    break
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, item = pending.pop(future)
+                    exception = future.exception()
+                    result = ItemResult(index=index, item=item, exception=exception,
+                                        result=None if exception else future.result())
+                    _report(state, result, progress)
+                    yield result
+                    if exception is not None and cancel_on_error:
+                        log.debug(f'fan-out: cancelling after failed item {index}')
+                        return
+                    submit_next()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def map_items(fn: Callable[[T], R], items: Iterable[T], *, max_workers: int, return_exceptions: bool = True,
+              cancel_on_error: bool = False, progress: ProgressCallback = None) -> list[Union[R, BaseException]]:
+    """
+    Call a function for each item in a thread pool and return the results in the order of the items
+
+    :param fn: function to call for each item
+    :param items: items
+    :param max_workers: number of worker threads
+    :param return_exceptions: return exceptions as results. Else the first exception (in item order) is raised after
+        all calls completed
+    :param cancel_on_error: raise the first exception immediately and cancel all calls not started yet
+    :param progress: callback for progress reporting
+    :return: list of results (or exceptions)
+    """
+    results: dict[int, ItemResult] = dict()
+    with closing(items_as_completed(fn, items, max_workers=max_workers, cancel_on_error=cancel_on_error,
+                                    progress=progress)) as gen:
+        for result in gen:
+            if not result.ok and cancel_on_error:
+                raise result.exception
+            results[result.index] = result
+    ordered = [results[i] for i in range(len(results))]
+    if not return_exceptions:
+        for result in ordered:
+            if not result.ok:
+                raise result.exception
+    return [result.value() for result in ordered]
+
+
+async def as_items_as_completed(fn: Callable[[T], Awaitable[R]], items: Iterable[T], *, concurrency: int,
+                                cancel_on_error: bool = False,
+                                progress: ProgressCallback = None) -> AsyncGenerator[ItemResult[T, R], None]:
+    """
+    Await a coroutine for each item with bounded concurrency and yield the results as they complete. Async
+    counterpart of :func:`items_as_completed`
+
+    :param fn: function returning an awaitable for an item
+    :param items: items; consumed lazily
+    :param concurrency: maximum number of concurrent calls
+    :param cancel_on_error: stop after the first failed call: the failed result is yielded, all other calls are
+        cancelled and the generator ends
+    :param progress: callback for progress reporting
+    :return: async generator of results in completion order
+    """
+
+    async def call(item: T) -> R:
+        return await fn(item)
+
+    state = _progress(items)
+    source = enumerate(items)
+    pending: dict[asyncio.Task, tuple[int, T]] = dict()
+
+    def submit_next() -> bool:
+        for index, item in source:
+            pending[asyncio.ensure_future(call(item))] = (index, item)
+            return True
+        return False
+
+    try:
+        for _ in range(concurrency):
+            if not submit_next():
+                break
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index, item = pending.pop(task)
+                exception = task.exception()
+                result = ItemResult(index=index, item=item, exception=exception,
+                                    result=None if exception else task.result())
+                _report(state, result, progress)
+                yield result
+                if exception is not None and cancel_on_error:
+                    log.debug(f'fan-out: cancelling after failed item {index}')
+                    return
+                submit_next()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def as_map_items(fn: Callable[[T], Awaitable[R]], items: Iterable[T], *, concurrency: int,
+                       return_exceptions: bool = True, cancel_on_error: bool = False,
+                       progress: ProgressCallback = None) -> list[Union[R, BaseException]]:
+    """
+    Await a coroutine for each item with bounded concurrency and return the results in the order of the items. Async
+    counterpart of :func:`map_items`
+
+    :param fn: function returning an awaitable for an item
+    :param items: items
+    :param concurrency: maximum number of concurrent calls
+    :param return_exceptions: return exceptions as results. Else the first exception (in item order) is raised after
+        all calls completed
+    :param cancel_on_error: raise the first exception immediately and cancel all other calls
+    :param progress: callback for progress reporting
+    :return: list of results (or exceptions)
+    """
+    results: dict[int, ItemResult] = dict()
+    gen = as_items_as_completed(fn, items, concurrency=concurrency, cancel_on_error=cancel_on_error,
+                                progress=progress)
+    try:
+        async for result in gen:
+            if not result.ok and cancel_on_error:
+                raise result.exception
+            results[result.index] = result
+    finally:
+        await gen.aclose()
+    ordered = [results[i] for i in range(len(results))]
+    if not return_exceptions:
+        for result in ordered:
+            if not result.ok:
+                raise result.exception
+    return [result.value() for result in ordered]
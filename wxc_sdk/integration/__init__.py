@@ -1,19 +1,45 @@
 """
 An OAuth integration
+
+Tokens of an integration can be cached in a :class:`TokenStore` which is shared by multiple processes:
+:class:`FileTokenStore` (YAML file with file locking) or :class:`SqliteTokenStore`. Refreshes are coordinated through
+the lock of the store: only one process refreshes the tokens while all other processes wait and then use the new
+tokens. :class:`SharedTokens` keeps the tokens of a process in sync with a store without reading the store for each
+request.
+
+Example:
+
+    .. code-block:: python
+
+        store = FileTokenStore('tokens.yml')
+        with SharedTokens(integration=integration, store=store) as shared:
+            with WebexSimpleApi(tokens=shared.tokens) as api:
+                ...
 """
 import concurrent.futures
+import contextlib
 import http.server
 import json
 import logging
+import os
 import socketserver
+import sqlite3
 import threading
 import urllib.parse
 import uuid
 import webbrowser
-from collections.abc import Callable
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable, Iterator
 from dataclasses import dataclass
 from typing import Union, Optional
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Windows
+    fcntl = None
+    import msvcrt
+
 import requests
 import yaml
 
@@ -22,7 +48,169 @@ from ..tokens import Tokens
 
 log = logging.getLogger(__name__)
 
-__all__ = ['Integration']
+__all__ = ['Integration', 'TokenStore', 'FileTokenStore', 'SqliteTokenStore', 'SharedTokens']
+
+
+class TokenStore(ABC):
+    """
+    Storage for tokens which can be shared by multiple processes
+    """
+
+    @abstractmethod
+    def read(self) -> Optional[Tokens]:
+        """
+        Read tokens from the store
+
+        :return: tokens or None if the store has no (valid) tokens
+        """
+        ...
+
+    @abstractmethod
+    def write(self, tokens: Tokens):
+        """
+        Write tokens to the store. Readers never see partially written tokens
+        """
+        ...
+
+    @abstractmethod
+    def lock(self) -> contextlib.AbstractContextManager:
+        """
+        Exclusive lock across processes; used to coordinate token refreshes. Writing tokens while holding the lock
+        is allowed
+        """
+        ...
+
+    @abstractmethod
+    def version(self) -> Hashable:
+        """
+        Cheap indicator which changes whenever tokens are written. Used to detect tokens written by other processes
+        without reading the tokens
+        """
+        ...
+
+
+class FileTokenStore(TokenStore):
+    """
+    Tokens in a YAML file; same format as used by :meth:`Integration.get_cached_tokens_from_yml`.
+
+    Tokens are written to a temporary file which then replaces the YAML file. The lock is an exclusive lock on a lock
+    file next to the YAML file.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: path of the YAML file
+        """
+        self.path = path
+        self.lock_path = f'{path}.lock'
+
+    def read(self) -> Optional[Tokens]:
+        try:
+            with open(self.path, mode='r') as f:
+                data = yaml.safe_load(f)
+            return Tokens.model_validate(data)
+        except Exception as e:
+            log.info(f'failed to read tokens from file: {e}')
+            return None
+
+    def write(self, tokens: Tokens):
+        temp_path = f'{self.path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temp_path, mode='w') as f:
+            yaml.safe_dump(json.loads(tokens.model_dump_json()), f)
+        os.replace(temp_path, self.path)
+
+    @contextlib.contextmanager
+    def lock(self) -> Iterator[None]:
+        with open(self.lock_path, mode='a+') as f:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:  # pragma: no cover
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:  # pragma: no cover
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def version(self) -> Hashable:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        # the file is replaced on each write: a new inode
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class SqliteTokenStore(TokenStore):
+    """
+    Tokens in a sqlite database. The lock is an immediate (write) transaction on the database
+    """
+
+    def __init__(self, path: str, timeout: float = 60.0):
+        """
+        :param path: path of the database file
+        :param timeout: maximum time in seconds to wait for the lock held by another process
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        with contextlib.closing(self._connect()) as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS tokens '
+                               '(id INTEGER PRIMARY KEY CHECK (id = 1), data TEXT NOT NULL, version INTEGER NOT NULL)')
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+
+    @contextlib.contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        # while the lock is held the connection of the lock has to be used for all operations
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            yield connection
+            return
+        with contextlib.closing(self._connect()) as connection:
+            yield connection
+
+    def read(self) -> Optional[Tokens]:
+        with self._connection() as connection:
+            row = connection.execute('SELECT data FROM tokens WHERE id = 1').fetchone()
+        if row is None:
+            return None
+        try:
+            return Tokens.model_validate_json(row[0])
+        except ValueError as e:
+            log.info(f'failed to read tokens from database: {e}')
+            return None
+
+    def write(self, tokens: Tokens):
+        with self._connection() as connection:
+            connection.execute('INSERT INTO tokens (id, data, version) VALUES (1, ?, 1) '
+                               'ON CONFLICT (id) DO UPDATE SET data = excluded.data, version = version + 1',
+                               (tokens.model_dump_json(),))
+
+    @contextlib.contextmanager
+    def lock(self) -> Iterator[None]:
+        with contextlib.closing(self._connect()) as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            self._local.connection = connection
+            try:
+                yield
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+            else:
+                connection.execute('COMMIT')
+            finally:
+                self._local.connection = None
+
+    def version(self) -> Hashable:
+        with self._connection() as connection:
+            row = connection.execute('SELECT version FROM tokens WHERE id = 1').fetchone()
+        return row and row[0]
 
 
 @dataclass(init=False, repr=False)
@@ -313,6 +501,8 @@ class Integration:
         Tokens are read from given YML file and then verified. If needed an OAuth flow is initiated to get a new
         set of tokens. For this the redirect URL http://localhost:6001/redirect is expected.
 
+        The YML file is locked while tokens are refreshed; see :class:`FileTokenStore`.
+
         :param yml_path: path to YML file to be used to cache tokens
         :param force_new: flag, don't read cached tokens and always get tokens from OAuth flow
         :type force_new: bool
@@ -320,21 +510,132 @@ class Integration:
         :return: set of tokens or None
         :rtype: :class:`wxc_sdk.tokens.Tokens`
         """
+        return self.get_tokens_from_store(store=FileTokenStore(yml_path), force_new=force_new)
 
-        def write_tokens(tokens_to_cache: Tokens):
-            with open(yml_path, mode='w') as f:
-                yaml.safe_dump(json.loads(tokens_to_cache.model_dump_json()), f)
-            return
+    def get_tokens_from_store(self, store: TokenStore, min_lifetime_seconds: int = 300, force_new: bool = False,
+                              oauth_flow: bool = True) -> Optional[Tokens]:
+        """
+        Get tokens from a token store shared by multiple processes.
+
+        Valid tokens are returned without locking the store. Else the lock of the store is acquired and the tokens
+        are read again: another process might have refreshed them in the meantime. Only if the tokens still need to be
+        refreshed a new access token is obtained using the refresh token or, if that fails, an OAuth flow is
+        initiated. New tokens are written to the store before the lock is released.
+
+        :param store: token store
+        :param min_lifetime_seconds: minimal remaining lifetime in seconds. Default: 300 seconds
+        :param force_new: flag, don't read cached tokens and always get tokens from OAuth flow
+        :param oauth_flow: initiate an OAuth flow if no valid tokens can be obtained otherwise
+        :return: set of tokens or None
+        :rtype: :class:`wxc_sdk.tokens.Tokens`
+        """
+        if not force_new:
+            tokens = store.read()
+            if tokens and tokens.remaining >= min_lifetime_seconds:
+                return tokens
+        with store.lock():
+            tokens = not force_new and store.read() or None
+            if tokens and tokens.remaining >= min_lifetime_seconds:
+                log.debug('tokens were refreshed by another process')
+                return tokens
+            if tokens and tokens.refresh_token:
+                self.validate_tokens(tokens=tokens, min_lifetime_seconds=min_lifetime_seconds)
+                if tokens.access_token:
+                    store.write(tokens)
+                    return tokens
+            if not oauth_flow:
+                return None
+            tokens = self.get_tokens_from_oauth_flow()
+            if tokens:
+                store.write(tokens)
+        return tokens
+
+
+class SharedTokens:
+    """
+    Tokens of a process kept in sync with a token store shared by multiple processes.
+
+    :attr:`tokens` is a single :class:`wxc_sdk.tokens.Tokens` instance which can be passed to
+    :class:`wxc_sdk.WebexSimpleApi` or :class:`wxc_sdk.as_api.AsWebexSimpleApi`. :meth:`check` updates this
+    instance in place when another process wrote new tokens to the store or when the access token needs to be
+    refreshed; API sessions pick up new access tokens without reading the store on each request. :meth:`start` runs
+    :meth:`check` periodically in a background thread.
+    """
+
+    def __init__(self, *, integration: Integration, store: TokenStore, min_lifetime_seconds: int = 300,
+                 check_interval: float = 60.0, oauth_flow: bool = False):
+        """
+        :param integration: integration used to refresh tokens
+        :param store: token store
+        :param min_lifetime_seconds: minimal remaining lifetime of the access token in seconds
+        :param check_interval: interval for background checks in seconds
+        :param oauth_flow: initiate an OAuth flow if no valid tokens can be obtained from the store or by refreshing
+            the tokens
+        """
+        self.integration = integration
+        self.store = store
+        self.min_lifetime_seconds = min_lifetime_seconds
+        self.check_interval = check_interval
+        self.oauth_flow = oauth_flow
+        #: tokens of this process; updated in place
+        self.tokens = Tokens()
+        self._version = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.check()
+
+    def check(self) -> bool:
+        """
+        Update :attr:`tokens` if the store has new tokens or the access token needs to be refreshed
 
-        def read_tokens() -> Optional[Tokens]:
+        :return: True if the tokens were updated
+        """
+        with self._lock:
+            version = self.store.version()
+            if version == self._version and self.tokens.remaining >= self.min_lifetime_seconds:
+                return False
+            tokens = self.integration.get_tokens_from_store(store=self.store,
+                                                            min_lifetime_seconds=self.min_lifetime_seconds,
+                                                            oauth_flow=self.oauth_flow)
+            self._version = self.store.version()
+            if tokens is None or tokens.access_token == self.tokens.access_token:
+                return False
+            self.tokens.update(tokens)
+            self.tokens.token_type = tokens.token_type
+            log.debug(f'new access token, valid until {tokens.expires_at}')
+            return True
+
+    def _run(self):
+        while not self._stop.wait(self.check_interval):
             try:
-                with open(yml_path, mode='r') as f:
-                    data = yaml.safe_load(f)
-                    tokens_read = Tokens.model_validate(data)
+                self.check()
             except Exception as e:
-                log.info(f'failed to read tokens from file: {e}')
-                tokens_read = None
-            return tokens_read
+                log.warning(f'failed to check tokens: {e}')
+
+    def start(self):
+        """
+        Start background checks
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='SharedTokens', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop background checks
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> 'SharedTokens':
+        self.start()
+        return self
 
-        return self.get_cached_tokens(read_from_cache=read_tokens, write_to_cache=write_tokens,
-                                      force_new=force_new)
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,543 @@
+"""
+Local org inventory mirror
+
+Most scripts start by listing people, locations, workspaces, virtual lines, numbers, call queues, hunt groups and auto
+attendants. :class:`InventoryMirror` snapshots these entities into an indexed local sqlite database and answers
+lookups by ID, email, extension, number or name locally.
+
+The mirror is refreshed using the async API. Refreshes can be limited to entity types and locations. Incremental
+refreshes can be driven by admin audit events (:meth:`InventoryMirror.refresh_from_audit`) or by explicitly
+invalidating entity types and locations, for example from a webhook handler (:meth:`InventoryMirror.invalidate` and
+:meth:`InventoryMirror.refresh_stale`).
+
+Example:
+
+    .. code-block:: python
+
+        mirror = InventoryMirror(path='inventory.db')
+        async with AsWebexSimpleApi() as api:
+            if mirror.last_refresh() is None:
+                await mirror.refresh(api)
+            else:
+                await mirror.refresh_from_audit(api, org_id=org_id)
+        person = mirror.by_email('alice@example.com')
+        owner = mirror.by_number('+14085551234')
+"""
+import asyncio
+import json
+import logging
+import re
+import sqlite3
+from collections.abc import AsyncGenerator, Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, Optional, Union
+
+from wxc_sdk.admin_audit import AuditEvent
+from wxc_sdk.base import ApiModel, dt_iso_str
+from wxc_sdk.event_tailer import SeenIds
+from wxc_sdk.locations import Location
+from wxc_sdk.people import Person
+from wxc_sdk.telephony import NumberListPhoneNumber
+from wxc_sdk.telephony.autoattendant import AutoAttendant
+from wxc_sdk.telephony.callqueue import CallQueue
+from wxc_sdk.telephony.huntgroup import HuntGroup
+from wxc_sdk.telephony.virtual_line import VirtualLine
+from wxc_sdk.workspaces import Workspace
+
+__all__ = ['InventoryEntityType', 'InventoryEntry', 'InventoryMirror', 'normalize_number']
+
+log = logging.getLogger(__name__)
+
+
+class InventoryEntityType(str, Enum):
+    """
+    Entity types kept in the inventory mirror
+    """
+    people = 'people'
+    locations = 'locations'
+    workspaces = 'workspaces'
+    virtual_lines = 'virtual_lines'
+    numbers = 'numbers'
+    call_queues = 'call_queues'
+    hunt_groups = 'hunt_groups'
+    auto_attendants = 'auto_attendants'
+
+
+def normalize_number(number: Optional[str]) -> Optional[str]:
+    """
+    Normalize a phone number for lookups: remove all formatting characters
+
+    :param number: phone number
+    :return: normalized number
+    """
+    return number and re.sub(r'[^+\d]', '', number) or None
+
+
+@dataclass
+class InventoryEntry:
+    """
+    Keys extracted from an entity for the local indices
+    """
+    #: entity ID
+    id: str
+    #: (calling) location ID of the entity
+    location_id: Optional[str]
+    #: name of the entity
+    name: Optional[str]
+    #: emails of the entity
+    emails: list[str]
+    #: extensions of the entity
+    extensions: list[str]
+    #: phone numbers of the entity
+    numbers: list[str]
+
+
+def _entry_person(p: Person) -> InventoryEntry:
+    return InventoryEntry(id=p.person_id, location_id=p.location_id, name=p.display_name,
+                          emails=list(p.emails or []),
+                          extensions=[p.extension] if p.extension else [],
+                          numbers=[n.value for n in p.phone_numbers or [] if n.value])
+
+
+def _entry_location(loc: Location) -> InventoryEntry:
+    return InventoryEntry(id=loc.location_id, location_id=loc.location_id, name=loc.name, emails=[],
+                          extensions=[], numbers=[])
+
+
+def _entry_workspace(ws: Workspace) -> InventoryEntry:
+    wxc = ws.calling and ws.calling.webex_calling
+    return InventoryEntry(id=ws.workspace_id, location_id=(wxc and wxc.location_id) or ws.location_id,
+                          name=ws.display_name, emails=[],
+                          extensions=[wxc.extension] if wxc and wxc.extension else [],
+                          numbers=[wxc.phone_number] if wxc and wxc.phone_number else [])
+
+
+def _entry_virtual_line(vl: VirtualLine) -> InventoryEntry:
+    number = vl.number
+    return InventoryEntry(id=vl.id, location_id=vl.location and vl.location.id, name=vl.display_name, emails=[],
+                          extensions=[number.extension] if number and number.extension else [],
+                          numbers=[number.external] if number and number.external else [])
+
+
+def _entry_number(n: NumberListPhoneNumber) -> InventoryEntry:
+    location_id = n.location and n.location.id
+    return InventoryEntry(id=n.phone_number or f'{location_id}:{n.extension}', location_id=location_id,
+                          name=n.owner and n.owner.display_name, emails=[],
+                          extensions=[n.extension] if n.extension else [],
+                          numbers=[n.phone_number] if n.phone_number else [])
+
+
+def _entry_feature(f: Union[CallQueue, HuntGroup, AutoAttendant]) -> InventoryEntry:
+    return InventoryEntry(id=f.auto_attendant_id if isinstance(f, AutoAttendant) else f.id,
+                          location_id=f.location_id, name=f.name, emails=[],
+                          extensions=[f.extension] if f.extension else [],
+                          numbers=[f.phone_number] if f.phone_number else [])
+
+
+@dataclass
+class _EntitySpec:
+    """
+    How to list and index one entity type
+    """
+    #: model of the entity
+    model: type[ApiModel]
+    #: key extraction
+    entry: Callable[[Any], InventoryEntry]
+    #: list method; called with the async API and an optional location id
+    list_gen: Callable[[Any, Optional[str]], AsyncGenerator[Any, None]]
+    #: can the entity type be listed per location?
+    location_scoped: bool = True
+
+
+_SPECS: dict[InventoryEntityType, _EntitySpec] = {
+    InventoryEntityType.locations: _EntitySpec(
+        model=Location, entry=_entry_location, location_scoped=False,
+        list_gen=lambda api, location_id: api.locations.list_gen()),
+    InventoryEntityType.people: _EntitySpec(
+        model=Person, entry=_entry_person,
+        list_gen=lambda api, location_id: api.people.list_gen(calling_data=True, location_id=location_id)),
+    InventoryEntityType.workspaces: _EntitySpec(
+        model=Workspace, entry=_entry_workspace,
+        list_gen=lambda api, location_id: api.workspaces.list_gen(location_id=location_id)),
+    InventoryEntityType.virtual_lines: _EntitySpec(
+        model=VirtualLine, entry=_entry_virtual_line,
+        list_gen=lambda api, location_id: api.telephony.virtual_lines.list_gen(
+            location_id=[location_id] if location_id else None)),
+    InventoryEntityType.numbers: _EntitySpec(
+        model=NumberListPhoneNumber, entry=_entry_number,
+        list_gen=lambda api, location_id: api.telephony.phone_numbers_gen(location_id=location_id)),
+    InventoryEntityType.call_queues: _EntitySpec(
+        model=CallQueue, entry=_entry_feature,
+        list_gen=lambda api, location_id: api.telephony.callqueue.list_gen(location_id=location_id)),
+    InventoryEntityType.hunt_groups: _EntitySpec(
+        model=HuntGroup, entry=_entry_feature,
+        list_gen=lambda api, location_id: api.telephony.huntgroup.list_gen(location_id=location_id)),
+    InventoryEntityType.auto_attendants: _EntitySpec(
+        model=AutoAttendant, entry=_entry_feature,
+        list_gen=lambda api, location_id: api.telephony.auto_attendant.list_gen(location_id=location_id)),
+}
+
+# values of the structured fields of admin audit events (event category, target type) indicating changes of an entity
+# type; values are compared after normalization: upper case, words separated by "_", w/o prefix like "TargetType."
+AUDIT_TYPES: dict[InventoryEntityType, frozenset[str]] = {
+    InventoryEntityType.people: frozenset(('USER', 'USERS', 'PERSON', 'PEOPLE')),
+    InventoryEntityType.locations: frozenset(('LOCATION', 'LOCATIONS')),
+    InventoryEntityType.workspaces: frozenset(('WORKSPACE', 'WORKSPACES', 'PLACE', 'PLACES')),
+    InventoryEntityType.virtual_lines: frozenset(('VIRTUAL_LINE', 'VIRTUAL_LINES')),
+    InventoryEntityType.numbers: frozenset(('NUMBER', 'NUMBERS', 'PHONE_NUMBER', 'PHONE_NUMBERS')),
+    InventoryEntityType.call_queues: frozenset(('CALL_QUEUE', 'CALL_QUEUES')),
+    InventoryEntityType.hunt_groups: frozenset(('HUNT_GROUP', 'HUNT_GROUPS')),
+    InventoryEntityType.auto_attendants: frozenset(('AUTO_ATTENDANT', 'AUTO_ATTENDANTS')),
+}
+
+
+def _audit_type(value: Optional[str]) -> Optional[str]:
+    """
+    Normalize the value of a structured admin audit event field for a lookup in :data:`AUDIT_TYPES`
+    """
+    if not value:
+        return None
+    return re.sub(r'[^A-Z\d]+', '_', value.rsplit('.', 1)[-1].upper()).strip('_')
+
+
+# marker for "all locations" in the refresh and stale tables
+_ALL = ''
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entity (
+    entity_type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    location_id TEXT,
+    name TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (entity_type, id));
+CREATE INDEX IF NOT EXISTS entity_location ON entity (entity_type, location_id);
+CREATE TABLE IF NOT EXISTS lookup (
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    entity_type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    location_id TEXT);
+CREATE INDEX IF NOT EXISTS lookup_value ON lookup (kind, value);
+CREATE INDEX IF NOT EXISTS lookup_entity ON lookup (entity_type, id);
+CREATE TABLE IF NOT EXISTS refresh (
+    entity_type TEXT NOT NULL,
+    location_id TEXT NOT NULL,
+    refreshed TEXT NOT NULL,
+    PRIMARY KEY (entity_type, location_id));
+CREATE TABLE IF NOT EXISTS stale (
+    entity_type TEXT NOT NULL,
+    location_id TEXT NOT NULL,
+    PRIMARY KEY (entity_type, location_id));
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT);
+"""
+
+
+@dataclass(init=False, repr=False)
+class InventoryMirror:
+    """
+    Local sqlite mirror of the org inventory
+    """
+    #: database connection
+    db: sqlite3.Connection
+
+    def __init__(self, path: str = ':memory:', check_same_thread: bool = True):
+        """
+
+        :param path: path of the sqlite database. Default: in-memory database
+        :param check_same_thread: passed to :func:`sqlite3.connect`
+        """
+        self.db = sqlite3.connect(path, check_same_thread=check_same_thread)
+        self.db.executescript(_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ----- writing
+
+    def store(self, entity_type: InventoryEntityType, entities: Iterable[ApiModel], location_id: str = None):
+        """
+        Replace all entities of a type (optionally only in one location) with the given entities
+
+        :param entity_type: entity type
+        :param entities: entities
+        :param location_id: if given, then only entities in this location are replaced
+        """
+        entity_type = InventoryEntityType(entity_type)
+        spec = _SPECS[entity_type]
+        now = dt_iso_str(datetime.now(tz=timezone.utc))
+        entity_rows = []
+        lookup_rows = []
+        for entity in entities:
+            entry = spec.entry(entity)
+            entity_rows.append((entity_type.value, entry.id, entry.location_id, entry.name,
+                                entity.model_dump_json()))
+            keys = [('email', e.lower()) for e in entry.emails]
+            keys.extend(('extension', e) for e in entry.extensions)
+            keys.extend(('number', normalize_number(n)) for n in entry.numbers)
+            if entry.name:
+                keys.append(('name', entry.name.lower()))
+            lookup_rows.extend((kind, value, entity_type.value, entry.id, entry.location_id)
+                               for kind, value in keys)
+        with self.db:
+            if location_id:
+                where, args = 'entity_type=? AND location_id=?', (entity_type.value, location_id)
+            else:
+                where, args = 'entity_type=?', (entity_type.value,)
+            self.db.execute(f'DELETE FROM entity WHERE {where}', args)
+            self.db.execute(f'DELETE FROM lookup WHERE {where}', args)
+            self.db.executemany('INSERT OR REPLACE INTO entity VALUES (?, ?, ?, ?, ?)', entity_rows)
+            self.db.executemany('INSERT INTO lookup VALUES (?, ?, ?, ?, ?)', lookup_rows)
+            self.db.execute('INSERT OR REPLACE INTO refresh VALUES (?, ?, ?)',
+                            (entity_type.value, location_id or _ALL, now))
+            self.db.execute('DELETE FROM stale WHERE entity_type=? AND location_id=?',
+                            (entity_type.value, location_id or _ALL))
+        log.debug(f'store({entity_type.value}, location_id={location_id}): {len(entity_rows)} entities')
+
+    def invalidate(self, entity_type: InventoryEntityType, location_id: str = None):
+        """
+        Mark an entity type (optionally only in one location) as stale. Stale data is re-read by
+        :meth:`refresh_stale`. Can be called from a webhook handler for example.
+
+        :param entity_type: entity type
+        :param location_id: location ID
+        """
+        with self.db:
+            self.db.execute('INSERT OR IGNORE INTO stale VALUES (?, ?)',
+                            (InventoryEntityType(entity_type).value, location_id or _ALL))
+
+    # ----- refresh
+
+    async def _refresh_one(self, api, entity_type: InventoryEntityType, location_id: Optional[str]):
+        spec = _SPECS[entity_type]
+        if not spec.location_scoped:
+            location_id = None
+        entities = [e async for e in spec.list_gen(api, location_id)]
+        self.store(entity_type, entities, location_id=location_id)
+
+    async def refresh(self, api, entity_types: Iterable[InventoryEntityType] = None,
+                      location_ids: Iterable[str] = None):
+        """
+        Refresh the mirror. All entity types (and locations) are read concurrently.
+
+        :param api: async API
+        :type api: :class:`wxc_sdk.as_api.AsWebexSimpleApi`
+        :param entity_types: entity types to refresh. Default: all
+        :param location_ids: only refresh entities in these locations. Default: all locations
+        """
+        entity_types = [InventoryEntityType(et) for et in entity_types or InventoryEntityType]
+        location_ids = list(location_ids or [None])
+        scopes = set()
+        for entity_type in entity_types:
+            if _SPECS[entity_type].location_scoped:
+                scopes.update((entity_type, location_id) for location_id in location_ids)
+            else:
+                scopes.add((entity_type, None))
+        await asyncio.gather(*[self._refresh_one(api, entity_type, location_id)
+                               for entity_type, location_id in scopes])
+        if set(entity_types) == set(InventoryEntityType) and location_ids == [None]:
+            self._set_meta('full_refresh', dt_iso_str(datetime.now(tz=timezone.utc)))
+
+    async def refresh_stale(self, api):
+        """
+        Refresh all entity types and locations marked as stale by :meth:`invalidate`
+
+        :param api: async API
+        :type api: :class:`wxc_sdk.as_api.AsWebexSimpleApi`
+        """
+        stale = self.db.execute('SELECT entity_type, location_id FROM stale').fetchall()
+        stale_all = {et for et, loc in stale if loc == _ALL}
+        scopes = [(InventoryEntityType(et), loc or None) for et, loc in stale
+                  if loc == _ALL or et not in stale_all]
+        await asyncio.gather(*[self._refresh_one(api, entity_type, location_id)
+                               for entity_type, location_id in scopes])
+
+    def stale_from_audit_event(self, event: AuditEvent) -> list[tuple[InventoryEntityType, Optional[str]]]:
+        """
+        Determine entity types and locations affected by an admin audit event
+
+        :param event: admin audit event
+        :return: list of (entity type, location id). Location id is None if the location can't be determined
+        """
+        data = event.data
+        if data is None:
+            return []
+        values = {_audit_type(data.event_category), _audit_type(data.target_type)}
+        entity_types = [et for et, types in AUDIT_TYPES.items() if not types.isdisjoint(values)]
+        if not entity_types:
+            return []
+        location_id = None
+        if data.location_id and self.by_id(InventoryEntityType.locations, data.location_id):
+            location_id = data.location_id
+        else:
+            location_name = data.location_name or data.current_location_name
+            if isinstance(location_name, str):
+                location = self.by_name(location_name, entity_type=InventoryEntityType.locations)
+                location_id = location[0].location_id if len(location) == 1 else None
+        if InventoryEntityType.locations in entity_types:
+            # location changes can affect everything in the location
+            location_id = None
+        return [(et, location_id) for et in entity_types]
+
+    async def refresh_from_audit(self, api, org_id: str, since: Union[str, datetime] = None,
+                                 overlap: timedelta = timedelta(minutes=5), seen_size: int = 10000):
+        """
+        Incremental refresh based on admin audit events: entity types and locations affected by admin audit events
+        since the last call are marked as stale and then refreshed.
+
+        Audit events can show up late. Like :class:`wxc_sdk.event_tailer.EventTailer` consecutive calls read
+        overlapping time windows and events already seen are ignored.
+
+        :param api: async API
+        :type api: :class:`wxc_sdk.as_api.AsWebexSimpleApi`
+        :param org_id: org ID, required to read admin audit events
+        :param since: read audit events since this time. Default: creation time of the newest audit event seen in
+            the last call minus the overlap, or time of the last full refresh
+        :param overlap: overlap of consecutive time windows
+        :param seen_size: maximum number of audit event ids kept for de-duplication
+        """
+        def parse(value: Union[str, datetime]) -> datetime:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')) if isinstance(value, str) else value
+
+        seen = SeenIds(maxsize=seen_size, ids=json.loads(self._get_meta('audit_seen') or '[]'))
+        cursor = self._get_meta('audit_cursor')
+        if since is not None:
+            watermark = since = parse(since)
+        elif cursor is not None:
+            watermark = parse(cursor)
+            since = watermark - overlap
+        elif full_refresh := self._get_meta('full_refresh'):
+            watermark = since = parse(full_refresh)
+        else:
+            raise ValueError('no previous refresh; full refresh required')
+        now = datetime.now(tz=timezone.utc)
+        async for event in api.admin_audit.list_events_gen(org_id=org_id, from_=since, to_=now):
+            if event.id and not seen.add(event.id):
+                continue
+            if event.created and event.created > watermark:
+                watermark = event.created
+            for entity_type, location_id in self.stale_from_audit_event(event):
+                self.invalidate(entity_type, location_id)
+        await self.refresh_stale(api)
+        self._set_meta('audit_cursor', dt_iso_str(watermark))
+        self._set_meta('audit_seen', json.dumps(list(seen)))
+
+    def last_refresh(self, entity_type: InventoryEntityType = None) -> Optional[datetime]:
+        """
+        Time of the last (full) refresh of an entity type or all entity types
+
+        :param entity_type: entity type; if omitted then the time of the last full refresh is returned
+        :return: time of last refresh or None
+        """
+        if entity_type is None:
+            value = self._get_meta('full_refresh')
+        else:
+            row = self.db.execute('SELECT refreshed FROM refresh WHERE entity_type=? AND location_id=?',
+                                  (InventoryEntityType(entity_type).value, _ALL)).fetchone()
+            value = row and row[0]
+        return value and datetime.fromisoformat(value.replace('Z', '+00:00')) or None
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.db.execute('SELECT value FROM meta WHERE key=?', (key,)).fetchone()
+        return row and row[0]
+
+    def _set_meta(self, key: str, value: str):
+        with self.db:
+            self.db.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, value))
+
+    # ----- lookups
+
+    def _parse(self, entity_type: str, data: str) -> ApiModel:
+        return _SPECS[InventoryEntityType(entity_type)].model.model_validate(json.loads(data))
+
+    def _lookup(self, kind: str, value: str, entity_type: InventoryEntityType = None,
+                location_id: str = None) -> list[ApiModel]:
+        sql = ('SELECT DISTINCT e.entity_type, e.data FROM lookup l JOIN entity e '
+               'ON e.entity_type=l.entity_type AND e.id=l.id WHERE l.kind=? AND l.value=?')
+        args = [kind, value]
+        if entity_type is not None:
+            sql += ' AND l.entity_type=?'
+            args.append(InventoryEntityType(entity_type).value)
+        if location_id is not None:
+            sql += ' AND l.location_id=?'
+            args.append(location_id)
+        return [self._parse(et, data) for et, data in self.db.execute(sql, args)]
+
+    def by_id(self, entity_type: InventoryEntityType, entity_id: str) -> Optional[ApiModel]:
+        """
+        Get an entity by ID
+
+        :param entity_type: entity type
+        :param entity_id: entity ID
+        :return: entity or None
+        """
+        row = self.db.execute('SELECT entity_type, data FROM entity WHERE entity_type=? AND id=?',
+                              (InventoryEntityType(entity_type).value, entity_id)).fetchone()
+        return row and self._parse(*row) or None
+
+    def by_email(self, email: str) -> Optional[Person]:
+        """
+        Get a person by email
+
+        :param email: email address
+        :return: person or None
+        """
+        r = self._lookup('email', email.lower(), entity_type=InventoryEntityType.people)
+        return r[0] if r else None
+
+    def by_number(self, number: str, entity_type: InventoryEntityType = None) -> list[ApiModel]:
+        """
+        Get all entities with a given phone number
+
+        :param number: phone number
+        :param entity_type: only return entities of this type
+        :return: list of entities
+        """
+        return self._lookup('number', normalize_number(number), entity_type=entity_type)
+
+    def by_extension(self, extension: str, location_id: str = None,
+                     entity_type: InventoryEntityType = None) -> list[ApiModel]:
+        """
+        Get all entities with a given extension
+
+        :param extension: extension
+        :param location_id: only return entities in this location
+        :param entity_type: only return entities of this type
+        :return: list of entities
+        """
+        return self._lookup('extension', extension, entity_type=entity_type, location_id=location_id)
+
+    def by_name(self, name: str, entity_type: InventoryEntityType = None) -> list[ApiModel]:
+        """
+        Get all entities with a given name (case-insensitive)
+
+        :param name: name
+        :param entity_type: only return entities of this type
+        :return: list of entities
+        """
+        return self._lookup('name', name.lower(), entity_type=entity_type)
+
+    def all(self, entity_type: InventoryEntityType, location_id: str = None) -> list[ApiModel]:
+        """
+        Get all entities of a type
+
+        :param entity_type: entity type
+        :param location_id: only return entities in this location
+        :return: list of entities
+        """
+        sql = 'SELECT entity_type, data FROM entity WHERE entity_type=?'
+        args = [InventoryEntityType(entity_type).value]
+        if location_id is not None:
+            sql += ' AND location_id=?'
+            args.append(location_id)
+        return [self._parse(*row) for row in self.db.execute(sql, args)]
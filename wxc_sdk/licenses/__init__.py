@@ -8,10 +8,10 @@ only by an admin.
 from collections.abc import Generator
 from typing import Optional, List
 
-from pydantic import Field, TypeAdapter
+from pydantic import Field
 
 from ..api_child import ApiChild
-from ..base import ApiModel, webex_id_to_uuid
+from ..base import ApiModel, webex_id_to_uuid, type_adapter
 from ..base import SafeEnum as Enum
 
 __all__ = ['SiteType', 'License', 'LicensesApi', 'LicenseUser', 'LicenseUserType', 'LicenseRequestOperation',
@@ -229,7 +229,7 @@ class LicensesApi(ApiChild, base='licenses'):
         params = org_id and {'orgId': org_id} or None
         url = self.ep()
         data = super().get(url, params=params)
-        r = TypeAdapter(list[License]).validate_python(data['items'])
+        r = type_adapter(list[License]).validate_python(data['items'])
         return r
 
     def details(self, license_id) -> License:
@@ -313,11 +313,11 @@ class LicensesApi(ApiChild, base='licenses'):
         if org_id is not None:
             body['orgId'] = org_id
         if licenses is not None:
-            body['licenses'] = TypeAdapter(list[LicenseRequest]).dump_python(licenses, mode='json', by_alias=True,
-                                                                             exclude_none=True)
-        if site_urls is not None:
-            body['siteUrls'] = TypeAdapter(list[SiteUrlsRequest]).dump_python(site_urls, mode='json', by_alias=True,
+            body['licenses'] = type_adapter(list[LicenseRequest]).dump_python(licenses, mode='json', by_alias=True,
                                                                               exclude_none=True)
+        if site_urls is not None:
+            body['siteUrls'] = type_adapter(list[SiteUrlsRequest]).dump_python(site_urls, mode='json', by_alias=True,
+                                                                               exclude_none=True)
         url = self.ep('users')
         data = super().patch(url, json=body)
         r = UserLicensesResponse.model_validate(data)
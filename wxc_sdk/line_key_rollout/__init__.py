@@ -0,0 +1,305 @@
+"""
+Line key template rollouts
+
+Applying line key templates to a large number of devices means calling
+:meth:`api.telephony.devices.preview_apply_line_key_template
+<wxc_sdk.telephony.devices.TelephonyDevicesApi.preview_apply_line_key_template>` and
+:meth:`api.telephony.jobs.apply_line_key_templates.apply
+<wxc_sdk.telephony.jobs.ApplyLineKeyTemplatesJobsApi.apply>` for each template and scope and then polling job status
+and errors. :class:`AsLineKeyRollout` does all of this in one call:
+
+* input is a mapping of templates to device populations: :class:`DevicePopulation`
+* the work is split into one task per template and location: :class:`RolloutTask`
+* the number of affected devices of each task is previewed concurrently; previews are cached
+  (:class:`PreviewCache`) so that planning a rollout again does not repeat identical previews
+* tasks without affected devices are skipped
+* jobs for the remaining tasks run in parallel up to a configurable limit. If the organization has too many jobs
+  running (409 response) the job is started again later
+* job errors of all tasks are aggregated in one report: :class:`RolloutReport`
+
+Example:
+
+    .. code-block:: python
+
+        async with AsWebexSimpleApi(tokens=token) as api:
+            rollout = AsLineKeyRollout(api, max_parallel_jobs=3)
+            report = await rollout.run({template_8845.id: DevicePopulation(location_ids=east_coast),
+                                        template_8865.id: DevicePopulation(location_ids=all_locations,
+                                                                           exclude_device_tags=['lobby'])})
+            print(f'{report.devices} devices in {len(report.tasks)} jobs, {len(report.errors)} errors')
+"""
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Optional
+
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.common import ApplyLineKeyTemplateAction
+from wxc_sdk.fan_out import as_items_as_completed
+from wxc_sdk.telephony.jobs import ApplyLineKeyTemplateJobDetails, JobErrorItem, LineKeyTemplateAdvisoryTypes
+
+__all__ = ['DevicePopulation', 'RolloutTask', 'PreviewCache', 'RolloutReport', 'AsLineKeyRollout']
+
+log = logging.getLogger(__name__)
+
+#: HTTP status of a rejected job start if too many jobs are running
+_CONFLICT = 409
+
+
+@dataclass
+class DevicePopulation:
+    """
+    Devices a template is applied to
+    """
+    #: locations; None: all locations of the organization
+    location_ids: Optional[list[str]] = None
+    exclude_devices_with_custom_layout: Optional[bool] = None
+    include_device_tags: Optional[list[str]] = None
+    exclude_device_tags: Optional[list[str]] = None
+    advisory_types: Optional[LineKeyTemplateAdvisoryTypes] = None
+
+
+@dataclass
+class RolloutTask:
+    """
+    Application of one template to the devices of a population in one location (or all locations of the
+    population)
+    """
+    #: template to apply; None to reset devices to the default line key settings
+    template_id: Optional[str]
+    #: locations; None for all locations
+    location_ids: Optional[list[str]]
+    population: DevicePopulation
+    #: number of affected devices from the preview; None if not previewed yet
+    preview: Optional[int] = None
+    #: final job state
+    job: Optional[ApplyLineKeyTemplateJobDetails] = None
+    #: error starting or monitoring the job
+    error: Optional[str] = None
+    #: job errors
+    job_errors: list[JobErrorItem] = field(default_factory=list)
+
+    @property
+    def action(self) -> ApplyLineKeyTemplateAction:
+        if self.template_id is None:
+            return ApplyLineKeyTemplateAction.apply_default_templates
+        return ApplyLineKeyTemplateAction.apply_template
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.job is not None and self.job.latest_execution_status == 'COMPLETED'
+
+    def arguments(self) -> dict:
+        """
+        arguments for preview and apply calls
+        """
+        population = self.population
+        return dict(action=self.action, template_id=self.template_id,
+                    location_ids=self.location_ids,
+                    exclude_devices_with_custom_layout=population.exclude_devices_with_custom_layout,
+                    include_device_tags=population.include_device_tags,
+                    exclude_device_tags=population.exclude_device_tags,
+                    advisory_types=population.advisory_types)
+
+    def cache_key(self) -> str:
+        """
+        key for the preview cache
+        """
+        arguments = self.arguments()
+        advisory_types = arguments.pop('advisory_types')
+        arguments['advisory_types'] = advisory_types and advisory_types.model_dump(mode='json', exclude_none=True)
+        return json.dumps(arguments, sort_keys=True, default=str)
+
+
+class PreviewCache:
+    """
+    Cache for preview results. Entries expire after a time to live
+    """
+
+    def __init__(self, ttl: float = 900.0):
+        """
+        :param ttl: time to live of an entry in seconds
+        """
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, int]] = dict()
+
+    def get(self, key: str) -> Optional[int]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        created, count = entry
+        if time.monotonic() - created > self.ttl:
+            del self._entries[key]
+            return None
+        return count
+
+    def set(self, key: str, count: int):
+        self._entries[key] = (time.monotonic(), count)
+
+    def clear(self):
+        self._entries.clear()
+
+
+@dataclass
+class RolloutReport:
+    """
+    Result of a rollout
+    """
+    #: all tasks with a job or an error
+    tasks: list[RolloutTask] = field(default_factory=list)
+    #: tasks skipped because the preview did not find any devices
+    skipped: list[RolloutTask] = field(default_factory=list)
+    #: duration in seconds
+    duration: float = 0.0
+
+    @property
+    def devices(self) -> int:
+        """
+        number of previewed devices of all executed tasks
+        """
+        return sum(task.preview or 0 for task in self.tasks)
+
+    @property
+    def failed(self) -> list[RolloutTask]:
+        return [task for task in self.tasks if not task.ok]
+
+    @property
+    def errors(self) -> list[tuple[RolloutTask, JobErrorItem]]:
+        """
+        job errors of all tasks
+        """
+        return [(task, error) for task in self.tasks for error in task.job_errors]
+
+
+class AsLineKeyRollout:
+    """
+    Apply line key templates to device populations with per location jobs
+    """
+
+    def __init__(self, api: AsWebexSimpleApi, *, max_parallel_jobs: int = 2, preview_concurrency: int = 10,
+                 per_location: bool = True, job_poll_interval: float = 10.0, job_timeout: float = 3600.0,
+                 preview_cache: PreviewCache = None, org_id: str = None):
+        """
+        :param api: async API
+        :param max_parallel_jobs: maximum number of jobs running at the same time
+        :param preview_concurrency: maximum number of concurrent preview requests
+        :param per_location: split populations into one task per location. If False, one task per template is
+            created
+        :param job_poll_interval: seconds between job status polls; also the wait time before starting a job again
+            after a 409 response
+        :param job_timeout: maximum time in seconds to wait for a job
+        :param preview_cache: cache for preview results. Default: new cache
+        :param org_id: organization
+        """
+        self.api = api
+        self.max_parallel_jobs = max_parallel_jobs
+        self.preview_concurrency = preview_concurrency
+        self.per_location = per_location
+        self.job_poll_interval = job_poll_interval
+        self.job_timeout = job_timeout
+        self.preview_cache = preview_cache if preview_cache is not None else PreviewCache()
+        self.org_id = org_id
+
+    def tasks(self, templates: Mapping[Optional[str], DevicePopulation]) -> list[RolloutTask]:
+        """
+        Split a rollout into tasks
+
+        :param templates: template id -> devices. A None template id resets devices to the default line key settings
+        :return: tasks
+        """
+        tasks = []
+        seen = set()
+        for template_id, population in templates.items():
+            if self.per_location and population.location_ids:
+                scopes = [[location_id] for location_id in population.location_ids]
+            else:
+                scopes = [population.location_ids]
+            for location_ids in scopes:
+                key = (template_id, location_ids and tuple(location_ids))
+                if key in seen:
+                    continue
+                seen.add(key)
+                tasks.append(RolloutTask(template_id=template_id, location_ids=location_ids, population=population))
+        return tasks
+
+    async def preview(self, tasks: list[RolloutTask]):
+        """
+        Preview the number of affected devices of each task; uses the preview cache
+        """
+
+        async def preview(task: RolloutTask) -> int:
+            key = task.cache_key()
+            count = self.preview_cache.get(key)
+            if count is None:
+                count = await self.api.telephony.devices.preview_apply_line_key_template(**task.arguments(),
+                                                                                         org_id=self.org_id)
+                self.preview_cache.set(key, count)
+            return count
+
+        async for result in as_items_as_completed(preview, [t for t in tasks if t.preview is None],
+                                                  concurrency=self.preview_concurrency):
+            if result.ok:
+                result.item.preview = result.result
+            else:
+                # apply anyway; the job will report problems
+                log.warning(f'preview failed for template {result.item.template_id} in locations '
+                            f'{result.item.location_ids}: {result.exception}')
+
+    async def _start(self, task: RolloutTask) -> ApplyLineKeyTemplateJobDetails:
+        deadline = time.monotonic() + self.job_timeout
+        while True:
+            try:
+                return await self.api.telephony.jobs.apply_line_key_templates.apply(**task.arguments(),
+                                                                                    org_id=self.org_id)
+            except Exception as e:
+                if getattr(e, 'status', None) != _CONFLICT or time.monotonic() > deadline:
+                    raise
+                log.debug(f'too many jobs running; retrying template {task.template_id} in locations '
+                          f'{task.location_ids}')
+                await asyncio.sleep(self.job_poll_interval)
+
+    async def _execute(self, task: RolloutTask):
+        try:
+            job = await self._start(task)
+            deadline = time.monotonic() + self.job_timeout
+            while job.latest_execution_status not in ('COMPLETED', 'FAILED'):
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f'job {job.id} not completed after {self.job_timeout}s')
+                await asyncio.sleep(self.job_poll_interval)
+                job = await self.api.telephony.jobs.apply_line_key_templates.status(job_id=job.id,
+                                                                                    org_id=self.org_id)
+            task.job = job
+            task.job_errors = [error async for error in
+                               self.api.telephony.jobs.apply_line_key_templates.errors_gen(job_id=job.id,
+                                                                                           org_id=self.org_id)]
+        except Exception as e:
+            log.warning(f'job for template {task.template_id} in locations {task.location_ids} failed: {e}')
+            task.error = str(e) or e.__class__.__name__
+
+    async def run(self, templates: Mapping[Optional[str], DevicePopulation]) -> RolloutReport:
+        """
+        Roll out templates
+
+        :param templates: template id -> devices. A None template id resets devices to the default line key settings
+        :return: report
+        """
+        start = time.perf_counter()
+        report = RolloutReport()
+        tasks = self.tasks(templates)
+        await self.preview(tasks)
+        for task in tasks:
+            if task.preview == 0:
+                report.skipped.append(task)
+            else:
+                report.tasks.append(task)
+        log.info(f'line key rollout: {len(report.tasks)} jobs for {report.devices} devices, '
+                 f'{len(report.skipped)} tasks without devices')
+        async for _ in as_items_as_completed(self._execute, report.tasks, concurrency=self.max_parallel_jobs):
+            pass
+        report.duration = time.perf_counter() - start
+        log.info(f'line key rollout: {len(report.tasks) - len(report.failed)} jobs completed, '
+                 f'{len(report.failed)} failed, {len(report.errors)} job errors, {report.duration:.1f}s')
+        return report
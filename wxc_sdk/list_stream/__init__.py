@@ -0,0 +1,280 @@
+"""
+Bounded memory streaming of async list results
+
+The list methods of :class:`AsWebexSimpleApi <wxc_sdk.as_api.AsWebexSimpleApi>` like
+:meth:`api.people.list() <wxc_sdk.as_api.AsPeopleApi.list>` collect all items in a list before returning. For large
+listings (hundreds of thousands of numbers or users) this means that the complete result has to be held in memory.
+Each list method has a ``*_gen`` counterpart which returns an async generator; :class:`AsListStream` wraps such a
+generator and adds:
+
+* bounded prefetch: a background task pulls items from the generator while the consumer is busy. The prefetch
+  queue is bounded: if the consumer falls behind then the prefetcher is blocked and no further pages are requested
+* iteration in batches of N items: :meth:`AsListStream.batches`
+* explicit materialization with an optional limit: :meth:`AsListStream.collect`. Once the limit is reached no further
+  pages are fetched
+* details fan-out: :meth:`AsListStream.list_with_details`. Many list endpoints only return partial objects and the
+  complete object has to be obtained with a call per item. :func:`as_list_with_details` streams list results into a
+  bounded pool of detail fetchers and yields the detailed objects as soon as they are available
+
+Example:
+
+    .. code-block:: python
+
+        async with AsWebexSimpleApi() as api:
+            async with AsListStream(api.telephony.phone_numbers_gen(), prefetch=2000) as numbers:
+                async for batch in numbers.batches(500):
+                    await process(batch)
+
+            first_ten = await AsListStream(api.people.list_gen()).collect(limit=10)
+
+            # call queue details, 20 concurrent details() calls
+            async for queue in as_list_with_details(
+                    api.telephony.callqueue.list_gen(),
+                    lambda q: api.telephony.callqueue.details(location_id=q.location_id, queue_id=q.id),
+                    concurrency=20):
+                ...
+"""
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable
+from typing import Generic, Optional, TypeVar, Union
+
+__all__ = ['AsListStream', 'as_batches', 'as_list_with_details']
+
+log = logging.getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# end of stream marker in the prefetch queue
+_END = object()
+
+
+class _Failure:
+    """
+    exception raised by the source; put into the prefetch queue so that the consumer can re-raise it
+    """
+    __slots__ = ('error',)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+async def as_batches(source: AsyncIterable[T], size: int) -> AsyncGenerator[list[T], None]:
+    """
+    Yield items of an async iterable in lists of up to `size` items
+
+    :param source: async iterable, for example :meth:`api.people.list_gen() <wxc_sdk.as_api.AsPeopleApi.list_gen>`
+    :param size: maximum batch size
+    :return: yields lists of items; only the last list can have less than `size` items
+    """
+    if size < 1:
+        raise ValueError('size has to be positive')
+    batch = []
+    async for item in source:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def as_list_with_details(source: AsyncIterable[T], details: Callable[[T], Awaitable[R]],
+                               concurrency: int = 10, ordered: bool = True,
+                               return_exceptions: bool = False) -> AsyncGenerator[Union[R, BaseException], None]:
+    """
+    Details fan-out: get details for each item of an async iterable with a bounded number of concurrent detail calls.
+
+    Items are only pulled from the source if a detail fetcher is available: at most `concurrency` detail calls are
+    in flight and the source is not read further ahead.
+
+    :param source: async iterable of partial objects, for example
+        :meth:`api.people.list_gen() <wxc_sdk.as_api.AsPeopleApi.list_gen>`
+    :param details: coroutine function returning the details for an item, for example
+        ``lambda p: api.people.details(person_id=p.person_id, calling_data=True)``
+    :param concurrency: maximum number of concurrent detail calls
+    :param ordered: yield results in source order. Else results are yielded as soon as they are ready
+    :param return_exceptions: like for :func:`asyncio.gather`: if True, then exceptions raised by detail calls are
+        yielded instead of the result. Else the 1st exception is raised and all pending detail calls are cancelled
+    :return: yields details
+    """
+    if concurrency < 1:
+        raise ValueError('concurrency has to be positive')
+    iterator = source.__aiter__()
+    # detail tasks in source order
+    pending: dict[asyncio.Future, None] = dict()
+    exhausted = False
+    try:
+        while True:
+            # pull items from the source until all detail fetchers are busy
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending[asyncio.ensure_future(details(item))] = None
+            if not pending:
+                break
+            if ordered:
+                task = next(iter(pending))
+                await asyncio.wait([task])
+                done = [task]
+            else:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.pop(task)
+                if (error := task.exception()) is not None:
+                    if not return_exceptions:
+                        raise error
+                    yield error
+                else:
+                    yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        if (aclose := getattr(iterator, 'aclose', None)) is not None:
+            await aclose()
+
+
+class AsListStream(Generic[T]):
+    """
+    Streaming wrapper for the async generators returned by the ``*_gen`` list methods of the async API.
+
+    A stream can only be consumed once. To make sure that the prefetch task is stopped and the source generator is
+    closed if the stream is not consumed completely, the stream should be used as async context manager or
+    :meth:`aclose` should be called explicitly.
+    """
+
+    def __init__(self, source: AsyncIterable[T], prefetch: int = 0):
+        """
+        :param source: async iterable; typically the async generator returned by a ``*_gen`` method like
+            :meth:`api.telephony.phone_numbers_gen() <wxc_sdk.as_api.AsTelephonyApi.phone_numbers_gen>`
+        :param prefetch: maximum number of items to read ahead in a background task. With prefetch=0 items are only
+            pulled from the source when the consumer asks for them. To overlap fetching the next page with processing
+            the current page, prefetch should be set to (at least) the page size of the list request.
+        """
+        if prefetch < 0:
+            raise ValueError('prefetch has to be non-negative')
+        self._source = source
+        self._iterator = source.__aiter__()
+        self._prefetch = prefetch
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._done = False
+
+    def _start(self):
+        """
+        start the prefetch task on first use
+        """
+        if self._prefetch and self._task is None and not self._done:
+            self._queue = asyncio.Queue(maxsize=self._prefetch)
+            self._task = asyncio.create_task(self._produce())
+
+    async def _produce(self):
+        """
+        prefetch task: move items from the source to the prefetch queue. Blocks if the queue is full
+        """
+        queue = self._queue
+        try:
+            async for item in self._iterator:
+                await queue.put(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(_Failure(e))
+        else:
+            await queue.put(_END)
+
+    def __aiter__(self) -> 'AsListStream[T]':
+        return self
+
+    async def __anext__(self) -> T:
+        if self._done:
+            raise StopAsyncIteration
+        if not self._prefetch:
+            try:
+                return await self._iterator.__anext__()
+            except StopAsyncIteration:
+                self._done = True
+                raise
+        self._start()
+        item = await self._queue.get()
+        if item is _END:
+            self._done = True
+            raise StopAsyncIteration
+        if isinstance(item, _Failure):
+            self._done = True
+            raise item.error
+        return item
+
+    def batches(self, size: int) -> AsyncGenerator[list[T], None]:
+        """
+        Iterate over the stream in batches
+
+        :param size: maximum batch size
+        :return: yields lists of up to `size` items
+        """
+        return as_batches(self, size)
+
+    def list_with_details(self, details: Callable[[T], Awaitable[R]], concurrency: int = 10, ordered: bool = True,
+                          return_exceptions: bool = False) -> AsyncGenerator[Union[R, BaseException], None]:
+        """
+        Get details for each item of the stream with a bounded number of concurrent detail calls. See
+        :func:`as_list_with_details`
+
+        :param details: coroutine function returning the details for an item
+        :param concurrency: maximum number of concurrent detail calls
+        :param ordered: yield results in stream order
+        :param return_exceptions: yield exceptions raised by detail calls instead of raising them
+        :return: yields details
+        """
+        return as_list_with_details(self, details, concurrency=concurrency, ordered=ordered,
+                                    return_exceptions=return_exceptions)
+
+    async def collect(self, limit: int = None) -> list[T]:
+        """
+        Materialize the stream in a list. If a limit is given, then the stream is closed after `limit` items and no
+        further pages are requested.
+
+        :param limit: maximum number of items to collect
+        :return: list of items
+        """
+        result = []
+        if limit is not None and limit <= 0:
+            await self.aclose()
+            return result
+        try:
+            async for item in self:
+                result.append(item)
+                if limit is not None and len(result) >= limit:
+                    break
+        finally:
+            await self.aclose()
+        return result
+
+    async def aclose(self):
+        """
+        Stop the prefetch task and close the source generator
+        """
+        self._done = True
+        if self._task is not None:
+            if not self._task.done():
+                self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._queue = None
+        if (aclose := getattr(self._iterator, 'aclose', None)) is not None:
+            await aclose()
+
+    async def __aenter__(self) -> 'AsListStream[T]':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
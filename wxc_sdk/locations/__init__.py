@@ -11,10 +11,10 @@ combinations.
 from collections.abc import Generator
 from typing import Optional, List
 
-from pydantic import Field, TypeAdapter
+from pydantic import Field
 
 from ..api_child import ApiChild
-from ..base import ApiModel, to_camel, webex_id_to_uuid
+from ..base import ApiModel, to_camel, webex_id_to_uuid, type_adapter
 
 __all__ = ['LocationAddress', 'Location', 'Floor', 'LocationsApi']
 
@@ -273,7 +273,7 @@ class LocationsApi(ApiChild, base='locations'):
         """
         url = self.ep(f'{location_id}/floors')
         data = super().get(url)
-        r = TypeAdapter(list[Floor]).validate_python(data['items'])
+        r = type_adapter(list[Floor]).validate_python(data['items'])
         return r
 
     def create_floor(self, location_id: str, floor_number: int, display_name: str = None) -> Floor:
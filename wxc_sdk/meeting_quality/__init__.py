@@ -0,0 +1,330 @@
+"""
+Meeting quality analytics with columnar storage
+
+:meth:`api.meetings.qualities.meeting_qualities <wxc_sdk.meetings.qualities.MeetingQualitiesApi.meeting_qualities>`
+returns a deeply nested :class:`MediaSessionQuality <wxc_sdk.meetings.qualities.MediaSessionQuality>` for each
+participant session with lists of metric values per sampling interval for each media stream. For analysis of many
+meetings this module flattens quality data into columns instead:
+
+* :class:`QualityColumns`: one row per session, one row per media stream and one flat :class:`array.array` of floats
+  per metric. The samples of each stream are a slice of the metric arrays given by an offsets array (compressed sparse
+  row layout). Missing values are NaN
+* :class:`AsQualityCollector`: fetches quality data for many meetings concurrently and flattens the raw JSON
+  records directly into columns; no pydantic models are created
+* :meth:`QualityColumns.summary`: summary statistics (mean, 95th percentile, max) per meeting, site or network type
+
+Example:
+
+    .. code-block:: python
+
+        async with AsWebexSimpleApi(tokens=token) as api:
+            meetings = await api.meetings.list(meeting_type=MeetingType.meeting, from_=yesterday, to_=today)
+            columns = await AsQualityCollector(api, concurrency=10).collect(meetings)
+            for summary in columns.summary(by='network', media='audio_in'):
+                print(summary.key, summary.metrics['jitter'].p95)
+"""
+import logging
+import math
+import sys
+from array import array
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Literal, Optional, Union
+
+from dateutil.parser import isoparse
+
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.fan_out import ProgressCallback, as_items_as_completed
+from wxc_sdk.meetings import Meeting
+from wxc_sdk.meetings.qualities import MediaSessionQuality
+
+__all__ = ['MEDIA_TYPES', 'METRICS', 'MetricStats', 'QualitySummary', 'QualityColumns', 'AsQualityCollector']
+
+log = logging.getLogger(__name__)
+
+MEETING_QUALITIES_URL = 'https://analytics.webexapis.com/v1/meeting/qualities'
+
+#: media streams of a session: attribute names of :class:`MediaSessionQuality` and keys in the raw JSON
+MEDIA_TYPES = {'audio_in': 'audioIn', 'audio_out': 'audioOut', 'video_in': 'videoIn', 'video_out': 'videoOut',
+               'share_in': 'shareIn', 'share_out': 'shareOut'}
+
+#: metrics with one value per sampling interval: attribute names of
+#: :class:`VideoIn <wxc_sdk.meetings.qualities.VideoIn>` and keys in the raw JSON
+METRICS = {'packet_loss': 'packetLoss', 'latency': 'latency', 'jitter': 'jitter', 'media_bit_rate': 'mediaBitRate',
+           'frame_rate': 'frameRate', 'resolution_height': 'resolutionHeight'}
+
+SummaryKey = Literal['meeting', 'site', 'network']
+
+
+def _str(value) -> Optional[str]:
+    # repeated strings (client types, regions, codecs, ...) are only stored once
+    return value if value is None else sys.intern(str(value))
+
+
+def _timestamp(value: Optional[str]) -> float:
+    if not value:
+        return math.nan
+    try:
+        return isoparse(value).timestamp()
+    except ValueError:
+        return math.nan
+
+
+@dataclass
+class MetricStats:
+    """
+    Statistics of one metric
+    """
+    #: number of samples
+    count: int = 0
+    mean: float = math.nan
+    #: 95th percentile
+    p95: float = math.nan
+    max: float = math.nan
+
+    @classmethod
+    def from_values(cls, values: array) -> 'MetricStats':
+        values = sorted(v for v in values if not math.isnan(v))
+        if not values:
+            return cls()
+        return cls(count=len(values), mean=math.fsum(values) / len(values),
+                   p95=values[min(len(values) - 1, math.ceil(0.95 * len(values)) - 1)], max=values[-1])
+
+
+@dataclass
+class QualitySummary:
+    """
+    Summary statistics for a group of sessions
+    """
+    #: meeting id, site URL or network type
+    key: Optional[str]
+    #: number of sessions
+    sessions: int = 0
+    #: number of media streams
+    streams: int = 0
+    #: statistics per metric
+    metrics: dict[str, MetricStats] = field(default_factory=dict)
+
+
+class QualityColumns:
+    """
+    Columnar storage of meeting quality data
+    """
+
+    #: session columns
+    SESSION_COLUMNS = {'meeting_id': 'meetingInstanceId', 'participant_id': 'participantId',
+                       'participant_session_id': 'participantSessionId', 'user_email': 'webexUserEmail',
+                       'client_type': 'clientType', 'client_version': 'clientVersion', 'os_type': 'osType',
+                       'network_type': 'networkType', 'server_region': 'serverRegion'}
+
+    def __init__(self):
+        #: session columns; one entry per session. See :attr:`SESSION_COLUMNS`
+        self.sessions: dict[str, list[Optional[str]]] = {column: [] for column in self.SESSION_COLUMNS}
+        #: site URL of each session's meeting; only set if known when the session was added
+        self.site_url: list[Optional[str]] = []
+        #: join time of each session as POSIX timestamp
+        self.join_time = array('d')
+        #: session index of each media stream
+        self.stream_session = array('l')
+        #: media type of each stream; key of :data:`MEDIA_TYPES`
+        self.stream_media: list[str] = []
+        #: codec of each stream
+        self.stream_codec: list[Optional[str]] = []
+        #: transport type of each stream
+        self.stream_transport: list[Optional[str]] = []
+        #: sampling interval of each stream in seconds
+        self.stream_interval = array('d')
+        #: start time of each stream as POSIX timestamp
+        self.stream_start = array('d')
+        #: the samples of stream i are at positions offsets[i] to offsets[i + 1] in the metric columns
+        self.offsets = array('q', [0])
+        #: sample columns: one array per metric. See :data:`METRICS`
+        self.samples: dict[str, array] = {metric: array('d') for metric in METRICS}
+        #: meetings for which quality data could not be fetched: meeting id -> error message
+        self.errors: dict[str, str] = dict()
+
+    def __len__(self) -> int:
+        return len(self.site_url)
+
+    @property
+    def stream_count(self) -> int:
+        return len(self.stream_media)
+
+    @property
+    def sample_count(self) -> int:
+        return self.offsets[-1]
+
+    def add_session(self, data: dict, site_url: str = None):
+        """
+        Add a session from the raw JSON of a quality record
+
+        :param data: quality record as returned by the API (camelCase keys)
+        :param site_url: site URL of the meeting
+        """
+        session = len(self)
+        for column, key in self.SESSION_COLUMNS.items():
+            self.sessions[column].append(_str(data.get(key)))
+        self.site_url.append(_str(site_url))
+        self.join_time.append(_timestamp(data.get('joinTime')))
+        for media, media_key in MEDIA_TYPES.items():
+            for stream in data.get(media_key) or ():
+                series = [stream.get(key) or () for key in METRICS.values()]
+                length = max(map(len, series))
+                for column, values in zip(self.samples.values(), series):
+                    column.extend(math.nan if v is None else v for v in values)
+                    if len(values) < length:
+                        column.extend([math.nan] * (length - len(values)))
+                self.offsets.append(self.offsets[-1] + length)
+                self.stream_session.append(session)
+                self.stream_media.append(media)
+                self.stream_codec.append(_str(stream.get('codec')))
+                self.stream_transport.append(_str(stream.get('transportType')))
+                interval = stream.get('samplingInterval')
+                self.stream_interval.append(math.nan if interval is None else interval)
+                self.stream_start.append(_timestamp(stream.get('startTime')))
+
+    def add_quality(self, quality: MediaSessionQuality, site_url: str = None):
+        """
+        Add a session from a parsed quality record
+
+        :param quality: quality record
+        :param site_url: site URL of the meeting
+        """
+        self.add_session(quality.model_dump(mode='json', by_alias=True, exclude_none=True), site_url=site_url)
+
+    def extend(self, other: 'QualityColumns'):
+        """
+        Append all sessions of another instance
+        """
+        session_base = len(self)
+        sample_base = self.offsets[-1]
+        for column, values in other.sessions.items():
+            self.sessions[column].extend(values)
+        self.site_url.extend(other.site_url)
+        self.join_time.extend(other.join_time)
+        self.stream_session.extend(s + session_base for s in other.stream_session)
+        self.stream_media.extend(other.stream_media)
+        self.stream_codec.extend(other.stream_codec)
+        self.stream_transport.extend(other.stream_transport)
+        self.stream_interval.extend(other.stream_interval)
+        self.stream_start.extend(other.stream_start)
+        self.offsets.extend(o + sample_base for o in other.offsets[1:])
+        for metric, values in other.samples.items():
+            self.samples[metric].extend(values)
+        self.errors.update(other.errors)
+
+    def series(self, stream: int, metric: str) -> array:
+        """
+        Time series of a metric for one stream
+
+        :param stream: stream index
+        :param metric: metric; key of :data:`METRICS`
+        :return: one value per sampling interval
+        """
+        return self.samples[metric][self.offsets[stream]:self.offsets[stream + 1]]
+
+    def _key(self, by: SummaryKey) -> list[Optional[str]]:
+        if by == 'meeting':
+            return self.sessions['meeting_id']
+        if by == 'site':
+            return self.site_url
+        if by == 'network':
+            return self.sessions['network_type']
+        raise ValueError(f'invalid summary key: {by}')
+
+    def summary(self, by: SummaryKey = 'meeting', media: Union[str, Iterable[str]] = None,
+                metrics: Iterable[str] = None) -> list[QualitySummary]:
+        """
+        Summary statistics per meeting, site or network type
+
+        :param by: grouping: 'meeting', 'site' or 'network'
+        :param media: only consider these media types (keys of :data:`MEDIA_TYPES`). Default: all
+        :param metrics: metrics to summarize. Default: all
+        :return: one summary per group, ordered by key
+        """
+        keys = self._key(by)
+        if isinstance(media, str):
+            media = {media}
+        media = set(media) if media is not None else None
+        metrics = list(metrics) if metrics is not None else list(METRICS)
+
+        # stream indices per group
+        groups: dict[Optional[str], list[int]] = defaultdict(list)
+        for stream, session in enumerate(self.stream_session):
+            if media is None or self.stream_media[stream] in media:
+                groups[keys[session]].append(stream)
+        sessions: dict[Optional[str], int] = defaultdict(int)
+        for key in keys:
+            sessions[key] += 1
+
+        summaries = []
+        for key in sorted(sessions, key=lambda k: (k is None, k or '')):
+            streams = groups.get(key, [])
+            summary = QualitySummary(key=key, sessions=sessions[key], streams=len(streams))
+            for metric in metrics:
+                column = self.samples[metric]
+                values = array('d')
+                for stream in streams:
+                    values.extend(column[self.offsets[stream]:self.offsets[stream + 1]])
+                summary.metrics[metric] = MetricStats.from_values(values)
+            summaries.append(summary)
+        return summaries
+
+
+class AsQualityCollector:
+    """
+    Fetch quality data of many meetings concurrently into a :class:`QualityColumns` instance
+    """
+
+    def __init__(self, api: AsWebexSimpleApi, *, concurrency: int = 5):
+        """
+        :param api: async API
+        :param concurrency: maximum number of meetings fetched concurrently
+        """
+        self.api = api
+        self.concurrency = concurrency
+
+    async def fetch(self, meeting_id: str, site_url: str = None) -> QualityColumns:
+        """
+        Fetch quality data of one meeting
+
+        :param meeting_id: meeting instance id
+        :param site_url: site URL of the meeting
+        :return: quality data of the meeting
+        """
+        columns = QualityColumns()
+        async for data in self.api.session.follow_pagination(url=MEETING_QUALITIES_URL,
+                                                             params={'meetingId': meeting_id}):
+            columns.add_session(data, site_url=site_url)
+        return columns
+
+    async def collect(self, meetings: Iterable[Union[str, Meeting]], columns: QualityColumns = None,
+                      progress: ProgressCallback = None) -> QualityColumns:
+        """
+        Fetch quality data of multiple meetings.
+
+        The data of each meeting is only added after all pages were fetched; failures are recorded in
+        :attr:`QualityColumns.errors`
+
+        :param meetings: meeting instance ids or meetings; for meetings the site URL is recorded with each session
+        :param columns: add to these columns. Default: new instance
+        :param progress: callback for progress reporting
+        :return: quality data
+        """
+        columns = columns if columns is not None else QualityColumns()
+
+        def fetch(meeting: Union[str, Meeting]):
+            if isinstance(meeting, Meeting):
+                return self.fetch(meeting.id, site_url=meeting.site_url)
+            return self.fetch(meeting)
+
+        async for result in as_items_as_completed(fetch, meetings, concurrency=self.concurrency,
+                                                  progress=progress):
+            meeting_id = result.item.id if isinstance(result.item, Meeting) else result.item
+            if result.ok:
+                columns.extend(result.result)
+            else:
+                log.warning(f'failed to get quality data for meeting {meeting_id}: {result.exception}')
+                columns.errors[meeting_id] = str(result.exception)
+        return columns
@@ -4,10 +4,8 @@ Meetings preferences API
 
 from typing import Optional
 
-from pydantic import TypeAdapter
-
 from ...api_child import ApiChild
-from ...base import ApiModel
+from ...base import ApiModel, type_adapter
 from ...base import SafeEnum as Enum
 from ...common import LinkRelation
 
@@ -529,7 +527,7 @@ class MeetingPreferencesApi(ApiChild, base='meetingPreferences'):
             params['siteUrl'] = site_url
         url = self.ep('video')
         data = super().get(url=url, params=params)
-        return TypeAdapter(list[VideoDevice]).validate_python(data["videoDevices"])
+        return type_adapter(list[VideoDevice]).validate_python(data["videoDevices"])
 
     def update_video_options(self, video_devices: VideoDevice, user_email: str = None,
                              site_url: str = None) -> list[VideoDevice]:
@@ -561,7 +559,7 @@ class MeetingPreferencesApi(ApiChild, base='meetingPreferences'):
             body.video_devices = video_devices
         url = self.ep('video')
         data = super().put(url=url, params=params, data=body.model_dump_json())
-        return TypeAdapter(list[VideoDevice]).validate_python(data["videoDevices"])
+        return type_adapter(list[VideoDevice]).validate_python(data["videoDevices"])
 
     def scheduling_options(self, user_email: str = None, site_url: str = None) -> SchedulingOptions:
         """
@@ -654,7 +652,7 @@ class MeetingPreferencesApi(ApiChild, base='meetingPreferences'):
             params['userEmail'] = user_email
         url = self.ep('sites')
         data = super().get(url=url, params=params)
-        return TypeAdapter(list[MeetingsSite]).validate_python(data["sites"])
+        return type_adapter(list[MeetingsSite]).validate_python(data["sites"])
 
     def update_default_site(self, default_site: bool, site_url: str, user_email: str = None) -> MeetingsSite:
         """
@@ -157,5 +157,5 @@ class MeetingQualitiesApi(ApiChild, base=''):
         params['meetingId'] = meeting_id
         if offset is not None:
             params['offset'] = offset
-        url = self.ep('https://analytics.webexapis.com/v1/meeting/qualities')
+        url = 'https://analytics.webexapis.com/v1/meeting/qualities'
         return self.session.follow_pagination(url=url, model=MediaSessionQuality, params=params)
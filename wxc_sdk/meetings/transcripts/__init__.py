@@ -1,6 +1,8 @@
 """
 Meeting transcripts API
 """
+import json
+import os
 from collections.abc import Generator
 from typing import Optional
 
@@ -158,10 +160,28 @@ class MeetingTranscriptsApi(ApiChild, base=''):
         url = self.ep('admin/meetingTranscripts')
         return self.session.follow_pagination(url=url, model=Transcript, params=params)
 
-    def download(self, transcript_id: str, format: str = None, host_email: str = None):
+    def _download_url_params(self, transcript_id: str, format: str = None,
+                             host_email: str = None) -> tuple[str, dict]:
+        """
+        URL and parameters for a transcript download
+
+        :meta private:
+        """
+        params = {}
+        if format is not None:
+            params['format'] = format
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        url = self.ep(f'meetingTranscripts/{transcript_id}/download')
+        return url, params
+
+    def download(self, transcript_id: str, format: str = None, host_email: str = None) -> str:
         """
         Download a meeting transcript from the meeting transcript specified by transcriptId.
 
+        The whole transcript is read into memory. Use :meth:`download_stream` or :meth:`download_to_file` for large
+        transcripts.
+
         :param transcript_id: Unique identifier for the meeting transcript.
         :type transcript_id: str
         :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
@@ -170,17 +190,127 @@ class MeetingTranscriptsApi(ApiChild, base=''):
             calling the API has the admin-level scopes. If set, the admin may specify the email of a user in a site
             they manage and the API will return details for a meeting that is hosted by that user.
         :type host_email: str
+        :return: transcript content
+        :rtype: str
 
         documentation: https://developer.webex.com/docs/api/v1/meeting-transcripts/download-a-meeting-transcript
         """
-        params = {}
-        if format is not None:
-            params['format'] = format
-        if host_email is not None:
-            params['hostEmail'] = host_email
-        url = self.ep(f'meetingTranscripts/{transcript_id}/download')
-        super().get(url=url, params=params)
-        # TODO: fix. Find out what the actual return type is
+        url, params = self._download_url_params(transcript_id=transcript_id, format=format, host_email=host_email)
+        data = super().get(url=url, params=params)
+        return data if isinstance(data, str) else json.dumps(data)
+
+    def download_stream(self, transcript_id: str, format: str = None, host_email: str = None,
+                        chunk_size: int = 65536) -> Generator[bytes, None, None]:
+        """
+        Download a meeting transcript in chunks without reading the whole transcript into memory
+
+        :param transcript_id: Unique identifier for the meeting transcript.
+        :type transcript_id: str
+        :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
+        :type format: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes.
+        :type host_email: str
+        :param chunk_size: maximum size of the chunks
+        :type chunk_size: int
+        :return: generator of chunks of the transcript content
+        """
+        '''async
+    async def download_stream(self, transcript_id: str, format: str = None, host_email: str = None,
+                              chunk_size: int = 65536) -> AsyncGenerator[bytes, None]:
+        """
+        Download a meeting transcript in chunks without reading the whole transcript into memory
+
+        :param transcript_id: Unique identifier for the meeting transcript.
+        :type transcript_id: str
+        :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
+        :type format: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes.
+        :type host_email: str
+        :param chunk_size: maximum size of the chunks
+        :type chunk_size: int
+        :return: async generator of chunks of the transcript content
+        """
+        url, params = self._download_url_params(transcript_id=transcript_id, format=format, host_email=host_email)
+        async for chunk in self.session.stream_get(url=url, params=params, chunk_size=chunk_size):
+            yield chunk
+        '''
+        url, params = self._download_url_params(transcript_id=transcript_id, format=format, host_email=host_email)
+        yield from self.session.stream_get(url=url, params=params, chunk_size=chunk_size)
+
+    def download_to_file(self, transcript_id: str, path: str, format: str = None, host_email: str = None,
+                         chunk_size: int = 65536) -> int:
+        """
+        Download a meeting transcript to a file.
+
+        The transcript is streamed to a temporary file next to the target which is renamed to the target path after
+        the download completed: the target file never contains a partial transcript.
+
+        :param transcript_id: Unique identifier for the meeting transcript.
+        :type transcript_id: str
+        :param path: path of the target file
+        :type path: str
+        :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
+        :type format: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes.
+        :type host_email: str
+        :param chunk_size: maximum size of the chunks
+        :type chunk_size: int
+        :return: number of bytes written
+        :rtype: int
+        """
+        '''async
+    async def download_to_file(self, transcript_id: str, path: str, format: str = None, host_email: str = None,
+                               chunk_size: int = 65536) -> int:
+        """
+        Download a meeting transcript to a file.
+
+        The transcript is streamed to a temporary file next to the target which is renamed to the target path after
+        the download completed: the target file never contains a partial transcript.
+
+        :param transcript_id: Unique identifier for the meeting transcript.
+        :type transcript_id: str
+        :param path: path of the target file
+        :type path: str
+        :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
+        :type format: str
+        :param host_email: Email address for the meeting host. This parameter is only used if the user or application
+            calling the API has the admin-level scopes.
+        :type host_email: str
+        :param chunk_size: maximum size of the chunks
+        :type chunk_size: int
+        :return: number of bytes written
+        :rtype: int
+        """
+        tmp_path = f'{path}.part'
+        size = 0
+        try:
+            with open(tmp_path, mode='wb') as f:
+                async for chunk in self.download_stream(transcript_id=transcript_id, format=format,
+                                                        host_email=host_email, chunk_size=chunk_size):
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return size
+        '''
+        tmp_path = f'{path}.part'
+        size = 0
+        try:
+            with open(tmp_path, mode='wb') as f:
+                for chunk in self.download_stream(transcript_id=transcript_id, format=format, host_email=host_email,
+                                                  chunk_size=chunk_size):
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return size
 
     def list_snippets(self, transcript_id: str, **params) -> Generator[TranscriptSnippet, None, None]:
         """
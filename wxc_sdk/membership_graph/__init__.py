@@ -0,0 +1,461 @@
+"""
+Graph of memberships in spaces, teams and groups
+
+Answering "which spaces, teams and groups is this person in" with the APIs requires listing the members of each space
+(:meth:`api.memberships.list <wxc_sdk.memberships.MembershipApi.list>`), team
+(:meth:`api.team_memberships.list <wxc_sdk.team_memberships.TeamMembershipsApi.list>`) and group
+(:meth:`api.groups.members <wxc_sdk.groups.GroupsApi.members>` or SCIM groups). :class:`AsMembershipGraphBuilder`
+crawls these APIs concurrently and creates a :class:`MembershipGraph`:
+
+* persons and containers (spaces, teams, groups) are mapped to integer indices: :class:`IdIndex`. Webex person ids
+  and the UUIDs used by SCIM are mapped to the same index
+* memberships are stored as compact adjacency arrays in CSR layout (offsets + indices) in both directions: members of
+  a container and containers of a person are both a single slice
+* changes are kept in a small overlay until the graph is compacted again; the graph can be updated incrementally from
+  membership webhook events: :meth:`MembershipGraph.apply_event`
+
+Example:
+
+    .. code-block:: python
+
+        async with AsWebexSimpleApi(tokens=token, concurrent_requests=50) as api:
+            graph = await AsMembershipGraphBuilder(api, concurrency=50).build()
+        for container_id in graph.containers_of('leaver@example.com'):
+            print(graph.kind(container_id), container_id)
+"""
+import base64
+import binascii
+import contextlib
+import logging
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from itertools import accumulate
+from typing import Optional, Union
+
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.fan_out import as_items_as_completed
+from wxc_sdk.webhook import WebhookEvent, WebhookEventType
+
+__all__ = ['ContainerKind', 'normalize_id', 'IdIndex', 'MembershipGraph', 'AsMembershipGraphBuilder']
+
+log = logging.getLogger(__name__)
+
+
+class ContainerKind(str, Enum):
+    """
+    Type of a container persons are members of
+    """
+    room = 'room'
+    team = 'team'
+    group = 'group'
+
+
+#: container kinds in the order used for the kind codes in :attr:`MembershipGraph.kinds`
+_KINDS = tuple(ContainerKind)
+
+
+def normalize_id(entity_id: str, keep_type: bool = False) -> str:
+    """
+    Normalize an id for lookups: Webex ids (base64 encoded URIs) are converted to the UUID also used by SCIM. Other
+    ids are returned unchanged
+
+    :param entity_id: Webex id, UUID, or email address
+    :param keep_type: keep the resource type of Webex ids: "ROOM/<uuid>" instead of "<uuid>". Teams and their General
+        space have the same UUID
+    :return: normalized id
+    """
+    if '@' in entity_id:
+        return entity_id.lower()
+    try:
+        decoded = base64.b64decode(entity_id + '=' * (-len(entity_id) % 4), validate=True).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return entity_id
+    if not decoded.startswith('ciscospark://'):
+        return entity_id
+    return '/'.join(decoded.split('/')[-2 if keep_type else -1:])
+
+
+class IdIndex:
+    """
+    Bidirectional mapping between ids and integer indices. Lookups use normalized ids; :attr:`ids` keeps the ids as
+    they were first added
+    """
+
+    def __init__(self, keep_type: bool = False):
+        """
+        :param keep_type: normalize Webex ids to "<type>/<uuid>" instead of the bare UUID; see :func:`normalize_id`
+        """
+        self.keep_type = keep_type
+        #: index -> id
+        self.ids: list[str] = []
+        self._index: dict[str, int] = dict()
+
+    def _key(self, entity_id: str) -> str:
+        return normalize_id(entity_id, keep_type=self.keep_type)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return self._key(entity_id) in self._index
+
+    def get(self, entity_id: str) -> Optional[int]:
+        """
+        index of an id; None if the id is unknown
+        """
+        return self._index.get(self._key(entity_id))
+
+    def add(self, entity_id: str) -> int:
+        """
+        Get the index of an id; new ids are added
+        """
+        key = self._key(entity_id)
+        index = self._index.get(key)
+        if index is None:
+            index = len(self.ids)
+            self.ids.append(entity_id)
+            self._index[key] = index
+        return index
+
+    def alias(self, alias: str, index: int):
+        """
+        Add an additional id (for example an email address) for an existing index
+        """
+        self._index.setdefault(self._key(alias), index)
+
+
+def _csr(rows: array, cols: array, n_rows: int) -> tuple[array, array]:
+    """
+    Build CSR adjacency arrays from an edge list. The indices in each row are sorted
+
+    :return: offsets (n_rows + 1 entries), indices
+    """
+    counts = [0] * n_rows
+    for row in rows:
+        counts[row] += 1
+    offsets = array('l', accumulate(counts, initial=0))
+    indices = array('i', bytes(4 * len(rows)))
+    position = offsets[:-1].tolist()
+    for row, col in zip(rows, cols):
+        indices[position[row]] = col
+        position[row] += 1
+    for row in range(n_rows):
+        start, end = offsets[row], offsets[row + 1]
+        if end - start > 1:
+            indices[start:end] = array('i', sorted(indices[start:end]))
+    return offsets, indices
+
+
+class MembershipGraph:
+    """
+    Memberships of persons in containers (spaces, teams, groups)
+
+    Memberships are stored in CSR layout in both directions: container -> persons and person -> containers. Updates
+    go to an overlay of added and removed memberships which is merged into the CSR arrays by :meth:`compact`. For bulk
+    updates use :meth:`bulk` to compact only once at the end
+    """
+
+    def __init__(self, compact_threshold: int = 10000, compact_ratio: float = 0.25):
+        """
+        :param compact_threshold: minimum number of changes in the overlay before compacting automatically
+        :param compact_ratio: compact automatically only when the overlay has more changes than this fraction of the
+            compacted memberships; keeps the cost of automatic compaction linear in the number of changes
+        """
+        self.compact_threshold = compact_threshold
+        self.compact_ratio = compact_ratio
+        #: persons; email addresses are aliases of person ids
+        self.persons = IdIndex()
+        #: containers; keyed by type and UUID: a team and its General space have the same UUID
+        self.containers = IdIndex(keep_type=True)
+        #: container kind codes: index into :class:`ContainerKind`
+        self.kinds = array('B')
+        self._members = (array('l', [0]), array('i'))
+        self._containers_of = (array('l', [0]), array('i'))
+        # overlay: container -> persons, person -> containers
+        self._added: dict[int, set[int]] = defaultdict(set)
+        self._added_reverse: dict[int, set[int]] = defaultdict(set)
+        self._removed: dict[int, set[int]] = defaultdict(set)
+        self._removed_reverse: dict[int, set[int]] = defaultdict(set)
+        self._changes = 0
+        self._bulk = 0
+
+    def __len__(self) -> int:
+        """
+        number of memberships
+        """
+        return (len(self._members[1]) + sum(map(len, self._added.values())) -
+                sum(map(len, self._removed.values())))
+
+    @staticmethod
+    def _row(csr: tuple[array, array], row: int) -> array:
+        offsets, indices = csr
+        if row + 1 >= len(offsets):
+            return array('i')
+        return indices[offsets[row]:offsets[row + 1]]
+
+    @staticmethod
+    def _in_row(csr: tuple[array, array], row: int, col: int) -> bool:
+        offsets, indices = csr
+        if row + 1 >= len(offsets):
+            return False
+        end = offsets[row + 1]
+        i = bisect_left(indices, col, offsets[row], end)
+        return i < end and indices[i] == col
+
+    def _container(self, kind: ContainerKind, container_id: str) -> int:
+        container = self.containers.add(container_id)
+        if container == len(self.kinds):
+            self.kinds.append(_KINDS.index(kind))
+        return container
+
+    def add_membership(self, kind: ContainerKind, container_id: str, person_id: str, email: str = None):
+        """
+        Add a membership
+
+        :param kind: container kind
+        :param container_id: id of space, team, or group
+        :param person_id: person id
+        :param email: email address of the person; can be used for lookups
+        """
+        container = self._container(kind, container_id)
+        person = self.persons.add(person_id)
+        if email:
+            self.persons.alias(email, person)
+        if person in self._removed.get(container, ()):
+            self._removed[container].discard(person)
+            self._removed_reverse[person].discard(container)
+        elif not self._in_row(self._members, container, person):
+            self._added[container].add(person)
+            self._added_reverse[person].add(container)
+        self._changed()
+
+    def remove_membership(self, container_id: str, person_id: str):
+        """
+        Remove a membership; unknown memberships are ignored
+
+        :param container_id: id of space, team, or group
+        :param person_id: person id or email address
+        """
+        container = self.containers.get(container_id)
+        person = self.persons.get(person_id)
+        if container is None or person is None:
+            return
+        if person in self._added.get(container, ()):
+            self._added[container].discard(person)
+            self._added_reverse[person].discard(container)
+        elif self._in_row(self._members, container, person):
+            self._removed[container].add(person)
+            self._removed_reverse[person].add(container)
+        self._changed()
+
+    def remove_container(self, container_id: str):
+        """
+        Remove all memberships of a container
+        """
+        for person_id in self.members_of(container_id):
+            self.remove_membership(container_id, person_id)
+
+    def _changed(self):
+        self._changes += 1
+        if self._bulk:
+            return
+        if self._changes > max(self.compact_threshold, self.compact_ratio * len(self._members[1])):
+            self.compact()
+
+    @contextlib.contextmanager
+    def bulk(self) -> Iterator['MembershipGraph']:
+        """
+        Context manager for bulk updates: no automatic compaction while in the context; the graph is compacted once
+        when leaving the context
+        """
+        self._bulk += 1
+        try:
+            yield self
+        finally:
+            self._bulk -= 1
+            if not self._bulk:
+                self.compact()
+
+    def compact(self):
+        """
+        Merge all changes into the CSR arrays
+        """
+        rows, cols = array('i'), array('i')
+        for container in range(len(self.containers)):
+            for person in self._merged(self._members, self._added, self._removed, container):
+                rows.append(container)
+                cols.append(person)
+        self._members = _csr(rows, cols, len(self.containers))
+        self._containers_of = _csr(cols, rows, len(self.persons))
+        for overlay in (self._added, self._added_reverse, self._removed, self._removed_reverse):
+            overlay.clear()
+        self._changes = 0
+
+    def _merged(self, csr: tuple[array, array], added: dict[int, set[int]], removed: dict[int, set[int]],
+                row: int) -> Iterator[int]:
+        removed = removed.get(row)
+        for col in self._row(csr, row):
+            if not removed or col not in removed:
+                yield col
+        yield from added.get(row, ())
+
+    def kind(self, container_id: str) -> Optional[ContainerKind]:
+        """
+        Kind of a container
+        """
+        container = self.containers.get(container_id)
+        return None if container is None else _KINDS[self.kinds[container]]
+
+    def members_of(self, container_id: str) -> list[str]:
+        """
+        Person ids of the members of a container
+
+        :param container_id: id of space, team, or group
+        """
+        container = self.containers.get(container_id)
+        if container is None:
+            return []
+        ids = self.persons.ids
+        return [ids[person] for person in self._merged(self._members, self._added, self._removed, container)]
+
+    def containers_of(self, person_id: str, kind: ContainerKind = None) -> list[str]:
+        """
+        Ids of the containers a person is a member of
+
+        :param person_id: person id, SCIM user id, or email address
+        :param kind: only return containers of this kind
+        """
+        person = self.persons.get(person_id)
+        if person is None:
+            return []
+        code = None if kind is None else _KINDS.index(kind)
+        ids = self.containers.ids
+        return [ids[container]
+                for container in self._merged(self._containers_of, self._added_reverse, self._removed_reverse, person)
+                if code is None or self.kinds[container] == code]
+
+    def is_member(self, container_id: str, person_id: str) -> bool:
+        container = self.containers.get(container_id)
+        person = self.persons.get(person_id)
+        if container is None or person is None:
+            return False
+        if person in self._added.get(container, ()):
+            return True
+        return person not in self._removed.get(container, ()) and self._in_row(self._members, container, person)
+
+    def apply_event(self, event: WebhookEvent) -> bool:
+        """
+        Update the graph from a webhook event. Handles "memberships" events and deleted "rooms"
+
+        :param event: webhook event
+        :return: True if the event was applied
+        """
+        data = event.data
+        if isinstance(data, dict):
+            room_id, person_id, email = data.get('roomId'), data.get('personId'), data.get('personEmail')
+            data_id = data.get('id')
+        else:
+            room_id, person_id, email = (getattr(data, 'room_id', None), getattr(data, 'person_id', None),
+                                         getattr(data, 'person_email', None))
+            data_id = getattr(data, 'id', None)
+        if event.resource == 'memberships' and room_id and person_id:
+            if event.event == WebhookEventType.created:
+                self.add_membership(ContainerKind.room, room_id, person_id, email=email)
+                return True
+            if event.event == WebhookEventType.deleted:
+                self.remove_membership(room_id, person_id)
+                return True
+        elif event.resource == 'rooms' and event.event == WebhookEventType.deleted and data_id:
+            self.remove_container(data_id)
+            return True
+        return False
+
+
+class AsMembershipGraphBuilder:
+    """
+    Crawl spaces, teams and groups concurrently and build a :class:`MembershipGraph`
+    """
+
+    def __init__(self, api: AsWebexSimpleApi, *, concurrency: int = 20, scim_org_id: str = None):
+        """
+        :param api: async API
+        :param concurrency: maximum number of containers crawled concurrently
+        :param scim_org_id: get groups and group members using SCIM 2 for this organization instead of the groups API
+        """
+        self.api = api
+        self.concurrency = concurrency
+        self.scim_org_id = scim_org_id
+        #: containers which could not be crawled in the last build: container id -> error message
+        self.failed: dict[str, str] = dict()
+
+    async def containers(self, rooms: bool = True, teams: bool = True,
+                         groups: bool = True) -> list[tuple[ContainerKind, str]]:
+        """
+        List the containers to crawl
+        """
+        containers = []
+        if rooms:
+            containers.extend([(ContainerKind.room, room.id) async for room in self.api.rooms.list_gen()])
+        if teams:
+            containers.extend([(ContainerKind.team, team.id) async for team in self.api.teams.list_gen()])
+        if groups:
+            if self.scim_org_id:
+                containers.extend([(ContainerKind.group, group.id)
+                                   async for group in self.api.scim.groups.search_all_gen(org_id=self.scim_org_id)])
+            else:
+                containers.extend([(ContainerKind.group, group.group_id)
+                                   async for group in self.api.groups.list_gen()])
+        return containers
+
+    async def members(self, kind: ContainerKind, container_id: str) -> list[tuple[str, Optional[str]]]:
+        """
+        Members of a container
+
+        :return: list of (person id, email)
+        """
+        if kind == ContainerKind.room:
+            return [(m.person_id, m.person_email)
+                    async for m in self.api.memberships.list_gen(room_id=container_id)]
+        if kind == ContainerKind.team:
+            return [(m.person_id, m.person_email)
+                    async for m in self.api.team_memberships.list_gen(team_id=container_id)]
+        if self.scim_org_id:
+            return [(m.value, None)
+                    async for m in self.api.scim.groups.members_all_gen(org_id=self.scim_org_id,
+                                                                        group_id=container_id)]
+        return [(m.member_id, None) async for m in self.api.groups.members_gen(group_id=container_id)]
+
+    async def build(self, containers: Iterable[tuple[Union[ContainerKind, str], str]] = None,
+                    graph: MembershipGraph = None) -> MembershipGraph:
+        """
+        Crawl containers and build a graph
+
+        :param containers: (kind, container id) tuples to crawl. Default: all spaces, teams and groups from
+            :meth:`containers`
+        :param graph: graph to add memberships to. Default: new graph
+        :return: compacted graph
+        """
+        if containers is None:
+            containers = await self.containers()
+        graph = graph if graph is not None else MembershipGraph()
+        self.failed = dict()
+
+        async def members(container: tuple[ContainerKind, str]):
+            return await self.members(ContainerKind(container[0]), container[1])
+
+        with graph.bulk():
+            async for result in as_items_as_completed(members, containers, concurrency=self.concurrency):
+                kind, container_id = result.item
+                if not result.ok:
+                    log.warning(f'failed to get members of {kind} {container_id}: {result.exception}')
+                    self.failed[container_id] = str(result.exception) or result.exception.__class__.__name__
+                    continue
+                for person_id, email in result.result:
+                    if person_id:
+                        graph.add_membership(ContainerKind(kind), container_id, person_id, email=email)
+        log.info(f'membership graph: {len(graph.persons)} persons, {len(graph.containers)} containers, '
+                 f'{len(graph)} memberships, {len(self.failed)} failed containers')
+        return graph
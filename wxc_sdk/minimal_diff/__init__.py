@@ -0,0 +1,244 @@
+"""
+Minimal-diff updates: skip no-op updates and send only changed fields
+
+Setters like :meth:`api.person_settings.forwarding.configure
+<wxc_sdk.person_settings.forwarding.PersonForwardingApi.configure>`,
+:meth:`api.telephony.callqueue.update <wxc_sdk.telephony.callqueue.CallQueueApi.update>` or
+:meth:`api.telephony.location.update <wxc_sdk.telephony.location.TelephonyLocationApi.update>` serialize the complete
+model passed to them and always issue a request. When re-applying a desired state to a large number of entities most
+of these requests are no-ops.
+
+:class:`MinimalDiff` compares the desired state with the last known state (from a cache or fetched on demand) and:
+
+* skips the update entirely if nothing changed
+* else calls the setter with a sparse copy of the desired model which only has the changed fields set. All update
+  helpers in the SDK serialize with ``exclude_unset`` or ``exclude_none`` so that only the changed fields are sent
+* reports what was sent: :class:`DiffResult`
+
+For endpoints with full replace semantics (like :meth:`api.people.update <wxc_sdk.people.PeopleApi.update>`) the
+sparse payload can be disabled with ``sparse=False``: no-op updates are still skipped but the complete model is sent.
+
+Example:
+
+    .. code-block:: python
+
+        diff = MinimalDiff()
+        for person_id in person_ids:
+            r = diff.update(key=('forwarding', person_id),
+                            desired=desired_forwarding,
+                            current=lambda: api.person_settings.forwarding.read(person_id),
+                            update=lambda f: api.person_settings.forwarding.configure(person_id, f))
+            if not r.skipped:
+                print(f'{person_id}: changed {", ".join(r.changes)}')
+        print(f'{diff.sent} updates sent, {diff.skipped} skipped')
+"""
+import inspect
+import logging
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Optional, TypeVar, Union
+
+from pydantic import BaseModel
+
+__all__ = ['model_diff', 'sparse_model', 'DiffResult', 'MinimalDiff']
+
+log = logging.getLogger(__name__)
+
+M = TypeVar('M', bound=BaseModel)
+
+# current state: model, JSON dict, or (async) callable returning the model
+CurrentState = Union[BaseModel, dict, Callable[[], Union[BaseModel, Awaitable[BaseModel]]], None]
+
+
+def _as_json(state: Union[BaseModel, dict, None]) -> dict:
+    if state is None:
+        return {}
+    if isinstance(state, BaseModel):
+        return state.model_dump(mode='json')
+    return state
+
+
+def model_diff(current: Union[BaseModel, dict, None], desired: BaseModel, ignore: Iterable[str] = None,
+               ignore_none: bool = True) -> dict[str, tuple[Any, Any]]:
+    """
+    Changed fields between current and desired state.
+
+    Only fields set in the desired model (:attr:`pydantic.BaseModel.model_fields_set`) are considered. Values are
+    compared in their JSON representation; nested models are compared as a whole.
+
+    :param current: current state as model or JSON dict (as returned by ``model_dump(mode='json')``)
+    :param desired: desired state
+    :param ignore: names of fields to ignore
+    :param ignore_none: ignore fields which are None in the desired state
+    :return: dict field name -> (current value, desired value), JSON representation
+    """
+    ignore = set(ignore or ())
+    current_json = _as_json(current)
+    fields = desired.model_fields_set - ignore
+    desired_json = desired.model_dump(mode='json', include=fields)
+    changes = dict()
+    for name in sorted(fields):
+        new = desired_json.get(name)
+        if new is None and ignore_none:
+            continue
+        old = current_json.get(name)
+        if old != new:
+            changes[name] = (old, new)
+    return changes
+
+
+def sparse_model(model: M, fields: Iterable[str]) -> M:
+    """
+    Copy of a model with only the given fields set. All other fields have their default value and are not in
+    :attr:`pydantic.BaseModel.model_fields_set`, so that they are excluded from ``exclude_unset`` and ``exclude_none``
+    serialization.
+
+    :param model: model to copy
+    :param fields: names of fields to keep
+    :return: sparse copy
+    """
+    fields = set(fields)
+    return model.model_construct(_fields_set=fields, **{name: getattr(model, name) for name in fields})
+
+
+@dataclass
+class DiffResult:
+    """
+    Result of a minimal-diff update
+    """
+    #: key of the updated entity
+    key: Hashable
+    #: changed fields: field name -> (current value, desired value)
+    changes: dict[str, tuple[Any, Any]]
+    #: model passed to the setter; None if the update was skipped
+    payload: Optional[BaseModel] = None
+    #: return value of the setter
+    result: Any = None
+
+    @property
+    def skipped(self) -> bool:
+        """
+        True if nothing changed and no request was sent
+        """
+        return not self.changes
+
+
+@dataclass
+class MinimalDiff:
+    """
+    Minimal-diff updates with a cache of the last known state of each entity.
+
+    The cache holds the JSON representation of the last known state per key. After each update the cached state is
+    updated with the changes sent so that re-applying the same desired state does not require another read.
+    """
+    #: fields to always include in the payload, even if unchanged (for example ids required by the setter)
+    always: set[str] = field(default_factory=set)
+    #: fields to never consider in the diff
+    ignore: set[str] = field(default_factory=set)
+    #: last known state (JSON dict) per key
+    cache: dict[Hashable, dict] = field(default_factory=dict)
+    #: number of updates sent
+    sent: int = 0
+    #: number of updates skipped
+    skipped: int = 0
+
+    def forget(self, key: Hashable = None):
+        """
+        Remove an entry from the cache; forget all cached state if no key is given
+
+        :param key: key of entity
+        """
+        if key is None:
+            self.cache.clear()
+        else:
+            self.cache.pop(key, None)
+
+    def _prepare(self, key: Hashable, current: Union[BaseModel, dict, None], desired: BaseModel,
+                 ignore: Optional[Iterable[str]]) -> DiffResult:
+        current_json = _as_json(current)
+        self.cache[key] = current_json
+        return DiffResult(key=key, changes=model_diff(current_json, desired, ignore=self.ignore | set(ignore or ())))
+
+    def _payload(self, result: DiffResult, desired: M, sparse: bool, always: Optional[Iterable[str]]) -> Optional[M]:
+        if result.skipped:
+            self.skipped += 1
+            log.debug(f'minimal diff {result.key}: no changes, update skipped')
+            return None
+        self.sent += 1
+        log.debug(f'minimal diff {result.key}: changed {", ".join(result.changes)}')
+        if not sparse:
+            return desired
+        fields = set(result.changes) | ((self.always | set(always or ())) & desired.model_fields_set)
+        return sparse_model(desired, fields)
+
+    def _updated(self, result: DiffResult):
+        state = self.cache.setdefault(result.key, {})
+        state.update((name, new) for name, (_, new) in result.changes.items())
+
+    def _current(self, key: Hashable, current: CurrentState, use_cache: bool):
+        """
+        cached state or current state as passed (without calling a callable)
+        """
+        if use_cache and key in self.cache:
+            return self.cache[key], False
+        if callable(current) and not isinstance(current, BaseModel):
+            return current, True
+        return current, False
+
+    def update(self, key: Hashable, desired: M, update: Callable[[M], Any], current: CurrentState = None,
+               sparse: bool = True, always: Iterable[str] = None, ignore: Iterable[str] = None,
+               use_cache: bool = True) -> DiffResult:
+        """
+        Apply desired state with a minimal diff
+
+        :param key: key identifying the entity, for example ``('forwarding', person_id)``
+        :param desired: desired state
+        :param update: setter; called with the (sparse) desired state
+        :param current: current state as model or JSON dict, or callable returning the current state. Only used if
+            no cached state exists for the key (or if use_cache is False)
+        :param sparse: pass a sparse model with only the changed fields to the setter. Else the complete desired
+            model is passed
+        :param always: additional fields to always include in a sparse payload
+        :param ignore: additional fields to ignore in the diff
+        :param use_cache: use cached state if available
+        :return: result of the update
+        """
+        state, fetch = self._current(key, current, use_cache)
+        if fetch:
+            state = state()
+        result = self._prepare(key, state, desired, ignore)
+        if (payload := self._payload(result, desired, sparse, always)) is None:
+            return result
+        result.payload = payload
+        result.result = update(payload)
+        self._updated(result)
+        return result
+
+    async def as_update(self, key: Hashable, desired: M, update: Callable[[M], Awaitable[Any]],
+                        current: CurrentState = None, sparse: bool = True, always: Iterable[str] = None,
+                        ignore: Iterable[str] = None, use_cache: bool = True) -> DiffResult:
+        """
+        Apply desired state with a minimal diff using the async API. See :meth:`update`
+
+        :param key: key identifying the entity
+        :param desired: desired state
+        :param update: async setter; called with the (sparse) desired state
+        :param current: current state as model or JSON dict, or (async) callable returning the current state
+        :param sparse: pass a sparse model with only the changed fields to the setter
+        :param always: additional fields to always include in a sparse payload
+        :param ignore: additional fields to ignore in the diff
+        :param use_cache: use cached state if available
+        :return: result of the update
+        """
+        state, fetch = self._current(key, current, use_cache)
+        if fetch:
+            state = state()
+            if inspect.isawaitable(state):
+                state = await state
+        result = self._prepare(key, state, desired, ignore)
+        if (payload := self._payload(result, desired, sparse, always)) is None:
+            return result
+        result.payload = payload
+        result.result = await update(payload)
+        self._updated(result)
+        return result
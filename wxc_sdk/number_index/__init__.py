@@ -0,0 +1,383 @@
+"""
+Number and extension ownership index
+
+Resolving the owner of a phone number or extension otherwise means scanning :meth:`api.telephony.phone_numbers
+<wxc_sdk.telephony.TelephonyApi.phone_numbers>` page by page. :class:`NumberIndex` is an in-memory index built from
+the phone number list and the feature lists (hunt groups, call queues, auto attendants, virtual lines and workspaces)
+keyed by:
+
+* E.164 number
+* extension per location
+* ESN (routing prefix + extension)
+
+Owners are stored in compact parallel arrays; the keys map to integer owner slots. The index can be built in bulk
+from the API (:meth:`NumberIndex.from_api`, :meth:`NumberIndex.as_from_api`) and then be updated incrementally.
+
+Example:
+
+    .. code-block:: python
+
+        with WebexSimpleApi() as api:
+            index = NumberIndex.from_api(api)
+        owner = index.by_number('+14085551234')
+        owner = index.by_extension(location_id=location_id, extension='4711')
+"""
+import asyncio
+import logging
+from array import array
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Union
+
+from wxc_sdk.common import OwnerType
+from wxc_sdk.inventory import normalize_number
+from wxc_sdk.telephony import NumberListPhoneNumber
+from wxc_sdk.telephony.autoattendant import AutoAttendant
+from wxc_sdk.telephony.callqueue import CallQueue
+from wxc_sdk.telephony.huntgroup import HuntGroup
+from wxc_sdk.telephony.virtual_line import VirtualLine
+from wxc_sdk.workspaces import Workspace
+
+__all__ = ['NumberOwnerRef', 'NumberIndex']
+
+log = logging.getLogger(__name__)
+
+
+class NumberOwnerRef(NamedTuple):
+    """
+    Result of a lookup in the number index
+    """
+    #: ID of the owner; None for numbers without owner
+    owner_id: Optional[str]
+    #: owner type, see :class:`wxc_sdk.common.OwnerType`
+    owner_type: Optional[str]
+    #: name of the owner
+    name: Optional[str]
+    #: location ID
+    location_id: Optional[str]
+
+
+# a feature list entry which can be added to the index
+IndexableFeature = Union[CallQueue, HuntGroup, AutoAttendant, VirtualLine, Workspace]
+
+
+@dataclass(init=False, repr=False)
+class NumberIndex:
+    """
+    In-memory index of number and extension owners
+    """
+    #: owner table: parallel arrays indexed by owner slot
+    _owner_ids: list[Optional[str]]
+    _names: list[Optional[str]]
+    _owner_type_idx: array
+    _location_idx: array
+    #: keys held by each owner slot; needed for incremental updates
+    _slot_keys: list[Optional[list[tuple[str, object]]]]
+    #: free owner slots
+    _free: list[int]
+    #: owner ID -> owner slot
+    _slot_by_owner: dict[str, int]
+    #: interned strings for owner types and location IDs
+    _owner_types: list[Optional[str]]
+    _owner_type_map: dict[Optional[str], int]
+    _locations: list[Optional[str]]
+    _location_map: dict[Optional[str], int]
+    #: the actual indices: key -> owner slot
+    _by_number: dict[str, int]
+    _by_extension: dict[tuple[int, str], int]
+    _by_esn: dict[str, int]
+
+    def __init__(self):
+        self._owner_ids = []
+        self._names = []
+        self._owner_type_idx = array('i')
+        self._location_idx = array('i')
+        self._slot_keys = []
+        self._free = []
+        self._slot_by_owner = dict()
+        self._owner_types = []
+        self._owner_type_map = dict()
+        self._locations = []
+        self._location_map = dict()
+        self._by_number = dict()
+        self._by_extension = dict()
+        self._by_esn = dict()
+
+    def __len__(self) -> int:
+        return len(self._by_number) + len(self._by_extension)
+
+    @staticmethod
+    def _intern(value: Optional[str], values: list, value_map: dict) -> int:
+        idx = value_map.get(value)
+        if idx is None:
+            idx = len(values)
+            values.append(value)
+            value_map[value] = idx
+        return idx
+
+    def _ref(self, slot: Optional[int]) -> Optional[NumberOwnerRef]:
+        if slot is None:
+            return None
+        return NumberOwnerRef(owner_id=self._owner_ids[slot],
+                              owner_type=self._owner_types[self._owner_type_idx[slot]],
+                              name=self._names[slot],
+                              location_id=self._locations[self._location_idx[slot]])
+
+    def _slot(self, owner_id: Optional[str], owner_type: Optional[str], name: Optional[str],
+              location_id: Optional[str]) -> int:
+        """
+        Get (or allocate) the owner slot for an owner. Numbers without owner get one slot per location
+        """
+        key = owner_id or f'\0unassigned:{location_id}'
+        slot = self._slot_by_owner.get(key)
+        type_idx = self._intern(owner_type, self._owner_types, self._owner_type_map)
+        location_idx = self._intern(location_id, self._locations, self._location_map)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+                self._owner_ids[slot] = owner_id
+                self._names[slot] = name
+                self._owner_type_idx[slot] = type_idx
+                self._location_idx[slot] = location_idx
+                self._slot_keys[slot] = []
+            else:
+                slot = len(self._owner_ids)
+                self._owner_ids.append(owner_id)
+                self._names.append(name)
+                self._owner_type_idx.append(type_idx)
+                self._location_idx.append(location_idx)
+                self._slot_keys.append([])
+            self._slot_by_owner[key] = slot
+        else:
+            # update owner attributes with latest information
+            self._names[slot] = name or self._names[slot]
+            if owner_type:
+                self._owner_type_idx[slot] = type_idx
+            if location_id and location_idx != self._location_idx[slot]:
+                self._move(slot, location_idx)
+        return slot
+
+    def _move(self, slot: int, location_idx: int):
+        """
+        Move an owner to a new location: extensions are keyed by location and have to be re-keyed
+        """
+        self._location_idx[slot] = location_idx
+        extensions = [key for kind, key in self._slot_keys[slot] if kind == 'extension']
+        for key in extensions:
+            self._slot_keys[slot].remove(('extension', key))
+            if self._by_extension.get(key) == slot:
+                del self._by_extension[key]
+        for _, extension in extensions:
+            self._set_key(slot, 'extension', (location_idx, extension))
+
+    def _set_key(self, slot: int, kind: str, key):
+        target = {'number': self._by_number, 'extension': self._by_extension, 'esn': self._by_esn}[kind]
+        previous = target.get(key)
+        if previous == slot:
+            return
+        if previous is not None:
+            # key moves to a new owner
+            self._slot_keys[previous].remove((kind, key))
+        target[key] = slot
+        self._slot_keys[slot].append((kind, key))
+
+    def add(self, *, owner_id: Optional[str], owner_type: Optional[str], name: Optional[str],
+            location_id: Optional[str], number: str = None, extension: str = None, esn: str = None):
+        """
+        Add a number and/or extension to the index
+
+        :param owner_id: ID of the owner; None for numbers without owner
+        :param owner_type: owner type
+        :param name: name of the owner
+        :param location_id: location ID
+        :param number: phone number
+        :param extension: extension
+        :param esn: routing prefix + extension
+        """
+        if not (number or extension or esn):
+            return
+        slot = self._slot(owner_id, owner_type, name, location_id)
+        if number := normalize_number(number):
+            self._set_key(slot, 'number', number)
+        if extension:
+            self._set_key(slot, 'extension', (self._location_idx[slot], extension))
+        if esn:
+            self._set_key(slot, 'esn', esn)
+
+    def remove_owner(self, owner_id: str):
+        """
+        Remove an owner and all numbers and extensions of that owner from the index
+
+        :param owner_id: owner ID
+        """
+        slot = self._slot_by_owner.pop(owner_id, None)
+        if slot is None:
+            return
+        targets = {'number': self._by_number, 'extension': self._by_extension, 'esn': self._by_esn}
+        for kind, key in self._slot_keys[slot]:
+            targets[kind].pop(key, None)
+        self._owner_ids[slot] = None
+        self._names[slot] = None
+        self._slot_keys[slot] = None
+        self._free.append(slot)
+
+    def remove_number(self, number: str):
+        """
+        Remove a phone number from the index
+
+        :param number: phone number
+        """
+        number = normalize_number(number)
+        slot = self._by_number.pop(number, None)
+        if slot is not None:
+            self._slot_keys[slot].remove(('number', number))
+
+    def add_phone_numbers(self, numbers: Iterable[NumberListPhoneNumber]):
+        """
+        Bulk add entries from :meth:`api.telephony.phone_numbers <wxc_sdk.telephony.TelephonyApi.phone_numbers>`
+
+        :param numbers: phone number list entries
+        """
+        for n in numbers:
+            owner = n.owner
+            if owner:
+                name = owner.display_name or ' '.join(filter(None, (owner.first_name, owner.last_name))) or None
+            else:
+                name = None
+            self.add(owner_id=owner and owner.owner_id, owner_type=owner and owner.owner_type, name=name,
+                     location_id=n.location and n.location.id, number=n.phone_number, extension=n.extension,
+                     esn=n.esn)
+
+    def add_features(self, features: Iterable[IndexableFeature]):
+        """
+        Bulk add call queues, hunt groups, auto attendants, virtual lines or workspaces
+
+        :param features: list of features
+        """
+        for f in features:
+            if isinstance(f, (CallQueue, HuntGroup, AutoAttendant)):
+                if isinstance(f, AutoAttendant):
+                    owner_id, owner_type = f.auto_attendant_id, OwnerType.auto_attendant
+                elif isinstance(f, CallQueue):
+                    owner_id, owner_type = f.id, OwnerType.call_queue
+                else:
+                    owner_id, owner_type = f.id, OwnerType.hunt_group
+                self.add(owner_id=owner_id, owner_type=owner_type.value, name=f.name, location_id=f.location_id,
+                         number=f.phone_number, extension=f.extension, esn=f.esn)
+            elif isinstance(f, VirtualLine):
+                number = f.number
+                if number is None:
+                    continue
+                self.add(owner_id=f.id, owner_type=OwnerType.virtual_line.value, name=f.display_name,
+                         location_id=f.location and f.location.id, number=number.external,
+                         extension=number.extension, esn=number.esn)
+            elif isinstance(f, Workspace):
+                wxc = f.calling and f.calling.webex_calling
+                if wxc is None:
+                    continue
+                self.add(owner_id=f.workspace_id, owner_type=OwnerType.place.value, name=f.display_name,
+                         location_id=wxc.location_id or f.location_id, number=wxc.phone_number,
+                         extension=wxc.extension)
+            else:
+                raise TypeError(f'unsupported type: {type(f).__name__}')
+
+    def by_number(self, number: str) -> Optional[NumberOwnerRef]:
+        """
+        Owner of a phone number
+
+        :param number: phone number
+        :return: owner or None if the number is not known
+        """
+        return self._ref(self._by_number.get(normalize_number(number)))
+
+    def by_extension(self, location_id: str, extension: str) -> Optional[NumberOwnerRef]:
+        """
+        Owner of an extension in a location
+
+        :param location_id: location ID
+        :param extension: extension
+        :return: owner or None if the extension is not known
+        """
+        location_idx = self._location_map.get(location_id)
+        if location_idx is None:
+            return None
+        return self._ref(self._by_extension.get((location_idx, extension)))
+
+    def by_esn(self, esn: str) -> Optional[NumberOwnerRef]:
+        """
+        Owner of an ESN (routing prefix + extension)
+
+        :param esn: ESN
+        :return: owner or None if the ESN is not known
+        """
+        return self._ref(self._by_esn.get(esn))
+
+    def numbers_of(self, owner_id: str) -> list[str]:
+        """
+        All phone numbers of an owner
+
+        :param owner_id: owner ID
+        :return: list of phone numbers
+        """
+        slot = self._slot_by_owner.get(owner_id)
+        if slot is None:
+            return []
+        return [key for kind, key in self._slot_keys[slot] if kind == 'number']
+
+    @classmethod
+    def from_api(cls, api, location_id: str = None, workspaces: bool = True) -> 'NumberIndex':
+        """
+        Build an index using the sync API. Phone numbers and feature lists are read concurrently
+
+        :param api: sync API
+        :type api: :class:`wxc_sdk.WebexSimpleApi`
+        :param location_id: only index numbers in this location
+        :param workspaces: also read workspaces
+        :return: new index
+        """
+        tel = api.telephony
+        listings = [lambda: list(tel.callqueue.list(location_id=location_id)),
+                    lambda: list(tel.huntgroup.list(location_id=location_id)),
+                    lambda: list(tel.auto_attendant.list(location_id=location_id)),
+                    lambda: list(tel.virtual_lines.list(location_id=location_id and [location_id]))]
+        if workspaces:
+            listings.append(lambda: list(api.workspaces.list(location_id=location_id)))
+        with ThreadPoolExecutor() as pool:
+            numbers = pool.submit(lambda: list(tel.phone_numbers(location_id=location_id)))
+            features = list(pool.map(lambda f: f(), listings))
+            numbers = numbers.result()
+        return cls._build(numbers, features)
+
+    @classmethod
+    async def as_from_api(cls, api, location_id: str = None, workspaces: bool = True) -> 'NumberIndex':
+        """
+        Build an index using the async API. Phone numbers and feature lists are read concurrently
+
+        :param api: async API
+        :type api: :class:`wxc_sdk.as_api.AsWebexSimpleApi`
+        :param location_id: only index numbers in this location
+        :param workspaces: also read workspaces
+        :return: new index
+        """
+        tel = api.telephony
+        listings = [tel.phone_numbers(location_id=location_id),
+                    tel.callqueue.list(location_id=location_id),
+                    tel.huntgroup.list(location_id=location_id),
+                    tel.auto_attendant.list(location_id=location_id),
+                    tel.virtual_lines.list(location_id=location_id and [location_id])]
+        if workspaces:
+            listings.append(api.workspaces.list(location_id=location_id))
+        numbers, *features = await asyncio.gather(*listings)
+        return cls._build(numbers, features)
+
+    @classmethod
+    def _build(cls, numbers: list[NumberListPhoneNumber], features: list[list[IndexableFeature]]) -> 'NumberIndex':
+        index = cls()
+        # features first: the number list has the most complete owner information and wins on conflicts
+        for feature_list in features:
+            index.add_features(feature_list)
+        index.add_phone_numbers(numbers)
+        log.debug(f'build: {len(index._by_number)} numbers, {len(index._by_extension)} extensions, '
+                  f'{len(index._slot_by_owner)} owners')
+        return index
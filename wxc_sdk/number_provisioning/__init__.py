@@ -0,0 +1,278 @@
+"""
+Batched phone number provisioning: validate → add → activate
+
+:meth:`api.telephony.validate_phone_numbers <wxc_sdk.telephony.TelephonyApi.validate_phone_numbers>`,
+:meth:`api.telephony.location.number.add <wxc_sdk.telephony.location.numbers.LocationNumbersApi.add>` and
+:meth:`api.telephony.location.number.activate <wxc_sdk.telephony.location.numbers.LocationNumbersApi.activate>` take
+lists of numbers with server side size limits. :class:`AsNumberProvisioner` provisions an arbitrary number of
+numbers:
+
+* numbers are streamed in (sync or async iterable of (location id, number) tuples) and grouped by location
+* each location's numbers are chunked to the API limits
+* validation and addition are overlapping stages: numbers validated in one batch are added while later batches are
+  still being validated
+* concurrency is bounded: a global limit for validation requests and a limit per location for add/activate requests.
+  If the add stage falls behind then validation (and reading the input) is paused
+* failures (unavailable numbers, per number add errors, failed requests) are routed to an error sink instead of
+  aborting the whole run: :class:`ProvisioningError`
+
+Example:
+
+    .. code-block:: python
+
+        async with AsWebexSimpleApi(tokens=token) as api:
+            provisioner = AsNumberProvisioner(api, state=NumberState.inactive,
+                                              error_sink=lambda e: print(f'{e.stage}: {e.phone_numbers}: {e.error}'))
+            report = await provisioner.run((row['location_id'], row['number']) for row in csv.DictReader(f))
+            print(f'{report.validated} validated, {report.added} added, {len(report.errors)} errors')
+"""
+import asyncio
+import inspect
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Union
+
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.common import NumberState
+from wxc_sdk.telephony.location.numbers import TelephoneNumberType
+
+__all__ = ['ProvisioningStage', 'ProvisioningError', 'ErrorSink', 'ProvisioningReport', 'AsNumberProvisioner']
+
+log = logging.getLogger(__name__)
+
+
+class ProvisioningStage(str, Enum):
+    #: duplicate number in the input
+    input = 'input'
+    #: number validation
+    validate = 'validate'
+    #: adding numbers to a location
+    add = 'add'
+    #: activating numbers
+    activate = 'activate'
+
+
+@dataclass
+class ProvisioningError:
+    """
+    A failure in one of the provisioning stages
+    """
+    #: stage in which the failure occurred
+    stage: ProvisioningStage
+    #: location of the numbers
+    location_id: str
+    #: affected numbers
+    phone_numbers: list[str]
+    #: error message
+    error: str
+
+
+#: error sink; called for each failure. Can be a coroutine function
+ErrorSink = Callable[[ProvisioningError], Union[None, Awaitable[None]]]
+
+
+@dataclass
+class ProvisioningReport:
+    """
+    Result of a provisioning run
+    """
+    #: number of numbers which passed validation
+    validated: int = 0
+    #: number of numbers added to locations
+    added: int = 0
+    #: number of numbers activated
+    activated: int = 0
+    #: number of requests per stage
+    requests: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    #: all failures
+    errors: list[ProvisioningError] = field(default_factory=list)
+
+
+async def _aiter(source) -> AsyncIterator:
+    if isinstance(source, AsyncIterable):
+        async for item in source:
+            yield item
+    else:
+        for item in source:
+            yield item
+
+
+class AsNumberProvisioner:
+    """
+    Provision phone numbers to locations in batches with overlapping validation and add stages
+    """
+
+    def __init__(self, api: AsWebexSimpleApi, *, validate_batch: int = 10, add_batch: int = 10,
+                 validate_concurrency: int = 5, location_concurrency: int = 2, max_pending_adds: int = 20,
+                 state: NumberState = NumberState.active, number_type: TelephoneNumberType = None,
+                 activate: bool = False, validate_only: bool = False, org_id: str = None,
+                 error_sink: ErrorSink = None):
+        """
+        :param api: async API
+        :param validate_batch: maximum number of numbers per validation request
+        :param add_batch: maximum number of numbers per add (and activate) request
+        :param validate_concurrency: maximum number of concurrent validation requests
+        :param location_concurrency: maximum number of concurrent add/activate requests per location
+        :param max_pending_adds: maximum number of add batches waiting or in flight; validation pauses if this limit
+            is reached
+        :param state: state of added numbers
+        :param number_type: number type passed to the add request
+        :param activate: activate numbers after adding them; useful together with ``state=NumberState.inactive``
+        :param validate_only: only validate numbers (dry run)
+        :param org_id: organization
+        :param error_sink: called for each failure. Failures are always also collected in the report
+        """
+        self.api = api
+        self.validate_batch = validate_batch
+        self.add_batch = add_batch
+        self.validate_concurrency = validate_concurrency
+        self.location_concurrency = location_concurrency
+        self.max_pending_adds = max_pending_adds
+        self.state = state
+        self.number_type = number_type
+        self.activate = activate
+        self.validate_only = validate_only
+        self.org_id = org_id
+        self.error_sink = error_sink
+
+    async def run(self, numbers: Union[Iterable[tuple[str, str]], AsyncIterable[tuple[str, str]]]) \
+            -> ProvisioningReport:
+        """
+        Provision numbers
+
+        :param numbers: (location id, phone number) tuples
+        :return: report
+        """
+        return await _Run(self).run(numbers)
+
+
+class _Run:
+    """
+    State of one provisioning run
+    """
+
+    def __init__(self, provisioner: AsNumberProvisioner):
+        self.p = provisioner
+        self.api = provisioner.api
+        self.report = ProvisioningReport()
+        self.validate_slots = asyncio.Semaphore(provisioner.validate_concurrency)
+        self.add_slots = asyncio.Semaphore(provisioner.max_pending_adds)
+        self.location_slots: dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(provisioner.location_concurrency))
+        #: validated numbers per location waiting to be added
+        self.validated: dict[str, list[str]] = defaultdict(list)
+        self.tasks: set[asyncio.Task] = set()
+
+    def spawn(self, coro: Awaitable):
+        task = asyncio.ensure_future(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def error(self, stage: ProvisioningStage, location_id: str, phone_numbers: list[str], error: str):
+        e = ProvisioningError(stage=stage, location_id=location_id, phone_numbers=phone_numbers, error=error)
+        log.warning(f'{stage.value} failed for {", ".join(phone_numbers)} in location {location_id}: {error}')
+        self.report.errors.append(e)
+        if self.p.error_sink is not None:
+            r = self.p.error_sink(e)
+            if inspect.isawaitable(r):
+                await r
+
+    async def run(self, numbers) -> ProvisioningReport:
+        pending: dict[str, list[str]] = defaultdict(list)
+        seen = set()
+        async for location_id, number in _aiter(numbers):
+            if number in seen:
+                await self.error(ProvisioningStage.input, location_id, [number], 'duplicate number')
+                continue
+            seen.add(number)
+            batch = pending[location_id]
+            batch.append(number)
+            if len(batch) >= self.p.validate_batch:
+                del pending[location_id]
+                await self.start_validation(location_id, batch)
+        for location_id, batch in pending.items():
+            await self.start_validation(location_id, batch)
+        await self.wait()
+        # add remaining validated numbers
+        for location_id in list(self.validated):
+            await self.start_add(location_id, flush=True)
+        await self.wait()
+        return self.report
+
+    async def wait(self):
+        while self.tasks:
+            await asyncio.gather(*list(self.tasks))
+
+    async def start_validation(self, location_id: str, numbers: list[str]):
+        # backpressure: wait for a free validation slot before reading more input
+        await self.validate_slots.acquire()
+        self.spawn(self.validate(location_id, numbers))
+
+    async def validate(self, location_id: str, numbers: list[str]):
+        try:
+            self.report.requests[ProvisioningStage.validate.value] += 1
+            try:
+                result = await self.api.telephony.validate_phone_numbers(phone_numbers=numbers, org_id=self.p.org_id)
+            except Exception as e:
+                await self.error(ProvisioningStage.validate, location_id, numbers, str(e))
+                return
+            for status in result.phone_numbers or []:
+                if status.ok:
+                    self.report.validated += 1
+                    self.validated[location_id].append(status.phone_number)
+                else:
+                    await self.error(ProvisioningStage.validate, location_id, [status.phone_number],
+                                     f'{status.state}: {"; ".join(status.detail)}'.rstrip(': '))
+            if not self.p.validate_only:
+                await self.start_add(location_id)
+        finally:
+            self.validate_slots.release()
+
+    async def start_add(self, location_id: str, flush: bool = False):
+        """
+        start add tasks for full batches of validated numbers; also for a partial batch if flush is set
+        """
+        if self.p.validate_only:
+            return
+        validated = self.validated[location_id]
+        while len(validated) >= self.p.add_batch or (flush and validated):
+            batch, validated[:] = validated[:self.p.add_batch], validated[self.p.add_batch:]
+            await self.add_slots.acquire()
+            self.spawn(self.add(location_id, batch))
+        if not validated:
+            self.validated.pop(location_id, None)
+
+    async def add(self, location_id: str, numbers: list[str]):
+        try:
+            async with self.location_slots[location_id]:
+                self.report.requests[ProvisioningStage.add.value] += 1
+                try:
+                    result = await self.api.telephony.location.number.add(location_id=location_id,
+                                                                          phone_numbers=numbers,
+                                                                          number_type=self.p.number_type,
+                                                                          state=self.p.state, org_id=self.p.org_id)
+                except Exception as e:
+                    await self.error(ProvisioningStage.add, location_id, numbers, str(e))
+                    return
+                failed = set()
+                for error in result.errors:
+                    failed.add(error.number)
+                    await self.error(ProvisioningStage.add, location_id, [error.number],
+                                     error.error_message or error.error_title or error.error_code or 'failed')
+                added = [n for n in numbers if n not in failed]
+                self.report.added += len(added)
+                if not (self.p.activate and added):
+                    return
+                self.report.requests[ProvisioningStage.activate.value] += 1
+                try:
+                    await self.api.telephony.location.number.activate(location_id=location_id, phone_numbers=added,
+                                                                      org_id=self.p.org_id)
+                except Exception as e:
+                    await self.error(ProvisioningStage.activate, location_id, added, str(e))
+                    return
+                self.report.activated += len(added)
+        finally:
+            self.add_slots.release()
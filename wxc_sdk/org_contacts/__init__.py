@@ -2,10 +2,10 @@ from collections.abc import Generator
 from datetime import datetime
 from typing import Optional, List, Union, Any
 
-from pydantic import Field, TypeAdapter
+from pydantic import Field
 
 from wxc_sdk.api_child import ApiChild
-from wxc_sdk.base import ApiModel
+from wxc_sdk.base import ApiModel, type_adapter
 from wxc_sdk.base import SafeEnum as Enum
 from wxc_sdk.people import SipType
 from wxc_sdk.scim.users import ScimPhoneNumberType
@@ -339,8 +339,8 @@ class OrganizationContactsApi(ApiChild, base='contacts/organizations'):
         """
         body = dict()
         body['schemas'] = 'urn:cisco:codev:identity:contact:core:1.0'
-        body['contacts'] = TypeAdapter(list[Contact]).dump_python(contacts, mode='json', by_alias=True,
-                                                                  exclude_unset=True)
+        body['contacts'] = type_adapter(list[Contact]).dump_python(contacts, mode='json', by_alias=True,
+                                                                   exclude_unset=True)
         url = self.ep(f'{org_id}/contacts/bulk')
         data = super().post(url, json=body)
         return BulkResponse.model_validate(data)
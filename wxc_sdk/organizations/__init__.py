@@ -13,10 +13,10 @@ __all__ = ['Organization', 'OrganizationApi']
 import datetime
 from typing import Optional
 
-from pydantic import TypeAdapter, Field
+from pydantic import Field
 
 from ..api_child import ApiChild
-from ..base import ApiModel
+from ..base import ApiModel, type_adapter
 
 
 class Organization(ApiModel):
@@ -48,7 +48,7 @@ class OrganizationApi(ApiChild, base='organizations'):
         """
         params = calling_data and {'callingData': 'true'} or None
         data = self.get(url=self.ep(), params=params)
-        return TypeAdapter(list[Organization]).validate_python(data['items'])
+        return type_adapter(list[Organization]).validate_python(data['items'])
 
     def details(self, org_id: str, calling_data: bool = None) -> Organization:
         """
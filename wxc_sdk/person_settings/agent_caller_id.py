@@ -4,10 +4,10 @@ API to manage call queue agent caller ID information
 import json
 from typing import Optional
 
-from pydantic import model_validator, TypeAdapter
+from pydantic import model_validator
 
 from .common import PersonSettingsApiChild
-from ..base import ApiModel
+from ..base import ApiModel, type_adapter
 from ..base import SafeEnum as Enum
 
 __all__ = ['AvailableCallerIdType', 'AgentCallerId', 'AgentCallerIdApi']
@@ -103,7 +103,7 @@ class AgentCallerIdApi(PersonSettingsApiChild):
         ep = self.f_ep(entity_id, 'availableCallerIds')
         params = org_id and {'orgId': org_id} or None
         data = self.get(ep, params=params)
-        return TypeAdapter(list[AgentCallerId]).validate_python(data['availableCallerIds'])
+        return type_adapter(list[AgentCallerId]).validate_python(data['availableCallerIds'])
 
     def read(self, entity_id: str) -> AgentCallerId:
         """
@@ -1,8 +1,7 @@
 from collections.abc import Generator
 
-from pydantic import TypeAdapter
-
 from wxc_sdk.api_child import ApiChild
+from wxc_sdk.base import type_adapter
 from wxc_sdk.telephony.devices import MemberCommon, DeviceMembersResponse, DeviceMember
 
 
@@ -106,7 +105,7 @@ class AppSharedLineApi(ApiChild, base='telephony/config/people'):
         """
         body = dict()
         if members is not None:
-            body['members'] = TypeAdapter(list[DeviceMember]).dump_python(members, mode='json', by_alias=True,
-                                                                          exclude_none=True)
+            body['members'] = type_adapter(list[DeviceMember]).dump_python(members, mode='json', by_alias=True,
+                                                                           exclude_none=True)
         url = self.f_ep(person_id=person_id, application_id=application_id, path='members')
         super().put(url, json=body)
@@ -1,10 +1,8 @@
 from collections.abc import Generator
 from typing import Optional
 
-from pydantic import TypeAdapter
-
 from wxc_sdk.api_child import ApiChild
-from wxc_sdk.base import ApiModel
+from wxc_sdk.base import ApiModel, type_adapter
 from wxc_sdk.base import SafeEnum as Enum
 
 __all__ = ['ModeManagementApi', 'ExceptionType',
@@ -166,7 +164,7 @@ class ModeManagementApi(ApiChild, base='telephony/config/people'):
             params['orgId'] = org_id
         url = self.ep(f'{person_id}/modeManagement/features')
         data = super().get(url, params=params)
-        r = TypeAdapter(list[ModeManagementFeature]).validate_python(data['features'])
+        r = type_adapter(list[ModeManagementFeature]).validate_python(data['features'])
         return r
 
     def assign_features(self, feature_ids: list[str], person_id: str = None, org_id: str = None):
@@ -0,0 +1,615 @@
+"""
+Declarative desired-state reconciler for calling configuration
+
+Applying calling configuration managed as code typically is a serial read-compare-write loop over many APIs.
+:class:`AsReconciler` instead:
+
+* loads the desired state (:class:`DesiredState`, for example from YAML)
+* fetches the current state of all referenced locations, features and users concurrently
+* compares desired and current state and builds a dependency-ordered :class:`Plan`: locations → schedules → features
+  (call queues, hunt groups, auto attendants) → user settings. Only entities which differ are part of the plan
+* executes the plan; independent branches (for example features in different locations) are executed concurrently
+
+Only attributes present in the desired state are compared and sent. Entities which exist but are not part of the
+desired state are never touched. Locations have to exist; they are only used to resolve location names.
+
+Desired state format (YAML):
+
+    .. code-block:: yaml
+
+        locations:
+          San Jose:
+            schedules:
+              - name: business
+                type: businessHours
+                events:
+                  - name: weekdays
+                    startDate: 2024-01-01
+                    endDate: 2024-01-01
+                    startTime: '09:00'
+                    endTime: '17:00'
+                    recurrence:
+                      recurWeekly: {monday: true, tuesday: true, wednesday: true, thursday: true, friday: true}
+            call_queues:
+              - name: Support
+                extension: '5000'
+                callPolicies: {policy: SIMULTANEOUS}
+            hunt_groups: []
+            auto_attendants:
+              - name: Main
+                extension: '5100'
+                businessSchedule: business
+        users:
+          alice@example.com:
+            dnd: {enabled: false}
+            forwarding:
+              callForwarding:
+                busy: {enabled: true, destination: '5000'}
+
+Example:
+
+    .. code-block:: python
+
+        async with AsWebexSimpleApi() as api:
+            reconciler = AsReconciler(api)
+            plan = await reconciler.plan(DesiredState.from_yaml('calling.yml'))
+            print(plan.summary())
+            if not dry_run:
+                await plan.execute()
+"""
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import partial
+from io import TextIOBase
+from typing import Any, Optional, Union, get_args, get_origin
+
+import yaml
+from pydantic import ValidationError
+
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.base import ApiModel, type_adapter
+from wxc_sdk.common.schedules import Schedule
+from wxc_sdk.minimal_diff import sparse_model
+from wxc_sdk.people import Person
+from wxc_sdk.person_settings.caller_id import CallerId
+from wxc_sdk.person_settings.dnd import DND
+from wxc_sdk.person_settings.forwarding import PersonForwardingSetting
+from wxc_sdk.person_settings.privacy import Privacy
+from wxc_sdk.person_settings.voicemail import VoicemailSettings
+from wxc_sdk.telephony.autoattendant import AutoAttendant
+from wxc_sdk.telephony.callqueue import CallQueue
+from wxc_sdk.telephony.huntgroup import HuntGroup
+
+__all__ = ['ReconcileKind', 'ActionType', 'UserSetting', 'USER_SETTINGS', 'DesiredLocation', 'DesiredState',
+           'state_diff', 'PlannedAction', 'Plan', 'AsReconciler']
+
+log = logging.getLogger(__name__)
+
+
+class ReconcileKind(str, Enum):
+    """
+    Kinds of entities handled by the reconciler; the order of the values is the order of dependencies
+    """
+    location = 'location'
+    schedule = 'schedule'
+    call_queue = 'call_queue'
+    hunt_group = 'hunt_group'
+    auto_attendant = 'auto_attendant'
+    user_setting = 'user_setting'
+
+
+class ActionType(str, Enum):
+    create = 'create'
+    update = 'update'
+    #: an entity referenced in the desired state can't be resolved
+    error = 'error'
+
+
+@dataclass(frozen=True)
+class UserSetting:
+    """
+    A user setting handled by the reconciler
+    """
+    #: model of the setting
+    model: type[ApiModel]
+    #: name of the setter method of the settings API
+    configure: str = 'configure'
+
+
+#: user settings which can be part of the desired state: name of the attribute of
+#: :attr:`AsWebexSimpleApi.person_settings <wxc_sdk.as_api.AsWebexSimpleApi.person_settings>` -> setting
+USER_SETTINGS: dict[str, UserSetting] = {
+    'caller_id': UserSetting(model=CallerId, configure='configure_settings'),
+    'dnd': UserSetting(model=DND),
+    'forwarding': UserSetting(model=PersonForwardingSetting),
+    'privacy': UserSetting(model=Privacy),
+    'voicemail': UserSetting(model=VoicemailSettings),
+}
+
+
+@dataclass
+class DesiredLocation:
+    """
+    Desired state of features in a location
+    """
+    #: location name
+    name: str
+    schedules: list[Schedule] = field(default_factory=list)
+    call_queues: list[CallQueue] = field(default_factory=list)
+    hunt_groups: list[HuntGroup] = field(default_factory=list)
+    auto_attendants: list[AutoAttendant] = field(default_factory=list)
+
+
+# location attribute and model for each feature kind
+_FEATURES: dict[ReconcileKind, tuple[str, type[ApiModel]]] = {
+    ReconcileKind.schedule: ('schedules', Schedule),
+    ReconcileKind.call_queue: ('call_queues', CallQueue),
+    ReconcileKind.hunt_group: ('hunt_groups', HuntGroup),
+    ReconcileKind.auto_attendant: ('auto_attendants', AutoAttendant),
+}
+
+
+def _nested_model(annotation: Any) -> tuple[Optional[type[ApiModel]], bool]:
+    """
+    Model class of a field annotation: ``Model``, ``Optional[Model]``, ``list[Model]`` or ``Optional[list[Model]]``
+
+    :return: model class (None if the annotation is not a model) and flag whether the annotation is a list
+    """
+    args = [a for a in get_args(annotation) if a is not type(None)] if get_origin(annotation) is Union else []
+    if len(args) == 1:
+        annotation = args[0]
+    is_list = get_origin(annotation) is list
+    if is_list:
+        annotation = (get_args(annotation) or (None,))[0]
+    if isinstance(annotation, type) and issubclass(annotation, ApiModel):
+        return annotation, is_list
+    return None, False
+
+
+def _partial_model(model: type[ApiModel], data: dict) -> ApiModel:
+    """
+    Validate a partial desired state. Required attributes of the model and of nested models can be missing: only the
+    attributes present in the data are validated and set, on each level
+    """
+    try:
+        return model.model_validate(data)
+    except ValidationError as e:
+        if any(err['type'] != 'missing' for err in e.errors()):
+            raise
+    names = dict()
+    for name, field_info in model.model_fields.items():
+        names[name] = name
+        if field_info.alias:
+            names[field_info.alias] = name
+    values = dict()
+    for key, value in data.items():
+        if (name := names.get(key)) is None:
+            continue
+        annotation = model.model_fields[name].annotation
+        nested, is_list = _nested_model(annotation)
+        if nested is not None and not is_list and isinstance(value, dict):
+            values[name] = _partial_model(nested, value)
+            continue
+        if nested is not None and is_list and isinstance(value, list) and all(isinstance(v, dict) for v in value):
+            values[name] = [_partial_model(nested, v) for v in value]
+            continue
+        value = type_adapter(annotation).validate_python(value)
+        # models store enum values, not enum members
+        values[name] = value.value if isinstance(value, Enum) else value
+    return model.model_construct(_fields_set=set(values), **values)
+
+
+@dataclass
+class DesiredState:
+    """
+    Desired state: features per location and settings per user
+    """
+    #: desired location state by location name
+    locations: dict[str, DesiredLocation] = field(default_factory=dict)
+    #: desired user settings: email -> setting name (key in :data:`USER_SETTINGS`) -> settings
+    users: dict[str, dict[str, ApiModel]] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'DesiredState':
+        """
+        Desired state from a dict (parsed YAML or JSON). Attribute names can be given in snake case or in camel case
+        (as in the API). Required attributes can be omitted.
+
+        :param data: dict with "locations" and "users" keys
+        :return: desired state
+        """
+        locations = dict()
+        for name, features in (data.get('locations') or {}).items():
+            features = features or {}
+            unknown = set(features) - {attr for attr, _ in _FEATURES.values()}
+            if unknown:
+                raise ValueError(f'location "{name}": unknown feature type(s): {", ".join(sorted(unknown))}')
+            locations[name] = DesiredLocation(
+                name=name, **{attr: [_partial_model(model, d) for d in features.get(attr) or []]
+                              for attr, model in _FEATURES.values()})
+        users = dict()
+        for email, settings in (data.get('users') or {}).items():
+            user = dict()
+            for setting_name, value in (settings or {}).items():
+                if (setting := USER_SETTINGS.get(setting_name)) is None:
+                    raise ValueError(f'user "{email}": unknown setting "{setting_name}"')
+                user[setting_name] = _partial_model(setting.model, value)
+            users[email.lower()] = user
+        return cls(locations=locations, users=users)
+
+    @classmethod
+    def from_yaml(cls, source: Union[str, TextIOBase]) -> 'DesiredState':
+        """
+        Desired state from YAML
+
+        :param source: path of a YAML file or text stream
+        :return: desired state
+        """
+        if isinstance(source, str):
+            with open(source, mode='r') as f:
+                return cls.from_dict(yaml.safe_load(f) or {})
+        return cls.from_dict(yaml.safe_load(source) or {})
+
+
+def _differs(current: Any, desired: Any) -> bool:
+    """
+    Check if the desired (partial) value differs from the current value. Only keys present in desired dicts are
+    compared. Lists of dicts with a "name" key are matched by name; items which only exist in the current list are
+    ignored. Other lists are compared element by element
+    """
+    if isinstance(desired, dict):
+        if not isinstance(current, dict):
+            return True
+        return any(_differs(current.get(k), v) for k, v in desired.items())
+    if isinstance(desired, list):
+        if not isinstance(current, list):
+            return True
+        if desired and all(isinstance(d, dict) and 'name' in d for d in desired):
+            by_name = {c.get('name'): c for c in current if isinstance(c, dict)}
+            return any(_differs(by_name.get(d['name']), d) for d in desired)
+        return len(current) != len(desired) or any(_differs(c, d) for c, d in zip(current, desired))
+    return current != desired
+
+
+def _project(current: Any, desired: Any) -> Any:
+    """
+    Reduce the current value to the keys present in the desired value, recursively
+    """
+    if isinstance(desired, dict) and isinstance(current, dict):
+        return {k: _project(current.get(k), v) for k, v in desired.items()}
+    return current
+
+
+def state_diff(current: Optional[ApiModel], desired: ApiModel) -> dict[str, tuple[Any, Any]]:
+    """
+    Differences between current and desired state. Only attributes (recursively) set in the desired state are
+    compared
+
+    :param current: current state; None if the entity does not exist
+    :param desired: desired state
+    :return: dict attribute name -> (current value, desired value), JSON representation. Current values are reduced
+        to the attributes set in the desired state
+    """
+    desired_json = desired.model_dump(mode='json', exclude_unset=True)
+    current_json = current.model_dump(mode='json') if current is not None else {}
+    return {name: (_project(current_json.get(name), value), value) for name, value in desired_json.items()
+            if _differs(current_json.get(name), value)}
+
+
+@dataclass(eq=False)
+class PlannedAction:
+    """
+    A single create or update in a plan
+    """
+    kind: ReconcileKind
+    action: ActionType
+    #: location name or user email
+    scope: str
+    #: name of feature or setting
+    name: str
+    #: changed attributes: name -> (current, desired)
+    changes: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+    #: actions which have to be completed before this action can be executed
+    depends_on: list['PlannedAction'] = field(default_factory=list, repr=False)
+    #: coroutine function executing the action
+    apply: Optional[Callable[[], Awaitable[Any]]] = field(default=None, repr=False)
+    #: result of the API call
+    result: Any = None
+    #: exception raised while executing the action
+    error: Optional[BaseException] = None
+    #: True after the action has been executed (successfully or not)
+    done: bool = False
+
+    def __str__(self):
+        r = f'{self.action.value} {self.kind.value} "{self.scope}/{self.name}"'
+        if self.action == ActionType.error:
+            return f'{r}: {self.error}'
+        if self.changes:
+            r = f'{r}: {", ".join(f"{k}: {old!r} -> {new!r}" for k, (old, new) in self.changes.items())}'
+        return r
+
+
+@dataclass
+class Plan:
+    """
+    Dependency-ordered plan of actions; actions are ordered by kind (see :class:`ReconcileKind`)
+    """
+    actions: list[PlannedAction] = field(default_factory=list)
+    #: number of entities which are already in the desired state
+    unchanged: int = 0
+
+    @property
+    def errors(self) -> list[PlannedAction]:
+        """
+        actions which failed or could not be planned
+        """
+        return [a for a in self.actions if a.error is not None]
+
+    def summary(self) -> str:
+        """
+        Text summary of the plan (dry-run output)
+        """
+        kinds = list(ReconcileKind)
+        lines = [str(a) for a in sorted(self.actions, key=lambda a: (kinds.index(a.kind), a.scope, a.name))]
+        lines.append(f'{sum(a.action != ActionType.error for a in self.actions)} change(s), '
+                     f'{self.unchanged} unchanged, {sum(a.action == ActionType.error for a in self.actions)} '
+                     f'error(s)')
+        return '\n'.join(lines)
+
+    async def execute(self, concurrency: int = 10) -> 'Plan':
+        """
+        Execute the plan. Each action is started as soon as all actions it depends on have been executed
+        successfully. Actions with failed dependencies are not executed.
+
+        :param concurrency: maximum number of actions executed concurrently
+        :return: the plan, with result and error of all actions set
+        """
+        sem = asyncio.Semaphore(concurrency)
+        tasks: dict[int, asyncio.Task] = dict()
+
+        async def run(action: PlannedAction):
+            if action.apply is None or action.done:
+                return
+            for dep in action.depends_on:
+                if (task := tasks.get(id(dep))) is not None:
+                    await task
+            failed = [dep for dep in action.depends_on if dep.error is not None]
+            if failed:
+                action.error = RuntimeError(f'dependency failed: {failed[0].kind.value} "{failed[0].scope}/'
+                                            f'{failed[0].name}"')
+                action.done = True
+                return
+            async with sem:
+                try:
+                    log.debug(f'execute: {action}')
+                    action.result = await action.apply()
+                except Exception as e:
+                    log.warning(f'execute: {action} failed: {e}')
+                    action.error = e
+                finally:
+                    action.done = True
+
+        for action in self.actions:
+            tasks[id(action)] = asyncio.create_task(run(action))
+        await asyncio.gather(*tasks.values())
+        return self
+
+
+@dataclass
+class _LocationState:
+    location_id: str
+    #: current state by kind and name
+    features: dict[ReconcileKind, dict[str, ApiModel]]
+
+
+class AsReconciler:
+    """
+    Reconcile desired calling configuration using the async API
+    """
+
+    def __init__(self, api: AsWebexSimpleApi, org_id: str = None):
+        """
+        :param api: async API
+        :param org_id: organization to work on
+        """
+        self.api = api
+        self.org_id = org_id
+
+    # current state
+
+    async def _feature_state(self, kind: ReconcileKind, location_id: str,
+                             names: set[str]) -> dict[str, ApiModel]:
+        """
+        current state of features of one kind in a location; details are only read for features in the desired state
+        """
+        api = self.api.telephony
+        org_id = self.org_id
+        if kind == ReconcileKind.schedule:
+            items = await api.schedules.list(obj_id=location_id, org_id=org_id)
+            items = [i for i in items if i.name in names]
+            details = await asyncio.gather(*[api.schedules.details(obj_id=location_id, schedule_type=i.schedule_type,
+                                                                   schedule_id=i.schedule_id, org_id=org_id)
+                                             for i in items])
+        elif kind == ReconcileKind.call_queue:
+            items = [i for i in await api.callqueue.list(location_id=location_id, org_id=org_id) if i.name in names]
+            details = await asyncio.gather(*[api.callqueue.details(location_id=location_id, queue_id=i.id,
+                                                                   org_id=org_id)
+                                             for i in items])
+        elif kind == ReconcileKind.hunt_group:
+            items = [i for i in await api.huntgroup.list(location_id=location_id, org_id=org_id) if i.name in names]
+            details = await asyncio.gather(*[api.huntgroup.details(location_id=location_id, huntgroup_id=i.id,
+                                                                   org_id=org_id)
+                                             for i in items])
+        else:
+            items = [i for i in await api.auto_attendant.list(location_id=location_id, org_id=org_id)
+                     if i.name in names]
+            details = await asyncio.gather(*[api.auto_attendant.details(location_id=location_id,
+                                                                        auto_attendant_id=i.auto_attendant_id,
+                                                                        org_id=org_id)
+                                             for i in items])
+        for item, detail in zip(items, details):
+            # some details responses don't include the id
+            if kind == ReconcileKind.schedule:
+                detail.schedule_id = detail.schedule_id or item.schedule_id
+            elif kind == ReconcileKind.auto_attendant:
+                detail.auto_attendant_id = detail.auto_attendant_id or item.auto_attendant_id
+            else:
+                detail.id = detail.id or item.id
+        return {d.name: d for d in details}
+
+    async def _location_state(self, location_id: str, desired: DesiredLocation) -> _LocationState:
+        kinds = list(_FEATURES)
+        states = await asyncio.gather(
+            *[self._feature_state(kind, location_id, {f.name for f in getattr(desired, _FEATURES[kind][0])})
+              for kind in kinds])
+        return _LocationState(location_id=location_id, features=dict(zip(kinds, states)))
+
+    async def _user_state(self, email: str, settings: dict[str, ApiModel]) -> tuple[Optional[Person],
+                                                                                    dict[str, ApiModel]]:
+        # calling data is needed to get the location of the user
+        people = await self.api.people.list(email=email, calling_data=True, org_id=self.org_id)
+        person = next((p for p in people if email in (e.lower() for e in p.emails or [])), None)
+        if person is None:
+            return None, {}
+        names = list(settings)
+        current = await asyncio.gather(*[getattr(self.api.person_settings, name).read(entity_id=person.person_id,
+                                                                                      org_id=self.org_id)
+                                         for name in names])
+        return person, dict(zip(names, current))
+
+    # actions
+
+    def _feature_action(self, kind: ReconcileKind, location: str, location_id: str, desired: ApiModel,
+                        current: Optional[ApiModel]) -> Optional[PlannedAction]:
+        changes = state_diff(current, desired)
+        if not changes:
+            return None
+        api = self.api.telephony
+        org_id = self.org_id
+        if current is None:
+            action = ActionType.create
+            if kind == ReconcileKind.schedule:
+                apply = partial(api.schedules.create, obj_id=location_id, schedule=desired, org_id=org_id)
+            elif kind == ReconcileKind.call_queue:
+                apply = partial(api.callqueue.create, location_id=location_id, settings=desired, org_id=org_id)
+            elif kind == ReconcileKind.hunt_group:
+                apply = partial(api.huntgroup.create, location_id=location_id, settings=desired, org_id=org_id)
+            else:
+                apply = partial(api.auto_attendant.create, location_id=location_id, settings=desired, org_id=org_id)
+        else:
+            action = ActionType.update
+            if kind == ReconcileKind.schedule:
+                # schedule updates need the complete schedule; desired events are merged into the current events by
+                # name, events not in the desired state are kept
+                update = current.model_copy(deep=True)
+                desired_events = {e.name: e for e in desired.events or []}
+                update.events = [desired_events.pop(e.name).model_copy(update={'event_id': e.event_id})
+                                 if e.name in desired_events else e
+                                 for e in current.events or []] + list(desired_events.values())
+                for name in desired.model_fields_set - {'events'}:
+                    setattr(update, name, getattr(desired, name))
+                apply = partial(api.schedules.update, obj_id=location_id, schedule=update,
+                                schedule_type=current.schedule_type, schedule_id=current.schedule_id,
+                                org_id=org_id)
+            else:
+                payload = sparse_model(desired, changes)
+                if kind == ReconcileKind.call_queue:
+                    apply = partial(api.callqueue.update, location_id=location_id, queue_id=current.id,
+                                    update=payload, org_id=org_id)
+                elif kind == ReconcileKind.hunt_group:
+                    apply = partial(api.huntgroup.update, location_id=location_id, huntgroup_id=current.id,
+                                    update=payload, org_id=org_id)
+                else:
+                    apply = partial(api.auto_attendant.update, location_id=location_id,
+                                    auto_attendant_id=current.auto_attendant_id, settings=payload, org_id=org_id)
+        return PlannedAction(kind=kind, action=action, scope=location, name=desired.name, changes=changes,
+                             apply=apply)
+
+    def _setting_action(self, email: str, person: Person, name: str, desired: ApiModel,
+                        current: ApiModel) -> Optional[PlannedAction]:
+        changes = state_diff(current, desired)
+        if not changes:
+            return None
+        setter = getattr(getattr(self.api.person_settings, name), USER_SETTINGS[name].configure)
+        payload = sparse_model(desired, changes)
+        return PlannedAction(kind=ReconcileKind.user_setting, action=ActionType.update, scope=email, name=name,
+                             changes=changes,
+                             apply=partial(setter, person.person_id, payload, org_id=self.org_id))
+
+    async def plan(self, desired: DesiredState) -> Plan:
+        """
+        Fetch the current state and build a plan to reach the desired state
+
+        :param desired: desired state
+        :return: plan; execute with :meth:`Plan.execute`
+        """
+        plan = Plan()
+        locations = {loc.name: loc.location_id for loc in await self.api.locations.list(org_id=self.org_id)}
+        missing = [name for name in desired.locations if name not in locations]
+        for name in missing:
+            plan.actions.append(PlannedAction(kind=ReconcileKind.location, action=ActionType.error, scope=name,
+                                              name=name, error=KeyError(f'location "{name}" not found')))
+        location_names = [name for name in desired.locations if name in locations]
+        emails = list(desired.users)
+
+        # fetch all current state concurrently
+        location_states, user_states = await asyncio.gather(
+            asyncio.gather(*[self._location_state(locations[name], desired.locations[name])
+                             for name in location_names]),
+            asyncio.gather(*[self._user_state(email, desired.users[email]) for email in emails]))
+
+        # features: depend on the schedules of the same location
+        feature_actions: dict[str, list[PlannedAction]] = dict()
+        for name, state in zip(location_names, location_states):
+            desired_location = desired.locations[name]
+            schedule_actions = []
+            actions = []
+            for kind, (attr, _) in _FEATURES.items():
+                for desired_feature in getattr(desired_location, attr):
+                    action = self._feature_action(kind, name, state.location_id, desired_feature,
+                                                  state.features[kind].get(desired_feature.name))
+                    if action is None:
+                        plan.unchanged += 1
+                        continue
+                    if kind == ReconcileKind.schedule:
+                        schedule_actions.append(action)
+                    else:
+                        action.depends_on = schedule_actions
+                        actions.append(action)
+            plan.actions.extend(schedule_actions)
+            plan.actions.extend(actions)
+            feature_actions[state.location_id] = schedule_actions + actions
+
+        # user settings: depend on the features in the user's location
+        for email, (person, current) in zip(emails, user_states):
+            if person is None:
+                plan.actions.append(PlannedAction(kind=ReconcileKind.user_setting, action=ActionType.error,
+                                                  scope=email, name='*',
+                                                  error=KeyError(f'user "{email}" not found')))
+                continue
+            for setting_name, desired_setting in desired.users[email].items():
+                action = self._setting_action(email, person, setting_name, desired_setting, current[setting_name])
+                if action is None:
+                    plan.unchanged += 1
+                    continue
+                action.depends_on = feature_actions.get(person.location_id, [])
+                plan.actions.append(action)
+        return plan
+
+    async def apply(self, desired: DesiredState, dry_run: bool = False, concurrency: int = 10) -> Plan:
+        """
+        Plan and execute
+
+        :param desired: desired state
+        :param dry_run: only plan, don't execute
+        :param concurrency: maximum number of concurrent updates
+        :return: plan
+        """
+        plan = await self.plan(desired)
+        log.info(f'plan:\n{plan.summary()}')
+        if not dry_run:
+            await plan.execute(concurrency=concurrency)
+        return plan
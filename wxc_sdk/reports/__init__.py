@@ -9,10 +9,10 @@ from dataclasses import dataclass
 from datetime import datetime, date
 from typing import Optional
 
-from pydantic import Field, TypeAdapter
+from pydantic import Field
 
 from ..api_child import ApiChild
-from ..base import ApiModel, to_camel
+from ..base import ApiModel, to_camel, type_adapter
 from ..cdr import CDR
 
 __all__ = ['ValidationRules', 'ReportTemplate', 'Report', 'ReportsApi', 'CallingCDR']
@@ -133,7 +133,7 @@ class ReportsApi(ApiChild, base='devices'):
         #   "startDate", "endDate" not documented
         url = self.session.ep('report/templates')
         data = self.get(url=url)
-        result = TypeAdapter(list[ReportTemplate]).validate_python(data['items'])
+        result = type_adapter(list[ReportTemplate]).validate_python(data['items'])
         return result
 
     def list(self, report_id: str = None, service: str = None, template_id: str = None, from_date: date = None,
@@ -1,16 +1,19 @@
 """
 REST session for Webex API requests
 """
+import copy
 import json
 import logging
 import time
 import uuid
 from collections.abc import Generator
+from concurrent.futures import Future
+from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import wraps, partial
 from io import TextIOBase, StringIO
 from json import JSONDecodeError
-from threading import Semaphore
+from threading import Semaphore, Lock
 from typing import Tuple, Type, Optional, ClassVar, Callable, Union
 from urllib.parse import parse_qsl
 
@@ -246,6 +249,34 @@ RestResponseCallBack = Callable[[Response, int], None]
 def _dump_response_callback(response: Response, diff_ns: int):
     dump_response(response, diff_ns=diff_ns)
 
+
+def coalesce_key(method: str, url: str, token: str, kwargs: dict) -> Optional[str]:
+    """
+    Key to identify identical GET requests for request coalescing. Only GET requests w/o body qualify
+
+    :meta private:
+    :return: key or None if the request can't be coalesced
+    """
+    if method != 'GET' or set(kwargs) - {'params', 'headers', 'content_type'}:
+        return None
+    try:
+        return json.dumps([url, kwargs.get('params'), kwargs.get('headers'), kwargs.get('content_type'), token],
+                          sort_keys=True, default=str)
+    except TypeError:
+        return None
+
+
+@dataclass(init=False, repr=False)
+class _InFlightRequest:
+    """
+    A coalesced GET request in flight
+    """
+    #: future for the (response, data) tuple
+    future: Future
+    #: number of callers sharing the request
+    callers: int
+
+
 @dataclass(init=False, repr=False)
 class RestSession(Session):
     """
@@ -259,23 +290,45 @@ class RestSession(Session):
 
     # Bearer token(s) for this session
     _tokens: Tokens
+    #: maximum number of concurrent requests; also the size of the connection pool
+    concurrent_requests: int
     # semaphore for rate limiting
     _sem: Semaphore
     # retry on 429?
     retry_429: bool
     # registry of response callbacks
     _response_callback_registry: dict[str, RestResponseCallBack]
+    # coalesce identical concurrent GET requests?
+    coalesce_gets: bool
+    # coalesced GET requests in flight
+    _in_flight: dict[str, _InFlightRequest]
+    _in_flight_lock: Lock
 
     def __init__(self, *, tokens: Tokens, concurrent_requests: int, retry_429: bool = True,
-                 proxy_url: str = None, verify: Union[bool, str] = None):
+                 proxy_url: str = None, verify: Union[bool, str] = None, coalesce_gets: bool = False):
+        """
+        Initialize the REST session
+
+        :param tokens: tokens to be used for the session
+        :param concurrent_requests: maximum number of concurrent requests
+        :param retry_429: enable automatic retry on 429 responses
+        :param proxy_url: proxy URL for https requests
+        :param verify: passed to :attr:`requests.Session.verify`
+        :param coalesce_gets: coalesce identical concurrent GET requests (same URL, parameters and token): only one
+            request is sent and all callers get a copy of the parsed result
+        """
         super().__init__()
         self.mount('http://', HTTPAdapter(pool_maxsize=concurrent_requests))
         self.mount('https://', HTTPAdapter(pool_maxsize=concurrent_requests))
         self._tokens = tokens
+        self.concurrent_requests = concurrent_requests
         self._sem = Semaphore(concurrent_requests)
         self.retry_429 = retry_429
         self._response_callback_registry = dict()
         self.register_response_callback(_dump_response_callback)
+        self.coalesce_gets = coalesce_gets
+        self._in_flight = dict()
+        self._in_flight_lock = Lock()
         if proxy_url:
             self.proxies = {'https': proxy_url}
         if verify is not None:
@@ -378,6 +431,45 @@ class RestSession(Session):
             response.close()
         return response, data
 
+    def _single_flight_request(self, method: str, url: str, **kwargs) -> Tuple[Response, StrOrDict]:
+        """
+        Wrapper for :meth:`_request_w_response` which coalesces identical concurrent GET requests if
+        :attr:`coalesce_gets` is set. Callers sharing a request each get their own copy of the parsed body
+
+        :meta private:
+        """
+        key = self.coalesce_gets and coalesce_key(method, url, self._tokens.access_token, kwargs)
+        if not key:
+            return self._request_w_response(method, url=url, **kwargs)
+        with self._in_flight_lock:
+            in_flight = self._in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                in_flight = _InFlightRequest()
+                in_flight.future = Future()
+                in_flight.callers = 1
+                self._in_flight[key] = in_flight
+            else:
+                in_flight.callers += 1
+        if leader:
+            try:
+                result = self._request_w_response(method, url=url, **kwargs)
+            except BaseException as e:
+                in_flight.future.set_exception(e)
+                raise
+            else:
+                in_flight.future.set_result(result)
+            finally:
+                with self._in_flight_lock:
+                    self._in_flight.pop(key, None)
+        else:
+            log.debug(f'coalesced GET {url}')
+        response, data = in_flight.future.result()
+        if in_flight.callers > 1 and isinstance(data, (dict, list)):
+            # copy on return: each caller gets its own copy of mutable data
+            data = copy.deepcopy(data)
+        return response, data
+
     def _rest_request(self, method: str, url: str, **kwargs) -> StrOrDict:
         """
         low level API request only returning the body
@@ -393,7 +485,7 @@ class RestSession(Session):
         :return: body. Body can be text or dict (parsed from JSON body)
         :rtype: Unon
         """
-        _, data = self._request_w_response(method, url=url, **kwargs)
+        _, data = self._single_flight_request(method, url=url, **kwargs)
         return data
 
     def rest_get(self, *args, **kwargs) -> StrOrDict:
@@ -444,6 +536,68 @@ class RestSession(Session):
         """
         return self._rest_request('PATCH', *args, **kwargs)
 
+    @retry_request
+    def _stream_request(self, method: str, url: str, headers: dict = None, **kwargs) -> Response:
+        """
+        low level API REST request with support for 429 rate limiting. The body of a successful response is not read.
+        Response callbacks are only called for error responses.
+
+        :meta private:
+        :return: open streaming response; needs to be closed by the caller
+        """
+        request_headers = {'Authorization': f'Bearer {self._tokens.access_token}',
+                           'TrackingID': f'SIMPLE_{uuid.uuid4()}'}
+        if headers:
+            request_headers.update((k.lower(), v) for k, v in headers.items())
+        start = time.perf_counter_ns()
+        response = self.request(method, url=url, headers=request_headers, stream=True, **kwargs)
+        if response.ok:
+            return response
+        diff_ns = time.perf_counter_ns() - start
+        try:
+            for callback in self._response_callback_registry.values():
+                callback(response, diff_ns)
+            try:
+                response.raise_for_status()
+            except HTTPError as error:
+                raise RestError(error.args[0], response=error.response)
+        finally:
+            response.close()
+
+    @contextmanager
+    def stream_response(self, method: str, url: str, **kwargs) -> Generator[Response, None, None]:
+        """
+        Request with a streaming response; for downloads which also need the response headers like
+        content-disposition or content-type. The body is not read and the response is closed when leaving the
+        context.
+
+        Example::
+
+            with api.session.stream_response('GET', url) as response:
+                content_type = response.headers.get('content-type')
+                for chunk in response.iter_content(chunk_size=65536):
+                    ...
+
+        :param method: HTTP method
+        :param url: URL
+        :param kwargs: additional keyword arguments for the request like params or headers
+        :return: context manager for the open response
+        """
+        with self._stream_request(method, url=url, **kwargs) as response:
+            yield response
+
+    def stream_get(self, url: str, chunk_size: int = 65536, **kwargs) -> Generator[bytes, None, None]:
+        """
+        GET request streaming the response body in chunks; for downloads which should not be read into memory at once
+
+        :param url: URL
+        :param chunk_size: maximum size of the chunks
+        :param kwargs: additional keyword arguments for the request like params or headers
+        :return: generator of body chunks
+        """
+        with self.stream_response('GET', url=url, **kwargs) as response:
+            yield from response.iter_content(chunk_size=chunk_size)
+
     def follow_pagination(self, url: str, model: Type[ApiModel] = None,
                           params: dict = None, item_key: str = None, **kwargs) -> Generator[ApiModel, None, None]:
         """
@@ -473,7 +627,7 @@ class RestSession(Session):
             # if url.startswith('https,'):
             #     url = url[6:]
             log.debug(f'{self.__class__.__name__}.pagination: getting {url}')
-            response, data = self._request_w_response('GET', url=url, params=params, **kwargs)
+            response, data = self._single_flight_request('GET', url=url, params=params, **kwargs)
             # params only in first request. In subsequent requests we rely on the completeness of the 'next' URL
             params = None
             # try to get the next page (if present)
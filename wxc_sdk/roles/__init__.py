@@ -1,6 +1,5 @@
-from pydantic import TypeAdapter
-
 from wxc_sdk.api_child import ApiChild
+from wxc_sdk.base import type_adapter
 
 __all__ = ['RolesApi']
 
@@ -25,7 +24,7 @@ class RolesApi(ApiChild, base='roles'):
         """
         url = self.ep()
         data = super().get(url)
-        r = TypeAdapter(list[IdAndName]).validate_python(data['items'])
+        r = type_adapter(list[IdAndName]).validate_python(data['items'])
         return r
 
     def details(self, role_id: str) -> IdAndName:
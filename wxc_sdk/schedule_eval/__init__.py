@@ -0,0 +1,388 @@
+"""
+Local evaluation of location and user schedules
+
+Schedules (:class:`wxc_sdk.common.schedules.Schedule`) are compiled into sorted interval arrays. Recurrences are
+expanded lazily, one calendar year at a time, and the expansion is cached. This allows to answer questions like "is
+location X in business hours or on holiday at time T" locally for many locations and many timestamps.
+
+Example:
+
+    .. code-block:: python
+
+        evaluator = ScheduleEvaluator()
+        evaluator.add_location(location_id=location.location_id, time_zone=location.time_zone,
+                               business_hours=business_schedule, holidays=[holiday_schedule])
+        state = evaluator.state(location_id=location.location_id, t=datetime.now(tz=timezone.utc))
+"""
+import datetime
+from array import array
+from bisect import bisect_right
+from collections.abc import Generator, Iterable, Sequence
+from dataclasses import dataclass
+from itertools import islice, takewhile
+from typing import Optional, Union
+
+from dateutil import tz
+
+from wxc_sdk.base import SafeEnum as Enum
+from wxc_sdk.common.schedules import Event, Schedule
+
+__all__ = ['ScheduleState', 'CompiledSchedule', 'ScheduleEvaluator', 'ScheduleTimestamp']
+
+# a point in time: epoch seconds or datetime. Naive datetimes are interpreted as wall clock time in the time zone
+# of the schedule
+ScheduleTimestamp = Union[float, int, datetime.datetime]
+
+_MONTHS = {'JANUARY': 1, 'FEBRUARY': 2, 'MARCH': 3, 'APRIL': 4, 'MAY': 5, 'JUNE': 6, 'JULY': 7, 'AUGUST': 8,
+           'SEPTEMBER': 9, 'OCTOBER': 10, 'NOVEMBER': 11, 'DECEMBER': 12}
+_DAYS = {'MONDAY': 0, 'TUESDAY': 1, 'WEDNESDAY': 2, 'THURSDAY': 3, 'FRIDAY': 4, 'SATURDAY': 5, 'SUNDAY': 6}
+_WEEKS = {'FIRST': 1, 'SECOND': 2, 'THIRD': 3, 'FOURTH': 4, 'LAST': -1}
+_ONE_DAY = datetime.timedelta(days=1)
+
+
+class ScheduleState(str, Enum):
+    """
+    State of a location at a given time
+    """
+    business_hours = 'BUSINESS_HOURS'
+    after_hours = 'AFTER_HOURS'
+    holiday = 'HOLIDAY'
+
+
+def _enum_value(v) -> str:
+    return getattr(v, 'value', v)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, week: int) -> Optional[datetime.date]:
+    """
+    n-th weekday in a month; week -1 is the last weekday in the month
+    """
+    if week == -1:
+        next_month = datetime.date(year + month // 12, month % 12 + 1, 1)
+        last = next_month - _ONE_DAY
+        return last - datetime.timedelta(days=(last.weekday() - weekday) % 7)
+    first = datetime.date(year, month, 1)
+    d = first + datetime.timedelta(days=(weekday - first.weekday()) % 7 + 7 * (week - 1))
+    return d if d.month == month else None
+
+
+@dataclass(init=False, repr=False)
+class _EventRule:
+    """
+    Occurrence rule derived from one schedule event
+    """
+    start_date: datetime.date
+    start_time: datetime.time
+    duration: datetime.timedelta
+    end_date: Optional[datetime.date]
+    max_count: Optional[int]
+    event: Event
+
+    def __init__(self, event: Event):
+        self.event = event
+        if event.start_date is None:
+            raise ValueError(f'event "{event.name}" has no start date')
+        end_date = event.end_date or event.start_date
+        self.start_date = event.start_date
+        if event.all_day_enabled:
+            self.start_time = datetime.time(0)
+            self.duration = (end_date - event.start_date) + _ONE_DAY
+        else:
+            self.start_time = event.start_time or datetime.time(0)
+            end_time = event.end_time or datetime.time(0)
+            start = datetime.datetime.combine(event.start_date, self.start_time)
+            end = datetime.datetime.combine(end_date, end_time)
+            if end <= start and end_date == event.start_date:
+                # end time 00:00 on the same day means end of day
+                end += _ONE_DAY
+            self.duration = end - start
+        recurrence = event.recurrence
+        self.end_date = recurrence and recurrence.recur_end_date
+        self.max_count = recurrence and recurrence.recur_end_of_occurrence
+
+    def _dates(self, from_date: datetime.date) -> Generator[datetime.date, None, None]:
+        """
+        Dates of all occurrences on or after a given date (not considering the count limit)
+        """
+        start = self.start_date
+        from_date = max(from_date, start)
+        recurrence = self.event.recurrence
+        if recurrence is None or not any((recurrence.recur_daily, recurrence.recur_weekly,
+                                          recurrence.recur_yearly_by_date, recurrence.recur_yearly_by_day)):
+            if start >= from_date:
+                yield start
+            return
+        if daily := recurrence.recur_daily:
+            interval = max(1, daily.recur_interval)
+            k = -(-(from_date - start).days // interval)
+            d = start + datetime.timedelta(days=k * interval)
+            while True:
+                yield d
+                d += datetime.timedelta(days=interval)
+        elif weekly := recurrence.recur_weekly:
+            interval = max(1, weekly.recur_interval or 1)
+            weekdays = {wd for name, wd in _DAYS.items() if getattr(weekly, name.lower())}
+            if not weekdays:
+                return
+            week0 = start - datetime.timedelta(days=start.weekday())
+            d = from_date
+            while True:
+                if d.weekday() in weekdays and ((d - week0).days // 7) % interval == 0:
+                    yield d
+                d += _ONE_DAY
+        elif by_date := recurrence.recur_yearly_by_date:
+            month = _MONTHS[_enum_value(by_date.month)]
+            for year in range(from_date.year, datetime.MAXYEAR):
+                try:
+                    d = datetime.date(year, month, by_date.day_of_month)
+                except ValueError:
+                    # Feb 29th in a non-leap year
+                    continue
+                if d >= from_date:
+                    yield d
+        else:
+            by_day = recurrence.recur_yearly_by_day
+            month = _MONTHS[_enum_value(by_day.month)]
+            weekday = _DAYS[_enum_value(by_day.day)]
+            week = _WEEKS[_enum_value(by_day.week)]
+            for year in range(from_date.year, datetime.MAXYEAR):
+                d = _nth_weekday(year, month, weekday, week)
+                if d is not None and d >= from_date:
+                    yield d
+
+    def dates_in_year(self, year: int) -> list[datetime.date]:
+        """
+        Dates of all occurrences starting in a given year
+        """
+        if self.start_date.year > year or (self.end_date and self.end_date.year < year):
+            return []
+        if self.max_count:
+            # occurrences have to be counted from the start
+            dates = islice(self._dates(self.start_date), self.max_count)
+            dates = (d for d in takewhile(lambda d: d.year <= year, dates) if d.year == year)
+        else:
+            dates = takewhile(lambda d: d.year == year, self._dates(datetime.date(year, 1, 1)))
+        if self.end_date:
+            dates = takewhile(lambda d: d <= self.end_date, dates)
+        return list(dates)
+
+
+def _merge(intervals: Iterable[tuple[float, float]]) -> tuple[array, array]:
+    """
+    Merge intervals into sorted arrays of non-overlapping interval starts and ends
+    """
+    starts = array('d')
+    ends = array('d')
+    for s, e in sorted(intervals):
+        if ends and s <= ends[-1]:
+            if e > ends[-1]:
+                ends[-1] = e
+        else:
+            starts.append(s)
+            ends.append(e)
+    return starts, ends
+
+
+@dataclass(init=False, repr=False)
+class CompiledSchedule:
+    """
+    A schedule compiled to sorted interval arrays (epoch seconds). Recurrences are expanded lazily per calendar year
+    """
+    #: the schedule
+    schedule: Schedule
+    #: time zone of the schedule
+    tzinfo: datetime.tzinfo
+    _rules: list[_EventRule]
+    #: cache of merged intervals of occurrences starting in a given year
+    _years: dict[int, tuple[array, array]]
+
+    def __init__(self, schedule: Schedule, time_zone: Union[str, datetime.tzinfo, None] = None):
+        """
+
+        :param schedule: schedule with events; the result of a :meth:`details` call
+        :param time_zone: time zone the schedule is evaluated in, for example the time zone of the location.
+            Default: UTC
+        """
+        self.schedule = schedule
+        if isinstance(time_zone, str):
+            time_zone_info = tz.gettz(time_zone)
+            if time_zone_info is None:
+                raise ValueError(f'unknown time zone: {time_zone}')
+            time_zone = time_zone_info
+        self.tzinfo = time_zone or datetime.timezone.utc
+        self._rules = [_EventRule(event) for event in schedule.events or []]
+        self._years = dict()
+
+    def _epoch(self, dt: datetime.datetime) -> float:
+        return dt.replace(tzinfo=self.tzinfo).timestamp()
+
+    def _to_epoch(self, t: ScheduleTimestamp) -> float:
+        if isinstance(t, datetime.datetime):
+            return t.timestamp() if t.tzinfo else self._epoch(t)
+        return float(t)
+
+    def _year(self, year: int) -> tuple[array, array]:
+        """
+        merged intervals of all occurrences starting in a given year (local time)
+        """
+        if (r := self._years.get(year)) is None:
+            intervals = []
+            for rule in self._rules:
+                for d in rule.dates_in_year(year):
+                    start = datetime.datetime.combine(d, rule.start_time)
+                    intervals.append((self._epoch(start), self._epoch(start + rule.duration)))
+            r = _merge(intervals)
+            self._years[year] = r
+        return r
+
+    def _local_year(self, t: float) -> int:
+        return datetime.datetime.fromtimestamp(t, tz=self.tzinfo).year
+
+    def _span(self, first_year: int, last_year: int) -> tuple[array, array]:
+        """
+        merged intervals covering a range of years. Occurrences starting in the previous year can spill over
+        """
+        parts = [self._year(y) for y in range(first_year - 1, last_year + 1)]
+        return _merge(pair for starts, ends in parts for pair in zip(starts, ends))
+
+    def is_active(self, t: ScheduleTimestamp) -> bool:
+        """
+        Check whether the schedule is active at a given time
+
+        :param t: epoch seconds or datetime
+        """
+        t = self._to_epoch(t)
+        year = self._local_year(t)
+        for y in (year, year - 1):
+            starts, ends = self._year(y)
+            i = bisect_right(starts, t) - 1
+            if i >= 0 and ends[i] > t:
+                return True
+        return False
+
+    def is_active_many(self, timestamps: Sequence[ScheduleTimestamp]) -> list[bool]:
+        """
+        Batched evaluation for many timestamps: the timestamps are sorted and swept against the merged interval
+        array in a single pass
+
+        :param timestamps: epoch seconds or datetimes
+        :return: list of results in the order of the timestamps
+        """
+        if not timestamps:
+            return []
+        ts = [self._to_epoch(t) for t in timestamps]
+        order = sorted(range(len(ts)), key=ts.__getitem__)
+        starts, ends = self._span(self._local_year(ts[order[0]]), self._local_year(ts[order[-1]]))
+        result = [False] * len(ts)
+        i = 0
+        n = len(starts)
+        for idx in order:
+            t = ts[idx]
+            while i < n and ends[i] <= t:
+                i += 1
+            result[idx] = i < n and starts[i] <= t
+        return result
+
+    def intervals(self, start: ScheduleTimestamp,
+                  end: ScheduleTimestamp) -> list[tuple[datetime.datetime, datetime.datetime]]:
+        """
+        Range query: all intervals in which the schedule is active overlapping with [start, end)
+
+        :param start: start of range
+        :param end: end of range
+        :return: list of (start, end) tuples of aware datetimes in the time zone of the schedule
+        """
+        s = self._to_epoch(start)
+        e = self._to_epoch(end)
+        starts, ends = self._span(self._local_year(s), self._local_year(e))
+        i = max(0, bisect_right(ends, s))
+        r = []
+        while i < len(starts) and starts[i] < e:
+            r.append((datetime.datetime.fromtimestamp(starts[i], tz=self.tzinfo),
+                      datetime.datetime.fromtimestamp(ends[i], tz=self.tzinfo)))
+            i += 1
+        return r
+
+
+@dataclass(init=False, repr=False)
+class _LocationSchedules:
+    business_hours: Optional[CompiledSchedule]
+    holidays: list[CompiledSchedule]
+
+
+@dataclass(init=False, repr=False)
+class ScheduleEvaluator:
+    """
+    Evaluate business hours and holiday schedules of many locations (or users)
+    """
+    _locations: dict[str, _LocationSchedules]
+
+    def __init__(self):
+        self._locations = dict()
+
+    def add_location(self, location_id: str, time_zone: Union[str, datetime.tzinfo, None],
+                     business_hours: Optional[Schedule] = None,
+                     holidays: Union[Schedule, Iterable[Schedule], None] = None):
+        """
+        Add (or replace) the schedules of a location
+
+        :param location_id: location ID
+        :param time_zone: time zone of the location
+        :param business_hours: business hours schedule; if None, then the location is always in business hours
+        :param holidays: holiday schedule(s)
+        """
+        if isinstance(holidays, Schedule):
+            holidays = [holidays]
+        ls = _LocationSchedules()
+        ls.business_hours = business_hours and CompiledSchedule(business_hours, time_zone)
+        ls.holidays = [CompiledSchedule(h, time_zone) for h in holidays or []]
+        self._locations[location_id] = ls
+
+    def remove_location(self, location_id: str):
+        self._locations.pop(location_id, None)
+
+    @property
+    def location_ids(self) -> list[str]:
+        return list(self._locations)
+
+    def state(self, location_id: str, t: ScheduleTimestamp) -> ScheduleState:
+        """
+        State of a location at a given time
+
+        :param location_id: location ID
+        :param t: epoch seconds or datetime
+        """
+        ls = self._locations[location_id]
+        if any(h.is_active(t) for h in ls.holidays):
+            return ScheduleState.holiday
+        if ls.business_hours is None or ls.business_hours.is_active(t):
+            return ScheduleState.business_hours
+        return ScheduleState.after_hours
+
+    def states_at(self, t: ScheduleTimestamp) -> dict[str, ScheduleState]:
+        """
+        State of all locations at a given time
+
+        :param t: epoch seconds or datetime
+        :return: dict location id -> state
+        """
+        return {location_id: self.state(location_id, t) for location_id in self._locations}
+
+    def timeline(self, location_id: str, timestamps: Sequence[ScheduleTimestamp]) -> list[ScheduleState]:
+        """
+        Batched evaluation of the state of a location for many timestamps
+
+        :param location_id: location ID
+        :param timestamps: epoch seconds or datetimes
+        :return: list of states in the order of the timestamps
+        """
+        ls = self._locations[location_id]
+        holiday = [False] * len(timestamps)
+        for h in ls.holidays:
+            holiday = [a or b for a, b in zip(holiday, h.is_active_many(timestamps))]
+        if ls.business_hours is None:
+            business = [True] * len(timestamps)
+        else:
+            business = ls.business_hours.is_active_many(timestamps)
+        return [ScheduleState.holiday if h else ScheduleState.business_hours if b else ScheduleState.after_hours
+                for h, b in zip(holiday, business)]
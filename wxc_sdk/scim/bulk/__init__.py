@@ -1,9 +1,9 @@
 import re
 from typing import Optional
 
-from pydantic import TypeAdapter, Field
+from pydantic import Field
 
-from wxc_sdk.base import ApiModel
+from wxc_sdk.base import ApiModel, type_adapter
 from wxc_sdk.base import SafeEnum as Enum
 
 __all__ = ['BulkMethod', 'BulkOperation', 'ResponseError', 'BulkErrorResponse', 'BulkResponseOperation',
@@ -155,7 +155,7 @@ class SCIM2BulkApi(ScimApiChild, base='identity/scim'):
         body = dict()
         body['schemas'] = ['urn:ietf:params:scim:api:messages:2.0:BulkRequest']
         body['failOnErrors'] = fail_on_errors
-        body['operations'] = TypeAdapter(list[BulkOperation]).dump_python(
+        body['operations'] = type_adapter(list[BulkOperation]).dump_python(
             operations, mode='json', by_alias=True, exclude_none=True)
         url = self.ep(f'{org_id}/v2/Bulk')
         data = super().post(url, json=body)
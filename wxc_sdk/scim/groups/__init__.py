@@ -2,9 +2,9 @@ from collections.abc import Generator
 from datetime import datetime
 from typing import Optional
 
-from pydantic import Field, TypeAdapter
+from pydantic import Field
 
-from wxc_sdk.base import ApiModel
+from wxc_sdk.base import ApiModel, type_adapter
 from wxc_sdk.base import SafeEnum as Enum
 from wxc_sdk.scim.child import ScimApiChild
 from wxc_sdk.scim.users import PatchUserOperation
@@ -659,8 +659,8 @@ class SCIM2GroupsApi(ScimApiChild, base='identity/scim'):
         """
         body = dict()
         body['schemas'] = schemas
-        body['Operations'] = TypeAdapter(list[PatchUserOperation]).dump_python(operations, mode='json', by_alias=True,
-                                                                               exclude_none=True)
+        body['Operations'] = type_adapter(list[PatchUserOperation]).dump_python(operations, mode='json', by_alias=True,
+                                                                                exclude_none=True)
         url = self.ep(f'{org_id}/v2/Groups/{group_id}')
         data = super().patch(url, json=body)
         r = ScimGroup.model_validate(data)
@@ -2,9 +2,9 @@ from collections.abc import Generator
 from datetime import datetime
 from typing import Optional
 
-from pydantic import Field, TypeAdapter
+from pydantic import Field
 
-from wxc_sdk.base import ApiModel
+from wxc_sdk.base import ApiModel, type_adapter
 from wxc_sdk.base import SafeEnum as Enum
 from wxc_sdk.scim.child import ScimApiChild
 
@@ -796,8 +796,8 @@ class SCIM2UsersApi(ScimApiChild, base='identity/scim'):
         """
         body = dict()
         body['schemas'] = ["urn:ietf:params:scim:api:messages:2.0:PatchOp"]
-        body['Operations'] = TypeAdapter(list[PatchUserOperation]).dump_python(operations, mode='json', by_alias=True,
-                                                                               exclude_none=True)
+        body['Operations'] = type_adapter(list[PatchUserOperation]).dump_python(operations, mode='json', by_alias=True,
+                                                                                exclude_none=True)
         url = self.ep(f'{org_id}/v2/Users/{user_id}')
         data = super().patch(url, json=body)
         r = ScimUser.model_validate(data)
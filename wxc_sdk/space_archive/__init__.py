@@ -0,0 +1,324 @@
+"""
+Archive of the messages and files of many spaces
+
+Listing messages with :meth:`api.messages.list <wxc_sdk.messages.MessagesApi.list>` walks one space at a time and
+attachments have to be downloaded separately. :class:`AsSpaceArchiver` archives any number of spaces to a directory:
+
+* spaces are archived concurrently; messages of each space are streamed to a JSON lines file
+  ``messages/<room id>.jsonl``
+* files attached to messages are downloaded with bounded concurrency and stored content-addressed as
+  ``files/<sha256>``: each file is only stored once, no matter how often it was posted. The file index
+  ``files.jsonl`` maps file URLs to content hashes and original file names: :class:`ArchivedFile`
+* archiving is incremental: the creation time of the newest archived message of each space is recorded in
+  ``cursors.jsonl`` (:class:`RoomCursor`). The next run only gets messages created after that time. Spaces which had
+  no activity since the last run are skipped without any request if :class:`wxc_sdk.rooms.Room` instances are passed.
+  Failed file downloads are retried in the next run
+* a space is only marked as archived after all its messages and files are stored; an interrupted run can simply be
+  started again
+
+Example:
+
+    .. code-block:: python
+
+        async with AsWebexSimpleApi(tokens=token, concurrent_requests=100) as api:
+            archiver = AsSpaceArchiver(api, directory='archive', concurrency=20, download_concurrency=20)
+            rooms = await api.rooms.list()
+            report = await archiver.archive(rooms)
+            print(f'{report.messages} messages in {report.rooms} spaces, {report.files} files downloaded')
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Union
+
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.base import ApiModel
+from wxc_sdk.fan_out import as_items_as_completed
+from wxc_sdk.messages import Message
+from wxc_sdk.rooms import Room
+
+__all__ = ['RoomCursor', 'ArchivedFile', 'ArchiveIndex', 'ArchiveReport', 'AsSpaceArchiver']
+
+log = logging.getLogger(__name__)
+
+RE_FILENAME = re.compile(r'filename="?([^";]+)"?')
+
+
+class RoomCursor(ApiModel):
+    """
+    Archive state of a space
+    """
+    room_id: str
+    #: creation time of the newest archived message
+    last_created: Optional[datetime] = None
+    #: number of messages archived in the run which wrote this cursor
+    messages: int = 0
+
+
+class ArchivedFile(ApiModel):
+    """
+    Result of the download of one file
+    """
+    url: str
+    #: sha256 of the file content; name of the file in the files directory
+    sha256: Optional[str] = None
+    #: original file name from the content disposition
+    name: Optional[str] = None
+    content_type: Optional[str] = None
+    size: Optional[int] = None
+    #: error message if the download failed
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ArchiveIndex:
+    """
+    Cursors and file index of an archive. Both are JSON lines files which are only appended to; the last entry for a
+    space or file URL wins
+    """
+
+    def __init__(self, directory: str):
+        self.cursors_path = os.path.join(directory, 'cursors.jsonl')
+        self.files_path = os.path.join(directory, 'files.jsonl')
+        #: room id -> cursor
+        self.cursors: dict[str, RoomCursor] = {cursor.room_id: cursor
+                                               for cursor in self._read(self.cursors_path, RoomCursor)}
+        #: URLs of downloaded files
+        self.downloaded: set[str] = set()
+        #: URLs of failed downloads
+        self.failed: set[str] = set()
+        #: content hashes of stored files
+        self.hashes: set[str] = set()
+        for file in self._read(self.files_path, ArchivedFile):
+            self._add_file(file)
+
+    @staticmethod
+    def _read(path: str, model):
+        try:
+            with open(path, mode='r') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield model.model_validate(json.loads(line))
+                    except ValueError:
+                        # last line of an interrupted run might be incomplete
+                        log.warning(f'{path}: ignoring invalid line')
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _append(path: str, entry: ApiModel):
+        with open(path, mode='a') as f:
+            f.write(f'{entry.model_dump_json(exclude_none=True)}\n')
+
+    def _add_file(self, file: ArchivedFile):
+        if file.ok:
+            self.downloaded.add(file.url)
+            self.failed.discard(file.url)
+            self.hashes.add(file.sha256)
+        elif file.url not in self.downloaded:
+            self.failed.add(file.url)
+
+    def record_cursor(self, cursor: RoomCursor):
+        self.cursors[cursor.room_id] = cursor
+        self._append(self.cursors_path, cursor)
+
+    def record_file(self, file: ArchivedFile):
+        self._add_file(file)
+        self._append(self.files_path, file)
+
+
+@dataclass
+class ArchiveReport:
+    """
+    Result of an archive run
+    """
+    #: number of spaces archived
+    rooms: int = 0
+    #: number of spaces skipped because they had no activity since the last run
+    unchanged: int = 0
+    #: number of messages archived
+    messages: int = 0
+    #: number of files downloaded
+    files: int = 0
+    #: number of downloaded files which were already stored with identical content
+    duplicates: int = 0
+    #: total number of bytes downloaded
+    bytes: int = 0
+    #: failed spaces: room id -> error message
+    failed_rooms: dict[str, str] = field(default_factory=dict)
+    #: failed downloads: URL -> error message
+    failed_files: dict[str, str] = field(default_factory=dict)
+    #: duration in seconds
+    duration: float = 0.0
+
+
+class AsSpaceArchiver:
+    """
+    Archive messages and files of spaces to a directory
+    """
+
+    def __init__(self, api: AsWebexSimpleApi, *, directory: str, concurrency: int = 10,
+                 download_concurrency: int = 10, download_files: bool = True, chunk_size: int = 65536,
+                 page_size: int = 1000):
+        """
+        :param api: async API
+        :param directory: archive directory; created if needed
+        :param concurrency: maximum number of spaces archived concurrently
+        :param download_concurrency: maximum number of concurrent file downloads over all spaces
+        :param download_files: download files attached to messages
+        :param chunk_size: chunk size for streaming downloads
+        :param page_size: page size for message lists
+        """
+        self.api = api
+        self.directory = directory
+        self.concurrency = concurrency
+        self.download_concurrency = download_concurrency
+        self.download_files = download_files
+        self.chunk_size = chunk_size
+        self.page_size = page_size
+        self._download_semaphore: Optional[asyncio.Semaphore] = None
+        #: downloads in progress: URL -> task
+        self._downloads: dict[str, asyncio.Task] = dict()
+
+    def messages_path(self, room_id: str) -> str:
+        return os.path.join(self.directory, 'messages', f'{room_id}.jsonl')
+
+    def file_path(self, sha256: str) -> str:
+        return os.path.join(self.directory, 'files', sha256)
+
+    async def _download(self, url: str, index: ArchiveIndex, report: ArchiveReport) -> ArchivedFile:
+        file = ArchivedFile(url=url)
+        temp_path = os.path.join(self.directory, 'files', f'.{uuid.uuid4()}.part')
+        async with self._download_semaphore:
+            try:
+                digest = hashlib.sha256()
+                size = 0
+                async with self.api.session.stream_response('GET', url=url) as response:
+                    match = RE_FILENAME.search(response.headers.get('content-disposition') or '')
+                    file.name = match and match.group(1)
+                    file.content_type = response.headers.get('content-type')
+                    with open(temp_path, mode='wb') as f:
+                        async for chunk in response.content.iter_chunked(self.chunk_size):
+                            digest.update(chunk)
+                            size += len(chunk)
+                            f.write(chunk)
+                file.sha256 = digest.hexdigest()
+                file.size = size
+                if file.sha256 in index.hashes or os.path.exists(self.file_path(file.sha256)):
+                    os.remove(temp_path)
+                    report.duplicates += 1
+                else:
+                    os.replace(temp_path, self.file_path(file.sha256))
+                report.files += 1
+                report.bytes += size
+            except Exception as e:
+                log.warning(f'download of {url} failed: {e}')
+                file.error = str(e) or e.__class__.__name__
+                report.failed_files[url] = file.error
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+        index.record_file(file)
+        return file
+
+    def _schedule_download(self, url: str, index: ArchiveIndex, report: ArchiveReport) -> Optional[asyncio.Task]:
+        """
+        Start the download of a file unless it was downloaded before or is being downloaded
+        """
+        if url in index.downloaded:
+            return None
+        task = self._downloads.get(url)
+        if task is None:
+            task = asyncio.create_task(self._download(url, index, report))
+            self._downloads[url] = task
+            task.add_done_callback(lambda _: self._downloads.pop(url, None))
+        return task
+
+    async def archive_room(self, room: Union[str, Room], index: ArchiveIndex, report: ArchiveReport):
+        """
+        Archive new messages and files of one space
+
+        :param room: room or room id
+        :param index: archive index
+        :param report: report to update
+        """
+        room_id = room if isinstance(room, str) else room.id
+        cursor = index.cursors.get(room_id)
+        last_created = cursor and cursor.last_created
+        if last_created and isinstance(room, Room) and room.last_activity and room.last_activity <= last_created:
+            report.unchanged += 1
+            return
+        path = self.messages_path(room_id)
+        temp_path = f'{path}.part'
+        newest = None
+        messages = 0
+        downloads = []
+        with open(temp_path, mode='w') as f:
+            message: Message
+            async for message in self.api.messages.list_gen(room_id=room_id, max=self.page_size):
+                # messages are listed newest first
+                if last_created and message.created and message.created <= last_created:
+                    break
+                if newest is None:
+                    newest = message.created
+                f.write(f'{message.model_dump_json(exclude_none=True)}\n')
+                messages += 1
+                if self.download_files:
+                    downloads.extend(filter(None, (self._schedule_download(url, index, report)
+                                                   for url in message.files or [])))
+        # the space is only marked as archived when all files of new messages are stored; failed downloads are
+        # retried in the next run
+        await asyncio.gather(*downloads, return_exceptions=True)
+        if messages:
+            # append the messages of this run to the archive of the space
+            with open(path, mode='a') as archive, open(temp_path, mode='r') as f:
+                for line in f:
+                    archive.write(line)
+            index.record_cursor(RoomCursor(room_id=room_id, last_created=newest, messages=messages))
+        os.remove(temp_path)
+        report.rooms += 1
+        report.messages += messages
+
+    async def archive(self, rooms: Iterable[Union[str, Room]]) -> ArchiveReport:
+        """
+        Archive spaces
+
+        :param rooms: rooms or room ids; consumed lazily
+        :return: report
+        """
+        start = time.perf_counter()
+        os.makedirs(os.path.join(self.directory, 'messages'), exist_ok=True)
+        os.makedirs(os.path.join(self.directory, 'files'), exist_ok=True)
+        index = ArchiveIndex(self.directory)
+        report = ArchiveReport()
+        self._download_semaphore = asyncio.Semaphore(self.download_concurrency)
+
+        # retry downloads which failed in previous runs
+        retries = [self._schedule_download(url, index, report) for url in list(index.failed)]
+
+        async def archive_room(room: Union[str, Room]):
+            await self.archive_room(room, index, report)
+
+        async for result in as_items_as_completed(archive_room, rooms, concurrency=self.concurrency):
+            if not result.ok:
+                room_id = result.item if isinstance(result.item, str) else result.item.id
+                log.warning(f'archiving space {room_id} failed: {result.exception}')
+                report.failed_rooms[room_id] = str(result.exception) or result.exception.__class__.__name__
+        await asyncio.gather(*filter(None, retries), return_exceptions=True)
+        report.duration = time.perf_counter() - start
+        log.info(f'archive: {report.rooms} spaces, {report.messages} messages, {report.files} files, '
+                 f'{len(report.failed_rooms)} failed spaces, {len(report.failed_files)} failed files, '
+                 f'{report.duration:.1f}s')
+        return report
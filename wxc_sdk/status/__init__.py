@@ -4,10 +4,10 @@ Webex Status API as described at https://status.webex.com/api
 from datetime import datetime
 from typing import Optional
 
-from pydantic import Field, TypeAdapter
+from pydantic import Field
 
 from wxc_sdk.api_child import ApiChild
-from wxc_sdk.base import ApiModel
+from wxc_sdk.base import ApiModel, type_adapter
 
 __all__ = ['Component', 'IncidentUpdate', 'Incident', 'WebexStatus', 'StatusSummary', 'StatusAPI']
 
@@ -119,7 +119,7 @@ class StatusAPI(ApiChild, base='status'):
         """
         url = self.ep('components')
         data = self.session.rest_get(url=url)
-        return TypeAdapter(list[Component]).validate_python(data['components'])
+        return type_adapter(list[Component]).validate_python(data['components'])
 
     def unresolved_incidents(self) -> list[Incident]:
         """
@@ -131,7 +131,7 @@ class StatusAPI(ApiChild, base='status'):
         """
         url = self.ep('unresolved-incidents')
         data = self.session.rest_get(url=url)
-        return TypeAdapter(list[Incident]).validate_python(data['incidents'])
+        return type_adapter(list[Incident]).validate_python(data['incidents'])
 
     def all_incidents(self) -> list[Incident]:
         """
@@ -143,7 +143,7 @@ class StatusAPI(ApiChild, base='status'):
         """
         url = self.ep('all-incidents')
         data = self.session.rest_get(url=url)
-        return TypeAdapter(list[Incident]).validate_python(data['incidents'])
+        return type_adapter(list[Incident]).validate_python(data['incidents'])
 
     def upcoming_scheduled_maintenances(self) -> list[Incident]:
         """
@@ -161,7 +161,7 @@ class StatusAPI(ApiChild, base='status'):
         """
         url = self.ep('upcoming-scheduled-maintenances')
         data = self.session.rest_get(url=url)
-        return TypeAdapter(list[Incident]).validate_python(data['scheduled_maintenances'])
+        return type_adapter(list[Incident]).validate_python(data['scheduled_maintenances'])
 
     def active_scheduled_maintenances(self) -> list[Incident]:
         """
@@ -173,7 +173,7 @@ class StatusAPI(ApiChild, base='status'):
         """
         url = self.ep('active-scheduled-maintenances')
         data = self.session.rest_get(url=url)
-        return TypeAdapter(list[Incident]).validate_python(data['scheduled_maintenances'])
+        return type_adapter(list[Incident]).validate_python(data['scheduled_maintenances'])
 
     def all_scheduled_maintenances(self) -> list[Incident]:
         """
@@ -185,4 +185,4 @@ class StatusAPI(ApiChild, base='status'):
         """
         url = self.ep('all-scheduled-maintenances')
         data = self.session.rest_get(url=url)
-        return TypeAdapter(list[Incident]).validate_python(data['scheduled_maintenances'])
+        return type_adapter(list[Incident]).validate_python(data['scheduled_maintenances'])
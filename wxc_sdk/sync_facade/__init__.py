@@ -0,0 +1,286 @@
+"""
+Sync facade over the async API
+
+Parallelism in synchronous code using :class:`WebexSimpleApi <wxc_sdk.WebexSimpleApi>` means thread pools: one
+thread per concurrent request. :class:`SyncFacade` instead drives an
+:class:`AsWebexSimpleApi <wxc_sdk.as_api.AsWebexSimpleApi>` on an event loop in a dedicated background thread and
+offers:
+
+* blocking access to all async API methods with the same signatures as the async API: :attr:`SyncFacade.api`.
+  Coroutine methods block until the result is available, ``*_gen`` methods return a (sync) generator
+* fan-out of many concurrent requests from a single calling thread: :meth:`SyncFacade.map_concurrent`
+* futures for async API calls: :meth:`SyncFacade.submit`
+
+Example:
+
+    .. code-block:: python
+
+        with SyncFacade(concurrent_requests=100) as facade:
+            users = facade.api.people.list()
+            # get details for all users with up to 100 concurrent requests
+            details = facade.map_concurrent(
+                lambda user: facade.as_api.people.details(person_id=user.person_id, calling_data=True),
+                users)
+
+            for number in facade.api.telephony.phone_numbers_gen():
+                ...
+"""
+import asyncio
+import inspect
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Generator, Iterable
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Optional, TypeVar, Union
+
+from wxc_sdk.as_api import AsApiChild, AsWebexSimpleApi
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.list_stream import AsListStream
+from wxc_sdk.tokens import Tokens
+
+__all__ = ['SyncFacade', 'SyncProxy']
+
+log = logging.getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class SyncProxy:
+    """
+    Blocking proxy for an async API object. Attribute access is delegated to the wrapped object:
+
+    * coroutine methods are wrapped in blocking methods
+    * async generator methods are wrapped in methods returning a sync generator
+    * async API children are wrapped in a :class:`SyncProxy`
+    * everything else is returned as is
+    """
+
+    def __init__(self, facade: 'SyncFacade', target: Any):
+        self._facade = facade
+        self._target = target
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        facade = self._facade
+        if inspect.iscoroutinefunction(attr):
+            def blocking(*args, **kwargs):
+                return facade.run(attr(*args, **kwargs))
+
+            blocking.__doc__ = attr.__doc__
+            blocking.__name__ = name
+            return blocking
+        if inspect.isasyncgenfunction(attr):
+            def gen(*args, **kwargs):
+                return facade.iterate(attr(*args, **kwargs))
+
+            gen.__doc__ = attr.__doc__
+            gen.__name__ = name
+            return gen
+        # some async API objects (like call queue policies) are no AsApiChild but also hold a session
+        if (isinstance(attr, (AsApiChild, AsWebexSimpleApi))
+                or isinstance(getattr(attr, '_session', None), AsRestSession)):
+            return SyncProxy(facade, attr)
+        return attr
+
+    def __dir__(self):
+        return dir(self._target)
+
+    def __repr__(self):
+        return f'SyncProxy({self._target!r})'
+
+
+class SyncFacade:
+    """
+    Sync facade driving an :class:`AsWebexSimpleApi <wxc_sdk.as_api.AsWebexSimpleApi>` on a background event loop.
+
+    The facade is thread safe: any number of threads can use it concurrently. Blocking methods must not be called from
+    coroutines running on the facade's event loop.
+    """
+
+    def __init__(self, *, tokens: Union[str, Tokens] = None, concurrent_requests: int = 10, retry_429: bool = True,
+                 **kwargs):
+        """
+        Start the background event loop and create the async API
+
+        :param tokens: passed to :class:`AsWebexSimpleApi <wxc_sdk.as_api.AsWebexSimpleApi>`
+        :param concurrent_requests: maximum number of concurrent requests of the async API
+        :param retry_429: automatically retry for 429 throttling response
+        :param kwargs: additional arguments for the :class:`AsWebexSimpleApi <wxc_sdk.as_api.AsWebexSimpleApi>`
+            constructor
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name='SyncFacade', daemon=True)
+        self._thread.start()
+        self._closed = False
+
+        async def create() -> AsWebexSimpleApi:
+            # the aiohttp session has to be created on the event loop it is used on
+            return AsWebexSimpleApi(tokens=tokens, concurrent_requests=concurrent_requests, retry_429=retry_429,
+                                    **kwargs)
+
+        try:
+            self._as_api = self.run(create())
+        except BaseException:
+            self._stop_loop()
+            raise
+        self._api = SyncProxy(self, self._as_api)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _stop_loop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    @property
+    def api(self) -> AsWebexSimpleApi:
+        """
+        Blocking view of the async API: same attributes and methods, but methods block and return results
+        instead of coroutines. ``*_gen`` methods return sync generators.
+        """
+        # noinspection PyTypeChecker
+        return self._api
+
+    @property
+    def as_api(self) -> AsWebexSimpleApi:
+        """
+        The async API driven by the facade; used to create coroutines for :meth:`submit` and :meth:`map_concurrent`
+        """
+        return self._as_api
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """
+        The event loop of the facade
+        """
+        return self._loop
+
+    def _check(self):
+        if self._closed:
+            raise RuntimeError('SyncFacade is closed')
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            raise RuntimeError('blocking SyncFacade call from the facade event loop would deadlock')
+
+    def submit(self, coro_or_func: Union[Awaitable[T], Callable[..., Awaitable[T]]], *args, **kwargs) -> Future:
+        """
+        Schedule a coroutine on the facade's event loop
+
+        :param coro_or_func: coroutine, or coroutine function which is called with the given arguments on the event
+            loop
+        :return: future for the result
+        """
+        self._check()
+        if inspect.isawaitable(coro_or_func):
+            if args or kwargs:
+                raise ValueError('arguments can only be passed with a coroutine function')
+            if asyncio.iscoroutine(coro_or_func):
+                return asyncio.run_coroutine_threadsafe(coro_or_func, self._loop)
+
+            async def call():
+                return await coro_or_func
+        else:
+            async def call():
+                return await coro_or_func(*args, **kwargs)
+
+        return asyncio.run_coroutine_threadsafe(call(), self._loop)
+
+    def run(self, coro: Awaitable[T], timeout: float = None) -> T:
+        """
+        Run a coroutine on the facade's event loop and wait for the result
+
+        :param coro: coroutine
+        :param timeout: timeout in seconds; the coroutine is cancelled if it doesn't finish in time
+        :return: result
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def iterate(self, agen, prefetch: int = 0) -> Generator[Any, None, None]:
+        """
+        Iterate over an async generator from sync code. Each item is pulled from the generator on the facade's event
+        loop.
+
+        :param agen: async generator, for example ``facade.as_api.people.list_gen()``
+        :param prefetch: passed to :class:`AsListStream <wxc_sdk.list_stream.AsListStream>` to read ahead on the
+            event loop
+        :return: generator of items
+        """
+        self._check()
+        if prefetch:
+            agen = AsListStream(agen, prefetch=prefetch)
+        try:
+            while True:
+                try:
+                    yield self.run(agen.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            if not self._closed:
+                self.run(agen.aclose())
+
+    def map_concurrent(self, func: Callable[[T], Awaitable[R]], items: Iterable[T], concurrency: int = None,
+                       return_exceptions: bool = False, timeout: float = None) -> list[Union[R, BaseException]]:
+        """
+        Call an async function for each item concurrently on the facade's event loop and wait for all results.
+        Similar to :meth:`concurrent.futures.ThreadPoolExecutor.map` but without a thread per concurrent call.
+
+        :param func: function returning an awaitable for an item; called on the event loop. Typically a lambda
+            calling a method of :attr:`as_api`
+        :param items: items
+        :param concurrency: maximum number of concurrent calls. Default: not limited; the number of concurrent
+            requests is limited by the concurrent_requests parameter of the facade
+        :param return_exceptions: like for :func:`asyncio.gather`: return exceptions instead of raising the 1st
+            exception
+        :param timeout: timeout in seconds
+        :return: list of results in the order of the items. After the 1st exception (if return_exceptions is False)
+            or a timeout all pending calls are cancelled
+        """
+        items = list(items)
+
+        async def one(sem: Optional[asyncio.Semaphore], item: T) -> R:
+            if sem is None:
+                return await func(item)
+            async with sem:
+                return await func(item)
+
+        async def map_all():
+            sem = concurrency and asyncio.Semaphore(concurrency) or None
+            tasks = [asyncio.ensure_future(one(sem, item)) for item in items]
+            try:
+                return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+            finally:
+                # gather() doesn't cancel the other tasks if one of them fails
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        return self.run(map_all(), timeout=timeout)
+
+    def close(self):
+        """
+        Close the async API and stop the background event loop
+        """
+        if self._closed:
+            return
+        try:
+            self.run(self._as_api.close())
+        finally:
+            self._closed = True
+            self._stop_loop()
+
+    def __enter__(self) -> 'SyncFacade':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -5,7 +5,7 @@ from collections.abc import Generator
 from dataclasses import dataclass
 from typing import Optional
 
-from pydantic import Field, TypeAdapter, field_validator
+from pydantic import Field, field_validator
 
 from .access_codes import LocationAccessCodesApi
 from .announcements_repo import AnnouncementsRepositoryApi
@@ -42,7 +42,7 @@ from .voice_messaging import VoiceMessagingApi
 from .voicemail_groups import VoicemailGroupsApi
 from .voiceportal import VoicePortalApi
 from ..api_child import ApiChild
-from ..base import ApiModel, to_camel, plus1, enum_str
+from ..base import ApiModel, to_camel, plus1, enum_str, type_adapter
 from ..base import SafeEnum as Enum
 from ..common import UserType, RouteIdentity, NumberState, ValidateExtensionsResponse, ValidatePhoneNumbersResponse, \
     DeviceCustomization, IdAndName, OwnerType, NumberOwner, DeviceType
@@ -907,7 +907,7 @@ class TelephonyApi(ApiChild, base='telephony/config'):
         params = org_id and {'orgId': org_id} or None
         url = self.ep(path='callingProfiles')
         data = self.get(url, params=params)
-        return TypeAdapter(list[UCMProfile]).validate_python(data['callingProfiles'])
+        return type_adapter(list[UCMProfile]).validate_python(data['callingProfiles'])
 
     def route_choices(self, route_group_name: str = None, trunk_name: str = None, order: str = None,
                       org_id: str = None) -> Generator[RouteIdentity, None, None]:
@@ -1025,7 +1025,7 @@ class TelephonyApi(ApiChild, base='telephony/config'):
         """
         url = self.ep('announcementLanguages')
         data = super().get(url=url)
-        return TypeAdapter(list[AnnouncementLanguage]).validate_python(data["languages"])
+        return type_adapter(list[AnnouncementLanguage]).validate_python(data["languages"])
 
     def read_moh(self, org_id: str = None) -> MoHConfig:
         """
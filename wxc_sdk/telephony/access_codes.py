@@ -5,9 +5,8 @@ Use Access Codes to bypass the set permissions for all persons/workspaces at thi
 """
 from typing import Union
 
-from pydantic import TypeAdapter
-
 from ..api_child import ApiChild
+from ..base import type_adapter
 from ..common import AuthCode
 
 __all__ = ['LocationAccessCodesApi']
@@ -56,7 +55,7 @@ class LocationAccessCodesApi(ApiChild, base='telephony/config/locations'):
         params = org_id and {'orgId': org_id} or None
         url = self._endpoint(location_id=location_id)
         data = self.get(url, params=params)
-        return TypeAdapter(list[AuthCode]).validate_python(data['accessCodes'])
+        return type_adapter(list[AuthCode]).validate_python(data['accessCodes'])
 
     def create(self, location_id: str, access_codes: list[AuthCode], org_id: str = None) -> list[AuthCode]:
         """
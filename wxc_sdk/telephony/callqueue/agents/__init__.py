@@ -1,10 +1,8 @@
 from collections.abc import Generator
 from typing import Optional, List
 
-from pydantic import TypeAdapter
-
 from wxc_sdk.api_child import ApiChild
-from wxc_sdk.base import ApiModel
+from wxc_sdk.base import ApiModel, type_adapter
 from wxc_sdk.common import IdAndName
 
 __all__ = ['CallQueueAgent', 'CallQueueAgentQueue', 'CallQueueAgentDetail', 'AgentCallQueueSetting',
@@ -194,8 +192,8 @@ class CallQueueAgentsApi(ApiChild, base='telephony/config/queues/agents'):
         if has_cx_essentials is not None:
             params['hasCxEssentials'] = str(has_cx_essentials).lower()
         body = dict()
-        body['settings'] = TypeAdapter(list[AgentCallQueueSetting]).dump_python(settings, mode='json',
-                                                                                by_alias=True,
-                                                                                exclude_none=True)
+        body['settings'] = type_adapter(list[AgentCallQueueSetting]).dump_python(settings, mode='json',
+                                                                                 by_alias=True,
+                                                                                 exclude_none=True)
         url = self.ep(f'{id}/settings')
         super().put(url, params=params, json=body)
@@ -1,10 +1,10 @@
 from collections.abc import Generator
 from typing import Optional
 
-from pydantic import TypeAdapter, Field
+from pydantic import Field
 
 from wxc_sdk.api_child import ApiChild
-from wxc_sdk.base import ApiModel, enum_str
+from wxc_sdk.base import ApiModel, enum_str, type_adapter
 from wxc_sdk.base import SafeEnum as Enum
 from wxc_sdk.common import IdAndName, UserType, AssignedDectNetwork
 from wxc_sdk.telephony.devices import AvailableMember
@@ -217,7 +217,7 @@ class DECTDevicesApi(ApiChild, base='telephony/config'):
             params['orgId'] = org_id
         url = self.ep('devices/dectNetworks/supportedDevices')
         data = super().get(url, params=params)
-        r = TypeAdapter(list[DectDevice]).validate_python(data['devices'])
+        r = type_adapter(list[DectDevice]).validate_python(data['devices'])
         return r
 
     def create_dect_network(self, location_id: str, name: str, model: DECTNetworkModel,
@@ -299,7 +299,7 @@ class DECTDevicesApi(ApiChild, base='telephony/config'):
             params['locationId'] = location_id
         url = self.ep('dectNetworks')
         data = super().get(url, params=params)
-        r = TypeAdapter(list[DECTNetworkDetail]).validate_python(data['dectNetworks'])
+        r = type_adapter(list[DECTNetworkDetail]).validate_python(data['dectNetworks'])
         return r
 
     def dect_network_details(self, location_id: str, dect_network_id: str,
@@ -450,7 +450,7 @@ class DECTDevicesApi(ApiChild, base='telephony/config'):
         body['baseStationMacs'] = base_station_macs
         url = self.ep(f'locations/{location_id}/dectNetworks/{dect_id}/baseStations')
         data = super().post(url, params=params, json=body)
-        r = TypeAdapter(list[BaseStationResponse]).validate_python(data['baseStations'])
+        r = type_adapter(list[BaseStationResponse]).validate_python(data['baseStations'])
         return r
 
     def list_base_stations(self, location_id: str, dect_network_id: str,
@@ -480,7 +480,7 @@ class DECTDevicesApi(ApiChild, base='telephony/config'):
             params['orgId'] = org_id
         url = self.ep(f'locations/{location_id}/dectNetworks/{dect_network_id}/baseStations')
         data = super().get(url, params=params)
-        r = TypeAdapter(list[BaseStationsResponse]).validate_python(data['baseStations'])
+        r = type_adapter(list[BaseStationsResponse]).validate_python(data['baseStations'])
         return r
 
     def base_station_details(self, location_id: str, dect_network_id: str,
@@ -811,7 +811,7 @@ class DECTDevicesApi(ApiChild, base='telephony/config'):
             params['orgId'] = org_id
         url = self.ep(f'people/{person_id}/dectNetworks')
         data = super().get(url, params=params)
-        r = TypeAdapter(list[AssignedDectNetwork]).validate_python(data['dectNetworks'])
+        r = type_adapter(list[AssignedDectNetwork]).validate_python(data['dectNetworks'])
         return r
 
     def dect_networks_associated_with_workspace(self, workspace_id: str,
@@ -838,7 +838,7 @@ class DECTDevicesApi(ApiChild, base='telephony/config'):
             params['orgId'] = org_id
         url = self.ep(f'workspaces/{workspace_id}/dectNetworks')
         data = super().get(url, params=params)
-        r = TypeAdapter(list[AssignedDectNetwork]).validate_python(data['dectNetworks'])
+        r = type_adapter(list[AssignedDectNetwork]).validate_python(data['dectNetworks'])
         return r
 
     def dect_networks_associated_with_virtual_line(self, virtual_line_id: str,
@@ -866,7 +866,7 @@ class DECTDevicesApi(ApiChild, base='telephony/config'):
 
         url = self.ep(f'virtualLines/{virtual_line_id}/dectNetworks')
         data = super().get(url, params=params)
-        r = TypeAdapter(list[AssignedDectNetwork]).validate_python(data['dectNetworks'])
+        r = type_adapter(list[AssignedDectNetwork]).validate_python(data['dectNetworks'])
         return r
 
     def available_members(self, member_name: str = None, phone_number: str = None, extension: str = None,
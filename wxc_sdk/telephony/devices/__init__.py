@@ -6,12 +6,12 @@ from collections.abc import Generator
 from io import BufferedReader
 from typing import Optional, Union, Any
 
-from pydantic import TypeAdapter, Field, field_validator, field_serializer
+from pydantic import Field, field_validator, field_serializer
 from requests_toolbelt import MultipartEncoder
 
 from ..jobs import LineKeyTemplateAdvisoryTypes
 from ...api_child import ApiChild
-from ...base import ApiModel, plus1, to_camel, enum_str
+from ...base import ApiModel, plus1, to_camel, enum_str, type_adapter
 from ...base import SafeEnum as Enum
 from ...common import PrimaryOrShared, UserType, ValidationStatus, DeviceCustomization, IdAndName, \
     ApplyLineKeyTemplateAction, UserLicenseType
@@ -727,7 +727,7 @@ class TelephonyDevicesApi(ApiChild, base='telephony/config'):
             params['orgId'] = org_id
         url = self.ep('devices/lineKeyTemplates')
         data = super().get(url, params=params)
-        r = TypeAdapter(list[LineKeyTemplate]).validate_python(data['lineKeyTemplates'])
+        r = type_adapter(list[LineKeyTemplate]).validate_python(data['lineKeyTemplates'])
         return r
 
     def line_key_template_details(self, template_id: str, org_id: str = None) -> LineKeyTemplate:
@@ -1130,9 +1130,9 @@ class TelephonyDevicesApi(ApiChild, base='telephony/config'):
         if org_id is not None:
             params['orgId'] = org_id
         body = dict()
-        body['backgroundImages'] = TypeAdapter(list[DeleteImageRequestObject]).dump_python(background_images,
-                                                                                           mode='json', by_alias=True,
-                                                                                           exclude_none=True)
+        body['backgroundImages'] = type_adapter(list[DeleteImageRequestObject]).dump_python(background_images,
+                                                                                            mode='json', by_alias=True,
+                                                                                            exclude_none=True)
         url = self.ep('devices/backgroundImages')
         data = super().delete(url, params=params, json=body)
         r = DeleteDeviceBackgroundImagesResponse.model_validate(data)
@@ -7,10 +7,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List, Union
 
-from pydantic import Field, TypeAdapter
+from pydantic import Field
 
 from ...api_child import ApiChild
-from ...base import ApiModel, enum_str
+from ...base import ApiModel, enum_str, type_adapter
 from ...common import DeviceCustomization, ApplyLineKeyTemplateAction
 from ...rest import RestSession
 
@@ -184,7 +184,7 @@ class DeviceSettingsJobsApi(ApiChild, base='telephony/config/jobs/devices/callDe
         :rtype: StartJobResponse
         """
         url = self.ep()
-        params = org_id and {'prgId': org_id} or None
+        params = org_id and {'orgId': org_id} or None
         body = {}
         if location_id:
             body['locationId'] = location_id
@@ -426,8 +426,8 @@ class ManageNumbersJobsApi(ApiChild, base='telephony/config/jobs/numbers'):
             body['targetLocationId'] = target_location_id
         if number_usage_type is not None:
             body['numberUsageType'] = number_usage_type
-        body['numberList'] = TypeAdapter(list[NumberItem]).dump_python(number_list, mode='json', by_alias=True,
-                                                                       exclude_none=True)
+        body['numberList'] = type_adapter(list[NumberItem]).dump_python(number_list, mode='json', by_alias=True,
+                                                                        exclude_none=True)
         url = self.ep('manageNumbers')
         data = super().post(url=url, json=body)
         return NumberJob.model_validate(data)
@@ -642,7 +642,7 @@ class ApplyLineKeyTemplatesJobsApi(ApiChild, base='telephony/config/jobs/devices
             params['orgId'] = org_id
         url = self.ep()
         data = super().get(url, params=params)
-        r = TypeAdapter(list[ApplyLineKeyTemplateJobDetails]).validate_python(data['items'])
+        r = type_adapter(list[ApplyLineKeyTemplateJobDetails]).validate_python(data['items'])
         return r
 
     def status(self, job_id: str, org_id: str = None) -> ApplyLineKeyTemplateJobDetails:
@@ -754,7 +754,7 @@ class RebuildPhonesJobsApi(ApiChild, base='telephony/config/jobs/devices/rebuild
             params['orgId'] = org_id
         url = self.ep()
         data = super().get(url, params=params)
-        r = TypeAdapter(list[StartJobResponse]).validate_python(data['items'])
+        r = type_adapter(list[StartJobResponse]).validate_python(data['items'])
         return r
 
     def status(self, job_id: str, org_id: str = None) -> StartJobResponse:
@@ -1297,8 +1297,8 @@ class MoveUsersJobsApi(ApiChild, base='telephony/config/jobs/person/moveLocation
         if org_id is not None:
             params['orgId'] = org_id
         body = dict()
-        body['usersList'] = TypeAdapter(list[MoveUsersList]).dump_python(users_list, mode='json', by_alias=True,
-                                                                         exclude_none=True)
+        body['usersList'] = type_adapter(list[MoveUsersList]).dump_python(users_list, mode='json', by_alias=True,
+                                                                          exclude_none=True)
         url = self.ep()
         data = super().post(url, params=params, json=body)
         r = StartMoveUsersJobResponse.model_validate(data['response'])
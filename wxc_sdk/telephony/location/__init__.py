@@ -2,7 +2,7 @@ from collections.abc import Generator
 from dataclasses import dataclass
 from typing import Optional, List
 
-from pydantic import Field, TypeAdapter
+from pydantic import Field
 
 from .emergency_services import LocationEmergencyServicesApi
 from .intercept import LocationInterceptApi
@@ -12,7 +12,7 @@ from .numbers import LocationNumbersApi
 from .receptionist_contacts import ReceptionistContactsDirectoryApi
 from .vm import LocationVoicemailSettingsApi
 from ...api_child import ApiChild
-from ...base import ApiModel, to_camel, enum_str
+from ...base import ApiModel, to_camel, enum_str, type_adapter
 from ...base import SafeEnum as Enum
 from ...common import ValidateExtensionsResponse, RouteType, DeviceCustomization, UserType, IdAndName
 from ...locations import Location
@@ -711,7 +711,7 @@ class TelephonyLocationApi(ApiChild, base='telephony/config/locations'):
             params['orgId'] = org_id
         url = self.ep(f'locations/{location_id}/receptionistContacts/directories')
         data = super().get(url, params=params)
-        r = TypeAdapter(list[IdAndName]).validate_python(data['directories'])
+        r = type_adapter(list[IdAndName]).validate_python(data['directories'])
         return r
 
     def receptionist_contact_directory_details(self, location_id: str, directory_id: str,
@@ -774,7 +774,7 @@ class TelephonyLocationApi(ApiChild, base='telephony/config/locations'):
             params['personId'] = person_id
         url = self.ep(f'locations/{location_id}/receptionistContacts/directories/{directory_id}')
         data = super().get(url, params=params)
-        r = TypeAdapter(list[ContactDetails]).validate_python(data['contacts'])
+        r = type_adapter(list[ContactDetails]).validate_python(data['contacts'])
         return r
 
     def delete_receptionist_contact_directory(self, location_id: str, directory_id: str, org_id: str = None):
@@ -2,10 +2,10 @@ from collections.abc import Generator
 from datetime import datetime, time, date
 from typing import Optional, Union, List, Annotated
 
-from pydantic import TypeAdapter, PlainSerializer
+from pydantic import PlainSerializer
 
 from wxc_sdk.api_child import ApiChild
-from wxc_sdk.base import ApiModel
+from wxc_sdk.base import ApiModel, type_adapter
 from wxc_sdk.base import SafeEnum as Enum
 from wxc_sdk.common import IdAndName
 from wxc_sdk.common.schedules import ScheduleLevel
@@ -536,5 +536,5 @@ class OperatingModesApi(ApiChild, base='telephony/config'):
             params['orgId'] = org_id
         url = self.ep(f'locations/{location_id}/operatingModes/availableOperatingModes')
         data = super().get(url, params=params)
-        r = TypeAdapter(list[IdAndName]).validate_python(data['operatingModes'])
+        r = type_adapter(list[IdAndName]).validate_python(data['operatingModes'])
         return r
@@ -1,10 +1,8 @@
 from datetime import datetime
 from typing import Optional, List
 
-from pydantic import TypeAdapter
-
 from wxc_sdk.api_child import ApiChild
-from wxc_sdk.base import ApiModel
+from wxc_sdk.base import ApiModel, type_adapter
 from wxc_sdk.common import IdAndName
 
 __all__ = ['PlaylistAnnouncement', 'PlayListApi', 'PlayList']
@@ -84,7 +82,7 @@ class PlayListApi(ApiChild, base='telephony/config/announcements/playlists'):
             params['orgId'] = org_id
         url = self.ep()
         data = super().get(url, params=params)
-        r = TypeAdapter(list[PlayList]).validate_python(data['playlists'])
+        r = type_adapter(list[PlayList]).validate_python(data['playlists'])
         return r
 
     def create(self, name: str, announcement_ids: List[str], org_id: str = None) -> str:
@@ -205,7 +203,7 @@ class PlayListApi(ApiChild, base='telephony/config/announcements/playlists'):
             params['orgId'] = org_id
         url = self.ep(f'{play_list_id}/locations')
         data = super().get(url, params=params)
-        r = TypeAdapter(list[IdAndName]).validate_python(data['locations'])
+        r = type_adapter(list[IdAndName]).validate_python(data['locations'])
         return r
 
     def modify_assigned_locations(self, play_list_id: str, location_ids: List[str], org_id: str = None):
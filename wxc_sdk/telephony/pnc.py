@@ -2,9 +2,8 @@
 Private network connect API
 """
 
-from pydantic import TypeAdapter
-
 from ..api_child import ApiChild
+from ..base import type_adapter
 from ..base import SafeEnum as Enum
 
 __all__ = ['NetworkConnectionType', 'PrivateNetworkConnectApi']
@@ -46,7 +45,7 @@ class PrivateNetworkConnectApi(ApiChild, base='telephony/config/locations'):
         params = org_id and {'orgId': org_id} or None
         url = self.session.ep(f'telephony/config/locations/{location_id}/privateNetworkConnect')
         data = self.get(url, params=params)
-        return TypeAdapter(NetworkConnectionType).validate_python(data['networkConnectionType'])
+        return type_adapter(NetworkConnectionType).validate_python(data['networkConnectionType'])
 
     def update(self, location_id: str, connection_type: NetworkConnectionType, org_id: str = None):
         """
@@ -2,10 +2,10 @@ from collections.abc import Generator
 from dataclasses import dataclass
 from typing import List
 
-from pydantic import Field, TypeAdapter
+from pydantic import Field
 
 from ...api_child import ApiChild
-from ...base import to_camel, ApiModel
+from ...base import to_camel, ApiModel, type_adapter
 from ...common import IdAndName, PatternAction
 
 __all__ = ['RouteListDetail', 'RouteList', 'NumberAndAction', 'UpdateNumbersResponse', 'RouteListApi']
@@ -245,13 +245,13 @@ class RouteListApi(ApiChild, base='telephony/config/premisePstn/routeLists'):
 
         body = dict()
         if numbers is not None:
-            body['numbers'] = TypeAdapter(list[NumberAndAction]).dump_python(numbers, mode='json', by_alias=True,
-                                                                             exclude_none=True)
+            body['numbers'] = type_adapter(list[NumberAndAction]).dump_python(numbers, mode='json', by_alias=True,
+                                                                              exclude_none=True)
         if delete_all_numbers is not None:
             body['deleteAllNumbers'] = delete_all_numbers
         data = self.put(url=url, params=params, json=body)
         if data:
-            return TypeAdapter(list[UpdateNumbersResponse]).validate_python(data['numberStatus'])
+            return type_adapter(list[UpdateNumbersResponse]).validate_python(data['numberStatus'])
         else:
             return []
 
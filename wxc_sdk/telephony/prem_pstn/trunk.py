@@ -2,11 +2,11 @@ from collections.abc import Generator
 from dataclasses import dataclass
 from typing import List, Any, Optional
 
-from pydantic import Field, TypeAdapter
+from pydantic import Field
 
 from ...api_child import ApiChild
 from ...base import SafeEnum as Enum
-from ...base import to_camel, ApiModel
+from ...base import to_camel, ApiModel, type_adapter
 from ...common import Customer, IdAndName
 
 __all__ = ['TrunkType', 'Trunk', 'TrunkDeviceType', 'TrunkTypeWithDeviceType', 'DeviceStatus',
@@ -318,7 +318,7 @@ class TrunkApi(ApiChild, base='telephony/config/premisePstn/trunks'):
         params = org_id and {'orgId': org_id} or None
         ep = self.ep('trunkTypes')
         data = self.get(url=ep, params=params)
-        return TypeAdapter(list[TrunkTypeWithDeviceType]).validate_python(data['trunkTypes'])
+        return type_adapter(list[TrunkTypeWithDeviceType]).validate_python(data['trunkTypes'])
 
     def usage(self, trunk_id: str, org_id: str = None) -> TrunkUsage:
         """
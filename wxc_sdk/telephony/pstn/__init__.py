@@ -1,9 +1,7 @@
 from typing import Optional
 
-from pydantic import TypeAdapter
-
 from wxc_sdk.api_child import ApiChild
-from wxc_sdk.base import ApiModel
+from wxc_sdk.base import ApiModel, type_adapter
 from wxc_sdk.base import SafeEnum as Enum
 
 __all__ = ['PSTNServiceType', 'PSTNConnectionOption', 'PSTNType', 'PSTNApi']
@@ -90,7 +88,7 @@ class PSTNApi(ApiChild, base='telephony/pstn/locations'):
             params['orgId'] = org_id
         url = self.ep(f'{location_id}/connectionOptions')
         data = super().get(url, params=params)
-        r = TypeAdapter(list[PSTNConnectionOption]).validate_python(data['items'])
+        r = type_adapter(list[PSTNConnectionOption]).validate_python(data['items'])
         return r
 
     def configure(self, location_id: str, id: str = None, premise_route_type: str = None,
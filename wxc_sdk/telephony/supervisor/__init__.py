@@ -1,10 +1,8 @@
 from collections.abc import Generator
 from typing import Optional, List
 
-from pydantic import TypeAdapter
-
 from wxc_sdk.api_child import ApiChild
-from wxc_sdk.base import ApiModel
+from wxc_sdk.base import ApiModel, type_adapter
 from wxc_sdk.common import PatternAction, UserType
 
 __all__ = ['SupervisorApi', 'IdAndAction',
@@ -312,12 +310,12 @@ class SupervisorApi(ApiChild, base='telephony/config/supervisors'):
         if has_cx_essentials is not None:
             params['hasCxEssentials'] = str(has_cx_essentials).lower()
         body = dict()
-        body['agents'] = TypeAdapter(list[IdAndAction]).dump_python(agents, mode='json', by_alias=True)
+        body['agents'] = type_adapter(list[IdAndAction]).dump_python(agents, mode='json', by_alias=True)
         url = self.ep(supervisor_id)
         data = super().put(url, params=params, json=body)
         if not data:
             return None
-        r = TypeAdapter(List[SupervisorAgentStatus]).validate_python(data['supervisorAgentStatus'])
+        r = type_adapter(List[SupervisorAgentStatus]).validate_python(data['supervisorAgentStatus'])
         return r
 
     def available_agents(self, name: str = None, phone_number: str = None, order: str = None,
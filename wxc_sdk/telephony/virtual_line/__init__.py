@@ -2,10 +2,8 @@ from collections.abc import Generator
 from dataclasses import dataclass
 from typing import Optional
 
-from pydantic import TypeAdapter
-
 from ...api_child import ApiChild
-from ...base import ApiModel
+from ...base import ApiModel, type_adapter
 from ...common import PrimaryOrShared, AssignedDectNetwork, UserNumber
 from ...locations import LocationAddress
 from ...person_settings import TelephonyDevice, AvailableNumbersApi
@@ -441,7 +439,7 @@ class VirtualLinesApi(ApiChild, base='telephony/config/virtualLines'):
             params['orgId'] = org_id
         url = self.ep(f'{virtual_line_id}/dectNetworks')
         data = super().get(url, params=params)
-        r = TypeAdapter(list[AssignedDectNetwork]).validate_python(data['dectNetworks'])
+        r = type_adapter(list[AssignedDectNetwork]).validate_python(data['dectNetworks'])
         return r
 
     def list(self, org_id: str = None, location_id: list[str] = None,
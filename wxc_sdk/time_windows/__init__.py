@@ -0,0 +1,359 @@
+"""
+Windowed parallel fetch for list endpoints which take a time range
+
+A number of list endpoints take a time range (``from_``/``to_``) and are walked with a single serial pagination chain:
+
+* :meth:`api.admin_audit.list_events <wxc_sdk.admin_audit.AdminAuditEventsApi.list_events>`
+* :meth:`api.events.list <wxc_sdk.events.EventsApi.list>`
+* :meth:`api.meetings.list <wxc_sdk.meetings.MeetingsApi.list>`
+* :meth:`api.meetings.recordings.list_recordings <wxc_sdk.meetings.recordings.MeetingRecordingsApi.list_recordings>`
+* :meth:`api.converged_recordings.list <wxc_sdk.converged_recordings.ConvergedRecordingsApi.list>`
+
+:class:`AsWindowedFetcher` splits the time range into windows, paginates multiple windows concurrently using the
+async API and merges the results in time order.
+
+Example:
+
+    .. code-block:: python
+
+        async with AsWebexSimpleApi() as api:
+            fetcher = AsWindowedFetcher(list_gen=partial(api.admin_audit.list_events_gen, org_id=org_id),
+                                        time_key=lambda e: e.created, descending=True)
+            async for event in fetcher.fetch(from_=from_, to_=to_):
+                ...
+"""
+import asyncio
+import heapq
+import logging
+from collections.abc import AsyncGenerator, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Union
+
+from dateutil.parser import isoparse
+
+from wxc_sdk.base import dt_iso_str
+
+__all__ = ['TimeWindow', 'split_time_range', 'WindowPlanner', 'AsWindowedFetcher', 'as_utc']
+
+log = logging.getLogger(__name__)
+
+# callable returning the timestamp of an item
+TimeKey = Callable[[Any], datetime]
+
+# async generator method taking from_ and to_ parameters, for example api.admin_audit.list_events_gen
+AsTimeRangeListGen = Callable[..., AsyncGenerator[Any, None]]
+
+
+def as_utc(dt: Union[str, datetime]) -> datetime:
+    """
+    Normalize a datetime or ISO string to a timezone aware datetime in UTC. Naive datetimes are assumed to be UTC
+
+    :param dt: datetime or ISO 8601 string
+    :return: timezone aware datetime
+    """
+    if isinstance(dt, str):
+        dt = isoparse(dt)
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """
+    A half-open time window [start, end)
+    """
+    #: start of the window (inclusive)
+    start: datetime
+    #: end of the window (exclusive)
+    end: datetime
+
+    @property
+    def duration(self) -> timedelta:
+        return self.end - self.start
+
+    def contains(self, dt: datetime, end_inclusive: bool = False) -> bool:
+        """
+        Check if a timestamp is in the window
+
+        :param dt: timestamp to check
+        :param end_inclusive: treat the window as closed interval [start, end]
+        """
+        dt = as_utc(dt)
+        if end_inclusive:
+            return self.start <= dt <= self.end
+        return self.start <= dt < self.end
+
+
+def split_time_range(from_: Union[str, datetime], to_: Union[str, datetime], windows: int) -> list[TimeWindow]:
+    """
+    Split a time range into a number of equally sized windows
+
+    :param from_: start of range
+    :param to_: end of range
+    :param windows: number of windows
+    :return: list of windows in ascending order
+    """
+    from_ = as_utc(from_)
+    to_ = as_utc(to_)
+    if to_ <= from_:
+        raise ValueError('to_ has to be after from_')
+    windows = max(1, windows)
+    step = (to_ - from_) / windows
+    bounds = [from_ + step * i for i in range(windows)] + [to_]
+    return [TimeWindow(start=s, end=e) for s, e in zip(bounds, bounds[1:])]
+
+
+@dataclass(init=False, repr=False)
+class WindowPlanner:
+    """
+    Lazily plan time windows covering a time range. The size of each new window is adapted to the item density
+    observed in completed windows so that each window yields roughly :attr:`target_items` items.
+    """
+    #: start of the range
+    from_: datetime
+    #: end of the range
+    to_: datetime
+    #: plan windows from newest to oldest
+    descending: bool
+    #: desired number of items per window; None disables adaptation
+    target_items: Optional[int]
+    #: minimum window size
+    min_window: timedelta
+    #: maximum window size
+    max_window: timedelta
+    #: size of the last window planned
+    _size: timedelta
+    #: boundary up to which windows have been planned
+    _frontier: datetime
+    #: observed items and seconds in completed windows
+    _observed_items: int
+    _observed_seconds: float
+
+    def __init__(self, *, from_: Union[str, datetime], to_: Union[str, datetime], windows: int = 8,
+                 descending: bool = False, target_items: Optional[int] = None,
+                 min_window: timedelta = timedelta(minutes=1), max_window: timedelta = None):
+        """
+
+        :param from_: start of the range
+        :param to_: end of the range
+        :param windows: number of windows the range is initially split into
+        :param descending: plan windows from newest to oldest
+        :param target_items: desired number of items per window. If set, then window sizes are adapted based on the
+            observed density
+        :param min_window: minimum window size
+        :param max_window: maximum window size. Default: no limit
+        """
+        self.from_ = as_utc(from_)
+        self.to_ = as_utc(to_)
+        if self.to_ <= self.from_:
+            raise ValueError('to_ has to be after from_')
+        self.descending = descending
+        self.target_items = target_items
+        self.min_window = min_window
+        self.max_window = max_window or self.to_ - self.from_
+        self._size = max(min_window, (self.to_ - self.from_) / max(1, windows))
+        self._frontier = self.to_ if descending else self.from_
+        self._observed_items = 0
+        self._observed_seconds = 0.0
+
+    @property
+    def done(self) -> bool:
+        """
+        True if the complete range has been planned
+        """
+        return self._frontier == (self.from_ if self.descending else self.to_)
+
+    def observe(self, window: TimeWindow, items: int):
+        """
+        Record the number of items observed in a completed window
+
+        :param window: completed window
+        :param items: number of items in that window
+        """
+        self._observed_items += items
+        self._observed_seconds += window.duration.total_seconds()
+
+    def _next_size(self) -> timedelta:
+        if not self.target_items or not self._observed_seconds:
+            return self._size
+        if not self._observed_items:
+            # nothing seen so far: grow windows
+            size = self._size * 2
+        else:
+            density = self._observed_items / self._observed_seconds
+            size = timedelta(seconds=self.target_items / density)
+        return max(self.min_window, min(self.max_window, size))
+
+    def next_window(self) -> Optional[TimeWindow]:
+        """
+        Plan the next window
+
+        :return: next window or None if the complete range has been planned
+        """
+        if self.done:
+            return None
+        self._size = self._next_size()
+        if self.descending:
+            start = max(self.from_, self._frontier - self._size)
+            window = TimeWindow(start=start, end=self._frontier)
+            self._frontier = start
+        else:
+            end = min(self.to_, self._frontier + self._size)
+            window = TimeWindow(start=self._frontier, end=end)
+            self._frontier = end
+        return window
+
+
+# sentinel to signal the end of a window
+_EOW = object()
+
+
+@dataclass(init=False, repr=False)
+class _ActiveWindow:
+    """
+    A window which is currently being fetched
+    """
+    seq: int
+    window: TimeWindow
+    queue: asyncio.Queue
+    task: asyncio.Task
+    items: int = 0
+
+
+@dataclass(init=False, repr=False)
+class AsWindowedFetcher:
+    """
+    Fetch items from a list endpoint taking a time range by paginating multiple time windows concurrently. Results of
+    all windows are merged in time order using a heap based k-way merge.
+    """
+    #: async generator taking from_ and to_ parameters
+    list_gen: AsTimeRangeListGen
+    #: callable returning the timestamp of an item
+    time_key: TimeKey
+    #: number of windows the range is initially split into
+    windows: int
+    #: maximum number of windows fetched concurrently
+    concurrency: int
+    #: endpoint returns (and fetcher yields) newest items first
+    descending: bool
+    #: desired number of items per window for adaptive window sizing
+    target_items: Optional[int]
+    #: minimum window size
+    min_window: timedelta
+    #: maximum window size
+    max_window: Optional[timedelta]
+    #: maximum number of prefetched items per window
+    prefetch: int
+
+    def __init__(self, *, list_gen: AsTimeRangeListGen, time_key: TimeKey, windows: int = 8,
+                 concurrency: int = None, descending: bool = False, target_items: Optional[int] = None,
+                 min_window: timedelta = timedelta(minutes=1), max_window: timedelta = None, prefetch: int = 1000):
+        """
+
+        :param list_gen: async generator taking from_ and to_ parameters, for example
+            ``partial(api.admin_audit.list_events_gen, org_id=org_id)``
+        :param time_key: callable returning the timestamp of an item, for example ``lambda e: e.created``
+        :param windows: number of windows the range is initially split into
+        :param concurrency: maximum number of windows fetched concurrently. Default: number of windows
+        :param descending: yield newest items first; windows are planned from newest to oldest
+        :param target_items: desired number of items per window. If set, then the size of new windows is adapted to
+            the item density observed in completed windows
+        :param min_window: minimum window size
+        :param max_window: maximum window size
+        :param prefetch: maximum number of prefetched items per window. Limits memory consumption
+        """
+        self.list_gen = list_gen
+        self.time_key = time_key
+        self.windows = windows
+        self.concurrency = concurrency or windows
+        self.descending = descending
+        self.target_items = target_items
+        self.min_window = min_window
+        self.max_window = max_window
+        self.prefetch = prefetch
+
+    def _sort_key(self, item: Any) -> float:
+        ts = as_utc(self.time_key(item)).timestamp()
+        return -ts if self.descending else ts
+
+    async def _fetch_window(self, window: TimeWindow, queue: asyncio.Queue, last: bool):
+        """
+        Fetch all items in one window and put them in the queue. The window is treated as half-open so that items
+        on window boundaries are not returned twice
+        """
+        try:
+            async for item in self.list_gen(from_=dt_iso_str(window.start), to_=dt_iso_str(window.end)):
+                if not window.contains(self.time_key(item), end_inclusive=last):
+                    continue
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(e)
+        finally:
+            await queue.put(_EOW)
+
+    async def fetch(self, from_: Union[str, datetime], to_: Union[str, datetime]) -> AsyncGenerator[Any, None]:
+        """
+        Fetch all items in the given time range
+
+        :param from_: start of the time range
+        :param to_: end of the time range
+        :return: yields items in time order (newest first if :attr:`descending`)
+        """
+        planner = WindowPlanner(from_=from_, to_=to_, windows=self.windows, descending=self.descending,
+                                target_items=self.target_items, min_window=self.min_window,
+                                max_window=self.max_window)
+        range_end = planner.to_
+        active: dict[int, _ActiveWindow] = dict()
+        heap: list[tuple[float, int, int, Any]] = []
+        # windows which currently don't have an entry in the heap
+        need_head: set[int] = set()
+        seq = 0
+        item_seq = 0
+
+        def start_windows():
+            nonlocal seq
+            while len(active) < self.concurrency and (window := planner.next_window()) is not None:
+                aw = _ActiveWindow()
+                aw.seq = seq
+                aw.window = window
+                aw.items = 0
+                aw.queue = asyncio.Queue(maxsize=self.prefetch)
+                aw.task = asyncio.create_task(self._fetch_window(window, aw.queue, last=window.end == range_end))
+                log.debug(f'fetch: started window {seq}: {window.start} - {window.end}')
+                active[seq] = aw
+                need_head.add(seq)
+                seq += 1
+
+        try:
+            start_windows()
+            while active:
+                # make sure that each active window has its next item in the heap
+                for window_seq in sorted(need_head):
+                    aw = active[window_seq]
+                    item = await aw.queue.get()
+                    if isinstance(item, Exception):
+                        raise item
+                    if item is _EOW:
+                        log.debug(f'fetch: window {window_seq} done, {aw.items} items')
+                        planner.observe(aw.window, aw.items)
+                        del active[window_seq]
+                    else:
+                        aw.items += 1
+                        heapq.heappush(heap, (self._sort_key(item), window_seq, item_seq, item))
+                        item_seq += 1
+                need_head.clear()
+                if len(active) < self.concurrency and not planner.done:
+                    # windows are done: start new windows and get their heads before yielding anything
+                    start_windows()
+                    continue
+                if not heap:
+                    continue
+                _, window_seq, _, item = heapq.heappop(heap)
+                if window_seq in active:
+                    need_head.add(window_seq)
+                yield item
+        finally:
+            for aw in active.values():
+                aw.task.cancel()
@@ -0,0 +1,229 @@
+"""
+Bulk export of meeting transcripts for compliance officers
+
+:class:`AsTranscriptExporter` walks
+:meth:`api.meetings.transcripts.list_compliance_officer_gen
+<wxc_sdk.as_api.AsMeetingTranscriptsApi.list_compliance_officer_gen>` over a date range and downloads all transcripts
+to a directory:
+
+* the date range is split into windows; transcripts are listed lazily window by window
+* transcripts are downloaded concurrently and streamed to disk: memory use does not depend on the size of
+  transcripts. Only the ids of the transcripts in the current and previous window and the ids of transcripts
+  downloaded successfully (see below) are kept in memory
+* each completed (or failed) download is appended to a manifest (JSON lines): :class:`TranscriptManifest`. When
+  exporting again with the same manifest, transcripts which were downloaded before are skipped and failed downloads
+  are retried. An interrupted export can simply be restarted
+
+Example:
+
+    .. code-block:: python
+
+        async with AsWebexSimpleApi(tokens=token) as api:
+            exporter = AsTranscriptExporter(api, site_url='company.webex.com', directory='legal_hold/2024q1')
+            report = await exporter.export(from_=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                                           to_=datetime(2024, 4, 1, tzinfo=timezone.utc))
+            print(f'{report.downloaded} downloaded, {report.skipped} skipped, {report.failed} failed')
+"""
+import asyncio
+import json
+import logging
+import os
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.base import ApiModel
+from wxc_sdk.meetings.transcripts import Transcript
+
+__all__ = ['ManifestEntry', 'TranscriptManifest', 'ExportReport', 'AsTranscriptExporter']
+
+log = logging.getLogger(__name__)
+
+
+class ManifestEntry(ApiModel):
+    """
+    Result of the download of one transcript
+    """
+    transcript_id: str
+    meeting_id: Optional[str] = None
+    meeting_topic: Optional[str] = None
+    start_time: Optional[str] = None
+    host_user_id: Optional[str] = None
+    #: path of the downloaded file relative to the export directory
+    path: Optional[str] = None
+    #: size of the downloaded file in bytes
+    size: Optional[int] = None
+    #: error message if the download failed
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class TranscriptManifest:
+    """
+    Manifest of an export: JSON lines file with one :class:`ManifestEntry` per download attempt. Only the ids of
+    successfully downloaded transcripts are kept in memory
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        #: ids of transcripts downloaded successfully
+        self.done: set[str] = set()
+        try:
+            with open(path, mode='r') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = ManifestEntry.model_validate(json.loads(line))
+                    except ValueError:
+                        # last line of an interrupted export might be incomplete
+                        log.warning(f'{path}: ignoring invalid manifest line')
+                        continue
+                    if entry.ok:
+                        self.done.add(entry.transcript_id)
+        except FileNotFoundError:
+            pass
+
+    def record(self, entry: ManifestEntry):
+        """
+        Append an entry to the manifest
+        """
+        if entry.ok:
+            self.done.add(entry.transcript_id)
+        with open(self.path, mode='a') as f:
+            f.write(f'{entry.model_dump_json(exclude_none=True)}\n')
+
+
+@dataclass
+class ExportReport:
+    """
+    Result of an export
+    """
+    #: number of transcripts downloaded
+    downloaded: int = 0
+    #: number of transcripts skipped because they were downloaded before
+    skipped: int = 0
+    #: number of failed downloads
+    failed: int = 0
+    #: total number of bytes downloaded
+    bytes: int = 0
+
+
+class AsTranscriptExporter:
+    """
+    Export all transcripts of a site in a date range to a directory
+    """
+
+    def __init__(self, api: AsWebexSimpleApi, *, site_url: str, directory: str, format: str = 'vtt',
+                 concurrency: int = 10, window: timedelta = timedelta(days=7), manifest: str = None,
+                 chunk_size: int = 65536):
+        """
+        :param api: async API
+        :param site_url: URL of the Webex site
+        :param directory: target directory; created if needed
+        :param format: transcript format: vtt or txt
+        :param concurrency: maximum number of concurrent downloads
+        :param window: size of the time windows used to list transcripts
+        :param manifest: path of the manifest. Default: manifest.jsonl in the target directory
+        :param chunk_size: chunk size for streaming downloads
+        """
+        self.api = api
+        self.site_url = site_url
+        self.directory = directory
+        self.format = format
+        self.concurrency = concurrency
+        self.window = window
+        self.manifest_path = manifest or os.path.join(directory, 'manifest.jsonl')
+        self.chunk_size = chunk_size
+
+    async def transcripts(self, from_: datetime, to_: datetime) -> AsyncGenerator[Transcript, None]:
+        """
+        All transcripts in the date range, listed window by window
+
+        :param from_: start (inclusive)
+        :param to_: end (exclusive)
+        """
+        # consecutive windows can both return a transcript at the boundary; de-duplicating against the previous
+        # window is enough
+        previous, current = set(), set()
+        start = from_
+        while start < to_:
+            end = min(start + self.window, to_)
+            async for transcript in self.api.meetings.transcripts.list_compliance_officer_gen(
+                    site_url=self.site_url, from_=start.isoformat(), to_=end.isoformat()):
+                if transcript.id in previous or transcript.id in current:
+                    continue
+                current.add(transcript.id)
+                yield transcript
+            previous, current = current, set()
+            start = end
+
+    def file_name(self, transcript: Transcript) -> str:
+        """
+        Name of the file for a transcript, relative to the export directory
+        """
+        return f'{transcript.id}.{self.format}'
+
+    async def _download(self, transcript: Transcript) -> ManifestEntry:
+        entry = ManifestEntry(transcript_id=transcript.id, meeting_id=transcript.meeting_id,
+                              meeting_topic=transcript.meeting_topic, start_time=transcript.start_time,
+                              host_user_id=transcript.host_user_id)
+        name = self.file_name(transcript)
+        try:
+            size = await self.api.meetings.transcripts.download_to_file(transcript_id=transcript.id,
+                                                                        path=os.path.join(self.directory, name),
+                                                                        format=self.format,
+                                                                        chunk_size=self.chunk_size)
+        except Exception as e:
+            log.warning(f'download of transcript {transcript.id} failed: {e}')
+            entry.error = str(e) or e.__class__.__name__
+        else:
+            entry.path = name
+            entry.size = size
+        return entry
+
+    async def export(self, from_: datetime, to_: datetime) -> ExportReport:
+        """
+        Export all transcripts in the date range. Transcripts already recorded as downloaded in the manifest are
+        skipped
+
+        :param from_: start (inclusive)
+        :param to_: end (exclusive)
+        :return: report
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = TranscriptManifest(self.manifest_path)
+        report = ExportReport()
+        # bounded queue between listing and downloads: listing pauses while all workers are busy
+        queue: asyncio.Queue[Optional[Transcript]] = asyncio.Queue(maxsize=self.concurrency)
+
+        async def worker():
+            while (transcript := await queue.get()) is not None:
+                entry = await self._download(transcript)
+                manifest.record(entry)
+                if entry.ok:
+                    report.downloaded += 1
+                    report.bytes += entry.size
+                else:
+                    report.failed += 1
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        try:
+            async for transcript in self.transcripts(from_=from_, to_=to_):
+                if transcript.id in manifest.done:
+                    report.skipped += 1
+                    continue
+                await queue.put(transcript)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+        log.info(f'export {from_.isoformat()} - {to_.isoformat()}: {report}')
+        return report
@@ -0,0 +1,453 @@
+"""
+Webhook receiver: aiohttp based server for Webex webhook events
+
+:class:`WebhookReceiver` accepts webhook events posted by Webex and:
+
+* verifies the ``X-Spark-Signature`` header (HMAC-SHA1 of the body using the webhook secret):
+  :func:`verify_signature`
+* parses the body directly from bytes into a :class:`WebhookEvent <wxc_sdk.webhook.WebhookEvent>` (with the
+  resource specific :class:`WebhookEventData <wxc_sdk.webhook.WebhookEventData>` subclass): :func:`parse_event`
+* queues the event in a bounded queue. Worker tasks dispatch queued events to async handlers registered per resource
+  and event type: :meth:`WebhookReceiver.handler`
+* applies backpressure: if the queue is full the request waits up to ``enqueue_timeout`` seconds for a free slot and
+  is rejected with 503 after that, so that the sender can retry
+* acknowledges at least once: events are only acknowledged (2xx) after they have been queued; with
+  ``ack_after_processing=True`` only after all handlers succeeded
+* batches follow-up detail requests for messages and attachment actions through the async API:
+  :meth:`WebhookReceiver.message_details`, :meth:`WebhookReceiver.attachment_action_details`
+
+Example:
+
+    .. code-block:: python
+
+        async with AsWebexSimpleApi(tokens=bot_token) as api:
+            receiver = WebhookReceiver(secret=webhook_secret, api=api)
+
+            @receiver.handler(resource=WebhookResource.messages, event=WebhookEventType.created)
+            async def new_message(event: WebhookEvent):
+                message = await receiver.message_details(event.data.id)
+                print(f'{message.person_email}: {message.text}')
+
+            await receiver.start(host='0.0.0.0', port=6001)
+            ...
+            await receiver.stop()
+"""
+import asyncio
+import hashlib
+import hmac
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Generic, Optional, TypeVar, Union
+
+from aiohttp import web
+
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.attachment_actions import AttachmentAction
+from wxc_sdk.messages import Message
+from wxc_sdk.webhook import WebhookEvent, WebhookEventType, WebhookResource
+
+__all__ = ['SIGNATURE_HEADER', 'verify_signature', 'parse_event', 'EventHandler', 'DetailsBatcher',
+           'WebhookReceiver']
+
+log = logging.getLogger(__name__)
+
+#: header with the HMAC-SHA1 signature of the body
+SIGNATURE_HEADER = 'X-Spark-Signature'
+
+K = TypeVar('K', bound=Hashable)
+T = TypeVar('T')
+
+#: async handler for a webhook event
+EventHandler = Callable[[WebhookEvent], Awaitable[None]]
+
+
+def verify_signature(body: bytes, secret: Union[str, bytes], signature: Optional[str]) -> bool:
+    """
+    Verify the signature of a webhook event
+
+    :param body: raw body of the request
+    :param secret: secret of the webhook
+    :param signature: value of the ``X-Spark-Signature`` header
+    :return: True if the signature is valid
+    """
+    if not signature:
+        return False
+    if isinstance(secret, str):
+        secret = secret.encode()
+    expected = hmac.new(secret, body, hashlib.sha1).hexdigest()
+    return hmac.compare_digest(expected, signature.lower())
+
+
+def parse_event(body: Union[bytes, str]) -> WebhookEvent:
+    """
+    Parse a webhook event from the raw body.
+
+    :class:`WebhookEvent <wxc_sdk.webhook.WebhookEvent>` has a before-validator which works on a dict: the JSON body is
+    parsed into a dict first and then the ``data`` component is parsed with the
+    :class:`WebhookEventData <wxc_sdk.webhook.WebhookEventData>` subclass registered for the resource.
+
+    :param body: raw body of the request
+    :return: parsed event
+    """
+    return WebhookEvent.model_validate_json(body)
+
+
+@dataclass
+class _Pending(Generic[T]):
+    #: futures of all callers waiting for the same key
+    futures: list[asyncio.Future] = field(default_factory=list)
+
+
+class DetailsBatcher(Generic[K, T]):
+    """
+    Batch concurrent detail requests.
+
+    Requests are collected for up to ``window`` seconds (or until ``max_batch`` distinct keys are pending) and then
+    fetched concurrently with at most ``concurrency`` concurrent requests. Concurrent requests for the same key
+    (pending or already being fetched) are coalesced into a single fetch.
+    """
+
+    def __init__(self, fetch: Callable[[K], Awaitable[T]], window: float = 0.05, max_batch: int = 50,
+                 concurrency: int = 10):
+        """
+        :param fetch: async function to fetch details for one key, for example ``api.messages.details``
+        :param window: maximum time in seconds to wait for more requests before a batch is fetched
+        :param max_batch: maximum number of distinct keys in a batch
+        :param concurrency: maximum number of concurrent fetches
+        """
+        self._fetch = fetch
+        self.window = window
+        self.max_batch = max_batch
+        self._sem = asyncio.Semaphore(concurrency)
+        self._pending: dict[K, _Pending[T]] = dict()
+        self._in_flight: dict[K, _Pending[T]] = dict()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+        #: number of fetches
+        self.fetches = 0
+        #: number of requests
+        self.requests = 0
+
+    async def get(self, key: K) -> T:
+        """
+        Get details for a key
+
+        :param key: key, for example a message id
+        :return: details
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.requests += 1
+        if (in_flight := self._in_flight.get(key)) is not None:
+            in_flight.futures.append(future)
+            return await future
+        self._pending.setdefault(key, _Pending()).futures.append(future)
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self.flush)
+        return await future
+
+    def flush(self):
+        """
+        Start fetching all pending requests
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, dict()
+        if not batch:
+            return
+        log.debug(f'details batch: fetching {len(batch)} keys for '
+                  f'{sum(len(p.futures) for p in batch.values())} requests')
+        for key, pending in batch.items():
+            self._in_flight[key] = pending
+            task = asyncio.ensure_future(self._fetch_one(key, pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch_one(self, key: K, pending: _Pending[T]):
+        async with self._sem:
+            self.fetches += 1
+            try:
+                result = await self._fetch(key)
+            except Exception as e:
+                self._in_flight.pop(key, None)
+                for future in pending.futures:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+        self._in_flight.pop(key, None)
+        for future in pending.futures:
+            if not future.done():
+                future.set_result(result)
+
+    async def aclose(self):
+        """
+        Fetch all pending requests and wait for all fetches to complete
+        """
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+@dataclass
+class _QueuedEvent:
+    event: WebhookEvent
+    #: set if the request waits for the result of the handlers
+    done: Optional[asyncio.Future] = None
+
+
+class WebhookReceiver:
+    """
+    aiohttp based receiver for Webex webhook events with signature verification, bounded queueing and dispatch to
+    async handlers
+    """
+
+    def __init__(self, *, secret: Union[str, bytes] = None, api: AsWebexSimpleApi = None, path: str = '/webhook',
+                 queue_size: int = 1000, workers: int = 10, enqueue_timeout: float = 5.0,
+                 ack_after_processing: bool = False, max_attempts: int = 1, details_window: float = 0.05,
+                 details_batch: int = 50):
+        """
+        :param secret: webhook secret. If set, then requests without a valid ``X-Spark-Signature`` header are
+            rejected with 401
+        :param api: async API used for follow-up detail requests
+        :param path: path to accept POST requests on
+        :param queue_size: maximum number of queued events
+        :param workers: number of worker tasks dispatching events to handlers
+        :param enqueue_timeout: maximum time in seconds a request waits for a free slot in a full queue before it is
+            rejected with 503
+        :param ack_after_processing: only acknowledge events after all handlers completed; failed handlers result in
+            a 500 response
+        :param max_attempts: number of attempts to call a failing handler
+        :param details_window: batching window in seconds for follow-up detail requests
+        :param details_batch: maximum batch size for follow-up detail requests
+        """
+        self.secret = secret
+        self.api = api
+        self.path = path
+        self.queue_size = queue_size
+        self.workers = workers
+        self.enqueue_timeout = enqueue_timeout
+        self.ack_after_processing = ack_after_processing
+        self.max_attempts = max_attempts
+        self._details_args = dict(window=details_window, max_batch=details_batch)
+        self._handlers: dict[tuple[Optional[str], Optional[str]], list[EventHandler]] = dict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: list[asyncio.Task] = []
+        self._runner: Optional[web.AppRunner] = None
+        self._message_details: Optional[DetailsBatcher[str, Message]] = None
+        self._action_details: Optional[DetailsBatcher[str, AttachmentAction]] = None
+        #: number of events received (and queued)
+        self.received = 0
+        #: number of events rejected because of an invalid signature or body or because the queue was full
+        self.rejected = 0
+        #: number of events processed
+        self.processed = 0
+        #: number of events for which at least one handler failed
+        self.failed = 0
+
+    def handler(self, resource: Union[WebhookResource, str] = None,
+                event: Union[WebhookEventType, str] = None) -> Callable[[EventHandler], EventHandler]:
+        """
+        Decorator to register an async handler
+
+        :param resource: resource to register the handler for. Default: all resources
+        :param event: event type to register the handler for. Default: all event types
+        """
+
+        def decorator(func: EventHandler) -> EventHandler:
+            self.add_handler(func, resource=resource, event=event)
+            return func
+
+        return decorator
+
+    def add_handler(self, func: EventHandler, resource: Union[WebhookResource, str] = None,
+                    event: Union[WebhookEventType, str] = None):
+        """
+        Register an async handler
+
+        :param func: handler; called with the event
+        :param resource: resource to register the handler for. Default: all resources
+        :param event: event type to register the handler for. Default: all event types
+        """
+        key = (resource and WebhookResource(resource).value, event and WebhookEventType(event).value)
+        self._handlers.setdefault(key, []).append(func)
+
+    def handlers_for(self, event: WebhookEvent) -> list[EventHandler]:
+        """
+        All handlers registered for the resource and type of an event; most specific handlers first
+        """
+        resource, event_type = event.resource, event.event
+        return [h
+                for key in ((resource, event_type), (resource, None), (None, event_type), (None, None))
+                for h in self._handlers.get(key, [])]
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        """
+        The queue of events waiting to be dispatched
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+        return self._queue
+
+    def _batcher(self, fetch: Callable[[str], Awaitable[T]]) -> DetailsBatcher[str, T]:
+        if self.api is None:
+            raise ValueError('follow-up detail requests require an api')
+        return DetailsBatcher(fetch, concurrency=self.api.session.concurrent_requests, **self._details_args)
+
+    async def message_details(self, message_id: str) -> Message:
+        """
+        Get message details. Concurrent requests are batched and coalesced
+
+        :param message_id: message id, for example from :class:`MessagesData <wxc_sdk.messages.MessagesData>`
+        """
+        if self._message_details is None:
+            self._message_details = self._batcher(self.api.messages.details)
+        return await self._message_details.get(message_id)
+
+    async def attachment_action_details(self, action_id: str) -> AttachmentAction:
+        """
+        Get attachment action details. Concurrent requests are batched and coalesced
+
+        :param action_id: attachment action id
+        """
+        if self._action_details is None:
+            self._action_details = self._batcher(self.api.attachment_actions.details)
+        return await self._action_details.get(action_id)
+
+    async def dispatch(self, event: WebhookEvent) -> bool:
+        """
+        Call all handlers for an event
+
+        :param event: event
+        :return: True if all handlers succeeded
+        """
+        ok = True
+        for handler in self.handlers_for(event):
+            for attempt in range(1, self.max_attempts + 1):
+                try:
+                    await handler(event)
+                except Exception as e:
+                    log.warning(f'handler {handler.__name__} failed for {event.resource}/{event.event} event, '
+                                f'attempt {attempt}/{self.max_attempts}: {e}')
+                    if attempt == self.max_attempts:
+                        ok = False
+                else:
+                    break
+        self.processed += 1
+        self.failed += not ok
+        return ok
+
+    async def _worker(self):
+        queue = self.queue
+        while True:
+            queued: _QueuedEvent = await queue.get()
+            try:
+                ok = await self.dispatch(queued.event)
+            except asyncio.CancelledError:
+                if queued.done is not None and not queued.done.done():
+                    queued.done.cancel()
+                raise
+            else:
+                if queued.done is not None and not queued.done.done():
+                    queued.done.set_result(ok)
+            finally:
+                queue.task_done()
+
+    async def handle_request(self, request: web.Request) -> web.Response:
+        """
+        aiohttp request handler for webhook events
+        """
+        body = await request.read()
+        if self.secret is not None and not verify_signature(body, self.secret,
+                                                            request.headers.get(SIGNATURE_HEADER)):
+            self.rejected += 1
+            log.warning('webhook event with invalid signature rejected')
+            return web.Response(status=401)
+        try:
+            event = parse_event(body)
+        except ValueError as e:
+            self.rejected += 1
+            log.warning(f'invalid webhook event rejected: {e}')
+            return web.Response(status=400)
+        queued = _QueuedEvent(event=event)
+        if self.ack_after_processing:
+            queued.done = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait_for(self.queue.put(queued), timeout=self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            log.warning(f'webhook queue full ({self.queue.qsize()} events), event rejected')
+            return web.Response(status=503, headers={'Retry-After': '1'})
+        self.received += 1
+        if queued.done is None:
+            return web.Response(status=202)
+        ok = await queued.done
+        return web.Response(status=200 if ok else 500)
+
+    def start_workers(self):
+        """
+        Start the worker tasks; called when the application starts
+        """
+        if not self._worker_tasks:
+            self._worker_tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+
+    async def stop_workers(self, drain_timeout: float = 10.0):
+        """
+        Wait for queued events to be processed and stop the worker tasks; called when the application shuts down
+
+        :param drain_timeout: maximum time in seconds to wait for queued events
+        """
+        if self._queue is not None and self._worker_tasks:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                log.warning(f'{self._queue.qsize()} queued webhook events dropped on shutdown')
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        for batcher in (self._message_details, self._action_details):
+            if batcher is not None:
+                await batcher.aclose()
+
+    def app(self) -> web.Application:
+        """
+        aiohttp application accepting webhook events on :attr:`path`
+        """
+        app = web.Application()
+        app.router.add_post(self.path, self.handle_request)
+
+        async def on_startup(_):
+            self.start_workers()
+
+        async def on_cleanup(_):
+            await self.stop_workers()
+
+        app.on_startup.append(on_startup)
+        app.on_cleanup.append(on_cleanup)
+        return app
+
+    async def start(self, host: str = '0.0.0.0', port: int = 6001):
+        """
+        Start an aiohttp server for the application
+
+        :param host: host to listen on
+        :param port: port to listen on
+        """
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host=host, port=port)
+        await site.start()
+        log.info(f'webhook receiver listening on {host}:{port}{self.path}')
+
+    async def stop(self):
+        """
+        Stop the server started with :meth:`start`
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
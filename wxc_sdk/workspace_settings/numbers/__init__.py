@@ -3,10 +3,8 @@ Numbers API for Workspaces
 """
 from typing import Optional
 
-from pydantic import TypeAdapter
-
 from ...api_child import ApiChild
-from ...base import ApiModel
+from ...base import ApiModel, type_adapter
 from ...common import IdAndName, UserNumber, IdOnly, PatternAction, RingPattern
 
 __all__ = ['WorkspaceNumbers', 'UpdateWorkspacePhoneNumber', 'WorkspaceNumbersApi']
@@ -66,7 +64,7 @@ class WorkspaceNumbersApi(ApiChild, base='workspaces'):
         params = org_id and {'org_id': org_id} or None
         url = self.ep(workspace_id=workspace_id)
         data = self.get(url=url, params=params)
-        return TypeAdapter(WorkspaceNumbers).validate_python(data)
+        return type_adapter(WorkspaceNumbers).validate_python(data)
 
     def update(self, workspace_id: str,
                phone_numbers: list[UpdateWorkspacePhoneNumber],
@@ -104,8 +102,8 @@ class WorkspaceNumbersApi(ApiChild, base='workspaces'):
         body = dict()
         if distinctive_ring_enabled is not None:
             body['distinctiveRingEnabled'] = distinctive_ring_enabled
-        body['phoneNumbers'] = TypeAdapter(list[UpdateWorkspacePhoneNumber]).dump_python(phone_numbers, mode='json',
-                                                                                         by_alias=True,
-                                                                                         exclude_none=True)
+        body['phoneNumbers'] = type_adapter(list[UpdateWorkspacePhoneNumber]).dump_python(phone_numbers, mode='json',
+                                                                                          by_alias=True,
+                                                                                          exclude_none=True)
         url = self.session.ep(f'telephony/config/workspaces/{workspace_id}/numbers')
         super().put(url, params=params, json=body)
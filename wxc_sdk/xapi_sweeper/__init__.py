@@ -0,0 +1,280 @@
+"""
+Fleet status sweeps using xAPI
+
+:meth:`api.xapi.query_status <wxc_sdk.xapi.XApi.query_status>` queries one device at a time. :class:`AsXApiSweeper`
+queries a set of status paths on all devices of a fleet:
+
+* devices are grouped by connection status; only connected devices which support xAPI are queried
+* queries run with bounded concurrency and a timeout per device; slow or failing devices don't hold up a sweep
+* status results are flattened to dotted paths (``SystemUnit.Uptime``, ``Peripherals.ConnectedDevice[1001].Name``)
+  and kept in a last-state table: :class:`StatusTable`
+* each sweep reports only the values which changed since the previous sweep, together with the sweep duration:
+  :class:`SweepReport`
+
+Example:
+
+    .. code-block:: python
+
+        async with AsWebexSimpleApi(tokens=token, concurrent_requests=50) as api:
+            sweeper = AsXApiSweeper(api, paths=['SystemUnit.Uptime', 'Audio.Volume', 'Peripherals.ConnectedDevice'],
+                                    concurrency=50)
+            async for report in sweeper.run(interval=300):
+                print(f'{report.queried} devices in {report.duration:.1f}s, {len(report.changes)} changes')
+                for change in report.changes:
+                    print(change.device_id, change.path, change.old, '->', change.new)
+"""
+import asyncio
+import logging
+import sys
+import time
+from collections import defaultdict
+from collections.abc import AsyncGenerator, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.devices import ConnectionStatus, Device
+from wxc_sdk.fan_out import as_items_as_completed
+
+__all__ = ['MAX_STATUS_EXPRESSIONS', 'QUERY_STATES', 'flatten_status', 'StatusChange', 'StatusTable', 'SweepReport',
+           'AsXApiSweeper']
+
+log = logging.getLogger(__name__)
+
+#: maximum number of status expressions in a single xAPI status query
+MAX_STATUS_EXPRESSIONS = 10
+
+#: connection states of devices which get queried
+QUERY_STATES = frozenset((ConnectionStatus.connected, ConnectionStatus.connected_with_issues))
+
+
+def flatten_status(result: Any, prefix: str = '') -> dict[str, Any]:
+    """
+    Flatten an xAPI status result to a dict of dotted paths and scalar values.
+
+    List entries are identified by their ``id`` attribute if present, else by their position:
+    ``{'Peripherals': {'ConnectedDevice': [{'id': 1001, 'Name': 'Navigator'}]}}`` is flattened to
+    ``{'Peripherals.ConnectedDevice[1001].Name': 'Navigator'}``
+
+    :param result: xAPI status result
+    :param prefix: path prefix
+    :return: flattened result
+    """
+    flat = dict()
+    if isinstance(result, dict):
+        for key, value in result.items():
+            if key == 'id' and prefix.endswith(']'):
+                # already part of the path
+                continue
+            flat.update(flatten_status(value, f'{prefix}.{key}' if prefix else key))
+    elif isinstance(result, list):
+        for i, value in enumerate(result):
+            index = value.get('id', i) if isinstance(value, dict) else i
+            flat.update(flatten_status(value, f'{prefix}[{index}]'))
+    else:
+        flat[sys.intern(prefix)] = result
+    return flat
+
+
+@dataclass
+class StatusChange:
+    """
+    A changed status value
+    """
+    device_id: str
+    #: dotted status path
+    path: str
+    #: previous value; None if the value was not known before
+    old: Any
+    #: new value; None if the path does not exist anymore
+    new: Any
+
+
+class StatusTable:
+    """
+    Last known status values of all devices. Path strings are interned so that each path is only stored once for all
+    devices
+    """
+
+    def __init__(self):
+        self._state: dict[str, dict[str, Any]] = dict()
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    def __contains__(self, device_id: str) -> bool:
+        return device_id in self._state
+
+    def get(self, device_id: str) -> dict[str, Any]:
+        """
+        Last known status values of a device
+        """
+        return dict(self._state.get(device_id) or {})
+
+    def update(self, device_id: str, values: dict[str, Any]) -> list[StatusChange]:
+        """
+        Update the status values of a device
+
+        :param device_id: device id
+        :param values: flattened status values
+        :return: changes
+        """
+        old_values = self._state.get(device_id) or {}
+        changes = [StatusChange(device_id=device_id, path=path, old=old_values.get(path), new=value)
+                   for path, value in values.items()
+                   if path not in old_values or old_values[path] != value]
+        changes.extend(StatusChange(device_id=device_id, path=path, old=value, new=None)
+                       for path, value in old_values.items()
+                       if path not in values)
+        self._state[device_id] = values
+        return changes
+
+    def remove(self, device_id: str):
+        """
+        Remove a device
+        """
+        self._state.pop(device_id, None)
+
+
+@dataclass
+class SweepReport:
+    """
+    Result of a sweep
+    """
+    #: start of the sweep; :func:`time.time` value
+    started: float = 0.0
+    #: duration of the sweep in seconds
+    duration: float = 0.0
+    #: number of devices in the fleet
+    devices: int = 0
+    #: number of devices queried successfully
+    queried: int = 0
+    #: number of skipped devices by connection status
+    skipped: dict[str, int] = field(default_factory=dict)
+    #: failed devices: device id -> error message
+    failed: dict[str, str] = field(default_factory=dict)
+    #: changed values since the previous sweep
+    changes: list[StatusChange] = field(default_factory=list)
+
+
+class AsXApiSweeper:
+    """
+    Query xAPI status paths on all devices of a fleet and detect changes between sweeps
+    """
+
+    def __init__(self, api: AsWebexSimpleApi, *, paths: Iterable[str], concurrency: int = 20, timeout: float = 10.0,
+                 org_id: str = None, table: StatusTable = None):
+        """
+        :param api: async API
+        :param paths: status expressions to query on each device; split into queries with at most
+            :data:`MAX_STATUS_EXPRESSIONS` expressions
+        :param concurrency: maximum number of devices queried concurrently
+        :param timeout: timeout in seconds for all queries of one device
+        :param org_id: organization of the devices
+        :param table: last-state table. Default: new empty table
+        """
+        self.api = api
+        self.paths = list(paths)
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.org_id = org_id
+        self.table = table if table is not None else StatusTable()
+
+    @staticmethod
+    def group_devices(devices: Iterable[Device]) -> dict[ConnectionStatus, list[Device]]:
+        """
+        Group devices by connection status
+        """
+        groups = defaultdict(list)
+        for device in devices:
+            groups[device.connection_status].append(device)
+        return groups
+
+    @staticmethod
+    def supports_xapi(device: Device) -> bool:
+        """
+        Check if xAPI status queries are possible for a device
+        """
+        return 'xapi' in (device.capabilities or []) and 'xapi' in (device.permissions or [])
+
+    async def devices(self) -> list[Device]:
+        """
+        Get the devices of the fleet
+        """
+        return await self.api.devices.list(org_id=self.org_id)
+
+    async def query_device(self, device_id: str) -> dict[str, Any]:
+        """
+        Query all status paths on one device
+
+        :param device_id: device id
+        :return: flattened status values
+        """
+        chunks = [self.paths[i:i + MAX_STATUS_EXPRESSIONS]
+                  for i in range(0, len(self.paths), MAX_STATUS_EXPRESSIONS)]
+        responses = await asyncio.wait_for(
+            asyncio.gather(*[self.api.xapi.query_status(device_id=device_id, name=chunk) for chunk in chunks]),
+            timeout=self.timeout)
+        values = dict()
+        for response in responses:
+            values.update(flatten_status(response.result or {}))
+        return values
+
+    async def sweep(self, devices: Iterable[Device] = None) -> SweepReport:
+        """
+        Query all connected devices once
+
+        :param devices: devices of the fleet. Default: get devices using :meth:`devices`
+        :return: report with all changes since the previous sweep
+        """
+        start = time.perf_counter()
+        report = SweepReport(started=time.time())
+        if devices is None:
+            devices = await self.devices()
+        groups = self.group_devices(devices)
+        to_query = []
+        for status, group in groups.items():
+            report.devices += len(group)
+            if status not in QUERY_STATES:
+                report.skipped[status] = len(group)
+                continue
+            for device in group:
+                if self.supports_xapi(device):
+                    to_query.append(device.device_id)
+                else:
+                    report.skipped['no_xapi'] = report.skipped.get('no_xapi', 0) + 1
+
+        async for result in as_items_as_completed(self.query_device, to_query, concurrency=self.concurrency):
+            if result.ok:
+                report.queried += 1
+                report.changes.extend(self.table.update(result.item, result.result))
+            else:
+                error = result.exception
+                if isinstance(error, asyncio.TimeoutError):
+                    error = f'timeout after {self.timeout}s'
+                report.failed[result.item] = str(error)
+                log.debug(f'sweep: query on {result.item} failed: {error}')
+        report.duration = time.perf_counter() - start
+        log.info(f'sweep: {report.queried}/{report.devices} devices queried, {len(report.failed)} failed, '
+                 f'{len(report.changes)} changes, {report.duration:.1f}s')
+        return report
+
+    async def run(self, interval: float, refresh_devices: int = 10) -> AsyncGenerator[SweepReport, None]:
+        """
+        Sweep continuously
+
+        :param interval: sweep interval in seconds; the next sweep starts interval seconds after the start of the
+            previous sweep or immediately if the previous sweep took longer
+        :param refresh_devices: get the device list again every refresh_devices sweeps
+        :return: async generator of sweep reports
+        """
+        devices: Optional[list[Device]] = None
+        sweeps = 0
+        while True:
+            start = time.perf_counter()
+            if devices is None or sweeps % refresh_devices == 0:
+                devices = await self.devices()
+            report = await self.sweep(devices)
+            sweeps += 1
+            yield report
+            await asyncio.sleep(max(0.0, interval - (time.perf_counter() - start)))